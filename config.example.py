@@ -14,6 +14,25 @@ DB_CONFIG = {
     "password": "YOUR_DB_PASSWORD"
 }
 
+# Database Connection Pool (src.database.get_db_connection)
+DB_POOL_MIN_CONN = 1                  # Connections kept open per process
+DB_POOL_MAX_CONN = 20                 # Hard cap per process; callers wait beyond this
+DB_POOL_TIMEOUT = 30.0                # Seconds to wait for a free connection
+DB_POOL_IDLE_TIMEOUT = 300.0          # Close idle connections beyond the minimum after this
+DB_POOL_HEALTHCHECK_INTERVAL = 30.0   # Ping connections idle longer than this (seconds)
+DB_STATEMENT_TIMEOUT_MS = 300000      # Per-statement timeout (0 = none)
+DB_PGBOUNCER_MODE = False             # Connecting through PgBouncer (transaction pooling)
+
+# Async API Database Access (src.core.async_database, src.core.offload)
+ASYNC_DB_POOL_MIN_CONN = 2            # psycopg3 async pool used by async routes
+ASYNC_DB_POOL_MAX_CONN = 10
+OFFLOAD_WORKERS = 16                  # Threads for sync calls made from async routes
+OFFLOAD_REPORT_WORKERS = 4            # Separate lane for heavy report builders
+
+# MCP Tools (routers/mcp)
+MCP_DISPATCH_MODE = "inprocess"       # "inprocess": call API routes inside the app; "http": loopback requests
+MCP_API_BASE_URL = "http://localhost:8000"  # Loopback target for "http" mode and tools run outside the app
+
 # ESI API Configuration
 ESI_BASE_URL = "https://esi.evetech.net/latest"
 ESI_USER_AGENT = "EVE-CoPilot/1.0"
@@ -74,6 +93,13 @@ WAR_DOCTRINE_MIN_FLEET_SIZE = 10
 WAR_HEATMAP_MIN_KILLS = 5
 WAR_EVEREF_BASE_URL = "https://data.everef.net/killmails"
 
+# zKillboard Live Listener (RedisQ)
+ZKILL_QUEUE_ID = "eve-copilot-live-v2"  # Persistent RedisQ queue ID (position kept for 3h)
+ZKILL_TTW = 10                          # RedisQ time-to-wait (1-10 seconds)
+ZKILL_MAX_CONCURRENT_ESI = 10           # Concurrent ESI killmail fetches
+ZKILL_DB_WORKERS = 4                    # DB/Redis lanes (kills of one system share a lane)
+ZKILL_PIPELINE_MAX_IN_FLIGHT = 500      # Kills between poll and commit before polling pauses
+
 # Discord War Alerts
 WAR_DISCORD_ENABLED = False
 WAR_ALERT_DEMAND_SCORE_THRESHOLD = 2.0
@@ -3,12 +3,14 @@ Agentic Streaming Loop
 Executes multi-turn tool-calling workflow with streaming.
 """
 
+import asyncio
 import logging
 import json
 import time
-from typing import List, Dict, Any, AsyncIterator, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from ..llm.anthropic_client import AnthropicClient
 from ..mcp.client import MCPClient
+from ..mcp.async_client import AsyncMCPClient
 from ..models.user_settings import UserSettings
 from ..governance.authorization import AuthorizationChecker
 from ..governance.tool_classification import get_tool_risk_level
@@ -29,7 +31,7 @@ class AgenticStreamingLoop:
     Flow:
     1. Stream LLM response
     2. Extract tool calls from stream
-    3. Execute tools (with authorization)
+    3. Execute tools (with authorization; read-only calls concurrently)
     4. Feed results back to LLM
     5. Repeat until final answer
     6. Stream events to client
@@ -42,10 +44,13 @@ class AgenticStreamingLoop:
         user_settings: UserSettings,
         max_iterations: int = 5,
         event_bus: Optional[EventBus] = None,
-        max_context_messages: int = 20
+        max_context_messages: int = 20,
+        async_mcp_client: Optional[AsyncMCPClient] = None,
+        max_parallel_tools: int = 4
     ):
         self.llm = llm_client
         self.mcp = mcp_client
+        self.async_mcp = async_mcp_client  # Preferred for tool calls when set
         self.settings = user_settings
         self.max_iterations = max_iterations
         self.auth_checker = AuthorizationChecker(user_settings)
@@ -53,6 +58,7 @@ class AgenticStreamingLoop:
         self.event_bus = event_bus  # Optional EventBus for broadcasting
         self.retry_handler = RetryHandler(max_retries=3)
         self.context_manager = ContextWindowManager(max_messages=max_context_messages)
+        self._tool_slots = asyncio.Semaphore(max_parallel_tools)
 
     async def execute(
         self,
@@ -93,6 +99,7 @@ class AgenticStreamingLoop:
 
         while iteration < self.max_iterations:
             iteration += 1
+            iteration_start = time.time()
             logger.info(f"Agentic loop iteration {iteration}/{self.max_iterations}")
 
             # Yield thinking event
@@ -173,6 +180,7 @@ class AgenticStreamingLoop:
             if not tool_calls:
                 # No tool calls - final answer reached
                 logger.info("No tool calls detected - final answer reached")
+                yield self._iteration_completed(iteration, iteration_start, 0, 0)
                 yield {"type": "done"}
                 return
 
@@ -301,143 +309,83 @@ class AgenticStreamingLoop:
                     "content": assistant_message_content
                 })
 
-            # Execute tools and build tool results
-            tool_results = []
+            # Execute tools and build tool results. Consecutive read-only calls
+            # run concurrently; a write waits for earlier calls and runs alone.
+            # Completion events and results always follow call order.
+            tools_start = time.time()
+            tool_results: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+            pending: List[Tuple[int, Dict[str, Any], "asyncio.Task"]] = []
 
-            for tool_call in tool_calls:
-                tool_name = tool_call["name"]
-                tool_input = tool_call["input"]
-                tool_id = tool_call["id"]
-
-                # Yield tool_call_started event
-                yield {
-                    "type": "tool_call_started",
-                    "tool": tool_name,
-                    "arguments": tool_input
-                }
-
-                # Publish TOOL_CALL_STARTED event to EventBus
-                if self.event_bus and session_id:
-                    event = ToolCallStartedEvent(
-                        session_id=session_id,
-                        plan_id=None,
-                        step_index=0,
-                        tool=tool_name,
-                        arguments=tool_input
-                    )
-                    await self.event_bus.publish(session_id, event)
-
-                # Check authorization
-                allowed, denial_reason = self.auth_checker.check_authorization(
-                    tool_name,
-                    tool_input
-                )
+            try:
+                for index, tool_call in enumerate(tool_calls):
+                    tool_name = tool_call["name"]
+                    tool_input = tool_call["input"]
+                    tool_id = tool_call["id"]
 
-                if not allowed:
-                    logger.warning(f"Tool '{tool_name}' blocked: {denial_reason}")
-
-                    # Yield authorization denied event
+                    # Yield tool_call_started event
                     yield {
-                        "type": "authorization_denied",
+                        "type": "tool_call_started",
                         "tool": tool_name,
-                        "reason": denial_reason
+                        "arguments": tool_input
                     }
 
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": f"Authorization Error: {denial_reason}",
-                        "is_error": True
-                    })
-                    continue
-
-                # Execute tool with retry logic
-                logger.info(f"Executing tool: {tool_name}")
-                start_time = time.time()
-
-                try:
-                    async def execute_tool():
-                        result = self.mcp.call_tool(tool_name, tool_input)
-
-                        # Check if result indicates retryable error
-                        if isinstance(result, dict) and "error" in result:
-                            if self.retry_handler.is_retryable_error(Exception(result["error"])):
-                                raise RetryableError(result["error"])
-
-                        return result
-
-                    result = await self.retry_handler.execute_with_retry(execute_tool)
-                    duration_ms = int((time.time() - start_time) * 1000)
-
-                    # Yield tool_call_completed event
-                    yield {
-                        "type": "tool_call_completed",
-                        "tool": tool_name,
-                        "result": result
-                    }
-
-                    # Publish TOOL_CALL_COMPLETED event to EventBus
+                    # Publish TOOL_CALL_STARTED event to EventBus
                     if self.event_bus and session_id:
-                        # Create result preview (first 200 chars)
-                        result_preview = self._format_tool_result(result)[:200]
-                        event = ToolCallCompletedEvent(
+                        event = ToolCallStartedEvent(
                             session_id=session_id,
                             plan_id=None,
-                            step_index=0,
+                            step_index=index,
                             tool=tool_name,
-                            duration_ms=duration_ms,
-                            result_preview=result_preview
+                            arguments=tool_input
                         )
                         await self.event_bus.publish(session_id, event)
 
-                    # Format for LLM
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": self._format_tool_result(result)
-                    })
+                    # Check authorization
+                    allowed, denial_reason = self.auth_checker.check_authorization(
+                        tool_name,
+                        tool_input
+                    )
 
-                except RetryableError as e:
-                    # All retries exhausted
-                    logger.error(f"Tool {tool_name} failed after retries: {e}")
+                    if not allowed:
+                        logger.warning(f"Tool '{tool_name}' blocked: {denial_reason}")
 
-                    # Yield error event
-                    yield {
-                        "type": "tool_call_failed",
-                        "tool": tool_name,
-                        "error": str(e),
-                        "retries_exhausted": True
-                    }
+                        # Yield authorization denied event
+                        yield {
+                            "type": "authorization_denied",
+                            "tool": tool_name,
+                            "reason": denial_reason
+                        }
 
-                    # Add error to tool results so LLM can adapt
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": f"Tool execution failed after {self.retry_handler.max_retries} retries: {e}",
-                        "is_error": True
-                    })
+                        tool_results[index] = {
+                            "type": "tool_result",
+                            "tool_use_id": tool_id,
+                            "content": f"Authorization Error: {denial_reason}",
+                            "is_error": True
+                        }
+                        continue
 
-                    continue
+                    read_only = self._is_read_only(tool_call)
+                    if not read_only:
+                        # Write barrier: finish everything started before this call
+                        async for event in self._complete_tool_calls(pending, tool_results, session_id):
+                            yield event
 
-                except Exception as e:
-                    # Non-retryable error
-                    logger.error(f"Tool {tool_name} failed with non-retryable error: {e}")
+                    logger.info(f"Executing tool: {tool_name}")
+                    pending.append((index, tool_call, asyncio.ensure_future(self._run_tool(tool_name, tool_input))))
 
-                    yield {
-                        "type": "tool_call_failed",
-                        "tool": tool_name,
-                        "error": str(e),
-                        "retries_exhausted": False
-                    }
+                    if not read_only:
+                        async for event in self._complete_tool_calls(pending, tool_results, session_id):
+                            yield event
 
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": f"Tool execution error: {e}",
-                        "is_error": True
-                    })
+                async for event in self._complete_tool_calls(pending, tool_results, session_id):
+                    yield event
+            finally:
+                # Client went away mid-turn: don't leave tool calls running
+                for _, _, task in pending:
+                    task.cancel()
 
-                    continue
+            tools_ms = int((time.time() - tools_start) * 1000)
+            yield self._iteration_completed(iteration, iteration_start, len(tool_calls), tools_ms)
 
             # Add tool results to conversation (format depends on provider)
             if provider == "openai":
@@ -462,6 +410,150 @@ class AgenticStreamingLoop:
             "error": "Maximum iterations reached without final answer"
         }
 
+    def _is_read_only(self, tool_call: Dict[str, Any]) -> bool:
+        """Whether a tool call may run concurrently with its neighbours."""
+        risk_level = tool_call.get("risk_level")
+        return getattr(risk_level, "value", risk_level) == "read_only"
+
+    async def _call_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool without blocking the event loop."""
+        if self.async_mcp is not None:
+            return await self.async_mcp.call_tool(tool_name, tool_input)
+        # Synchronous client: run the blocking request in a worker thread
+        return await asyncio.to_thread(self.mcp.call_tool, tool_name, tool_input)
+
+    async def _run_tool(
+        self,
+        tool_name: str,
+        tool_input: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Exception], int]:
+        """
+        Execute one tool call with retry logic.
+
+        Returns:
+            (result, error, duration_ms); exactly one of result/error is set
+        """
+        async def execute_tool():
+            result = await self._call_tool(tool_name, tool_input)
+
+            # Check if result indicates retryable error
+            if isinstance(result, dict) and "error" in result:
+                if self.retry_handler.is_retryable_error(Exception(result["error"])):
+                    raise RetryableError(result["error"])
+
+            return result
+
+        async with self._tool_slots:
+            start_time = time.time()
+            try:
+                result = await self.retry_handler.execute_with_retry(execute_tool)
+                return result, None, int((time.time() - start_time) * 1000)
+            except Exception as e:
+                return None, e, int((time.time() - start_time) * 1000)
+
+    async def _complete_tool_calls(
+        self,
+        pending: List[Tuple[int, Dict[str, Any], "asyncio.Task"]],
+        tool_results: List[Optional[Dict[str, Any]]],
+        session_id: Optional[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Await started tool calls in call order, yielding their completion events."""
+        while pending:
+            index, tool_call, task = pending[0]
+            result, error, duration_ms = await task
+            pending.pop(0)
+
+            tool_name = tool_call["name"]
+            tool_id = tool_call["id"]
+
+            if error is None:
+                # Yield tool_call_completed event
+                yield {
+                    "type": "tool_call_completed",
+                    "tool": tool_name,
+                    "result": result,
+                    "duration_ms": duration_ms
+                }
+
+                # Publish TOOL_CALL_COMPLETED event to EventBus
+                if self.event_bus and session_id:
+                    # Create result preview (first 200 chars)
+                    result_preview = self._format_tool_result(result)[:200]
+                    event = ToolCallCompletedEvent(
+                        session_id=session_id,
+                        plan_id=None,
+                        step_index=index,
+                        tool=tool_name,
+                        duration_ms=duration_ms,
+                        result_preview=result_preview
+                    )
+                    await self.event_bus.publish(session_id, event)
+
+                # Format for LLM
+                tool_results[index] = {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": self._format_tool_result(result)
+                }
+
+            elif isinstance(error, RetryableError):
+                # All retries exhausted
+                logger.error(f"Tool {tool_name} failed after retries: {error}")
+
+                yield {
+                    "type": "tool_call_failed",
+                    "tool": tool_name,
+                    "error": str(error),
+                    "retries_exhausted": True
+                }
+
+                # Add error to tool results so LLM can adapt
+                tool_results[index] = {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": f"Tool execution failed after {self.retry_handler.max_retries} retries: {error}",
+                    "is_error": True
+                }
+
+            else:
+                # Non-retryable error
+                logger.error(f"Tool {tool_name} failed with non-retryable error: {error}")
+
+                yield {
+                    "type": "tool_call_failed",
+                    "tool": tool_name,
+                    "error": str(error),
+                    "retries_exhausted": False
+                }
+
+                tool_results[index] = {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": f"Tool execution error: {error}",
+                    "is_error": True
+                }
+
+    def _iteration_completed(
+        self,
+        iteration: int,
+        iteration_start: float,
+        tool_count: int,
+        tools_ms: int
+    ) -> Dict[str, Any]:
+        """Build the per-iteration timing event."""
+        duration_ms = int((time.time() - iteration_start) * 1000)
+        logger.info(
+            f"Iteration {iteration} took {duration_ms}ms "
+            f"({tool_count} tool calls, {tools_ms}ms in tools)"
+        )
+        return {
+            "type": "iteration_completed",
+            "iteration": iteration,
+            "duration_ms": duration_ms,
+            "tools_ms": tools_ms,
+            "tool_calls": tool_count
+        }
+
     def _build_assistant_content(self, content_blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Build assistant content blocks for conversation."""
         result = []
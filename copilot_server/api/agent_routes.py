@@ -33,6 +33,7 @@ runtime: Optional[AgentRuntime] = None
 db_pool: Optional[asyncpg.Pool] = None
 llm_client: Optional[Any] = None  # AnthropicClient
 mcp_client: Optional[Any] = None  # MCPClient
+async_mcp_client: Optional[Any] = None  # AsyncMCPClient
 
 
 class ChatRequest(BaseModel):
@@ -325,7 +326,8 @@ async def stream_chat_response(
                 mcp_client=mcp_client,
                 user_settings=user_settings,
                 max_iterations=5,
-                event_bus=session_manager.event_bus if session_manager else None
+                event_bus=session_manager.event_bus if session_manager else None,
+                async_mcp_client=async_mcp_client
             )
 
             # Execute agentic loop
@@ -365,7 +367,18 @@ async def stream_chat_response(
                     })
                     yield formatter.format({
                         "type": "tool_call_completed",
-                        "tool": event.get("tool")
+                        "tool": event.get("tool"),
+                        "duration_ms": event.get("duration_ms")
+                    })
+
+                elif event_type == "iteration_completed":
+                    # Per-iteration wall time
+                    yield formatter.format({
+                        "type": "iteration_completed",
+                        "iteration": event.get("iteration"),
+                        "duration_ms": event.get("duration_ms"),
+                        "tools_ms": event.get("tools_ms"),
+                        "tool_calls": event.get("tool_calls")
                     })
 
                 elif event_type == "authorization_denied":
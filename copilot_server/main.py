@@ -24,7 +24,7 @@ from .config import (
 import asyncpg
 from .llm import AnthropicClient, ConversationManager
 from .llm.openai_client import OpenAIClient
-from .mcp import MCPClient, ToolOrchestrator
+from .mcp import MCPClient, AsyncMCPClient, ToolOrchestrator
 from .websocket import ConnectionManager, SessionManager
 from .audio import AudioTranscriber, TextToSpeech
 from .models.user_settings import get_default_settings
@@ -59,6 +59,7 @@ app.add_middleware(
 # LLM client will be set in startup() based on available API keys
 llm_client = None
 mcp_client = MCPClient()
+async_mcp_client = AsyncMCPClient()
 # Note: orchestrator now requires user_settings, created per-request
 conv_manager = ConversationManager()
 conn_manager = ConnectionManager()
@@ -149,6 +150,7 @@ async def startup():
         agent_routes.runtime = agent_runtime
         agent_routes.llm_client = llm_client
         agent_routes.mcp_client = mcp_client
+        agent_routes.async_mcp_client = async_mcp_client
 
         logger.info("Agent Runtime initialized")
         logger.info("LLM client initialized for agent routes")
@@ -195,12 +197,16 @@ async def shutdown():
         except Exception as e:
             logger.error(f"Error closing database pool: {e}")
 
+    # Close pooled MCP connections
+    await async_mcp_client.close()
+
     # Reset agent_routes globals
     agent_routes.session_manager = None
     agent_routes.runtime = None
     agent_routes.db_pool = None
     agent_routes.llm_client = None
     agent_routes.mcp_client = None
+    agent_routes.async_mcp_client = None
 
     logger.info("Server stopped")
 
@@ -1,6 +1,7 @@
 """MCP Client Module"""
 
 from .client import MCPClient
+from .async_client import AsyncMCPClient
 from .orchestrator import ToolOrchestrator
 
-__all__ = ["MCPClient", "ToolOrchestrator"]
+__all__ = ["MCPClient", "AsyncMCPClient", "ToolOrchestrator"]
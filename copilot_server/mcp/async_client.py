@@ -0,0 +1,95 @@
+"""
+Async MCP Client
+Non-blocking tool calls to EVE Co-Pilot MCP endpoints.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ..config import EVE_COPILOT_API_URL
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMCPClient:
+    """
+    Async counterpart of MCPClient.call_tool.
+
+    Shares one pooled HTTP connection set across calls; at most
+    `max_concurrency` tool calls are in flight at a time, further calls wait.
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        max_concurrency: int = 4,
+        timeout: float = 60.0
+    ):
+        """
+        Initialize async MCP client.
+
+        Args:
+            api_url: Base URL for EVE Co-Pilot API
+            max_concurrency: Maximum concurrent tool calls
+            timeout: Per-call timeout in seconds
+        """
+        self.api_url = api_url or EVE_COPILOT_API_URL
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.api_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency)
+            )
+        return self._client
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call an MCP tool.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tool execution result, or {"error": ..., "isError": True}
+            (same shape as MCPClient.call_tool)
+        """
+        async with self._semaphore:
+            try:
+                response = await self._get_client().post(
+                    "/mcp/tools/call",
+                    json={"name": name, "arguments": arguments}
+                )
+                response.raise_for_status()
+
+                result = response.json()
+                logger.info(f"Tool '{name}' executed successfully")
+                return result
+
+            except httpx.TimeoutException:
+                logger.error(f"Tool '{name}' timed out")
+                return {
+                    "error": f"Tool '{name}' timed out after {self.timeout:.0f} seconds",
+                    "isError": True
+                }
+            except httpx.HTTPError as e:
+                logger.error(f"Tool '{name}' failed: {e}")
+                return {
+                    "error": f"Tool execution failed: {str(e)}",
+                    "isError": True
+                }
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock
 from copilot_server.agent.agentic_loop import AgenticStreamingLoop
@@ -224,3 +225,131 @@ async def test_broadcast_events_to_websocket(mock_event_bus):
     published_events = mock_event_bus.get_published_events("sess-123")
     assert any(e.type == AgentEventType.TOOL_CALL_STARTED for e in published_events)
     assert any(e.type == AgentEventType.TOOL_CALL_COMPLETED for e in published_events)
+
+
+def tool_use_stream(calls):
+    """Build a mock stream: tool calls on the first turn, a final answer after."""
+    call_count = [0]
+
+    async def mock_stream(params, *args, **kwargs):
+        call_count[0] += 1
+        mock_stream.messages.append(list(params["messages"]))
+        if call_count[0] == 1:
+            for index, (tool_id, name) in enumerate(calls):
+                yield {"type": "content_block_start", "index": index, "content_block": {"type": "tool_use", "id": tool_id, "name": name}}
+                yield {"type": "content_block_delta", "index": index, "delta": {"type": "input_json_delta", "partial_json": '{}'}}
+                yield {"type": "content_block_stop", "index": index}
+        else:
+            yield {"type": "content_block_start", "index": 0, "content_block": {"type": "text"}}
+            yield {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Done"}}
+            yield {"type": "content_block_stop", "index": 0}
+        yield {"type": "message_stop"}
+
+    mock_stream.messages = []
+    return mock_stream
+
+
+class RecordingAsyncMCP:
+    """Async MCP client that records call overlap; per-tool delays in seconds."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.log = []
+        self.active = 0
+        self.max_active = 0
+
+    async def call_tool(self, name, arguments):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.log.append(("start", name))
+        await asyncio.sleep(self.delays.get(name, 0))
+        self.log.append(("end", name))
+        self.active -= 1
+        return {"content": [{"type": "text", "text": name}]}
+
+
+def make_loop(calls, async_mcp, max_parallel_tools=4, autonomy_level=AutonomyLevel.RECOMMENDATIONS):
+    llm_client = Mock()
+    llm_client.model = "claude-3-5-sonnet-20241022"
+    llm_client.build_tool_schema = Mock(return_value=[])
+    llm_client._stream_response = tool_use_stream(calls)
+
+    mcp_client = Mock()
+    mcp_client.get_tools = Mock(return_value=[])
+
+    user_settings = UserSettings(character_id=123, autonomy_level=autonomy_level)
+    loop = AgenticStreamingLoop(
+        llm_client, mcp_client, user_settings,
+        async_mcp_client=async_mcp, max_parallel_tools=max_parallel_tools
+    )
+    return loop, mcp_client
+
+
+@pytest.mark.asyncio
+async def test_read_only_tools_run_concurrently_in_call_order():
+    """Read-only calls overlap, but completion events follow call order."""
+    async_mcp = RecordingAsyncMCP({"get_market_prices": 0.2, "get_market_stats": 0.1, "get_market_history": 0.0})
+    loop, mcp_client = make_loop(
+        [("t1", "get_market_prices"), ("t2", "get_market_stats"), ("t3", "get_market_history")],
+        async_mcp
+    )
+
+    events = [e async for e in loop.execute([{"role": "user", "content": "Prices?"}])]
+
+    assert async_mcp.max_active == 3
+    mcp_client.call_tool.assert_not_called()
+
+    completed = [e["tool"] for e in events if e["type"] == "tool_call_completed"]
+    assert completed == ["get_market_prices", "get_market_stats", "get_market_history"]
+    assert all("duration_ms" in e for e in events if e["type"] == "tool_call_completed")
+
+    # Tool results are fed back in call order
+    tool_results = loop.llm._stream_response.messages[1][-1]["content"]
+    assert [r["tool_use_id"] for r in tool_results] == ["t1", "t2", "t3"]
+
+    iterations = [e for e in events if e["type"] == "iteration_completed"]
+    assert [e["iteration"] for e in iterations] == [1, 2]
+    assert iterations[0]["tool_calls"] == 3
+
+
+@pytest.mark.asyncio
+async def test_write_tool_waits_for_earlier_calls_and_runs_alone():
+    """A write is a barrier: earlier reads finish first, later reads start after."""
+    async_mcp = RecordingAsyncMCP({"get_market_prices": 0.1, "clear_market_cache": 0.05})
+    loop, _ = make_loop(
+        [("t1", "get_market_prices"), ("t2", "clear_market_cache"), ("t3", "get_market_stats")],
+        async_mcp
+    )
+
+    events = [e async for e in loop.execute([{"role": "user", "content": "Refresh"}])]
+
+    assert async_mcp.log == [
+        ("start", "get_market_prices"), ("end", "get_market_prices"),
+        ("start", "clear_market_cache"), ("end", "clear_market_cache"),
+        ("start", "get_market_stats"), ("end", "get_market_stats"),
+    ]
+    completed = [e["tool"] for e in events if e["type"] == "tool_call_completed"]
+    assert completed == ["get_market_prices", "clear_market_cache", "get_market_stats"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_tools_bounded_and_denials_kept_in_order():
+    """Parallelism respects max_parallel_tools; a denied call still gets its result slot."""
+    async_mcp = RecordingAsyncMCP({"get_market_prices": 0.05, "get_market_stats": 0.05, "get_market_history": 0.05})
+    loop, _ = make_loop(
+        [("t1", "get_market_prices"), ("t2", "get_market_stats"),
+         ("t3", "shopping_list_create"), ("t4", "get_market_history")],
+        async_mcp,
+        max_parallel_tools=2,
+        autonomy_level=AutonomyLevel.READ_ONLY
+    )
+
+    events = [e async for e in loop.execute([{"role": "user", "content": "Test"}])]
+
+    assert async_mcp.max_active == 2
+    assert ("start", "shopping_list_create") not in async_mcp.log
+    assert any(e["type"] == "authorization_denied" for e in events)
+
+    tool_results = loop.llm._stream_response.messages[1][-1]["content"]
+    assert [r["tool_use_id"] for r in tool_results] == ["t1", "t2", "t3", "t4"]
+    assert tool_results[2]["is_error"] is True
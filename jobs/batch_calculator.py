@@ -28,8 +28,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.database import get_db_connection
 from src.market_service import market_service
-from src.production_simulator import ProductionSimulator
-from src.material_classifier import material_classifier
+from src.services.market.price_book import get_price_book
+from src.services.production.profitability import ProfitabilityEngine, ProfitabilityScan
 from src.esi_client import esi_client
 from config import REGIONS
 
@@ -94,7 +94,7 @@ def fetch_and_store_prices(verbose: bool = False) -> int:
         print(f"  ERROR: {result['error']}")
         return 0
 
-    # Load to memory - WICHTIG für ProductionSimulator
+    # Load to memory - WICHTIG für den Profitability-Scan
     loaded = market_service.load_prices_to_memory()
     if verbose:
         print(f"  Loaded {loaded:,} prices to memory")
@@ -126,75 +126,58 @@ def get_material_prices_all_regions(type_ids: List[int]) -> Dict[int, Dict[str,
     return prices
 
 
-def calculate_opportunity(bp: Dict, simulator: ProductionSimulator, me: int = 10) -> Optional[Dict]:
-    """Berechnet eine einzelne Manufacturing Opportunity"""
-    try:
-        # Quick profit check using cached adjusted_price
-        result = simulator.quick_profit_check(
-            type_id=bp["product_id"],
-            runs=1,
-            me=me
-        )
-
-        if not result:
-            return None
-
-        margin = result.get("margin_percent", 0)
-        if margin <= 0:
-            return None
-
-        # Get BOM and difficulty
-        bom = simulator.get_bom(bp["product_id"], runs=1, me=me)
-        if not bom:
-            return None
-
-        manufacturability = material_classifier.get_manufacturability_score(bom)
-
-        # Use the values from quick_profit_check (based on adjusted_price)
-        material_cost = result.get("material_cost", 0)
-        sell_price = result.get("product_price", 0) * result.get("output_quantity", 1)  # revenue
-        profit = result.get("profit", 0)
-        roi = margin
-
-        if material_cost <= 0:
-            return None
-
-        return {
-            "product_id": bp["product_id"],
-            "blueprint_id": bp["blueprint_id"],
-            "product_name": bp["product_name"],
-            "category": bp["category_name"],
-            "group_name": bp["group_name"],
-            "difficulty": manufacturability["score"],
-
-            # For now, use same price for all regions (adjusted_price is global)
-            "material_cost_jita": material_cost,
-            "material_cost_amarr": material_cost,
-            "material_cost_rens": material_cost,
-            "material_cost_dodixie": material_cost,
-            "material_cost_hek": material_cost,
-            "cheapest_material_cost": material_cost,
-            "cheapest_material_region": "the_forge",
-
-            "sell_price_jita": sell_price,
-            "sell_price_amarr": sell_price,
-            "sell_price_rens": sell_price,
-            "sell_price_dodixie": sell_price,
-            "sell_price_hek": sell_price,
-            "best_sell_price": sell_price,
-            "best_sell_region": "the_forge",
-
-            # Calculated
-            "profit": profit,
-            "roi": roi,
-            "me_level": me
-        }
-
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
+def build_opportunity(bp: Dict, scan: ProfitabilityScan, me: int = 10) -> Optional[Dict]:
+    """Baut eine einzelne Manufacturing Opportunity aus dem Katalog-Scan"""
+    # Profit and ROI are based on the global adjusted_price
+    result = scan.result(bp["blueprint_id"], me)
+    if not result:
         return None
 
+    margin = result["margin_percent"]
+    material_cost = result["material_cost"]
+    if margin <= 0 or material_cost <= 0:
+        return None
+
+    opportunity = {
+        "product_id": bp["product_id"],
+        "blueprint_id": bp["blueprint_id"],
+        "product_name": bp["product_name"],
+        "category": bp["category_name"],
+        "group_name": bp["group_name"],
+        "difficulty": result["difficulty"],
+        "cheapest_material_cost": material_cost,
+        "cheapest_material_region": "the_forge",
+        "best_sell_price": result["revenue"],
+        "best_sell_region": "the_forge",
+
+        # Calculated
+        "profit": result["profit"],
+        "roi": margin,
+        "me_level": me
+    }
+
+    # Regional material cost (lowest sell) and sell price; falls back to the
+    # adjusted_price values where a region lacks prices
+    cheapest = None
+    best = None
+    for region_id, (region_name, hub) in REGION_MAP.items():
+        regional = scan.result(bp["blueprint_id"], me, region_id)
+        cost = regional["material_cost"] if regional["priced"] else material_cost
+        sell = regional["revenue"] if regional["product_price"] > 0 else result["revenue"]
+        opportunity[f"material_cost_{hub}"] = cost
+        opportunity[f"sell_price_{hub}"] = sell
+
+        if regional["priced"] and (cheapest is None or cost < cheapest):
+            cheapest = cost
+            opportunity["cheapest_material_cost"] = cost
+            opportunity["cheapest_material_region"] = region_name
+        if regional["product_price"] > 0 and (best is None or sell > best):
+            best = sell
+            opportunity["best_sell_price"] = sell
+            opportunity["best_sell_region"] = region_name
+
+    return opportunity
+
 
 def save_opportunities_to_db(opportunities: List[Dict], verbose: bool = False) -> int:
     """Speichert alle Opportunities in der DB"""
@@ -268,15 +251,17 @@ def run_batch_calculation(me: int = 10, verbose: bool = False) -> Dict:
         print()
         print("Step 3: Calculating opportunities...")
 
-    simulator = ProductionSimulator(source='cache')
+    # Price all blueprints at once: adjusted prices plus every hub region
+    engine = ProfitabilityEngine.load()
+    scan = engine.scan(get_price_book(), me_levels=(me,), runs=1, region_ids=REGION_MAP.keys())
+    if verbose:
+        print(f"  Priced {len(engine):,} blueprints x {len(scan.sources)} price sources in {scan.elapsed:.3f}s")
+
     opportunities = []
     errors = 0
 
-    for i, bp in enumerate(blueprints):
-        if verbose and i % 100 == 0:
-            print(f"  Processing {i}/{len(blueprints)}...", end='\r')
-
-        opp = calculate_opportunity(bp, simulator, me)
+    for bp in blueprints:
+        opp = build_opportunity(bp, scan, me)
         if opp:
             opportunities.append(opp)
         else:
@@ -24,7 +24,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.database import get_db_connection
 from src.market_service import market_service
-from src.production_simulator import ProductionSimulator
+from src.services.market.price_book import get_price_book
+from src.services.production.profitability import ProfitabilityEngine
 
 
 def get_all_t1_blueprints() -> List[Dict]:
@@ -91,41 +92,26 @@ def scan_all_blueprints(
     Returns:
         List of profitable blueprints sorted by margin
     """
-    simulator = ProductionSimulator(source='cache')
-    results = []
     total = len(blueprints)
-    errors = 0
-
-    for i, bp in enumerate(blueprints):
-        if progress_callback and i % 100 == 0:
-            progress_callback(i, total)
-
-        try:
-            result = simulator.quick_profit_check(
-                type_id=bp["product_id"],
-                runs=runs,
-                me=me
-            )
-
-            if result:
-                # Add category/group info
-                result["group_name"] = bp["group_name"]
-                result["category_name"] = bp["category_name"]
-
-                # Apply filters
-                if min_margin and result["margin_percent"] < min_margin:
-                    continue
-                if min_profit and result["profit"] < min_profit:
-                    continue
-
-                results.append(result)
-        except Exception as e:
-            errors += 1
-            if errors < 10:
-                print(f"Error scanning {bp['product_name']}: {e}")
-
-    # Sort by margin descending
-    results.sort(key=lambda x: x["margin_percent"], reverse=True)
+    if progress_callback:
+        progress_callback(0, total)
+
+    # Price the whole catalog at once from the shared price book
+    engine = ProfitabilityEngine.load()
+    scan = engine.scan(get_price_book(), me_levels=(me,), runs=runs)
+
+    by_blueprint = {bp["blueprint_id"]: bp for bp in blueprints}
+    results = scan.results(by_blueprint.keys(), me=me, min_margin=min_margin or None, min_profit=min_profit or None)
+
+    for result in results:
+        # Add name and category/group info
+        bp = by_blueprint[result["blueprint_id"]]
+        result["name"] = bp["product_name"]
+        result["group_name"] = bp["group_name"]
+        result["category_name"] = bp["category_name"]
+
+    if progress_callback:
+        progress_callback(total, total)
 
     return results
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Combat Rollups Job
+
+Keeps the hourly combat rollup tables (migrations/011_combat_rollups.sql) in
+sync with killmails / killmail_attackers:
+
+- default:     roll up the hours touched by kills stored since the last run
+- --backfill:  rebuild the last N days (after deploying the migration)
+- --check:     catch up, then compare the last N hours with the raw tables
+
+Should run every 5 minutes via cron.
+"""
+
+import sys
+import os
+import argparse
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.combat_rollup_service import backfill, catch_up, check_consistency, is_consistent
+
+
+def run_catch_up() -> bool:
+    """Roll up new kills"""
+    try:
+        result = catch_up()
+    except Exception as e:
+        print(f"[{datetime.now()}] ERROR rolling up kills: {e}")
+        return False
+
+    if result["hours"]:
+        rows = ", ".join(f"{table}={count}" for table, count in result["rows"].items())
+        print(f"[{datetime.now()}] Rolled up {result['hours']} hours ({rows})")
+    else:
+        print(f"[{datetime.now()}] No new kills to roll up")
+    print(f"[{datetime.now()}] Watermark: {result['watermark']}")
+    return True
+
+
+def run_backfill(days: int) -> bool:
+    """Rebuild the rollups of the last `days` days"""
+    print(f"[{datetime.now()}] Backfilling {days} days of combat rollups...")
+    try:
+        result = backfill(days=days, verbose=True)
+    except Exception as e:
+        print(f"[{datetime.now()}] ERROR backfilling rollups: {e}")
+        return False
+
+    for table, count in result["rows"].items():
+        print(f"  {table}: {count} rows")
+    print(f"[{datetime.now()}] Backfill complete: {result['hours']} hours, watermark {result['watermark']}")
+    return True
+
+
+def run_check(hours: int) -> bool:
+    """Compare the rollups of the last `hours` hours with the raw tables"""
+    if not run_catch_up():
+        return False
+
+    try:
+        report = check_consistency(hours=hours)
+    except Exception as e:
+        print(f"[{datetime.now()}] ERROR checking rollups: {e}")
+        return False
+
+    for table, counts in report.items():
+        status = "OK" if counts["missing"] == 0 and counts["unexpected"] == 0 else "MISMATCH"
+        print(f"  {table}: {counts['expected']} rows, {counts['missing']} missing, "
+              f"{counts['unexpected']} unexpected [{status}]")
+
+    consistent = is_consistent(report)
+    print(f"[{datetime.now()}] Rollups over the last {hours}h are "
+          f"{'consistent' if consistent else 'INCONSISTENT'}")
+    return consistent
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Combat Rollups - Hourly pre-aggregation of killmail statistics'
+    )
+    parser.add_argument(
+        '--backfill',
+        type=int,
+        metavar='DAYS',
+        help='Rebuild the rollups of the last DAYS days'
+    )
+    parser.add_argument(
+        '--check',
+        type=int,
+        metavar='HOURS',
+        help='Catch up, then verify the last HOURS hours against the raw tables'
+    )
+
+    args = parser.parse_args()
+
+    if args.backfill:
+        ok = run_backfill(args.backfill)
+    elif args.check:
+        ok = run_check(args.check)
+    else:
+        ok = run_catch_up()
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+#!/bin/bash
+cd /home/cytrex/eve_copilot
+python3 jobs/combat_rollups.py >> logs/combat_rollups.log 2>&1
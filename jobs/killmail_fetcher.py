@@ -10,17 +10,21 @@ Usage:
     python3 -m jobs.killmail_fetcher --verbose          # Verbose output
     python3 -m jobs.killmail_fetcher --backfill 7       # Backfill last 7 days
     python3 -m jobs.killmail_fetcher --date 2024-12-06  # Specific date
+    python3 -m jobs.killmail_fetcher --backfill 30 --concurrency 4 --workers 8
+    python3 -m jobs.killmail_fetcher --legacy           # Download + in-memory parse path
 """
 
 import sys
 import os
+import time
 import argparse
+import resource
 from datetime import datetime, timedelta, date
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.killmail_service import killmail_service
+from src.killmail_service import killmail_service, BACKFILL_CONCURRENCY
 
 
 def parse_date_string(date_str: str) -> date:
@@ -31,6 +35,18 @@ def parse_date_string(date_str: str) -> date:
         raise argparse.ArgumentTypeError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
 
+def peak_rss_mb(results: list) -> float:
+    """Peak RSS of this process and of the largest parse worker (reported per day)"""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return max([own] + [r.get('worker_peak_rss_mb', 0) for r in results])
+
+
+def process_one(target_date: date, args) -> dict:
+    if args.legacy:
+        return killmail_service.process_date(target_date, verbose=args.verbose)
+    return killmail_service.ingest_date(target_date, workers=args.workers, verbose=args.verbose)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Killmail Fetcher - Download and process EVE killmail archives'
@@ -52,8 +68,27 @@ def main():
         metavar='YYYY-MM-DD',
         help='Process specific date'
     )
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=BACKFILL_CONCURRENCY,
+        metavar='N',
+        help=f'Days ingested at the same time during backfill (default: {BACKFILL_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        metavar='N',
+        help='Parse worker processes (default: CPU count)'
+    )
+    parser.add_argument(
+        '--legacy',
+        action='store_true',
+        help='Download to a temp dir and parse in memory instead of streaming'
+    )
 
     args = parser.parse_args()
+    started = time.time()
 
     # Determine date(s) to process
     if args.date:
@@ -61,8 +96,7 @@ def main():
         target_date = args.date
         if args.verbose:
             print(f"Processing specific date: {target_date}")
-        result = killmail_service.process_date(target_date, verbose=args.verbose)
-        results = [result]
+        results = [process_one(target_date, args)]
 
     elif args.backfill:
         # Backfill N days
@@ -72,7 +106,13 @@ def main():
         if args.verbose:
             print(f"Backfilling {args.backfill} days: {start_date} to {end_date}")
 
-        results = killmail_service.backfill(start_date, end_date, verbose=args.verbose)
+        results = killmail_service.backfill(
+            start_date, end_date,
+            verbose=args.verbose,
+            concurrency=args.concurrency,
+            workers=args.workers,
+            streaming=not args.legacy
+        )
 
     else:
         # Default: process yesterday
@@ -81,8 +121,11 @@ def main():
         if args.verbose:
             print(f"Processing yesterday: {yesterday}")
 
-        result = killmail_service.process_date(yesterday, verbose=args.verbose)
-        results = [result]
+        results = [process_one(yesterday, args)]
+
+    elapsed = time.time() - started
+    total_killmails = sum(r.get('killmails_processed', 0) for r in results if r.get('success'))
+    throughput = f"{total_killmails / elapsed:.0f} killmails/s, peak RSS {peak_rss_mb(results):.0f} MB"
 
     # Cleanup old data
     if args.verbose:
@@ -103,18 +146,19 @@ def main():
             else:
                 print(f"  {result['date']}: FAILED - {result.get('error', 'Unknown error')}")
 
-        print(f"\nCleanup: Removed {cleanup_stats['ship_losses_deleted']} ship records, "
+        print(f"\nIngestion: {total_killmails} killmails in {elapsed:.1f}s ({throughput})")
+        print(f"Cleanup: Removed {cleanup_stats['ship_losses_deleted']} ship records, "
               f"{cleanup_stats['item_losses_deleted']} item records (cutoff: {cleanup_stats['cutoff_date']})")
         print("=" * 60)
     else:
         # Compact output for cron logs
         successful = sum(1 for r in results if r.get('success'))
-        total_killmails = sum(r.get('killmails_processed', 0) for r in results if r.get('success'))
         total_ships = sum(r.get('ship_losses_saved', 0) for r in results if r.get('success'))
         total_items = sum(r.get('item_losses_saved', 0) for r in results if r.get('success'))
 
         print(f"Killmail Fetcher: {successful}/{len(results)} dates processed, "
-              f"{total_killmails} killmails, {total_ships} ships, {total_items} items saved")
+              f"{total_killmails} killmails, {total_ships} ships, {total_items} items saved "
+              f"({throughput})")
 
 
 if __name__ == "__main__":
@@ -32,7 +32,8 @@ from src.database import get_db_connection
 from src.market_service import market_service
 from src.production_simulator import ProductionSimulator
 from src.notification_service import notification_service
-from src.material_classifier import material_classifier, MaterialSource
+from src.services.market.price_book import get_price_book
+from src.services.production.profitability import ProfitabilityEngine
 from src.esi_client import esi_client
 from config import (
     HUNTER_MIN_ROI,
@@ -181,32 +182,35 @@ def run_market_hunter(
         print("Step 2: Pre-scanning all T1 blueprints (cache mode)...")
 
     blueprints = get_all_t1_blueprints()
-    cache_simulator = ProductionSimulator(source='cache')
+
+    # Price the whole catalog at once from the shared price book
+    engine = ProfitabilityEngine.load()
+    scan = engine.scan(get_price_book(), me_levels=(me,), runs=1)
+
+    by_blueprint = {bp["blueprint_id"]: bp for bp in blueprints}
+    profitable = [
+        r for r in scan.results(by_blueprint.keys(), me=me)
+        if r["margin_percent"] > 0
+    ]
 
     cache_results = []
     filtered_out = 0
 
-    for bp in blueprints:
-        result = cache_simulator.quick_profit_check(
-            type_id=bp["product_id"],
-            runs=1,
-            me=me
-        )
-        if result and result["margin_percent"] > 0:
-            # Check material difficulty
-            bom = cache_simulator.get_bom(bp["product_id"], runs=1, me=me)
-            manufacturability = material_classifier.get_manufacturability_score(bom)
-
-            if manufacturability["score"] > max_difficulty:
-                filtered_out += 1
-                continue
-
-            result["group_name"] = bp["group_name"]
-            result["category_name"] = bp["category_name"]
-            result["difficulty"] = manufacturability["score"]
-            result["material_sources"] = manufacturability["sources"]
-            result["warnings"] = manufacturability["warnings"]
-            cache_results.append(result)
+    for result in profitable:
+        # Check material difficulty
+        if result["difficulty"] > max_difficulty:
+            filtered_out += 1
+            continue
+
+        bp = by_blueprint[result["blueprint_id"]]
+        manufacturability = engine.manufacturability(bp["blueprint_id"])
+
+        result["name"] = bp["product_name"]
+        result["group_name"] = bp["group_name"]
+        result["category_name"] = bp["category_name"]
+        result["material_sources"] = manufacturability["sources"]
+        result["warnings"] = manufacturability["warnings"]
+        cache_results.append(result)
 
     # Sort by margin and take top candidates
     cache_results.sort(key=lambda x: x["margin_percent"], reverse=True)
@@ -4,6 +4,9 @@ Production Chain Builder
 Builds production_dependencies and production_chains tables from EVE SDE data.
 Uses bottom-up approach: Raw Materials → Components → T1 → T2 → T3
 
+All dependency edges are loaded once, sorted topologically and resolved with
+one memoized raw-material vector per item; results are written in bulk.
+
 Usage:
     python3 -m jobs.production_chain_builder --batch=raw_materials
     python3 -m jobs.production_chain_builder --batch=basic_components
@@ -12,9 +15,11 @@ Usage:
 """
 
 import sys
+import time
 import argparse
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from src.database import get_db_connection
+from services.production.chain_graph import ProductionGraph
 from services.production.chain_repository import ProductionChainRepository
 
 
@@ -43,6 +48,7 @@ class ProductionChainBuilder:
     def __init__(self):
         self.repo = ProductionChainRepository()
         self.processed_items: Set[int] = set()
+        self.graph: Optional[ProductionGraph] = None
 
     def get_items_for_batch(self, batch_name: str) -> List[int]:
         """Get list of item type IDs for a batch"""
@@ -96,123 +102,81 @@ class ProductionChainBuilder:
             print(f"Error getting items for batch: {e}")
             return []
 
-    def build_dependencies(self, item_type_id: int) -> bool:
+    def load_graph(self) -> ProductionGraph:
+        """Load all manufacturing dependency edges from the SDE once"""
+        if self.graph is None:
+            started = time.time()
+            self.graph = ProductionGraph.from_rows(self.repo.get_sde_dependency_edges())
+            print(f"Loaded dependency graph: {len(self.graph)} producible items "
+                  f"in {time.time() - started:.2f}s")
+        return self.graph
+
+    def build_complete_chain(self, item_type_id: int) -> Dict[int, float]:
         """
-        Build direct dependencies for an item from SDE
+        Complete production chain to raw materials
 
         Args:
-            item_type_id: Item to build dependencies for
+            item_type_id: Item to build chain for
 
         Returns:
-            True if successful
+            Dict mapping raw_material_type_id -> total quantity
+            (empty for raw materials and items on a dependency cycle)
         """
-        try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cursor:
-                    # Get materials from SDE
-                    cursor.execute("""
-                        SELECT
-                            iam."materialTypeID",
-                            iam."quantity"
-                        FROM "industryActivityMaterials" iam
-                        WHERE iam."typeID" = (
-                            SELECT "typeID"
-                            FROM "industryActivityProducts"
-                            WHERE "productTypeID" = %s
-                            AND "activityID" = 1
-                            LIMIT 1
-                        )
-                        AND iam."activityID" = 1
-                    """, (item_type_id,))
-
-                    materials = cursor.fetchall()
-
-                    if not materials:
-                        # No materials = raw material
-                        return True
-
-                    # Save each dependency
-                    for material_type_id, quantity in materials:
-                        # Check if material is a raw material (has no blueprint)
-                        cursor.execute("""
-                            SELECT COUNT(*)
-                            FROM "industryActivityProducts"
-                            WHERE "productTypeID" = %s
-                            AND "activityID" = 1
-                        """, (material_type_id,))
-
-                        is_raw = cursor.fetchone()[0] == 0
-
-                        self.repo.save_dependency(
-                            item_type_id=item_type_id,
-                            material_type_id=material_type_id,
-                            base_quantity=quantity,
-                            activity_id=1,
-                            is_raw_material=is_raw
-                        )
+        chain = self.load_graph().chain(item_type_id) or {}
+        return {raw_id: entry.quantity for raw_id, entry in chain.items()}
 
-            return True
-
-        except Exception as e:
-            print(f"Error building dependencies for {item_type_id}: {e}")
-            return False
-
-    def build_complete_chain(self, item_type_id: int, depth: int = 0, path: List[int] = None) -> Dict[int, float]:
+    def build_items(self, item_type_ids: List[int]) -> Tuple[int, int]:
         """
-        Recursively build complete production chain to raw materials
+        Build dependencies and complete chains for many items at once
+
+        Resolves the DAG bottom-up (each component once), then writes
+        production_dependencies and production_chains in bulk. Components
+        below the requested items get their chains written too.
 
         Args:
-            item_type_id: Item to build chain for
-            depth: Current recursion depth
-            path: Path taken to reach this item
+            item_type_ids: Items to build
 
         Returns:
-            Dict mapping raw_material_type_id -> total quantity
+            Tuple of (successful_count, failed_count)
         """
-        if path is None:
-            path = [item_type_id]
-
-        # Prevent infinite loops
-        if depth > 20:
-            print(f"Warning: Max depth reached for {item_type_id}")
-            return {}
-
-        # Circular dependency check
-        if item_type_id in path[:-1]:
-            print(f"Warning: Circular dependency detected: {path}")
-            return {}
-
-        # Get direct dependencies
-        dependencies = self.repo.get_direct_dependencies(item_type_id)
-
-        if not dependencies:
-            # This is a raw material
-            return {item_type_id: 1.0}
-
-        # Accumulate raw materials from all dependencies
-        total_raw_materials: Dict[int, float] = {}
-
-        for dep in dependencies:
-            material_id = dep['material_type_id']
-            quantity = dep['base_quantity']
-
-            if dep['is_raw_material']:
-                # Direct raw material
-                total_raw_materials[material_id] = total_raw_materials.get(material_id, 0) + quantity
-            else:
-                # Recursively get materials for this component
-                sub_materials = self.build_complete_chain(
-                    material_id,
-                    depth + 1,
-                    path + [material_id]
-                )
-
-                # Multiply quantities and accumulate
-                for raw_id, raw_qty in sub_materials.items():
-                    total_qty = quantity * raw_qty
-                    total_raw_materials[raw_id] = total_raw_materials.get(raw_id, 0) + total_qty
-
-        return total_raw_materials
+        graph = self.load_graph()
+        started = time.time()
+        chains = graph.resolve(item_type_ids)
+
+        nodes = sorted(graph.reachable(item_type_ids) - graph.cyclic)
+        dependency_rows = [
+            (node, material_id, quantity, graph.is_raw(material_id))
+            for node in nodes
+            for material_id, quantity in graph.edges[node]
+        ]
+        chain_rows = [
+            (node, raw_id, entry.quantity, entry.depth, graph.path(node, raw_id))
+            for node in nodes
+            for raw_id, entry in chains[node].items()
+        ]
+        print(f"Resolved {len(nodes)} items to {len(chain_rows)} raw material chains "
+              f"in {time.time() - started:.2f}s")
+
+        if nodes:
+            if self.repo.replace_dependencies(dependency_rows) is None:
+                return 0, len(item_type_ids)
+            if self.repo.replace_chains(chain_rows) is None:
+                return 0, len(item_type_ids)
+
+        success_count = 0
+        fail_count = 0
+        for item_type_id in item_type_ids:
+            if item_type_id in graph.cyclic:
+                print(f"Warning: Circular dependency detected for {item_type_id}")
+                fail_count += 1
+                continue
+            success_count += 1
+            self.processed_items.add(item_type_id)
+        self.processed_items.update(nodes)
+
+        print(f"Saved {len(dependency_rows)} dependencies and {len(chain_rows)} chains "
+              f"in {time.time() - started:.2f}s")
+        return success_count, fail_count
 
     def build_item(self, item_type_id: int) -> bool:
         """
@@ -229,39 +193,13 @@ class ProductionChainBuilder:
 
         print(f"Building chain for item {item_type_id}...")
 
-        # Step 1: Build direct dependencies
-        if not self.build_dependencies(item_type_id):
-            return False
-
-        # Step 2: Build complete chain
-        raw_materials = self.build_complete_chain(item_type_id)
-
-        if not raw_materials:
-            # Item might be a raw material itself
+        if self.load_graph().is_raw(item_type_id):
             print(f"  -> Item {item_type_id} is a raw material")
             self.processed_items.add(item_type_id)
             return True
 
-        # Step 3: Save complete chains
-        max_depth = 0
-        for raw_material_id, total_quantity in raw_materials.items():
-            # Calculate depth for this path
-            # (Simplified: we use recursion depth as proxy)
-            chain_depth = 1  # Will be improved with actual path tracking
-
-            path_str = f"{item_type_id}->{raw_material_id}"
-
-            self.repo.save_chain(
-                item_type_id=item_type_id,
-                raw_material_type_id=raw_material_id,
-                base_quantity=total_quantity,
-                chain_depth=chain_depth,
-                path=path_str
-            )
-
-        print(f"  -> Saved {len(raw_materials)} raw material dependencies")
-        self.processed_items.add(item_type_id)
-        return True
+        success_count, _ = self.build_items([item_type_id])
+        return success_count == 1
 
     def build_batch(self, batch_name: str) -> Tuple[int, int]:
         """
@@ -282,17 +220,7 @@ class ProductionChainBuilder:
         print(f"\nBuilding batch '{batch_name}': {BATCH_CONFIGS[batch_name]['description']}")
         print(f"Processing {len(items)} items...\n")
 
-        success_count = 0
-        fail_count = 0
-
-        for i, item_type_id in enumerate(items, 1):
-            if i % 100 == 0:
-                print(f"Progress: {i}/{len(items)} items processed")
-
-            if self.build_item(item_type_id):
-                success_count += 1
-            else:
-                fail_count += 1
+        success_count, fail_count = self.build_items(items)
 
         print(f"\nBatch '{batch_name}' completed:")
         print(f"  Success: {success_count}")
@@ -12,7 +12,9 @@ Usage:
 import sys
 import argparse
 from typing import Dict, Optional
+import numpy as np
 from src.database import get_db_connection
+from src.services.market.price_book import get_price_book
 from services.production.economics_repository import ProductionEconomicsRepository
 from services.production.chain_repository import ProductionChainRepository
 
@@ -133,61 +135,25 @@ class ProductionEconomicsUpdater:
         if not materials:
             return None
 
-        total_cost = 0.0
+        material_ids = [m['material_type_id'] for m in materials]
+        quantities = np.array([m['base_quantity'] for m in materials], dtype=np.float64)
 
-        for material in materials:
-            material_id = material['material_type_id']
-            quantity = material['base_quantity']
+        # Price vector from the shared price book (adjusted, then regional sell)
+        prices = get_price_book().material_prices(material_ids, region_id)
 
-            # Get price from market_prices_cache
-            price = self._get_material_price(material_id, region_id)
+        # Use fallback estimate if no market price (10 ISK per unit)
+        prices = np.where(np.isnan(prices) | (prices <= 0), 10.0, prices)
 
-            if price:
-                total_cost += quantity * price
-            else:
-                # Use fallback estimate if no market price
-                total_cost += quantity * 10  # 10 ISK per unit fallback
-
-        return total_cost
+        return float(quantities @ prices)
 
     def _get_material_price(
         self,
         material_id: int,
         region_id: int
     ) -> Optional[float]:
-        """Get material price from market_prices_cache or market_prices"""
-        try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cursor:
-                    # Try market_prices_cache first (global adjusted prices)
-                    cursor.execute("""
-                        SELECT adjusted_price
-                        FROM market_prices_cache
-                        WHERE type_id = %s
-                        LIMIT 1
-                    """, (material_id,))
-
-                    row = cursor.fetchone()
-                    if row and row[0]:
-                        return float(row[0])
-
-                    # Fallback to regional market prices
-                    cursor.execute("""
-                        SELECT lowest_sell
-                        FROM market_prices
-                        WHERE type_id = %s AND region_id = %s
-                        LIMIT 1
-                    """, (material_id, region_id))
-
-                    row = cursor.fetchone()
-                    if row and row[0]:
-                        return float(row[0])
-
-                    return None
-
-        except Exception as e:
-            print(f"Error getting material price: {e}")
-            return None
+        """Get material price from market_prices_cache or market_prices (via the price book)"""
+        price = get_price_book().material_prices([material_id], region_id)[0]
+        return float(price) if price > 0 else None
 
     def _get_market_prices(
         self,
@@ -195,27 +161,8 @@ class ProductionEconomicsUpdater:
         region_id: int
     ) -> tuple:
         """Get market sell and buy prices"""
-        try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT lowest_sell, highest_buy
-                        FROM market_prices
-                        WHERE type_id = %s AND region_id = %s
-                    """, (type_id, region_id))
-
-                    row = cursor.fetchone()
-                    if row:
-                        return (
-                            float(row[0]) if row[0] else None,
-                            float(row[1]) if row[1] else None
-                        )
-
-                    return None, None
-
-        except Exception as e:
-            print(f"Error getting market prices: {e}")
-            return None, None
+        sell, buy = get_price_book().regional_prices(type_id, region_id)
+        return sell or None, buy or None
 
     def _get_production_time(self, type_id: int) -> int:
         """Get base production time from SDE"""
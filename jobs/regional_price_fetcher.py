@@ -12,17 +12,24 @@ Usage:
     python3 -m jobs.regional_price_fetcher
     python3 -m jobs.regional_price_fetcher --verbose
     python3 -m jobs.regional_price_fetcher --region the_forge  # Single region
+    python3 -m jobs.regional_price_fetcher --concurrency 16 --use-etags
+    python3 -m jobs.regional_price_fetcher --row-by-row  # Per-row saves (debugging)
 """
 
 import sys
 import os
+import io
+import gzip
+import json
 import time
+import heapq
 import argparse
+import threading
 import requests
 from datetime import datetime
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Iterator, NamedTuple
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -30,6 +37,26 @@ from src.database import get_db_connection
 from config import REGIONS, ESI_BASE_URL, ESI_USER_AGENT
 
 
+# Pagination and concurrency
+MAX_PAGES = 400  # Safety limit (The Forge has ~300 pages)
+DEFAULT_CONCURRENCY = 8  # Concurrent page requests across all regions
+PAGE_RETRIES = 3
+
+# Aggregation
+TOP_ORDERS = 10  # Orders per side stored in market_order_snapshots
+REALISTIC_TARGET_VOLUME = 100000  # Units priced by calculate_realistic_price
+
+# ESI error budget (X-ESI-Error-Limit-Remain) thresholds
+ERROR_LIMIT_SLOWDOWN = 50  # Halve the concurrency window below this
+ERROR_LIMIT_PAUSE = 20  # Pause until the error window resets below this
+
+# ETag page cache location (used with --use-etags)
+PAGE_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'cache', 'market_pages'
+)
+
+
 def get_relevant_type_ids() -> Set[int]:
     """
     Get all type IDs we need prices for:
@@ -72,79 +99,293 @@ def get_relevant_type_ids() -> Set[int]:
             return materials | products
 
 
-def fetch_region_orders(region_id: int, verbose: bool = False) -> List[Dict]:
+class ErrorLimitWindow:
     """
-    Fetch ALL market orders for a region.
-    Uses pagination to get all pages.
+    Concurrency window shared by all page fetches of a run.
 
-    Returns list of order dicts.
+    ESI's error budget is per IP, so every region draws from the same window.
+    The window grows back to max_concurrency while the budget is healthy,
+    halves when X-ESI-Error-Limit-Remain gets low and pauses all requests
+    until X-ESI-Error-Limit-Reset when it is nearly exhausted.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_CONCURRENCY):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self.in_flight = 0
+        self.banned = False
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> bool:
+        """Wait for a request slot. Returns False once ESI has error-banned us."""
+        with self._cond:
+            while True:
+                if self.banned:
+                    return False
+                wait = self._paused_until - time.time()
+                if wait > 0:
+                    self._cond.wait(wait)
+                elif self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return True
+                else:
+                    self._cond.wait()
+
+    def release(self, headers: Optional[Dict[str, str]] = None, status: Optional[int] = None):
+        """Free a slot and resize the window from the response headers."""
+        with self._cond:
+            self.in_flight -= 1
+            if status == 420:
+                self.banned = True
+            elif headers:
+                self._adjust(headers)
+            self._cond.notify_all()
+
+    def pause(self, seconds: float):
+        """Stop handing out slots for the given time (e.g. Retry-After)."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.time() + seconds)
+            self._cond.notify_all()
+
+    def _adjust(self, headers: Dict[str, str]):
+        remain = headers.get('X-ESI-Error-Limit-Remain')
+        if remain is None:
+            return
+
+        remain = int(remain)
+        if remain < ERROR_LIMIT_PAUSE:
+            reset = int(headers.get('X-ESI-Error-Limit-Reset', 60))
+            self.limit = 1
+            self._paused_until = max(self._paused_until, time.time() + reset)
+        elif remain < ERROR_LIMIT_SLOWDOWN:
+            self.limit = max(1, self.limit // 2)
+        elif self.limit < self.max_concurrency:
+            self.limit += 1
+
+
+class PageETagCache:
+    """
+    On-disk ETag + body cache for market order pages.
+
+    Lets a run send If-None-Match and reuse the stored page on 304.
     """
-    all_orders = []
-    page = 1
-    max_pages = 400  # Safety limit (The Forge has ~300 pages)
-
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": ESI_USER_AGENT,
-        "Accept": "application/json"
-    })
-
-    while page <= max_pages:
-        url = f"{ESI_BASE_URL}/markets/{region_id}/orders/"
-        params = {
-            "datasource": "tranquility",
-            "order_type": "all",
-            "page": page
-        }
 
+    def __init__(self, directory: str = PAGE_CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, region_id: int, page: int) -> str:
+        return os.path.join(self.directory, str(region_id), f"page_{page}")
+
+    def get_etag(self, region_id: int, page: int) -> Optional[str]:
         try:
-            response = session.get(url, params=params, timeout=30)
-
-            if response.status_code == 200:
-                orders = response.json()
-                if not orders:
-                    break
-
-                all_orders.extend(orders)
-
-                # Check pagination - ESI returns max 1000 per page
-                if len(orders) < 1000:
-                    break
-
-                page += 1
-
-                if verbose and page % 50 == 0:
-                    print(f"    Page {page}, total orders: {len(all_orders):,}", end='\r')
-
-                # Small delay to be nice to ESI
-                time.sleep(0.1)
-
-            elif response.status_code == 404:
-                # No more pages
-                break
-            elif response.status_code == 420:
-                print(f"  ERROR: ESI error banned! Stopping.")
-                break
-            elif response.status_code == 429:
-                # Rate limited, wait and retry
-                retry_after = int(response.headers.get("Retry-After", 60))
-                if verbose:
-                    print(f"  Rate limited, waiting {retry_after}s...")
-                time.sleep(retry_after)
-            else:
-                if verbose:
-                    print(f"  Warning: HTTP {response.status_code} on page {page}")
-                break
+            with open(self._path(region_id, page) + '.etag') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def get_orders(self, region_id: int, page: int) -> Optional[List[Dict]]:
+        try:
+            with gzip.open(self._path(region_id, page) + '.json.gz', 'rt') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, region_id: int, page: int, etag: str, orders: List[Dict]):
+        path = self._path(region_id, page)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(path + '.json.gz.tmp', 'wt') as f:
+                json.dump(orders, f)
+            os.replace(path + '.json.gz.tmp', path + '.json.gz')
+            with open(path + '.etag', 'w') as f:
+                f.write(etag)
+        except OSError as e:
+            print(f"  Warning: could not cache page {page} of region {region_id}: {e}")
+
+
+class OrderPage(NamedTuple):
+    """One fetched page of region orders."""
+    page: int
+    orders: List[Dict]
+    total_pages: int
+    from_cache: bool
+
+
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """One requests.Session per worker thread."""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": ESI_USER_AGENT,
+            "Accept": "application/json"
+        })
+        _thread_local.session = session
+    return session
+
+
+def fetch_order_page(
+    region_id: int,
+    page: int,
+    window: ErrorLimitWindow,
+    etag_cache: Optional[PageETagCache] = None,
+    verbose: bool = False
+) -> Optional[OrderPage]:
+    """
+    Fetch one page of region orders inside the shared concurrency window.
+
+    Retries timeouts, 429 and 5xx responses. Returns None if the page
+    could not be fetched.
+    """
+    url = f"{ESI_BASE_URL}/markets/{region_id}/orders/"
+    params = {
+        "datasource": "tranquility",
+        "order_type": "all",
+        "page": page
+    }
+
+    send_etag = etag_cache is not None
+    for attempt in range(PAGE_RETRIES + 1):
+        if not window.acquire():
+            return None
+
+        headers = {}
+        etag = etag_cache.get_etag(region_id, page) if send_etag else None
+        if etag:
+            headers["If-None-Match"] = etag
 
+        try:
+            response = _get_session().get(url, params=params, headers=headers, timeout=30)
         except requests.Timeout:
+            window.release()
             if verbose:
-                print(f"  Timeout on page {page}, retrying...")
-            time.sleep(5)
+                print(f"  Timeout on region {region_id} page {page}, retrying...")
+            time.sleep(2 ** attempt)
+            continue
         except Exception as e:
+            window.release()
             if verbose:
-                print(f"  Error: {e}")
-            break
+                print(f"  Error on region {region_id} page {page}: {e}")
+            return None
+
+        status = response.status_code
+        window.release(response.headers, status)
+        total_pages = int(response.headers.get("X-Pages", 1))
+
+        if status == 200:
+            orders = response.json()
+            if etag_cache and response.headers.get("ETag"):
+                etag_cache.put(region_id, page, response.headers["ETag"], orders)
+            return OrderPage(page, orders, total_pages, False)
+
+        if status == 304:
+            orders = etag_cache.get_orders(region_id, page) if etag_cache else None
+            if orders is not None:
+                return OrderPage(page, orders, total_pages, True)
+            # Cached body is gone; retry without the ETag so the 200 re-caches it
+            send_etag = False
+            continue
+
+        if status == 404:
+            return OrderPage(page, [], total_pages, False)
+
+        if status == 420:
+            print(f"  ERROR: ESI error banned! Stopping.")
+            return None
+
+        if status == 429:
+            retry_after = int(response.headers.get("Retry-After", 60))
+            if verbose:
+                print(f"  Rate limited, waiting {retry_after}s...")
+            window.pause(retry_after)
+            continue
+
+        if status >= 500:
+            if verbose:
+                print(f"  HTTP {status} on region {region_id} page {page}, retrying...")
+            time.sleep(2 ** attempt)
+            continue
+
+        if verbose:
+            print(f"  Warning: HTTP {status} on region {region_id} page {page}")
+        return None
+
+    return None
 
+
+def iter_region_order_pages(
+    region_id: int,
+    window: Optional[ErrorLimitWindow] = None,
+    etag_cache: Optional[PageETagCache] = None,
+    verbose: bool = False,
+    stats: Optional[Dict] = None
+) -> Iterator[OrderPage]:
+    """
+    Yield pages of region orders as they arrive.
+
+    Page 1 is fetched first to read X-Pages, the remaining pages are fanned
+    out over the concurrency window and yielded in completion order.
+    """
+    window = window or ErrorLimitWindow()
+    stats = stats if stats is not None else {}
+    stats.setdefault('pages', 0)
+    stats.setdefault('cached_pages', 0)
+    stats.setdefault('failed_pages', 0)
+
+    def record(result: Optional[OrderPage]) -> bool:
+        if result is None:
+            stats['failed_pages'] += 1
+            return False
+        stats['pages'] += 1
+        if result.from_cache:
+            stats['cached_pages'] += 1
+        return True
+
+    first = fetch_order_page(region_id, 1, window, etag_cache, verbose)
+    if not record(first):
+        return
+    yield first
+
+    total_pages = min(first.total_pages, MAX_PAGES)
+    if total_pages <= 1:
+        return
+
+    with ThreadPoolExecutor(max_workers=window.max_concurrency) as executor:
+        futures = [
+            executor.submit(fetch_order_page, region_id, page, window, etag_cache, verbose)
+            for page in range(2, total_pages + 1)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            if record(result):
+                yield result
+                if verbose and stats['pages'] % 50 == 0:
+                    print(f"    Region {region_id}: {stats['pages']}/{total_pages} pages")
+
+    if stats['failed_pages']:
+        print(f"  Warning: {stats['failed_pages']} pages failed for region {region_id}")
+
+
+def fetch_region_orders(
+    region_id: int,
+    verbose: bool = False,
+    window: Optional[ErrorLimitWindow] = None,
+    etag_cache: Optional[PageETagCache] = None,
+    stats: Optional[Dict] = None
+) -> List[Dict]:
+    """
+    Fetch ALL market orders for a region.
+    Pages are fetched concurrently (see iter_region_order_pages).
+
+    Returns list of order dicts.
+    """
+    all_orders = []
+    for result in iter_region_order_pages(region_id, window, etag_cache, verbose, stats):
+        all_orders.extend(result.orders)
     return all_orders
 
 
@@ -246,8 +487,258 @@ def aggregate_prices(orders: List[Dict], type_ids: Set[int]) -> Dict[int, Dict]:
     return results
 
 
-def save_prices_to_db(region_id: int, prices: Dict[int, Dict]) -> int:
-    """Save aggregated prices and order snapshots to database."""
+class _TypeBook:
+    """Bounded per-type order state kept by StreamingPriceAggregator."""
+
+    __slots__ = ('lowest_sell', 'highest_buy', 'sell_volume', 'buy_volume',
+                 'top_sells', 'top_buys', 'depth', 'depth_volume')
+
+    def __init__(self):
+        self.lowest_sell: Optional[float] = None
+        self.highest_buy: Optional[float] = None
+        self.sell_volume = 0
+        self.buy_volume = 0
+        # Heaps with the worst kept order at [0]; seq breaks ties by arrival
+        self.top_sells: List[tuple] = []  # (-price, -seq, order)
+        self.top_buys: List[tuple] = []  # (price, -seq, order)
+        # Cheapest sells covering REALISTIC_TARGET_VOLUME: (-price, volume)
+        self.depth: List[tuple] = []
+        self.depth_volume = 0
+
+
+class StreamingPriceAggregator:
+    """
+    Aggregates region orders page by page with bounded memory.
+
+    Produces the same output as aggregate_prices(), but only keeps per-type
+    state: min sell, max buy, volume totals, the top 10 orders per side and
+    the cheapest sell orders needed for calculate_realistic_price(). Memory
+    grows with the number of tracked type IDs, not with the number of orders.
+    """
+
+    def __init__(self, type_ids: Set[int], target_volume: int = REALISTIC_TARGET_VOLUME):
+        self.type_ids = type_ids
+        self.target_volume = target_volume
+        self.orders_seen = 0
+        self._books: Dict[int, _TypeBook] = {}
+        self._seq = 0
+
+    def add_orders(self, orders: List[Dict]):
+        """Consume one page of orders."""
+        self.orders_seen += len(orders)
+        books = self._books
+        type_ids = self.type_ids
+
+        for order in orders:
+            type_id = order.get('type_id')
+            if type_id not in type_ids:
+                continue
+
+            book = books.get(type_id)
+            if book is None:
+                book = books[type_id] = _TypeBook()
+
+            self._seq += 1
+            price = order['price']
+            volume = order.get('volume_remain', 0)
+
+            if order.get('is_buy_order'):
+                book.buy_volume += volume
+                if book.highest_buy is None or price > book.highest_buy:
+                    book.highest_buy = price
+                # Equal prices keep the earlier order, like a stable sort
+                top = book.top_buys
+                if len(top) < TOP_ORDERS:
+                    heapq.heappush(top, (price, -self._seq, _snapshot_order(order)))
+                elif price > top[0][0]:
+                    heapq.heapreplace(top, (price, -self._seq, _snapshot_order(order)))
+            else:
+                book.sell_volume += volume
+                if book.lowest_sell is None or price < book.lowest_sell:
+                    book.lowest_sell = price
+                top = book.top_sells
+                if len(top) < TOP_ORDERS:
+                    heapq.heappush(top, (-price, -self._seq, _snapshot_order(order)))
+                elif -price > top[0][0]:
+                    heapq.heapreplace(top, (-price, -self._seq, _snapshot_order(order)))
+                self._push_depth(book, price, volume)
+
+    def _push_depth(self, book: _TypeBook, price: float, volume: int):
+        if volume <= 0:
+            return
+        depth = book.depth
+        # Already covered by cheaper orders: this one would be dropped right away
+        if book.depth_volume >= self.target_volume and price >= -depth[0][0]:
+            return
+        heapq.heappush(depth, (-price, volume))
+        book.depth_volume += volume
+        # Drop the most expensive orders while the rest still cover the target
+        while book.depth_volume - depth[0][1] >= self.target_volume:
+            _, dropped = heapq.heappop(depth)
+            book.depth_volume -= dropped
+
+    def results(self) -> Dict[int, Dict]:
+        """Aggregated prices in the aggregate_prices() format."""
+        results = {}
+        for type_id, book in self._books.items():
+            depth_orders = [{'price': -neg_price, 'volume_remain': volume}
+                            for neg_price, volume in book.depth]
+
+            results[type_id] = {
+                'lowest_sell': book.lowest_sell,
+                'highest_buy': book.highest_buy,
+                'sell_volume': book.sell_volume,
+                'buy_volume': book.buy_volume,
+                'realistic_sell': calculate_realistic_price(depth_orders, target_volume=self.target_volume),
+                'top_sells': [entry[2] for entry in sorted(book.top_sells, reverse=True)],
+                'top_buys': [entry[2] for entry in sorted(book.top_buys, reverse=True)],
+            }
+
+        return results
+
+
+def _snapshot_order(order: Dict) -> Dict:
+    """Fields kept for market_order_snapshots."""
+    return {
+        'price': order['price'],
+        'volume': order.get('volume_remain', 0),
+        'location_id': order.get('location_id'),
+        'issued': order.get('issued')
+    }
+
+
+def _copy_rows(cur, table: str, columns: str, rows: Iterator[tuple]) -> None:
+    """Stream rows into a table with COPY (tab-separated text format)."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(r'\N' if value is None else str(value) for value in row))
+        buffer.write('\n')
+    buffer.seek(0)
+    cur.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer)
+
+
+def _iter_snapshot_rows(prices: Dict[int, Dict]) -> Iterator[tuple]:
+    """(type_id, is_buy_order, price, volume_remain, location_id, issued, rank) rows."""
+    for type_id, data in prices.items():
+        for is_buy, key in ((False, 'top_sells'), (True, 'top_buys')):
+            for rank, order in enumerate(data.get(key, [])[:TOP_ORDERS], start=1):
+                yield (
+                    type_id,
+                    't' if is_buy else 'f',
+                    order['price'],
+                    order['volume'],
+                    order.get('location_id'),
+                    order.get('issued'),
+                    rank
+                )
+
+
+def save_prices_bulk(region_id: int, prices: Dict[int, Dict]) -> int:
+    """
+    Save aggregated prices and order snapshots with two set-based upserts.
+
+    Rows are COPY'd into temp tables and merged into market_prices and
+    market_order_snapshots in one transaction, so a region costs a handful
+    of round trips instead of one per row. Any error rolls back the whole
+    region.
+    """
+    if not prices:
+        return 0
+
+    with get_db_connection() as conn:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TEMP TABLE tmp_market_prices (
+                        type_id INTEGER,
+                        lowest_sell NUMERIC,
+                        highest_buy NUMERIC,
+                        sell_volume BIGINT,
+                        buy_volume BIGINT,
+                        realistic_sell NUMERIC
+                    ) ON COMMIT DROP
+                """)
+                cur.execute("""
+                    CREATE TEMP TABLE tmp_market_order_snapshots (
+                        type_id INTEGER,
+                        is_buy_order BOOLEAN,
+                        price NUMERIC,
+                        volume_remain BIGINT,
+                        location_id BIGINT,
+                        issued TIMESTAMPTZ,
+                        rank INTEGER
+                    ) ON COMMIT DROP
+                """)
+
+                _copy_rows(
+                    cur, 'tmp_market_prices',
+                    'type_id, lowest_sell, highest_buy, sell_volume, buy_volume, realistic_sell',
+                    (
+                        (type_id, data['lowest_sell'], data['highest_buy'], data['sell_volume'],
+                         data['buy_volume'], data.get('realistic_sell'))
+                        for type_id, data in prices.items()
+                    )
+                )
+                _copy_rows(
+                    cur, 'tmp_market_order_snapshots',
+                    'type_id, is_buy_order, price, volume_remain, location_id, issued, rank',
+                    _iter_snapshot_rows(prices)
+                )
+
+                cur.execute("""
+                    INSERT INTO market_prices (type_id, region_id, lowest_sell, highest_buy, sell_volume, buy_volume, realistic_sell, updated_at)
+                    SELECT type_id, %s, lowest_sell, highest_buy, sell_volume, buy_volume, realistic_sell, NOW()
+                    FROM tmp_market_prices
+                    ON CONFLICT (type_id, region_id)
+                    DO UPDATE SET
+                        lowest_sell = EXCLUDED.lowest_sell,
+                        highest_buy = EXCLUDED.highest_buy,
+                        sell_volume = EXCLUDED.sell_volume,
+                        buy_volume = EXCLUDED.buy_volume,
+                        realistic_sell = EXCLUDED.realistic_sell,
+                        updated_at = NOW()
+                """, (region_id,))
+                saved = cur.rowcount
+
+                cur.execute("""
+                    INSERT INTO market_order_snapshots (type_id, region_id, is_buy_order, price, volume_remain, location_id, issued, rank, updated_at)
+                    SELECT type_id, %s, is_buy_order, price, volume_remain, location_id, issued, rank, NOW()
+                    FROM tmp_market_order_snapshots
+                    ON CONFLICT (type_id, region_id, is_buy_order, rank)
+                    DO UPDATE SET
+                        price = EXCLUDED.price,
+                        volume_remain = EXCLUDED.volume_remain,
+                        location_id = EXCLUDED.location_id,
+                        issued = EXCLUDED.issued,
+                        updated_at = NOW()
+                """, (region_id,))
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    return saved
+
+
+def save_prices_to_db(region_id: int, prices: Dict[int, Dict], bulk: bool = True) -> int:
+    """
+    Save aggregated prices and order snapshots to database.
+
+    Uses the bulk COPY path by default. If it fails (or bulk=False) the
+    region is saved row by row instead, which reports the failing type IDs.
+    """
+    if bulk:
+        try:
+            return save_prices_bulk(region_id, prices)
+        except Exception as e:
+            print(f"  Bulk save failed for region {region_id}, falling back to row-by-row: {e}")
+
+    return save_prices_row_by_row(region_id, prices)
+
+
+def save_prices_row_by_row(region_id: int, prices: Dict[int, Dict]) -> int:
+    """Save aggregated prices and order snapshots one upsert per row."""
     if not prices:
         return 0
 
@@ -329,45 +820,75 @@ def save_prices_to_db(region_id: int, prices: Dict[int, Dict]) -> int:
     return saved
 
 
-def fetch_region(region_name: str, region_id: int, type_ids: Set[int], verbose: bool = False) -> Dict:
+def fetch_region(
+    region_name: str,
+    region_id: int,
+    type_ids: Set[int],
+    verbose: bool = False,
+    window: Optional[ErrorLimitWindow] = None,
+    etag_cache: Optional[PageETagCache] = None,
+    bulk_save: bool = True
+) -> Dict:
     """Fetch and save prices for a single region."""
     start = time.time()
 
     if verbose:
         print(f"  {region_name.upper()} (ID: {region_id})...")
 
-    # Fetch all orders
-    orders = fetch_region_orders(region_id, verbose)
+    # Fetch and aggregate page by page
+    page_stats = {}
+    aggregator = StreamingPriceAggregator(type_ids)
+    for page in iter_region_order_pages(region_id, window, etag_cache, verbose, page_stats):
+        aggregator.add_orders(page.orders)
+    fetch_elapsed = time.time() - start
 
     if verbose:
-        print(f"    Fetched {len(orders):,} orders")
+        print(f"    {region_name}: fetched {aggregator.orders_seen:,} orders from {page_stats['pages']} pages "
+              f"in {fetch_elapsed:.1f}s")
 
-    # Aggregate
-    prices = aggregate_prices(orders, type_ids)
+    prices = aggregator.results()
 
     if verbose:
-        print(f"    Found prices for {len(prices):,} items")
+        print(f"    {region_name}: found prices for {len(prices):,} items")
 
     # Save
-    saved = save_prices_to_db(region_id, prices)
+    save_start = time.time()
+    saved = save_prices_to_db(region_id, prices, bulk=bulk_save)
+    save_elapsed = time.time() - save_start
+
+    if verbose:
+        print(f"    {region_name}: saved {saved:,} prices in {save_elapsed:.1f}s")
 
     elapsed = time.time() - start
 
     return {
         'region': region_name,
-        'orders': len(orders),
+        'orders': aggregator.orders_seen,
+        'pages': page_stats['pages'],
+        'cached_pages': page_stats['cached_pages'],
+        'failed_pages': page_stats['failed_pages'],
+        'pages_per_sec': round(page_stats['pages'] / fetch_elapsed, 1) if fetch_elapsed > 0 else 0.0,
         'items_priced': len(prices),
         'saved': saved,
+        'fetch_elapsed': round(fetch_elapsed, 1),
+        'save_elapsed': round(save_elapsed, 1),
         'elapsed': round(elapsed, 1)
     }
 
 
 def run_price_fetch(
     verbose: bool = False,
-    single_region: Optional[str] = None
+    single_region: Optional[str] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_etags: bool = False,
+    bulk_save: bool = True
 ) -> Dict:
     """
     Main entry point: fetch all regional prices and save to DB.
+
+    Regions are fetched in parallel; their page requests share one
+    concurrency window of `concurrency` slots. With bulk_save=False each
+    region is saved with one upsert per row (slow, but reports failing rows).
     """
     start_time = time.time()
 
@@ -375,6 +896,8 @@ def run_price_fetch(
         print("=" * 60)
         print("EVE Co-Pilot Regional Price Fetcher")
         print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Concurrency: {concurrency}, ETag reuse: {'on' if use_etags else 'off'}, "
+              f"save mode: {'bulk' if bulk_save else 'row-by-row'}")
         print("=" * 60)
         print()
 
@@ -388,7 +911,7 @@ def run_price_fetch(
         print(f"  {len(type_ids):,} items to track")
         print()
 
-    # Step 2: Fetch each region
+    # Step 2: Fetch all regions in parallel
     if verbose:
         print("Step 2: Fetching regional market data...")
 
@@ -397,14 +920,26 @@ def run_price_fetch(
     else:
         regions_to_fetch = REGIONS
 
-    results = []
-    for region_name, region_id in regions_to_fetch.items():
-        result = fetch_region(region_name, region_id, type_ids, verbose)
-        results.append(result)
+    window = ErrorLimitWindow(concurrency)
+    etag_cache = PageETagCache() if use_etags else None
+
+    fetch_start = time.time()
+    with ThreadPoolExecutor(max_workers=len(regions_to_fetch)) as executor:
+        futures = [
+            executor.submit(
+                fetch_region, region_name, region_id, type_ids, verbose, window, etag_cache, bulk_save
+            )
+            for region_name, region_id in regions_to_fetch.items()
+        ]
+        results = [future.result() for future in futures]
+    fetch_elapsed = time.time() - fetch_start
 
     # Summary
     total_saved = sum(r['saved'] for r in results)
     total_orders = sum(r['orders'] for r in results)
+    total_pages = sum(r['pages'] for r in results)
+    pages_per_sec = round(total_pages / fetch_elapsed, 1) if fetch_elapsed > 0 else 0.0
+    save_seconds = round(sum(r['save_elapsed'] for r in results), 1)
     elapsed = time.time() - start_time
 
     if verbose:
@@ -412,9 +947,13 @@ def run_price_fetch(
         print("=" * 60)
         print("Summary:")
         for r in results:
-            print(f"  {r['region']}: {r['saved']:,} prices ({r['elapsed']}s)")
+            print(f"  {r['region']}: {r['saved']:,} prices, {r['pages']} pages "
+                  f"({r['cached_pages']} cached) at {r['pages_per_sec']} pages/s, "
+                  f"save {r['save_elapsed']}s ({r['elapsed']}s)")
         print()
-        print(f"Total: {total_saved:,} prices from {total_orders:,} orders in {elapsed:.1f}s")
+        print(f"Total: {total_saved:,} prices from {total_orders:,} orders "
+              f"({total_pages} pages, {pages_per_sec} pages/s) in {elapsed:.1f}s")
+        print(f"Save phase: {save_seconds}s across regions")
         print("=" * 60)
 
     return {
@@ -422,7 +961,10 @@ def run_price_fetch(
         "type_ids_tracked": len(type_ids),
         "regions": len(regions_to_fetch),
         "total_orders_fetched": total_orders,
+        "total_pages_fetched": total_pages,
+        "pages_per_sec": pages_per_sec,
         "prices_saved": total_saved,
+        "save_seconds": save_seconds,
         "elapsed_seconds": round(elapsed, 2),
         "per_region": results
     }
@@ -443,16 +985,37 @@ def main():
         choices=list(REGIONS.keys()),
         help='Fetch single region only'
     )
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Max concurrent page requests across all regions (default: {DEFAULT_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--use-etags',
+        action='store_true',
+        help='Send If-None-Match and reuse cached pages on 304 (cache in data/cache/market_pages)'
+    )
+    parser.add_argument(
+        '--row-by-row',
+        action='store_true',
+        help='Save with one upsert per row instead of bulk COPY (reports failing type IDs)'
+    )
 
     args = parser.parse_args()
 
     result = run_price_fetch(
         verbose=args.verbose,
-        single_region=args.region
+        single_region=args.region,
+        concurrency=args.concurrency,
+        use_etags=args.use_etags,
+        bulk_save=not args.row_by_row
     )
 
     if not args.verbose:
-        print(f"Regional prices: {result['prices_saved']} saved from {result['total_orders_fetched']:,} orders in {result['elapsed_seconds']}s")
+        print(f"Regional prices: {result['prices_saved']} saved from {result['total_orders_fetched']:,} orders "
+              f"({result['total_pages_fetched']} pages, {result['pages_per_sec']} pages/s) in {result['elapsed_seconds']}s "
+              f"(save {result['save_seconds']}s)")
 
 
 if __name__ == "__main__":
@@ -13,396 +13,452 @@ Reports generated:
 - Strategic Briefing (LLM)
 - Alliance Wars Analysis (LLM)
 - War Economy Analysis (LLM)
+
+Reports run as a dependency graph: independent reports are generated
+concurrently (--workers), each LLM analysis waits only for its own input
+report, and a failed or timed-out report only skips its dependents.
 """
 
 import sys
 import os
 import time
+import queue
 import asyncio
+import argparse
+import threading
+import traceback
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 from services.stored_reports_service import save_report, get_report_status
 
+DEFAULT_WORKERS = 3
+DATA_REPORT_TIMEOUT = 900       # seconds
+LLM_REPORT_TIMEOUT = 300
+
 
 def log(msg: str):
     print(f"[{datetime.utcnow().isoformat()}] {msg}")
 
 
-def generate_pilot_intelligence():
+def generate_pilot_intelligence(inputs: Dict[str, Dict]) -> Dict:
     """Generate pilot intelligence battle report"""
     from services.zkillboard import zkill_live_service
 
-    log("Generating Pilot Intelligence Report...")
-    start = time.time()
-
-    try:
-        # Force fresh generation (bypass cache)
-        result = zkill_live_service._reports_service.build_pilot_intelligence_report_fresh()
-        elapsed = time.time() - start
-
-        if result.get("error"):
-            log(f"  [WARN] Generated with error: {result['error']} ({elapsed:.1f}s)")
-        else:
-            kills = result.get("global", {}).get("total_kills", 0)
-            log(f"  [OK] Pilot Intelligence ({kills} kills, {elapsed:.1f}s)")
+    # Force fresh generation (bypass cache)
+    result = zkill_live_service._reports_service.build_pilot_intelligence_report_fresh()
 
-        # Save to database
-        save_report('pilot_intelligence', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] Pilot Intelligence: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    if result.get("error"):
+        log(f"  [WARN] Pilot Intelligence generated with error: {result['error']}")
+    else:
+        kills = result.get("global", {}).get("total_kills", 0)
+        log(f"  [OK] Pilot Intelligence ({kills} kills)")
+    return result
 
 
-def generate_war_economy_report():
+def generate_war_economy_report(inputs: Dict[str, Dict]) -> Dict:
     """Generate war economy data report"""
     from services.zkillboard import zkill_live_service
 
-    log("Generating War Economy Report...")
-    start = time.time()
+    result = zkill_live_service.get_war_economy_report()
 
-    try:
-        result = zkill_live_service.get_war_economy_report()
-        elapsed = time.time() - start
+    if result.get("error"):
+        log(f"  [WARN] War Economy Report generated with error: {result['error']}")
+    else:
+        regions = result.get("global_summary", {}).get("total_regions_active", 0)
+        log(f"  [OK] War Economy Report ({regions} regions)")
+    return result
 
-        if result.get("error"):
-            log(f"  [WARN] Generated with error: {result['error']} ({elapsed:.1f}s)")
-        else:
-            regions = result.get("global_summary", {}).get("total_regions_active", 0)
-            log(f"  [OK] War Economy Report ({regions} regions, {elapsed:.1f}s)")
-
-        save_report('war_economy', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] War Economy Report: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
 
-
-def generate_alliance_wars():
+def generate_alliance_wars(inputs: Dict[str, Dict]) -> Dict:
     """Generate alliance wars tracker with coalitions"""
     from services.zkillboard import zkill_live_service
 
-    log("Generating Alliance Wars...")
-    start = time.time()
-
-    try:
-        # Get wars and coalitions
-        wars_data = asyncio.run(zkill_live_service.get_alliance_war_tracker(limit=5))
-        coalition_data = asyncio.run(zkill_live_service.detect_coalitions(days=7))
-        elapsed = time.time() - start
-
-        # Calculate global summary
-        total_conflicts = len(wars_data.get("wars", []))
-        all_alliances = set()
-        total_kills = 0
-        total_isk = 0
-
-        for war in wars_data.get("wars", []):
-            all_alliances.add(war["alliance_a_id"])
-            all_alliances.add(war["alliance_b_id"])
-            total_kills += war["total_kills"]
-            total_isk += war["isk_by_a"] + war["isk_by_b"]
-
-        # Transform wars to conflicts
-        conflicts = []
-        for war in wars_data.get("wars", []):
-            winner_name = None
-            if war.get("overall_winner") == "a":
-                winner_name = war["alliance_a_name"]
-            elif war.get("overall_winner") == "b":
-                winner_name = war["alliance_b_name"]
-            elif war.get("overall_winner") == "contested":
-                winner_name = "Contested"
-
-            conflicts.append({
-                "alliance_1_id": war["alliance_a_id"],
-                "alliance_1_name": war["alliance_a_name"],
-                "alliance_2_id": war["alliance_b_id"],
-                "alliance_2_name": war["alliance_b_name"],
-                "alliance_1_kills": war["kills_by_a"],
-                "alliance_1_losses": war["kills_by_b"],
-                "alliance_1_isk_destroyed": war["isk_by_a"],
-                "alliance_1_isk_lost": war["isk_by_b"],
-                "alliance_1_efficiency": float(war["isk_efficiency_a"]),
-                "alliance_2_kills": war["kills_by_b"],
-                "alliance_2_losses": war["kills_by_a"],
-                "alliance_2_isk_destroyed": war["isk_by_b"],
-                "alliance_2_isk_lost": war["isk_by_a"],
-                "alliance_2_efficiency": float(war["isk_efficiency_b"]),
-                "duration_days": war.get("duration_days", 1),
-                "primary_regions": [war["system_hotspots"][0]["region_name"]] if war.get("system_hotspots") else ["Unknown"],
-                "active_systems": war.get("system_hotspots", []),
-                "winner": winner_name,
-                "alliance_1_ship_classes": war.get("ship_classes_a", {}),
-                "alliance_2_ship_classes": war.get("ship_classes_b", {}),
-                "hourly_activity": {},
-                "peak_hours": [],
-                "avg_kill_value": war["total_isk"] / war["total_kills"] if war["total_kills"] > 0 else 0,
-                "alliance_1_biggest_loss": war.get("biggest_loss_a", {"ship_type_id": None, "value": 0}),
-                "alliance_2_biggest_loss": war.get("biggest_loss_b", {"ship_type_id": None, "value": 0})
-            })
-
-        result = {
-            "period": wars_data.get("period", "24h"),
-            "global": {
-                "active_conflicts": total_conflicts,
-                "total_alliances_involved": len(all_alliances),
-                "total_kills": total_kills,
-                "total_isk_destroyed": total_isk
-            },
-            "coalitions": coalition_data.get("coalitions", []),
-            "unaffiliated_alliances": coalition_data.get("unaffiliated", []),
-            "conflicts": conflicts
-        }
-
-        wars = len(result.get("conflicts", []))
-        log(f"  [OK] Alliance Wars ({wars} conflicts, {elapsed:.1f}s)")
-
-        save_report('alliance_wars', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] Alliance Wars: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def generate_war_profiteering():
+    # Get wars and coalitions
+    wars_data = asyncio.run(zkill_live_service.get_alliance_war_tracker(limit=5))
+    coalition_data = asyncio.run(zkill_live_service.detect_coalitions(days=7))
+
+    # Calculate global summary
+    total_conflicts = len(wars_data.get("wars", []))
+    all_alliances = set()
+    total_kills = 0
+    total_isk = 0
+
+    for war in wars_data.get("wars", []):
+        all_alliances.add(war["alliance_a_id"])
+        all_alliances.add(war["alliance_b_id"])
+        total_kills += war["total_kills"]
+        total_isk += war["isk_by_a"] + war["isk_by_b"]
+
+    # Transform wars to conflicts
+    conflicts = []
+    for war in wars_data.get("wars", []):
+        winner_name = None
+        if war.get("overall_winner") == "a":
+            winner_name = war["alliance_a_name"]
+        elif war.get("overall_winner") == "b":
+            winner_name = war["alliance_b_name"]
+        elif war.get("overall_winner") == "contested":
+            winner_name = "Contested"
+
+        conflicts.append({
+            "alliance_1_id": war["alliance_a_id"],
+            "alliance_1_name": war["alliance_a_name"],
+            "alliance_2_id": war["alliance_b_id"],
+            "alliance_2_name": war["alliance_b_name"],
+            "alliance_1_kills": war["kills_by_a"],
+            "alliance_1_losses": war["kills_by_b"],
+            "alliance_1_isk_destroyed": war["isk_by_a"],
+            "alliance_1_isk_lost": war["isk_by_b"],
+            "alliance_1_efficiency": float(war["isk_efficiency_a"]),
+            "alliance_2_kills": war["kills_by_b"],
+            "alliance_2_losses": war["kills_by_a"],
+            "alliance_2_isk_destroyed": war["isk_by_b"],
+            "alliance_2_isk_lost": war["isk_by_a"],
+            "alliance_2_efficiency": float(war["isk_efficiency_b"]),
+            "duration_days": war.get("duration_days", 1),
+            "primary_regions": [war["system_hotspots"][0]["region_name"]] if war.get("system_hotspots") else ["Unknown"],
+            "active_systems": war.get("system_hotspots", []),
+            "winner": winner_name,
+            "alliance_1_ship_classes": war.get("ship_classes_a", {}),
+            "alliance_2_ship_classes": war.get("ship_classes_b", {}),
+            "hourly_activity": {},
+            "peak_hours": [],
+            "avg_kill_value": war["total_isk"] / war["total_kills"] if war["total_kills"] > 0 else 0,
+            "alliance_1_biggest_loss": war.get("biggest_loss_a", {"ship_type_id": None, "value": 0}),
+            "alliance_2_biggest_loss": war.get("biggest_loss_b", {"ship_type_id": None, "value": 0})
+        })
+
+    result = {
+        "period": wars_data.get("period", "24h"),
+        "global": {
+            "active_conflicts": total_conflicts,
+            "total_alliances_involved": len(all_alliances),
+            "total_kills": total_kills,
+            "total_isk_destroyed": total_isk
+        },
+        "coalitions": coalition_data.get("coalitions", []),
+        "unaffiliated_alliances": coalition_data.get("unaffiliated", []),
+        "conflicts": conflicts
+    }
+
+    wars = len(result.get("conflicts", []))
+    log(f"  [OK] Alliance Wars ({wars} conflicts)")
+    return result
+
+
+def generate_war_profiteering(inputs: Dict[str, Dict]) -> Dict:
     """Generate war profiteering report"""
     from services.zkillboard import zkill_live_service
 
-    log("Generating War Profiteering...")
-    start = time.time()
-
-    try:
-        profit_data = zkill_live_service.get_war_profiteering_report(limit=20)
-        elapsed = time.time() - start
-
-        # Transform for API response
-        items = []
-        total_items_destroyed = 0
-        max_value_item = None
-        max_value = 0
+    profit_data = zkill_live_service.get_war_profiteering_report(limit=20)
+
+    # Transform for API response
+    items = []
+    total_items_destroyed = 0
+    max_value_item = None
+    max_value = 0
+
+    for item in profit_data.get("items", []):
+        market_price = float(item["market_price"])
+        opportunity_value = float(item["opportunity_value"])
+        qty = item["quantity_destroyed"]
+
+        total_items_destroyed += qty
+
+        if opportunity_value > max_value:
+            max_value = opportunity_value
+            max_value_item = item["item_name"]
+
+        items.append({
+            "item_type_id": item["item_type_id"],
+            "item_name": item["item_name"],
+            "quantity_destroyed": qty,
+            "market_price": market_price,
+            "opportunity_value": opportunity_value
+        })
+
+    result = {
+        "period": profit_data.get("period", "24h"),
+        "global": {
+            "total_opportunity_value": float(profit_data.get("total_opportunity_value", 0)),
+            "total_items_destroyed": total_items_destroyed,
+            "unique_item_types": len(items),
+            "most_valuable_item": max_value_item or "N/A"
+        },
+        "items": items
+    }
+
+    log(f"  [OK] War Profiteering ({len(items)} items)")
+    return result
+
+
+def generate_trade_routes(inputs: Dict[str, Dict]) -> Dict:
+    """Generate trade route danger map"""
+    from services.zkillboard import zkill_live_service
 
-        for item in profit_data.get("items", []):
-            market_price = float(item["market_price"])
-            opportunity_value = float(item["opportunity_value"])
-            qty = item["quantity_destroyed"]
+    routes_data = zkill_live_service.get_trade_route_danger_map()
 
-            total_items_destroyed += qty
+    # Calculate global summary
+    total_routes = len(routes_data.get("routes", []))
+    dangerous_count = 0
+    total_danger = 0
+    gate_camps = 0
 
-            if opportunity_value > max_value:
-                max_value = opportunity_value
-                max_value_item = item["item_name"]
+    transformed_routes = []
+    for route in routes_data.get("routes", []):
+        avg_danger = route.get("avg_danger_score", 0)
+        total_danger += avg_danger
 
-            items.append({
-                "item_type_id": item["item_type_id"],
-                "item_name": item["item_name"],
-                "quantity_destroyed": qty,
-                "market_price": market_price,
-                "opportunity_value": opportunity_value
-            })
+        if avg_danger >= 5:
+            dangerous_count += 1
 
-        result = {
-            "period": profit_data.get("period", "24h"),
-            "global": {
-                "total_opportunity_value": float(profit_data.get("total_opportunity_value", 0)),
-                "total_items_destroyed": total_items_destroyed,
-                "unique_item_types": len(items),
-                "most_valuable_item": max_value_item or "N/A"
-            },
-            "items": items
-        }
-
-        log(f"  [OK] War Profiteering ({len(items)} items, {elapsed:.1f}s)")
-        save_report('war_profiteering', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] War Profiteering: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def generate_trade_routes():
-    """Generate trade route danger map"""
-    from services.zkillboard import zkill_live_service
+        transformed_systems = []
+        total_kills = 0
+        total_isk = 0
 
-    log("Generating Trade Routes...")
-    start = time.time()
-
-    try:
-        routes_data = zkill_live_service.get_trade_route_danger_map()
-        elapsed = time.time() - start
-
-        # Calculate global summary
-        total_routes = len(routes_data.get("routes", []))
-        dangerous_count = 0
-        total_danger = 0
-        gate_camps = 0
-
-        transformed_routes = []
-        for route in routes_data.get("routes", []):
-            avg_danger = route.get("avg_danger_score", 0)
-            total_danger += avg_danger
-
-            if avg_danger >= 5:
-                dangerous_count += 1
-
-            transformed_systems = []
-            total_kills = 0
-            total_isk = 0
-
-            for system in route.get("systems", []):
-                kills = system.get("kills_24h", 0)
-                isk = system.get("isk_destroyed_24h", 0)
-                is_camp = system.get("gate_camp_detected", False)
-
-                total_kills += kills
-                total_isk += isk
-                if is_camp:
-                    gate_camps += 1
-
-                transformed_systems.append({
-                    "system_id": system["system_id"],
-                    "system_name": system["system_name"],
-                    "security_status": system.get("security", 0),
-                    "danger_score": system.get("danger_score", 0),
-                    "kills_24h": kills,
-                    "isk_destroyed_24h": isk,
-                    "is_gate_camp": is_camp
-                })
-
-            transformed_routes.append({
-                "origin_system": route["from_hub"],
-                "destination_system": route["to_hub"],
-                "jumps": route.get("total_jumps", 0),
-                "danger_score": avg_danger,
-                "total_kills": total_kills,
-                "total_isk_destroyed": total_isk,
-                "systems": transformed_systems
+        for system in route.get("systems", []):
+            kills = system.get("kills_24h", 0)
+            isk = system.get("isk_destroyed_24h", 0)
+            is_camp = system.get("gate_camp_detected", False)
+
+            total_kills += kills
+            total_isk += isk
+            if is_camp:
+                gate_camps += 1
+
+            transformed_systems.append({
+                "system_id": system["system_id"],
+                "system_name": system["system_name"],
+                "security_status": system.get("security", 0),
+                "danger_score": system.get("danger_score", 0),
+                "kills_24h": kills,
+                "isk_destroyed_24h": isk,
+                "is_gate_camp": is_camp
             })
 
-        avg_danger_score = total_danger / total_routes if total_routes > 0 else 0
-
-        result = {
-            "period": routes_data.get("period", "24h"),
-            "global": {
-                "total_routes": total_routes,
-                "dangerous_routes": dangerous_count,
-                "avg_danger_score": avg_danger_score,
-                "gate_camps_detected": gate_camps
-            },
-            "routes": transformed_routes
-        }
-
-        log(f"  [OK] Trade Routes ({total_routes} routes, {elapsed:.1f}s)")
-        save_report('trade_routes', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] Trade Routes: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def generate_strategic_briefing():
+        transformed_routes.append({
+            "origin_system": route["from_hub"],
+            "destination_system": route["to_hub"],
+            "jumps": route.get("total_jumps", 0),
+            "danger_score": avg_danger,
+            "total_kills": total_kills,
+            "total_isk_destroyed": total_isk,
+            "systems": transformed_systems
+        })
+
+    avg_danger_score = total_danger / total_routes if total_routes > 0 else 0
+
+    result = {
+        "period": routes_data.get("period", "24h"),
+        "global": {
+            "total_routes": total_routes,
+            "dangerous_routes": dangerous_count,
+            "avg_danger_score": avg_danger_score,
+            "gate_camps_detected": gate_camps
+        },
+        "routes": transformed_routes
+    }
+
+    log(f"  [OK] Trade Routes ({total_routes} routes)")
+    return result
+
+
+def generate_strategic_briefing(inputs: Dict[str, Dict]) -> Dict:
     """Generate strategic intelligence briefing (LLM)"""
     from services.llm_analysis_service import generate_strategic_briefing as gen_briefing
 
-    log("Generating Strategic Briefing...")
-    start = time.time()
-
-    try:
-        result = gen_briefing(force_fresh=True)
-        elapsed = time.time() - start
-
-        if result.get("error"):
-            log(f"  [WARN] Generated with error: {result['error']} ({elapsed:.1f}s)")
-        else:
-            log(f"  [OK] Strategic Briefing ({elapsed:.1f}s)")
+    result = gen_briefing(force_fresh=True)
 
-        save_report('strategic_briefing', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] Strategic Briefing: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    if result.get("error"):
+        log(f"  [WARN] Strategic Briefing generated with error: {result['error']}")
+    else:
+        log("  [OK] Strategic Briefing")
+    return result
 
 
-def generate_alliance_wars_analysis():
-    """Generate alliance wars LLM analysis"""
+def generate_alliance_wars_analysis(inputs: Dict[str, Dict]) -> Dict:
+    """Generate alliance wars LLM analysis from this cycle's alliance wars report"""
     from services.llm_analysis_service import generate_alliance_wars_analysis
-    from services.stored_reports_service import get_report
 
-    log("Generating Alliance Wars Analysis...")
-    start = time.time()
+    result = generate_alliance_wars_analysis(inputs['alliance_wars'], force_fresh=True)
 
-    try:
-        # Get the alliance wars data from stored report
-        wars_data = get_report('alliance_wars')
-        if not wars_data:
-            log("  [SKIP] Alliance Wars data not available yet")
-            return False
+    if result.get("error"):
+        log(f"  [WARN] Alliance Wars Analysis generated with error: {result['error']}")
+    else:
+        log("  [OK] Alliance Wars Analysis")
+    return result
 
-        result = generate_alliance_wars_analysis(wars_data, force_fresh=True)
-        elapsed = time.time() - start
 
-        if result.get("error"):
-            log(f"  [WARN] Generated with error: {result['error']} ({elapsed:.1f}s)")
-        else:
-            log(f"  [OK] Alliance Wars Analysis ({elapsed:.1f}s)")
-
-        save_report('alliance_wars_analysis', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] Alliance Wars Analysis: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def generate_war_economy_analysis():
-    """Generate war economy LLM analysis"""
+def generate_war_economy_analysis(inputs: Dict[str, Dict]) -> Dict:
+    """Generate war economy LLM analysis from this cycle's war economy report"""
     from services.llm_analysis_service import generate_war_economy_analysis
-    from services.stored_reports_service import get_report
 
-    log("Generating War Economy Analysis...")
-    start = time.time()
-
-    try:
-        # Get the war economy data from stored report
-        economy_data = get_report('war_economy')
-        if not economy_data:
-            log("  [SKIP] War Economy data not available yet")
-            return False
-
-        result = generate_war_economy_analysis(economy_data, force_fresh=True)
-        elapsed = time.time() - start
-
-        if result.get("error"):
-            log(f"  [WARN] Generated with error: {result['error']} ({elapsed:.1f}s)")
+    result = generate_war_economy_analysis(inputs['war_economy'], force_fresh=True)
+
+    if result.get("error"):
+        log(f"  [WARN] War Economy Analysis generated with error: {result['error']}")
+    else:
+        log("  [OK] War Economy Analysis")
+    return result
+
+
+@dataclass
+class ReportNode:
+    """One report of the generation cycle"""
+    report_type: str
+    name: str
+    generate: Callable[[Dict[str, Dict]], Dict]   # Gets the results of depends_on
+    depends_on: Tuple[str, ...] = ()
+    timeout: float = DATA_REPORT_TIMEOUT
+
+
+@dataclass
+class NodeResult:
+    """Outcome of one report: ok, failed, timeout or skipped"""
+    name: str
+    status: str
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 'ok'
+
+
+REPORT_GRAPH = [
+    ReportNode('pilot_intelligence', 'Pilot Intelligence', generate_pilot_intelligence),
+    ReportNode('war_economy', 'War Economy Report', generate_war_economy_report),
+    ReportNode('war_profiteering', 'War Profiteering', generate_war_profiteering),
+    ReportNode('alliance_wars', 'Alliance Wars', generate_alliance_wars),
+    ReportNode('trade_routes', 'Trade Routes', generate_trade_routes),
+    ReportNode('strategic_briefing', 'Strategic Briefing', generate_strategic_briefing,
+               timeout=LLM_REPORT_TIMEOUT),
+    ReportNode('alliance_wars_analysis', 'Alliance Wars Analysis', generate_alliance_wars_analysis,
+               depends_on=('alliance_wars',), timeout=LLM_REPORT_TIMEOUT),
+    ReportNode('war_economy_analysis', 'War Economy Analysis', generate_war_economy_analysis,
+               depends_on=('war_economy',), timeout=LLM_REPORT_TIMEOUT),
+]
+
+
+def _check_graph(nodes: List[ReportNode]):
+    """Raise ValueError on unknown dependencies or cycles"""
+    by_type = {node.report_type: node for node in nodes}
+    for node in nodes:
+        for dep in node.depends_on:
+            if dep not in by_type:
+                raise ValueError(f"{node.report_type} depends on unknown report {dep}")
+
+    resolved = set()
+    remaining = list(nodes)
+    while remaining:
+        ready = [n for n in remaining if all(d in resolved for d in n.depends_on)]
+        if not ready:
+            raise ValueError(f"Dependency cycle between: {', '.join(n.report_type for n in remaining)}")
+        resolved.update(n.report_type for n in ready)
+        remaining = [n for n in remaining if n.report_type not in resolved]
+
+
+def run_report_graph(
+    nodes: List[ReportNode],
+    workers: int = DEFAULT_WORKERS,
+    save: Callable[[str, Dict, float], bool] = save_report
+) -> Dict[str, NodeResult]:
+    """
+    Generate reports in dependency order, up to `workers` at a time.
+
+    Each report runs in a daemon thread and is saved from this thread with
+    its wall time as generation_time_seconds. A report that exceeds its
+    timeout is abandoned (its thread is left to finish in the background
+    and its result is discarded); failed and timed-out reports skip their
+    dependents only.
+
+    Returns:
+        report_type -> NodeResult, in node order
+    """
+    _check_graph(nodes)
+
+    pending = list(nodes)
+    running: Dict[str, Tuple[ReportNode, float]] = {}   # report_type -> (node, deadline)
+    outputs: Dict[str, Dict] = {}
+    results: Dict[str, NodeResult] = {}
+    finished: "queue.Queue" = queue.Queue()
+
+    def run(node: ReportNode, inputs: Dict[str, Dict]):
+        start = time.time()
+        try:
+            output, error = node.generate(inputs), None
+        except Exception as e:
+            traceback.print_exc()
+            output, error = None, e
+        finished.put((node.report_type, output, error, time.time() - start))
+
+    while pending or running:
+        for node in list(pending):
+            failed = [d for d in node.depends_on if d in results and not results[d].ok]
+            if failed:
+                pending.remove(node)
+                results[node.report_type] = NodeResult(node.name, 'skipped', error=f"{', '.join(failed)} not generated")
+                log(f"  [SKIP] {node.name}: {', '.join(failed)} not generated")
+
+        for node in list(pending):
+            if len(running) >= workers:
+                break
+            if all(d in outputs for d in node.depends_on):
+                pending.remove(node)
+                log(f"Generating {node.name}...")
+                inputs = {d: outputs[d] for d in node.depends_on}
+                threading.Thread(target=run, args=(node, inputs), name=f"report-{node.report_type}",
+                                 daemon=True).start()
+                running[node.report_type] = (node, time.time() + node.timeout)
+
+        if not running:
+            continue
+
+        next_deadline = min(deadline for _, deadline in running.values())
+        try:
+            report_type, output, error, elapsed = finished.get(timeout=max(0.0, next_deadline - time.time()))
+        except queue.Empty:
+            now = time.time()
+            for report_type, (node, deadline) in list(running.items()):
+                if now >= deadline:
+                    del running[report_type]
+                    results[report_type] = NodeResult(node.name, 'timeout', node.timeout,
+                                                      f"timed out after {node.timeout:.0f}s")
+                    log(f"  [TIMEOUT] {node.name} after {node.timeout:.0f}s")
+            continue
+
+        if report_type not in running:
+            continue    # Late result of a report that already timed out
+        node, _ = running.pop(report_type)
+
+        if error is None:
+            try:
+                save(report_type, output, elapsed)
+            except Exception as e:
+                traceback.print_exc()
+                error = e
+        if error is not None:
+            results[report_type] = NodeResult(node.name, 'failed', elapsed, str(error))
+            log(f"  [FAIL] {node.name}: {error} ({elapsed:.1f}s)")
         else:
-            log(f"  [OK] War Economy Analysis ({elapsed:.1f}s)")
+            outputs[report_type] = output
+            results[report_type] = NodeResult(node.name, 'ok', elapsed)
+            log(f"  [SAVED] {node.name} ({elapsed:.1f}s)")
 
-        save_report('war_economy_analysis', result, elapsed)
-        return True
-    except Exception as e:
-        log(f"  [FAIL] War Economy Analysis: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    return {node.report_type: results[node.report_type] for node in nodes}
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Pre-generate all intelligence reports')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Reports generated concurrently (default: {DEFAULT_WORKERS})')
+    args = parser.parse_args()
+
     log("=" * 60)
     log("Starting Report Pre-Generation (6-hour cycle)")
     log("=" * 60)
@@ -416,33 +472,20 @@ def main():
         log(f"  - {rt}: {age}{stale}")
 
     total_start = time.time()
-    results = []
-
-    # Generate data reports first (they're needed for LLM analysis)
-    log("\n--- Data Reports ---")
-    results.append(("Pilot Intelligence", generate_pilot_intelligence()))
-    results.append(("War Economy Report", generate_war_economy_report()))
-    results.append(("War Profiteering", generate_war_profiteering()))
-    results.append(("Alliance Wars", generate_alliance_wars()))
-    results.append(("Trade Routes", generate_trade_routes()))
-
-    # Generate LLM analyses (depend on data reports)
-    log("\n--- LLM Analyses ---")
-    results.append(("Strategic Briefing", generate_strategic_briefing()))
-    results.append(("Alliance Wars Analysis", generate_alliance_wars_analysis()))
-    results.append(("War Economy Analysis", generate_war_economy_analysis()))
+    log(f"\n--- Reports ({args.workers} workers) ---")
+    results = run_report_graph(REPORT_GRAPH, workers=max(1, args.workers))
 
     # Summary
     total_time = time.time() - total_start
-    success = sum(1 for _, ok in results if ok)
+    success = sum(1 for r in results.values() if r.ok)
     total = len(results)
 
     log("\n" + "=" * 60)
     log(f"Report Pre-Generation Complete: {success}/{total} successful ({total_time:.1f}s)")
 
-    for name, ok in results:
-        status = "OK" if ok else "FAILED"
-        log(f"  - {name}: {status}")
+    for r in results.values():
+        detail = f" ({r.error})" if r.error else ""
+        log(f"  - {r.name}: {r.status.upper()} {r.elapsed:.1f}s{detail}")
 
     log("=" * 60)
 
@@ -6,6 +6,8 @@ Uses official zKillboard RedisQ API for reliable killmail streaming.
 https://github.com/zKillboard/RedisQ
 
 Key Features:
+- Staged pipeline: RedisQ poll -> concurrent ESI fetch -> DB/Redis lanes
+  (kills of one solar system are processed in order)
 - queueID persistence: zKillboard remembers position for 3 hours
 - Survives restarts without missing kills
 - Redis-based deduplication (no more in-memory state loss)
@@ -23,25 +25,37 @@ import os
 import asyncio
 import argparse
 import signal
-from typing import List
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.zkillboard.redisq_client import ZKillRedisQClient, RedisQPackage, create_redisq_client
+from services.zkillboard.redisq_client import ZKillRedisQClient, create_redisq_client
 from services.zkillboard.live_service import ZKillboardLiveService
+from services.zkillboard.kill_pipeline import KillPipeline
 from services.zkillboard.state_manager import RedisStateManager
-from config import ZKILL_QUEUE_ID, ZKILL_TTW, ZKILL_MAX_CONCURRENT_ESI
+from src.services.sde import get_sde_lookup
+from config import (
+    ZKILL_QUEUE_ID, ZKILL_TTW, ZKILL_MAX_CONCURRENT_ESI,
+    ZKILL_DB_WORKERS, ZKILL_PIPELINE_MAX_IN_FLIGHT
+)
 
 # Global service instance
 live_service: ZKillboardLiveService = None
 redisq_client: ZKillRedisQClient = None
+pipeline: KillPipeline = None
 state_manager: RedisStateManager = None
 verbose_mode: bool = False
 
 
 def signal_handler(signum, frame):
-    """Handle shutdown signals"""
+    """Handle shutdown signals (second signal exits immediately)"""
+    if pipeline and pipeline.running:
+        print("\nShutdown signal received. Draining in-flight kills...")
+        pipeline.stop()
+        if live_service:
+            live_service.stop()
+        return
+
     print("\nShutdown signal received. Stopping listener...")
     if redisq_client:
         redisq_client.stop()
@@ -50,45 +64,8 @@ def signal_handler(signum, frame):
     sys.exit(0)
 
 
-async def process_kill_batch(packages: List[RedisQPackage]):
-    """
-    Process a batch of killmails from RedisQ.
-
-    Args:
-        packages: List of RedisQPackage from RedisQ
-    """
-    global live_service, verbose_mode
-
-    for package in packages:
-        try:
-            if not package.killmail_id or not package.hash:
-                continue
-
-            if verbose_mode:
-                print(f"[RedisQ] Processing killmail {package.killmail_id}")
-
-            # Create zkb_entry format expected by process_live_kill
-            zkb_entry = {
-                "killmail_id": package.killmail_id,
-                "zkb": {
-                    "hash": package.hash,
-                    **package.zkb
-                }
-            }
-
-            # If killmail data was pre-fetched by RedisQ client
-            if package.killmail:
-                zkb_entry["killmail"] = package.killmail
-
-            # Process the kill
-            await live_service.process_live_kill(zkb_entry)
-
-        except Exception as e:
-            print(f"[ERROR] Failed to process killmail {package.killmail_id}: {e}")
-
-
 async def main():
-    global live_service, redisq_client, state_manager, verbose_mode
+    global live_service, redisq_client, pipeline, state_manager, verbose_mode
 
     parser = argparse.ArgumentParser(
         description='zKillboard Live Listener - Real-time killmail processing (v2.0 RedisQ)'
@@ -109,6 +86,18 @@ async def main():
         default=ZKILL_TTW,
         help=f'Time to wait for new kills in seconds (default: {ZKILL_TTW})'
     )
+    parser.add_argument(
+        '--esi-concurrency',
+        type=int,
+        default=ZKILL_MAX_CONCURRENT_ESI,
+        help=f'Concurrent ESI killmail fetches (default: {ZKILL_MAX_CONCURRENT_ESI})'
+    )
+    parser.add_argument(
+        '--db-workers',
+        type=int,
+        default=ZKILL_DB_WORKERS,
+        help=f'DB/Redis lanes, one system per lane (default: {ZKILL_DB_WORKERS})'
+    )
 
     args = parser.parse_args()
     verbose_mode = args.verbose
@@ -135,6 +124,13 @@ async def main():
     print(f"  ✓ Live Service: Initialized")
     print(f"    - Hotspot threshold: 5 kills in 5 minutes")
     print(f"    - Battle timeout: 30 minutes")
+    print(f"    - Kill writer: batches of {live_service.kill_writer.max_batch} kills "
+          f"or {round(live_service.kill_writer.max_wait * 1000)}ms")
+
+    # SDE lookup (types, groups, systems) for the per-kill hot path
+    sde_stats = get_sde_lookup().stats()
+    print(f"  ✓ SDE Lookup: {sde_stats['types']} types, {sde_stats['systems']} systems "
+          f"({sde_stats['memory_bytes'] // 1024} KiB)")
 
     # RedisQ Client
     redisq_client = create_redisq_client(
@@ -146,17 +142,26 @@ async def main():
     print(f"    - TTW: {args.ttw}s")
     print(f"    - zKillboard remembers position for 3 hours!")
 
+    # Staged pipeline: poll -> ESI fetch -> DB/Redis lanes
+    pipeline = KillPipeline(
+        live_service,
+        redisq_client,
+        esi_concurrency=args.esi_concurrency,
+        db_workers=args.db_workers,
+        max_in_flight=ZKILL_PIPELINE_MAX_IN_FLIGHT,
+        verbose=verbose_mode
+    )
+    print(f"  ✓ Pipeline: {args.esi_concurrency} ESI fetchers, {args.db_workers} DB lanes, "
+          f"max {ZKILL_PIPELINE_MAX_IN_FLIGHT} kills in flight")
+
     print("\n" + "=" * 70)
     print("STATUS: Starting listener...")
     print("Press Ctrl+C to stop")
     print("=" * 70 + "\n")
 
     try:
-        # Start listening with callback
-        await redisq_client.listen(
-            callback=process_kill_batch,
-            batch_size=1  # Process kills immediately
-        )
+        # Runs until stopped, then drains in-flight kills
+        await pipeline.run()
     except KeyboardInterrupt:
         print("\nStopped by user")
     except Exception as e:
@@ -174,6 +179,13 @@ async def main():
             print(f"\nSession Statistics:")
             print(f"  - Kills processed today: {stats.get('processed_today', 0)}")
             print(f"  - Active systems: {stats.get('active_systems', 0)}")
+        if live_service:
+            writer = live_service.kill_writer.stats()
+            print(f"  - Kills stored: {writer['kills_stored']} in {writer['batches']} batches "
+                  f"(avg flush {writer['avg_flush_ms']}ms, max {writer['max_flush_ms']}ms)")
+        if pipeline:
+            lag = pipeline.stats()['kill_to_stored_lag']
+            print(f"  - Kill time -> stored lag: p50 {lag['p50']}s, p95 {lag['p95']}s, max {lag['max']}s")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ EVE Co-Pilot API
 FastAPI-based REST API for EVE Online production and trading analysis
 """
 
+import threading
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -25,7 +27,17 @@ from routers import (
     war_router,
     dashboard_router,
     research_router,
+    admin_router,
 )
+from src.services.route.universe import warm_up_universe_graph
+from src.services.market.price_book import warm_up_price_book
+from src.services.production.bom_cache import warm_up_bom_cache
+from src.services.sde.lookup import warm_up_sde_lookup
+from src.services.sde.search import warm_up_search_index
+from src.core.async_database import init_async_database, close_async_database
+from src.core.offload import shutdown_offload_pools
+from routers.mcp.handlers import api_proxy as mcp_api_proxy
+from src.database import close_db_pool
 
 # FastAPI App
 app = FastAPI(
@@ -61,6 +73,34 @@ app.include_router(mining_router)
 app.include_router(war_router, prefix="/api/war", tags=["War Room"])
 app.include_router(dashboard_router)
 app.include_router(research_router)
+app.include_router(admin_router)
+
+# MCP tools reach API routes in-process instead of over loopback HTTP
+mcp_api_proxy.bind_app(app)
+
+
+@app.on_event("startup")
+async def warm_up_caches():
+    """Build shared in-memory data in the background so first requests don't pay for it"""
+    threading.Thread(target=warm_up_universe_graph, name="universe-warmup", daemon=True).start()
+    threading.Thread(target=warm_up_price_book, name="price-book-warmup", daemon=True).start()
+    threading.Thread(target=warm_up_bom_cache, name="bom-cache-warmup", daemon=True).start()
+    threading.Thread(target=warm_up_sde_lookup, name="sde-lookup-warmup", daemon=True).start()
+    threading.Thread(target=warm_up_search_index, name="sde-search-warmup", daemon=True).start()
+
+
+@app.on_event("startup")
+async def open_async_database():
+    """Open the async pool used by async routes (connects in the background)"""
+    await init_async_database()
+
+
+@app.on_event("shutdown")
+async def close_pools():
+    """Close database pools and the offload thread pools"""
+    await close_async_database()
+    shutdown_offload_pools()
+    close_db_pool()
 
 
 @app.get("/")
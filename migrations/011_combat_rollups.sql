@@ -0,0 +1,146 @@
+-- Migration 011: Hourly Combat Rollups
+-- Pre-aggregated combat statistics for strategic metrics, war tracker and coalition detection
+--
+-- Rollups are rebuilt per hour from killmails / killmail_attackers by
+-- services/combat_rollup_service.py (jobs/combat_rollups.py):
+-- - catch-up: hours touched since the last run (killmails.processed_at watermark)
+-- - backfill: full rebuild of the last N days
+-- - check:    row-level comparison of rollups against the raw tables
+
+BEGIN;
+
+-- ============================================================
+-- STEP 1: Alliance activity per hour
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS combat_rollup_alliance_hourly (
+    hour TIMESTAMP NOT NULL,
+    alliance_id BIGINT NOT NULL,
+
+    -- As attacker (each kill counted once per alliance)
+    kills INTEGER NOT NULL DEFAULT 0,
+    isk_destroyed BIGINT NOT NULL DEFAULT 0,
+    attacker_entries INTEGER NOT NULL DEFAULT 0,
+
+    -- As victim
+    losses INTEGER NOT NULL DEFAULT 0,
+    isk_lost BIGINT NOT NULL DEFAULT 0,
+    capital_losses INTEGER NOT NULL DEFAULT 0,
+    capital_isk_lost BIGINT NOT NULL DEFAULT 0,
+    titan_losses INTEGER NOT NULL DEFAULT 0,
+    super_losses INTEGER NOT NULL DEFAULT 0,
+    dread_losses INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (hour, alliance_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_rollup_alliance ON combat_rollup_alliance_hourly(alliance_id, hour DESC);
+
+COMMENT ON COLUMN combat_rollup_alliance_hourly.attacker_entries IS 'Attacker rows of this alliance (one per pilot on the kill)';
+
+-- ============================================================
+-- STEP 2: Region activity per hour
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS combat_rollup_region_hourly (
+    hour TIMESTAMP NOT NULL,
+    region_id INTEGER NOT NULL,
+    kills INTEGER NOT NULL DEFAULT 0,
+    isk_destroyed BIGINT NOT NULL DEFAULT 0,
+    capital_kills INTEGER NOT NULL DEFAULT 0,
+    capital_isk BIGINT NOT NULL DEFAULT 0,
+    titan_kills INTEGER NOT NULL DEFAULT 0,
+    super_kills INTEGER NOT NULL DEFAULT 0,
+    other_capital_kills INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (hour, region_id)
+);
+
+-- ============================================================
+-- STEP 3: System activity per hour
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS combat_rollup_system_hourly (
+    hour TIMESTAMP NOT NULL,
+    solar_system_id INTEGER NOT NULL,
+    region_id INTEGER,
+    kills INTEGER NOT NULL DEFAULT 0,
+    isk_destroyed BIGINT NOT NULL DEFAULT 0,
+    hauler_kills INTEGER NOT NULL DEFAULT 0,
+    pod_kills INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (hour, solar_system_id)
+);
+
+-- ============================================================
+-- STEP 4: Ship category activity per hour
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS combat_rollup_ship_category_hourly (
+    hour TIMESTAMP NOT NULL,
+    ship_category VARCHAR(30) NOT NULL,
+    kills INTEGER NOT NULL DEFAULT 0,
+    isk_destroyed BIGINT NOT NULL DEFAULT 0,
+    capital_kills INTEGER NOT NULL DEFAULT 0,
+    capital_isk BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (hour, ship_category)
+);
+
+COMMENT ON COLUMN combat_rollup_ship_category_hourly.ship_category IS 'killmails.ship_category, ''unknown'' when not classified';
+
+-- ============================================================
+-- STEP 5: Attacker alliance vs victim alliance per hour
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS combat_rollup_matchup_hourly (
+    hour TIMESTAMP NOT NULL,
+    attacker_alliance_id BIGINT NOT NULL,
+    victim_alliance_id BIGINT NOT NULL,
+    solar_system_id INTEGER NOT NULL,
+    ship_class VARCHAR(20) NOT NULL,
+    kills INTEGER NOT NULL DEFAULT 0,
+    isk_destroyed BIGINT NOT NULL DEFAULT 0,
+    attacker_entries INTEGER NOT NULL DEFAULT 0,
+    max_ship_value BIGINT NOT NULL DEFAULT 0,
+    max_ship_type_id INTEGER,
+
+    PRIMARY KEY (hour, attacker_alliance_id, victim_alliance_id, solar_system_id, ship_class)
+);
+
+CREATE INDEX IF NOT EXISTS idx_rollup_matchup_pair
+ON combat_rollup_matchup_hourly(attacker_alliance_id, victim_alliance_id, hour DESC);
+
+COMMENT ON COLUMN combat_rollup_matchup_hourly.ship_class IS 'Victim ship class as used by the war tracker (capital, battleship, ..., other)';
+COMMENT ON COLUMN combat_rollup_matchup_hourly.max_ship_type_id IS 'Ship type of the most expensive kill in this row';
+
+-- ============================================================
+-- STEP 6: Co-attacking alliance pairs per hour
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS combat_rollup_alliance_pair_hourly (
+    hour TIMESTAMP NOT NULL,
+    alliance_a_id BIGINT NOT NULL,
+    alliance_b_id BIGINT NOT NULL,
+    kills_together INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (hour, alliance_a_id, alliance_b_id),
+    CHECK (alliance_a_id < alliance_b_id)
+);
+
+-- ============================================================
+-- STEP 7: Watermarks
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS combat_rollup_state (
+    name VARCHAR(50) PRIMARY KEY,
+    watermark TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE combat_rollup_state IS 'Rollup catch-up progress: killmails processed up to watermark are rolled up';
+
+-- Catch-up finds new kills by processed_at
+CREATE INDEX IF NOT EXISTS idx_killmails_processed_at ON killmails(processed_at);
+
+COMMIT;
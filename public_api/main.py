@@ -3,6 +3,8 @@ EVE Intelligence Public API
 Serves cached combat intelligence reports to the public
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
@@ -12,13 +14,29 @@ from slowapi.middleware import SlowAPIMiddleware
 from public_api.middleware.security import SecurityHeadersMiddleware
 from public_api.middleware.rate_limit import limiter, rate_limit_handler
 from public_api.routers import reports, war
+from public_api.report_cache import report_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the reports off the event loop, then keep the in-process
+    # cache in sync with stored_reports
+    try:
+        await asyncio.to_thread(report_cache.refresh)
+    except Exception as e:
+        print(f"Initial report cache load failed: {e}")
+    poller = asyncio.create_task(report_cache.run_poller())
+    yield
+    poller.cancel()
+
 
 app = FastAPI(
     title="EVE Intelligence API",
     description="Public combat intelligence reports for EVE Online",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # GZip Compression - Compress responses larger than 500 bytes
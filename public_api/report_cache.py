@@ -0,0 +1,159 @@
+"""
+Report Cache
+Holds the stored reports in-process as pre-serialized, pre-compressed bytes.
+
+Reports change only when the report generator saves a new version (every
+6 hours), so each version is serialized and compressed (gzip, and brotli
+when the brotli package is installed) once. A background task polls
+stored_reports.version and reloads only the reports whose version changed;
+requests are served from memory and never touch the database. The app
+lifespan awaits the first refresh() in a worker thread before the poller
+starts; until a refresh succeeds every report is reported as missing.
+"""
+
+import asyncio
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from services.stored_reports_service import get_report_versions, get_report_with_version
+
+try:
+    import brotli
+except ImportError:  # Optional: responses fall back to gzip
+    brotli = None
+
+REPORT_POLL_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class CachedReport:
+    """One serialized representation of a report version"""
+    etag: str
+    body: bytes
+    gzip_body: bytes
+    brotli_body: Optional[bytes] = None
+
+    @classmethod
+    def build(cls, data: Dict, etag: str) -> "CachedReport":
+        body = json.dumps(data, separators=(",", ":")).encode()
+        return cls(
+            etag=etag,
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+            brotli_body=brotli.compress(body) if brotli else None,
+        )
+
+    def encoded(self, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """Best representation for an Accept-Encoding header: (body, content encoding)"""
+        accepted = set()
+        for token in accept_encoding.lower().split(","):
+            coding, _, params = token.partition(";")
+            params = params.replace(" ", "")
+            if params.startswith("q="):
+                try:
+                    if float(params[2:]) == 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(coding.strip())
+
+        if self.brotli_body is not None and "br" in accepted:
+            return self.brotli_body, "br"
+        if "gzip" in accepted or "*" in accepted:
+            return self.gzip_body, "gzip"
+        return self.body, None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class ReportCache:
+    """Versioned in-process cache of the stored reports"""
+
+    def __init__(
+        self,
+        load: Callable[[str], Optional[Tuple[Dict, int]]] = get_report_with_version,
+        poll_versions: Callable[[], Dict[str, int]] = get_report_versions,
+        poll_seconds: float = REPORT_POLL_SECONDS
+    ):
+        self._load = load
+        self._poll_versions = poll_versions
+        self.poll_seconds = poll_seconds
+        self._reports: Dict[str, Tuple[int, Dict]] = {}              # report_type -> (version, data)
+        self._entries: Dict[Tuple[str, int, str], CachedReport] = {}  # (report_type, version, variant)
+
+    def refresh(self) -> int:
+        """
+        Reload the reports whose stored version changed.
+
+        Returns:
+            Number of reloaded reports
+        """
+        versions = self._poll_versions()
+        reloaded = 0
+        for report_type, version in versions.items():
+            cached = self._reports.get(report_type)
+            if cached and cached[0] == version:
+                continue
+            stored = self._load(report_type)
+            if stored is None:
+                continue
+            data, version = stored
+            self._reports[report_type] = (version, data)
+            self._entries = {
+                key: entry for key, entry in self._entries.items()
+                if key[0] != report_type or key[1] == version
+            }
+            self._entries[(report_type, version, "")] = CachedReport.build(data, f'W/"{report_type}-v{version}"')
+            reloaded += 1
+        return reloaded
+
+    def get(
+        self,
+        report_type: str,
+        variant: str = "",
+        transform: Optional[Callable[[Dict], Dict]] = None
+    ) -> Optional[CachedReport]:
+        """
+        Cached representation of a report, None if it was never generated
+        or not loaded yet. Never queries the database.
+
+        Args:
+            report_type: Stored report type
+            variant: Key of a derived representation (e.g. query parameters)
+            transform: Builds the variant from a copy of the report data;
+                runs once per report version and variant
+        """
+        cached = self._reports.get(report_type)
+        if cached is None:
+            return None
+        version, data = cached
+
+        key = (report_type, version, variant)
+        entry = self._entries.get(key)
+        if entry is None:
+            derived = transform(json.loads(json.dumps(data))) if transform else data
+            entry = CachedReport.build(derived, f'W/"{report_type}-v{version}-{variant}"')
+            self._entries[key] = entry
+        return entry
+
+    async def run_poller(self):
+        """Poll report versions until cancelled (the initial load happens before)"""
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                print(f"Report cache refresh failed: {e}")
+
+
+report_cache = ReportCache()
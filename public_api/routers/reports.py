@@ -2,28 +2,50 @@
 Reports API Router
 Serves pre-generated combat intelligence reports from PostgreSQL.
 Reports are generated every 6 hours by cron job.
+
+Reports are served from the in-process report cache as pre-compressed
+bytes with an ETag; If-None-Match requests get a 304.
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import Dict
-from services.stored_reports_service import get_report, get_report_status
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from typing import Callable, Dict, Optional
+from services.stored_reports_service import get_report_status
+from public_api.report_cache import report_cache, etag_matches
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
 
-def get_stored_report_or_error(report_type: str) -> Dict:
-    """Get a stored report or raise HTTPException if not available."""
-    report = get_report(report_type)
+def stored_report_response(
+    request: Request,
+    report_type: str,
+    variant: str = "",
+    transform: Optional[Callable[[Dict], Dict]] = None
+) -> Response:
+    """Serve a stored report from the cache or raise HTTPException if not available."""
+    report = report_cache.get(report_type, variant, transform)
     if report is None:
         raise HTTPException(
             status_code=503,
             detail=f"Report '{report_type}' not yet generated. Please wait for the next cron cycle."
         )
-    return report
+
+    headers = {
+        "ETag": report.etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "public, no-cache",
+    }
+    if etag_matches(request.headers.get("if-none-match"), report.etag):
+        return Response(status_code=304, headers=headers)
+
+    # Already compressed: GZipMiddleware leaves responses with a Content-Encoding alone
+    body, encoding = report.encoded(request.headers.get("accept-encoding", ""))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/battle-24h")
-async def get_battle_report() -> Dict:
+async def get_battle_report(request: Request) -> Response:
     """
     24-Hour Battle Report - Pilot Intelligence
 
@@ -37,11 +59,11 @@ async def get_battle_report() -> Dict:
 
     Pre-generated every 6 hours.
     """
-    return get_stored_report_or_error('pilot_intelligence')
+    return stored_report_response(request, 'pilot_intelligence')
 
 
 @router.get("/war-profiteering")
-async def get_war_profiteering(limit: int = Query(default=20, ge=5, le=50)) -> Dict:
+async def get_war_profiteering(request: Request, limit: int = Query(default=20, ge=5, le=50)) -> Response:
     """
     War Profiteering Daily Digest
 
@@ -50,11 +72,11 @@ async def get_war_profiteering(limit: int = Query(default=20, ge=5, le=50)) -> D
 
     Pre-generated every 6 hours.
     """
-    return get_stored_report_or_error('war_profiteering')
+    return stored_report_response(request, 'war_profiteering')
 
 
 @router.get("/alliance-wars")
-async def get_alliance_wars() -> Dict:
+async def get_alliance_wars(request: Request) -> Response:
     """
     Alliance War Tracker
 
@@ -64,11 +86,11 @@ async def get_alliance_wars() -> Dict:
 
     Pre-generated every 6 hours.
     """
-    return get_stored_report_or_error('alliance_wars')
+    return stored_report_response(request, 'alliance_wars')
 
 
 @router.get("/alliance-wars/analysis")
-async def get_alliance_wars_analysis() -> Dict:
+async def get_alliance_wars_analysis(request: Request) -> Response:
     """
     AI-Powered Alliance Wars Analysis
 
@@ -77,14 +99,15 @@ async def get_alliance_wars_analysis() -> Dict:
 
     Pre-generated every 6 hours.
     """
-    return get_stored_report_or_error('alliance_wars_analysis')
+    return stored_report_response(request, 'alliance_wars_analysis')
 
 
 @router.get("/trade-routes")
 async def get_trade_routes(
+    request: Request,
     limit: int = Query(default=5, ge=1, le=20),
     include_systems: bool = Query(default=True)
-) -> Dict:
+) -> Response:
     """
     Trade Route Danger Map
 
@@ -93,22 +116,24 @@ async def get_trade_routes(
 
     Pre-generated every 6 hours.
     """
-    report = get_stored_report_or_error('trade_routes')
-
-    # Apply limit and include_systems filtering
-    if report and 'routes' in report:
-        routes = report['routes'][:limit]
-        if not include_systems:
-            # Remove systems array from each route
-            for route in routes:
-                route.pop('systems', None)
-        report = {**report, 'routes': routes}
+    def apply_filters(report: Dict) -> Dict:
+        # Apply limit and include_systems filtering
+        if 'routes' in report:
+            routes = report['routes'][:limit]
+            if not include_systems:
+                # Remove systems array from each route
+                for route in routes:
+                    route.pop('systems', None)
+            report = {**report, 'routes': routes}
+        return report
 
-    return report
+    return stored_report_response(
+        request, 'trade_routes', variant=f"{limit}-{int(include_systems)}", transform=apply_filters
+    )
 
 
 @router.get("/war-economy")
-async def get_war_economy(limit: int = Query(default=10, ge=5, le=20)) -> Dict:
+async def get_war_economy(request: Request, limit: int = Query(default=10, ge=5, le=20)) -> Response:
     """
     War Economy Intelligence Report
 
@@ -120,11 +145,11 @@ async def get_war_economy(limit: int = Query(default=10, ge=5, le=20)) -> Dict:
 
     Pre-generated every 6 hours.
     """
-    return get_stored_report_or_error('war_economy')
+    return stored_report_response(request, 'war_economy')
 
 
 @router.get("/war-economy/analysis")
-async def get_war_economy_analysis_endpoint() -> Dict:
+async def get_war_economy_analysis_endpoint(request: Request) -> Response:
     """
     AI-Powered War Economy Analysis
 
@@ -133,11 +158,11 @@ async def get_war_economy_analysis_endpoint() -> Dict:
 
     Pre-generated every 6 hours.
     """
-    return get_stored_report_or_error('war_economy_analysis')
+    return stored_report_response(request, 'war_economy_analysis')
 
 
 @router.get("/strategic-briefing")
-async def get_strategic_briefing() -> Dict:
+async def get_strategic_briefing(request: Request) -> Response:
     """
     Strategic Intelligence Briefing
 
@@ -154,7 +179,7 @@ async def get_strategic_briefing() -> Dict:
 
     Pre-generated every 6 hours.
     """
-    return get_stored_report_or_error('strategic_briefing')
+    return stored_report_response(request, 'strategic_briefing')
 
 
 @router.get("/status")
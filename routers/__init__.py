@@ -16,6 +16,7 @@ from .mining import router as mining_router
 from .war import router as war_router
 from .dashboard import router as dashboard_router
 from .research import router as research_router
+from .admin import router as admin_router
 
 __all__ = [
     'auth_router',
@@ -35,4 +36,5 @@ __all__ = [
     'war_router',
     'dashboard_router',
     'research_router',
+    'admin_router',
 ]
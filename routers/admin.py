@@ -0,0 +1,59 @@
+"""
+Admin router - Metrics and maintenance for in-process caches and pools.
+"""
+
+from fastapi import APIRouter, Query
+
+from src.core.async_database import get_async_database
+from src.core.offload import get_offload_stats
+from src.database import get_db_pool_stats
+from src.services.market.price_book import get_price_book_stats
+from src.services.production.bom_cache import bom_cache
+from src.services.route.universe import get_universe_stats
+from src.services.sde.lookup import get_sde_lookup_stats
+from src.services.sde.search import get_search_index_stats
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+
+@router.get("/caches")
+async def api_cache_stats():
+    """Size and hit/miss metrics of all shared in-memory caches"""
+    return {
+        "bom_cache": bom_cache.stats(),
+        "price_book": get_price_book_stats(),
+        "universe_graph": get_universe_stats(),
+        "sde_lookup": get_sde_lookup_stats(),
+        "sde_search": get_search_index_stats(),
+    }
+
+
+@router.get("/db-pool")
+async def api_db_pool_stats():
+    """Size, saturation and wait metrics of the process-wide connection pool"""
+    return get_db_pool_stats()
+
+
+@router.get("/async")
+async def api_async_stats():
+    """Async database pool counters and offload thread pool usage per lane"""
+    db = await get_async_database()
+    return {
+        "async_db_pool": db.stats(),
+        "offload": get_offload_stats(),
+    }
+
+
+@router.get("/caches/bom")
+async def api_bom_cache_stats():
+    """Hit/miss counters, size and SDE version of the BOM cache"""
+    return bom_cache.stats()
+
+
+@router.post("/caches/bom/invalidate")
+def api_invalidate_bom_cache(warm: bool = Query(False, description="Reload all blueprints right away")):
+    """Drop the BOM cache (e.g. after importing a new SDE)"""
+    bom_cache.invalidate()
+    if warm:
+        bom_cache.warm_up()
+    return {"status": "invalidated", **bom_cache.stats()}
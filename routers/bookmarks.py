@@ -5,8 +5,7 @@ Bookmarks router - Bookmark management endpoints.
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 
-from src.core.config import get_settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.core.exceptions import NotFoundError, EVECopilotError
 from src.services.bookmark.service import BookmarkService
 from src.services.bookmark.repository import BookmarkRepository
@@ -17,8 +16,7 @@ router = APIRouter(prefix="/api/bookmarks", tags=["Bookmarks"])
 
 def get_bookmark_service() -> BookmarkService:
     """Dependency injection for BookmarkService."""
-    settings = get_settings()
-    db = DatabasePool(settings)
+    db = get_database_pool()
     repository = BookmarkRepository(db)
     return BookmarkService(repository)
 
@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 
 from src.core.config import get_settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.core.exceptions import NotFoundError, ExternalAPIError, AuthenticationError, EVECopilotError
 from src.services.character.service import CharacterService
 from src.services.auth.service import AuthService
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/api/character", tags=["Character"])
 def get_character_service() -> CharacterService:
     """Dependency injection for CharacterService."""
     settings = get_settings()
-    db = DatabasePool(settings)
+    db = get_database_pool()
     esi_client = ESIClient()
 
     # Initialize AuthService for token management
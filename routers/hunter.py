@@ -5,7 +5,7 @@ Endpoints for finding profitable manufacturing opportunities
 
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, List
-from src.database import get_db_connection
+from src.core.async_database import get_async_database
 
 router = APIRouter(prefix="/api/hunter", tags=["Market Hunter"])
 
@@ -17,32 +17,31 @@ async def get_categories():
     Returns hierarchical structure of Category -> Groups.
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT category, group_name, COUNT(*) as count
-                    FROM manufacturing_opportunities
-                    GROUP BY category, group_name
-                    ORDER BY category, count DESC
-                """)
-                rows = cur.fetchall()
-
-                # Build hierarchical structure
-                categories = {}
-                for row in rows:
-                    cat = row[0] or "Unknown"
-                    group = row[1]
-                    count = row[2]
-
-                    if cat not in categories:
-                        categories[cat] = {"count": 0, "groups": []}
-                    categories[cat]["count"] += count
-                    categories[cat]["groups"].append({"name": group, "count": count})
-
-                return {
-                    "categories": categories,
-                    "total_items": sum(c["count"] for c in categories.values())
-                }
+        db = await get_async_database()
+        async with db.session() as session:
+            rows = await session.fetch_all("""
+                SELECT category, group_name, COUNT(*) as count
+                FROM manufacturing_opportunities
+                GROUP BY category, group_name
+                ORDER BY category, count DESC
+            """)
+
+            # Build hierarchical structure
+            categories = {}
+            for row in rows:
+                cat = row[0] or "Unknown"
+                group = row[1]
+                count = row[2]
+
+                if cat not in categories:
+                    categories[cat] = {"count": 0, "groups": []}
+                categories[cat]["count"] += count
+                categories[cat]["groups"].append({"name": group, "count": count})
+
+            return {
+                "categories": categories,
+                "total_items": sum(c["count"] for c in categories.values())
+            }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -55,54 +54,53 @@ async def get_market_tree():
     Returns tree structure like: Ships > Frigates > Standard Frigates > Amarr
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                # Get 3-level market hierarchy with item counts
-                cur.execute('''
-                    SELECT
-                        mg1."marketGroupID" as level1_id,
-                        mg1."marketGroupName" as level1,
-                        mg2."marketGroupID" as level2_id,
-                        mg2."marketGroupName" as level2,
-                        mg3."marketGroupID" as level3_id,
-                        mg3."marketGroupName" as level3,
-                        COUNT(DISTINCT mo.product_id) as items
-                    FROM manufacturing_opportunities mo
-                    JOIN "invTypes" t ON mo.product_id = t."typeID"
-                    LEFT JOIN "invMarketGroups" mg3 ON t."marketGroupID" = mg3."marketGroupID"
-                    LEFT JOIN "invMarketGroups" mg2 ON mg3."parentGroupID" = mg2."marketGroupID"
-                    LEFT JOIN "invMarketGroups" mg1 ON mg2."parentGroupID" = mg1."marketGroupID"
-                    GROUP BY mg1."marketGroupID", mg1."marketGroupName",
-                             mg2."marketGroupID", mg2."marketGroupName",
-                             mg3."marketGroupID", mg3."marketGroupName"
-                    ORDER BY mg1."marketGroupName", mg2."marketGroupName", mg3."marketGroupName"
-                ''')
-                rows = cur.fetchall()
-
-                # Build tree structure
-                tree = {}
-                for row in rows:
-                    level1_id, level1, level2_id, level2, level3_id, level3, items = row
-
-                    # Handle null levels (some items may not have full hierarchy)
-                    level1 = level1 or "Other"
-                    level2 = level2 or "Other"
-                    level3 = level3 or "Other"
-
-                    if level1 not in tree:
-                        tree[level1] = {"id": level1_id, "count": 0, "children": {}}
-
-                    if level2 not in tree[level1]["children"]:
-                        tree[level1]["children"][level2] = {"id": level2_id, "count": 0, "children": {}}
-
-                    tree[level1]["children"][level2]["children"][level3] = {
-                        "id": level3_id,
-                        "count": items
-                    }
-                    tree[level1]["children"][level2]["count"] += items
-                    tree[level1]["count"] += items
-
-                return {"tree": tree}
+        db = await get_async_database()
+        async with db.session() as session:
+            # Get 3-level market hierarchy with item counts
+            rows = await session.fetch_all('''
+                SELECT
+                    mg1."marketGroupID" as level1_id,
+                    mg1."marketGroupName" as level1,
+                    mg2."marketGroupID" as level2_id,
+                    mg2."marketGroupName" as level2,
+                    mg3."marketGroupID" as level3_id,
+                    mg3."marketGroupName" as level3,
+                    COUNT(DISTINCT mo.product_id) as items
+                FROM manufacturing_opportunities mo
+                JOIN "invTypes" t ON mo.product_id = t."typeID"
+                LEFT JOIN "invMarketGroups" mg3 ON t."marketGroupID" = mg3."marketGroupID"
+                LEFT JOIN "invMarketGroups" mg2 ON mg3."parentGroupID" = mg2."marketGroupID"
+                LEFT JOIN "invMarketGroups" mg1 ON mg2."parentGroupID" = mg1."marketGroupID"
+                GROUP BY mg1."marketGroupID", mg1."marketGroupName",
+                         mg2."marketGroupID", mg2."marketGroupName",
+                         mg3."marketGroupID", mg3."marketGroupName"
+                ORDER BY mg1."marketGroupName", mg2."marketGroupName", mg3."marketGroupName"
+            ''')
+
+            # Build tree structure
+            tree = {}
+            for row in rows:
+                level1_id, level1, level2_id, level2, level3_id, level3, items = row
+
+                # Handle null levels (some items may not have full hierarchy)
+                level1 = level1 or "Other"
+                level2 = level2 or "Other"
+                level3 = level3 or "Other"
+
+                if level1 not in tree:
+                    tree[level1] = {"id": level1_id, "count": 0, "children": {}}
+
+                if level2 not in tree[level1]["children"]:
+                    tree[level1]["children"][level2] = {"id": level2_id, "count": 0, "children": {}}
+
+                tree[level1]["children"][level2]["children"][level3] = {
+                    "id": level3_id,
+                    "count": items
+                }
+                tree[level1]["children"][level2]["count"] += items
+                tree[level1]["count"] += items
+
+            return {"tree": tree}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -131,104 +129,103 @@ async def hunter_scan(
     - Browse mode: Set min_roi=0, min_profit=0 and use category/groups/search/market_group
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                # Build query with filters
-                where_clauses = ["mo.roi >= %s", "mo.profit >= %s", "mo.difficulty <= %s"]
-                params = [min_roi, min_profit, max_difficulty]
-                joins = []
-
-                if category and category != "All":
-                    where_clauses.append("mo.category = %s")
-                    params.append(category)
-
-                # Group filter (comma-separated list)
-                if groups:
-                    group_list = [g.strip() for g in groups.split(",") if g.strip()]
-                    if group_list:
-                        placeholders = ", ".join(["%s"] * len(group_list))
-                        where_clauses.append(f"mo.group_name IN ({placeholders})")
-                        params.extend(group_list)
-
-                # Market group filter - matches this group or any child groups
-                if market_group:
-                    joins.append('JOIN "invTypes" t ON mo.product_id = t."typeID"')
-                    joins.append('LEFT JOIN "invMarketGroups" mg3 ON t."marketGroupID" = mg3."marketGroupID"')
-                    joins.append('LEFT JOIN "invMarketGroups" mg2 ON mg3."parentGroupID" = mg2."marketGroupID"')
-                    joins.append('LEFT JOIN "invMarketGroups" mg1 ON mg2."parentGroupID" = mg1."marketGroupID"')
-                    where_clauses.append(
-                        "(t.\"marketGroupID\" = %s OR mg3.\"parentGroupID\" = %s OR mg2.\"parentGroupID\" = %s OR mg1.\"marketGroupID\" = %s)"
-                    )
-                    params.extend([market_group, market_group, market_group, market_group])
-
-                # Text search in product name
-                if search:
-                    where_clauses.append("mo.product_name ILIKE %s")
-                    params.append(f"%{search}%")
-
-                # Determine sort order
-                sort_column = "mo.profit"
-                sort_direction = "DESC"
-                if sort_by == "roi":
-                    sort_column = "mo.roi"
-                elif sort_by == "material_cost":
-                    sort_column = "mo.cheapest_material_cost"
-                elif sort_by == "sell_price":
-                    sort_column = "mo.best_sell_price"
-                elif sort_by == "name":
-                    sort_column = "mo.product_name"
-                    sort_direction = "ASC"
-
-                join_clause = " ".join(joins) if joins else ""
-                query = f"""
-                    SELECT
-                        mo.product_id, mo.blueprint_id, mo.product_name, mo.category, mo.group_name,
-                        mo.difficulty, mo.cheapest_material_cost, mo.best_sell_price, mo.profit, mo.roi,
-                        mo.updated_at
-                    FROM manufacturing_opportunities mo
-                    {join_clause}
-                    WHERE {' AND '.join(where_clauses)}
-                    ORDER BY {sort_column} {sort_direction}
-                    LIMIT %s
-                """
-                params.append(top)
-
-                cur.execute(query, params)
-                rows = cur.fetchall()
-
-                # Get total count for stats
-                cur.execute("SELECT COUNT(*), MAX(updated_at) FROM manufacturing_opportunities")
-                stats_row = cur.fetchone()
-                total_in_db = stats_row[0] if stats_row else 0
-                last_updated = stats_row[1] if stats_row else None
-
-                results = []
-                for row in rows:
-                    results.append({
-                        "product_id": row[0],
-                        "blueprint_id": row[1],
-                        "product_name": row[2],
-                        "category": row[3] or "Unknown",
-                        "group_name": row[4],
-                        "difficulty": row[5],
-                        "material_cost": float(row[6]) if row[6] else 0,
-                        "sell_price": float(row[7]) if row[7] else 0,
-                        "profit": float(row[8]) if row[8] else 0,
-                        "roi": min(float(row[9]), 9999) if row[9] else 0,
-                        "volume_available": 0
-                    })
-
-                return {
-                    "scan_id": last_updated.isoformat() if last_updated else "unknown",
-                    "results": results,
-                    "summary": {
-                        "total_scanned": total_in_db,
-                        "profitable": len(results),
-                        "avg_roi": sum(r['roi'] for r in results) / len(results) if results else 0
-                    },
-                    "cached": True,
-                    "last_updated": last_updated.isoformat() if last_updated else None
-                }
+        db = await get_async_database()
+        async with db.session() as session:
+            # Build query with filters
+            where_clauses = ["mo.roi >= %s", "mo.profit >= %s", "mo.difficulty <= %s"]
+            params = [min_roi, min_profit, max_difficulty]
+            joins = []
+
+            if category and category != "All":
+                where_clauses.append("mo.category = %s")
+                params.append(category)
+
+            # Group filter (comma-separated list)
+            if groups:
+                group_list = [g.strip() for g in groups.split(",") if g.strip()]
+                if group_list:
+                    placeholders = ", ".join(["%s"] * len(group_list))
+                    where_clauses.append(f"mo.group_name IN ({placeholders})")
+                    params.extend(group_list)
+
+            # Market group filter - matches this group or any child groups
+            if market_group:
+                joins.append('JOIN "invTypes" t ON mo.product_id = t."typeID"')
+                joins.append('LEFT JOIN "invMarketGroups" mg3 ON t."marketGroupID" = mg3."marketGroupID"')
+                joins.append('LEFT JOIN "invMarketGroups" mg2 ON mg3."parentGroupID" = mg2."marketGroupID"')
+                joins.append('LEFT JOIN "invMarketGroups" mg1 ON mg2."parentGroupID" = mg1."marketGroupID"')
+                where_clauses.append(
+                    "(t.\"marketGroupID\" = %s OR mg3.\"parentGroupID\" = %s OR mg2.\"parentGroupID\" = %s OR mg1.\"marketGroupID\" = %s)"
+                )
+                params.extend([market_group, market_group, market_group, market_group])
+
+            # Text search in product name
+            if search:
+                where_clauses.append("mo.product_name ILIKE %s")
+                params.append(f"%{search}%")
+
+            # Determine sort order
+            sort_column = "mo.profit"
+            sort_direction = "DESC"
+            if sort_by == "roi":
+                sort_column = "mo.roi"
+            elif sort_by == "material_cost":
+                sort_column = "mo.cheapest_material_cost"
+            elif sort_by == "sell_price":
+                sort_column = "mo.best_sell_price"
+            elif sort_by == "name":
+                sort_column = "mo.product_name"
+                sort_direction = "ASC"
+
+            join_clause = " ".join(joins) if joins else ""
+            query = f"""
+                SELECT
+                    mo.product_id, mo.blueprint_id, mo.product_name, mo.category, mo.group_name,
+                    mo.difficulty, mo.cheapest_material_cost, mo.best_sell_price, mo.profit, mo.roi,
+                    mo.updated_at
+                FROM manufacturing_opportunities mo
+                {join_clause}
+                WHERE {' AND '.join(where_clauses)}
+                ORDER BY {sort_column} {sort_direction}
+                LIMIT %s
+            """
+            params.append(top)
+
+            rows = await session.fetch_all(query, params)
+
+            # Get total count for stats
+            stats_row = await session.fetch_one("SELECT COUNT(*), MAX(updated_at) FROM manufacturing_opportunities")
+
+            total_in_db = stats_row[0] if stats_row else 0
+            last_updated = stats_row[1] if stats_row else None
+
+            results = []
+            for row in rows:
+                results.append({
+                    "product_id": row[0],
+                    "blueprint_id": row[1],
+                    "product_name": row[2],
+                    "category": row[3] or "Unknown",
+                    "group_name": row[4],
+                    "difficulty": row[5],
+                    "material_cost": float(row[6]) if row[6] else 0,
+                    "sell_price": float(row[7]) if row[7] else 0,
+                    "profit": float(row[8]) if row[8] else 0,
+                    "roi": min(float(row[9]), 9999) if row[9] else 0,
+                    "volume_available": 0
+                })
+
+            return {
+                "scan_id": last_updated.isoformat() if last_updated else "unknown",
+                "results": results,
+                "summary": {
+                    "total_scanned": total_in_db,
+                    "profitable": len(results),
+                    "avg_roi": sum(r['roi'] for r in results) / len(results) if results else 0
+                },
+                "cached": True,
+                "last_updated": last_updated.isoformat() if last_updated else None
+            }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -247,41 +244,39 @@ async def get_opportunities(
     This endpoint provides quick access to profitable opportunities with sensible defaults.
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT
-                        product_id, blueprint_id, product_name, category, group_name,
-                        difficulty, cheapest_material_cost, best_sell_price, profit, roi,
-                        updated_at
-                    FROM manufacturing_opportunities
-                    WHERE roi >= %s AND profit >= %s AND difficulty <= %s
-                    ORDER BY profit DESC
-                    LIMIT %s
-                """, (min_roi, min_profit, max_difficulty, limit))
-
-                rows = cur.fetchall()
-
-                results = []
-                for row in rows:
-                    results.append({
-                        "product_id": row[0],
-                        "blueprint_id": row[1],
-                        "product_name": row[2],
-                        "category": row[3] or "Unknown",
-                        "group_name": row[4],
-                        "difficulty": row[5],
-                        "material_cost": float(row[6]) if row[6] else 0,
-                        "sell_price": float(row[7]) if row[7] else 0,
-                        "profit": float(row[8]) if row[8] else 0,
-                        "roi": min(float(row[9]), 9999) if row[9] else 0,
-                        "volume_available": 0
-                    })
-
-                return {
-                    "results": results,
-                    "count": len(results)
-                }
+        db = await get_async_database()
+        async with db.session() as session:
+            rows = await session.fetch_all("""
+                SELECT
+                    product_id, blueprint_id, product_name, category, group_name,
+                    difficulty, cheapest_material_cost, best_sell_price, profit, roi,
+                    updated_at
+                FROM manufacturing_opportunities
+                WHERE roi >= %s AND profit >= %s AND difficulty <= %s
+                ORDER BY profit DESC
+                LIMIT %s
+            """, (min_roi, min_profit, max_difficulty, limit))
+
+            results = []
+            for row in rows:
+                results.append({
+                    "product_id": row[0],
+                    "blueprint_id": row[1],
+                    "product_name": row[2],
+                    "category": row[3] or "Unknown",
+                    "group_name": row[4],
+                    "difficulty": row[5],
+                    "material_cost": float(row[6]) if row[6] else 0,
+                    "sell_price": float(row[7]) if row[7] else 0,
+                    "profit": float(row[8]) if row[8] else 0,
+                    "roi": min(float(row[9]), 9999) if row[9] else 0,
+                    "volume_available": 0
+                })
+
+            return {
+                "results": results,
+                "count": len(results)
+            }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -2,13 +2,17 @@
 Items router - Item search, groups, materials, regions, routes, cargo, and systems endpoints.
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
 
 from config import REGIONS
 from src.database import get_item_info, get_item_by_name, get_group_by_name, get_material_composition
+from src.core.offload import run_blocking
 from src.esi_client import esi_client
 from src.route_service import route_service, TRADE_HUB_SYSTEMS
+from src.services.route.universe import get_universe_stats
 from src.cargo_service import cargo_service
 from src.schemas import CargoCalculateRequest
 
@@ -32,14 +36,14 @@ async def api_item_search(
     if q and len(q) < 2 and not group_id and not market_group_id:
         raise HTTPException(status_code=422, detail="Search query must be at least 2 characters")
 
-    items = get_item_by_name(q, group_id=group_id, market_group_id=market_group_id)
+    items = await run_blocking(get_item_by_name, q, group_id=group_id, market_group_id=market_group_id)
     return {"query": q, "results": items, "count": len(items)}
 
 
 @router.get("/api/items/{type_id}")
 async def api_item_info(type_id: int):
     """Get item information by typeID"""
-    item = get_item_info(type_id)
+    item = await run_blocking(get_item_info, type_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     return item
@@ -48,7 +52,7 @@ async def api_item_info(type_id: int):
 @router.get("/api/groups/search")
 async def api_group_search(q: str = Query(..., min_length=2)):
     """Search for item groups by name"""
-    groups = get_group_by_name(q)
+    groups = await run_blocking(get_group_by_name, q)
     return {"query": q, "results": groups, "count": len(groups)}
 
 
@@ -65,8 +69,10 @@ async def api_regions():
 @router.get("/api/materials/{type_id}/composition")
 async def api_material_composition(type_id: int):
     """Get manufacturing composition for an item"""
-    composition = get_material_composition(type_id)
-    item = get_item_info(type_id)
+    composition, item = await asyncio.gather(
+        run_blocking(get_material_composition, type_id),
+        run_blocking(get_item_info, type_id)
+    )
     return {
         "type_id": type_id,
         "item_name": item["typeName"] if item else f"Type {type_id}",
@@ -81,10 +87,13 @@ async def api_material_composition(type_id: int):
 @router.get("/api/materials/{type_id}/volumes")
 async def api_material_volumes(type_id: int):
     """Get available volumes for a material across all trade hub regions"""
-    item = get_item_info(type_id)
+    # One ESI call per region, issued concurrently
+    item, *depths = await asyncio.gather(
+        run_blocking(get_item_info, type_id),
+        *(run_blocking(esi_client.get_market_depth, region_id, type_id) for region_id in REGIONS.values())
+    )
     volumes = {}
-    for region_name, region_id in REGIONS.items():
-        depth = esi_client.get_market_depth(region_id, type_id)
+    for region_name, depth in zip(REGIONS, depths):
         volumes[region_name] = {
             "sell_volume": depth["sell_volume"],
             "lowest_sell": depth["lowest_sell_price"],
@@ -110,9 +119,8 @@ async def api_material_volumes(type_id: int):
 # Routes & Navigation
 # ============================================================
 
-@router.get("/api/route/hubs")
-async def api_get_trade_hubs():
-    """Get list of known trade hub systems"""
+def _trade_hubs() -> dict:
+    """Trade hub systems with names and security (sync, runs offloaded)"""
     result = {}
     for name, sys_id in TRADE_HUB_SYSTEMS.items():
         sys_info = route_service.get_system_by_name(name) or {}
@@ -124,19 +132,26 @@ async def api_get_trade_hubs():
     return result
 
 
+@router.get("/api/route/hubs")
+async def api_get_trade_hubs():
+    """Get list of known trade hub systems"""
+    return await run_blocking(_trade_hubs)
+
+
 @router.get("/api/route/distances/{from_system}")
 async def api_hub_distances(from_system: str = "isikemi"):
     """Get distances from a system to all trade hubs"""
-    return route_service.get_hub_distances(from_system)
+    return await run_blocking(route_service.get_hub_distances, from_system)
 
 
-@router.get("/api/route/{from_system}/{to_system}")
-async def api_calculate_route(
-    from_system: str,
-    to_system: str,
-    highsec_only: bool = Query(True)
-):
-    """Calculate route between two systems using A* pathfinding"""
+@router.get("/api/route/universe/stats")
+async def api_universe_stats():
+    """Build time and memory footprint of the shared universe graph"""
+    return await run_blocking(get_universe_stats)
+
+
+def _calculate_route(from_system: str, to_system: str, highsec_only: bool) -> dict:
+    """Route between two named systems (sync, runs offloaded)"""
     from_sys = route_service.get_system_by_name(from_system)
     to_sys = route_service.get_system_by_name(to_system)
 
@@ -161,10 +176,20 @@ async def api_calculate_route(
     }
 
 
+@router.get("/api/route/{from_system}/{to_system}")
+async def api_calculate_route(
+    from_system: str,
+    to_system: str,
+    highsec_only: bool = Query(True)
+):
+    """Calculate route between two systems using A* pathfinding"""
+    return await run_blocking(_calculate_route, from_system, to_system, highsec_only)
+
+
 @router.get("/api/systems/search")
 async def api_search_systems(q: str = Query(..., min_length=2)):
     """Search for solar systems by name"""
-    results = route_service.search_systems(q, limit=10)
+    results = await run_blocking(route_service.search_systems, q, limit=10)
     return {"query": q, "results": results}
 
 
@@ -175,7 +200,7 @@ async def api_search_systems(q: str = Query(..., min_length=2)):
 @router.post("/api/cargo/calculate")
 async def api_calculate_cargo(request: CargoCalculateRequest):
     """Calculate total cargo volume for a list of items"""
-    volume_info = cargo_service.calculate_cargo_volume(request.items)
+    volume_info = await run_blocking(cargo_service.calculate_cargo_volume, request.items)
     ship_recommendation = cargo_service.recommend_ship(volume_info['total_volume_m3'])
     return {**volume_info, 'ship_recommendation': ship_recommendation}
 
@@ -183,7 +208,7 @@ async def api_calculate_cargo(request: CargoCalculateRequest):
 @router.get("/api/cargo/item/{type_id}")
 async def api_item_volume(type_id: int, quantity: int = Query(1)):
     """Get volume for a single item"""
-    volume = cargo_service.get_item_volume(type_id)
+    volume = await run_blocking(cargo_service.get_item_volume, type_id)
     if volume is None:
         raise HTTPException(status_code=404, detail="Item not found or has no volume")
     total = volume * quantity
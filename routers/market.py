@@ -2,15 +2,19 @@
 Market router - Market stats, arbitrage, and price comparison endpoints.
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 
 from config import REGIONS
 from src.core.config import get_settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.core.exceptions import NotFoundError, ExternalAPIError, EVECopilotError
+from src.core.offload import run_blocking
 from src.services.market.service import MarketService
 from src.services.market.repository import MarketRepository
+from src.services.market.price_book import get_price_book_stats
 from src.esi_client import esi_client  # Use the legacy ESI client instance
 from src.legacy_services import find_arbitrage
 from src.database import get_item_info
@@ -46,7 +50,7 @@ SHIP_CAPACITIES = {
 def get_market_service() -> MarketService:
     """Dependency injection for MarketService."""
     settings = get_settings()
-    db = DatabasePool(settings)
+    db = get_database_pool()
     from src.integrations.esi.client import ESIClient
     esi = ESIClient(settings)  # New ESI client needs settings
     repository = MarketRepository(db)
@@ -60,10 +64,10 @@ async def api_market_stats(
 ):
     """Get market statistics for an item in a region"""
     try:
-        stats = esi_client.get_market_stats(region_id, type_id)
+        stats = await run_blocking(esi_client.get_market_stats, region_id, type_id)
         if not stats.get("total_orders"):
             raise HTTPException(status_code=404, detail="No market data found")
-        item = get_item_info(type_id)
+        item = await run_blocking(get_item_info, type_id)
         if item:
             stats["item_name"] = item["typeName"]
         return stats
@@ -81,8 +85,10 @@ async def api_compare_prices(
 ):
     """Compare prices for an item across all trade hubs"""
     try:
-        prices = esi_client.get_all_region_prices(type_id)
-        item = get_item_info(type_id)
+        prices, item = await asyncio.gather(
+            run_blocking(esi_client.get_all_region_prices, type_id),
+            run_blocking(get_item_info, type_id)
+        )
         item_name = item["typeName"] if item else f"Type {type_id}"
 
         best_buy = {"region": None, "price": float('inf')}
@@ -117,8 +123,10 @@ async def api_find_arbitrage(
 ):
     """Find arbitrage opportunities for an item between trade hubs"""
     try:
-        opportunities = esi_client.find_arbitrage_opportunities(type_id, min_profit)
-        item = get_item_info(type_id)
+        opportunities, item = await asyncio.gather(
+            run_blocking(esi_client.find_arbitrage_opportunities, type_id, min_profit),
+            run_blocking(get_item_info, type_id)
+        )
         item_name = item["typeName"] if item else f"Type {type_id}"
         return {
             "type_id": type_id, "item_name": item_name,
@@ -149,13 +157,14 @@ async def api_enhanced_arbitrage(
     """
     try:
         # Get basic arbitrage opportunities
-        opportunities = esi_client.find_arbitrage_opportunities(type_id, min_profit)
-        item = get_item_info(type_id)
+        opportunities, item, item_volume = await asyncio.gather(
+            run_blocking(esi_client.find_arbitrage_opportunities, type_id, min_profit),
+            run_blocking(get_item_info, type_id),
+            # Get item volume for cargo calculations
+            run_blocking(cargo_service.get_item_volume, type_id)
+        )
         item_name = item["typeName"] if item else f"Type {type_id}"
 
-        # Get item volume for cargo calculations
-        item_volume = cargo_service.get_item_volume(type_id)
-
         if item_volume is None:
             item_volume = 0
 
@@ -174,7 +183,7 @@ async def api_enhanced_arbitrage(
                 from_system = REGION_TO_HUB_SYSTEM[buy_region]
                 to_system = REGION_TO_HUB_SYSTEM[sell_region]
 
-                route = route_service.find_route(from_system, to_system, avoid_lowsec=True)
+                route = await run_blocking(route_service.find_route, from_system, to_system, avoid_lowsec=True)
 
                 if route:
                     # Calculate route safety
@@ -294,7 +303,8 @@ async def api_enhanced_arbitrage(
 async def api_arbitrage(request: ArbitrageRequest):
     """Find arbitrage opportunities between two regions"""
     try:
-        result = find_arbitrage(
+        result = await run_blocking(
+            find_arbitrage,
             group_name=request.group_name,
             group_id=request.group_id,
             source_region=request.source_region,
@@ -322,7 +332,8 @@ async def api_arbitrage_get(
 ):
     """GET endpoint for arbitrage search"""
     try:
-        result = find_arbitrage(
+        result = await run_blocking(
+            find_arbitrage,
             group_name=group_name, group_id=group_id,
             source_region=source_region, target_region=target_region,
             min_margin_percent=min_margin_percent, limit=limit
@@ -348,3 +359,9 @@ async def api_clear_cache(
         return {"status": "cache cleared"}
     except EVECopilotError as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/api/market/price-book/stats")
+async def api_price_book_stats():
+    """Size, age and build time of the shared in-memory price book"""
+    return get_price_book_stats()
@@ -6,8 +6,10 @@ Model Context Protocol implementation for EVE Co-Pilot.
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Any, Dict, List, Optional
+import inspect
 import traceback
 
+from src.core.offload import run_blocking
 from .tools import ALL_TOOLS, ALL_HANDLERS, get_handler_by_name, TOOL_COUNTS
 
 # Create router
@@ -66,10 +68,12 @@ async def call_tool(request: ToolCallRequest):
             detail=f"Tool '{tool_name}' not found. Use /mcp/tools/list to see available tools."
         )
 
-    # Execute handler
+    # Execute handler: async handlers (in-process API dispatch) run on the loop,
+    # sync handlers (direct service calls) in the offload pool
     try:
-        result = handler(args)
-        return result
+        if inspect.iscoroutinefunction(handler):
+            return await handler(args)
+        return await run_blocking(handler, args)
     except Exception as e:
         error_msg = f"Tool execution failed: {str(e)}\n{traceback.format_exc()}"
         return {
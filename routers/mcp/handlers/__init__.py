@@ -1,5 +1,6 @@
 """MCP Handlers - Shared utilities for MCP tools."""
 
 from .api_proxy import api_proxy, APIProxy
+from .results import tool_result, json_result, to_json
 
-__all__ = ["api_proxy", "APIProxy"]
+__all__ = ["api_proxy", "APIProxy", "tool_result", "json_result", "to_json"]
@@ -1,122 +1,155 @@
 """
 API Proxy Helper for MCP Tools
-Provides utilities for making requests to the FastAPI backend.
+Dispatches MCP tool calls to FastAPI endpoints.
+
+In-process mode (default) calls the bound FastAPI app directly over ASGI:
+no socket, no second trip through the server, and the JSON body is passed
+through unchanged. Loopback HTTP to the server is the fallback, used when
+MCP_DISPATCH_MODE is "http" or no app has been bound (e.g. tools running
+outside the API process).
 """
 
-import requests
+import asyncio
 import traceback
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
 
+import requests
 
-class APIProxy:
-    """Helper class for proxying MCP tool calls to FastAPI endpoints."""
+from config import MCP_DISPATCH_MODE, MCP_API_BASE_URL
+from src.core.offload import run_blocking
+from .results import json_result, to_json
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        self.base_url = base_url
+REQUEST_TIMEOUT = 30  # seconds, same for both dispatch modes
 
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """
-        Make GET request to API endpoint.
 
-        Args:
-            endpoint: API endpoint path (e.g., "/api/market/stats/10000002/34")
-            params: Optional query parameters
+def _error(message: str) -> Dict[str, Any]:
+    return {"error": message, "isError": True}
 
-        Returns:
-            API response as dict with {"content": [...]} or {"error": "..."}
-        """
-        try:
-            url = f"{self.base_url}{endpoint}"
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
 
-            data = response.json()
-            return {"content": [{"type": "text", "text": str(data)}]}
+class APIProxy:
+    """Helper class for proxying MCP tool calls to FastAPI endpoints."""
 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
+    def __init__(self, base_url: str = MCP_API_BASE_URL, mode: str = MCP_DISPATCH_MODE):
+        self.base_url = base_url
+        self.mode = mode
+        self.app = None
+
+    def bind_app(self, app) -> None:
+        """Dispatch to this ASGI app in-process (called once the app is built)."""
+        self.app = app
 
-    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @property
+    def in_process(self) -> bool:
+        return self.mode == "inprocess" and self.app is not None
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Make POST request to API endpoint.
+        GET an API endpoint.
 
         Args:
-            endpoint: API endpoint path
-            data: Optional request body
+            endpoint: API endpoint path (e.g., "/api/market/stats/10000002/34")
             params: Optional query parameters
 
         Returns:
-            API response as dict with {"content": [...]} or {"error": "..."}
+            {"content": [...]} with the JSON response body, or {"error": "..."}
         """
-        try:
-            url = f"{self.base_url}{endpoint}"
-            response = requests.post(url, json=data, params=params, timeout=30)
-            response.raise_for_status()
+        return await self.request("GET", endpoint, params=params)
 
-            result = response.json()
-            return {"content": [{"type": "text", "text": str(result)}]}
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                   params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """POST to an API endpoint with an optional JSON body."""
+        return await self.request("POST", endpoint, params=params, data=data)
 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
+    async def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """PATCH an API endpoint with an optional JSON body."""
+        return await self.request("PATCH", endpoint, data=data)
 
-    def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """
-        Make PATCH request to API endpoint.
+    async def delete(self, endpoint: str) -> Dict[str, Any]:
+        """DELETE an API endpoint."""
+        return await self.request("DELETE", endpoint)
 
-        Args:
-            endpoint: API endpoint path
-            data: Optional request body
+    async def request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                      data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Dispatch in-process if possible, otherwise over loopback HTTP in a worker thread."""
+        if not self.in_process:
+            return await run_blocking(self._http_request, method, endpoint, params, data)
 
-        Returns:
-            API response as dict with {"content": [...]} or {"error": "..."}
-        """
         try:
-            url = f"{self.base_url}{endpoint}"
-            response = requests.patch(url, json=data, timeout=30)
-            response.raise_for_status()
-
-            result = response.json()
-            return {"content": [{"type": "text", "text": str(result)}]}
-
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
+            status, body = await asyncio.wait_for(
+                self._asgi_request(method, endpoint, params, data), timeout=REQUEST_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return _error(f"API request timed out after {REQUEST_TIMEOUT}s: {method} {endpoint}")
         except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
-
-    def delete(self, endpoint: str) -> Dict[str, Any]:
-        """
-        Make DELETE request to API endpoint.
-
-        Args:
-            endpoint: API endpoint path
-
-        Returns:
-            API response as dict with {"content": [...]} or {"error": "..."}
-        """
+            return _error(f"API request failed: {str(e)}\n{traceback.format_exc()}")
+
+        if status >= 400:
+            return _error(f"API request failed: {status} for {method} {endpoint}: "
+                          f"{body.decode(errors='replace')}")
+        return json_result(body.decode() if body else "null")
+
+    async def _asgi_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]],
+                            data: Optional[Dict[str, Any]]) -> Tuple[int, bytes]:
+        """Run one request through the app's ASGI interface and collect the response."""
+        body = to_json(data).encode() if data is not None else b""
+        query = urlencode({k: v for k, v in (params or {}).items() if v is not None}, doseq=True)
+        headers = [(b"host", b"localhost"), (b"content-length", str(len(body)).encode())]
+        if data is not None:
+            headers.append((b"content-type", b"application/json"))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": endpoint,
+            "raw_path": quote(endpoint).encode(),
+            "root_path": "",
+            "query_string": query.encode(),
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("localhost", 80),
+        }
+
+        status = 500
+        chunks: List[bytes] = []
+        request_sent = False
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    finished.set()
+
+        await self.app(scope, receive, send)
+        return status, b"".join(chunks)
+
+    def _http_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]],
+                      data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Loopback HTTP request to the API server (fallback)."""
         try:
             url = f"{self.base_url}{endpoint}"
-            response = requests.delete(url, timeout=30)
+            response = requests.request(method, url, params=params, json=data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-
-            result = response.json()
-            return {"content": [{"type": "text", "text": str(result)}]}
+            return json_result(response.text or "null")
 
         except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
+            return _error(f"API request failed: {str(e)}\n{traceback.format_exc()}")
         except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}\n{traceback.format_exc()}"
-            return {"error": error_msg, "isError": True}
+            return _error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
 
 
 # Global instance
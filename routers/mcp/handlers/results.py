@@ -0,0 +1,60 @@
+"""
+Tool Result Helpers for MCP Tools
+Serializes handler output as compact JSON text content.
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is slower but produces the same text
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """JSON form of values the encoders don't handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if hasattr(value, "tolist"):  # numpy arrays and scalars
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_json(data: Any) -> str:
+    """Compact JSON text (no whitespace, non-ASCII kept, non-string keys stringified)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(data, default=_default, separators=(",", ":"), ensure_ascii=False)
+
+
+def tool_result(data: Any) -> Dict[str, Any]:
+    """
+    Wrap handler output in MCP content format.
+
+    Args:
+        data: JSON-compatible result (dicts, lists, Pydantic models, Decimals, datetimes)
+
+    Returns:
+        {"content": [{"type": "text", "text": <compact JSON>}]}
+    """
+    return {"content": [{"type": "text", "text": to_json(data)}]}
+
+
+def json_result(text: str) -> Dict[str, Any]:
+    """MCP content for a body that is already JSON text (e.g. an API response)."""
+    return {"content": [{"type": "text", "text": text}]}
@@ -4,7 +4,7 @@ Bookmark and bookmark list management.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from src.bookmark_service import bookmark_service
 
 
@@ -147,7 +147,7 @@ def handle_create_bookmark(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call bookmark_service directly instead of HTTP request
         result = bookmark_service.create_bookmark(type_id=type_id, notes=notes)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to create bookmark: {str(e)}", "isError": True}
 
@@ -158,7 +158,7 @@ def handle_list_bookmarks(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call bookmark_service directly instead of HTTP request
         result = bookmark_service.get_all_bookmarks()
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to list bookmarks: {str(e)}", "isError": True}
 
@@ -176,7 +176,7 @@ def handle_check_bookmark(args: Dict[str, Any]) -> Dict[str, Any]:
             bookmark = bookmark_service.get_bookmark_by_type(type_id)
             result["bookmark"] = bookmark
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to check bookmark: {str(e)}", "isError": True}
 
@@ -190,7 +190,7 @@ def handle_update_bookmark(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call bookmark_service directly instead of HTTP request
         result = bookmark_service.update_bookmark(bookmark_id=bookmark_id, notes=notes)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to update bookmark: {str(e)}", "isError": True}
 
@@ -204,7 +204,7 @@ def handle_delete_bookmark(args: Dict[str, Any]) -> Dict[str, Any]:
         success = bookmark_service.delete_bookmark(bookmark_id)
         result = {"bookmark_id": bookmark_id, "deleted": success}
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to delete bookmark: {str(e)}", "isError": True}
 
@@ -218,7 +218,7 @@ def handle_create_bookmark_list(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call bookmark_service directly instead of HTTP request
         result = bookmark_service.create_bookmark_list(name=name, description=description)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to create bookmark list: {str(e)}", "isError": True}
 
@@ -229,7 +229,7 @@ def handle_list_bookmark_lists(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call bookmark_service directly instead of HTTP request
         result = bookmark_service.get_all_bookmark_lists()
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to list bookmark lists: {str(e)}", "isError": True}
 
@@ -244,7 +244,7 @@ def handle_add_to_bookmark_list(args: Dict[str, Any]) -> Dict[str, Any]:
         success = bookmark_service.add_to_list(list_id=list_id, bookmark_id=bookmark_id)
         result = {"list_id": list_id, "bookmark_id": bookmark_id, "added": success}
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to add to bookmark list: {str(e)}", "isError": True}
 
@@ -259,7 +259,7 @@ def handle_remove_from_bookmark_list(args: Dict[str, Any]) -> Dict[str, Any]:
         success = bookmark_service.remove_from_list(list_id=list_id, bookmark_id=bookmark_id)
         result = {"list_id": list_id, "bookmark_id": bookmark_id, "removed": success}
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to remove from bookmark list: {str(e)}", "isError": True}
 
@@ -4,7 +4,7 @@ Character and corporation data access via EVE SSO.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from src.character import character_api
 from src.auth import eve_auth
 
@@ -164,7 +164,7 @@ def handle_get_authenticated_characters(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         # Call auth module directly instead of HTTP request
         characters = eve_auth.get_authenticated_characters()
-        return {"content": [{"type": "text", "text": str(characters)}]}
+        return tool_result(characters)
     except Exception as e:
         return {"error": f"Failed to get authenticated characters: {str(e)}", "isError": True}
 
@@ -175,7 +175,7 @@ def handle_get_character_wallet(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_wallet_balance(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get wallet: {str(e)}", "isError": True}
 
@@ -186,7 +186,7 @@ def handle_get_character_assets(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_assets(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get assets: {str(e)}", "isError": True}
 
@@ -197,7 +197,7 @@ def handle_get_character_skills(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_skills(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get skills: {str(e)}", "isError": True}
 
@@ -208,7 +208,7 @@ def handle_get_character_skillqueue(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_skill_queue(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get skill queue: {str(e)}", "isError": True}
 
@@ -219,7 +219,7 @@ def handle_get_character_orders(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_market_orders(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get market orders: {str(e)}", "isError": True}
 
@@ -230,7 +230,7 @@ def handle_get_character_industry(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_industry_jobs(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get industry jobs: {str(e)}", "isError": True}
 
@@ -241,7 +241,7 @@ def handle_get_character_blueprints(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_blueprints(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get blueprints: {str(e)}", "isError": True}
 
@@ -252,7 +252,7 @@ def handle_get_character_info(args: Dict[str, Any]) -> Dict[str, Any]:
         character_id = args.get("character_id")
         # Call character_api directly instead of HTTP request
         result = character_api.get_character_info(character_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get character info: {str(e)}", "isError": True}
 
@@ -268,7 +268,7 @@ def handle_get_character_portrait(args: Dict[str, Any]) -> Dict[str, Any]:
             "portrait_url": portrait_url,
             "sizes_available": [32, 64, 128, 256, 512, 1024]
         }
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get character portrait: {str(e)}", "isError": True}
 
@@ -288,7 +288,7 @@ def handle_get_corporation_wallet(args: Dict[str, Any]) -> Dict[str, Any]:
             if division_wallet:
                 result = division_wallet
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get corporation wallet: {str(e)}", "isError": True}
 
@@ -304,7 +304,7 @@ def handle_get_corporation_info(args: Dict[str, Any]) -> Dict[str, Any]:
 
         # Call character_api directly instead of HTTP request
         result = character_api.get_corporation_info(corp_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get corporation info: {str(e)}", "isError": True}
 
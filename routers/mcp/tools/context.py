@@ -4,7 +4,7 @@ Provides system context and reference information.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from config import REGIONS
 from src.auth import eve_auth
 
@@ -41,7 +41,7 @@ def handle_get_regions(args: Dict[str, Any]) -> Dict[str, Any]:
         # Use REGIONS constant directly instead of HTTP request
         result = dict(REGIONS)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get regions: {str(e)}", "isError": True}
 
@@ -83,7 +83,7 @@ def handle_eve_copilot_context(args: Dict[str, Any]) -> Dict[str, Any]:
             ]
         }
 
-        return {"content": [{"type": "text", "text": str(context)}]}
+        return tool_result(context)
 
     except Exception as e:
         return {"error": f"Failed to get context: {str(e)}", "isError": True}
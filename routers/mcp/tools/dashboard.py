@@ -4,7 +4,7 @@ Dashboard overview and portfolio analysis.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from services.dashboard_service import DashboardService
 from services.portfolio_service import PortfolioService
 
@@ -70,7 +70,7 @@ def handle_get_market_opportunities(args: Dict[str, Any]) -> Dict[str, Any]:
         if category:
             opportunities = [opp for opp in opportunities if opp.get("category") == category]
 
-        return {"content": [{"type": "text", "text": str(opportunities)}]}
+        return tool_result(opportunities)
     except Exception as e:
         return {"error": f"Failed to get market opportunities: {str(e)}", "isError": True}
 
@@ -84,7 +84,7 @@ def handle_get_opportunities_by_category(args: Dict[str, Any]) -> Dict[str, Any]
         opportunities = dashboard_service.get_opportunities(limit=50)
         filtered = [opp for opp in opportunities if opp.get("category") == category]
 
-        return {"content": [{"type": "text", "text": str(filtered)}]}
+        return tool_result(filtered)
     except Exception as e:
         return {"error": f"Failed to get opportunities by category: {str(e)}", "isError": True}
 
@@ -101,7 +101,7 @@ def handle_get_characters_summary(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call portfolio_service directly instead of HTTP request
         summaries = portfolio_service.get_character_summaries(character_ids)
 
-        return {"content": [{"type": "text", "text": str(summaries)}]}
+        return tool_result(summaries)
     except Exception as e:
         return {"error": f"Failed to get characters summary: {str(e)}", "isError": True}
 
@@ -124,7 +124,7 @@ def handle_get_portfolio_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
             "characters": summaries
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get portfolio analysis: {str(e)}", "isError": True}
 
@@ -151,7 +151,7 @@ def handle_get_active_projects(args: Dict[str, Any]) -> Dict[str, Any]:
             "projects": projects
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get active projects: {str(e)}", "isError": True}
 
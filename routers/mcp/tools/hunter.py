@@ -62,17 +62,17 @@ TOOLS: List[Dict[str, Any]] = [
 
 
 # Tool Handlers
-def handle_get_hunter_categories(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_get_hunter_categories(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get hunter categories."""
-    return api_proxy.get("/api/hunter/categories")
+    return await api_proxy.get("/api/hunter/categories")
 
 
-def handle_get_market_tree(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_get_market_tree(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get market tree."""
-    return api_proxy.get("/api/hunter/market-tree")
+    return await api_proxy.get("/api/hunter/market-tree")
 
 
-def handle_scan_market_opportunities(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_scan_market_opportunities(args: Dict[str, Any]) -> Dict[str, Any]:
     """Scan market opportunities."""
     params = {
         "min_roi": args.get("min_roi", 15),
@@ -80,13 +80,13 @@ def handle_scan_market_opportunities(args: Dict[str, Any]) -> Dict[str, Any]:
     }
     if args.get("category"):
         params["category"] = args.get("category")
-    return api_proxy.get("/api/hunter/scan", params=params)
+    return await api_proxy.get("/api/hunter/scan", params=params)
 
 
-def handle_get_precalculated_opportunities(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_get_precalculated_opportunities(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get precalculated opportunities."""
     limit = args.get("limit", 20)
-    return api_proxy.get("/api/hunter/opportunities", params={"limit": limit})
+    return await api_proxy.get("/api/hunter/opportunities", params={"limit": limit})
 
 
 # Handler mapping
@@ -4,7 +4,7 @@ Item information, materials, volumes, and cargo calculations.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from src.database import get_material_composition, get_item_info
 from src.esi_client import esi_client
 from config import REGIONS
@@ -109,7 +109,7 @@ def handle_get_material_composition(args: Dict[str, Any]) -> Dict[str, Any]:
             ]
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get material composition: {str(e)}", "isError": True}
 
@@ -146,7 +146,7 @@ def handle_get_material_volumes(args: Dict[str, Any]) -> Dict[str, Any]:
             "best_availability_volume": best_availability[1]
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get material volumes: {str(e)}", "isError": True}
 
@@ -167,7 +167,7 @@ def handle_calculate_cargo_volume(args: Dict[str, Any]) -> Dict[str, Any]:
 
         result = {**volume_info, 'ship_recommendation': ship_recommendation}
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to calculate cargo volume: {str(e)}", "isError": True}
 
@@ -189,7 +189,7 @@ def handle_get_item_volume_info(args: Dict[str, Any]) -> Dict[str, Any]:
             "packaged_volume_m3": item.get("packagedVolume", item.get("volume", 0))
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get item volume info: {str(e)}", "isError": True}
 
@@ -204,7 +204,7 @@ def handle_search_systems(args: Dict[str, Any]) -> Dict[str, Any]:
             system_id = int(query)
             sys_info = route_service.get_system_by_id(system_id)
             if sys_info:
-                return {"content": [{"type": "text", "text": str([sys_info])}]}
+                return tool_result([sys_info])
         except (ValueError, AttributeError):
             pass
 
@@ -212,7 +212,7 @@ def handle_search_systems(args: Dict[str, Any]) -> Dict[str, Any]:
         sys_info = route_service.get_system_by_name(query)
         results = [sys_info] if sys_info else []
 
-        return {"content": [{"type": "text", "text": str(results)}]}
+        return tool_result(results)
     except Exception as e:
         return {"error": f"Failed to search systems: {str(e)}", "isError": True}
 
@@ -227,7 +227,7 @@ def handle_get_system_info(args: Dict[str, Any]) -> Dict[str, Any]:
         if not sys_info:
             return {"error": f"System {system_id} not found", "isError": True}
 
-        return {"content": [{"type": "text", "text": str(sys_info)}]}
+        return tool_result(sys_info)
     except Exception as e:
         return {"error": f"Failed to get system info: {str(e)}", "isError": True}
 
@@ -4,9 +4,9 @@ Market analysis, arbitrage, and price comparison tools.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import api_proxy, tool_result
 from src.esi_client import esi_client
-from src.database import get_item_info
+from src.database import get_item_info, get_item_by_name, get_group_by_name
 from config import REGIONS
 
 
@@ -219,11 +219,10 @@ def handle_search_item(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         query = args.get("query")
 
-        # Call database function directly instead of HTTP request
-        from database import search_items_by_name
-        results = search_items_by_name(query, limit=10)
+        # In-memory SDE search index, no HTTP request or table scan
+        results = get_item_by_name(query)
 
-        return {"content": [{"type": "text", "text": str(results)}]}
+        return tool_result(results)
     except Exception as e:
         return {"error": f"Failed to search items: {str(e)}", "isError": True}
 
@@ -238,7 +237,7 @@ def handle_get_item_info(args: Dict[str, Any]) -> Dict[str, Any]:
         if not item:
             return {"error": f"Item {type_id} not found", "isError": True}
 
-        return {"content": [{"type": "text", "text": str(item)}]}
+        return tool_result(item)
     except Exception as e:
         return {"error": f"Failed to get item info: {str(e)}", "isError": True}
 
@@ -259,7 +258,7 @@ def handle_get_market_stats(args: Dict[str, Any]) -> Dict[str, Any]:
         if item:
             stats["item_name"] = item["typeName"]
 
-        return {"content": [{"type": "text", "text": str(stats)}]}
+        return tool_result(stats)
     except Exception as e:
         return {"error": f"Failed to get market stats: {str(e)}", "isError": True}
 
@@ -292,29 +291,29 @@ def handle_compare_region_prices(args: Dict[str, Any]) -> Dict[str, Any]:
             "best_sell_price": best_sell["price"] if best_sell["price"] > 0 else None,
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to compare region prices: {str(e)}", "isError": True}
 
 
-def handle_find_arbitrage(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_find_arbitrage(args: Dict[str, Any]) -> Dict[str, Any]:
     """Find arbitrage opportunities."""
     type_id = args.get("type_id")
     min_profit = args.get("min_profit", 100000)
-    return api_proxy.get(f"/api/market/arbitrage/{type_id}", params={"min_profit": min_profit})
+    return await api_proxy.get(f"/api/market/arbitrage/{type_id}", params={"min_profit": min_profit})
 
 
-def handle_enhanced_arbitrage_with_routing(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_enhanced_arbitrage_with_routing(args: Dict[str, Any]) -> Dict[str, Any]:
     """Enhanced arbitrage with routing."""
     type_id = args.get("type_id")
     params = {
         "max_jumps": args.get("max_jumps", 20),
         "min_profit": args.get("min_profit", 100000)
     }
-    return api_proxy.get(f"/api/arbitrage/enhanced/{type_id}", params=params)
+    return await api_proxy.get(f"/api/arbitrage/enhanced/{type_id}", params=params)
 
 
-def handle_submit_custom_arbitrage(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_submit_custom_arbitrage(args: Dict[str, Any]) -> Dict[str, Any]:
     """Submit custom arbitrage calculation."""
     data = {
         "type_id": args.get("type_id"),
@@ -322,39 +321,44 @@ def handle_submit_custom_arbitrage(args: Dict[str, Any]) -> Dict[str, Any]:
         "sell_region_id": args.get("sell_region_id"),
         "quantity": args.get("quantity", 1000)
     }
-    return api_proxy.post("/api/trade/arbitrage", data=data)
+    return await api_proxy.post("/api/trade/arbitrage", data=data)
 
 
-def handle_get_saved_arbitrage(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_get_saved_arbitrage(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get saved arbitrage results."""
-    return api_proxy.get("/api/trade/arbitrage")
+    return await api_proxy.get("/api/trade/arbitrage")
 
 
-def handle_clear_market_cache(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_clear_market_cache(args: Dict[str, Any]) -> Dict[str, Any]:
     """Clear market cache."""
     region_id = args.get("region_id")
     params = {"region_id": region_id} if region_id else None
-    return api_proxy.post("/api/cache/clear", params=params)
+    return await api_proxy.post("/api/cache/clear", params=params)
 
 
-def handle_get_market_orders(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_get_market_orders(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get market orders for item."""
     type_id = args.get("type_id")
     region_id = args.get("region_id", 10000002)
-    return api_proxy.get(f"/api/shopping/orders/{type_id}", params={"region_id": region_id})
+    return await api_proxy.get(f"/api/shopping/orders/{type_id}", params={"region_id": region_id})
 
 
 def handle_search_item_groups(args: Dict[str, Any]) -> Dict[str, Any]:
     """Search item groups."""
-    query = args.get("query")
-    return api_proxy.get("/api/groups/search", params={"q": query})
+    try:
+        query = args.get("query")
+
+        # In-memory SDE search index, no HTTP request
+        return tool_result(get_group_by_name(query))
+    except Exception as e:
+        return {"error": f"Failed to search item groups: {str(e)}", "isError": True}
 
 
 def handle_get_all_regions(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get all regions."""
     try:
         # Return REGIONS constant directly instead of HTTP request
-        return {"content": [{"type": "text", "text": str(REGIONS)}]}
+        return tool_result(REGIONS)
     except Exception as e:
         return {"error": f"Failed to get regions: {str(e)}", "isError": True}
 
@@ -55,28 +55,28 @@ TOOLS: List[Dict[str, Any]] = [
 
 
 # Tool Handlers
-def handle_find_mineral_locations(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_find_mineral_locations(args: Dict[str, Any]) -> Dict[str, Any]:
     """Find mineral locations."""
     mineral_name = args.get("mineral_name")
     from_system = args.get("from_system")
     params = {"mineral": mineral_name}
     if from_system:
         params["from_system"] = from_system
-    return api_proxy.get("/api/mining/find-mineral", params=params)
+    return await api_proxy.get("/api/mining/find-mineral", params=params)
 
 
-def handle_get_system_mining_info(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_get_system_mining_info(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get system mining info."""
     system_id = args.get("system_id")
     # Use route planner with system as target
-    return api_proxy.get("/api/mining/route-planner", params={"target_system": system_id})
+    return await api_proxy.get("/api/mining/route-planner", params={"target_system": system_id})
 
 
-def handle_get_ore_composition(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_get_ore_composition(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get ore composition."""
     ore_name = args.get("ore_name")
     params = {"ore": ore_name} if ore_name else None
-    return api_proxy.get("/api/mining/ore-info", params=params)
+    return await api_proxy.get("/api/mining/ore-info", params=params)
 
 
 # Handler mapping
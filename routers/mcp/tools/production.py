@@ -4,7 +4,7 @@ Production planning, cost calculation, chains, economics, and workflow managemen
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from src.production_simulator import production_simulator
 from services.production.chain_service import ProductionChainService
 from services.production.economics_service import ProductionEconomicsService
@@ -335,7 +335,7 @@ def handle_get_production_cost(args: Dict[str, Any]) -> Dict[str, Any]:
             te=te
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to calculate production cost: {str(e)}", "isError": True}
 
@@ -354,7 +354,7 @@ def handle_simulate_build(args: Dict[str, Any]) -> Dict[str, Any]:
             me=me
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to simulate build: {str(e)}", "isError": True}
 
@@ -373,7 +373,7 @@ def handle_get_blueprint_info(args: Dict[str, Any]) -> Dict[str, Any]:
             "total_materials": len(bom)
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get blueprint info: {str(e)}", "isError": True}
 
@@ -388,7 +388,7 @@ def handle_get_production_chains(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call chain_service directly instead of HTTP request
         result = chain_service.get_chain_tree(type_id, format='tree')
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get production chains: {str(e)}", "isError": True}
 
@@ -402,7 +402,7 @@ def handle_get_chain_materials(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call chain_service directly instead of HTTP request
         result = chain_service.get_materials_list(type_id=type_id, quantity=quantity)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get chain materials: {str(e)}", "isError": True}
 
@@ -415,7 +415,7 @@ def handle_get_direct_materials(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call chain_service directly instead of HTTP request
         result = chain_service.get_direct_dependencies(type_id)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get direct materials: {str(e)}", "isError": True}
 
@@ -432,7 +432,7 @@ def handle_get_economics_opportunities(args: Dict[str, Any]) -> Dict[str, Any]:
             category=category
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get economic opportunities: {str(e)}", "isError": True}
 
@@ -449,7 +449,7 @@ def handle_get_economics_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
             region_id=region_id
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get economics analysis: {str(e)}", "isError": True}
 
@@ -463,7 +463,7 @@ def handle_get_economics_regions(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call economics_service directly instead of HTTP request
         result = economics_service.compare_regions(type_id)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get regional economics: {str(e)}", "isError": True}
 
@@ -484,7 +484,7 @@ def handle_create_workflow_job(args: Dict[str, Any]) -> Dict[str, Any]:
             notes=notes
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to create workflow job: {str(e)}", "isError": True}
 
@@ -501,7 +501,7 @@ def handle_list_workflow_jobs(args: Dict[str, Any]) -> Dict[str, Any]:
             status=status
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to list workflow jobs: {str(e)}", "isError": True}
 
@@ -520,7 +520,7 @@ def handle_update_workflow_job(args: Dict[str, Any]) -> Dict[str, Any]:
             notes=notes
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to update workflow job: {str(e)}", "isError": True}
 
@@ -538,7 +538,7 @@ def handle_get_production_optimize(args: Dict[str, Any]) -> Dict[str, Any]:
             me=me
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to optimize production: {str(e)}", "isError": True}
 
@@ -565,7 +565,7 @@ def handle_batch_production_cost(args: Dict[str, Any]) -> Dict[str, Any]:
             except Exception as e:
                 results.append({"type_id": type_id, "error": str(e)})
 
-        return {"content": [{"type": "text", "text": str(results)}]}
+        return tool_result(results)
     except Exception as e:
         return {"error": f"Failed to batch calculate costs: {str(e)}", "isError": True}
 
@@ -4,7 +4,7 @@ Skill requirements and recommendations.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from services.research_service import ResearchService
 
 # Create service instance
@@ -56,7 +56,7 @@ def handle_get_skills_for_item(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call research_service directly instead of HTTP request
         result = research_service.get_required_skills(type_id)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get skills for item: {str(e)}", "isError": True}
 
@@ -70,7 +70,7 @@ def handle_get_skill_recommendations(args: Dict[str, Any]) -> Dict[str, Any]:
         # Call research_service directly instead of HTTP request
         result = research_service.get_recommendations(character_id, focus=focus)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get skill recommendations: {str(e)}", "isError": True}
 
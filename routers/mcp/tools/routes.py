@@ -4,8 +4,9 @@ Route calculation and navigation assistance.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import api_proxy, tool_result
 from src.route_service import route_service, TRADE_HUB_SYSTEMS
+from src.services.sde.lookup import get_sde_lookup
 
 
 # Tool Definitions
@@ -106,7 +107,7 @@ def handle_get_trade_hubs(args: Dict[str, Any]) -> Dict[str, Any]:
                 'security': sys_info.get('security', 0)
             }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get trade hubs: {str(e)}", "isError": True}
 
@@ -117,7 +118,7 @@ def handle_get_hub_distances(args: Dict[str, Any]) -> Dict[str, Any]:
         from_system = args.get("from_system")
         # Call route_service directly instead of HTTP request
         distances = route_service.get_hub_distances(from_system)
-        return {"content": [{"type": "text", "text": str(distances)}]}
+        return tool_result(distances)
     except Exception as e:
         return {"error": f"Failed to get hub distances: {str(e)}", "isError": True}
 
@@ -154,17 +155,17 @@ def handle_calculate_system_route(args: Dict[str, Any]) -> Dict[str, Any]:
             "waypoints": [r['system_name'] for r in route]
         }
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to calculate route: {str(e)}", "isError": True}
 
 
-def handle_calculate_route_with_danger(args: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_calculate_route_with_danger(args: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate route with danger."""
     from_system = args.get("from_system")
     to_system = args.get("to_system")
     avoid_dangerous = args.get("avoid_dangerous", False)
-    return api_proxy.get(
+    return await api_proxy.get(
         f"/api/war/route/safe/{from_system}/{to_system}",
         params={"avoid_dangerous": avoid_dangerous}
     )
@@ -172,9 +173,17 @@ def handle_calculate_route_with_danger(args: Dict[str, Any]) -> Dict[str, Any]:
 
 def handle_get_system_region(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get system region."""
-    system_id = args.get("system_id")
-    # Use system search to get region info
-    return api_proxy.get("/api/systems/search", params={"q": str(system_id)})
+    try:
+        system_id = int(args.get("system_id"))
+
+        # In-memory SDE lookup instead of a name search over HTTP
+        info = get_sde_lookup().system_info(system_id)
+        if not info:
+            return {"error": f"System {system_id} not found", "isError": True}
+
+        return tool_result(info)
+    except Exception as e:
+        return {"error": f"Failed to get system region: {str(e)}", "isError": True}
 
 
 # Handler mapping
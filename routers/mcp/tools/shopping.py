@@ -4,7 +4,7 @@ Shopping list management, regional comparison, cargo calculation, and wizard.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from src.shopping_service import shopping_service
 
 
@@ -439,7 +439,7 @@ def handle_list_shopping_lists(args: Dict[str, Any]) -> Dict[str, Any]:
     """List all shopping lists."""
     try:
         result = shopping_service.get_lists()
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to list shopping lists: {str(e)}", "isError": True}
 
@@ -450,7 +450,7 @@ def handle_create_shopping_list(args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
         description = args.get("description", "")
         result = shopping_service.create_list(name=name, description=description)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to create shopping list: {str(e)}", "isError": True}
 
@@ -460,7 +460,7 @@ def handle_get_shopping_list(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         list_id = args.get("list_id")
         result = shopping_service.get_list_with_items(list_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get shopping list: {str(e)}", "isError": True}
 
@@ -472,7 +472,7 @@ def handle_update_shopping_list(args: Dict[str, Any]) -> Dict[str, Any]:
         name = args.get("name")
         description = args.get("description")
         result = shopping_service.update_list(list_id=list_id, name=name, description=description)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to update shopping list: {str(e)}", "isError": True}
 
@@ -482,7 +482,7 @@ def handle_delete_shopping_list(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         list_id = args.get("list_id")
         success = shopping_service.delete_list(list_id)
-        return {"content": [{"type": "text", "text": str({"deleted": success, "list_id": list_id})}]}
+        return tool_result({"deleted": success, "list_id": list_id})
     except Exception as e:
         return {"error": f"Failed to delete shopping list: {str(e)}", "isError": True}
 
@@ -495,7 +495,7 @@ def handle_add_shopping_item(args: Dict[str, Any]) -> Dict[str, Any]:
         quantity = args.get("quantity")
         notes = args.get("notes", "")
         result = shopping_service.add_item(list_id=list_id, type_id=type_id, quantity=quantity, notes=notes)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to add shopping item: {str(e)}", "isError": True}
 
@@ -507,7 +507,7 @@ def handle_update_shopping_item(args: Dict[str, Any]) -> Dict[str, Any]:
         quantity = args.get("quantity")
         notes = args.get("notes")
         result = shopping_service.update_item(item_id=item_id, quantity=quantity, notes=notes)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to update shopping item: {str(e)}", "isError": True}
 
@@ -517,7 +517,7 @@ def handle_delete_shopping_item(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         item_id = args.get("item_id")
         success = shopping_service.remove_item(item_id)
-        return {"content": [{"type": "text", "text": str({"deleted": success, "item_id": item_id})}]}
+        return tool_result({"deleted": success, "item_id": item_id})
     except Exception as e:
         return {"error": f"Failed to delete shopping item: {str(e)}", "isError": True}
 
@@ -527,7 +527,7 @@ def handle_mark_item_purchased(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         item_id = args.get("item_id")
         result = shopping_service.mark_purchased(item_id=item_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to mark item purchased: {str(e)}", "isError": True}
 
@@ -537,7 +537,7 @@ def handle_unmark_item_purchased(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         item_id = args.get("item_id")
         result = shopping_service.unmark_purchased(item_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to unmark item purchased: {str(e)}", "isError": True}
 
@@ -548,7 +548,7 @@ def handle_set_purchase_region(args: Dict[str, Any]) -> Dict[str, Any]:
         item_id = args.get("item_id")
         region_id = args.get("region_id")
         result = shopping_service.update_item(item_id=item_id, region_id=region_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to set purchase region: {str(e)}", "isError": True}
 
@@ -559,7 +559,7 @@ def handle_update_item_runs(args: Dict[str, Any]) -> Dict[str, Any]:
         item_id = args.get("item_id")
         runs = args.get("runs")
         result = shopping_service.update_item_runs(item_id=item_id, runs=runs)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to update item runs: {str(e)}", "isError": True}
 
@@ -570,7 +570,7 @@ def handle_set_build_decision(args: Dict[str, Any]) -> Dict[str, Any]:
         item_id = args.get("item_id")
         build = args.get("build")
         result = shopping_service.update_build_decision(item_id=item_id, build_instead_of_buy=build)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to set build decision: {str(e)}", "isError": True}
 
@@ -580,7 +580,7 @@ def handle_calculate_item_materials(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         item_id = args.get("item_id")
         result = shopping_service.calculate_materials(item_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to calculate materials: {str(e)}", "isError": True}
 
@@ -590,7 +590,7 @@ def handle_apply_materials_to_list(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         item_id = args.get("item_id")
         result = shopping_service.apply_materials(item_id=item_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to apply materials: {str(e)}", "isError": True}
 
@@ -600,7 +600,7 @@ def handle_get_item_with_materials(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         item_id = args.get("item_id")
         result = shopping_service.get_product_with_materials(item_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get item with materials: {str(e)}", "isError": True}
 
@@ -613,7 +613,7 @@ def handle_add_production_to_list(args: Dict[str, Any]) -> Dict[str, Any]:
         runs = args.get("runs", 1)
         me = args.get("me", 10)
         result = shopping_service.add_materials_from_production(list_id=list_id, type_id=type_id, runs=runs, me_level=me)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to add production to list: {str(e)}", "isError": True}
 
@@ -623,7 +623,7 @@ def handle_export_shopping_list(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         list_id = args.get("list_id")
         result = shopping_service.export_multibuy(list_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to export shopping list: {str(e)}", "isError": True}
 
@@ -633,7 +633,7 @@ def handle_get_list_by_region(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         list_id = args.get("list_id")
         result = shopping_service.get_by_region(list_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get list by region: {str(e)}", "isError": True}
 
@@ -644,7 +644,7 @@ def handle_get_regional_comparison(args: Dict[str, Any]) -> Dict[str, Any]:
         list_id = args.get("list_id")
         regions = args.get("regions", "10000002,10000043,10000030,10000032")
         result = shopping_service.compare_regions(list_id=list_id, regions=regions)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get regional comparison: {str(e)}", "isError": True}
 
@@ -654,7 +654,7 @@ def handle_get_cargo_summary(args: Dict[str, Any]) -> Dict[str, Any]:
     try:
         list_id = args.get("list_id")
         result = shopping_service.get_cargo_summary(list_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get cargo summary: {str(e)}", "isError": True}
 
@@ -673,7 +673,7 @@ def handle_get_transport_options(args: Dict[str, Any]) -> Dict[str, Any]:
         from cargo_service import cargo_service
         result = cargo_service.get_transport_options(volume=volume, security=security)
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get transport options: {str(e)}", "isError": True}
 
@@ -694,7 +694,7 @@ def handle_calculate_shopping_route(args: Dict[str, Any]) -> Dict[str, Any]:
             items_by_region=items_by_region
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to calculate shopping route: {str(e)}", "isError": True}
 
@@ -713,7 +713,7 @@ def handle_wizard_calculate_materials(args: Dict[str, Any]) -> Dict[str, Any]:
             me_level=me
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to calculate materials: {str(e)}", "isError": True}
 
@@ -734,7 +734,7 @@ def handle_wizard_compare_regions(args: Dict[str, Any]) -> Dict[str, Any]:
             regions=regions
         )
 
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to compare regions: {str(e)}", "isError": True}
 
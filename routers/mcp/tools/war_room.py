@@ -4,7 +4,7 @@ Combat intelligence, sovereignty, faction warfare, and market demand analysis.
 """
 
 from typing import Dict, Any, List
-from ..handlers import api_proxy
+from ..handlers import tool_result
 from src.killmail_service import killmail_service
 from src.sovereignty_service import sovereignty_service
 from src.fw_service import fw_service
@@ -310,7 +310,7 @@ def handle_get_war_losses(args: Dict[str, Any]) -> Dict[str, Any]:
             days=days,
             loss_type=loss_type
         )
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get war losses: {str(e)}", "isError": True}
 
@@ -327,7 +327,7 @@ def handle_get_war_demand(args: Dict[str, Any]) -> Dict[str, Any]:
             days=days,
             min_gap=min_gap
         )
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get war demand: {str(e)}", "isError": True}
 
@@ -339,7 +339,7 @@ def handle_get_war_heatmap(args: Dict[str, Any]) -> Dict[str, Any]:
         min_kills = args.get("min_kills", 5)
 
         result = killmail_service.get_heatmap(days=days, min_kills=min_kills)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get combat heatmap: {str(e)}", "isError": True}
 
@@ -350,7 +350,7 @@ def handle_get_war_campaigns(args: Dict[str, Any]) -> Dict[str, Any]:
         region_id = args.get("region_id")
 
         result = sovereignty_service.get_campaigns(region_id=region_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get sov campaigns: {str(e)}", "isError": True}
 
@@ -359,7 +359,7 @@ def handle_update_war_campaigns(args: Dict[str, Any]) -> Dict[str, Any]:
     """Update sov campaigns."""
     try:
         result = sovereignty_service.update_campaigns()
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to update sov campaigns: {str(e)}", "isError": True}
 
@@ -370,7 +370,7 @@ def handle_get_war_fw_hotspots(args: Dict[str, Any]) -> Dict[str, Any]:
         faction = args.get("faction")
 
         result = fw_service.get_hotspots(faction=faction)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get FW hotspots: {str(e)}", "isError": True}
 
@@ -381,7 +381,7 @@ def handle_get_war_fw_vulnerable(args: Dict[str, Any]) -> Dict[str, Any]:
         min_contested = args.get("min_contested", 50)
 
         result = fw_service.get_vulnerable(min_contested=min_contested)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get vulnerable FW systems: {str(e)}", "isError": True}
 
@@ -390,7 +390,7 @@ def handle_update_war_fw(args: Dict[str, Any]) -> Dict[str, Any]:
     """Update FW status."""
     try:
         result = fw_service.update_status()
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to update FW status: {str(e)}", "isError": True}
 
@@ -407,7 +407,7 @@ def handle_get_war_doctrines(args: Dict[str, Any]) -> Dict[str, Any]:
             days=days,
             min_fleet_size=min_fleet_size
         )
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get war doctrines: {str(e)}", "isError": True}
 
@@ -418,7 +418,7 @@ def handle_get_war_conflicts(args: Dict[str, Any]) -> Dict[str, Any]:
         alliance_id = args.get("alliance_id")
 
         result = war_analyzer.get_conflicts(alliance_id=alliance_id)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get war conflicts: {str(e)}", "isError": True}
 
@@ -430,7 +430,7 @@ def handle_get_system_danger(args: Dict[str, Any]) -> Dict[str, Any]:
         hours = args.get("hours", 24)
 
         result = killmail_service.get_system_danger(system_id=system_id, hours=hours)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get system danger: {str(e)}", "isError": True}
 
@@ -442,7 +442,7 @@ def handle_get_war_summary(args: Dict[str, Any]) -> Dict[str, Any]:
         days = args.get("days", 7)
 
         result = killmail_service.get_summary(region_id=region_id, days=days)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get war summary: {str(e)}", "isError": True}
 
@@ -454,7 +454,7 @@ def handle_get_war_top_ships(args: Dict[str, Any]) -> Dict[str, Any]:
         limit = args.get("limit", 50)
 
         result = killmail_service.get_top_ships(days=days, limit=limit)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get top ships: {str(e)}", "isError": True}
 
@@ -471,7 +471,7 @@ def handle_get_safe_route(args: Dict[str, Any]) -> Dict[str, Any]:
             to_system=to_system,
             avoid_dangerous=avoid_dangerous
         )
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get safe route: {str(e)}", "isError": True}
 
@@ -483,7 +483,7 @@ def handle_get_item_combat_stats(args: Dict[str, Any]) -> Dict[str, Any]:
         days = args.get("days", 30)
 
         result = killmail_service.get_item_stats(type_id=type_id, days=days)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get item combat stats: {str(e)}", "isError": True}
 
@@ -495,7 +495,7 @@ def handle_get_war_alerts(args: Dict[str, Any]) -> Dict[str, Any]:
         hours = args.get("hours", 6)
 
         result = war_analyzer.get_alerts(region_id=region_id, hours=hours)
-        return {"content": [{"type": "text", "text": str(result)}]}
+        return tool_result(result)
     except Exception as e:
         return {"error": f"Failed to get war alerts: {str(e)}", "isError": True}
 
@@ -3,12 +3,14 @@ Mining Router
 Endpoints for finding mining locations and ore information
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Query, Depends
 from src.database import get_db_connection
 
 # New refactored services (available for future integration)
 from src.core.config import get_settings, Settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.services.route.repository import RouteRepository
 from src.services.route.service import RouteService
 from src.services.cargo.repository import CargoRepository
@@ -22,26 +24,34 @@ router = APIRouter(prefix="/api/mining", tags=["Mining"])
 # Dependency Injection Functions
 # ============================================================
 
+# Process-wide services, created on first request instead of per call.
+# RouteService reads systems/jumps from the shared universe graph.
+_route_service: Optional[RouteService] = None
+_cargo_service: Optional[CargoService] = None
+
+
 def get_route_service(settings: Settings = Depends(get_settings)) -> RouteService:
     """
     Dependency injection for RouteService.
 
-    Creates service with proper repository and database pool.
+    Returns a shared service backed by the process-wide universe graph.
     """
-    db_pool = DatabasePool(settings)
-    repository = RouteRepository(db_pool)
-    return RouteService(repository)
+    global _route_service
+    if _route_service is None:
+        _route_service = RouteService(RouteRepository(get_database_pool()))
+    return _route_service
 
 
 def get_cargo_service(settings: Settings = Depends(get_settings)) -> CargoService:
     """
     Dependency injection for CargoService.
 
-    Creates service with proper repository and database pool.
+    Returns a shared service using the process-wide DatabasePool.
     """
-    db_pool = DatabasePool(settings)
-    repository = CargoRepository(db_pool)
-    return CargoService(repository)
+    global _cargo_service
+    if _cargo_service is None:
+        _cargo_service = CargoService(CargoRepository(get_database_pool()))
+    return _cargo_service
 
 
 # ============================================================
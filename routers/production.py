@@ -7,7 +7,7 @@ from typing import Optional
 
 from config import REGIONS
 from src.core.config import get_settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.core.exceptions import NotFoundError, EVECopilotError
 from src.services.production.service import ProductionService
 from src.services.production.repository import ProductionRepository
@@ -35,7 +35,7 @@ REGION_ID_TO_NAME = {
 def get_production_service(region_id: int = REGIONS["the_forge"]) -> ProductionService:
     """Dependency injection for ProductionService."""
     settings = get_settings()
-    db = DatabasePool(settings)
+    db = get_database_pool()
 
     # Initialize MarketService
     esi_client = ESIClient(settings)
@@ -50,7 +50,7 @@ def get_production_service(region_id: int = REGIONS["the_forge"]) -> ProductionS
 def get_character_service() -> CharacterService:
     """Dependency injection for CharacterService."""
     settings = get_settings()
-    db = DatabasePool(settings)
+    db = get_database_pool()
     esi_client = ESIClient(settings)
 
     # Initialize AuthService for token management
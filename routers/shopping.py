@@ -16,7 +16,7 @@ from src.transport_service import transport_service
 
 # New refactored services
 from src.core.config import get_settings, Settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.services.shopping.repository import ShoppingRepository
 from src.services.shopping.service import ShoppingService
 from src.services.shopping.models import (
@@ -38,7 +38,7 @@ def get_shopping_service(settings: Settings = Depends(get_settings)) -> Shopping
 
     Creates service with proper repository and database pool.
     """
-    db_pool = DatabasePool(settings)
+    db_pool = get_database_pool()
     repository = ShoppingRepository(db_pool)
     # Market service is optional for now
     return ShoppingService(repository, market_service=None)
@@ -17,7 +17,7 @@ from config import REGIONS
 
 # New refactored services
 from src.core.config import get_settings, Settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.integrations.esi.client import ESIClient
 from src.services.warroom.repository import WarRoomRepository
 from src.services.warroom.sovereignty import SovereigntyService
@@ -38,7 +38,7 @@ def get_war_room_repository(settings: Settings = Depends(get_settings)) -> WarRo
 
     Creates shared repository instance for War Room services.
     """
-    db_pool = DatabasePool(settings)
+    db_pool = get_database_pool()
     return WarRoomRepository(db_pool)
 
 
@@ -747,56 +747,11 @@ async def get_battle_participants(battle_id: int):
     Returns:
         Attackers and defenders with statistics and names
     """
-    import aiohttp
-    import asyncio
-    import redis
-
-    # Redis cache for ESI names (24h TTL)
-    redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-    ESI_NAME_TTL = 86400  # 24 hours
+    from src.services.names import get_name_resolver
 
     try:
         from src.database import get_db_connection
 
-        # Helper functions to fetch names from ESI with Redis caching
-        async def get_alliance_name(session: aiohttp.ClientSession, alliance_id: int) -> str:
-            cache_key = f"esi:alliance:{alliance_id}:name"
-            # Check cache first
-            cached = redis_client.get(cache_key)
-            if cached:
-                return cached
-            # Fetch from ESI
-            try:
-                url = f"https://esi.evetech.net/latest/alliances/{alliance_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        name = data.get("name", f"Alliance {alliance_id}")
-                        redis_client.setex(cache_key, ESI_NAME_TTL, name)
-                        return name
-            except:
-                pass
-            return f"Alliance {alliance_id}"
-
-        async def get_corporation_name(session: aiohttp.ClientSession, corp_id: int) -> str:
-            cache_key = f"esi:corporation:{corp_id}:name"
-            # Check cache first
-            cached = redis_client.get(cache_key)
-            if cached:
-                return cached
-            # Fetch from ESI
-            try:
-                url = f"https://esi.evetech.net/latest/corporations/{corp_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        name = data.get("name", f"Corporation {corp_id}")
-                        redis_client.setex(cache_key, ESI_NAME_TTL, name)
-                        return name
-            except:
-                pass
-            return f"Corporation {corp_id}"
-
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 # Verify battle exists
@@ -881,20 +836,10 @@ async def get_battle_participants(battle_id: int):
             if row[0]:
                 corp_ids.add(row[0])
 
-        # Fetch all names concurrently
-        alliance_names = {}
-        corp_names = {}
-
-        async with aiohttp.ClientSession() as session:
-            # Fetch alliance names
-            alliance_tasks = {aid: get_alliance_name(session, aid) for aid in alliance_ids}
-            alliance_results = await asyncio.gather(*alliance_tasks.values())
-            alliance_names = dict(zip(alliance_tasks.keys(), alliance_results))
-
-            # Fetch corporation names
-            corp_tasks = {cid: get_corporation_name(session, cid) for cid in corp_ids}
-            corp_results = await asyncio.gather(*corp_tasks.values())
-            corp_names = dict(zip(corp_tasks.keys(), corp_results))
+        # Resolve all names in one batch per category
+        resolver = get_name_resolver()
+        alliance_names = await resolver.aget_names('alliance', alliance_ids)
+        corp_names = await resolver.aget_names('corporation', corp_ids)
 
         # Build response with names
         attacker_alliances = []
@@ -7,7 +7,7 @@ Provides dependency injection functions for all war room routers.
 from fastapi import Depends
 
 from src.core.config import get_settings, Settings
-from src.core.database import DatabasePool
+from src.core.database import get_database_pool
 from src.integrations.esi.client import ESIClient
 from src.services.warroom.repository import WarRoomRepository
 from src.services.warroom.sovereignty import SovereigntyService
@@ -21,7 +21,7 @@ def get_war_room_repository(settings: Settings = Depends(get_settings)) -> WarRo
 
     Creates shared repository instance for War Room services.
     """
-    db_pool = DatabasePool(settings)
+    db_pool = get_database_pool()
     return WarRoomRepository(db_pool)
 
 
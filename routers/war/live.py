@@ -11,6 +11,7 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
 
+from src.core.offload import run_blocking, run_report
 from src.zkillboard_live_service import zkill_live_service
 
 router = APIRouter()
@@ -43,7 +44,8 @@ async def get_live_kills(
                 "example": "/api/war/live/kills?region_id=10000002&limit=50"
             }
 
-        kills = zkill_live_service.get_recent_kills(
+        kills = await run_blocking(
+            zkill_live_service.get_recent_kills,
             system_id=system_id,
             region_id=region_id,
             limit=limit
@@ -74,7 +76,7 @@ async def get_live_hotspots_from_service():
         List of active hotspots with kill counts and locations
     """
     try:
-        hotspots = zkill_live_service.get_active_hotspots()
+        hotspots = await run_blocking(zkill_live_service.get_active_hotspots)
 
         return {
             "hotspots": hotspots,
@@ -103,7 +105,7 @@ async def get_top_destroyed_items(
         List of items with destruction counts
     """
     try:
-        items = zkill_live_service.get_top_destroyed_items(limit)
+        items = await run_blocking(zkill_live_service.get_top_destroyed_items, limit)
 
         return {
             "items": items,
@@ -132,7 +134,7 @@ async def get_live_item_demand(
         Total quantity destroyed in last 24h
     """
     try:
-        quantity = zkill_live_service.get_item_demand(item_type_id)
+        quantity = await run_blocking(zkill_live_service.get_item_demand, item_type_id)
 
         return {
             "item_type_id": item_type_id,
@@ -153,7 +155,7 @@ async def get_live_stats():
         Service status and statistics
     """
     try:
-        stats = zkill_live_service.get_stats()
+        stats = await run_blocking(zkill_live_service.get_stats)
 
         return stats
 
@@ -175,7 +177,7 @@ async def get_24h_battle_report():
     Also includes global summary with most active and expensive regions.
     """
     try:
-        report = zkill_live_service.get_24h_battle_report()
+        report = await run_report(zkill_live_service.get_24h_battle_report)
 
         return report
 
@@ -198,12 +200,38 @@ async def get_pilot_intelligence_report():
     Data is cached for 10 minutes for performance.
     """
     try:
-        report = zkill_live_service.build_pilot_intelligence_report()
+        report = await run_report(zkill_live_service.build_pilot_intelligence_report)
         return report
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to build pilot intelligence report: {str(e)}")
 
 
+def _read_live_hotspots() -> list:
+    """Hotspots from Redis live_hotspot:* keys that are less than 5 minutes old"""
+    hotspots = []
+    current_time = time.time()
+
+    # Scan Redis for all live_hotspot:* keys
+    redis_client = zkill_live_service.redis_client
+    hotspot_keys = list(redis_client.scan_iter("live_hotspot:*"))
+
+    for key in hotspot_keys:
+        data = redis_client.get(key)
+        if data:
+            hotspot = json.loads(data)
+
+            # Calculate age in seconds
+            hotspot_time = hotspot.get("timestamp", current_time)
+            age_seconds = int(current_time - hotspot_time)
+            hotspot["age_seconds"] = age_seconds
+
+            # Only include hotspots less than 5 minutes old
+            if age_seconds < 300:
+                hotspots.append(hotspot)
+
+    return hotspots
+
+
 @router.get("/live-hotspots")
 async def get_live_hotspots():
     """
@@ -213,26 +241,7 @@ async def get_live_hotspots():
     Used by BattleMapPreview component for live pulsing visualization.
     """
     try:
-        hotspots = []
-        current_time = time.time()
-
-        # Scan Redis for all live_hotspot:* keys
-        redis_client = zkill_live_service.redis_client
-        hotspot_keys = list(redis_client.scan_iter("live_hotspot:*"))
-
-        for key in hotspot_keys:
-            data = redis_client.get(key)
-            if data:
-                hotspot = json.loads(data)
-
-                # Calculate age in seconds
-                hotspot_time = hotspot.get("timestamp", current_time)
-                age_seconds = int(current_time - hotspot_time)
-                hotspot["age_seconds"] = age_seconds
-
-                # Only include hotspots less than 5 minutes old
-                if age_seconds < 300:
-                    hotspots.append(hotspot)
+        hotspots = await run_blocking(_read_live_hotspots)
 
         return {
             "hotspots": hotspots,
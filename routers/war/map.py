@@ -6,8 +6,9 @@ Provides endpoints for map data and safe route calculation.
 
 from fastapi import APIRouter, HTTPException, Query
 
-from src.database import get_db_connection
+from src.core.offload import run_blocking
 from src.route_service import route_service
+from src.services.route.universe import get_universe_graph
 
 router = APIRouter()
 
@@ -27,41 +28,29 @@ async def get_map_systems():
         }
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT
-                        ms."solarSystemID",
-                        ms."solarSystemName",
-                        ms."regionID",
-                        mr."regionName",
-                        ms.x,
-                        ms.z,
-                        ms.security
-                    FROM "mapSolarSystems" ms
-                    JOIN "mapRegions" mr ON mr."regionID" = ms."regionID"
-                    ORDER BY ms."solarSystemID"
-                """)
-
-                rows = cur.fetchall()
-
-                systems = []
-                for row in rows:
-                    system_id, system_name, region_id, region_name, x, z, security = row
-                    systems.append({
-                        "system_id": system_id,
-                        "system_name": system_name,
-                        "region_id": region_id,
-                        "region_name": region_name,
-                        "x": float(x),
-                        "z": float(z),
-                        "security": float(security) if security else 0.0
-                    })
-
-                return {
-                    "systems": systems,
-                    "total": len(systems)
-                }
+        universe = await run_blocking(get_universe_graph)
+
+        systems = []
+        for i, system_id in enumerate(universe.system_ids.tolist()):
+            region_id = int(universe.region_ids[i])
+            region_name = universe.region_names.get(region_id)
+            if region_name is None:
+                continue
+            x, _, z = universe.coordinates[i]
+            systems.append({
+                "system_id": system_id,
+                "system_name": universe.names[i],
+                "region_id": region_id,
+                "region_name": region_name,
+                "x": float(x),
+                "z": float(z),
+                "security": float(universe.security[i])
+            })
+
+        return {
+            "systems": systems,
+            "total": len(systems)
+        }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get map systems: {str(e)}")
@@ -76,7 +65,8 @@ async def get_safe_route(
 ):
     """Get route with danger analysis (legacy service)"""
     try:
-        result = route_service.get_route_with_danger(
+        result = await run_blocking(
+            route_service.get_route_with_danger,
             from_system, to_system, avoid_lowsec, avoid_nullsec
         )
 
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmark coalition clustering: legacy union-find vs CoalitionClusterer
+
+Generates a synthetic week of kills (default 5,000 alliances in power-law
+sized blocs, 1,000,000 kill-attacker rows), counts co-attacker / conflict
+pairs per hour the way the hourly combat rollups do, and times:
+
+- re-clustering 24h / 72h / 7d windows from the hourly counters ('sum s'
+  is the in-process stand-in for the rollup SUM query, 'cluster s' is
+  CoalitionClusterer itself)
+- the legacy detect_coalitions clustering on the same 7d inputs (--legacy;
+  it scans every alliance per merge, seconds at full size) and whether
+  both produce the same clusters
+
+Usage:
+    python3 scripts/bench_coalition_clustering.py
+    python3 scripts/bench_coalition_clustering.py --alliances 1000 --rows 200000 --legacy
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.coalition_clustering import cluster_coalitions, count_pairs
+
+HOURS = 168
+MIN_FIGHTS_TOGETHER = 5
+
+
+def generate_kills(alliances: int, rows: int, blocs: int = 40):
+    """
+    Synthetic kills as (hour, victim_alliance_id, attacker alliance ids)
+
+    Alliances belong to blocs of power-law sizes; attackers of a kill mostly
+    come from one bloc and the victim mostly from another.
+    """
+    rng = random.Random(42)
+    alliance_ids = list(range(99000001, 99000001 + alliances))
+    bloc_of = [min(int(blocs ** rng.random()), blocs - 1) for _ in alliance_ids]
+    members = [[] for _ in range(blocs)]
+    for alliance_id, bloc in zip(alliance_ids, bloc_of):
+        members[bloc].append(alliance_id)
+    members = [m for m in members if m]
+
+    kills = []
+    emitted = 0
+    while emitted < rows:
+        attacker_bloc = rng.choice(members)
+        victim_bloc = rng.choice(members)
+        attacker_count = min(int(rng.paretovariate(1.2)), 200)
+        attackers = []
+        for _ in range(attacker_count):
+            if rng.random() < 0.05:
+                attackers.append(rng.choice(alliance_ids))     # Third party / awox noise
+            else:
+                attackers.append(rng.choice(attacker_bloc))
+        kills.append((rng.randrange(HOURS), rng.choice(victim_bloc), attackers))
+        emitted += attacker_count
+    return kills, emitted
+
+
+def hourly_counters(kills):
+    """Per-hour (pairs, activity, conflicts) dicts, as stored in the rollup tables"""
+    hours = {}
+    for hour, victim, attackers in kills:
+        hours.setdefault(hour, []).append((victim, attackers))
+
+    counters = {}
+    for hour, hour_kills in hours.items():
+        pairs, activity, conflicts = count_pairs(hour_kills, min_fights_together=1, min_activity=1)
+        counters[hour] = (
+            {(a, b): n for a, b, n in pairs},
+            activity,
+            {(a, v): n for a, v, n in conflicts},
+        )
+    return counters
+
+
+def window_inputs(counters, hours: int):
+    """Sum the newest `hours` hourly counters and apply the get_coalition_inputs() filters"""
+    together, activity, against = {}, {}, {}
+    for hour in range(HOURS - hours, HOURS):
+        if hour not in counters:
+            continue
+        hour_pairs, hour_activity, hour_conflicts = counters[hour]
+        for key, n in hour_pairs.items():
+            together[key] = together.get(key, 0) + n
+        for key, n in hour_activity.items():
+            activity[key] = activity.get(key, 0) + n
+        for key, n in hour_conflicts.items():
+            against[key] = against.get(key, 0) + n
+
+    pairs = sorted(((a, b, n) for (a, b), n in together.items() if n >= MIN_FIGHTS_TOGETHER),
+                   key=lambda p: p[2], reverse=True)
+    activity = {a: n for a, n in activity.items() if n >= 10}
+    conflicts = [(a, v, n) for (a, v), n in against.items() if n >= MIN_FIGHTS_TOGETHER]
+    return pairs, activity, conflicts
+
+
+def legacy_cluster(alliance_pairs, alliance_activity, conflicts_raw):
+    """The clustering detect_coalitions used before CoalitionClusterer"""
+    parent = {}
+
+    def find(x):
+        if x not in parent:
+            parent[x] = x
+        if parent[x] != x:
+            parent[x] = find(parent[x])
+        return parent[x]
+
+    conflict_map = {}
+    for attacker, victim, count in conflicts_raw:
+        pair = tuple(sorted([attacker, victim]))
+        conflict_map[pair] = conflict_map.get(pair, 0) + count
+
+    confirmed_enemies = {pair for pair, fights_against in conflict_map.items() if fights_against >= 20}
+
+    def safe_union(x, y):
+        px, py = find(x), find(y)
+        if px == py:
+            return
+        members_x = [a for a in list(parent) if find(a) == px] or [px]
+        members_y = [a for a in list(parent) if find(a) == py] or [py]
+        for mx in members_x:
+            for my in members_y:
+                if tuple(sorted([mx, my])) in confirmed_enemies:
+                    return
+        if alliance_activity.get(px, 0) >= alliance_activity.get(py, 0):
+            parent[py] = px
+        else:
+            parent[px] = py
+
+    for alliance_a, alliance_b, fights_together in alliance_pairs:
+        pair = tuple(sorted([alliance_a, alliance_b]))
+        if pair in confirmed_enemies:
+            continue
+        fights_against = conflict_map.get(pair, 0)
+        if fights_against > 0 and fights_together < fights_against * 5:
+            continue
+        min_activity = min(alliance_activity.get(alliance_a, 0), alliance_activity.get(alliance_b, 0))
+        if min_activity > 0 and fights_together >= min_activity * 0.10:
+            safe_union(alliance_a, alliance_b)
+
+    coalitions_raw = {}
+    for alliance_id in alliance_activity:
+        coalitions_raw.setdefault(find(alliance_id), []).append(alliance_id)
+    return list(coalitions_raw.values())
+
+
+def summarize(clusters):
+    coalitions = [c for c in clusters if len(c) >= 2]
+    return len(coalitions), max((len(c) for c in coalitions), default=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark coalition clustering')
+    parser.add_argument('--alliances', type=int, default=5000, help='Number of alliances (default: 5000)')
+    parser.add_argument('--rows', type=int, default=1000000, help='Kill-attacker rows (default: 1000000)')
+    parser.add_argument('--legacy', action='store_true', help='Also time the legacy clustering on the 7d window')
+    args = parser.parse_args()
+
+    start = time.time()
+    kills, rows = generate_kills(args.alliances, args.rows)
+    print(f"Generated {len(kills):,} kills / {rows:,} attacker rows in {time.time() - start:.1f}s")
+
+    start = time.time()
+    counters = hourly_counters(kills)
+    print(f"Counted hourly pair counters in {time.time() - start:.1f}s")
+
+    print(f"\n{'window':<8} {'pairs':>9} {'alliances':>10} {'conflicts':>10} {'sum s':>8} {'cluster s':>10} {'coalitions':>11} {'largest':>8}")
+    for hours in (24, 72, HOURS):
+        start = time.time()
+        inputs = window_inputs(counters, hours)
+        summed = time.time() - start
+
+        start = time.time()
+        clusters = cluster_coalitions(*inputs)
+        clustered = time.time() - start
+
+        count, largest = summarize(clusters)
+        pairs, activity, conflicts = inputs
+        print(f"{hours:>3}h     {len(pairs):>9,} {len(activity):>10,} {len(conflicts):>10,} "
+              f"{summed:>8.3f} {clustered:>10.3f} {count:>11,} {largest:>8,}")
+
+    if args.legacy:
+        start = time.time()
+        legacy = legacy_cluster(*inputs)
+        elapsed = time.time() - start
+        same = sorted(map(sorted, legacy)) == sorted(map(sorted, clusters))
+        print(f"\nlegacy {HOURS}h clustering: {elapsed:.3f}s (same clusters: {same})")
+
+
+if __name__ == "__main__":
+    main()
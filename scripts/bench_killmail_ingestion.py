@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark killmail archive ingestion: list-based vs streaming
+
+Compares killmails/sec and peak RSS of a multi-day backfill:
+
+- list:   KillmailService.extract_and_parse + aggregate_killmails, one day
+          after the other (the process_date path)
+- stream: stream_aggregate over several days at once, members parsed in a
+          shared process pool (the ingest_date / backfill path)
+
+Archives are read from local .tar.bz2 files instead of EVE Ref and nothing
+is written to the database. Each mode runs in its own subprocess so peak
+RSS is not shared; pool workers are reported separately (sum of their
+peaks).
+
+Usage:
+    # One month of synthetic archives (20k killmails per day), then benchmark
+    python3 scripts/bench_killmail_ingestion.py --synthetic 30 /tmp/killmails
+
+    # Real archives downloaded from https://data.everef.net/killmails/
+    python3 scripts/bench_killmail_ingestion.py /path/to/archives --concurrency 4 --workers 8
+"""
+
+import sys
+import os
+import io
+import glob
+import json
+import time
+import random
+import tarfile
+import argparse
+import resource
+import subprocess
+from datetime import date, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SYSTEMS = 8000
+
+
+def write_synthetic_archives(directory: str, days: int, per_day: int):
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(42)
+    killmail_id = 100000000
+    start = date(2026, 1, 1)
+    for day in range(days):
+        current = start + timedelta(days=day)
+        path = os.path.join(directory, f"killmails-{current.isoformat()}.tar.bz2")
+        with tarfile.open(path, 'w:bz2') as tar:
+            for _ in range(per_day):
+                killmail_id += 1
+                items = [
+                    {
+                        'item_type_id': rng.randint(1, 40000),
+                        'flag': rng.randint(5, 35),
+                        'quantity_destroyed': rng.randint(0, 20),
+                        'quantity_dropped': rng.randint(0, 5),
+                        'singleton': 0,
+                    }
+                    for _ in range(rng.randint(5, 40))
+                ]
+                killmail = {
+                    'killmail_id': killmail_id,
+                    'killmail_time': f"{current.isoformat()}T12:00:00Z",
+                    'solar_system_id': 30000000 + int(SYSTEMS ** rng.random()),
+                    'victim': {
+                        'character_id': rng.randint(90000000, 99000000),
+                        'ship_type_id': int(700 ** rng.random()) + 580,
+                        'damage_taken': rng.randint(100, 500000),
+                        'items': items,
+                    },
+                    'attackers': [
+                        {'character_id': rng.randint(90000000, 99000000), 'damage_done': rng.randint(1, 5000)}
+                        for _ in range(rng.randint(1, 20))
+                    ],
+                    'zkb': {'totalValue': round(rng.lognormvariate(17, 2), 2)},
+                }
+                data = json.dumps(killmail).encode()
+                info = tarfile.TarInfo(f"killmails/{killmail_id}.json")
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        print(f"Wrote {path}")
+
+
+def archive_date(path: str) -> date:
+    return date.fromisoformat(os.path.basename(path)[len('killmails-'):len('killmails-') + 10])
+
+
+def process_peak_rss_mb(pid: int) -> float:
+    """VmHWM of a live process (Linux)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def run_mode(mode: str, directory: str, concurrency: int, workers: int) -> dict:
+    """Ingest every archive with one mode (runs inside the subprocess)"""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.killmail_service import KillmailService, create_parse_pool
+
+    system_region_map = {30000000 + i: 10000000 + i % 60 for i in range(SYSTEMS + 1)}
+
+    class LocalKillmailService(KillmailService):
+        """System map without the database"""
+
+        def _get_system_region_map(self):
+            return system_region_map
+
+    service = LocalKillmailService()
+    archives = sorted(glob.glob(os.path.join(directory, 'killmails-*.tar.bz2')))
+    start = time.time()
+
+    worker_peak_mb = 0.0
+
+    if mode == 'list':
+        killmails = 0
+        rows = 0
+        for path in archives:
+            parsed = service.extract_and_parse(path)
+            aggregated = service.aggregate_killmails(parsed, archive_date(path))
+            killmails += len(parsed)
+            rows += len(aggregated['ship_losses']) + len(aggregated['item_losses'])
+            del parsed
+    else:
+        pool = create_parse_pool(workers)
+
+        def ingest(path):
+            with open(path, 'rb') as f:
+                count, aggregated, _ = service.stream_aggregate(f, archive_date(path), pool, workers, system_region_map)
+            return count, len(aggregated['ship_losses']) + len(aggregated['item_losses'])
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as days:
+                results = list(days.map(ingest, archives))
+            worker_peak_mb = sum(process_peak_rss_mb(pid) for pid in pool._processes)
+        finally:
+            pool.shutdown()
+        killmails = sum(count for count, _ in results)
+        rows = sum(row_count for _, row_count in results)
+
+    elapsed = time.time() - start
+    return {
+        'mode': mode,
+        'days': len(archives),
+        'killmails': killmails,
+        'rows': rows,
+        'wall_seconds': round(elapsed, 2),
+        'killmails_per_sec': round(killmails / elapsed) if elapsed else 0,
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'worker_peak_rss_mb': round(worker_peak_mb, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark list-based vs streaming killmail ingestion')
+    parser.add_argument('archives', help='Directory with killmails-YYYY-MM-DD.tar.bz2 files')
+    parser.add_argument('--synthetic', type=int, metavar='DAYS', help='Generate synthetic archives first')
+    parser.add_argument('--per-day', type=int, default=20000, help='Killmails per synthetic day (default: 20000)')
+    parser.add_argument('--concurrency', type=int, default=3, help='Days ingested at once in stream mode')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parse pool size')
+    parser.add_argument('--mode', choices=['list', 'stream'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.archives, args.concurrency, args.workers)))
+        return
+
+    if args.synthetic:
+        write_synthetic_archives(args.archives, args.synthetic, args.per_day)
+
+    results = []
+    for mode in ('list', 'stream'):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), args.archives, '--mode', mode,
+             '--concurrency', str(args.concurrency), '--workers', str(args.workers)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'mode':<8} {'days':>5} {'killmails':>11} {'rows':>9} {'wall s':>8} "
+          f"{'km/s':>8} {'peak RSS MB':>12} {'worker MB':>10}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['days']:>5} {r['killmails']:>11,} {r['rows']:>9,} {r['wall_seconds']:>8} "
+              f"{r['killmails_per_sec']:>8,} {r['peak_rss_mb']:>12} {r['worker_peak_rss_mb']:>10}")
+
+
+if __name__ == "__main__":
+    main()
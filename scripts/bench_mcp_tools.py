@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MCP tool call latency and payload size
+
+Calls a fixed set of tools through /mcp/tools/call on a running API server
+and prints p50/p95 latency and response text size per tool. Run it once per
+dispatch mode (MCP_DISPATCH_MODE = "http" vs "inprocess", or the old build),
+saving each run with --output; --baseline prints both side by side.
+
+Usage:
+    python3 scripts/bench_mcp_tools.py --output http.json           # MCP_DISPATCH_MODE = "http"
+    python3 scripts/bench_mcp_tools.py --baseline http.json         # MCP_DISPATCH_MODE = "inprocess"
+    python3 scripts/bench_mcp_tools.py --base-url http://10.0.0.5:8000 --calls 50
+"""
+
+import sys
+import json
+import time
+import argparse
+from typing import Dict, List, Optional
+
+import requests
+
+TOOLS = [
+    ("search_item", {"query": "Tritanium"}),
+    ("get_item_info", {"type_id": 34}),
+    ("search_item_groups", {"query": "frigate"}),
+    ("get_system_region", {"system_id": 30000142}),
+    ("get_hunter_categories", {}),
+    ("get_precalculated_opportunities", {"limit": 20}),
+    ("get_market_orders", {"type_id": 34, "region_id": 10000002}),
+    ("get_ore_composition", {}),
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def bench_tool(session: requests.Session, base_url: str, name: str, arguments: Dict, calls: int) -> Dict:
+    latencies = []
+    payload = 0
+    errors = 0
+    for _ in range(calls):
+        started = time.perf_counter()
+        response = session.post(f"{base_url}/mcp/tools/call", json={"name": name, "arguments": arguments}, timeout=120)
+        latencies.append(time.perf_counter() - started)
+        result = response.json()
+        if result.get("isError") or response.status_code >= 400:
+            errors += 1
+            continue
+        payload = sum(len(c.get("text", "")) for c in result.get("content", []))
+    values = sorted(latencies)
+    return {
+        "calls": calls,
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50) * 1000, 1),
+        "p95_ms": round(percentile(values, 95) * 1000, 1),
+        "payload_bytes": payload,
+    }
+
+
+def print_results(results: Dict, baseline: Optional[Dict] = None):
+    print(f"{'tool':<34} {'run':<9} {'err':>4} {'p50 ms':>8} {'p95 ms':>8} {'bytes':>9}")
+    for name in results["tools"]:
+        runs = [("baseline", baseline["tools"].get(name))] if baseline else []
+        runs.append(("current", results["tools"][name]))
+        for label, data in runs:
+            if not data:
+                continue
+            print(f"{name:<34} {label:<9} {data['errors']:>4} {data['p50_ms']:>8} "
+                  f"{data['p95_ms']:>8} {data['payload_bytes']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MCP tool call latency and payload size')
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--calls', type=int, default=20, help='Calls per tool (default: 20)')
+    parser.add_argument('--output', help='Write results as JSON')
+    parser.add_argument('--baseline', help='JSON from an earlier run to compare against')
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip('/')
+    session = requests.Session()
+    tools = {}
+    for name, arguments in TOOLS:
+        print(f"{name}: {args.calls} calls", file=sys.stderr)
+        tools[name] = bench_tool(session, base_url, name, arguments, args.calls)
+
+    results = {"base_url": base_url, "calls": args.calls, "tools": tools}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
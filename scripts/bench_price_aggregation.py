@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark regional price aggregation: list-based vs streaming
+
+Compares peak RSS and wall time of the old path (collect every order of a
+region, then aggregate_prices) against StreamingPriceAggregator fed page by
+page. Each mode runs in its own subprocess so peak RSS is not shared.
+
+The snapshot is a directory of page_N.json.gz files, the same layout the
+price fetcher writes with --use-etags (data/cache/market_pages/<region_id>).
+
+Usage:
+    # Record a Forge snapshot from ESI, then benchmark it
+    python3 scripts/bench_price_aggregation.py --record /tmp/forge
+    python3 scripts/bench_price_aggregation.py /tmp/forge
+
+    # Without ESI access: generate a synthetic snapshot of 300 pages
+    python3 scripts/bench_price_aggregation.py --synthetic 300 /tmp/synthetic
+"""
+
+import sys
+import os
+import gzip
+import glob
+import json
+import time
+import random
+import argparse
+import resource
+import subprocess
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+THE_FORGE = 10000002
+
+
+def iter_snapshot_pages(directory: str):
+    """Yield the order list of each page file in page order"""
+    paths = glob.glob(os.path.join(directory, 'page_*.json.gz'))
+    for path in sorted(paths, key=lambda p: int(os.path.basename(p).split('_')[1].split('.')[0])):
+        with gzip.open(path, 'rt') as f:
+            yield json.load(f)
+
+
+def record_snapshot(directory: str, region_id: int):
+    from jobs.regional_price_fetcher import PageETagCache, iter_region_order_pages
+
+    class SnapshotWriter(PageETagCache):
+        """Writes pages flat into the snapshot directory"""
+
+        def _path(self, region_id: int, page: int) -> str:
+            return os.path.join(self.directory, f"page_{page}")
+
+    stats = {}
+    for _ in iter_region_order_pages(region_id, etag_cache=SnapshotWriter(directory), verbose=True, stats=stats):
+        pass
+    print(f"Recorded {stats['pages']} pages to {directory}")
+
+
+def write_synthetic_snapshot(directory: str, pages: int, types: int = 15000):
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(42)
+    order_id = 0
+    for page in range(1, pages + 1):
+        orders = []
+        for _ in range(1000):
+            order_id += 1
+            type_id = int(types ** rng.random())  # Few busy types, long tail
+            is_buy = rng.random() < 0.45
+            orders.append({
+                'order_id': order_id,
+                'type_id': type_id,
+                'is_buy_order': is_buy,
+                'price': round(rng.lognormvariate(10, 2), 2),
+                'volume_remain': rng.randint(1, 500000),
+                'volume_total': 500000,
+                'location_id': 60003760,
+                'system_id': 30000142,
+                'range': 'region',
+                'duration': 90,
+                'min_volume': 1,
+                'issued': '2026-01-01T00:00:00Z',
+            })
+        with gzip.open(os.path.join(directory, f"page_{page}.json.gz"), 'wt') as f:
+            json.dump(orders, f)
+    print(f"Wrote {pages} synthetic pages to {directory}")
+
+
+def run_mode(mode: str, directory: str) -> dict:
+    """Aggregate the snapshot with one mode (runs inside the subprocess)"""
+    from jobs.regional_price_fetcher import aggregate_prices, StreamingPriceAggregator
+
+    start = time.time()
+    type_ids = set(range(1, 100000))
+
+    if mode == 'list':
+        orders = []
+        for page in iter_snapshot_pages(directory):
+            orders.extend(page)
+        prices = aggregate_prices(orders, type_ids)
+        order_count = len(orders)
+    else:
+        aggregator = StreamingPriceAggregator(type_ids)
+        for page in iter_snapshot_pages(directory):
+            aggregator.add_orders(page)
+        prices = aggregator.results()
+        order_count = aggregator.orders_seen
+
+    return {
+        'mode': mode,
+        'orders': order_count,
+        'types': len(prices),
+        'wall_seconds': round(time.time() - start, 2),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark list-based vs streaming price aggregation')
+    parser.add_argument('snapshot', help='Directory with page_N.json.gz files')
+    parser.add_argument('--record', action='store_true', help='Record the snapshot from ESI first')
+    parser.add_argument('--region', type=int, default=THE_FORGE, help='Region to record (default: The Forge)')
+    parser.add_argument('--synthetic', type=int, metavar='PAGES', help='Generate a synthetic snapshot first')
+    parser.add_argument('--mode', choices=['list', 'stream'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.snapshot)))
+        return
+
+    if args.record:
+        record_snapshot(args.snapshot, args.region)
+    elif args.synthetic:
+        write_synthetic_snapshot(args.snapshot, args.synthetic)
+
+    results = []
+    for mode in ('list', 'stream'):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), args.snapshot, '--mode', mode],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'mode':<8} {'orders':>10} {'types':>8} {'wall s':>8} {'peak RSS MB':>12}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['orders']:>10,} {r['types']:>8,} {r['wall_seconds']:>8} {r['peak_rss_mb']:>12}")
+
+
+if __name__ == "__main__":
+    main()
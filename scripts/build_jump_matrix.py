@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Precompute the all-pairs jump matrix used by RouteService"""
+
+import sys
+import os
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.route_service import RouteService
+from src.services.route.jump_matrix import JumpMatrix, DEFAULT_MATRIX_DIR
+
+
+def build_jump_matrix(directory: str):
+    service = RouteService()
+    service._load_graph()
+    matrix = JumpMatrix.build(service._systems, service._graph)
+    matrix.save(directory)
+    print(f"Saved jump matrix for {len(matrix.system_ids)} systems to {directory}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build jump distance/next-hop tables from mapSolarSystemJumps")
+    parser.add_argument("--dir", default=DEFAULT_MATRIX_DIR, help="Output directory")
+    args = parser.parse_args()
+    build_jump_matrix(args.dir)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Load test: /api/war/live/* latency while heavy report requests run
+
+Runs two phases against a running API server:
+
+- idle:  only live clients (short Redis/DB lookups)
+- heavy: the same live clients plus clients looping on heavy report
+         endpoints (pilot intelligence, 24h report, hunter scans)
+
+and prints p50/p95/p99/max latency of the live endpoints in both phases.
+Run it once against the old build and once against the new one, saving
+each run with --output; --baseline prints both side by side.
+
+Usage:
+    python3 scripts/loadtest_live_api.py --output before.json          # old build
+    python3 scripts/loadtest_live_api.py --baseline before.json        # new build
+    python3 scripts/loadtest_live_api.py --base-url http://10.0.0.5:8000 --duration 60 --heavy-clients 16
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from typing import Dict, List, Optional
+
+import aiohttp
+
+LIVE_ENDPOINTS = [
+    "/api/war/live/hotspots",
+    "/api/war/live/stats",
+    "/api/war/live/demand/top?limit=20",
+    "/api/war/live/kills?region_id=10000002&limit=50",
+    "/api/war/live-hotspots",
+]
+
+HEAVY_ENDPOINTS = [
+    "/api/war/pilot-intelligence",
+    "/api/war/live/report/24h",
+    "/api/hunter/market-tree",
+    "/api/hunter/scan?top=500&sort_by=roi",
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int) -> Dict:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50) * 1000, 1),
+        "p95_ms": round(percentile(values, 95) * 1000, 1),
+        "p99_ms": round(percentile(values, 99) * 1000, 1),
+        "max_ms": round(values[-1] * 1000, 1) if values else 0.0,
+    }
+
+
+async def client(session: aiohttp.ClientSession, base_url: str, endpoints: List[str],
+                 offset: int, deadline: float, latencies: List[float], errors: List[int]):
+    i = offset
+    while time.monotonic() < deadline:
+        path = endpoints[i % len(endpoints)]
+        i += 1
+        started = time.monotonic()
+        try:
+            async with session.get(base_url + path) as response:
+                await response.read()
+                if response.status >= 500:
+                    errors[0] += 1
+                    continue
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            errors[0] += 1
+            continue
+        latencies.append(time.monotonic() - started)
+
+
+async def run_phase(base_url: str, duration: float, live_clients: int, heavy_clients: int) -> Dict:
+    live_latencies: List[float] = []
+    heavy_latencies: List[float] = []
+    live_errors, heavy_errors = [0], [0]
+    deadline = time.monotonic() + duration
+    timeout = aiohttp.ClientTimeout(total=120)
+    connector = aiohttp.TCPConnector(limit=live_clients + heavy_clients)
+
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        tasks = [
+            client(session, base_url, LIVE_ENDPOINTS, n, deadline, live_latencies, live_errors)
+            for n in range(live_clients)
+        ] + [
+            client(session, base_url, HEAVY_ENDPOINTS, n, deadline, heavy_latencies, heavy_errors)
+            for n in range(heavy_clients)
+        ]
+        await asyncio.gather(*tasks)
+
+    return {
+        "live": summarize(live_latencies, live_errors[0]),
+        "heavy": summarize(heavy_latencies, heavy_errors[0]) if heavy_clients else None,
+    }
+
+
+def print_results(results: Dict, baseline: Optional[Dict] = None):
+    print(f"{'phase':<7} {'run':<9} {'live req':>9} {'err':>5} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'heavy req':>10}")
+    for phase in ("idle", "heavy"):
+        runs = [("baseline", baseline)] if baseline else []
+        runs.append(("current", results))
+        for label, data in runs:
+            live = data[phase]["live"]
+            heavy = data[phase]["heavy"]
+            print(f"{phase:<7} {label:<9} {live['requests']:>9} {live['errors']:>5} {live['p50_ms']:>8} "
+                  f"{live['p95_ms']:>8} {live['p99_ms']:>8} {live['max_ms']:>8} "
+                  f"{heavy['requests'] if heavy else '-':>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Live endpoint latency under heavy report load')
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds per phase (default: 30)')
+    parser.add_argument('--live-clients', type=int, default=20, help='Concurrent live clients (default: 20)')
+    parser.add_argument('--heavy-clients', type=int, default=8, help='Concurrent report clients (default: 8)')
+    parser.add_argument('--output', help='Write results as JSON')
+    parser.add_argument('--baseline', help='JSON from an earlier run to compare against')
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip('/')
+    print(f"Idle phase: {args.live_clients} live clients for {args.duration:.0f}s", file=sys.stderr)
+    idle = asyncio.run(run_phase(base_url, args.duration, args.live_clients, 0))
+    print(f"Heavy phase: + {args.heavy_clients} report clients", file=sys.stderr)
+    heavy = asyncio.run(run_phase(base_url, args.duration, args.live_clients, args.heavy_clients))
+
+    results = {
+        "base_url": base_url,
+        "duration": args.duration,
+        "live_clients": args.live_clients,
+        "heavy_clients": args.heavy_clients,
+        "idle": idle,
+        "heavy": heavy,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
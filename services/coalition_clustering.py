@@ -0,0 +1,168 @@
+"""
+Coalition Clustering
+
+Groups alliances into coalitions from combat patterns: alliances that
+attack together are merged, unless the merge would put two confirmed
+enemies (alliances that fight each other a lot) into the same coalition.
+
+Each cluster keeps its member set and the union of its members' enemies as
+bitmaps (Python ints, one bit per alliance), so the "any member of X an
+enemy of any member of Y" check of a merge is a single AND. Members are
+moved from the smaller cluster into the larger one, which keeps the total
+relabelling work at O(n log n).
+
+Inputs are the pair counters of the hourly combat rollups (see
+services/combat_rollup_service.get_coalition_inputs), so re-clustering any
+window only sums counters and never touches killmail_attackers.
+count_pairs() computes the same counters from raw kill-attacker rows.
+"""
+
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+ENEMY_MIN_FIGHTS = 20           # Attacker entries against each other that make two alliances enemies
+COOPERATION_RATIO = 5           # Fights together must outnumber fights against by this factor
+SIGNIFICANCE_SHARE = 0.10       # Fights together relative to the less active alliance's activity
+MIN_ACTIVITY = 10               # Alliances below this activity are not clustered
+
+
+class CoalitionClusterer:
+    """Union-find over alliances with explicit member sets and enemy bitmaps"""
+
+    def __init__(self, enemy_min_fights: int = ENEMY_MIN_FIGHTS,
+                 cooperation_ratio: float = COOPERATION_RATIO,
+                 significance_share: float = SIGNIFICANCE_SHARE):
+        self.enemy_min_fights = enemy_min_fights
+        self.cooperation_ratio = cooperation_ratio
+        self.significance_share = significance_share
+
+    def cluster(self, pairs: Sequence[Tuple[int, int, int]], activity: Dict[int, int],
+                conflicts: Iterable[Tuple[int, int, int]]) -> List[List[int]]:
+        """
+        Cluster the alliances of `activity` into coalitions
+
+        Args:
+            pairs: (alliance_a, alliance_b, fights_together), merged in this
+                order (strongest co-operation first)
+            activity: alliance_id -> activity (attacker entries + losses)
+            conflicts: (attacker_alliance, victim_alliance, fights_against),
+                both directions of a pair are added up
+
+        Returns:
+            Member lists, most active member first; alliances without
+            allies are single-member lists
+        """
+        conflict_map: Dict[Tuple[int, int], int] = {}
+        for attacker, victim, count in conflicts:
+            pair = (attacker, victim) if attacker < victim else (victim, attacker)
+            conflict_map[pair] = conflict_map.get(pair, 0) + count
+
+        # Dense index for the bitmaps: every alliance that can take part in a merge
+        index: Dict[int, int] = {}
+        for alliance_id in activity:
+            index.setdefault(alliance_id, len(index))
+        for a, b, _ in pairs:
+            index.setdefault(a, len(index))
+            index.setdefault(b, len(index))
+        size = len(index)
+
+        root = list(range(size))
+        members: List[Optional[List[int]]] = [[i] for i in range(size)]
+        member_bits = [1 << i for i in range(size)]
+        enemy_bits = [0] * size
+        enemies = set()
+        for (a, b), fights_against in conflict_map.items():
+            if fights_against >= self.enemy_min_fights and a in index and b in index:
+                ia, ib = index[a], index[b]
+                enemy_bits[ia] |= 1 << ib
+                enemy_bits[ib] |= 1 << ia
+                enemies.add((a, b))
+
+        for a, b, fights_together in pairs:
+            pair = (a, b) if a < b else (b, a)
+            if pair in enemies:
+                continue
+
+            # Must cooperate significantly more than conflict
+            fights_against = conflict_map.get(pair, 0)
+            if fights_against > 0 and fights_together < fights_against * self.cooperation_ratio:
+                continue
+
+            # Must actually cooperate significantly
+            min_activity = min(activity.get(a, 0), activity.get(b, 0))
+            if not (min_activity > 0 and fights_together >= min_activity * self.significance_share):
+                continue
+
+            ra, rb = root[index[a]], root[index[b]]
+            if ra == rb or enemy_bits[ra] & member_bits[rb]:
+                continue
+
+            # Move the smaller cluster into the larger one
+            if len(members[ra]) < len(members[rb]):
+                ra, rb = rb, ra
+            for i in members[rb]:
+                root[i] = ra
+            members[ra].extend(members[rb])
+            members[rb] = None
+            member_bits[ra] |= member_bits[rb]
+            enemy_bits[ra] |= enemy_bits[rb]
+
+        alliance_ids = list(index)
+        clusters = []
+        for i in range(size):
+            if members[i] is None:
+                continue
+            cluster = [alliance_ids[m] for m in members[i] if alliance_ids[m] in activity]
+            if cluster:
+                cluster.sort(key=lambda x: activity[x], reverse=True)
+                clusters.append(cluster)
+        return clusters
+
+
+def cluster_coalitions(pairs: Sequence[Tuple[int, int, int]], activity: Dict[int, int],
+                       conflicts: Iterable[Tuple[int, int, int]]) -> List[List[int]]:
+    """Cluster with the default thresholds (see CoalitionClusterer.cluster)"""
+    return CoalitionClusterer().cluster(pairs, activity, conflicts)
+
+
+def count_pairs(kills: Iterable[Tuple[Optional[int], Sequence[int]]], min_fights_together: int = 5,
+                min_activity: int = MIN_ACTIVITY) -> Tuple[List[Tuple[int, int, int]], Dict[int, int], List[Tuple[int, int, int]]]:
+    """
+    Coalition inputs from raw kills, same semantics as get_coalition_inputs()
+
+    Args:
+        kills: (victim_alliance_id, attacker alliance ids with one entry per
+            attacking pilot) per kill
+        min_fights_together: Minimum shared kills / attacker entries for pairs and conflicts
+        min_activity: Minimum activity for an alliance to be included
+
+    Returns:
+        (pairs sorted by fights_together desc, activity, conflicts)
+    """
+    together: Dict[Tuple[int, int], int] = {}
+    against: Dict[Tuple[int, int], int] = {}
+    activity: Dict[int, int] = {}
+
+    for victim_alliance, attacker_alliances in kills:
+        entries: Dict[int, int] = {}
+        for alliance_id in attacker_alliances:
+            if alliance_id:
+                entries[alliance_id] = entries.get(alliance_id, 0) + 1
+
+        for alliance_id, count in entries.items():
+            activity[alliance_id] = activity.get(alliance_id, 0) + count
+            if victim_alliance and alliance_id != victim_alliance:
+                key = (alliance_id, victim_alliance)
+                against[key] = against.get(key, 0) + count
+        if victim_alliance:
+            activity[victim_alliance] = activity.get(victim_alliance, 0) + 1
+
+        for pair in combinations(sorted(entries), 2):
+            together[pair] = together.get(pair, 0) + 1
+
+    pairs = sorted(((a, b, n) for (a, b), n in together.items() if n >= min_fights_together),
+                   key=lambda p: p[2], reverse=True)
+    activity = {a: n for a, n in activity.items() if n >= min_activity}
+    conflicts = [(a, v, n) for (a, v), n in against.items() if n >= min_fights_together]
+    return pairs, activity, conflicts
@@ -0,0 +1,498 @@
+"""
+Combat Rollup Service
+Maintains hourly combat rollup tables from killmails / killmail_attackers
+and provides the rollup reads used by the war tracker and coalition detection.
+
+Rollups are rebuilt one whole hour at a time from the raw tables, so a
+refresh is idempotent and late kills are picked up by recomputing their hour.
+catch_up() finds the hours touched since the last run through the
+killmails.processed_at watermark (see migrations/011_combat_rollups.sql).
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.database import get_db_connection
+
+
+WATERMARK_NAME = "combat_rollups"
+WATERMARK_OVERLAP = timedelta(minutes=10)   # Re-check kills committed late with an older processed_at
+DEFAULT_CATCH_UP_HOURS = 48                 # First catch-up without a watermark
+BACKFILL_CHUNK_HOURS = 24                   # Hours rebuilt per transaction during backfill
+
+HOUR = timedelta(hours=1)
+
+
+class Rollup(NamedTuple):
+    """Rollup table and the query that computes its rows for [start, end)"""
+    table: str
+    columns: Tuple[str, ...]
+    select_sql: str
+
+
+# Kills of the refreshed range (bound to %(start)s / %(end)s)
+_KILLS_CTE = """
+    kills AS (
+        SELECT killmail_id, date_trunc('hour', killmail_time) AS hour,
+               solar_system_id, region_id, ship_type_id, COALESCE(ship_value, 0) AS ship_value,
+               victim_alliance_id, COALESCE(is_capital, FALSE) AS is_capital,
+               ship_category, lower(ship_category) AS category
+        FROM killmails
+        WHERE killmail_time >= %(start)s AND killmail_time < %(end)s
+    )"""
+
+# One row per (kill, attacking alliance) with the alliance's number of attacker rows
+_ATTACKER_ALLIANCES_CTE = """
+    attacker_alliances AS (
+        SELECT ka.killmail_id, ka.alliance_id, COUNT(*) AS entries
+        FROM killmail_attackers ka
+        JOIN kills k ON k.killmail_id = ka.killmail_id
+        WHERE ka.alliance_id IS NOT NULL
+        GROUP BY ka.killmail_id, ka.alliance_id
+    )"""
+
+# Victim ship class used by the war tracker (invGroups groupID based)
+_WAR_SHIP_CLASS_SQL = """
+    CASE
+        WHEN it."groupID" IN (29) THEN 'capsule'
+        WHEN it."groupID" IN (30, 659, 547, 485, 1538) THEN 'capital'
+        WHEN it."groupID" IN (27, 898, 900) THEN 'battleship'
+        WHEN it."groupID" IN (419, 540) THEN 'battlecruiser'
+        WHEN it."groupID" IN (26, 358, 894, 906, 963) THEN 'cruiser'
+        WHEN it."groupID" IN (420, 541, 1305) THEN 'destroyer'
+        WHEN it."groupID" IN (25, 324, 831, 893) THEN 'frigate'
+        WHEN it."groupID" IN (832) THEN 'logistics'
+        WHEN it."groupID" IN (834) THEN 'stealth_bomber'
+        WHEN it."groupID" IN (513, 902) THEN 'hauler'
+        WHEN it."groupID" IN (543) THEN 'mining'
+        WHEN it."groupID" IN (28, 463) THEN 'industrial'
+        ELSE 'other'
+    END"""
+
+WAR_SHIP_CLASSES = (
+    "capital", "battleship", "battlecruiser", "cruiser", "destroyer", "frigate",
+    "logistics", "stealth_bomber", "industrial", "hauler", "mining", "capsule", "other",
+)
+
+ROLLUPS: Tuple[Rollup, ...] = (
+    Rollup(
+        "combat_rollup_alliance_hourly",
+        ("hour", "alliance_id", "kills", "isk_destroyed", "attacker_entries",
+         "losses", "isk_lost", "capital_losses", "capital_isk_lost",
+         "titan_losses", "super_losses", "dread_losses"),
+        f"""
+        WITH {_KILLS_CTE}, {_ATTACKER_ALLIANCES_CTE},
+        attacks AS (
+            SELECT k.hour, a.alliance_id,
+                   COUNT(*) AS kills,
+                   SUM(k.ship_value) AS isk_destroyed,
+                   SUM(a.entries) AS attacker_entries
+            FROM attacker_alliances a
+            JOIN kills k ON k.killmail_id = a.killmail_id
+            GROUP BY k.hour, a.alliance_id
+        ),
+        losses AS (
+            SELECT hour, victim_alliance_id AS alliance_id,
+                   COUNT(*) AS losses,
+                   SUM(ship_value) AS isk_lost,
+                   COUNT(*) FILTER (WHERE is_capital) AS capital_losses,
+                   COALESCE(SUM(ship_value) FILTER (WHERE is_capital), 0) AS capital_isk_lost,
+                   COUNT(*) FILTER (WHERE category = 'titan') AS titan_losses,
+                   COUNT(*) FILTER (WHERE category = 'supercarrier') AS super_losses,
+                   COUNT(*) FILTER (WHERE category = 'dreadnought') AS dread_losses
+            FROM kills
+            WHERE victim_alliance_id IS NOT NULL
+            GROUP BY hour, victim_alliance_id
+        )
+        SELECT COALESCE(a.hour, l.hour), COALESCE(a.alliance_id, l.alliance_id),
+               COALESCE(a.kills, 0), COALESCE(a.isk_destroyed, 0), COALESCE(a.attacker_entries, 0),
+               COALESCE(l.losses, 0), COALESCE(l.isk_lost, 0),
+               COALESCE(l.capital_losses, 0), COALESCE(l.capital_isk_lost, 0),
+               COALESCE(l.titan_losses, 0), COALESCE(l.super_losses, 0), COALESCE(l.dread_losses, 0)
+        FROM attacks a
+        FULL OUTER JOIN losses l ON l.hour = a.hour AND l.alliance_id = a.alliance_id
+        """,
+    ),
+    Rollup(
+        "combat_rollup_region_hourly",
+        ("hour", "region_id", "kills", "isk_destroyed", "capital_kills", "capital_isk",
+         "titan_kills", "super_kills", "other_capital_kills"),
+        f"""
+        WITH {_KILLS_CTE}
+        SELECT hour, region_id,
+               COUNT(*),
+               SUM(ship_value),
+               COUNT(*) FILTER (WHERE is_capital),
+               COALESCE(SUM(ship_value) FILTER (WHERE is_capital), 0),
+               COUNT(*) FILTER (WHERE is_capital AND category = 'titan'),
+               COUNT(*) FILTER (WHERE is_capital AND category = 'supercarrier'),
+               COUNT(*) FILTER (WHERE is_capital AND category IN ('dreadnought', 'carrier', 'force_auxiliary'))
+        FROM kills
+        WHERE region_id IS NOT NULL
+        GROUP BY hour, region_id
+        """,
+    ),
+    Rollup(
+        "combat_rollup_system_hourly",
+        ("hour", "solar_system_id", "region_id", "kills", "isk_destroyed", "hauler_kills", "pod_kills"),
+        f"""
+        WITH {_KILLS_CTE}
+        SELECT hour, solar_system_id, MAX(region_id),
+               COUNT(*),
+               SUM(ship_value),
+               COUNT(*) FILTER (WHERE category IN ('industrial', 'hauler', 'freighter')),
+               COUNT(*) FILTER (WHERE category = 'capsule')
+        FROM kills
+        WHERE solar_system_id IS NOT NULL
+        GROUP BY hour, solar_system_id
+        """,
+    ),
+    Rollup(
+        "combat_rollup_ship_category_hourly",
+        ("hour", "ship_category", "kills", "isk_destroyed", "capital_kills", "capital_isk"),
+        f"""
+        WITH {_KILLS_CTE}
+        SELECT hour, COALESCE(ship_category, 'unknown'),
+               COUNT(*),
+               SUM(ship_value),
+               COUNT(*) FILTER (WHERE is_capital),
+               COALESCE(SUM(ship_value) FILTER (WHERE is_capital), 0)
+        FROM kills
+        GROUP BY hour, COALESCE(ship_category, 'unknown')
+        """,
+    ),
+    Rollup(
+        "combat_rollup_matchup_hourly",
+        ("hour", "attacker_alliance_id", "victim_alliance_id", "solar_system_id", "ship_class",
+         "kills", "isk_destroyed", "attacker_entries", "max_ship_value", "max_ship_type_id"),
+        f"""
+        WITH {_KILLS_CTE}, {_ATTACKER_ALLIANCES_CTE}
+        SELECT k.hour, a.alliance_id, k.victim_alliance_id, k.solar_system_id,
+               {_WAR_SHIP_CLASS_SQL},
+               COUNT(*),
+               SUM(k.ship_value),
+               SUM(a.entries),
+               MAX(k.ship_value),
+               (ARRAY_AGG(k.ship_type_id ORDER BY k.ship_value DESC, k.killmail_id))[1]
+        FROM attacker_alliances a
+        JOIN kills k ON k.killmail_id = a.killmail_id
+        LEFT JOIN "invTypes" it ON it."typeID" = k.ship_type_id
+        WHERE k.victim_alliance_id IS NOT NULL
+          AND k.solar_system_id IS NOT NULL
+          AND a.alliance_id != k.victim_alliance_id
+        GROUP BY 1, 2, 3, 4, 5
+        """,
+    ),
+    Rollup(
+        "combat_rollup_alliance_pair_hourly",
+        ("hour", "alliance_a_id", "alliance_b_id", "kills_together"),
+        f"""
+        WITH {_KILLS_CTE}, {_ATTACKER_ALLIANCES_CTE}
+        SELECT k.hour, a.alliance_id, b.alliance_id, COUNT(*)
+        FROM attacker_alliances a
+        JOIN attacker_alliances b ON b.killmail_id = a.killmail_id AND a.alliance_id < b.alliance_id
+        JOIN kills k ON k.killmail_id = a.killmail_id
+        GROUP BY k.hour, a.alliance_id, b.alliance_id
+        """,
+    ),
+)
+
+
+def hour_ranges(hours: Iterable[datetime]) -> List[Tuple[datetime, datetime]]:
+    """
+    Merge hour buckets into contiguous [start, end) ranges
+
+    Args:
+        hours: Hour-truncated timestamps, any order, duplicates allowed
+
+    Returns:
+        Sorted, non-overlapping ranges covering exactly the given hours
+    """
+    ranges: List[Tuple[datetime, datetime]] = []
+    for hour in sorted(set(hours)):
+        if ranges and ranges[-1][1] == hour:
+            ranges[-1] = (ranges[-1][0], hour + HOUR)
+        else:
+            ranges.append((hour, hour + HOUR))
+    return ranges
+
+
+def split_range(start: datetime, end: datetime, chunk_hours: int) -> List[Tuple[datetime, datetime]]:
+    """Split [start, end) into ranges of at most chunk_hours hours"""
+    chunks = []
+    step = timedelta(hours=chunk_hours)
+    while start < end:
+        chunks.append((start, min(start + step, end)))
+        start += step
+    return chunks
+
+
+def refresh_range(cur, start: datetime, end: datetime) -> Dict[str, int]:
+    """
+    Rebuild all rollups for the hours in [start, end) (no commit)
+
+    Returns:
+        Rows written per rollup table
+    """
+    written = {}
+    params = {"start": start, "end": end}
+    for rollup in ROLLUPS:
+        cur.execute(f"DELETE FROM {rollup.table} WHERE hour >= %(start)s AND hour < %(end)s", params)
+        cur.execute(
+            f"INSERT INTO {rollup.table} ({', '.join(rollup.columns)}) {rollup.select_sql}",
+            params
+        )
+        written[rollup.table] = cur.rowcount
+    return written
+
+
+def get_watermark(cur) -> Optional[datetime]:
+    """processed_at up to which killmails are rolled up, None before the first run"""
+    cur.execute("SELECT watermark FROM combat_rollup_state WHERE name = %s", (WATERMARK_NAME,))
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def _set_watermark(cur, watermark: datetime) -> None:
+    cur.execute("""
+        INSERT INTO combat_rollup_state (name, watermark, updated_at)
+        VALUES (%s, %s, CURRENT_TIMESTAMP)
+        ON CONFLICT (name) DO UPDATE
+        SET watermark = GREATEST(combat_rollup_state.watermark, EXCLUDED.watermark),
+            updated_at = CURRENT_TIMESTAMP
+    """, (WATERMARK_NAME, watermark))
+
+
+def catch_up() -> Dict:
+    """
+    Roll up every hour that received kills since the last run
+
+    Hours are found through killmails.processed_at > watermark - WATERMARK_OVERLAP,
+    rebuilt in one transaction together with the watermark update.
+
+    Returns:
+        Dict with hours refreshed, rows written per table and the new watermark
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            watermark = get_watermark(cur)
+            if watermark is None:
+                cur.execute("SELECT LOCALTIMESTAMP - %s * INTERVAL '1 hour'", (DEFAULT_CATCH_UP_HOURS,))
+                since = cur.fetchone()[0]
+            else:
+                since = watermark - WATERMARK_OVERLAP
+
+            cur.execute("""
+                SELECT DISTINCT date_trunc('hour', killmail_time), MAX(processed_at) OVER ()
+                FROM killmails
+                WHERE processed_at > %s
+            """, (since,))
+            rows = cur.fetchall()
+            if not rows:
+                return {"hours": 0, "rows": {}, "watermark": watermark}
+
+            new_watermark = rows[0][1]
+            written: Dict[str, int] = {}
+            for start, end in hour_ranges(row[0] for row in rows):
+                for table, count in refresh_range(cur, start, end).items():
+                    written[table] = written.get(table, 0) + count
+
+            _set_watermark(cur, new_watermark)
+        conn.commit()
+
+    return {"hours": len(rows), "rows": written, "watermark": new_watermark}
+
+
+def backfill(days: int = 30, chunk_hours: int = BACKFILL_CHUNK_HOURS, verbose: bool = False) -> Dict:
+    """
+    Rebuild the rollups of the last `days` days (one transaction per chunk)
+
+    The watermark is moved to the newest processed_at seen before the rebuild
+    started, so a following catch_up() only handles kills stored meanwhile.
+
+    Returns:
+        Dict with hours rebuilt and rows written per table
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT date_trunc('hour', LOCALTIMESTAMP - %s * INTERVAL '1 day'),
+                       date_trunc('hour', LOCALTIMESTAMP) + INTERVAL '1 hour',
+                       (SELECT MAX(processed_at) FROM killmails)
+            """, (days,))
+            start, end, watermark = cur.fetchone()
+
+    written: Dict[str, int] = {}
+    for chunk_start, chunk_end in split_range(start, end, chunk_hours):
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                for table, count in refresh_range(cur, chunk_start, chunk_end).items():
+                    written[table] = written.get(table, 0) + count
+            conn.commit()
+        if verbose:
+            print(f"  Rolled up {chunk_start} - {chunk_end}")
+
+    if watermark is not None:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                _set_watermark(cur, watermark)
+            conn.commit()
+
+    return {"hours": int((end - start) / HOUR), "rows": written, "watermark": watermark}
+
+
+def check_consistency(hours: int = 48) -> Dict[str, Dict[str, int]]:
+    """
+    Compare the rollups of the last `hours` complete and current hours with the raw tables
+
+    Every rollup row is recomputed from killmails / killmail_attackers and
+    compared column by column.
+
+    Returns:
+        Per table: rows expected from the raw tables, 'missing' (raw rows not in
+        the rollup or different) and 'unexpected' (rollup rows not in the raw data)
+    """
+    results = {}
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT date_trunc('hour', LOCALTIMESTAMP) - %s * INTERVAL '1 hour',
+                       date_trunc('hour', LOCALTIMESTAMP) + INTERVAL '1 hour'
+            """, (hours,))
+            start, end = cur.fetchone()
+            params = {"start": start, "end": end}
+
+            for rollup in ROLLUPS:
+                stored = (f"SELECT {', '.join(rollup.columns)} FROM {rollup.table} "
+                          f"WHERE hour >= %(start)s AND hour < %(end)s")
+                cur.execute(f"""
+                    SELECT
+                        (SELECT COUNT(*) FROM ({rollup.select_sql}) expected),
+                        (SELECT COUNT(*) FROM (({rollup.select_sql}) EXCEPT ({stored})) missing),
+                        (SELECT COUNT(*) FROM (({stored}) EXCEPT ({rollup.select_sql})) unexpected)
+                """, params)
+                expected, missing, unexpected = cur.fetchone()
+                results[rollup.table] = {"expected": expected, "missing": missing, "unexpected": unexpected}
+
+    return results
+
+
+def is_consistent(report: Dict[str, Dict[str, int]]) -> bool:
+    """True if a check_consistency() report has no differences"""
+    return all(r["missing"] == 0 and r["unexpected"] == 0 for r in report.values())
+
+
+# ------------------------------------------------------------------
+# Rollup reads
+# ------------------------------------------------------------------
+
+def _since_days_sql(column: str = "hour") -> str:
+    """Rollup window of the last %s days (hour buckets, current hour included)"""
+    return f"{column} > date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '%s days'"
+
+
+def get_war_matchup(cur, alliance_a: int, alliance_b: int, days: int) -> Dict:
+    """
+    Kills between two alliances from the matchup rollup
+
+    Returns:
+        Dict with losses_a/losses_b, isk_lost_a/isk_lost_b, system_kills
+        [(solar_system_id, kills)] (top 5), ship_classes_a/ship_classes_b and
+        biggest_loss_a/biggest_loss_b ({'ship_type_id', 'value'})
+    """
+    cur.execute(f"""
+        SELECT victim_alliance_id, solar_system_id, ship_class,
+               SUM(kills), SUM(isk_destroyed), MAX(max_ship_value),
+               (ARRAY_AGG(max_ship_type_id ORDER BY max_ship_value DESC))[1]
+        FROM combat_rollup_matchup_hourly
+        WHERE {_since_days_sql()}
+          AND ((victim_alliance_id = %s AND attacker_alliance_id = %s)
+            OR (victim_alliance_id = %s AND attacker_alliance_id = %s))
+        GROUP BY victim_alliance_id, solar_system_id, ship_class
+    """, (days, alliance_a, alliance_b, alliance_b, alliance_a))
+    rows = cur.fetchall()
+
+    result = {
+        "losses_a": 0, "losses_b": 0, "isk_lost_a": 0, "isk_lost_b": 0,
+        "ship_classes_a": dict.fromkeys(WAR_SHIP_CLASSES, 0),
+        "ship_classes_b": dict.fromkeys(WAR_SHIP_CLASSES, 0),
+        "biggest_loss_a": {"ship_type_id": None, "value": 0},
+        "biggest_loss_b": {"ship_type_id": None, "value": 0},
+    }
+    systems: Dict[int, int] = {}
+    for victim, system_id, ship_class, kills, isk, max_value, max_type in rows:
+        side = "a" if victim == alliance_a else "b"
+        result[f"losses_{side}"] += int(kills)
+        result[f"isk_lost_{side}"] += int(isk)
+        classes = result[f"ship_classes_{side}"]
+        classes[ship_class] = classes.get(ship_class, 0) + int(kills)
+        if max_value and max_value > result[f"biggest_loss_{side}"]["value"]:
+            result[f"biggest_loss_{side}"] = {"ship_type_id": max_type, "value": int(max_value)}
+        systems[system_id] = systems.get(system_id, 0) + int(kills)
+
+    result["system_kills"] = sorted(systems.items(), key=lambda s: s[1], reverse=True)[:5]
+    return result
+
+
+def get_coalition_inputs(cur, days: int, min_fights_together: int) -> Tuple[List[Tuple], Dict[int, int], List[Tuple]]:
+    """
+    Co-operation, activity and conflict data for coalition detection
+
+    Returns:
+        (alliance_pairs [(alliance_a, alliance_b, fights_together)] by fights desc,
+         alliance_activity {alliance_id: attacker entries + losses} (>= 10),
+         conflicts [(attacker_alliance, victim_alliance, attacker entries)])
+    """
+    cur.execute(f"""
+        SELECT alliance_a_id, alliance_b_id, SUM(kills_together) AS fights_together
+        FROM combat_rollup_alliance_pair_hourly
+        WHERE {_since_days_sql()}
+        GROUP BY alliance_a_id, alliance_b_id
+        HAVING SUM(kills_together) >= %s
+        ORDER BY fights_together DESC
+    """, (days, min_fights_together))
+    alliance_pairs = [(a, b, int(n)) for a, b, n in cur.fetchall()]
+
+    cur.execute(f"""
+        SELECT alliance_id, SUM(attacker_entries + losses) AS total_activity
+        FROM combat_rollup_alliance_hourly
+        WHERE {_since_days_sql()}
+        GROUP BY alliance_id
+        HAVING SUM(attacker_entries + losses) >= 10
+        ORDER BY total_activity DESC
+    """, (days,))
+    alliance_activity = {row[0]: int(row[1]) for row in cur.fetchall()}
+
+    cur.execute(f"""
+        SELECT attacker_alliance_id, victim_alliance_id, SUM(attacker_entries)
+        FROM combat_rollup_matchup_hourly
+        WHERE {_since_days_sql()}
+        GROUP BY attacker_alliance_id, victim_alliance_id
+        HAVING SUM(attacker_entries) >= %s
+    """, (days, min_fights_together))
+    conflicts = [(a, v, int(n)) for a, v, n in cur.fetchall()]
+
+    return alliance_pairs, alliance_activity, conflicts
+
+
+def get_alliance_totals(cur, alliance_ids: Sequence[int], days: int) -> Dict[str, int]:
+    """
+    Summed kills / losses of a group of alliances
+
+    Kills are kill participations: a kill shared by two member alliances counts
+    for both.
+    """
+    cur.execute(f"""
+        SELECT COALESCE(SUM(kills), 0), COALESCE(SUM(isk_destroyed), 0),
+               COALESCE(SUM(losses), 0), COALESCE(SUM(isk_lost), 0)
+        FROM combat_rollup_alliance_hourly
+        WHERE {_since_days_sql()}
+          AND alliance_id = ANY(%s)
+    """, (days, list(alliance_ids)))
+    kills, isk_destroyed, losses, isk_lost = cur.fetchone()
+    return {
+        "total_kills": int(kills),
+        "isk_destroyed": int(isk_destroyed),
+        "total_losses": int(losses),
+        "isk_lost": int(isk_lost),
+    }
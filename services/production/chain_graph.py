@@ -0,0 +1,139 @@
+"""
+Production Chain Graph
+
+In-memory DAG of manufacturing dependencies (product -> material edges).
+Raw-material totals are computed bottom-up in topological order with one
+memoized vector per node, so shared components (e.g. T2 components used by
+hundreds of ships) are resolved exactly once per build.
+"""
+
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+class ChainEntry(NamedTuple):
+    """Total raw material need of one item"""
+    quantity: float
+    depth: int      # Longest number of production steps down to the raw material
+    via: int        # Next node on the deepest path (the raw material itself if direct)
+
+
+class ProductionGraph:
+    """Product -> material dependency DAG with memoized raw-material vectors"""
+
+    def __init__(self, edges: Dict[int, List[Tuple[int, float]]]):
+        """
+        Args:
+            edges: item_type_id -> [(material_type_id, base_quantity), ...]
+        """
+        self.edges = edges
+        self._chains: Dict[int, Dict[int, ChainEntry]] = {}
+        self.cyclic: Set[int] = set()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, int, float]]) -> 'ProductionGraph':
+        """Build from (item_type_id, material_type_id, base_quantity) rows"""
+        edges: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+        for item_type_id, material_type_id, quantity in rows:
+            edges[item_type_id].append((material_type_id, quantity))
+        return cls(dict(edges))
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def is_raw(self, type_id: int) -> bool:
+        """True if the type has no manufacturing dependencies"""
+        return type_id not in self.edges
+
+    def reachable(self, item_ids: Iterable[int]) -> Set[int]:
+        """All producible nodes reachable from the given items"""
+        seen: Set[int] = set()
+        stack = [i for i in item_ids if i in self.edges]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(m for m, _ in self.edges[node] if m in self.edges and m not in seen)
+        return seen
+
+    def topological_order(self, nodes: Set[int]) -> List[int]:
+        """
+        Order producible nodes so every component comes before its consumers
+
+        Nodes on a dependency cycle cannot be ordered; they are left out and
+        recorded in self.cyclic.
+        """
+        pending = {n: 0 for n in nodes}
+        consumers: Dict[int, List[int]] = defaultdict(list)
+        for node in nodes:
+            for material, _ in self.edges[node]:
+                if material in pending:
+                    pending[node] += 1
+                    consumers[material].append(node)
+
+        queue = deque(n for n, count in pending.items() if count == 0)
+        order: List[int] = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for consumer in consumers[node]:
+                pending[consumer] -= 1
+                if pending[consumer] == 0:
+                    queue.append(consumer)
+
+        if len(order) < len(nodes):
+            self.cyclic.update(nodes.difference(order))
+        return order
+
+    def resolve(self, item_ids: Iterable[int]) -> Dict[int, Dict[int, ChainEntry]]:
+        """
+        Compute raw-material vectors for the given items and every component below them
+
+        Returns:
+            Dict mapping item_type_id -> {raw_material_type_id: ChainEntry}
+            for every resolved producible node
+        """
+        todo = self.reachable(item_ids).difference(self._chains, self.cyclic)
+        for node in self.topological_order(todo):
+            self._chains[node] = self._combine(node)
+        return self._chains
+
+    def _combine(self, node: int) -> Dict[int, ChainEntry]:
+        totals: Dict[int, ChainEntry] = {}
+        for material, quantity in self.edges[node]:
+            if material in self.edges:
+                sub = self._chains.get(material)
+                if sub is None:  # Component on a cycle
+                    continue
+                contributions = [
+                    (raw, quantity * entry.quantity, entry.depth + 1, material)
+                    for raw, entry in sub.items()
+                ]
+            else:
+                contributions = [(material, quantity, 1, material)]
+
+            for raw, qty, depth, via in contributions:
+                current = totals.get(raw)
+                if current is None:
+                    totals[raw] = ChainEntry(qty, depth, via)
+                elif depth > current.depth:
+                    totals[raw] = ChainEntry(current.quantity + qty, depth, via)
+                else:
+                    totals[raw] = ChainEntry(current.quantity + qty, current.depth, current.via)
+        return totals
+
+    def chain(self, item_type_id: int) -> Optional[Dict[int, ChainEntry]]:
+        """Raw-material vector of an item (None for raw materials and cyclic items)"""
+        if self.is_raw(item_type_id):
+            return None
+        return self.resolve([item_type_id]).get(item_type_id)
+
+    def path(self, item_type_id: int, raw_material_type_id: int) -> str:
+        """Deepest production path as "648->12345->34" """
+        nodes = [item_type_id]
+        node = item_type_id
+        while node != raw_material_type_id:
+            node = self._chains[node][raw_material_type_id].via
+            nodes.append(node)
+        return '->'.join(str(n) for n in nodes)
@@ -5,7 +5,8 @@ Handles database operations for production dependencies and chains.
 Manages material dependency graphs from finished products to raw materials.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from psycopg2.extras import execute_values
 from src.database import get_db_connection
 
 
@@ -136,6 +137,105 @@ class ProductionChainRepository:
             print(f"Error saving chain: {e}")
             return None
 
+    def get_sde_dependency_edges(self, activity_id: int = 1) -> List[Tuple[int, int, int]]:
+        """
+        Load every product -> material edge from the SDE in one query
+
+        Uses the lowest blueprint typeID when several blueprints produce the
+        same item.
+
+        Args:
+            activity_id: Activity type (1=Manufacturing)
+
+        Returns:
+            List of (item_type_id, material_type_id, base_quantity)
+        """
+        try:
+            with get_db_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        WITH blueprints AS (
+                            SELECT DISTINCT ON ("productTypeID")
+                                "productTypeID", "typeID"
+                            FROM "industryActivityProducts"
+                            WHERE "activityID" = %s
+                            ORDER BY "productTypeID", "typeID"
+                        )
+                        SELECT b."productTypeID", iam."materialTypeID", iam."quantity"
+                        FROM blueprints b
+                        JOIN "industryActivityMaterials" iam
+                            ON iam."typeID" = b."typeID"
+                            AND iam."activityID" = %s
+                    """, (activity_id, activity_id))
+                    return cursor.fetchall()
+        except Exception as e:
+            print(f"Error loading SDE dependencies: {e}")
+            return []
+
+    def replace_dependencies(
+        self,
+        rows: Sequence[Tuple[int, int, int, bool]],
+        activity_id: int = 1
+    ) -> Optional[int]:
+        """
+        Replace direct dependencies of all items in rows in one transaction
+
+        Args:
+            rows: (item_type_id, material_type_id, base_quantity, is_raw_material)
+            activity_id: Activity type (1=Manufacturing)
+
+        Returns:
+            Number of rows written, None on error
+        """
+        item_ids = sorted({row[0] for row in rows})
+        try:
+            with get_db_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        DELETE FROM production_dependencies
+                        WHERE item_type_id = ANY(%s) AND activity_id = %s
+                    """, (item_ids, activity_id))
+                    execute_values(cursor, """
+                        INSERT INTO production_dependencies
+                        (item_type_id, material_type_id, base_quantity, activity_id, is_raw_material)
+                        VALUES %s
+                    """, [(i, m, q, activity_id, raw) for i, m, q, raw in rows], page_size=1000)
+                    conn.commit()
+                    return len(rows)
+        except Exception as e:
+            print(f"Error replacing dependencies: {e}")
+            return None
+
+    def replace_chains(self, rows: Sequence[Tuple[int, int, float, int, str]]) -> Optional[int]:
+        """
+        Replace complete chains of all items in rows in one transaction
+
+        Raw materials an item no longer needs are removed as well.
+
+        Args:
+            rows: (item_type_id, raw_material_type_id, base_quantity, chain_depth, path)
+
+        Returns:
+            Number of rows written, None on error
+        """
+        item_ids = sorted({row[0] for row in rows})
+        try:
+            with get_db_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        DELETE FROM production_chains WHERE item_type_id = ANY(%s)
+                    """, (item_ids,))
+                    execute_values(cursor, """
+                        INSERT INTO production_chains
+                        (item_type_id, raw_material_type_id, base_quantity, chain_depth, path)
+                        VALUES %s
+                    """, rows, page_size=1000)
+                    conn.commit()
+                    return len(rows)
+        except Exception as e:
+            print(f"Error replacing chains: {e}")
+            return None
+
     def get_full_chain(self, item_type_id: int) -> List[Dict[str, Any]]:
         """
         Get complete production chain to all raw materials
@@ -6,7 +6,7 @@ Business logic for production chains, material calculations, and ME adjustments.
 
 from typing import Dict, List, Any, Optional
 from services.production.chain_repository import ProductionChainRepository
-from src.database import get_db_connection
+from src.services.production.bom_cache import bom_cache
 
 
 class ProductionChainService:
@@ -193,23 +193,15 @@ class ProductionChainService:
     def _get_item_info(self, type_id: int) -> Optional[Dict[str, Any]]:
         """Get item name and basic info"""
         try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT "typeID", "typeName", "groupID"
-                        FROM "invTypes"
-                        WHERE "typeID" = %s
-                    """, (type_id,))
-
-                    row = cursor.fetchone()
-                    if not row:
-                        return None
-
-                    return {
-                        'type_id': row[0],
-                        'name': row[1],
-                        'group_id': row[2]
-                    }
+            info = bom_cache.type_info(type_id)
+            if not info:
+                return None
+
+            return {
+                'type_id': info.type_id,
+                'name': info.name,
+                'group_id': info.group_id
+            }
         except Exception as e:
             print(f"Error getting item info: {e}")
             return None
@@ -6,7 +6,7 @@ Reports are generated every 6 hours by cron and stored persistently.
 
 import json
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from src.database import get_db_connection
 
 
@@ -28,13 +28,22 @@ def get_report(report_type: str) -> Optional[Dict]:
     Get a stored report from the database.
     Returns None if report doesn't exist.
     """
+    stored = get_report_with_version(report_type)
+    return stored[0] if stored else None
+
+
+def get_report_with_version(report_type: str) -> Optional[Tuple[Dict, int]]:
+    """
+    Get a stored report and its version from the database.
+    Returns None if report doesn't exist.
+    """
     if report_type not in REPORT_TYPES:
         raise ValueError(f"Unknown report type: {report_type}")
 
     with get_db_connection() as conn:
         with conn.cursor() as cur:
             cur.execute("""
-                SELECT report_data, generated_at
+                SELECT report_data, generated_at, version
                 FROM stored_reports
                 WHERE report_type = %s
             """, (report_type,))
@@ -48,11 +57,22 @@ def get_report(report_type: str) -> Optional[Dict]:
                 if isinstance(report_data, dict):
                     report_data['_generated_at'] = generated_at.isoformat() if generated_at else None
 
-                return report_data
+                return report_data, row[2]
 
             return None
 
 
+def get_report_versions() -> Dict[str, int]:
+    """
+    Get the current version of every stored report.
+    Cheap poll for caches: the version is bumped by every save_report().
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT report_type, version FROM stored_reports")
+            return {report_type: version for report_type, version in cur.fetchall()}
+
+
 def save_report(report_type: str, report_data: Dict, generation_time: float = None) -> bool:
     """
     Save a generated report to the database.
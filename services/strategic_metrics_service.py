@@ -1,6 +1,9 @@
 """
 Strategic Metrics Service
 Provides strategic-level intelligence data for LLM analysis.
+
+Aggregates are read from the hourly combat rollups (combat_rollup_*_hourly),
+kept current by jobs/combat_rollups.py; windows are whole hour buckets.
 """
 
 import psycopg2
@@ -8,24 +11,21 @@ from psycopg2.extras import RealDictCursor
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from decimal import Decimal
-import redis
-import requests
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-# Redis connection for caching
-redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
 
-# ESI API base URL
-ESI_BASE_URL = "https://esi.evetech.net/latest"
+from src.services.names import get_name_resolver
 
-# Cache TTL for alliance/corp names (7 days)
-NAME_CACHE_TTL = 7 * 24 * 60 * 60
+# Rollup windows (hour buckets, current hour included) - see services/combat_rollup_service.py
+CURRENT_24H = "hour > date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '24 hours'"
+PREVIOUS_24H = ("hour > date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '48 hours' "
+                "AND hour <= date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '24 hours'")
+LAST_7D = "hour > date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '7 days'"
+LAST_30D = "hour > date_trunc('hour', LOCALTIMESTAMP) - INTERVAL '30 days'"
 
 
 def get_alliance_name(alliance_id: int) -> str:
     """
-    Get alliance name from ESI API with Redis caching.
+    Get alliance name via the shared name resolver.
 
     Args:
         alliance_id: The alliance ID
@@ -33,44 +33,12 @@ def get_alliance_name(alliance_id: int) -> str:
     Returns:
         Alliance name or fallback string
     """
-    if not alliance_id:
-        return "Unknown"
-
-    cache_key = f"esi:alliance:{alliance_id}:name"
-
-    # Try cache first
-    try:
-        cached = redis_client.get(cache_key)
-        if cached:
-            return cached
-    except redis.RedisError:
-        pass
-
-    # Fetch from ESI
-    try:
-        response = requests.get(
-            f"{ESI_BASE_URL}/alliances/{alliance_id}/",
-            timeout=5,
-            headers={"Accept": "application/json"}
-        )
-        if response.status_code == 200:
-            data = response.json()
-            name = data.get("name", f"Alliance {alliance_id}")
-            # Cache the result
-            try:
-                redis_client.setex(cache_key, NAME_CACHE_TTL, name)
-            except redis.RedisError:
-                pass
-            return name
-    except Exception as e:
-        print(f"Error fetching alliance {alliance_id}: {e}")
-
-    return f"Alliance {alliance_id}"
+    return get_name_resolver().get_name('alliance', alliance_id)
 
 
 def get_corporation_name(corp_id: int) -> str:
     """
-    Get corporation name from ESI API with Redis caching.
+    Get corporation name via the shared name resolver.
 
     Args:
         corp_id: The corporation ID
@@ -78,45 +46,12 @@ def get_corporation_name(corp_id: int) -> str:
     Returns:
         Corporation name or fallback string
     """
-    if not corp_id:
-        return "Unknown"
-
-    cache_key = f"esi:corporation:{corp_id}:name"
-
-    # Try cache first
-    try:
-        cached = redis_client.get(cache_key)
-        if cached:
-            return cached
-    except redis.RedisError:
-        pass
-
-    # Fetch from ESI
-    try:
-        response = requests.get(
-            f"{ESI_BASE_URL}/corporations/{corp_id}/",
-            timeout=5,
-            headers={"Accept": "application/json"}
-        )
-        if response.status_code == 200:
-            data = response.json()
-            name = data.get("name", f"Corp {corp_id}")
-            # Cache the result
-            try:
-                redis_client.setex(cache_key, NAME_CACHE_TTL, name)
-            except redis.RedisError:
-                pass
-            return name
-    except Exception as e:
-        print(f"Error fetching corporation {corp_id}: {e}")
-
-    return f"Corp {corp_id}"
+    return get_name_resolver().get_name('corporation', corp_id)
 
 
 def batch_resolve_alliance_names(alliance_ids: List[int]) -> Dict[int, str]:
     """
-    Resolve multiple alliance names efficiently using parallel requests.
-    Uses cache where available, fetches missing from ESI concurrently.
+    Resolve multiple alliance names in one batched lookup.
 
     Args:
         alliance_ids: List of alliance IDs to resolve
@@ -124,35 +59,7 @@ def batch_resolve_alliance_names(alliance_ids: List[int]) -> Dict[int, str]:
     Returns:
         Dict mapping alliance_id to name
     """
-    result = {}
-    ids_to_fetch = []
-
-    # Check cache first
-    for aid in alliance_ids:
-        if not aid:
-            continue
-        cache_key = f"esi:alliance:{aid}:name"
-        try:
-            cached = redis_client.get(cache_key)
-            if cached:
-                result[aid] = cached
-            else:
-                ids_to_fetch.append(aid)
-        except redis.RedisError:
-            ids_to_fetch.append(aid)
-
-    # Fetch missing from ESI in parallel (max 10 concurrent requests)
-    if ids_to_fetch:
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_aid = {executor.submit(get_alliance_name, aid): aid for aid in ids_to_fetch}
-            for future in as_completed(future_to_aid):
-                aid = future_to_aid[future]
-                try:
-                    result[aid] = future.result()
-                except Exception:
-                    result[aid] = f"Alliance {aid}"
-
-    return result
+    return get_name_resolver().get_names('alliance', alliance_ids)
 
 
 def convert_decimals(obj: Any) -> Any:
@@ -208,76 +115,43 @@ def get_power_balance_metrics() -> Dict:
     cur = conn.cursor()
 
     # Get top alliances by activity with ISK destroyed vs lost
-    cur.execute("""
-        WITH alliance_kills AS (
-            -- ISK destroyed by alliance (as attacker)
-            SELECT
-                ka.alliance_id,
-                COUNT(DISTINCT k.killmail_id) as kills,
-                SUM(k.ship_value) as isk_destroyed
-            FROM killmail_attackers ka
-            JOIN killmails k ON ka.killmail_id = k.killmail_id
-            WHERE k.killmail_time >= NOW() - INTERVAL '24 hours'
-            AND ka.alliance_id IS NOT NULL
-            GROUP BY ka.alliance_id
-        ),
-        alliance_losses AS (
-            -- ISK lost by alliance (as victim)
-            SELECT
-                victim_alliance_id as alliance_id,
-                COUNT(*) as losses,
-                SUM(ship_value) as isk_lost
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '24 hours'
-            AND victim_alliance_id IS NOT NULL
-            GROUP BY victim_alliance_id
-        ),
-        previous_kills AS (
-            SELECT
-                ka.alliance_id,
-                COUNT(DISTINCT k.killmail_id) as kills,
-                SUM(k.ship_value) as isk_destroyed
-            FROM killmail_attackers ka
-            JOIN killmails k ON ka.killmail_id = k.killmail_id
-            WHERE k.killmail_time >= NOW() - INTERVAL '48 hours'
-            AND k.killmail_time < NOW() - INTERVAL '24 hours'
-            AND ka.alliance_id IS NOT NULL
-            GROUP BY ka.alliance_id
+    cur.execute(f"""
+        WITH current_period AS (
+            SELECT alliance_id,
+                   SUM(kills) as kills, SUM(isk_destroyed) as isk_destroyed,
+                   SUM(losses) as losses, SUM(isk_lost) as isk_lost
+            FROM combat_rollup_alliance_hourly
+            WHERE {CURRENT_24H}
+            GROUP BY alliance_id
         ),
-        previous_losses AS (
-            SELECT
-                victim_alliance_id as alliance_id,
-                COUNT(*) as losses,
-                SUM(ship_value) as isk_lost
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '48 hours'
-            AND killmail_time < NOW() - INTERVAL '24 hours'
-            AND victim_alliance_id IS NOT NULL
-            GROUP BY victim_alliance_id
+        previous_period AS (
+            SELECT alliance_id,
+                   SUM(kills) as kills, SUM(isk_destroyed) as isk_destroyed,
+                   SUM(losses) as losses, SUM(isk_lost) as isk_lost
+            FROM combat_rollup_alliance_hourly
+            WHERE {PREVIOUS_24H}
+            GROUP BY alliance_id
         )
         SELECT
-            COALESCE(ak.alliance_id, al.alliance_id) as alliance_id,
-            'Alliance ' || COALESCE(ak.alliance_id, al.alliance_id)::text as alliance_name,
-            COALESCE(ak.kills, 0) as kills_24h,
-            COALESCE(al.losses, 0) as losses_24h,
-            COALESCE(ak.isk_destroyed, 0) as isk_destroyed_24h,
-            COALESCE(al.isk_lost, 0) as isk_lost_24h,
-            COALESCE(pk.kills, 0) as kills_prev_24h,
-            COALESCE(pl.losses, 0) as losses_prev_24h,
-            COALESCE(pk.isk_destroyed, 0) as isk_destroyed_prev_24h,
-            COALESCE(pl.isk_lost, 0) as isk_lost_prev_24h,
+            c.alliance_id,
+            'Alliance ' || c.alliance_id::text as alliance_name,
+            c.kills as kills_24h,
+            c.losses as losses_24h,
+            c.isk_destroyed as isk_destroyed_24h,
+            c.isk_lost as isk_lost_24h,
+            COALESCE(p.kills, 0) as kills_prev_24h,
+            COALESCE(p.losses, 0) as losses_prev_24h,
+            COALESCE(p.isk_destroyed, 0) as isk_destroyed_prev_24h,
+            COALESCE(p.isk_lost, 0) as isk_lost_prev_24h,
             CASE
-                WHEN COALESCE(ak.isk_destroyed, 0) + COALESCE(al.isk_lost, 0) > 0
-                THEN ROUND(COALESCE(ak.isk_destroyed, 0)::numeric /
-                     (COALESCE(ak.isk_destroyed, 0) + COALESCE(al.isk_lost, 0)) * 100, 1)
+                WHEN c.isk_destroyed + c.isk_lost > 0
+                THEN ROUND(c.isk_destroyed::numeric / (c.isk_destroyed + c.isk_lost) * 100, 1)
                 ELSE 0
             END as efficiency_24h
-        FROM alliance_kills ak
-        FULL OUTER JOIN alliance_losses al ON ak.alliance_id = al.alliance_id
-        LEFT JOIN previous_kills pk ON COALESCE(ak.alliance_id, al.alliance_id) = pk.alliance_id
-        LEFT JOIN previous_losses pl ON COALESCE(ak.alliance_id, al.alliance_id) = pl.alliance_id
-        WHERE COALESCE(ak.kills, 0) + COALESCE(al.losses, 0) >= 10
-        ORDER BY COALESCE(ak.kills, 0) + COALESCE(al.losses, 0) DESC
+        FROM current_period c
+        LEFT JOIN previous_period p ON p.alliance_id = c.alliance_id
+        WHERE c.kills + c.losses >= 10
+        ORDER BY c.kills + c.losses DESC
         LIMIT 15
     """)
 
@@ -325,27 +199,24 @@ def get_territorial_metrics() -> Dict:
     cur = conn.cursor()
 
     # Top regions by activity
-    cur.execute("""
+    cur.execute(f"""
         WITH current_period AS (
             SELECT
                 region_id,
-                COUNT(*) as kills,
-                SUM(ship_value) as isk_destroyed,
-                COUNT(*) FILTER (WHERE is_capital) as capital_kills
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '24 hours'
-            AND region_id IS NOT NULL
+                SUM(kills) as kills,
+                SUM(isk_destroyed) as isk_destroyed,
+                SUM(capital_kills) as capital_kills
+            FROM combat_rollup_region_hourly
+            WHERE {CURRENT_24H}
             GROUP BY region_id
         ),
         previous_period AS (
             SELECT
                 region_id,
-                COUNT(*) as kills,
-                SUM(ship_value) as isk_destroyed
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '48 hours'
-            AND killmail_time < NOW() - INTERVAL '24 hours'
-            AND region_id IS NOT NULL
+                SUM(kills) as kills,
+                SUM(isk_destroyed) as isk_destroyed
+            FROM combat_rollup_region_hourly
+            WHERE {PREVIOUS_24H}
             GROUP BY region_id
         )
         SELECT
@@ -367,22 +238,19 @@ def get_territorial_metrics() -> Dict:
     regions = cur.fetchall()
 
     # Identify hotspot shifts
-    cur.execute("""
+    cur.execute(f"""
         WITH current_top AS (
-            SELECT region_id, COUNT(*) as kills,
-                   ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC) as rank_now
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '24 hours'
-            AND region_id IS NOT NULL
+            SELECT region_id, SUM(kills) as kills,
+                   ROW_NUMBER() OVER (ORDER BY SUM(kills) DESC) as rank_now
+            FROM combat_rollup_region_hourly
+            WHERE {CURRENT_24H}
             GROUP BY region_id
         ),
         previous_top AS (
-            SELECT region_id, COUNT(*) as kills,
-                   ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC) as rank_prev
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '48 hours'
-            AND killmail_time < NOW() - INTERVAL '24 hours'
-            AND region_id IS NOT NULL
+            SELECT region_id, SUM(kills) as kills,
+                   ROW_NUMBER() OVER (ORDER BY SUM(kills) DESC) as rank_prev
+            FROM combat_rollup_region_hourly
+            WHERE {PREVIOUS_24H}
             GROUP BY region_id
         )
         SELECT
@@ -419,26 +287,26 @@ def get_capital_fleet_metrics() -> Dict:
     cur = conn.cursor()
 
     # Capital losses by type (24h vs averages)
-    cur.execute("""
+    cur.execute(f"""
         WITH daily_capitals AS (
             SELECT
                 ship_category,
-                DATE(killmail_time) as kill_date,
-                COUNT(*) as count,
-                SUM(ship_value) as isk_value
-            FROM killmails
-            WHERE is_capital = true
-            AND killmail_time >= NOW() - INTERVAL '30 days'
-            GROUP BY ship_category, DATE(killmail_time)
+                DATE(hour) as kill_date,
+                SUM(capital_kills) as count,
+                SUM(capital_isk) as isk_value
+            FROM combat_rollup_ship_category_hourly
+            WHERE capital_kills > 0
+            AND {LAST_30D}
+            GROUP BY ship_category, DATE(hour)
         ),
         today_capitals AS (
             SELECT
                 ship_category,
-                COUNT(*) as count_24h,
-                SUM(ship_value) as isk_24h
-            FROM killmails
-            WHERE is_capital = true
-            AND killmail_time >= NOW() - INTERVAL '24 hours'
+                SUM(capital_kills) as count_24h,
+                SUM(capital_isk) as isk_24h
+            FROM combat_rollup_ship_category_hourly
+            WHERE capital_kills > 0
+            AND {CURRENT_24H}
             GROUP BY ship_category
         ),
         avg_7d AS (
@@ -472,28 +340,27 @@ def get_capital_fleet_metrics() -> Dict:
         FROM today_capitals t
         FULL OUTER JOIN avg_7d a7 ON t.ship_category = a7.ship_category
         FULL OUTER JOIN avg_30d a30 ON COALESCE(t.ship_category, a7.ship_category) = a30.ship_category
-        WHERE COALESCE(t.ship_category, a7.ship_category, a30.ship_category) IN
-              ('Titan', 'Supercarrier', 'Dreadnought', 'Carrier', 'Force Auxiliary')
+        WHERE lower(COALESCE(t.ship_category, a7.ship_category, a30.ship_category)) IN
+              ('titan', 'supercarrier', 'dreadnought', 'carrier', 'force_auxiliary')
         ORDER BY COALESCE(t.isk_24h, 0) DESC
     """)
 
     capital_stats = cur.fetchall()
 
     # Top alliances losing capitals
-    cur.execute("""
+    cur.execute(f"""
         SELECT
-            victim_alliance_id,
-            'Alliance ' || victim_alliance_id::text as alliance_name,
-            COUNT(*) as capital_losses,
-            SUM(ship_value) as isk_lost,
-            COUNT(*) FILTER (WHERE ship_category = 'Titan') as titans,
-            COUNT(*) FILTER (WHERE ship_category = 'Supercarrier') as supers,
-            COUNT(*) FILTER (WHERE ship_category = 'Dreadnought') as dreads
-        FROM killmails k
-        WHERE is_capital = true
-        AND killmail_time >= NOW() - INTERVAL '24 hours'
-        AND victim_alliance_id IS NOT NULL
-        GROUP BY victim_alliance_id
+            alliance_id as victim_alliance_id,
+            'Alliance ' || alliance_id::text as alliance_name,
+            SUM(capital_losses) as capital_losses,
+            SUM(capital_isk_lost) as isk_lost,
+            SUM(titan_losses) as titans,
+            SUM(super_losses) as supers,
+            SUM(dread_losses) as dreads
+        FROM combat_rollup_alliance_hourly
+        WHERE capital_losses > 0
+        AND {CURRENT_24H}
+        GROUP BY alliance_id
         ORDER BY isk_lost DESC
         LIMIT 10
     """)
@@ -530,29 +397,18 @@ def get_momentum_indicators() -> Dict:
     cur = conn.cursor()
 
     # Daily efficiency for top alliances over 7 days
-    cur.execute("""
+    cur.execute(f"""
         WITH daily_stats AS (
             SELECT
-                DATE(k.killmail_time) as kill_date,
-                ka.alliance_id,
-                COUNT(DISTINCT k.killmail_id) as kills,
-                SUM(k.ship_value) as isk_destroyed
-            FROM killmail_attackers ka
-            JOIN killmails k ON ka.killmail_id = k.killmail_id
-            WHERE k.killmail_time >= NOW() - INTERVAL '7 days'
-            AND ka.alliance_id IS NOT NULL
-            GROUP BY DATE(k.killmail_time), ka.alliance_id
-        ),
-        daily_losses AS (
-            SELECT
-                DATE(killmail_time) as kill_date,
-                victim_alliance_id as alliance_id,
-                COUNT(*) as losses,
-                SUM(ship_value) as isk_lost
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '7 days'
-            AND victim_alliance_id IS NOT NULL
-            GROUP BY DATE(killmail_time), victim_alliance_id
+                DATE(hour) as kill_date,
+                alliance_id,
+                SUM(kills) as kills,
+                SUM(isk_destroyed) as isk_destroyed,
+                SUM(losses) as losses,
+                SUM(isk_lost) as isk_lost
+            FROM combat_rollup_alliance_hourly
+            WHERE {LAST_7D}
+            GROUP BY DATE(hour), alliance_id
         ),
         active_alliances AS (
             SELECT alliance_id FROM daily_stats
@@ -563,19 +419,18 @@ def get_momentum_indicators() -> Dict:
             ds.alliance_id,
             'Alliance ' || ds.alliance_id::text as alliance_name,
             ds.kill_date,
-            COALESCE(ds.kills, 0) as kills,
-            COALESCE(dl.losses, 0) as losses,
-            COALESCE(ds.isk_destroyed, 0) as isk_destroyed,
-            COALESCE(dl.isk_lost, 0) as isk_lost,
+            ds.kills,
+            ds.losses,
+            ds.isk_destroyed,
+            ds.isk_lost,
             CASE
-                WHEN COALESCE(ds.isk_destroyed, 0) + COALESCE(dl.isk_lost, 0) > 0
-                THEN ROUND(COALESCE(ds.isk_destroyed, 0)::numeric /
-                     (COALESCE(ds.isk_destroyed, 0) + COALESCE(dl.isk_lost, 0)) * 100, 1)
+                WHEN ds.isk_destroyed + ds.isk_lost > 0
+                THEN ROUND(ds.isk_destroyed::numeric / (ds.isk_destroyed + ds.isk_lost) * 100, 1)
                 ELSE 0
             END as efficiency
         FROM daily_stats ds
         JOIN active_alliances aa ON ds.alliance_id = aa.alliance_id
-        LEFT JOIN daily_losses dl ON ds.alliance_id = dl.alliance_id AND ds.kill_date = dl.kill_date
+        WHERE ds.kills > 0
         ORDER BY ds.alliance_id, ds.kill_date
     """)
 
@@ -637,26 +492,25 @@ def get_chokepoint_control() -> Dict:
     cur = conn.cursor()
 
     # Systems with high industrial/hauler kills (gate camp indicators)
-    cur.execute("""
+    cur.execute(f"""
         WITH camp_systems AS (
             SELECT
                 solar_system_id,
-                COUNT(*) as total_kills,
-                COUNT(*) FILTER (WHERE ship_category IN ('Industrial', 'Hauler', 'Freighter')) as hauler_kills,
-                COUNT(*) FILTER (WHERE ship_category = 'Capsule') as pod_kills,
-                SUM(ship_value) as isk_destroyed
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '24 hours'
+                SUM(kills) as total_kills,
+                SUM(hauler_kills) as hauler_kills,
+                SUM(pod_kills) as pod_kills,
+                SUM(isk_destroyed) as isk_destroyed
+            FROM combat_rollup_system_hourly
+            WHERE {CURRENT_24H}
             GROUP BY solar_system_id
-            HAVING COUNT(*) FILTER (WHERE ship_category IN ('Industrial', 'Hauler', 'Freighter', 'Capsule')) >= 3
+            HAVING SUM(hauler_kills + pod_kills) >= 3
         ),
         previous_camps AS (
             SELECT
                 solar_system_id,
-                COUNT(*) FILTER (WHERE ship_category IN ('Industrial', 'Hauler', 'Freighter')) as hauler_kills_prev
-            FROM killmails
-            WHERE killmail_time >= NOW() - INTERVAL '48 hours'
-            AND killmail_time < NOW() - INTERVAL '24 hours'
+                SUM(hauler_kills) as hauler_kills_prev
+            FROM combat_rollup_system_hourly
+            WHERE {PREVIOUS_24H}
             GROUP BY solar_system_id
         )
         SELECT
@@ -697,23 +551,22 @@ def get_escalation_indicators() -> Dict:
     cur = conn.cursor()
 
     # Regions with supercap activity
-    cur.execute("""
+    cur.execute(f"""
         SELECT
             region_id,
             COALESCE(r."regionName", 'Unknown') as region_name,
-            COUNT(*) FILTER (WHERE ship_category = 'Titan') as titan_kills,
-            COUNT(*) FILTER (WHERE ship_category = 'Supercarrier') as super_kills,
-            COUNT(*) FILTER (WHERE ship_category IN ('Dreadnought', 'Carrier', 'Force Auxiliary')) as other_caps,
-            SUM(ship_value) as total_isk
-        FROM killmails k
+            SUM(titan_kills) as titan_kills,
+            SUM(super_kills) as super_kills,
+            SUM(other_capital_kills) as other_caps,
+            SUM(capital_isk) as total_isk
+        FROM combat_rollup_region_hourly k
         LEFT JOIN "mapRegions" r ON k.region_id = r."regionID"
-        WHERE killmail_time >= NOW() - INTERVAL '24 hours'
-        AND is_capital = true
-        AND region_id IS NOT NULL
+        WHERE {CURRENT_24H}
+        AND capital_kills > 0
         GROUP BY region_id, r."regionName"
-        HAVING COUNT(*) >= 3
-        ORDER BY COUNT(*) FILTER (WHERE ship_category IN ('Titan', 'Supercarrier')) DESC,
-                 COUNT(*) DESC
+        HAVING SUM(capital_kills) >= 3
+        ORDER BY SUM(titan_kills + super_kills) DESC,
+                 SUM(capital_kills) DESC
         LIMIT 10
     """)
 
@@ -814,26 +667,28 @@ def get_global_summary() -> Dict:
     conn = get_db_connection()
     cur = conn.cursor()
 
-    cur.execute("""
+    cur.execute(f"""
         SELECT
-            COUNT(*) as total_kills_24h,
-            SUM(ship_value) as total_isk_24h,
-            COUNT(*) FILTER (WHERE is_capital) as capital_kills_24h,
-            COUNT(DISTINCT region_id) as active_regions,
-            COUNT(DISTINCT victim_alliance_id) FILTER (WHERE victim_alliance_id IS NOT NULL) as alliances_involved
-        FROM killmails
-        WHERE killmail_time >= NOW() - INTERVAL '24 hours'
+            (SELECT SUM(kills) FROM combat_rollup_ship_category_hourly
+             WHERE {CURRENT_24H}) as total_kills_24h,
+            (SELECT SUM(isk_destroyed) FROM combat_rollup_ship_category_hourly
+             WHERE {CURRENT_24H}) as total_isk_24h,
+            (SELECT SUM(capital_kills) FROM combat_rollup_ship_category_hourly
+             WHERE {CURRENT_24H}) as capital_kills_24h,
+            (SELECT COUNT(DISTINCT region_id) FROM combat_rollup_region_hourly
+             WHERE {CURRENT_24H}) as active_regions,
+            (SELECT COUNT(DISTINCT alliance_id) FROM combat_rollup_alliance_hourly
+             WHERE {CURRENT_24H} AND losses > 0) as alliances_involved
     """)
 
     current = cur.fetchone()
 
-    cur.execute("""
+    cur.execute(f"""
         SELECT
-            COUNT(*) as total_kills_prev,
-            SUM(ship_value) as total_isk_prev
-        FROM killmails
-        WHERE killmail_time >= NOW() - INTERVAL '48 hours'
-        AND killmail_time < NOW() - INTERVAL '24 hours'
+            SUM(kills) as total_kills_prev,
+            SUM(isk_destroyed) as total_isk_prev
+        FROM combat_rollup_ship_category_hourly
+        WHERE {PREVIOUS_24H}
     """)
 
     previous = cur.fetchone()
@@ -0,0 +1,317 @@
+"""
+zKillboard Kill Pipeline - Staged, concurrent RedisQ processing
+
+Stages:
+1. Poll:  RedisQ long-poll, Redis dedupe claim, sequence number per kill
+2. ESI:   bounded-concurrency killmail fetch (prefetched payloads are reused);
+          results are released in poll order through a reorder buffer
+3. Store: DB/Redis lanes; all kills of one solar system go through the same
+          lane in poll order, so hotspot detection and battle assignment see
+          kills in the order zKillboard delivered them
+
+Backpressure: at most max_in_flight kills may be between poll and commit;
+the poll stage waits when the window is full.
+
+Lag metrics: kill time -> stored time and poll -> stored time.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from services.zkillboard.redisq_client import RedisQPackage
+
+
+ESI_CONCURRENCY = 10
+DB_WORKERS = 4
+MAX_IN_FLIGHT = 500
+LAG_SAMPLES = 1000            # Kills kept for lag percentiles
+STATS_INTERVAL = 10           # Seconds between stats publications
+PIPELINE_STATS_KEY = "zkill:pipeline:stats"
+PIPELINE_STATS_TTL = 300
+
+
+@dataclass
+class _Job:
+    seq: int
+    package: RedisQPackage
+    polled_at: float
+    killmail: Optional[Dict] = None
+    solar_system_id: Optional[int] = None
+
+
+def _kill_timestamp(killmail: Dict) -> Optional[float]:
+    """Unix timestamp of an ESI killmail_time ("2025-12-01T18:22:05Z")"""
+    value = killmail.get("killmail_time")
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _lag_summary(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"last": None, "avg": None, "p50": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    return {
+        "last": round(samples[-1], 2),
+        "avg": round(sum(ordered) / len(ordered), 2),
+        "p50": round(ordered[len(ordered) // 2], 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+class KillPipeline:
+    """Staged RedisQ -> ESI -> DB/Redis pipeline for ZKillboardLiveService"""
+
+    def __init__(
+        self,
+        live_service,
+        redisq_client,
+        esi_concurrency: int = ESI_CONCURRENCY,
+        db_workers: int = DB_WORKERS,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        verbose: bool = False
+    ):
+        """
+        Args:
+            live_service: ZKillboardLiveService doing the per-kill work
+            redisq_client: ZKillRedisQClient to poll
+            esi_concurrency: Concurrent ESI fetches
+            db_workers: Number of DB/Redis lanes
+            max_in_flight: Kills allowed between poll and commit
+            verbose: Print per-kill progress and periodic stats
+        """
+        self.live_service = live_service
+        self.redisq_client = redisq_client
+        self.esi_concurrency = esi_concurrency
+        self.db_workers = db_workers
+        self.max_in_flight = max_in_flight
+        self.verbose = verbose
+        self._running = False
+
+        self._window: Optional[asyncio.Semaphore] = None
+        self._fetch_queue: Optional[asyncio.Queue] = None
+        self._lanes: List[asyncio.Queue] = []
+        self._reorder: Dict[int, _Job] = {}
+        self._next_seq = 0
+        self._seq = 0
+        self._in_flight = 0
+        self._esi_active = 0
+
+        # Counters
+        self._counts: Dict[str, int] = {
+            "polled": 0,
+            "already_processed": 0,
+            "prefetched": 0,
+            "esi_fetched": 0,
+            "esi_failed": 0,
+            "parse_failed": 0,
+            "queued": 0,
+            "stored": 0,
+            "duplicates": 0,
+            "errors": 0,
+        }
+        self._kill_lag: Deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._pipeline_lag: Deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._started_at: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def run(self):
+        """Run all stages until stop(), then drain in-flight kills"""
+        self._running = True
+        self._started_at = time.time()
+        self._window = asyncio.Semaphore(self.max_in_flight)
+        self._fetch_queue = asyncio.Queue()
+        self._lanes = [asyncio.Queue() for _ in range(self.db_workers)]
+
+        workers = [asyncio.create_task(self._fetch_stage()) for _ in range(self.esi_concurrency)]
+        workers += [asyncio.create_task(self._store_stage(lane)) for lane in self._lanes]
+        reporter = asyncio.create_task(self._report_loop())
+
+        try:
+            await self._poll_stage()
+
+            # Stopped: let every polled kill pass through all stages
+            await self._fetch_queue.join()
+            for lane in self._lanes:
+                await lane.join()
+        finally:
+            for task in workers + [reporter]:
+                task.cancel()
+            await asyncio.gather(*workers, reporter, return_exceptions=True)
+            await self.live_service.drain()
+            self._publish_stats()
+
+    def stop(self):
+        """Stop polling; kills already polled are still processed"""
+        self._running = False
+        self.redisq_client.stop()
+
+    @property
+    def running(self) -> bool:
+        """True from run() until stop(), while new kills are still polled"""
+        return self._running
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _poll_stage(self):
+        while self._running:
+            try:
+                response = await self.redisq_client.poll_with_retry()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"[Pipeline] Poll error: {e}")
+                await asyncio.sleep(5)
+                continue
+
+            package = response.package if response.has_data else None
+            if not package or not package.killmail_id or not package.hash:
+                continue
+
+            self._counts["polled"] += 1
+            if not self.live_service.claim_kill(package.killmail_id):
+                self._counts["already_processed"] += 1
+                continue
+
+            # Backpressure: wait for a free slot before accepting more kills
+            await self._window.acquire()
+            self._in_flight += 1
+            self._fetch_queue.put_nowait(_Job(self._seq, package, time.time()))
+            self._seq += 1
+
+    async def _fetch_stage(self):
+        while True:
+            job = await self._fetch_queue.get()
+            try:
+                if job.package.killmail:
+                    self._counts["prefetched"] += 1
+                    job.killmail = job.package.killmail
+                else:
+                    self._esi_active += 1
+                    try:
+                        job.killmail = await self.live_service.fetch_killmail_from_esi(
+                            job.package.killmail_id, job.package.hash
+                        )
+                    finally:
+                        self._esi_active -= 1
+                    self._counts["esi_fetched" if job.killmail else "esi_failed"] += 1
+            except Exception as e:
+                self._counts["errors"] += 1
+                print(f"[Pipeline] ESI stage failed for killmail {job.package.killmail_id}: {e}")
+            finally:
+                self._release_in_order(job)
+                self._fetch_queue.task_done()
+
+    def _release_in_order(self, job: _Job):
+        """Hand fetched kills to their lane strictly in poll order"""
+        self._reorder[job.seq] = job
+        while self._next_seq in self._reorder:
+            ready = self._reorder.pop(self._next_seq)
+            self._next_seq += 1
+
+            if not ready.killmail:
+                self._finish()
+                continue
+            ready.solar_system_id = ready.killmail.get("solar_system_id") or 0
+            self._lanes[ready.solar_system_id % len(self._lanes)].put_nowait(ready)
+
+    async def _store_stage(self, lane: asyncio.Queue):
+        while True:
+            job = await lane.get()
+            stored = None
+            failed = False
+            try:
+                if self.verbose:
+                    print(f"[Pipeline] Processing killmail {job.package.killmail_id} "
+                          f"(system {job.solar_system_id})")
+                zkb = {"hash": job.package.hash, **job.package.zkb}
+                stored = await self.live_service.process_fetched_kill(job.killmail, zkb)
+            except Exception as e:
+                failed = True
+                self._counts["errors"] += 1
+                print(f"[ERROR] Failed to process killmail {job.package.killmail_id}: {e}")
+            finally:
+                if stored is None:
+                    if not failed:
+                        self._counts["parse_failed"] += 1
+                    self._finish()
+                else:
+                    self._counts["queued"] += 1
+                    stored.add_done_callback(lambda f, job=job: self._on_stored(job, f))
+                lane.task_done()
+
+    def _on_stored(self, job: _Job, future: asyncio.Future):
+        """Record lag once the kill's batch is committed, then free its slot"""
+        if future.cancelled() or future.exception() is not None:
+            # Write failed; the writer already logged the error
+            self._counts["errors"] += 1
+        elif future.result() is None:
+            self._counts["duplicates"] += 1
+        else:
+            self._counts["stored"] += 1
+            now = time.time()
+            self._pipeline_lag.append(now - job.polled_at)
+            killed_at = _kill_timestamp(job.killmail)
+            if killed_at:
+                self._kill_lag.append(now - killed_at)
+        self._finish()
+
+    def _finish(self):
+        self._in_flight -= 1
+        self._window.release()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Stage queue depths, counters and lag percentiles (seconds)"""
+        return {
+            "running": self._running,
+            "uptime_seconds": round(time.time() - self._started_at) if self._started_at else 0,
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "backpressure": self._in_flight >= self.max_in_flight,
+            "fetch_queue": self._fetch_queue.qsize() if self._fetch_queue else 0,
+            "esi_active": self._esi_active,
+            "reorder_buffer": len(self._reorder),
+            "lanes": [lane.qsize() for lane in self._lanes],
+            "writer_queue": self.live_service.kill_writer.queue_depth,
+            **self._counts,
+            "kill_to_stored_lag": _lag_summary(self._kill_lag),
+            "poll_to_stored_lag": _lag_summary(self._pipeline_lag),
+        }
+
+    def _publish_stats(self):
+        try:
+            self.live_service.redis_client.setex(
+                PIPELINE_STATS_KEY, PIPELINE_STATS_TTL, json.dumps(self.stats())
+            )
+        except Exception as e:
+            print(f"[Pipeline] Failed to publish stats: {e}")
+
+    async def _report_loop(self):
+        last_print = time.time()
+        while True:
+            await asyncio.sleep(STATS_INTERVAL)
+            self._publish_stats()
+            if self.verbose and time.time() - last_print >= 60:
+                last_print = time.time()
+                stats = self.stats()
+                lag = stats["kill_to_stored_lag"]
+                print(f"[Pipeline] stored={stats['stored']} in_flight={stats['in_flight']} "
+                      f"lanes={stats['lanes']} lag p50={lag['p50']}s p95={lag['p95']}s")
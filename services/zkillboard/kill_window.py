@@ -0,0 +1,475 @@
+"""
+Kill Window - Sliding 24h aggregates for the live combat reports
+
+Every stored live kill is folded into the Redis bucket of its arrival hour
+(the same clock as the kill:*:timeline keys). A bucket holds counters and
+sorted sets instead of killmails:
+
+- totals / timeline:        kills and ISK, per killmail hour (UTC)
+- system_* / type_*:        kills and ISK per system and ship type
+- region_*:                 per region kills, ISK, systems, ship types and
+                            destroyed item quantities (24h battle report)
+- haulers:                  industrial / freighter losses per system
+- capitals / capital_kills: capital totals per category and the kills
+- top_kills:                the TOP_KILLS_PER_BUCKET most expensive kills
+
+Buckets expire once they leave the window, so the window slides without a
+cleanup job. snapshot() merges the WINDOW_HOURS newest buckets in one
+pipeline round trip; the size of a snapshot depends on the number of
+distinct systems and ship types, not on the number of kills.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+
+import redis
+
+from src.services.sde import get_sde_lookup, ship_class_for_group
+
+if TYPE_CHECKING:
+    from services.zkillboard.live_service import LiveKillmail
+
+
+KEY_PREFIX = "killwin"
+WINDOW_HOURS = 24
+BUCKET_SECONDS = 3600
+BUCKET_TTL = (WINDOW_HOURS + 1) * BUCKET_SECONDS  # Counted from the end of the bucket
+TOP_KILLS_PER_BUCKET = 20
+
+HASH_PARTS = ("totals", "timeline", "haulers", "capitals")
+ZSET_PARTS = (
+    "system_kills", "system_isk", "system_ships",
+    "type_kills", "type_isk",
+    "region_kills", "region_isk", "region_systems", "region_types", "region_items",
+    "capital_kills", "top_kills",
+)
+
+# Report keys of the capital categories (see ship_classes.SHIP_GROUP_CLASSES)
+CAPITAL_CATEGORIES = {
+    'titan': 'titans',
+    'supercarrier': 'supercarriers',
+    'carrier': 'carriers',
+    'dreadnought': 'dreadnoughts',
+    'force_auxiliary': 'force_auxiliaries',
+}
+
+INDUSTRIAL_CATEGORIES = frozenset({
+    'freighter', 'industrial', 'exhumer', 'mining_barge',
+    'industrial_command', 'capital_industrial',
+})
+
+
+def bucket_of(timestamp: float) -> int:
+    """Bucket number (hours since epoch) of a unix timestamp"""
+    return int(timestamp) // BUCKET_SECONDS
+
+
+def killmail_hour(killmail_time: str) -> Optional[int]:
+    """UTC hour of an ISO 8601 killmail time, None if unparsable"""
+    try:
+        return datetime.fromisoformat(killmail_time.replace('Z', '+00:00')).hour
+    except (AttributeError, ValueError):
+        return None
+
+
+def _pair(member: str) -> tuple:
+    """'<a>:<b>' sorted set member -> (int a, int b)"""
+    a, b = member.split(":", 1)
+    return int(a), int(b)
+
+
+@dataclass
+class WindowSnapshot:
+    """Merged aggregates of all buckets in the window"""
+    total_kills: int = 0
+    total_isk: float = 0.0
+    timeline: Dict[int, List[float]] = field(default_factory=dict)            # hour_utc -> [kills, isk]
+    system_kills: Dict[int, int] = field(default_factory=dict)
+    system_isk: Dict[int, float] = field(default_factory=dict)
+    system_ships: Dict[int, Dict[int, int]] = field(default_factory=dict)     # system -> ship type -> kills
+    type_kills: Dict[int, int] = field(default_factory=dict)
+    type_isk: Dict[int, float] = field(default_factory=dict)
+    region_kills: Dict[int, int] = field(default_factory=dict)
+    region_isk: Dict[int, float] = field(default_factory=dict)
+    region_systems: Dict[int, Dict[int, int]] = field(default_factory=dict)
+    region_types: Dict[int, Dict[int, int]] = field(default_factory=dict)
+    region_items: Dict[int, Dict[int, int]] = field(default_factory=dict)
+    haulers: Dict[int, Dict[str, float]] = field(default_factory=dict)        # system -> industrials/freighters/isk
+    capital_totals: Dict[str, List[float]] = field(default_factory=dict)      # category -> [count, isk]
+    capital_kills: List[Dict] = field(default_factory=list)
+    top_kills: List[Dict] = field(default_factory=list)
+    buckets: int = 0
+
+    # --------------------------------------------------------------
+    # Merging
+    # --------------------------------------------------------------
+
+    def add_bucket(self, hashes: Dict[str, Dict[str, str]], zsets: Dict[str, List]) -> None:
+        """Fold one bucket (HGETALL / ZRANGE WITHSCORES results by part) into the snapshot"""
+        totals = hashes.get("totals") or {}
+        if not totals:
+            return
+        self.buckets += 1
+        self.total_kills += int(totals.get("kills", 0))
+        self.total_isk += float(totals.get("isk", 0))
+
+        for name, value in (hashes.get("timeline") or {}).items():
+            hour, metric = name.split(":")
+            entry = self.timeline.setdefault(int(hour), [0, 0.0])
+            entry[0 if metric == "kills" else 1] += float(value)
+
+        for name, value in (hashes.get("haulers") or {}).items():
+            system_id, metric = name.split(":")
+            entry = self.haulers.setdefault(int(system_id), {'industrials': 0, 'freighters': 0, 'isk': 0.0})
+            entry[metric] += float(value)
+
+        for name, value in (hashes.get("capitals") or {}).items():
+            category, metric = name.split(":")
+            entry = self.capital_totals.setdefault(category, [0, 0.0])
+            entry[0 if metric == "count" else 1] += float(value)
+
+        for target, part in ((self.system_kills, "system_kills"), (self.system_isk, "system_isk"),
+                             (self.type_kills, "type_kills"), (self.type_isk, "type_isk"),
+                             (self.region_kills, "region_kills"), (self.region_isk, "region_isk")):
+            for member, score in zsets.get(part) or []:
+                key = int(member)
+                target[key] = target.get(key, 0) + score
+
+        for target, part in ((self.system_ships, "system_ships"), (self.region_systems, "region_systems"),
+                             (self.region_types, "region_types"), (self.region_items, "region_items")):
+            for member, score in zsets.get(part) or []:
+                outer, inner = _pair(member)
+                counts = target.setdefault(outer, {})
+                counts[inner] = counts.get(inner, 0) + int(score)
+
+        self.capital_kills.extend(json.loads(member) for member, _ in zsets.get("capital_kills") or [])
+        self.top_kills.extend(json.loads(member) for member, _ in zsets.get("top_kills") or [])
+
+    # --------------------------------------------------------------
+    # Report sections
+    # --------------------------------------------------------------
+
+    def hot_zone_ids(self, limit: int = 15) -> List[int]:
+        """Systems with the most kills"""
+        return sorted(self.system_kills, key=self.system_kills.get, reverse=True)[:limit]
+
+    def report_system_ids(self, hot_zone_limit: int = 15) -> Set[int]:
+        """Systems whose location info the pilot intelligence report needs"""
+        ids = set(self.hot_zone_ids(hot_zone_limit)) | set(self.haulers)
+        ids.update(kill['solar_system_id'] for kill in self.capital_kills + self.top_kills)
+        return ids
+
+    def timeline_section(self) -> List[Dict]:
+        """Kills and ISK per hour of day (UTC)"""
+        return [
+            {
+                'hour_utc': hour,
+                'kills': int(self.timeline.get(hour, (0, 0))[0]),
+                'isk_destroyed': self.timeline.get(hour, (0, 0.0))[1],
+            }
+            for hour in range(24)
+        ]
+
+    def hot_zones(self, system_cache: Dict[int, Dict], limit: int = 15) -> List[Dict]:
+        """Most active systems with their dominant ship type"""
+        sde = get_sde_lookup()
+        hot_zones = []
+        for system_id in self.hot_zone_ids(limit):
+            system_info = system_cache.get(system_id, {})
+            kills = int(self.system_kills[system_id])
+            total_isk = self.system_isk.get(system_id, 0.0)
+
+            ships = self.system_ships.get(system_id)
+            dominant = max(ships, key=ships.get) if ships else None
+
+            flags = []
+            if kills >= 20:
+                flags.append('high_activity')
+            if total_isk > 10_000_000_000:  # 10B
+                flags.append('high_value')
+
+            hot_zones.append({
+                'system_id': system_id,
+                'system_name': system_info.get('system_name', 'Unknown'),
+                'region_name': system_info.get('region_name', 'Unknown'),
+                'constellation_name': system_info.get('constellation_name', 'Unknown'),
+                'security_status': system_info.get('security_status', 0.0),
+                'kills': kills,
+                'total_isk_destroyed': total_isk,
+                'flags': flags,
+                'dominant_ship_type': sde.type_name(dominant, 'Unknown') if dominant else 'Unknown',
+            })
+        return hot_zones
+
+    def capital_section(self, system_cache: Dict[int, Dict]) -> Dict:
+        """Capital kills per category, most expensive first"""
+        sde = get_sde_lookup()
+        capitals = {key: {'count': 0, 'total_isk': 0, 'kills': []} for key in CAPITAL_CATEGORIES.values()}
+
+        for category, (count, isk) in self.capital_totals.items():
+            key = CAPITAL_CATEGORIES.get(category)
+            if key:
+                capitals[key]['count'] = int(count)
+                capitals[key]['total_isk'] = isk
+
+        for kill in self.capital_kills:
+            key = CAPITAL_CATEGORIES.get(kill['category'])
+            if not key:
+                continue
+            system_info = system_cache.get(kill['solar_system_id'], {})
+            capitals[key]['kills'].append({
+                'killmail_id': kill['killmail_id'],
+                'ship_name': sde.type_name(kill['ship_type_id'], 'Unknown'),
+                'victim': kill['victim_character_id'] or 0,
+                'isk_destroyed': kill['ship_value'],
+                'system_name': system_info.get('system_name', 'Unknown'),
+                'region_name': system_info.get('region_name', 'Unknown'),
+                'security_status': system_info.get('security_status', 0.0),
+                'time_utc': kill['killmail_time'],
+            })
+
+        for cat_data in capitals.values():
+            cat_data['kills'].sort(key=lambda x: x['isk_destroyed'], reverse=True)
+        return capitals
+
+    def high_value_kills(self, system_cache: Dict[int, Dict], ship_category: Callable[[int], str],
+                         limit: int = 20) -> List[Dict]:
+        """Most expensive kills of the window (exact: every bucket keeps its own top kills)"""
+        sde = get_sde_lookup()
+        top = sorted(self.top_kills, key=lambda k: k['ship_value'], reverse=True)[:limit]
+
+        high_value = []
+        for rank, kill in enumerate(top, 1):
+            system_id = kill['solar_system_id']
+            system_info = system_cache.get(system_id, {})
+            security = system_info.get('security_status', 0.0)
+            group_id = sde.type_group(kill['ship_type_id'])
+
+            high_value.append({
+                'killmail_id': kill['killmail_id'],
+                'isk_destroyed': kill['ship_value'],
+                'ship_type': ship_category(group_id) if group_id else 'unknown',
+                'ship_name': sde.type_name(kill['ship_type_id'], 'Unknown'),
+                'victim': kill['victim_character_id'] or 0,
+                'system_id': system_id,
+                'system_name': system_info.get('system_name', 'Unknown'),
+                'region_name': system_info.get('region_name', 'Unknown'),
+                'security_status': security,
+                # Gank detection: high-value kill in HighSec
+                'is_gank': security >= 0.5 and kill['ship_value'] > 1_000_000_000,
+                'time_utc': kill['killmail_time'],
+                'rank': rank,
+            })
+        return high_value
+
+    def danger_zones(self, system_cache: Dict[int, Dict], min_kills: int = 3) -> List[Dict]:
+        """Systems where industrials / freighters are dying"""
+        danger_zones = []
+        for system_id, counts in self.haulers.items():
+            industrials, freighters = int(counts['industrials']), int(counts['freighters'])
+            total_kills = industrials + freighters
+            if total_kills < min_kills:
+                continue
+
+            total_value = counts['isk']
+            if total_kills >= 20 or total_value > 50_000_000_000:
+                warning_level = 'EXTREME'
+            elif total_kills >= 10 or total_value > 20_000_000_000:
+                warning_level = 'HIGH'
+            else:
+                warning_level = 'MODERATE'
+
+            system_info = system_cache.get(system_id, {})
+            danger_zones.append({
+                'system_name': system_info.get('system_name', 'Unknown'),
+                'region_name': system_info.get('region_name', 'Unknown'),
+                'security_status': system_info.get('security_status', 0.0),
+                'industrials_killed': industrials,
+                'freighters_killed': freighters,
+                'total_value': total_value,
+                'warning_level': warning_level,
+            })
+
+        danger_zones.sort(key=lambda x: x['total_value'], reverse=True)
+        return danger_zones
+
+    def ship_breakdown(self, ship_category: Callable[[int], str]) -> Dict:
+        """Kills and ISK per ship category, most ISK first"""
+        sde = get_sde_lookup()
+        breakdown: Dict[str, Dict] = {}
+        for type_id, kills in self.type_kills.items():
+            group_id = sde.type_group(type_id)
+            category = ship_category(group_id) if group_id else 'other'
+            entry = breakdown.setdefault(category, {'count': 0, 'total_isk': 0})
+            entry['count'] += int(kills)
+            entry['total_isk'] += self.type_isk.get(type_id, 0.0)
+
+        return dict(sorted(breakdown.items(), key=lambda x: x[1]['total_isk'], reverse=True))
+
+    def region_summary(self) -> List[Dict]:
+        """Kills and ISK per region, most kills first"""
+        sde = get_sde_lookup()
+        regions = []
+        for region_id in sorted(self.region_kills, key=self.region_kills.get, reverse=True):
+            entry = {
+                'region_id': region_id,
+                'kills': int(self.region_kills[region_id]),
+                'total_isk_destroyed': self.region_isk.get(region_id, 0.0),
+            }
+            region_name = sde.region_name(region_id)
+            if region_name is not None:
+                entry['region_name'] = region_name
+            regions.append(entry)
+        return regions
+
+    def battle_regions(self) -> List[Dict]:
+        """Regional stats of the 24h battle report, most kills first"""
+        sde = get_sde_lookup()
+
+        def top(counts: Optional[Dict[int, int]], n: int) -> List:
+            return sorted((counts or {}).items(), key=lambda x: x[1], reverse=True)[:n]
+
+        regional_stats = []
+        for region in self.region_summary():
+            region_id = region['region_id']
+            kill_count = region['kills']
+            total_isk = region['total_isk_destroyed']
+
+            regional_stats.append({
+                "region_id": region_id,
+                "region_name": region.get('region_name', f"Region {region_id}"),
+                "kills": kill_count,
+                "total_isk_destroyed": total_isk,
+                "avg_kill_value": total_isk / kill_count if kill_count > 0 else 0,
+                "top_systems": [
+                    {
+                        "system_id": system_id,
+                        "system_name": sde.system_name(system_id, f"System {system_id}"),
+                        "kills": count
+                    }
+                    for system_id, count in top(self.region_systems.get(region_id), 3)
+                ],
+                "top_ships": [
+                    {
+                        "ship_type_id": ship_id,
+                        "ship_name": sde.type_name(ship_id, f"Ship {ship_id}"),
+                        "losses": count
+                    }
+                    for ship_id, count in top(self.region_types.get(region_id), 3)
+                ],
+                "top_destroyed_items": [
+                    {
+                        "item_type_id": item_id,
+                        "item_name": sde.type_name(item_id, f"Item {item_id}"),
+                        "quantity_destroyed": quantity
+                    }
+                    for item_id, quantity in top(self.region_items.get(region_id), 5)
+                ],
+            })
+        return regional_stats
+
+
+class KillWindow:
+    """Redis-backed hourly buckets of live kill aggregates"""
+
+    def __init__(self, redis_client: redis.Redis, window_hours: int = WINDOW_HOURS):
+        self.redis_client = redis_client
+        self.window_hours = window_hours
+
+    @staticmethod
+    def _key(bucket: int, part: str) -> str:
+        return f"{KEY_PREFIX}:{bucket}:{part}"
+
+    def record(self, kill: 'LiveKillmail', timestamp: Optional[float] = None):
+        """
+        Fold a stored kill into the bucket of its arrival hour
+
+        Must be called once per kill (after the duplicate check): the
+        counters are not idempotent.
+        """
+        bucket = bucket_of(timestamp if timestamp is not None else time.time())
+        key = lambda part: self._key(bucket, part)
+
+        sde = get_sde_lookup()
+        group_id = sde.type_group(kill.ship_type_id)
+        category = ship_class_for_group(group_id)[0] if group_id is not None else None
+        value = float(kill.ship_value or 0)
+        system_id, region_id, type_id = kill.solar_system_id, kill.region_id, kill.ship_type_id
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hincrby(key("totals"), "kills", 1)
+        pipe.hincrbyfloat(key("totals"), "isk", value)
+
+        hour = killmail_hour(kill.killmail_time)
+        if hour is not None:
+            pipe.hincrby(key("timeline"), f"{hour}:kills", 1)
+            pipe.hincrbyfloat(key("timeline"), f"{hour}:isk", value)
+
+        pipe.zincrby(key("system_kills"), 1, system_id)
+        pipe.zincrby(key("system_isk"), value, system_id)
+        pipe.zincrby(key("system_ships"), 1, f"{system_id}:{type_id}")
+        pipe.zincrby(key("type_kills"), 1, type_id)
+        pipe.zincrby(key("type_isk"), value, type_id)
+
+        if region_id:
+            pipe.zincrby(key("region_kills"), 1, region_id)
+            pipe.zincrby(key("region_isk"), value, region_id)
+            pipe.zincrby(key("region_systems"), 1, f"{region_id}:{system_id}")
+            pipe.zincrby(key("region_types"), 1, f"{region_id}:{type_id}")
+            for item in kill.destroyed_items:
+                pipe.zincrby(key("region_items"), item['quantity'], f"{region_id}:{item['item_type_id']}")
+
+        if category in INDUSTRIAL_CATEGORIES:
+            kind = "freighters" if category == 'freighter' else "industrials"
+            pipe.hincrby(key("haulers"), f"{system_id}:{kind}", 1)
+            pipe.hincrbyfloat(key("haulers"), f"{system_id}:isk", value)
+
+        detail = json.dumps({
+            'killmail_id': kill.killmail_id,
+            'killmail_time': kill.killmail_time,
+            'solar_system_id': system_id,
+            'ship_type_id': type_id,
+            'ship_value': value,
+            'victim_character_id': kill.victim_character_id,
+            'category': category,
+        }, sort_keys=True)
+
+        if category in CAPITAL_CATEGORIES:
+            pipe.hincrby(key("capitals"), f"{category}:count", 1)
+            pipe.hincrbyfloat(key("capitals"), f"{category}:isk", value)
+            pipe.zadd(key("capital_kills"), {detail: value})
+
+        pipe.zadd(key("top_kills"), {detail: value})
+        pipe.zremrangebyrank(key("top_kills"), 0, -(TOP_KILLS_PER_BUCKET + 1))
+
+        expire_at = (bucket + 1) * BUCKET_SECONDS + BUCKET_TTL
+        for part in HASH_PARTS + ZSET_PARTS:
+            pipe.expireat(key(part), expire_at)
+        pipe.execute()
+
+    def window_buckets(self, now: Optional[float] = None) -> List[int]:
+        """Buckets of the current window, oldest first (current hour included)"""
+        current = bucket_of(now if now is not None else time.time())
+        return list(range(current - self.window_hours + 1, current + 1))
+
+    def snapshot(self, now: Optional[float] = None) -> WindowSnapshot:
+        """Merge all buckets of the window (one pipeline round trip)"""
+        buckets = self.window_buckets(now)
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for bucket in buckets:
+            for part in HASH_PARTS:
+                pipe.hgetall(self._key(bucket, part))
+            for part in ZSET_PARTS:
+                pipe.zrange(self._key(bucket, part), 0, -1, withscores=True)
+        results = iter(pipe.execute())
+
+        snapshot = WindowSnapshot()
+        for _ in buckets:
+            hashes = {part: next(results) for part in HASH_PARTS}
+            zsets = {part: next(results) for part in ZSET_PARTS}
+            snapshot.add_bucket(hashes, zsets)
+        return snapshot
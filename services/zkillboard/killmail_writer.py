@@ -0,0 +1,321 @@
+"""
+Killmail Batch Writer - Write-behind persistence for live killmails
+
+Accumulates prepared killmails for up to KILL_BATCH_WAIT_MS or
+KILL_BATCH_SIZE kills and writes killmails, items and attackers with
+multi-row inserts in ONE transaction per batch.
+
+Guarantees kept from the single-kill path:
+- Battle assignment stays atomic: every killmail row carries its own
+  active-battle subquery inside the same INSERT statement
+- Duplicates are detected by ON CONFLICT (killmail_id) DO NOTHING; kills
+  not returned by RETURNING resolve to None
+- A kill that can't be written at all fails its future with the database
+  error, so it is never mistaken for a duplicate
+- Battle stats are refreshed once per touched battle, inside the batch
+  transaction
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from psycopg2.extras import execute_values
+
+from src.database import get_db_connection
+
+
+KILL_BATCH_SIZE = 50        # Flush when this many kills are queued
+KILL_BATCH_WAIT_MS = 250    # ...or when the oldest queued kill is this old
+
+KILLMAIL_COLUMNS = (
+    "killmail_id", "killmail_time", "solar_system_id", "region_id",
+    "ship_type_id", "ship_value", "ship_class", "ship_category", "ship_role",
+    "victim_character_id", "victim_corporation_id", "victim_alliance_id",
+    "attacker_count",
+    "final_blow_character_id", "final_blow_corporation_id", "final_blow_alliance_id",
+    "is_solo", "is_npc", "is_capital",
+    "zkb_points", "zkb_npc", "zkb_awox",
+)
+
+INSERT_KILLMAILS_SQL = f"""
+    INSERT INTO killmails ({", ".join(KILLMAIL_COLUMNS)}, processed_at, battle_id)
+    VALUES %s
+    ON CONFLICT (killmail_id) DO NOTHING
+    RETURNING killmail_id, battle_id
+"""
+
+# Per-row template: the active battle lookup is part of each row so the
+# kill-battle association still happens in the INSERT itself
+KILLMAIL_TEMPLATE = "(" + ", ".join(["%s"] * len(KILLMAIL_COLUMNS)) + """,
+    CURRENT_TIMESTAMP,
+    (SELECT battle_id FROM battles
+     WHERE solar_system_id = %s
+       AND status = 'active'
+       AND last_kill_at > NOW() - INTERVAL '30 minutes'
+     ORDER BY battle_id DESC
+     LIMIT 1))"""
+
+INSERT_ITEMS_SQL = """
+    INSERT INTO killmail_items (killmail_id, item_type_id, quantity, was_destroyed)
+    VALUES %s
+"""
+
+INSERT_ATTACKERS_SQL = """
+    INSERT INTO killmail_attackers (
+        killmail_id, character_id, corporation_id, alliance_id,
+        ship_type_id, weapon_type_id, damage_done, is_final_blow
+    ) VALUES %s
+"""
+
+
+class KillmailRecord(NamedTuple):
+    """Killmail prepared for storage (values in KILLMAIL_COLUMNS order)"""
+    killmail_id: int
+    solar_system_id: int
+    values: Tuple
+    items: List[Tuple]       # (item_type_id, quantity, was_destroyed)
+    attackers: List[Tuple]   # (character_id, corporation_id, alliance_id, ship_type_id, weapon_type_id, damage_done, is_final_blow)
+
+
+@dataclass
+class _Pending:
+    record: KillmailRecord
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+def write_killmails(records: Sequence[KillmailRecord]) -> List[Optional[int]]:
+    """
+    Store killmails, items and attackers in one transaction
+
+    Args:
+        records: Prepared killmails
+
+    Returns:
+        Per record: battle_id if stored and part of a battle, 0 if stored
+        without battle, None if duplicate (in the DB or earlier in the batch)
+    """
+    if not records:
+        return []
+
+    unique: Dict[int, KillmailRecord] = {}
+    for record in records:
+        unique.setdefault(record.killmail_id, record)
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            inserted = execute_values(
+                cur, INSERT_KILLMAILS_SQL,
+                [r.values + (r.solar_system_id,) for r in unique.values()],
+                template=KILLMAIL_TEMPLATE,
+                page_size=len(unique),
+                fetch=True
+            )
+            battles = {killmail_id: battle_id for killmail_id, battle_id in inserted}
+
+            stored = [r for r in unique.values() if r.killmail_id in battles]
+            item_rows = [(r.killmail_id,) + item for r in stored for item in r.items]
+            attacker_rows = [(r.killmail_id,) + attacker for r in stored for attacker in r.attackers]
+            if item_rows:
+                execute_values(cur, INSERT_ITEMS_SQL, item_rows, page_size=1000)
+            if attacker_rows:
+                execute_values(cur, INSERT_ATTACKERS_SQL, attacker_rows, page_size=1000)
+
+            # Refresh each touched battle once from the computed view
+            battle_ids = sorted({b for b in battles.values() if b})
+            if battle_ids:
+                cur.execute("""
+                    UPDATE battles SET last_kill_at = CURRENT_TIMESTAMP
+                    WHERE battle_id = ANY(%s)
+                """, (battle_ids,))
+                for battle_id in battle_ids:
+                    cur.execute("SELECT refresh_battle_stats(%s)", (battle_id,))
+
+        conn.commit()
+
+    results: List[Optional[int]] = []
+    seen = set()
+    for record in records:
+        if record.killmail_id in seen or record.killmail_id not in battles:
+            results.append(None)
+        else:
+            results.append(battles[record.killmail_id] or 0)
+        seen.add(record.killmail_id)
+    return results
+
+
+class KillmailBatchWriter:
+    """
+    Write-behind batcher for live killmails
+
+    submit() queues a record and returns a future that resolves to the
+    store result once its batch is written. Batches are written one at a
+    time, in submission order, off the event loop.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = KILL_BATCH_SIZE,
+        max_wait_ms: int = KILL_BATCH_WAIT_MS,
+        on_flush: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Args:
+            max_batch: Flush when this many kills are queued
+            max_wait_ms: Flush when the oldest queued kill is this old
+            on_flush: Called with stats() after every flush (e.g. to publish metrics)
+        """
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.on_flush = on_flush
+        self._pending: List[_Pending] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._in_flight = 0
+
+        # Metrics
+        self._batches = 0
+        self._stored = 0
+        self._duplicates = 0
+        self._errors = 0
+        self._last_batch_size = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+        self._last_wait_ms = 0.0
+
+    def submit(self, record: KillmailRecord) -> asyncio.Future:
+        """
+        Queue a killmail for the next batch
+
+        Must be called from the event loop.
+
+        Returns:
+            Future resolving to battle_id / 0 / None (see write_killmails),
+            or failing with the database error if the kill couldn't be written
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_Pending(record, future))
+
+        if len(self._pending) >= self.max_batch:
+            loop.create_task(self.flush())
+        elif self._timer is None or self._timer.done():
+            self._timer = loop.create_task(self._flush_later())
+        return future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_wait)
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write the next batch of queued kills
+
+        Returns:
+            Number of kills in the written batch
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            if self._pending and (self._timer is None or self._timer.done()):
+                self._timer = asyncio.get_running_loop().create_task(self._flush_later())
+            if not batch:
+                return 0
+
+            self._in_flight = len(batch)
+            started = time.monotonic()
+            self._last_wait_ms = (started - batch[0].queued_at) * 1000
+            try:
+                results = await asyncio.to_thread(self._write, [p.record for p in batch])
+            finally:
+                self._in_flight = 0
+
+            elapsed_ms = (time.monotonic() - started) * 1000
+            self._batches += 1
+            self._last_batch_size = len(batch)
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+
+            for pending, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    # Already counted under errors by _write()
+                    if not pending.future.done():
+                        pending.future.set_exception(result)
+                    continue
+                if result is None:
+                    self._duplicates += 1
+                else:
+                    self._stored += 1
+                if not pending.future.done():
+                    pending.future.set_result(result)
+
+        if self.on_flush:
+            try:
+                self.on_flush(self.stats())
+            except Exception as e:
+                print(f"[KillWriter] Failed to publish stats: {e}")
+        return len(batch)
+
+    def _write(self, records: List[KillmailRecord]) -> List[Union[Optional[int], Exception]]:
+        """
+        Write a batch; on failure retry kill by kill so one bad kill can't drop the batch
+
+        Returns:
+            write_killmails() results, with the exception in place of each
+            kill that could not be written
+        """
+        try:
+            return write_killmails(records)
+        except Exception as e:
+            if len(records) == 1:
+                self._errors += 1
+                print(f"Error storing killmail {records[0].killmail_id} to PostgreSQL: {e}")
+                return [e]
+            print(f"[KillWriter] Batch of {len(records)} failed, retrying individually: {e}")
+
+        results: List[Union[Optional[int], Exception]] = []
+        for record in records:
+            try:
+                results.extend(write_killmails([record]))
+            except Exception as e:
+                self._errors += 1
+                print(f"Error storing killmail {record.killmail_id} to PostgreSQL: {e}")
+                results.append(e)
+        return results
+
+    async def close(self) -> None:
+        """Flush all queued kills (call on shutdown)"""
+        while self._pending:
+            await self.flush()
+        if self._timer and not self._timer.done():
+            await self._timer
+
+    @property
+    def queue_depth(self) -> int:
+        """Kills waiting to be written (queued + currently being written)"""
+        return len(self._pending) + self._in_flight
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput and flush latency metrics"""
+        oldest = self._pending[0].queued_at if self._pending else None
+        return {
+            "queue_depth": self.queue_depth,
+            "oldest_queued_ms": round((time.monotonic() - oldest) * 1000, 1) if oldest else 0.0,
+            "batches": self._batches,
+            "kills_stored": self._stored,
+            "duplicates": self._duplicates,
+            "errors": self._errors,
+            "last_batch_size": self._last_batch_size,
+            "last_wait_ms": round(self._last_wait_ms, 1),
+            "last_flush_ms": round(self._last_flush_ms, 1),
+            "avg_flush_ms": round(self._total_flush_ms / self._batches, 1) if self._batches else 0.0,
+            "max_flush_ms": round(self._max_flush_ms, 1),
+            "max_batch": self.max_batch,
+            "max_wait_ms": round(self.max_wait * 1000),
+        }
@@ -9,6 +9,7 @@ from typing import Dict, List, Optional, TYPE_CHECKING
 import aiohttp
 
 from src.database import get_db_connection
+from src.services.sde import get_sde_lookup
 from .models import (
     LiveKillmail,
     ZKILL_API_URL, ZKILL_USER_AGENT, ZKILL_REQUEST_TIMEOUT,
@@ -114,9 +115,10 @@ class KillmailProcessorMixin:
             is_solo = attacker_count == 1
             is_npc = zkb.get("npc", False)
 
-            # Extract attacker corps and alliances
+            # Extract attacker corps, alliances and ships
             attacker_corporations = []
             attacker_alliances = []
+            attacker_ship_types = []
             for attacker in attackers:
                 corp_id = attacker.get("corporation_id")
                 if corp_id:
@@ -124,6 +126,9 @@ class KillmailProcessorMixin:
                 alliance_id = attacker.get("alliance_id")
                 if alliance_id:
                     attacker_alliances.append(alliance_id)
+                ship_id = attacker.get("ship_type_id")
+                if ship_id:
+                    attacker_ship_types.append(ship_id)
 
             # Item segregation: destroyed vs dropped
             items = victim.get("items", [])
@@ -163,7 +168,8 @@ class KillmailProcessorMixin:
                 destroyed_items=destroyed_items,
                 dropped_items=dropped_items,
                 attacker_corporations=attacker_corporations,
-                attacker_alliances=attacker_alliances
+                attacker_alliances=attacker_alliances,
+                attacker_ship_types=attacker_ship_types
             )
 
         except Exception as e:
@@ -358,29 +364,15 @@ class KillmailProcessorMixin:
             return None
 
     def _get_system_name(self, system_id: int) -> str:
-        """Get system name from DB"""
+        """Get system name from the SDE lookup"""
         try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT solarSystemName FROM mapSolarSystems WHERE solarSystemID = %s",
-                        (system_id,)
-                    )
-                    result = cur.fetchone()
-                    return result[0] if result else f"System {system_id}"
+            return get_sde_lookup().system_name(system_id, f"System {system_id}")
         except Exception:
             return f"System {system_id}"
 
     def _get_ship_name(self, type_id: int) -> str:
-        """Get ship name from DB"""
+        """Get ship name from the SDE lookup"""
         try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT typeName FROM invTypes WHERE typeID = %s",
-                        (type_id,)
-                    )
-                    result = cur.fetchone()
-                    return result[0] if result else f"Ship {type_id}"
+            return get_sde_lookup().type_name(type_id, f"Ship {type_id}")
         except Exception:
             return f"Ship {type_id}"
@@ -4,7 +4,7 @@ Live Service Models and Constants.
 Provides data structures and configuration for real-time killmail processing.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
@@ -49,3 +49,4 @@ class LiveKillmail:
     dropped_items: List[Dict]    # Items that dropped (no market demand)
     attacker_corporations: List[int]  # Corp IDs of attackers
     attacker_alliances: List[int]     # Alliance IDs of attackers
+    attacker_ship_types: List[int] = field(default_factory=list)  # Ship type IDs of attackers
@@ -86,6 +86,12 @@ class RedisCacheMixin:
             self.redis_client.incrby(key_item_demand, item['quantity'])
             self.redis_client.expire(key_item_demand, REDIS_TTL)
 
+        # 6. Fold into the sliding 24h report aggregates
+        self.kill_window.record(kill, timestamp)
+
+        # 7. Per-system danger summary (danger map, gate-camp detection)
+        self.system_danger.record(kill, timestamp)
+
         # Cache kill in state manager for fast retrieval
         self.state_manager.cache_kill(kill.killmail_id, asdict(kill))
 
@@ -8,9 +8,9 @@ import json
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
-import aiohttp
-
 from src.database import get_db_connection
+from src.services.sde import get_sde_lookup
+from src.services.names import get_name_resolver
 
 
 class StatisticsMixin:
@@ -27,42 +27,19 @@ class StatisticsMixin:
         Returns:
             List of {ship_type_id, ship_name, value} dicts
         """
-        # Get recent kills from Redis
-        kill_ids = self.redis_client.zrevrange(
-            f"kill:system:{system_id}:timeline",
-            0,
-            50
-        )
-
-        kills = []
-        for kill_id in kill_ids[:20]:  # Check last 20
-            kill_data = self.redis_client.get(f"kill:id:{kill_id}")
-            if kill_data:
-                kill = json.loads(kill_data)
-                kills.append(kill)
-
-        # Sort by value
-        kills_sorted = sorted(kills, key=lambda x: x['ship_value'], reverse=True)[:limit]
-
-        # Get ship names from DB
-        result = []
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                for kill in kills_sorted:
-                    cur.execute(
-                        'SELECT "typeName" FROM "invTypes" WHERE "typeID" = %s',
-                        (kill['ship_type_id'],)
-                    )
-                    row = cur.fetchone()
-                    ship_name = row[0] if row else f"Ship {kill['ship_type_id']}"
-
-                    result.append({
-                        'ship_type_id': kill['ship_type_id'],
-                        'ship_name': ship_name,
-                        'value': kill['ship_value']
-                    })
-
-        return result
+        # Most expensive of the system's recent kills (one Redis round trip)
+        kills_sorted = self.system_danger.read([system_id])[system_id].top_kills(limit)
+
+        # Get ship names from the SDE lookup
+        sde = get_sde_lookup()
+        return [
+            {
+                'ship_type_id': kill['ship_type_id'],
+                'ship_name': sde.type_name(kill['ship_type_id'], f"Ship {kill['ship_type_id']}"),
+                'value': kill['ship_value']
+            }
+            for kill in kills_sorted
+        ]
 
     def calculate_danger_level(self, security: float, kill_count: int, kill_rate: float, isk_destroyed: float) -> Tuple[str, int]:
         """
@@ -140,18 +117,9 @@ class StatisticsMixin:
         Returns:
             Tuple of (is_camp, confidence, indicators)
         """
-        # Get recent kills
-        kill_ids = self.redis_client.zrevrange(
-            f"kill:system:{system_id}:timeline",
-            0,
-            50
-        )
-
-        kills = []
-        for kill_id in kill_ids[:20]:
-            kill_data = self.redis_client.get(f"kill:id:{kill_id}")
-            if kill_data:
-                kills.append(json.loads(kill_data))
+        # Recent kills of the system (one Redis round trip)
+        danger = self.system_danger.read([system_id])[system_id]
+        kills = danger.recent
 
         if len(kills) < 3:
             return False, 0.0, []
@@ -169,21 +137,13 @@ class StatisticsMixin:
             score += 0.5
             indicators.append("Small gang")
 
-        # Indicator 2: Ship Types (check for Interdictors)
+        # Indicator 2: Attacker Ship Types (check for Interdictors)
         ship_types = {}
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                for kill in kills:
-                    cur.execute(
-                        'SELECT g."groupName" FROM "invTypes" t '
-                        'JOIN "invGroups" g ON t."groupID" = g."groupID" '
-                        'WHERE t."typeID" = %s',
-                        (kill['ship_type_id'],)
-                    )
-                    row = cur.fetchone()
-                    if row:
-                        group = row[0]
-                        ship_types[group] = ship_types.get(group, 0) + 1
+        sde = get_sde_lookup()
+        for group_id, kill_count in danger.attacker_group_kills().items():
+            group = sde.group_name(group_id)
+            if group:
+                ship_types[group] = kill_count
 
         interdictors = ship_types.get("Interdictor", 0)
         if interdictors >= 2:
@@ -214,7 +174,7 @@ class StatisticsMixin:
                 score += 0.5
 
         # Indicator 4: Victim Diversity
-        unique_corps = len(set(k['victim_corporation_id'] for k in kills if k['victim_corporation_id']))
+        unique_corps = danger.unique_victim_corps
         if unique_corps >= 8:
             score += 1
             indicators.append("Diverse victims (random traffic)")
@@ -382,51 +342,29 @@ class StatisticsMixin:
             top_victim_corps = sorted(victim_corps.items(), key=lambda x: x[1], reverse=True)[:limit]
             top_victim_alliances = sorted(victim_alliances.items(), key=lambda x: x[1], reverse=True)[:limit]
 
-        # Fetch names from ESI
-        session = await self._get_session()
-
-        async def get_corp_name(corp_id: int) -> str:
-            try:
-                url = f"https://esi.evetech.net/latest/corporations/{corp_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("name", f"Corp {corp_id}")
-            except:
-                pass
-            return f"Corp {corp_id}"
-
-        async def get_alliance_name(alliance_id: int) -> str:
-            try:
-                url = f"https://esi.evetech.net/latest/alliances/{alliance_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("name", f"Alliance {alliance_id}")
-            except:
-                pass
-            return f"Alliance {alliance_id}"
-
-        # Fetch all names concurrently
-        attacker_corps_with_names = []
-        for corp_id, count in top_attacker_corps:
-            name = await get_corp_name(corp_id)
-            attacker_corps_with_names.append({"id": corp_id, "name": name, "kills": count})
-
-        attacker_alliances_with_names = []
-        for alliance_id, count in top_attacker_alliances:
-            name = await get_alliance_name(alliance_id)
-            attacker_alliances_with_names.append({"id": alliance_id, "name": name, "kills": count})
-
-        victim_corps_with_names = []
-        for corp_id, count in top_victim_corps:
-            name = await get_corp_name(corp_id)
-            victim_corps_with_names.append({"id": corp_id, "name": name, "kills": count})
+        # Resolve all names in one batch per category
+        resolver = get_name_resolver()
+        corp_names = await resolver.aget_names('corporation', [c for c, _ in top_attacker_corps + top_victim_corps])
+        alliance_names = await resolver.aget_names(
+            'alliance', [a for a, _ in top_attacker_alliances + top_victim_alliances]
+        )
 
-        victim_alliances_with_names = []
-        for alliance_id, count in top_victim_alliances:
-            name = await get_alliance_name(alliance_id)
-            victim_alliances_with_names.append({"id": alliance_id, "name": name, "kills": count})
+        attacker_corps_with_names = [
+            {"id": corp_id, "name": corp_names.get(corp_id, f"Corporation {corp_id}"), "kills": count}
+            for corp_id, count in top_attacker_corps
+        ]
+        attacker_alliances_with_names = [
+            {"id": alliance_id, "name": alliance_names.get(alliance_id, f"Alliance {alliance_id}"), "kills": count}
+            for alliance_id, count in top_attacker_alliances
+        ]
+        victim_corps_with_names = [
+            {"id": corp_id, "name": corp_names.get(corp_id, f"Corporation {corp_id}"), "kills": count}
+            for corp_id, count in top_victim_corps
+        ]
+        victim_alliances_with_names = [
+            {"id": alliance_id, "name": alliance_names.get(alliance_id, f"Alliance {alliance_id}"), "kills": count}
+            for alliance_id, count in top_victim_alliances
+        ]
 
         return {
             "attackers": {
@@ -452,21 +390,12 @@ class StatisticsMixin:
         kill_count = hotspot['kill_count']
         window_minutes = hotspot['window_seconds'] // 60
 
-        # Get system info from DB
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    'SELECT ms."solarSystemName", mr."regionName", ms.security '
-                    'FROM "mapSolarSystems" ms '
-                    'JOIN "mapRegions" mr ON ms."regionID" = mr."regionID" '
-                    'WHERE ms."solarSystemID" = %s',
-                    (system_id,)
-                )
-                result = cur.fetchone()
-                if not result:
-                    return None
-
-                system_name, region_name, security = result
+        # Get system info from the SDE lookup
+        system = get_sde_lookup().system_info(system_id)
+        if not system:
+            return None
+
+        system_name, region_name, security = system['name'], system['region_name'], system['security']
 
         # Get top 5 expensive ships
         top_ships = self.get_top_expensive_ships(system_id, limit=5)
@@ -8,6 +8,7 @@ import asyncio
 from typing import Dict, Optional, TYPE_CHECKING
 
 from src.database import get_db_connection
+from src.services.sde import get_sde_lookup
 from src.telegram_service import telegram_service
 from .ship_classifier import safe_int_value
 
@@ -121,25 +122,13 @@ class TelegramAlertsMixin:
                 return
 
             # Get system info
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT
-                            ms."solarSystemName",
-                            mr."regionName",
-                            ms.security,
-                            it."typeName"
-                        FROM "mapSolarSystems" ms
-                        JOIN "mapRegions" mr ON mr."regionID" = ms."regionID"
-                        LEFT JOIN "invTypes" it ON it."typeID" = %s
-                        WHERE ms."solarSystemID" = %s
-                    """, (kill.ship_type_id, kill.solar_system_id))
-
-                    row = cur.fetchone()
-                    if not row:
-                        return
+            sde = get_sde_lookup()
+            system = sde.system_info(kill.solar_system_id)
+            if not system:
+                return
 
-                    system_name, region_name, security, ship_type_name = row
+            system_name, region_name, security = system['name'], system['region_name'], system['security']
+            ship_type_name = sde.type_name(kill.ship_type_id)
 
             isk_b = ship_value / 1_000_000_000
 
@@ -209,18 +198,11 @@ class TelegramAlertsMixin:
                     # Successfully claimed milestone - now send alert
 
                     # Get system info
-                    cur.execute("""
-                        SELECT ms."solarSystemName", mr."regionName", ms.security
-                        FROM "mapSolarSystems" ms
-                        JOIN "mapRegions" mr ON mr."regionID" = ms."regionID"
-                        WHERE ms."solarSystemID" = %s
-                    """, (system_id,))
-
-                    sys_row = cur.fetchone()
-                    if not sys_row:
+                    system = get_sde_lookup().system_info(system_id)
+                    if not system:
                         return
 
-                    system_name, region_name, security = sys_row
+                    system_name, region_name, security = system['name'], system['region_name'], system['security']
 
                     # Get involved parties
                     involved = await self.get_involved_parties(system_id, limit=3)
@@ -20,12 +20,17 @@ from typing import Dict, List, Optional, Tuple
 from collections import defaultdict, deque
 import aiohttp
 import redis
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 from src.database import get_db_connection
+from src.services.sde import get_sde_lookup
+from src.services.names import get_name_resolver
 from config import DISCORD_WEBHOOK_URL, WAR_DISCORD_ENABLED
 from src.telegram_service import telegram_service
 from services.zkillboard.state_manager import RedisStateManager, HotspotInfo
+from services.zkillboard.killmail_writer import KillmailBatchWriter, KillmailRecord, write_killmails
+from services.zkillboard.kill_window import KillWindow
+from services.zkillboard.system_danger import SystemDangerTracker
 
 
 # Redis Configuration
@@ -49,6 +54,11 @@ HOTSPOT_WINDOW_SECONDS = 300  # 5 minutes
 HOTSPOT_THRESHOLD_KILLS = 5   # 5+ kills in 5min = hotspot
 HOTSPOT_ALERT_COOLDOWN = 600  # 10 minutes between alerts for same system
 
+# Published by the listener process so the API can report writer metrics
+KILL_WRITER_STATS_KEY = "zkill:kill_writer:stats"
+KILL_WRITER_STATS_TTL = 300
+PIPELINE_STATS_KEY = "zkill:pipeline:stats"  # Written by kill_pipeline.KillPipeline
+
 
 @dataclass
 class LiveKillmail:
@@ -69,6 +79,7 @@ class LiveKillmail:
     dropped_items: List[Dict]    # Items that dropped (no market demand)
     attacker_corporations: List[int]  # Corp IDs of attackers
     attacker_alliances: List[int]     # Alliance IDs of attackers
+    attacker_ship_types: List[int] = field(default_factory=list)  # Ship type IDs of attackers
 
 
 def safe_int_value(value) -> int:
@@ -99,7 +110,8 @@ def classify_ship(ship_type_id: int) -> Tuple[Optional[str], Optional[str]]:
     """
     Classify ship by type ID using EVE SDE groupID.
 
-    Returns official EVE ship classification with category and role.
+    Returns official EVE ship classification with category and role
+    (see src.services.sde.ship_classes), resolved from the in-memory SDE lookup.
 
     Args:
         ship_type_id: EVE ship type ID
@@ -121,129 +133,7 @@ def classify_ship(ship_type_id: int) -> Tuple[Optional[str], Optional[str]]:
         light, heavy, support, structure_light, structure_support, structure_heavy
     """
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    'SELECT "groupID" FROM "invTypes" WHERE "typeID" = %s',
-                    (ship_type_id,)
-                )
-                result = cur.fetchone()
-                if not result:
-                    return (None, None)
-
-                group_id = result[0]
-
-                # Official EVE ship classification mapping
-                # Based on invGroups table from EVE SDE
-
-                # Corvettes & Shuttles
-                if group_id == 237: return ('corvette', 'standard')
-                if group_id == 2001: return ('corvette', 'citizen')
-                if group_id == 31: return ('shuttle', 'standard')
-                if group_id == 29: return ('capsule', 'standard')
-
-                # Frigates
-                if group_id == 25: return ('frigate', 'standard')
-                if group_id == 324: return ('frigate', 'assault')
-                if group_id == 831: return ('frigate', 'interceptor')
-                if group_id == 830: return ('frigate', 'covert_ops')
-                if group_id == 834: return ('frigate', 'stealth_bomber')
-                if group_id == 893: return ('frigate', 'electronic_attack')
-                if group_id == 1527: return ('frigate', 'logistics')
-                if group_id == 1283: return ('frigate', 'expedition')
-                if group_id == 1022: return ('frigate', 'prototype')
-
-                # Destroyers
-                if group_id == 420: return ('destroyer', 'standard')
-                if group_id == 541: return ('destroyer', 'interdictor')
-                if group_id == 1534: return ('destroyer', 'command')
-                if group_id == 1305: return ('destroyer', 'tactical')
-
-                # Cruisers
-                if group_id == 26: return ('cruiser', 'standard')
-                if group_id == 358: return ('cruiser', 'heavy_assault')
-                if group_id in (906, 833): return ('cruiser', 'recon')
-                if group_id == 832: return ('cruiser', 'logistics')
-                if group_id == 894: return ('cruiser', 'heavy_interdictor')
-                if group_id == 963: return ('cruiser', 'strategic')
-                if group_id == 1972: return ('cruiser', 'flag')
-
-                # Battlecruisers
-                if group_id == 419: return ('battlecruiser', 'standard')
-                if group_id == 1201: return ('battlecruiser', 'attack')
-                if group_id == 540: return ('battlecruiser', 'command')
-
-                # Battleships
-                if group_id == 27: return ('battleship', 'standard')
-                if group_id == 900: return ('battleship', 'marauder')
-                if group_id == 898: return ('battleship', 'black_ops')
-                if group_id == 381: return ('battleship', 'elite')
-
-                # Capitals
-                if group_id == 485: return ('dreadnought', 'standard')
-                if group_id == 4594: return ('dreadnought', 'lancer')
-                if group_id == 547: return ('carrier', 'standard')
-                if group_id == 1538: return ('force_auxiliary', 'standard')
-                if group_id == 659: return ('supercarrier', 'standard')
-                if group_id == 30: return ('titan', 'standard')
-
-                # Mining
-                if group_id == 463: return ('mining_barge', 'standard')
-                if group_id == 543: return ('exhumer', 'standard')
-
-                # Industrials
-                if group_id == 28: return ('industrial', 'standard')
-                if group_id == 1202: return ('industrial', 'blockade_runner')
-                if group_id == 380: return ('industrial', 'deep_space_transport')
-
-                # Freighters
-                if group_id == 513: return ('freighter', 'standard')
-                if group_id == 902: return ('freighter', 'jump')
-
-                # Industrial Command & Capital Industrial
-                if group_id == 941: return ('industrial_command', 'standard')
-                if group_id == 883: return ('capital_industrial', 'standard')
-
-                # Fighters (Carrier drones)
-                if group_id == 1652: return ('fighter', 'light')
-                if group_id == 1653: return ('fighter', 'heavy')
-                if group_id == 1537: return ('fighter', 'support')
-                if group_id == 4777: return ('fighter', 'structure_light')
-                if group_id == 4778: return ('fighter', 'structure_support')
-                if group_id == 4779: return ('fighter', 'structure_heavy')
-
-                # Deployables (Mobile structures)
-                if group_id == 361: return ('deployable', 'warp_disruptor')
-                if group_id == 1246: return ('deployable', 'depot')
-                if group_id == 1250: return ('deployable', 'tractor_unit')
-                if group_id == 1276: return ('deployable', 'micro_jump')
-                if group_id == 4093: return ('deployable', 'cyno_beacon')
-                if group_id == 4107: return ('deployable', 'observatory')
-                if group_id == 4137: return ('deployable', 'analysis_beacon')
-                if group_id == 4810: return ('deployable', 'mercenary_den')
-
-                # Starbase (POS structures)
-                if group_id == 365: return ('starbase', 'control_tower')
-                if group_id == 363: return ('starbase', 'ship_maintenance')
-                if group_id == 471: return ('starbase', 'hangar_array')
-                if group_id in (430, 449): return ('starbase', 'sentry')
-                if group_id == 441: return ('starbase', 'web_battery')
-                if group_id == 443: return ('starbase', 'scram_battery')
-
-                # Orbitals (Customs Offices, Skyhooks)
-                if group_id == 1025: return ('orbital', 'customs_office')
-                if group_id == 4736: return ('orbital', 'skyhook')
-
-                # Upwell Structures (Citadels, Refineries, etc.)
-                if group_id == 1657: return ('citadel', 'standard')
-                if group_id == 1406: return ('refinery', 'standard')
-                if group_id == 1408: return ('structure', 'jump_bridge')
-                if group_id == 4744: return ('structure', 'moon_drill')
-                if group_id == 1924: return ('structure', 'stronghold')
-
-                # Unknown/Other
-                return ('other', 'other')
-
+        return get_sde_lookup().ship_class(ship_type_id)
     except Exception as e:
         print(f"Warning: Failed to classify ship {ship_type_id}: {e}")
         return (None, None)
@@ -265,10 +155,20 @@ class ZKillboardLiveService:
         # Redis-based state management (survives restarts!)
         self.state_manager = RedisStateManager()
 
+        # Sliding 24h aggregates for the pilot intelligence / battle reports
+        self.kill_window = KillWindow(self.redis_client)
+
+        # Per-system danger summaries for the danger map and gate-camp detection
+        self.system_danger = SystemDangerTracker(self.redis_client)
+
         # System -> Region mapping cache
         self.system_region_map: Dict[int, int] = {}
         self._load_system_region_map()
 
+        # Write-behind batching of PostgreSQL kill storage
+        self.kill_writer = KillmailBatchWriter(on_flush=self._publish_writer_stats)
+        self._post_store_tasks: set = set()
+
     def _load_system_region_map(self):
         """Load solar_system_id -> region_id mapping from DB"""
         with get_db_connection() as conn:
@@ -378,9 +278,10 @@ class ZKillboardLiveService:
             is_solo = attacker_count == 1
             is_npc = zkb.get("npc", False)
 
-            # Extract attacker corps and alliances
+            # Extract attacker corps, alliances and ships
             attacker_corporations = []
             attacker_alliances = []
+            attacker_ship_types = []
             for attacker in attackers:
                 corp_id = attacker.get("corporation_id")
                 if corp_id:
@@ -388,6 +289,9 @@ class ZKillboardLiveService:
                 alliance_id = attacker.get("alliance_id")
                 if alliance_id:
                     attacker_alliances.append(alliance_id)
+                ship_id = attacker.get("ship_type_id")
+                if ship_id:
+                    attacker_ship_types.append(ship_id)
 
             # Item segregation: destroyed vs dropped
             items = victim.get("items", [])
@@ -427,17 +331,95 @@ class ZKillboardLiveService:
                 destroyed_items=destroyed_items,
                 dropped_items=dropped_items,
                 attacker_corporations=attacker_corporations,
-                attacker_alliances=attacker_alliances
+                attacker_alliances=attacker_alliances,
+                attacker_ship_types=attacker_ship_types
             )
 
         except Exception as e:
             print(f"Error parsing killmail: {e}")
             return None
 
+    def build_killmail_record(self, kill: LiveKillmail, zkb_data: Dict, esi_killmail: Dict) -> KillmailRecord:
+        """
+        Prepare a killmail, its items and attackers for storage.
+
+        Args:
+            kill: Parsed killmail data
+            zkb_data: zkillboard metadata (points, npc, awox flags)
+            esi_killmail: Full ESI killmail data (for attacker details)
+
+        Returns:
+            KillmailRecord for write_killmails / KillmailBatchWriter
+        """
+        # Classify ship type (official EVE classification) and capital flag
+        ship_category, ship_role = classify_ship(kill.ship_type_id)
+        is_capital = self._is_capital_ship(kill.ship_type_id)
+
+        # Legacy ship_class for backward compatibility
+        ship_class = ship_category if ship_category else None
+
+        # Find final blow attacker
+        final_blow_char_id = None
+        final_blow_corp_id = None
+        final_blow_alliance_id = None
+        attackers = esi_killmail.get("attackers", [])
+        for attacker in attackers:
+            if attacker.get("final_blow", False):
+                final_blow_char_id = attacker.get("character_id")
+                final_blow_corp_id = attacker.get("corporation_id")
+                final_blow_alliance_id = attacker.get("alliance_id")
+                break
+
+        values = (
+            kill.killmail_id,
+            kill.killmail_time,
+            kill.solar_system_id,
+            kill.region_id,
+            kill.ship_type_id,
+            safe_int_value(kill.ship_value),
+            ship_class,
+            ship_category,
+            ship_role,
+            kill.victim_character_id,
+            kill.victim_corporation_id,
+            kill.victim_alliance_id,
+            kill.attacker_count,
+            final_blow_char_id,
+            final_blow_corp_id,
+            final_blow_alliance_id,
+            kill.is_solo,
+            kill.is_npc,
+            is_capital,
+            zkb_data.get("points"),
+            zkb_data.get("npc", False),
+            zkb_data.get("awox", False),
+        )
+
+        items = [(item['item_type_id'], item['quantity'], True) for item in kill.destroyed_items]
+        items += [(item['item_type_id'], item['quantity'], False) for item in kill.dropped_items]
+
+        attacker_rows = [
+            (
+                attacker.get("character_id"),
+                attacker.get("corporation_id"),
+                attacker.get("alliance_id"),
+                attacker.get("ship_type_id"),
+                attacker.get("weapon_type_id"),
+                attacker.get("damage_done", 0),
+                attacker.get("final_blow", False)
+            )
+            for attacker in attackers
+        ]
+
+        return KillmailRecord(kill.killmail_id, kill.solar_system_id, values, items, attacker_rows)
+
     def store_persistent_kill(self, kill: LiveKillmail, zkb_data: Dict, esi_killmail: Dict) -> Optional[int]:
         """
         Store killmail permanently in PostgreSQL with atomic battle assignment.
 
+        Single-kill path; the live pipeline queues kills on self.kill_writer,
+        which writes the same statements for many kills per transaction.
+
         CRITICAL: This method atomically:
         1. Inserts the killmail with battle_id assignment in ONE query
         2. Returns battle_id if kill was associated with a battle
@@ -458,192 +440,34 @@ class ZKillboardLiveService:
             None if kill was a duplicate (already exists)
         """
         try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    # Determine if victim ship is a capital
-                    is_capital = self._is_capital_ship(kill.ship_type_id)
-
-                    # Classify ship type (official EVE classification)
-                    ship_category, ship_role = classify_ship(kill.ship_type_id)
-
-                    # Legacy ship_class for backward compatibility
-                    ship_class = ship_category if ship_category else None
-
-                    # Find final blow attacker
-                    final_blow_char_id = None
-                    final_blow_corp_id = None
-                    final_blow_alliance_id = None
-                    attackers = esi_killmail.get("attackers", [])
-                    for attacker in attackers:
-                        if attacker.get("final_blow", False):
-                            final_blow_char_id = attacker.get("character_id")
-                            final_blow_corp_id = attacker.get("corporation_id")
-                            final_blow_alliance_id = attacker.get("alliance_id")
-                            break
-
-                    # ATOMIC INSERT with battle assignment
-                    # The subquery finds an active battle in the same system
-                    # This ensures the kill-battle association happens in ONE query
-                    cur.execute("""
-                        INSERT INTO killmails (
-                            killmail_id, killmail_time, solar_system_id, region_id,
-                            ship_type_id, ship_value, ship_class, ship_category, ship_role,
-                            victim_character_id, victim_corporation_id, victim_alliance_id,
-                            attacker_count,
-                            final_blow_character_id, final_blow_corporation_id, final_blow_alliance_id,
-                            is_solo, is_npc, is_capital,
-                            zkb_points, zkb_npc, zkb_awox,
-                            processed_at,
-                            battle_id
-                        ) VALUES (
-                            %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s,
-                            %s, %s, %s,
-                            %s,
-                            %s, %s, %s,
-                            %s, %s, %s,
-                            %s, %s, %s,
-                            CURRENT_TIMESTAMP,
-                            (SELECT battle_id FROM battles
-                             WHERE solar_system_id = %s
-                               AND status = 'active'
-                               AND last_kill_at > NOW() - INTERVAL '30 minutes'
-                             ORDER BY battle_id DESC
-                             LIMIT 1)
-                        )
-                        ON CONFLICT (killmail_id) DO NOTHING
-                        RETURNING killmail_id, battle_id
-                    """, (
-                        kill.killmail_id,
-                        kill.killmail_time,
-                        kill.solar_system_id,
-                        kill.region_id,
-                        kill.ship_type_id,
-                        safe_int_value(kill.ship_value),
-                        ship_class,
-                        ship_category,
-                        ship_role,
-                        kill.victim_character_id,
-                        kill.victim_corporation_id,
-                        kill.victim_alliance_id,
-                        kill.attacker_count,
-                        final_blow_char_id,
-                        final_blow_corp_id,
-                        final_blow_alliance_id,
-                        kill.is_solo,
-                        kill.is_npc,
-                        is_capital,
-                        zkb_data.get("points"),
-                        zkb_data.get("npc", False),
-                        zkb_data.get("awox", False),
-                        kill.solar_system_id  # For the battle subquery
-                    ))
-
-                    # Check if insert was successful (not a duplicate)
-                    result = cur.fetchone()
-                    if result is None:
-                        # Duplicate kill - DO NOT count
-                        print(f"[DUPLICATE] Killmail {kill.killmail_id} already exists - skipping")
-                        return None
-
-                    inserted_killmail_id, battle_id = result
-
-                    # 2. Insert destroyed items
-                    for item in kill.destroyed_items:
-                        cur.execute("""
-                            INSERT INTO killmail_items (
-                                killmail_id, item_type_id, quantity, was_destroyed
-                            ) VALUES (%s, %s, %s, %s)
-                        """, (
-                            kill.killmail_id,
-                            item['item_type_id'],
-                            item['quantity'],
-                            True
-                        ))
-
-                    # 3. Insert dropped items
-                    for item in kill.dropped_items:
-                        cur.execute("""
-                            INSERT INTO killmail_items (
-                                killmail_id, item_type_id, quantity, was_destroyed
-                            ) VALUES (%s, %s, %s, %s)
-                        """, (
-                            kill.killmail_id,
-                            item['item_type_id'],
-                            item['quantity'],
-                            False
-                        ))
-
-                    # 4. Insert attacker details
-                    for attacker in attackers:
-                        cur.execute("""
-                            INSERT INTO killmail_attackers (
-                                killmail_id,
-                                character_id,
-                                corporation_id,
-                                alliance_id,
-                                ship_type_id,
-                                weapon_type_id,
-                                damage_done,
-                                is_final_blow
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        """, (
-                            kill.killmail_id,
-                            attacker.get("character_id"),
-                            attacker.get("corporation_id"),
-                            attacker.get("alliance_id"),
-                            attacker.get("ship_type_id"),
-                            attacker.get("weapon_type_id"),
-                            attacker.get("damage_done", 0),
-                            attacker.get("final_blow", False)
-                        ))
-
-                    # 5. If kill is associated with a battle, refresh stats from computed view
-                    # This ensures battle statistics are ALWAYS accurate
-                    if battle_id:
-                        cur.execute("""
-                            UPDATE battles b SET
-                                last_kill_at = CURRENT_TIMESTAMP
-                            WHERE b.battle_id = %s
-                        """, (battle_id,))
-
-                        # Refresh battle stats from computed view (always accurate)
-                        cur.execute("SELECT refresh_battle_stats(%s)", (battle_id,))
-
-                        print(f"[BATTLE] Kill {kill.killmail_id} added to battle {battle_id}")
-
-                    conn.commit()
-
-                    # Return battle_id (or 0 if not part of battle)
-                    return battle_id if battle_id else 0
-
+            result = write_killmails([self.build_killmail_record(kill, zkb_data, esi_killmail)])[0]
         except Exception as e:
             print(f"Error storing killmail {kill.killmail_id} to PostgreSQL: {e}")
             return None
 
+        if result is None:
+            # Duplicate kill - DO NOT count
+            print(f"[DUPLICATE] Killmail {kill.killmail_id} already exists - skipping")
+        elif result:
+            print(f"[BATTLE] Kill {kill.killmail_id} added to battle {result}")
+        return result
+
+    def _publish_writer_stats(self, stats: Dict):
+        """Publish kill writer metrics to Redis for get_stats() in other processes"""
+        self.redis_client.setex(KILL_WRITER_STATS_KEY, KILL_WRITER_STATS_TTL, json.dumps(stats))
+
     def _is_capital_ship(self, ship_type_id: int) -> bool:
         """
         Check if a ship is a capital ship.
 
         Capital ship groups: Titan, Supercarrier, Carrier, Dreadnought, Force Auxiliary, Rorqual
         """
-        capital_groups = [30, 659, 547, 485, 1538, 941]  # Group IDs for capital ships
         try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        'SELECT "groupID" FROM "invTypes" WHERE "typeID" = %s',
-                        (ship_type_id,)
-                    )
-                    result = cur.fetchone()
-                    if result:
-                        group_id = result[0]
-                        return group_id in capital_groups
+            return get_sde_lookup().is_capital(ship_type_id)
         except Exception:
-            pass
-        return False
+            return False
 
-    def create_battle_for_hotspot(self, kill: LiveKillmail) -> Optional[int]:
+    def create_battle_for_hotspot(self, kill: LiveKillmail, schedule_alert: bool = True) -> Optional[int]:
         """
         Create a new battle when a hotspot is detected (5+ kills in 5 minutes).
 
@@ -655,6 +479,8 @@ class ZKillboardLiveService:
 
         Args:
             kill: LiveKillmail that triggered the hotspot detection
+            schedule_alert: Schedule the initial battle alert on the running
+                event loop (pass False when called from a worker thread)
 
         Returns:
             battle_id if battle was created, None if battle already exists
@@ -705,7 +531,8 @@ class ZKillboardLiveService:
                     print(f"[BATTLE] Battle {battle_id} created in system {kill.solar_system_id}")
 
                     # Send initial battle alert after a few more kills
-                    asyncio.create_task(self.send_initial_battle_alert(battle_id, kill.solar_system_id))
+                    if schedule_alert:
+                        asyncio.create_task(self.send_initial_battle_alert(battle_id, kill.solar_system_id))
 
                     return battle_id
 
@@ -816,25 +643,13 @@ class ZKillboardLiveService:
                 return
 
             # Get system info
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT
-                            ms."solarSystemName",
-                            mr."regionName",
-                            ms.security,
-                            it."typeName"
-                        FROM "mapSolarSystems" ms
-                        JOIN "mapRegions" mr ON mr."regionID" = ms."regionID"
-                        LEFT JOIN "invTypes" it ON it."typeID" = %s
-                        WHERE ms."solarSystemID" = %s
-                    """, (kill.ship_type_id, kill.solar_system_id))
-
-                    row = cur.fetchone()
-                    if not row:
-                        return
+            sde = get_sde_lookup()
+            system = sde.system_info(kill.solar_system_id)
+            if not system:
+                return
 
-                    system_name, region_name, security, ship_type_name = row
+            system_name, region_name, security = system['name'], system['region_name'], system['security']
+            ship_type_name = sde.type_name(kill.ship_type_id)
 
             isk_b = ship_value / 1_000_000_000
 
@@ -904,18 +719,11 @@ class ZKillboardLiveService:
                     # Successfully claimed milestone - now send alert
 
                     # Get system info
-                    cur.execute("""
-                        SELECT ms."solarSystemName", mr."regionName", ms.security
-                        FROM "mapSolarSystems" ms
-                        JOIN "mapRegions" mr ON mr."regionID" = ms."regionID"
-                        WHERE ms."solarSystemID" = %s
-                    """, (system_id,))
-
-                    sys_row = cur.fetchone()
-                    if not sys_row:
+                    system = get_sde_lookup().system_info(system_id)
+                    if not system:
                         return
 
-                    system_name, region_name, security = sys_row
+                    system_name, region_name, security = system['name'], system['region_name'], system['security']
 
                     # Get involved parties
                     involved = await self.get_involved_parties(system_id, limit=3)
@@ -1254,8 +1062,6 @@ class ZKillboardLiveService:
             0 if kill was stored but not part of a battle
             None if kill was duplicate or failed to store
         """
-        timestamp = int(time.time())
-
         # PERSISTENT STORAGE: Write to PostgreSQL with atomic battle assignment
         if not zkb_data or not esi_killmail:
             print(f"[WARNING] Killmail {kill.killmail_id} missing zkb_data or esi_killmail - skipping")
@@ -1271,7 +1077,21 @@ class ZKillboardLiveService:
             # Duplicate - already exists in database
             return None
 
-        # TEMPORARY STORAGE: Redis for real-time queries
+        self.cache_live_kill(kill)
+
+        # Return battle_id (or 0 if not part of battle)
+        return result
+
+    def cache_live_kill(self, kill: LiveKillmail):
+        """
+        TEMPORARY STORAGE: Redis for real-time queries (24h TTL).
+        Multiple storage patterns for different query types.
+
+        Args:
+            kill: Parsed killmail that was stored in PostgreSQL
+        """
+        timestamp = int(time.time())
+
         # 1. Store full killmail by ID
         key_by_id = f"kill:id:{kill.killmail_id}"
         self.redis_client.setex(
@@ -1307,6 +1127,12 @@ class ZKillboardLiveService:
             self.redis_client.incrby(key_item_demand, item['quantity'])
             self.redis_client.expire(key_item_demand, REDIS_TTL)
 
+        # 6. Fold into the sliding 24h report aggregates
+        self.kill_window.record(kill, timestamp)
+
+        # 7. Per-system danger summary (danger map, gate-camp detection)
+        self.system_danger.record(kill, timestamp)
+
         # Cache kill in state manager for fast retrieval
         self.state_manager.cache_kill(kill.killmail_id, asdict(kill))
 
@@ -1317,9 +1143,6 @@ class ZKillboardLiveService:
             timestamp
         )
 
-        # Return battle_id (or 0 if not part of battle)
-        return result
-
     def detect_hotspot(self, kill: LiveKillmail) -> Optional[Dict]:
         """
         Detect if this kill indicates a hotspot (combat spike).
@@ -1360,42 +1183,19 @@ class ZKillboardLiveService:
         Returns:
             List of {ship_type_id, ship_name, value} dicts
         """
-        # Get recent kills from Redis
-        kill_ids = self.redis_client.zrevrange(
-            f"kill:system:{system_id}:timeline",
-            0,
-            50
-        )
-
-        kills = []
-        for kill_id in kill_ids[:20]:  # Check last 20
-            kill_data = self.redis_client.get(f"kill:id:{kill_id}")
-            if kill_data:
-                kill = json.loads(kill_data)
-                kills.append(kill)
-
-        # Sort by value
-        kills_sorted = sorted(kills, key=lambda x: x['ship_value'], reverse=True)[:limit]
-
-        # Get ship names from DB
-        result = []
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                for kill in kills_sorted:
-                    cur.execute(
-                        'SELECT "typeName" FROM "invTypes" WHERE "typeID" = %s',
-                        (kill['ship_type_id'],)
-                    )
-                    row = cur.fetchone()
-                    ship_name = row[0] if row else f"Ship {kill['ship_type_id']}"
-
-                    result.append({
-                        'ship_type_id': kill['ship_type_id'],
-                        'ship_name': ship_name,
-                        'value': kill['ship_value']
-                    })
-
-        return result
+        # Most expensive of the system's recent kills (one Redis round trip)
+        kills_sorted = self.system_danger.read([system_id])[system_id].top_kills(limit)
+
+        # Get ship names from the SDE lookup
+        sde = get_sde_lookup()
+        return [
+            {
+                'ship_type_id': kill['ship_type_id'],
+                'ship_name': sde.type_name(kill['ship_type_id'], f"Ship {kill['ship_type_id']}"),
+                'value': kill['ship_value']
+            }
+            for kill in kills_sorted
+        ]
 
     def calculate_danger_level(self, security: float, kill_count: int, kill_rate: float, isk_destroyed: float) -> Tuple[str, int]:
         """
@@ -1473,18 +1273,9 @@ class ZKillboardLiveService:
         Returns:
             Tuple of (is_camp, confidence, indicators)
         """
-        # Get recent kills
-        kill_ids = self.redis_client.zrevrange(
-            f"kill:system:{system_id}:timeline",
-            0,
-            50
-        )
-
-        kills = []
-        for kill_id in kill_ids[:20]:
-            kill_data = self.redis_client.get(f"kill:id:{kill_id}")
-            if kill_data:
-                kills.append(json.loads(kill_data))
+        # Recent kills of the system (one Redis round trip)
+        danger = self.system_danger.read([system_id])[system_id]
+        kills = danger.recent
 
         if len(kills) < 3:
             return False, 0.0, []
@@ -1502,21 +1293,13 @@ class ZKillboardLiveService:
             score += 0.5
             indicators.append("Small gang")
 
-        # Indicator 2: Ship Types (check for Interdictors)
+        # Indicator 2: Attacker Ship Types (check for Interdictors)
         ship_types = {}
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                for kill in kills:
-                    cur.execute(
-                        'SELECT g."groupName" FROM "invTypes" t '
-                        'JOIN "invGroups" g ON t."groupID" = g."groupID" '
-                        'WHERE t."typeID" = %s',
-                        (kill['ship_type_id'],)
-                    )
-                    row = cur.fetchone()
-                    if row:
-                        group = row[0]
-                        ship_types[group] = ship_types.get(group, 0) + 1
+        sde = get_sde_lookup()
+        for group_id, kill_count in danger.attacker_group_kills().items():
+            group = sde.group_name(group_id)
+            if group:
+                ship_types[group] = kill_count
 
         interdictors = ship_types.get("Interdictor", 0)
         if interdictors >= 2:
@@ -1548,7 +1331,7 @@ class ZKillboardLiveService:
                 score += 0.5
 
         # Indicator 4: Victim Diversity
-        unique_corps = len(set(k['victim_corporation_id'] for k in kills if k['victim_corporation_id']))
+        unique_corps = danger.unique_victim_corps
         if unique_corps >= 8:
             score += 1
             indicators.append("Diverse victims (random traffic)")
@@ -1716,51 +1499,29 @@ class ZKillboardLiveService:
             top_victim_corps = sorted(victim_corps.items(), key=lambda x: x[1], reverse=True)[:limit]
             top_victim_alliances = sorted(victim_alliances.items(), key=lambda x: x[1], reverse=True)[:limit]
 
-        # Fetch names from ESI
-        session = await self._get_session()
-
-        async def get_corp_name(corp_id: int) -> str:
-            try:
-                url = f"https://esi.evetech.net/latest/corporations/{corp_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("name", f"Corp {corp_id}")
-            except:
-                pass
-            return f"Corp {corp_id}"
-
-        async def get_alliance_name(alliance_id: int) -> str:
-            try:
-                url = f"https://esi.evetech.net/latest/alliances/{alliance_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("name", f"Alliance {alliance_id}")
-            except:
-                pass
-            return f"Alliance {alliance_id}"
-
-        # Fetch all names concurrently
-        attacker_corps_with_names = []
-        for corp_id, count in top_attacker_corps:
-            name = await get_corp_name(corp_id)
-            attacker_corps_with_names.append({"id": corp_id, "name": name, "kills": count})
-
-        attacker_alliances_with_names = []
-        for alliance_id, count in top_attacker_alliances:
-            name = await get_alliance_name(alliance_id)
-            attacker_alliances_with_names.append({"id": alliance_id, "name": name, "kills": count})
-
-        victim_corps_with_names = []
-        for corp_id, count in top_victim_corps:
-            name = await get_corp_name(corp_id)
-            victim_corps_with_names.append({"id": corp_id, "name": name, "kills": count})
+        # Resolve all names in one batch per category
+        resolver = get_name_resolver()
+        corp_names = await resolver.aget_names('corporation', [c for c, _ in top_attacker_corps + top_victim_corps])
+        alliance_names = await resolver.aget_names(
+            'alliance', [a for a, _ in top_attacker_alliances + top_victim_alliances]
+        )
 
-        victim_alliances_with_names = []
-        for alliance_id, count in top_victim_alliances:
-            name = await get_alliance_name(alliance_id)
-            victim_alliances_with_names.append({"id": alliance_id, "name": name, "kills": count})
+        attacker_corps_with_names = [
+            {"id": corp_id, "name": corp_names.get(corp_id, f"Corporation {corp_id}"), "kills": count}
+            for corp_id, count in top_attacker_corps
+        ]
+        attacker_alliances_with_names = [
+            {"id": alliance_id, "name": alliance_names.get(alliance_id, f"Alliance {alliance_id}"), "kills": count}
+            for alliance_id, count in top_attacker_alliances
+        ]
+        victim_corps_with_names = [
+            {"id": corp_id, "name": corp_names.get(corp_id, f"Corporation {corp_id}"), "kills": count}
+            for corp_id, count in top_victim_corps
+        ]
+        victim_alliances_with_names = [
+            {"id": alliance_id, "name": alliance_names.get(alliance_id, f"Alliance {alliance_id}"), "kills": count}
+            for alliance_id, count in top_victim_alliances
+        ]
 
         return {
             "attackers": {
@@ -1786,21 +1547,12 @@ class ZKillboardLiveService:
         kill_count = hotspot['kill_count']
         window_minutes = hotspot['window_seconds'] // 60
 
-        # Get system info from DB
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    'SELECT ms."solarSystemName", mr."regionName", ms.security '
-                    'FROM "mapSolarSystems" ms '
-                    'JOIN "mapRegions" mr ON ms."regionID" = mr."regionID" '
-                    'WHERE ms."solarSystemID" = %s',
-                    (system_id,)
-                )
-                result = cur.fetchone()
-                if not result:
-                    return None
+        # Get system info from the SDE lookup
+        system = get_sde_lookup().system_info(system_id)
+        if not system:
+            return None
 
-                system_name, region_name, security = result
+        system_name, region_name, security = system['name'], system['region_name'], system['security']
 
         # Get top 5 expensive ships
         top_ships = self.get_top_expensive_ships(system_id, limit=5)
@@ -2021,6 +1773,21 @@ class ZKillboardLiveService:
                         }
         return None
 
+    def claim_kill(self, killmail_id: int) -> bool:
+        """
+        Claim a killmail for processing (Redis-based, survives restarts).
+
+        Returns:
+            False if the kill was already processed or claimed by another process
+        """
+        # STEP 1: Check if already processed using Redis (survives restarts!)
+        if self.state_manager.is_kill_processed(killmail_id):
+            return False
+
+        # STEP 2: Atomically mark as processed in Redis
+        # SADD returns False if already exists (race condition protection)
+        return self.state_manager.mark_kill_processed(killmail_id, source="redisq")
+
     async def process_live_kill(self, zkb_entry: Dict):
         """
         Process a single killmail from zkillboard API.
@@ -2028,13 +1795,14 @@ class ZKillboardLiveService:
         Pipeline (REDESIGNED for atomicity):
         1. Check Redis if already processed (fast, survives restarts)
         2. Mark as processed in Redis (atomic SADD)
-        3. Fetch full data from ESI
+        3. Fetch full data from ESI (unless zkb_entry["killmail"] was prefetched)
         4. Parse killmail
-        5. Store in PostgreSQL with atomic battle assignment
-        6. If hotspot detected, create new battle (battles stats from computed view)
-        7. Update battle participants
-        8. Track alliance wars
-        9. Send alerts if needed
+        5. If hotspot detected, create new battle (battles stats from computed view)
+        6. Queue for batched PostgreSQL storage with atomic battle assignment
+        7. After the batch is committed (background task): Redis hot storage,
+           battle participants, alliance wars, alerts
+
+        Returns once the kill is queued; call drain() to wait for queued kills.
         """
         killmail_id = zkb_entry.get("killmail_id")
         hash_str = zkb_entry.get("zkb", {}).get("hash")
@@ -2042,69 +1810,134 @@ class ZKillboardLiveService:
         if not killmail_id or not hash_str:
             return
 
-        # STEP 1: Check if already processed using Redis (survives restarts!)
-        if self.state_manager.is_kill_processed(killmail_id):
+        if not self.claim_kill(killmail_id):
             return
 
-        # STEP 2: Atomically mark as processed in Redis
-        # SADD returns False if already exists (race condition protection)
-        if not self.state_manager.mark_kill_processed(killmail_id, source="redisq"):
-            return  # Another process already claimed this kill
-
-        # STEP 3: Fetch full killmail from ESI
-        killmail = await self.fetch_killmail_from_esi(killmail_id, hash_str)
+        # STEP 3: Fetch full killmail from ESI (reuse RedisQ prefetch)
+        killmail = zkb_entry.get("killmail")
+        if not killmail:
+            killmail = await self.fetch_killmail_from_esi(killmail_id, hash_str)
         if not killmail:
             return
 
+        await self.process_fetched_kill(killmail, zkb_entry.get("zkb", {}))
+
+    def prepare_live_kill(self, killmail: Dict, zkb: Dict) -> Optional[Tuple[LiveKillmail, Optional[Dict], Optional[int], KillmailRecord]]:
+        """
+        Blocking part of kill processing before storage (safe to run in a worker thread).
+
+        Returns:
+            (kill, hotspot, new_battle_id, record) or None if the killmail can't be parsed
+        """
         # STEP 4: Parse killmail
-        kill = self.parse_killmail(killmail, zkb_entry.get("zkb", {}))
+        kill = self.parse_killmail(killmail, zkb)
         if not kill:
-            return
+            return None
 
         # STEP 5: Detect hotspot BEFORE storing (to create battle if needed)
         # This uses Redis-based timestamps that survive restarts
         hotspot = self.detect_hotspot(kill)
 
         # STEP 6: If hotspot detected, ensure a battle exists for this system
-        # The battle must exist BEFORE store_live_kill so the kill gets associated
+        # The battle must exist BEFORE the kill is stored so it gets associated
+        new_battle_id = None
         if hotspot:
-            self.create_battle_for_hotspot(kill)
+            new_battle_id = self.create_battle_for_hotspot(kill, schedule_alert=False)
 
-        # STEP 7: Store in PostgreSQL with atomic battle assignment
-        # This returns:
-        # - battle_id (>0) if associated with battle
-        # - 0 if stored but no battle
-        # - None if duplicate (shouldn't happen due to Redis check)
-        battle_id = self.store_live_kill(
-            kill,
-            zkb_data=zkb_entry.get("zkb", {}),
-            esi_killmail=killmail
-        )
+        return kill, hotspot, new_battle_id, self.build_killmail_record(kill, zkb, killmail)
+
+    async def process_fetched_kill(self, killmail: Dict, zkb: Dict) -> Optional[asyncio.Future]:
+        """
+        Parse, battle-check and queue a claimed killmail for storage.
+
+        Blocking DB/Redis work runs in a worker thread.
+
+        Returns:
+            Future from kill_writer.submit() (battle_id / 0 / None), or None
+            if the killmail could not be parsed
+        """
+        prepared = await asyncio.to_thread(self.prepare_live_kill, killmail, zkb)
+        if prepared is None:
+            return None
+        kill, hotspot, new_battle_id, record = prepared
+
+        if new_battle_id:
+            asyncio.create_task(self.send_initial_battle_alert(new_battle_id, kill.solar_system_id))
 
-        if battle_id is None:
-            # Kill was duplicate (DB constraint) - shouldn't happen with Redis check
-            print(f"[SKIP] Killmail {killmail_id} not stored - duplicate in DB")
+        # STEP 7: Queue for PostgreSQL with atomic battle assignment
+        # The kill writer batches kills for a few hundred ms; the remaining
+        # steps run once this kill's batch is committed
+        stored = self.kill_writer.submit(record)
+        task = asyncio.create_task(self._complete_live_kill(kill, hotspot, stored))
+        self._post_store_tasks.add(task)
+        task.add_done_callback(self._post_store_tasks.discard)
+        return stored
+
+    async def _complete_live_kill(self, kill: LiveKillmail, hotspot: Optional[Dict], stored: asyncio.Future):
+        """
+        Steps after the kill's batch is written: Redis hot storage, battle
+        participants, alliance wars and alerts.
+
+        Args:
+            kill: Parsed killmail
+            hotspot: Result of detect_hotspot() for this kill
+            stored: Future from kill_writer.submit() resolving to
+                battle_id (>0), 0 (no battle) or None (duplicate), or
+                failing if the kill couldn't be written
+        """
+        try:
+            battle_id = await stored
+        except Exception as e:
+            print(f"[ERROR] Killmail {kill.killmail_id} lost - PostgreSQL write failed: {e}")
             return
 
+        try:
+            if battle_id is None:
+                # Kill was duplicate (DB constraint) - shouldn't happen with Redis check
+                print(f"[SKIP] Killmail {kill.killmail_id} not stored - duplicate in DB")
+                return
+
+            if battle_id:
+                print(f"[BATTLE] Kill {kill.killmail_id} added to battle {battle_id}")
+
+            total_kills = await asyncio.to_thread(self._post_store_steps, kill, hotspot, battle_id)
+
+            # Alerts run on the event loop
+            if total_kills is not None:
+                asyncio.create_task(self.send_initial_battle_alert(battle_id, kill.solar_system_id))
+                asyncio.create_task(self.check_and_send_milestone_alert(battle_id, total_kills, kill.solar_system_id))
+
+            # HIGH-VALUE KILL ALERTS: Alert on expensive kills (≥2B ISK)
+            asyncio.create_task(self.send_high_value_kill_alert(kill))
+        except Exception as e:
+            print(f"[ERROR] Post-store processing failed for killmail {kill.killmail_id}: {e}")
+
+    def _post_store_steps(self, kill: LiveKillmail, hotspot: Optional[Dict], battle_id: int) -> Optional[int]:
+        """
+        Blocking post-store work: Redis hot storage, battle participants,
+        alliance wars and live hotspot data (safe to run in a worker thread).
+
+        Returns:
+            Battle total_kills for milestone alerts, None if not part of a battle
+        """
+        self.cache_live_kill(kill)
+
         # STEP 8: Update battle participants (if kill is part of a battle)
+        total_kills = None
         if battle_id and battle_id > 0:
             self.update_battle_participants(battle_id, kill)
 
-            # Check for battle milestones and send alerts
+            # Current battle size for milestone alerts
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT total_kills FROM battles WHERE battle_id = %s", (battle_id,))
                     row = cur.fetchone()
                     if row:
-                        asyncio.create_task(self.send_initial_battle_alert(battle_id, kill.solar_system_id))
-                        asyncio.create_task(self.check_and_send_milestone_alert(battle_id, row[0], kill.solar_system_id))
+                        total_kills = row[0]
 
         # STEP 9: Track alliance wars
         self.track_alliance_war(kill)
 
-        # HIGH-VALUE KILL ALERTS: Alert on expensive kills (≥2B ISK)
-        asyncio.create_task(self.send_high_value_kill_alert(kill))
-
         # =====================================================
         # OLD HOTSPOT ALERT SYSTEM - DISABLED
         # Now using milestone-based battle alerts instead
@@ -2144,31 +1977,19 @@ class ZKillboardLiveService:
             self.redis_client.setex(live_key, 300, json.dumps(live_hotspot_data))  # 5-minute TTL
             print(f"Stored live hotspot for system {system_id} (TTL: 300s, danger: {simple_danger})")
 
+        return total_kills
+
     def _get_system_name(self, system_id: int) -> str:
-        """Get system name from DB"""
+        """Get system name from the SDE lookup"""
         try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT solarSystemName FROM mapSolarSystems WHERE solarSystemID = %s",
-                        (system_id,)
-                    )
-                    result = cur.fetchone()
-                    return result[0] if result else f"System {system_id}"
+            return get_sde_lookup().system_name(system_id, f"System {system_id}")
         except Exception:
             return f"System {system_id}"
 
     def _get_ship_name(self, type_id: int) -> str:
-        """Get ship name from DB"""
+        """Get ship name from the SDE lookup"""
         try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT typeName FROM invTypes WHERE typeID = %s",
-                        (type_id,)
-                    )
-                    result = cur.fetchone()
-                    return result[0] if result else f"Ship {type_id}"
+            return get_sde_lookup().type_name(type_id, f"Ship {type_id}")
         except Exception:
             return f"Ship {type_id}"
 
@@ -2238,6 +2059,7 @@ class ZKillboardLiveService:
             if verbose:
                 print(f"\nStopping listener. Processed {kill_count} kills total.")
         finally:
+            await self.drain()
             if self.session and not self.session.closed:
                 await self.session.close()
 
@@ -2245,6 +2067,12 @@ class ZKillboardLiveService:
         """Stop the listener"""
         self.running = False
 
+    async def drain(self):
+        """Write all queued kills and wait for their post-store processing"""
+        await self.kill_writer.close()
+        if self._post_store_tasks:
+            await asyncio.gather(*list(self._post_store_tasks), return_exceptions=True)
+
     # Query Methods for API
 
     def get_recent_kills(
@@ -2350,9 +2178,14 @@ class ZKillboardLiveService:
         total_kills = len(list(self.redis_client.scan_iter("kill:id:*")))
         total_hotspots = len(list(self.redis_client.scan_iter("hotspot:*")))
 
+        writer_stats = self.redis_client.get(KILL_WRITER_STATS_KEY)
+        pipeline_stats = self.redis_client.get(PIPELINE_STATS_KEY)
+
         return {
             "total_kills_24h": total_kills,
             "active_hotspots": total_hotspots,
             "redis_connected": self.redis_client.ping(),
-            "running": self.running
+            "running": self.running,
+            "kill_writer": json.loads(writer_stats) if writer_stats else self.kill_writer.stats(),
+            "pipeline": json.loads(pipeline_stats) if pipeline_stats else None
         }
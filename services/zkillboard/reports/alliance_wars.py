@@ -9,11 +9,13 @@ Tracks active alliance wars with:
 """
 
 import json
-import aiohttp
 from datetime import datetime
 from typing import Dict, List
 
 from src.database import get_db_connection
+from services.combat_rollup_service import get_war_matchup, get_coalition_inputs, get_alliance_totals
+from services.coalition_clustering import cluster_coalitions
+from src.services.names import get_name_resolver
 from .base import REPORT_CACHE_TTL
 
 
@@ -22,7 +24,7 @@ class AllianceWarsMixin:
 
     async def get_alliance_name(self, alliance_id: int) -> str:
         """
-        Get alliance name from ESI API with Redis caching.
+        Get alliance name via the shared name resolver.
 
         Args:
             alliance_id: Alliance ID
@@ -30,36 +32,7 @@ class AllianceWarsMixin:
         Returns:
             Alliance name or fallback string
         """
-        if not alliance_id:
-            return "Unknown"
-
-        cache_key = f"esi:alliance:{alliance_id}:name"
-
-        # Try cache first
-        try:
-            cached = self.redis_client.get(cache_key)
-            if cached:
-                return cached if isinstance(cached, str) else cached.decode('utf-8')
-        except Exception:
-            pass
-
-        # Fetch from ESI
-        try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://esi.evetech.net/latest/alliances/{alliance_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        name = data.get("name", f"Alliance {alliance_id}")
-                        # Cache for 7 days
-                        try:
-                            self.redis_client.setex(cache_key, 7 * 24 * 60 * 60, name)
-                        except Exception:
-                            pass
-                        return name
-        except Exception as e:
-            print(f"Error fetching alliance {alliance_id}: {e}")
-        return f"Alliance {alliance_id}"
+        return await get_name_resolver().aget_name('alliance', alliance_id)
 
     async def get_alliance_war_tracker_postgres(self, limit: int = 10, days: int = 7) -> Dict:
         """
@@ -109,6 +82,9 @@ class AllianceWarsMixin:
                     if not wars:
                         return {"wars": [], "total_wars": 0}
 
+                    # Resolve all alliance names in one batch
+                    await get_name_resolver().aget_names('alliance', [w[1] for w in wars] + [w[2] for w in wars])
+
                     war_data = []
                     for war in wars:
                         war_id, alliance_a, alliance_b, first_kill, last_kill, total_kills, total_isk, duration, status, \
@@ -118,33 +94,10 @@ class AllianceWarsMixin:
                         alliance_a_name = await self.get_alliance_name(alliance_a)
                         alliance_b_name = await self.get_alliance_name(alliance_b)
 
-                        # Count actual ship losses
-                        cur.execute("""
-                            SELECT
-                                COUNT(*) FILTER (WHERE k.victim_alliance_id = %s) as alliance_a_losses,
-                                COUNT(*) FILTER (WHERE k.victim_alliance_id = %s) as alliance_b_losses,
-                                COALESCE(SUM(k.ship_value) FILTER (WHERE k.victim_alliance_id = %s), 0) as alliance_a_isk_lost,
-                                COALESCE(SUM(k.ship_value) FILTER (WHERE k.victim_alliance_id = %s), 0) as alliance_b_isk_lost
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND (
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                                  OR
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                              )
-                        """, (alliance_a, alliance_b, alliance_a, alliance_b, days,
-                              alliance_a, alliance_b, alliance_b, alliance_a))
-
-                        actual_result = cur.fetchone()
-                        actual_losses_a, actual_losses_b, actual_isk_lost_a, actual_isk_lost_b = actual_result
+                        # Ship losses between the two alliances (hourly matchup rollup)
+                        matchup = get_war_matchup(cur, alliance_a, alliance_b, days)
+                        actual_losses_a, actual_losses_b = matchup["losses_a"], matchup["losses_b"]
+                        actual_isk_lost_a, actual_isk_lost_b = matchup["isk_lost_a"], matchup["isk_lost_b"]
 
                         # Use actual counts
                         recent_kills_a = actual_losses_b
@@ -169,32 +122,8 @@ class AllianceWarsMixin:
                             overall_winner = "contested"
 
                         # Get system hotspots
-                        cur.execute("""
-                            SELECT
-                                k.solar_system_id,
-                                COUNT(*) as kill_count
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND (
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                                  OR
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                              )
-                            GROUP BY k.solar_system_id
-                            ORDER BY kill_count DESC
-                            LIMIT 5
-                        """, (days, alliance_a, alliance_b, alliance_b, alliance_a))
-
                         system_hotspots = []
-                        for sys_id, kill_count in cur.fetchall():
+                        for sys_id, kill_count in matchup["system_kills"]:
                             sys_info = self.get_system_location_info(sys_id)
                             system_hotspots.append({
                                 "system_id": sys_id,
@@ -302,173 +231,34 @@ class AllianceWarsMixin:
         try:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    # Find alliance pairs that fight TOGETHER
-                    cur.execute("""
-                        WITH recent_kills AS (
-                            SELECT killmail_id
-                            FROM killmails
-                            WHERE killmail_time >= NOW() - INTERVAL '%s days'
-                        )
-                        SELECT
-                            ka1.alliance_id as alliance_a,
-                            ka2.alliance_id as alliance_b,
-                            COUNT(DISTINCT ka1.killmail_id) as fights_together
-                        FROM killmail_attackers ka1
-                        JOIN killmail_attackers ka2
-                            ON ka1.killmail_id = ka2.killmail_id
-                            AND ka1.alliance_id < ka2.alliance_id
-                        WHERE ka1.killmail_id IN (SELECT killmail_id FROM recent_kills)
-                          AND ka1.alliance_id IS NOT NULL
-                          AND ka2.alliance_id IS NOT NULL
-                          AND ka1.alliance_id != ka2.alliance_id
-                        GROUP BY ka1.alliance_id, ka2.alliance_id
-                        HAVING COUNT(DISTINCT ka1.killmail_id) >= %s
-                        ORDER BY fights_together DESC
-                    """, (days, min_fights_together))
-
-                    alliance_pairs = cur.fetchall()
-
-                    # Get alliance activity stats
-                    cur.execute("""
-                        SELECT
-                            alliance_id,
-                            COUNT(*) as total_activity
-                        FROM (
-                            SELECT ka.alliance_id
-                            FROM killmail_attackers ka
-                            JOIN killmails k ON k.killmail_id = ka.killmail_id
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND ka.alliance_id IS NOT NULL
-                            UNION ALL
-                            SELECT k.victim_alliance_id as alliance_id
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND k.victim_alliance_id IS NOT NULL
-                        ) combined
-                        GROUP BY alliance_id
-                        HAVING COUNT(*) >= 10
-                        ORDER BY total_activity DESC
-                    """, (days, days))
-
-                    alliance_activity = {row[0]: row[1] for row in cur.fetchall()}
-
-                    # Union-Find for clustering
-                    parent = {}
-
-                    def find(x):
-                        if x not in parent:
-                            parent[x] = x
-                        if parent[x] != x:
-                            parent[x] = find(parent[x])
-                        return parent[x]
-
-                    def union(x, y):
-                        px, py = find(x), find(y)
-                        if px != py:
-                            if alliance_activity.get(px, 0) >= alliance_activity.get(py, 0):
-                                parent[py] = px
-                            else:
-                                parent[px] = py
-
-                    # Get conflicts for enemy detection
-                    cur.execute("""
-                        SELECT
-                            ka.alliance_id as attacker_alliance,
-                            k.victim_alliance_id as victim_alliance,
-                            COUNT(*) as fights_against
-                        FROM killmail_attackers ka
-                        JOIN killmails k ON k.killmail_id = ka.killmail_id
-                        WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                          AND ka.alliance_id IS NOT NULL
-                          AND k.victim_alliance_id IS NOT NULL
-                          AND ka.alliance_id != k.victim_alliance_id
-                        GROUP BY ka.alliance_id, k.victim_alliance_id
-                        HAVING COUNT(*) >= %s
-                    """, (days, min_fights_together))
-
-                    conflicts_raw = cur.fetchall()
-
-                    conflict_map = {}
-                    for attacker, victim, count in conflicts_raw:
-                        pair = tuple(sorted([attacker, victim]))
-                        conflict_map[pair] = conflict_map.get(pair, 0) + count
-
-                    coop_map = {}
-                    for alliance_a, alliance_b, fights_together in alliance_pairs:
-                        pair = (alliance_a, alliance_b)
-                        coop_map[pair] = fights_together
-
-                    confirmed_enemies = set()
-                    for pair, fights_against in conflict_map.items():
-                        if fights_against >= 20:
-                            confirmed_enemies.add(pair)
-
-                    # Union alliances that are TRUE allies
-                    for alliance_a, alliance_b, fights_together in alliance_pairs:
-                        pair = tuple(sorted([alliance_a, alliance_b]))
-
-                        if pair in confirmed_enemies:
-                            continue
-
-                        fights_against = conflict_map.get(pair, 0)
-                        if fights_against > 0 and fights_together < fights_against * 5:
-                            continue
-
-                        activity_a = alliance_activity.get(alliance_a, 0)
-                        activity_b = alliance_activity.get(alliance_b, 0)
-                        min_activity = min(activity_a, activity_b)
-
-                        is_significant = min_activity > 0 and fights_together >= min_activity * 0.10
+                    # Co-attacking pairs, activity and conflicts from the hourly rollups
+                    alliance_pairs, alliance_activity, conflicts_raw = get_coalition_inputs(
+                        cur, days, min_fights_together
+                    )
 
-                        if is_significant:
-                            union(alliance_a, alliance_b)
+                    # Cluster allies, never merging confirmed enemies into one coalition
+                    clusters = cluster_coalitions(alliance_pairs, alliance_activity, conflicts_raw)
 
-                    # Group alliances by coalition root
-                    coalitions_raw = {}
-                    for alliance_id in alliance_activity.keys():
-                        root = find(alliance_id)
-                        if root not in coalitions_raw:
-                            coalitions_raw[root] = []
-                        coalitions_raw[root].append(alliance_id)
+                    # Resolve the names shown below in one batch
+                    named = [m for c in clusters if len(c) > 1 for m in c[:10]]
+                    named += sorted((c[0] for c in clusters if len(c) == 1),
+                                    key=lambda a: alliance_activity.get(a, 0), reverse=True)[:10]
+                    await get_name_resolver().aget_names('alliance', named)
 
                     # Build final coalition data
                     coalitions = []
                     unaffiliated = []
 
-                    for root, members in coalitions_raw.items():
+                    for members in clusters:
                         if len(members) < 2:
                             unaffiliated.extend(members)
                             continue
 
-                        members.sort(key=lambda x: alliance_activity.get(x, 0), reverse=True)
                         leader_name = await self.get_alliance_name(members[0])
 
-                        member_ids = tuple(members[:50])
-                        cur.execute("""
-                            SELECT
-                                COUNT(DISTINCT ka.killmail_id) as total_kills,
-                                COALESCE(SUM(DISTINCT k.ship_value), 0) as isk_destroyed
-                            FROM killmail_attackers ka
-                            JOIN killmails k ON k.killmail_id = ka.killmail_id
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND ka.alliance_id IN %s
-                        """, (days, member_ids))
-                        kills_result = cur.fetchone()
-
-                        cur.execute("""
-                            SELECT
-                                COUNT(*) as total_losses,
-                                COALESCE(SUM(ship_value), 0) as isk_lost
-                            FROM killmails
-                            WHERE killmail_time >= NOW() - INTERVAL '%s days'
-                              AND victim_alliance_id IN %s
-                        """, (days, member_ids))
-                        losses_result = cur.fetchone()
-
-                        total_kills = kills_result[0] if kills_result else 0
-                        isk_destroyed = int(kills_result[1]) if kills_result else 0
-                        total_losses = losses_result[0] if losses_result else 0
-                        isk_lost = int(losses_result[1]) if losses_result else 0
+                        totals = get_alliance_totals(cur, members[:50], days)
+                        total_kills, isk_destroyed = totals["total_kills"], totals["isk_destroyed"]
+                        total_losses, isk_lost = totals["total_losses"], totals["isk_lost"]
 
                         efficiency = (isk_destroyed / (isk_destroyed + isk_lost) * 100) if (isk_destroyed + isk_lost) > 0 else 50
 
@@ -503,29 +293,14 @@ class AllianceWarsMixin:
                     for alliance_id in unaffiliated[:10]:
                         name = await self.get_alliance_name(alliance_id)
 
-                        cur.execute("""
-                            SELECT COUNT(*) as kills
-                            FROM killmail_attackers ka
-                            JOIN killmails k ON k.killmail_id = ka.killmail_id
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND ka.alliance_id = %s
-                        """, (days, alliance_id))
-                        kills = cur.fetchone()[0]
-
-                        cur.execute("""
-                            SELECT COUNT(*) as losses, COALESCE(SUM(ship_value), 0) as isk_lost
-                            FROM killmails
-                            WHERE killmail_time >= NOW() - INTERVAL '%s days'
-                              AND victim_alliance_id = %s
-                        """, (days, alliance_id))
-                        loss_result = cur.fetchone()
+                        totals = get_alliance_totals(cur, [alliance_id], days)
 
                         unaffiliated_data.append({
                             "alliance_id": alliance_id,
                             "name": name,
-                            "kills": kills,
-                            "losses": loss_result[0],
-                            "isk_lost": int(loss_result[1]),
+                            "kills": totals["total_kills"],
+                            "losses": totals["total_losses"],
+                            "isk_lost": totals["isk_lost"],
                             "activity": alliance_activity.get(alliance_id, 0)
                         })
 
@@ -13,10 +13,10 @@ Provides comprehensive combat intelligence:
 
 import json
 import time
-from typing import Dict, List
+from typing import Dict
 
-from src.database import get_db_connection
 from .base import ReportsBase, REPORT_CACHE_TTL
+from ..kill_window import KillWindow
 
 
 class PilotIntelligenceMixin:
@@ -43,67 +43,35 @@ class PilotIntelligenceMixin:
         return self._build_pilot_intelligence_report_internal(start_time, None)
 
     def _build_pilot_intelligence_report_internal(self, start_time: float, cache_key: str = None) -> Dict:
-        """Internal method to build the report."""
-        # Get all killmails from Redis using PIPELINE for bulk loading
-        kill_keys = list(self.redis_client.scan_iter("kill:id:*"))
-        print(f"[Performance] Found {len(kill_keys)} killmail keys in {time.time() - start_time:.2f}s")
-
-        # Use pipeline for bulk fetch (10-100x faster than individual gets)
-        pipe_start = time.time()
-        killmails = []
-        if kill_keys:
-            # Process in batches to avoid memory issues
-            BATCH_SIZE = 1000
-            for i in range(0, len(kill_keys), BATCH_SIZE):
-                batch_keys = kill_keys[i:i + BATCH_SIZE]
-                pipe = self.redis_client.pipeline()
-                for key in batch_keys:
-                    pipe.get(key)
-                results = pipe.execute()
-                for kill_data in results:
-                    if kill_data:
-                        killmails.append(json.loads(kill_data))
-
-        print(f"[Performance] Loaded {len(killmails)} killmails via pipeline in {time.time() - pipe_start:.2f}s")
-
-        if not killmails:
+        """Internal method to build the report from the sliding 24h kill window."""
+        window = KillWindow(self.redis_client).snapshot()
+        print(f"[Performance] Loaded kill window ({window.total_kills} kills, {window.buckets} buckets) in {time.time() - start_time:.3f}s")
+
+        if not window.total_kills:
             return self._empty_pilot_report()
 
-        # PRE-LOAD all system and ship data in BATCH (eliminates N+1 queries)
+        # Location info only for the systems that appear in the report (1 query)
         batch_start = time.time()
+        system_cache = self.get_system_locations_batch(list(window.report_system_ids(hot_zone_limit=15)))
+        print(f"[Performance] Batch loaded {len(system_cache)} systems in {time.time() - batch_start:.3f}s")
 
-        # Collect all unique system IDs
-        all_system_ids = list(set(km.get('solar_system_id') for km in killmails if km.get('solar_system_id')))
-
-        # Collect all unique ship type IDs
-        all_ship_type_ids = list(set(km.get('ship_type_id') for km in killmails if km.get('ship_type_id')))
-
-        # Batch load system locations (1 query instead of N)
-        system_cache = self.get_system_locations_batch(all_system_ids)
-        print(f"[Performance] Batch loaded {len(system_cache)} systems in {time.time() - batch_start:.2f}s")
-
-        # Batch load ship info (1 query instead of N)
-        ship_start = time.time()
-        ship_cache = self.get_ship_info_batch(all_ship_type_ids)
-        print(f"[Performance] Batch loaded {len(ship_cache)} ship types in {time.time() - ship_start:.2f}s")
-
-        # Calculate all intelligence sections (using caches)
+        # Calculate all intelligence sections from the pre-aggregated window
         calc_start = time.time()
-        timeline = self.calculate_hourly_timeline(killmails)
+        timeline = window.timeline_section()
         peak_activity = self.find_peak_activity(timeline)
-        hot_zones = self.extract_hot_zones(killmails, limit=15, system_cache=system_cache, ship_cache=ship_cache)
-        capital_kills = self.extract_capital_kills(killmails, system_cache=system_cache, ship_cache=ship_cache)
-        high_value_kills = self.extract_high_value_kills(killmails, limit=20, system_cache=system_cache, ship_cache=ship_cache)
-        danger_zones = self.identify_danger_zones(killmails, min_kills=3, system_cache=system_cache, ship_cache=ship_cache)
-        ship_breakdown = self.calculate_ship_breakdown(killmails, ship_cache=ship_cache)
-        print(f"[Performance] Calculated all sections in {time.time() - calc_start:.2f}s")
+        hot_zones = window.hot_zones(system_cache, limit=15)
+        capital_kills = window.capital_section(system_cache)
+        high_value_kills = window.high_value_kills(system_cache, self.get_ship_category, limit=20)
+        danger_zones = window.danger_zones(system_cache, min_kills=3)
+        ship_breakdown = window.ship_breakdown(self.get_ship_category)
+        print(f"[Performance] Calculated all sections in {time.time() - calc_start:.3f}s")
 
         # Calculate global stats
-        total_kills = len(killmails)
-        total_isk = sum(float(km.get('ship_value', 0)) for km in killmails)
+        total_kills = window.total_kills
+        total_isk = window.total_isk
 
         # Build region summary for backwards compatibility
-        region_summary = self._build_region_summary_compat(killmails)
+        region_summary = window.region_summary()
 
         report = {
             'period': '24h',
@@ -150,41 +118,3 @@ class PilotIntelligenceMixin:
             'timeline': [{'hour_utc': h, 'kills': 0, 'isk_destroyed': 0} for h in range(24)],
             'regions': []
         }
-
-    def _build_region_summary_compat(self, killmails: List[Dict]) -> List[Dict]:
-        """Build simplified region summary for backwards compatibility."""
-        # Group kills by region
-        region_data = {}
-        for km in killmails:
-            region_id = km.get('region_id')
-            if not region_id:
-                continue
-
-            if region_id not in region_data:
-                region_data[region_id] = {
-                    'region_id': region_id,
-                    'kills': 0,
-                    'total_isk_destroyed': 0
-                }
-
-            region_data[region_id]['kills'] += 1
-            region_data[region_id]['total_isk_destroyed'] += float(km.get('ship_value', 0))
-
-        # Get region names
-        if region_data:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    region_ids = list(region_data.keys())
-                    cur.execute(
-                        'SELECT "regionID", "regionName" FROM "mapRegions" WHERE "regionID" = ANY(%s)',
-                        (region_ids,)
-                    )
-                    for row in cur.fetchall():
-                        if row[0] in region_data:
-                            region_data[row[0]]['region_name'] = row[1]
-
-        # Convert to list and sort
-        regions = list(region_data.values())
-        regions.sort(key=lambda x: x['kills'], reverse=True)
-
-        return regions
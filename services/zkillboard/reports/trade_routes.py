@@ -12,8 +12,9 @@ import json
 from datetime import datetime
 from typing import Dict, List
 
-from src.route_service import RouteService, TRADE_HUB_SYSTEMS
+from src.route_service import route_service, TRADE_HUB_SYSTEMS
 from .base import REPORT_CACHE_TTL
+from ..system_danger import SystemDangerTracker
 
 
 class TradeRoutesMixin:
@@ -41,8 +42,6 @@ class TradeRoutesMixin:
         except Exception:
             pass
 
-        route_service = RouteService()
-
         # Major trade routes (hub pairs)
         trade_routes = [
             ('jita', 'amarr'),
@@ -52,77 +51,28 @@ class TradeRoutesMixin:
             ('amarr', 'rens'),
         ]
 
-        # Build system danger scores from Redis data
-        system_danger = {}
-        system_kill_count = {}
-        system_total_isk = {}
-        system_gate_camps = set()
-
-        # Get all system timelines
-        system_keys = list(self.redis_client.scan_iter("kill:system:*:timeline"))
-
-        for system_key in system_keys:
-            # Extract system_id from key
-            parts = system_key.split(":")
-            if len(parts) < 3:
-                continue
-            system_id = int(parts[2])
-
-            # Get kills for this system
-            kill_ids = self.redis_client.zrevrange(system_key, 0, -1)
-            if not kill_ids:
-                continue
-
-            kills = []
-            for kill_id in kill_ids:
-                kill_data = self.redis_client.get(f"kill:id:{kill_id}")
-                if kill_data:
-                    kills.append(json.loads(kill_data))
-
-            if not kills:
-                continue
-
-            # Calculate danger metrics
-            kill_count = len(kills)
-            total_isk = sum(k['ship_value'] for k in kills)
-            avg_isk = total_isk / kill_count if kill_count > 0 else 0
-
-            # Detect gate camps (kills with 4+ attackers)
-            gate_camp_kills = sum(1 for k in kills if k.get('attacker_count', 0) >= 4)
-            gate_camp_ratio = gate_camp_kills / kill_count if kill_count > 0 else 0
-
-            # Danger score calculation (0-100)
-            # - Kill frequency: 0-40 points (1 point per kill, capped at 40)
-            # - Average value: 0-30 points (1 point per 100M ISK, capped at 30)
-            # - Gate camps: 0-30 points (30 points if >20% gate camps)
-            danger_score = min(40, kill_count) + \
-                          min(30, int(avg_isk / 100_000_000)) + \
-                          (30 if gate_camp_ratio > 0.2 else 0)
-
-            system_danger[system_id] = danger_score
-            system_kill_count[system_id] = kill_count
-            system_total_isk[system_id] = total_isk
-
-            if gate_camp_ratio > 0.2:
-                system_gate_camps.add(system_id)
-
-        # Calculate routes with danger analysis
-        routes_data = []
-
+        # Calculate the HighSec routes first so only their systems are read
+        routes = []
         for from_hub, to_hub in trade_routes:
-            from_system_id = TRADE_HUB_SYSTEMS[from_hub]
-            to_system_id = TRADE_HUB_SYSTEMS[to_hub]
-
-            # Calculate route (HighSec only)
             route = route_service.find_route(
-                from_system_id,
-                to_system_id,
+                TRADE_HUB_SYSTEMS[from_hub],
+                TRADE_HUB_SYSTEMS[to_hub],
                 avoid_lowsec=True,
                 avoid_nullsec=True
             )
+            if route:
+                routes.append((from_hub, to_hub, route))
+
+        # Danger summaries of all route systems (one pipelined Redis round trip)
+        system_ids = {system['system_id'] for _, _, route in routes for system in route}
+        danger_summaries = SystemDangerTracker(self.redis_client).read(system_ids)
 
-            if not route:
-                continue
+        # Calculate routes with danger analysis
+        routes_data = []
+
+        for from_hub, to_hub, route in routes:
+            from_system_id = TRADE_HUB_SYSTEMS[from_hub]
+            to_system_id = TRADE_HUB_SYSTEMS[to_hub]
 
             # Analyze danger along route
             route_systems = []
@@ -132,10 +82,22 @@ class TradeRoutesMixin:
 
             for system in route:
                 system_id = system['system_id']
-                danger = system_danger.get(system_id, 0)
-                kill_count = system_kill_count.get(system_id, 0)
-                total_isk = system_total_isk.get(system_id, 0)
-                is_gate_camp = system_id in system_gate_camps
+                summary = danger_summaries[system_id]
+                kill_count = summary.kills
+                total_isk = summary.isk_destroyed
+                avg_isk = total_isk / kill_count if kill_count > 0 else 0
+
+                # Gate camps: kills with 4+ attackers
+                gate_camp_ratio = summary.multi_attacker_kills / kill_count if kill_count > 0 else 0
+                is_gate_camp = gate_camp_ratio > 0.2
+
+                # Danger score calculation (0-100)
+                # - Kill frequency: 0-40 points (1 point per kill, capped at 40)
+                # - Average value: 0-30 points (1 point per 100M ISK, capped at 30)
+                # - Gate camps: 0-30 points (30 points if >20% gate camps)
+                danger = min(40, kill_count) + \
+                    min(30, int(avg_isk / 100_000_000)) + \
+                    (30 if is_gate_camp else 0)
 
                 total_danger += danger
 
@@ -17,7 +17,13 @@ from typing import Dict, List, Optional
 import redis
 
 from src.database import get_db_connection
-from src.route_service import RouteService, TRADE_HUB_SYSTEMS
+from services.combat_rollup_service import get_war_matchup, get_coalition_inputs, get_alliance_totals
+from services.coalition_clustering import cluster_coalitions
+from src.services.names import get_name_resolver
+from src.services.sde import get_sde_lookup
+from services.zkillboard.kill_window import KillWindow
+from services.zkillboard.system_danger import SystemDangerTracker
+from src.route_service import route_service, TRADE_HUB_SYSTEMS
 
 
 # Cache Configuration - All reports generated every 6h by cron, TTL 7h for buffer
@@ -89,14 +95,8 @@ class ZKillboardReportsService:
 
     def get_system_security(self, system_id: int) -> float:
         """Get security status for a solar system"""
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    'SELECT security FROM "mapSolarSystems" WHERE "solarSystemID" = %s',
-                    (system_id,)
-                )
-                result = cur.fetchone()
-                return float(result[0]) if result else 0.0
+        security = get_sde_lookup().system_security(system_id)
+        return security if security is not None else 0.0
 
     def get_ship_class(self, ship_type_id: int) -> Optional[str]:
         """
@@ -106,47 +106,39 @@ class ZKillboardReportsService:
                  'logistics', 'stealth_bomber', 'industrial', 'hauler', 'mining', 'capsule',
                  'other', or None
         """
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    'SELECT "groupID" FROM "invTypes" WHERE "typeID" = %s',
-                    (ship_type_id,)
-                )
-                result = cur.fetchone()
-                if not result:
-                    return None
-
-                group_id = result[0]
-
-                # Classify based on group (order matters - most specific first)
-                if group_id in SHIP_CATEGORIES.get('capsule', []):
-                    return 'capsule'
-                elif group_id in SHIP_CATEGORIES.get('titan', []) + SHIP_CATEGORIES.get('supercarrier', []) + \
-                             SHIP_CATEGORIES.get('carrier', []) + SHIP_CATEGORIES.get('dreadnought', []) + \
-                             SHIP_CATEGORIES.get('force_auxiliary', []):
-                    return 'capital'
-                elif group_id in SHIP_CATEGORIES.get('battleship', []):
-                    return 'battleship'
-                elif group_id in SHIP_CATEGORIES.get('battlecruiser', []):
-                    return 'battlecruiser'
-                elif group_id in SHIP_CATEGORIES.get('cruiser', []):
-                    return 'cruiser'
-                elif group_id in SHIP_CATEGORIES.get('destroyer', []):
-                    return 'destroyer'
-                elif group_id in SHIP_CATEGORIES.get('frigate', []):
-                    return 'frigate'
-                elif group_id in SHIP_CATEGORIES.get('logistics', []):
-                    return 'logistics'
-                elif group_id in SHIP_CATEGORIES.get('stealth_bomber', []):
-                    return 'stealth_bomber'
-                elif group_id in SHIP_CATEGORIES.get('freighter', []):
-                    return 'hauler'
-                elif group_id in SHIP_CATEGORIES.get('exhumer', []):
-                    return 'mining'
-                elif group_id in SHIP_CATEGORIES.get('industrial', []):
-                    return 'industrial'
-                else:
-                    return 'other'
+        group_id = get_sde_lookup().type_group(ship_type_id)
+        if group_id is None:
+            return None
+
+        # Classify based on group (order matters - most specific first)
+        if group_id in SHIP_CATEGORIES.get('capsule', []):
+            return 'capsule'
+        elif group_id in SHIP_CATEGORIES.get('titan', []) + SHIP_CATEGORIES.get('supercarrier', []) + \
+                     SHIP_CATEGORIES.get('carrier', []) + SHIP_CATEGORIES.get('dreadnought', []) + \
+                     SHIP_CATEGORIES.get('force_auxiliary', []):
+            return 'capital'
+        elif group_id in SHIP_CATEGORIES.get('battleship', []):
+            return 'battleship'
+        elif group_id in SHIP_CATEGORIES.get('battlecruiser', []):
+            return 'battlecruiser'
+        elif group_id in SHIP_CATEGORIES.get('cruiser', []):
+            return 'cruiser'
+        elif group_id in SHIP_CATEGORIES.get('destroyer', []):
+            return 'destroyer'
+        elif group_id in SHIP_CATEGORIES.get('frigate', []):
+            return 'frigate'
+        elif group_id in SHIP_CATEGORIES.get('logistics', []):
+            return 'logistics'
+        elif group_id in SHIP_CATEGORIES.get('stealth_bomber', []):
+            return 'stealth_bomber'
+        elif group_id in SHIP_CATEGORIES.get('freighter', []):
+            return 'hauler'
+        elif group_id in SHIP_CATEGORIES.get('exhumer', []):
+            return 'mining'
+        elif group_id in SHIP_CATEGORIES.get('industrial', []):
+            return 'industrial'
+        else:
+            return 'other'
 
     def get_system_location_info(self, system_id: int, cache: Dict = None) -> Dict:
         """Get full location info for a system (uses cache if provided)"""
@@ -213,23 +205,17 @@ class ZKillboardReportsService:
                 return result
 
     def get_ship_info_batch(self, ship_type_ids: List[int]) -> Dict[int, Dict]:
-        """Batch load ship type info (groupID, name) for multiple ships in ONE query"""
-        if not ship_type_ids:
-            return {}
-
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    'SELECT "typeID", "groupID", "typeName" FROM "invTypes" WHERE "typeID" = ANY(%s)',
-                    (list(set(ship_type_ids)),)
-                )
-                result = {}
-                for row in cur.fetchall():
-                    result[row[0]] = {
-                        'group_id': row[1],
-                        'name': row[2]
-                    }
-                return result
+        """Batch load ship type info (groupID, name) for multiple ships from the SDE lookup"""
+        sde = get_sde_lookup()
+        result = {}
+        for type_id in set(ship_type_ids):
+            group_id = sde.type_group(type_id)
+            if group_id is not None:
+                result[type_id] = {
+                    'group_id': group_id,
+                    'name': sde.type_name(type_id)
+                }
+        return result
 
     def get_ship_category(self, group_id: int) -> str:
         """Determine ship category from group ID"""
@@ -255,230 +241,6 @@ class ZKillboardReportsService:
         ]
         return self.get_ship_category(group_id) in industrial_categories
 
-    def extract_capital_kills(self, killmails: List[Dict],
-                              system_cache: Dict = None, ship_cache: Dict = None) -> Dict:
-        """Extract and categorize capital kills (uses caches if provided)"""
-        capitals = {
-            'titans': {'count': 0, 'total_isk': 0, 'kills': []},
-            'supercarriers': {'count': 0, 'total_isk': 0, 'kills': []},
-            'carriers': {'count': 0, 'total_isk': 0, 'kills': []},
-            'dreadnoughts': {'count': 0, 'total_isk': 0, 'kills': []},
-            'force_auxiliaries': {'count': 0, 'total_isk': 0, 'kills': []}
-        }
-
-        for km in killmails:
-            ship_type_id = km.get('ship_type_id')
-            if not ship_type_id:
-                continue
-
-            # Use cached ship info or skip
-            ship_info = ship_cache.get(ship_type_id, {}) if ship_cache else {}
-            if not ship_info:
-                continue
-
-            group_id = ship_info.get('group_id')
-            if not group_id:
-                continue
-
-            category = self.get_ship_category(group_id)
-
-            if category not in ['titan', 'supercarrier', 'carrier', 'dreadnought', 'force_auxiliary']:
-                continue
-
-            # Get system info from cache
-            system_id = km.get('solar_system_id')
-            system_info = system_cache.get(system_id, {}) if system_cache else {}
-
-            kill_data = {
-                'killmail_id': km.get('killmail_id'),
-                'ship_name': ship_info.get('name', 'Unknown'),
-                'victim': km.get('victim_character_id', 0),  # Character ID
-                'isk_destroyed': float(km.get('ship_value', 0)),
-                'system_name': system_info.get('system_name', 'Unknown'),
-                'region_name': system_info.get('region_name', 'Unknown'),
-                'security_status': system_info.get('security_status', 0.0),
-                'time_utc': km.get('killmail_time', '')
-            }
-
-            # Add to appropriate category
-            key = category + 's' if category != 'force_auxiliary' else 'force_auxiliaries'
-            if key in capitals:
-                capitals[key]['count'] += 1
-                capitals[key]['total_isk'] += kill_data['isk_destroyed']
-                capitals[key]['kills'].append(kill_data)
-
-        # Sort kills by ISK value within each category
-        for cat_data in capitals.values():
-            cat_data['kills'].sort(key=lambda x: x['isk_destroyed'], reverse=True)
-
-        return capitals
-
-    def extract_high_value_kills(self, killmails: List[Dict], limit: int = 20,
-                                 system_cache: Dict = None, ship_cache: Dict = None) -> List[Dict]:
-        """Extract top N highest value kills (uses caches if provided)"""
-        high_value = []
-
-        for km in killmails:
-            system_id = km.get('solar_system_id')
-            system_info = system_cache.get(system_id, {}) if system_cache else {}
-
-            isk_value = float(km.get('ship_value', 0))
-            security = system_info.get('security_status', 0.0)
-
-            ship_type_id = km.get('ship_type_id', 0)
-            ship_info = ship_cache.get(ship_type_id, {}) if ship_cache else {}
-            group_id = ship_info.get('group_id', 0)
-
-            # Gank detection: high-value kill in HighSec
-            is_gank = security >= 0.5 and isk_value > 1_000_000_000  # 1B ISK threshold
-
-            kill_data = {
-                'killmail_id': km.get('killmail_id'),
-                'isk_destroyed': isk_value,
-                'ship_type': self.get_ship_category(group_id) if group_id else 'unknown',
-                'ship_name': ship_info.get('name', 'Unknown'),
-                'victim': km.get('victim_character_id', 0),
-                'system_id': system_id,
-                'system_name': system_info.get('system_name', 'Unknown'),
-                'region_name': system_info.get('region_name', 'Unknown'),
-                'security_status': security,
-                'is_gank': is_gank,
-                'time_utc': km.get('killmail_time', '')
-            }
-
-            high_value.append(kill_data)
-
-        # Sort by ISK value and take top N
-        high_value.sort(key=lambda x: x['isk_destroyed'], reverse=True)
-
-        # Add rank
-        for idx, kill in enumerate(high_value[:limit], 1):
-            kill['rank'] = idx
-
-        return high_value[:limit]
-
-    def identify_danger_zones(self, killmails: List[Dict], min_kills: int = 3,
-                              system_cache: Dict = None, ship_cache: Dict = None) -> List[Dict]:
-        """Identify systems where industrials/freighters are dying (uses caches if provided)"""
-        system_industrial_kills = {}
-
-        for km in killmails:
-            ship_type_id = km.get('ship_type_id')
-            if not ship_type_id:
-                continue
-
-            # Use cached ship info
-            ship_info = ship_cache.get(ship_type_id, {}) if ship_cache else {}
-            group_id = ship_info.get('group_id')
-            if not group_id or not self.is_industrial_ship(group_id):
-                continue
-
-            system_id = km.get('solar_system_id')
-            if not system_id:
-                continue
-
-            if system_id not in system_industrial_kills:
-                # Use cached system info
-                system_info = system_cache.get(system_id, {}) if system_cache else {}
-                system_industrial_kills[system_id] = {
-                    'system_name': system_info.get('system_name', 'Unknown'),
-                    'region_name': system_info.get('region_name', 'Unknown'),
-                    'security_status': system_info.get('security_status', 0.0),
-                    'industrials_killed': 0,
-                    'freighters_killed': 0,
-                    'total_value': 0,
-                    'kills': []
-                }
-
-            isk_value = float(km.get('ship_value', 0))
-            system_industrial_kills[system_id]['total_value'] += isk_value
-            system_industrial_kills[system_id]['kills'].append(km)
-
-            # Count by type (group_id already loaded from cache above)
-            if self.get_ship_category(group_id) == 'freighter':
-                system_industrial_kills[system_id]['freighters_killed'] += 1
-            else:
-                system_industrial_kills[system_id]['industrials_killed'] += 1
-
-        # Filter systems with minimum kills and calculate warning levels
-        danger_zones = []
-        for sys_id, data in system_industrial_kills.items():
-            total_kills = data['industrials_killed'] + data['freighters_killed']
-            if total_kills < min_kills:
-                continue
-
-            # Warning level based on kills and value
-            if total_kills >= 20 or data['total_value'] > 50_000_000_000:
-                warning_level = 'EXTREME'
-            elif total_kills >= 10 or data['total_value'] > 20_000_000_000:
-                warning_level = 'HIGH'
-            else:
-                warning_level = 'MODERATE'
-
-            data['warning_level'] = warning_level
-            # Remove kills array (not needed in output)
-            del data['kills']
-            danger_zones.append(data)
-
-        # Sort by total value
-        danger_zones.sort(key=lambda x: x['total_value'], reverse=True)
-
-        return danger_zones
-
-    def calculate_ship_breakdown(self, killmails: List[Dict], ship_cache: Dict = None) -> Dict:
-        """Calculate kills and ISK by ship category (uses cache if provided)"""
-        breakdown = {}
-
-        for km in killmails:
-            ship_type_id = km.get('ship_type_id', 0)
-            ship_info = ship_cache.get(ship_type_id, {}) if ship_cache else {}
-            group_id = ship_info.get('group_id', 0)
-            category = self.get_ship_category(group_id) if group_id else 'other'
-
-            if category not in breakdown:
-                breakdown[category] = {
-                    'count': 0,
-                    'total_isk': 0
-                }
-
-            breakdown[category]['count'] += 1
-            breakdown[category]['total_isk'] += float(km.get('ship_value', 0))
-
-        # Sort by ISK value
-        sorted_breakdown = dict(sorted(
-            breakdown.items(),
-            key=lambda x: x[1]['total_isk'],
-            reverse=True
-        ))
-
-        return sorted_breakdown
-
-    def calculate_hourly_timeline(self, killmails: List[Dict]) -> List[Dict]:
-        """Calculate kills and ISK per hour (UTC)"""
-        hourly_data = {hour: {'hour_utc': hour, 'kills': 0, 'isk_destroyed': 0}
-                       for hour in range(24)}
-
-        for km in killmails:
-            time_str = km.get('killmail_time', '')
-            if not time_str:
-                continue
-
-            try:
-                # Parse ISO 8601 timestamp
-                dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                hour = dt.hour
-
-                hourly_data[hour]['kills'] += 1
-                hourly_data[hour]['isk_destroyed'] += float(km.get('ship_value', 0))
-            except:
-                continue
-
-        # Convert to list and sort by hour
-        timeline = list(hourly_data.values())
-        timeline.sort(key=lambda x: x['hour_utc'])
-
-        return timeline
-
     def find_peak_activity(self, timeline: List[Dict]) -> Dict:
         """Find hour with most kills"""
         if not timeline:
@@ -491,63 +253,6 @@ class ZKillboardReportsService:
             'isk_per_hour': peak['isk_destroyed']
         }
 
-    def extract_hot_zones(self, killmails: List[Dict], limit: int = 15,
-                          system_cache: Dict = None, ship_cache: Dict = None) -> List[Dict]:
-        """Extract top N most active systems (uses caches if provided)"""
-        system_activity = {}
-
-        for km in killmails:
-            system_id = km.get('solar_system_id')
-            if not system_id:
-                continue
-
-            if system_id not in system_activity:
-                # Use cached system info or fetch individually (fallback)
-                system_info = system_cache.get(system_id, {}) if system_cache else self.get_system_location_info(system_id)
-                system_activity[system_id] = {
-                    'system_id': system_id,
-                    'system_name': system_info.get('system_name', 'Unknown'),
-                    'region_name': system_info.get('region_name', 'Unknown'),
-                    'constellation_name': system_info.get('constellation_name', 'Unknown'),
-                    'security_status': system_info.get('security_status', 0.0),
-                    'kills': 0,
-                    'total_isk_destroyed': 0,
-                    'ship_types': {},
-                    'flags': []
-                }
-
-            system_activity[system_id]['kills'] += 1
-            system_activity[system_id]['total_isk_destroyed'] += float(km.get('ship_value', 0))
-
-            # Track ship types (use cached ship names)
-            ship_type_id = km.get('ship_type_id')
-            ship_name = ship_cache.get(ship_type_id, {}).get('name', 'Unknown') if ship_cache else 'Unknown'
-            if ship_name not in system_activity[system_id]['ship_types']:
-                system_activity[system_id]['ship_types'][ship_name] = 0
-            system_activity[system_id]['ship_types'][ship_name] += 1
-
-        # Determine dominant ship type and flags for each system
-        for sys_data in system_activity.values():
-            if sys_data['ship_types']:
-                dominant = max(sys_data['ship_types'].items(), key=lambda x: x[1])
-                sys_data['dominant_ship_type'] = dominant[0]
-            else:
-                sys_data['dominant_ship_type'] = 'Unknown'
-
-            # Add flags
-            if sys_data['kills'] >= 20:
-                sys_data['flags'].append('high_activity')
-            if sys_data['total_isk_destroyed'] > 10_000_000_000:  # 10B
-                sys_data['flags'].append('high_value')
-
-            # Remove ship_types dict (not needed in output)
-            del sys_data['ship_types']
-
-        # Sort by kills and take top N
-        hot_zones = sorted(system_activity.values(), key=lambda x: x['kills'], reverse=True)[:limit]
-
-        return hot_zones
-
     def build_pilot_intelligence_report(self) -> Dict:
         """Build complete pilot intelligence battle report (with cache)"""
         import time
@@ -571,69 +276,37 @@ class ZKillboardReportsService:
         return self._build_pilot_intelligence_report_internal(start_time, None)
 
     def _build_pilot_intelligence_report_internal(self, start_time: float, cache_key: str = None) -> Dict:
-        """Internal method to build the report"""
+        """Internal method to build the report from the sliding 24h kill window"""
         import time
 
-        # Get all killmails from Redis using PIPELINE for bulk loading
-        kill_keys = list(self.redis_client.scan_iter("kill:id:*"))
-        print(f"[Performance] Found {len(kill_keys)} killmail keys in {time.time() - start_time:.2f}s")
-
-        # Use pipeline for bulk fetch (10-100x faster than individual gets)
-        pipe_start = time.time()
-        killmails = []
-        if kill_keys:
-            # Process in batches to avoid memory issues
-            BATCH_SIZE = 1000
-            for i in range(0, len(kill_keys), BATCH_SIZE):
-                batch_keys = kill_keys[i:i + BATCH_SIZE]
-                pipe = self.redis_client.pipeline()
-                for key in batch_keys:
-                    pipe.get(key)
-                results = pipe.execute()
-                for kill_data in results:
-                    if kill_data:
-                        killmails.append(json.loads(kill_data))
-
-        print(f"[Performance] Loaded {len(killmails)} killmails via pipeline in {time.time() - pipe_start:.2f}s")
+        window = KillWindow(self.redis_client).snapshot()
+        print(f"[Performance] Loaded kill window ({window.total_kills} kills, {window.buckets} buckets) in {time.time() - start_time:.3f}s")
 
-        if not killmails:
+        if not window.total_kills:
             return self._empty_pilot_report()
 
-        # PRE-LOAD all system and ship data in BATCH (eliminates N+1 queries)
+        # Location info only for the systems that appear in the report (1 query)
         batch_start = time.time()
+        system_cache = self.get_system_locations_batch(list(window.report_system_ids(hot_zone_limit=15)))
+        print(f"[Performance] Batch loaded {len(system_cache)} systems in {time.time() - batch_start:.3f}s")
 
-        # Collect all unique system IDs
-        all_system_ids = list(set(km.get('solar_system_id') for km in killmails if km.get('solar_system_id')))
-
-        # Collect all unique ship type IDs
-        all_ship_type_ids = list(set(km.get('ship_type_id') for km in killmails if km.get('ship_type_id')))
-
-        # Batch load system locations (1 query instead of N)
-        system_cache = self.get_system_locations_batch(all_system_ids)
-        print(f"[Performance] Batch loaded {len(system_cache)} systems in {time.time() - batch_start:.2f}s")
-
-        # Batch load ship info (1 query instead of N)
-        ship_start = time.time()
-        ship_cache = self.get_ship_info_batch(all_ship_type_ids)
-        print(f"[Performance] Batch loaded {len(ship_cache)} ship types in {time.time() - ship_start:.2f}s")
-
-        # Calculate all intelligence sections (using caches)
+        # Calculate all intelligence sections from the pre-aggregated window
         calc_start = time.time()
-        timeline = self.calculate_hourly_timeline(killmails)
+        timeline = window.timeline_section()
         peak_activity = self.find_peak_activity(timeline)
-        hot_zones = self.extract_hot_zones(killmails, limit=15, system_cache=system_cache, ship_cache=ship_cache)
-        capital_kills = self.extract_capital_kills(killmails, system_cache=system_cache, ship_cache=ship_cache)
-        high_value_kills = self.extract_high_value_kills(killmails, limit=20, system_cache=system_cache, ship_cache=ship_cache)
-        danger_zones = self.identify_danger_zones(killmails, min_kills=3, system_cache=system_cache, ship_cache=ship_cache)
-        ship_breakdown = self.calculate_ship_breakdown(killmails, ship_cache=ship_cache)
-        print(f"[Performance] Calculated all sections in {time.time() - calc_start:.2f}s")
+        hot_zones = window.hot_zones(system_cache, limit=15)
+        capital_kills = window.capital_section(system_cache)
+        high_value_kills = window.high_value_kills(system_cache, self.get_ship_category, limit=20)
+        danger_zones = window.danger_zones(system_cache, min_kills=3)
+        ship_breakdown = window.ship_breakdown(self.get_ship_category)
+        print(f"[Performance] Calculated all sections in {time.time() - calc_start:.3f}s")
 
         # Calculate global stats
-        total_kills = len(killmails)
-        total_isk = sum(float(km.get('ship_value', 0)) for km in killmails)
+        total_kills = window.total_kills
+        total_isk = window.total_isk
 
         # Build region summary for backwards compatibility
-        region_summary = self._build_region_summary_compat(killmails)
+        region_summary = window.region_summary()
 
         report = {
             'period': '24h',
@@ -681,44 +354,6 @@ class ZKillboardReportsService:
             'regions': []
         }
 
-    def _build_region_summary_compat(self, killmails: List[Dict]) -> List[Dict]:
-        """Build simplified region summary for backwards compatibility"""
-        # Group kills by region
-        region_data = {}
-        for km in killmails:
-            region_id = km.get('region_id')
-            if not region_id:
-                continue
-
-            if region_id not in region_data:
-                region_data[region_id] = {
-                    'region_id': region_id,
-                    'kills': 0,
-                    'total_isk_destroyed': 0
-                }
-
-            region_data[region_id]['kills'] += 1
-            region_data[region_id]['total_isk_destroyed'] += float(km.get('ship_value', 0))
-
-        # Get region names
-        if region_data:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    region_ids = list(region_data.keys())
-                    cur.execute(
-                        'SELECT "regionID", "regionName" FROM "mapRegions" WHERE "regionID" = ANY(%s)',
-                        (region_ids,)
-                    )
-                    for row in cur.fetchall():
-                        if row[0] in region_data:
-                            region_data[row[0]]['region_name'] = row[1]
-
-        # Convert to list and sort
-        regions = list(region_data.values())
-        regions.sort(key=lambda x: x['kills'], reverse=True)
-
-        return regions
-
     def get_war_profiteering_report(self, limit: int = 20) -> Dict:
         """
         Generate war profiteering report with market opportunities.
@@ -836,7 +471,7 @@ class ZKillboardReportsService:
 
     async def get_alliance_name(self, alliance_id: int) -> str:
         """
-        Get alliance name from ESI API with Redis caching.
+        Get alliance name via the shared name resolver.
 
         Args:
             alliance_id: Alliance ID
@@ -844,36 +479,7 @@ class ZKillboardReportsService:
         Returns:
             Alliance name or fallback string
         """
-        if not alliance_id:
-            return "Unknown"
-
-        cache_key = f"esi:alliance:{alliance_id}:name"
-
-        # Try cache first
-        try:
-            cached = self.redis.get(cache_key)
-            if cached:
-                return cached if isinstance(cached, str) else cached.decode('utf-8')
-        except Exception:
-            pass
-
-        # Fetch from ESI
-        try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://esi.evetech.net/latest/alliances/{alliance_id}/"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        name = data.get("name", f"Alliance {alliance_id}")
-                        # Cache for 7 days
-                        try:
-                            self.redis.setex(cache_key, 7 * 24 * 60 * 60, name)
-                        except Exception:
-                            pass
-                        return name
-        except Exception as e:
-            print(f"Error fetching alliance {alliance_id}: {e}")
-        return f"Alliance {alliance_id}"
+        return await get_name_resolver().aget_name('alliance', alliance_id)
 
     async def get_alliance_war_tracker_postgres(self, limit: int = 10, days: int = 7) -> Dict:
         """
@@ -924,6 +530,9 @@ class ZKillboardReportsService:
                     if not wars:
                         return {"wars": [], "total_wars": 0}
 
+                    # Resolve all alliance names in one batch
+                    await get_name_resolver().aget_names('alliance', [w[1] for w in wars] + [w[2] for w in wars])
+
                     war_data = []
                     for war in wars:
                         war_id, alliance_a, alliance_b, first_kill, last_kill, total_kills, total_isk, duration, status, \
@@ -933,33 +542,10 @@ class ZKillboardReportsService:
                         alliance_a_name = await self.get_alliance_name(alliance_a)
                         alliance_b_name = await self.get_alliance_name(alliance_b)
 
-                        # Count actual ship losses (not multi-alliance inflated stats)
-                        cur.execute("""
-                            SELECT
-                                COUNT(*) FILTER (WHERE k.victim_alliance_id = %s) as alliance_a_losses,
-                                COUNT(*) FILTER (WHERE k.victim_alliance_id = %s) as alliance_b_losses,
-                                COALESCE(SUM(k.ship_value) FILTER (WHERE k.victim_alliance_id = %s), 0) as alliance_a_isk_lost,
-                                COALESCE(SUM(k.ship_value) FILTER (WHERE k.victim_alliance_id = %s), 0) as alliance_b_isk_lost
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND (
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                                  OR
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                              )
-                        """, (alliance_a, alliance_b, alliance_a, alliance_b, days,
-                              alliance_a, alliance_b, alliance_b, alliance_a))
-
-                        actual_result = cur.fetchone()
-                        actual_losses_a, actual_losses_b, actual_isk_lost_a, actual_isk_lost_b = actual_result
+                        # Ship losses between the two alliances (hourly matchup rollup)
+                        matchup = get_war_matchup(cur, alliance_a, alliance_b, days)
+                        actual_losses_a, actual_losses_b = matchup["losses_a"], matchup["losses_b"]
+                        actual_isk_lost_a, actual_isk_lost_b = matchup["isk_lost_a"], matchup["isk_lost_b"]
 
                         # Use actual counts instead of war_daily_stats
                         recent_kills_a = actual_losses_b  # Alliance A killed B's ships
@@ -984,33 +570,9 @@ class ZKillboardReportsService:
                         else:
                             overall_winner = "contested"
 
-                        # Get system hotspots for this war (count each ship once)
-                        cur.execute("""
-                            SELECT
-                                k.solar_system_id,
-                                COUNT(*) as kill_count
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND (
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                                  OR
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                              )
-                            GROUP BY k.solar_system_id
-                            ORDER BY kill_count DESC
-                            LIMIT 5
-                        """, (days, alliance_a, alliance_b, alliance_b, alliance_a))
-
+                        # System hotspots for this war (count each ship once)
                         system_hotspots = []
-                        for sys_id, kill_count in cur.fetchall():
+                        for sys_id, kill_count in matchup["system_kills"]:
                             sys_info = self.get_system_location_info(sys_id)
                             system_hotspots.append({
                                 "system_id": sys_id,
@@ -1020,98 +582,11 @@ class ZKillboardReportsService:
                                 "region_name": sys_info.get("region_name", "Unknown")
                             })
 
-                        # Get ship class breakdown (count each kill once, not per attacker)
-                        cur.execute("""
-                            SELECT
-                                CASE
-                                    WHEN ig."groupID" IN (29) THEN 'capsule'
-                                    WHEN ig."groupID" IN (30, 659, 547, 485, 1538) THEN 'capital'
-                                    WHEN ig."groupID" IN (27, 898, 900) THEN 'battleship'
-                                    WHEN ig."groupID" IN (419, 540) THEN 'battlecruiser'
-                                    WHEN ig."groupID" IN (26, 358, 894, 906, 963) THEN 'cruiser'
-                                    WHEN ig."groupID" IN (420, 541, 1305) THEN 'destroyer'
-                                    WHEN ig."groupID" IN (25, 324, 831, 893) THEN 'frigate'
-                                    WHEN ig."groupID" IN (832) THEN 'logistics'
-                                    WHEN ig."groupID" IN (834) THEN 'stealth_bomber'
-                                    WHEN ig."groupID" IN (513, 902) THEN 'hauler'
-                                    WHEN ig."groupID" IN (543) THEN 'mining'
-                                    WHEN ig."groupID" IN (28, 463) THEN 'industrial'
-                                    ELSE 'other'
-                                END as ship_class,
-                                k.victim_alliance_id,
-                                COUNT(*) as count
-                            FROM killmails k
-                            LEFT JOIN "invTypes" it ON it."typeID" = k.ship_type_id
-                            LEFT JOIN "invGroups" ig ON ig."groupID" = it."groupID"
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND (
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                                  OR
-                                  (k.victim_alliance_id = %s AND EXISTS (
-                                      SELECT 1 FROM killmail_attackers ka
-                                      WHERE ka.killmail_id = k.killmail_id
-                                      AND ka.alliance_id = %s
-                                  ))
-                              )
-                            GROUP BY 1, 2
-                        """, (days, alliance_a, alliance_b, alliance_b, alliance_a))
-
-                        ship_classes_a = {
-                            "capital": 0, "battleship": 0, "battlecruiser": 0, "cruiser": 0,
-                            "destroyer": 0, "frigate": 0, "logistics": 0, "stealth_bomber": 0,
-                            "industrial": 0, "hauler": 0, "mining": 0, "capsule": 0, "other": 0
-                        }
-                        ship_classes_b = {
-                            "capital": 0, "battleship": 0, "battlecruiser": 0, "cruiser": 0,
-                            "destroyer": 0, "frigate": 0, "logistics": 0, "stealth_bomber": 0,
-                            "industrial": 0, "hauler": 0, "mining": 0, "capsule": 0, "other": 0
-                        }
-
-                        for ship_class, victim_alliance_id, count in cur.fetchall():
-                            if victim_alliance_id == alliance_a:
-                                ship_classes_a[ship_class] = count
-                            elif victim_alliance_id == alliance_b:
-                                ship_classes_b[ship_class] = count
-
-                        # Get biggest loss for alliance A
-                        cur.execute("""
-                            SELECT k.ship_type_id, k.ship_value
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND k.victim_alliance_id = %s
-                              AND EXISTS (
-                                  SELECT 1 FROM killmail_attackers ka
-                                  WHERE ka.killmail_id = k.killmail_id
-                                  AND ka.alliance_id = %s
-                              )
-                            ORDER BY k.ship_value DESC
-                            LIMIT 1
-                        """, (days, alliance_a, alliance_b))
-
-                        result_a = cur.fetchone()
-                        biggest_loss_a = {"ship_type_id": result_a[0], "value": int(result_a[1])} if result_a else {"ship_type_id": None, "value": 0}
-
-                        # Get biggest loss for alliance B
-                        cur.execute("""
-                            SELECT k.ship_type_id, k.ship_value
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND k.victim_alliance_id = %s
-                              AND EXISTS (
-                                  SELECT 1 FROM killmail_attackers ka
-                                  WHERE ka.killmail_id = k.killmail_id
-                                  AND ka.alliance_id = %s
-                              )
-                            ORDER BY k.ship_value DESC
-                            LIMIT 1
-                        """, (days, alliance_b, alliance_a))
-
-                        result_b = cur.fetchone()
-                        biggest_loss_b = {"ship_type_id": result_b[0], "value": int(result_b[1])} if result_b else {"ship_type_id": None, "value": 0}
+                        # Ship class breakdown and biggest losses
+                        ship_classes_a = matchup["ship_classes_a"]
+                        ship_classes_b = matchup["ship_classes_b"]
+                        biggest_loss_a = matchup["biggest_loss_a"]
+                        biggest_loss_b = matchup["biggest_loss_b"]
 
                         # Calculate war intensity score
                         isk_score = (total_isk / 1e9) * 0.6
@@ -1406,34 +881,14 @@ class ZKillboardReportsService:
         # Sort by war intensity score (ISK-weighted activity)
         war_data.sort(key=lambda x: x['war_intensity_score'], reverse=True)
 
-        # Get alliance names from ESI
-        if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
-
-        for war in war_data[:limit]:
-            # Get alliance A name
-            try:
-                url = f"https://esi.evetech.net/latest/alliances/{war['alliance_a_id']}/"
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=3)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        war['alliance_a_name'] = data.get('name', f"Alliance {war['alliance_a_id']}")
-                    else:
-                        war['alliance_a_name'] = f"Alliance {war['alliance_a_id']}"
-            except:
-                war['alliance_a_name'] = f"Alliance {war['alliance_a_id']}"
-
-            # Get alliance B name
-            try:
-                url = f"https://esi.evetech.net/latest/alliances/{war['alliance_b_id']}/"
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=3)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        war['alliance_b_name'] = data.get('name', f"Alliance {war['alliance_b_id']}")
-                    else:
-                        war['alliance_b_name'] = f"Alliance {war['alliance_b_id']}"
-            except:
-                war['alliance_b_name'] = f"Alliance {war['alliance_b_id']}"
+        # Get alliance names
+        shown = war_data[:limit]
+        names = await get_name_resolver().aget_names(
+            'alliance', [w['alliance_a_id'] for w in shown] + [w['alliance_b_id'] for w in shown]
+        )
+        for war in shown:
+            war['alliance_a_name'] = names.get(war['alliance_a_id'], f"Alliance {war['alliance_a_id']}")
+            war['alliance_b_name'] = names.get(war['alliance_b_id'], f"Alliance {war['alliance_b_id']}")
 
         return {
             "wars": war_data[:limit],
@@ -1463,8 +918,6 @@ class ZKillboardReportsService:
         except Exception:
             pass
 
-        route_service = RouteService()
-
         # Major trade routes (hub pairs)
         trade_routes = [
             ('jita', 'amarr'),
@@ -1474,78 +927,29 @@ class ZKillboardReportsService:
             ('amarr', 'rens'),
         ]
 
-        # Build system danger scores from Redis data
-        system_danger = {}
-        system_kill_count = {}
-        system_total_isk = {}
-        system_gate_camps = set()
-
-        # Get all system timelines
-        system_keys = list(self.redis_client.scan_iter("kill:system:*:timeline"))
-
-        for system_key in system_keys:
-            # Extract system_id from key
-            parts = system_key.split(":")
-            if len(parts) < 3:
-                continue
-            system_id = int(parts[2])
-
-            # Get kills for this system
-            kill_ids = self.redis_client.zrevrange(system_key, 0, -1)
-            if not kill_ids:
-                continue
-
-            kills = []
-            for kill_id in kill_ids:
-                kill_data = self.redis_client.get(f"kill:id:{kill_id}")
-                if kill_data:
-                    kills.append(json.loads(kill_data))
-
-            if not kills:
-                continue
-
-            # Calculate danger metrics
-            kill_count = len(kills)
-            total_isk = sum(k['ship_value'] for k in kills)
-            avg_isk = total_isk / kill_count if kill_count > 0 else 0
-
-            # Detect gate camps (kills with 4+ attackers)
-            gate_camp_kills = sum(1 for k in kills if k.get('attacker_count', 0) >= 4)
-            gate_camp_ratio = gate_camp_kills / kill_count if kill_count > 0 else 0
-
-            # Danger score calculation (0-100)
-            # - Kill frequency: 0-40 points (1 point per kill, capped at 40)
-            # - Average value: 0-30 points (1 point per 100M ISK, capped at 30)
-            # - Gate camps: 0-30 points (30 points if >20% gate camps)
-            danger_score = min(40, kill_count) + \
-                          min(30, int(avg_isk / 100_000_000)) + \
-                          (30 if gate_camp_ratio > 0.2 else 0)
-
-            system_danger[system_id] = danger_score
-            system_kill_count[system_id] = kill_count
-            system_total_isk[system_id] = total_isk
+        # Calculate the HighSec routes first so only their systems are read
+        routes = []
+        for from_hub, to_hub in trade_routes:
+            route = route_service.find_route(
+                TRADE_HUB_SYSTEMS[from_hub],
+                TRADE_HUB_SYSTEMS[to_hub],
+                avoid_lowsec=True,
+                avoid_nullsec=True
+            )
+            if route:
+                routes.append((from_hub, to_hub, route))
 
-            if gate_camp_ratio > 0.2:
-                system_gate_camps.add(system_id)
+        # Danger summaries of all route systems (one pipelined Redis round trip)
+        system_ids = {system['system_id'] for _, _, route in routes for system in route}
+        danger_summaries = SystemDangerTracker(self.redis_client).read(system_ids)
 
         # Calculate routes with danger analysis
         routes_data = []
 
-        for from_hub, to_hub in trade_routes:
+        for from_hub, to_hub, route in routes:
             from_system_id = TRADE_HUB_SYSTEMS[from_hub]
             to_system_id = TRADE_HUB_SYSTEMS[to_hub]
 
-            # Calculate route (HighSec only)
-            route = route_service.find_route(
-                from_system_id,
-                to_system_id,
-                avoid_lowsec=True,
-                avoid_nullsec=True
-            )
-
-            if not route:
-                continue
-
             # Analyze danger along route
             route_systems = []
             total_danger = 0
@@ -1554,10 +958,22 @@ class ZKillboardReportsService:
 
             for system in route:
                 system_id = system['system_id']
-                danger = system_danger.get(system_id, 0)
-                kill_count = system_kill_count.get(system_id, 0)
-                total_isk = system_total_isk.get(system_id, 0)
-                is_gate_camp = system_id in system_gate_camps
+                summary = danger_summaries[system_id]
+                kill_count = summary.kills
+                total_isk = summary.isk_destroyed
+                avg_isk = total_isk / kill_count if kill_count > 0 else 0
+
+                # Gate camps: kills with 4+ attackers
+                gate_camp_ratio = summary.multi_attacker_kills / kill_count if kill_count > 0 else 0
+                is_gate_camp = gate_camp_ratio > 0.2
+
+                # Danger score calculation (0-100)
+                # - Kill frequency: 0-40 points (1 point per kill, capped at 40)
+                # - Average value: 0-30 points (1 point per 100M ISK, capped at 30)
+                # - Gate camps: 0-30 points (30 points if >20% gate camps)
+                danger = min(40, kill_count) + \
+                    min(30, int(avg_isk / 100_000_000)) + \
+                    (30 if is_gate_camp else 0)
 
                 total_danger += danger
 
@@ -1635,7 +1051,8 @@ class ZKillboardReportsService:
         """
         Generate comprehensive 24h battle report by region.
 
-        Cached for 10 minutes to reduce computation load.
+        Built from the pre-aggregated sliding 24h kill window (see
+        kill_window.KillWindow); cached to share it between requests.
 
         Returns:
             Dict with regional stats and global summary
@@ -1646,135 +1063,11 @@ class ZKillboardReportsService:
         if cached:
             return json.loads(cached)
 
-        # Generate fresh report
-        # Get all region timelines
-        region_keys = list(self.redis_client.scan_iter("kill:region:*:timeline"))
-
-        regional_stats = []
-        total_kills_global = 0
-        total_isk_global = 0.0
-
-        for region_key in region_keys:
-            # Extract region_id from key
-            parts = region_key.split(":")
-            if len(parts) < 3:
-                continue
-            region_id = int(parts[2])
-
-            # Get all kills for this region
-            kill_ids = self.redis_client.zrevrange(region_key, 0, -1)
-
-            if not kill_ids:
-                continue
-
-            kills = []
-            for kill_id in kill_ids:
-                kill_data = self.redis_client.get(f"kill:id:{kill_id}")
-                if kill_data:
-                    kills.append(json.loads(kill_data))
-
-            if not kills:
-                continue
-
-            # Calculate region stats
-            kill_count = len(kills)
-            total_isk = sum(k['ship_value'] for k in kills)
-            avg_isk = total_isk / kill_count if kill_count > 0 else 0
-
-            # Get top 3 systems
-            system_counts = {}
-            for kill in kills:
-                system_id = kill['solar_system_id']
-                system_counts[system_id] = system_counts.get(system_id, 0) + 1
-            top_systems = sorted(system_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-
-            # Get top 3 ship types
-            ship_counts = {}
-            for kill in kills:
-                ship_id = kill['ship_type_id']
-                ship_counts[ship_id] = ship_counts.get(ship_id, 0) + 1
-            top_ships = sorted(ship_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-
-            # Get top 5 destroyed items/modules
-            item_counts = {}
-            for kill in kills:
-                for item in kill.get('destroyed_items', []):
-                    item_id = item['item_type_id']
-                    quantity = item['quantity']
-                    item_counts[item_id] = item_counts.get(item_id, 0) + quantity
-            top_items = sorted(item_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-
-            # Get region name from DB
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        'SELECT "regionName" FROM "mapRegions" WHERE "regionID" = %s',
-                        (region_id,)
-                    )
-                    row = cur.fetchone()
-                    region_name = row[0] if row else f"Region {region_id}"
-
-                    # Get system names
-                    top_systems_with_names = []
-                    for system_id, count in top_systems:
-                        cur.execute(
-                            'SELECT "solarSystemName" FROM "mapSolarSystems" WHERE "solarSystemID" = %s',
-                            (system_id,)
-                        )
-                        row = cur.fetchone()
-                        system_name = row[0] if row else f"System {system_id}"
-                        top_systems_with_names.append({
-                            "system_id": system_id,
-                            "system_name": system_name,
-                            "kills": count
-                        })
-
-                    # Get ship names
-                    top_ships_with_names = []
-                    for ship_id, count in top_ships:
-                        cur.execute(
-                            'SELECT "typeName" FROM "invTypes" WHERE "typeID" = %s',
-                            (ship_id,)
-                        )
-                        row = cur.fetchone()
-                        ship_name = row[0] if row else f"Ship {ship_id}"
-                        top_ships_with_names.append({
-                            "ship_type_id": ship_id,
-                            "ship_name": ship_name,
-                            "losses": count
-                        })
-
-                    # Get item/module names
-                    top_items_with_names = []
-                    for item_id, quantity in top_items:
-                        cur.execute(
-                            'SELECT "typeName" FROM "invTypes" WHERE "typeID" = %s',
-                            (item_id,)
-                        )
-                        row = cur.fetchone()
-                        item_name = row[0] if row else f"Item {item_id}"
-                        top_items_with_names.append({
-                            "item_type_id": item_id,
-                            "item_name": item_name,
-                            "quantity_destroyed": quantity
-                        })
-
-            regional_stats.append({
-                "region_id": region_id,
-                "region_name": region_name,
-                "kills": kill_count,
-                "total_isk_destroyed": total_isk,
-                "avg_kill_value": avg_isk,
-                "top_systems": top_systems_with_names,
-                "top_ships": top_ships_with_names,
-                "top_destroyed_items": top_items_with_names
-            })
-
-            total_kills_global += kill_count
-            total_isk_global += total_isk
-
-        # Sort regions by kills descending
-        regional_stats.sort(key=lambda x: x['kills'], reverse=True)
+        # Generate fresh report from the sliding 24h kill window
+        window = KillWindow(self.redis_client).snapshot()
+        regional_stats = window.battle_regions()  # Sorted by kills descending
+        total_kills_global = window.total_kills
+        total_isk_global = window.total_isk
 
         # Find most active and most expensive regions
         most_active_region = regional_stats[0] if regional_stats else None
@@ -1818,213 +1111,38 @@ class ZKillboardReportsService:
         try:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    # Step 1: Find alliance pairs that fight TOGETHER (co-attackers)
-                    cur.execute("""
-                        WITH recent_kills AS (
-                            SELECT killmail_id
-                            FROM killmails
-                            WHERE killmail_time >= NOW() - INTERVAL '%s days'
-                        )
-                        SELECT
-                            ka1.alliance_id as alliance_a,
-                            ka2.alliance_id as alliance_b,
-                            COUNT(DISTINCT ka1.killmail_id) as fights_together
-                        FROM killmail_attackers ka1
-                        JOIN killmail_attackers ka2
-                            ON ka1.killmail_id = ka2.killmail_id
-                            AND ka1.alliance_id < ka2.alliance_id
-                        WHERE ka1.killmail_id IN (SELECT killmail_id FROM recent_kills)
-                          AND ka1.alliance_id IS NOT NULL
-                          AND ka2.alliance_id IS NOT NULL
-                          AND ka1.alliance_id != ka2.alliance_id
-                        GROUP BY ka1.alliance_id, ka2.alliance_id
-                        HAVING COUNT(DISTINCT ka1.killmail_id) >= %s
-                        ORDER BY fights_together DESC
-                    """, (days, min_fights_together))
-
-                    alliance_pairs = cur.fetchall()
-
-                    # Step 2: Get alliance activity stats (for sizing and naming)
-                    cur.execute("""
-                        SELECT
-                            alliance_id,
-                            COUNT(*) as total_activity
-                        FROM (
-                            SELECT ka.alliance_id
-                            FROM killmail_attackers ka
-                            JOIN killmails k ON k.killmail_id = ka.killmail_id
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND ka.alliance_id IS NOT NULL
-                            UNION ALL
-                            SELECT k.victim_alliance_id as alliance_id
-                            FROM killmails k
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND k.victim_alliance_id IS NOT NULL
-                        ) combined
-                        GROUP BY alliance_id
-                        HAVING COUNT(*) >= 10
-                        ORDER BY total_activity DESC
-                    """, (days, days))
-
-                    alliance_activity = {row[0]: row[1] for row in cur.fetchall()}
-
-                    # Step 3: Build coalition clusters using Union-Find algorithm
-                    parent = {}
-
-                    def find(x):
-                        if x not in parent:
-                            parent[x] = x
-                        if parent[x] != x:
-                            parent[x] = find(parent[x])
-                        return parent[x]
-
-                    def union(x, y):
-                        px, py = find(x), find(y)
-                        if px != py:
-                            # Merge smaller into larger (by activity)
-                            if alliance_activity.get(px, 0) >= alliance_activity.get(py, 0):
-                                parent[py] = px
-                            else:
-                                parent[px] = py
-
-                    # Step 3b: Also get alliance pairs that fight AGAINST each other
-                    cur.execute("""
-                        SELECT
-                            ka.alliance_id as attacker_alliance,
-                            k.victim_alliance_id as victim_alliance,
-                            COUNT(*) as fights_against
-                        FROM killmail_attackers ka
-                        JOIN killmails k ON k.killmail_id = ka.killmail_id
-                        WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                          AND ka.alliance_id IS NOT NULL
-                          AND k.victim_alliance_id IS NOT NULL
-                          AND ka.alliance_id != k.victim_alliance_id
-                        GROUP BY ka.alliance_id, k.victim_alliance_id
-                        HAVING COUNT(*) >= %s
-                    """, (days, min_fights_together))
-
-                    conflicts_raw = cur.fetchall()
-
-                    # Build conflict map: (alliance_a, alliance_b) -> fights_against
-                    conflict_map = {}
-                    for attacker, victim, count in conflicts_raw:
-                        pair = tuple(sorted([attacker, victim]))
-                        conflict_map[pair] = conflict_map.get(pair, 0) + count
-
-                    # Build cooperation map from alliance_pairs
-                    coop_map = {}
-                    for alliance_a, alliance_b, fights_together in alliance_pairs:
-                        pair = (alliance_a, alliance_b)
-                        coop_map[pair] = fights_together
-
-                    # Build set of confirmed enemies (fight against each other significantly)
-                    confirmed_enemies = set()
-                    for pair, fights_against in conflict_map.items():
-                        if fights_against >= 20:  # If they've fought 20+ times, they're enemies
-                            confirmed_enemies.add(pair)
-
-                    # Modified union that respects enemy relationships
-                    def safe_union(x, y):
-                        """Union only if not enemies (direct or transitive)"""
-                        px, py = find(x), find(y)
-                        if px == py:
-                            return  # Already in same coalition
-
-                        # Check if ANY member of coalition X is enemy of ANY member of coalition Y
-                        members_x = [a for a, r in parent.items() if find(a) == px]
-                        members_y = [a for a, r in parent.items() if find(a) == py]
-
-                        if not members_x:
-                            members_x = [px]
-                        if not members_y:
-                            members_y = [py]
-
-                        for mx in members_x:
-                            for my in members_y:
-                                enemy_pair = tuple(sorted([mx, my]))
-                                if enemy_pair in confirmed_enemies:
-                                    return  # Can't merge - they're enemies
-
-                        # Safe to merge
-                        if alliance_activity.get(px, 0) >= alliance_activity.get(py, 0):
-                            parent[py] = px
-                        else:
-                            parent[px] = py
-
-                    # Union alliances that are TRUE allies (fight together, rarely against)
-                    for alliance_a, alliance_b, fights_together in alliance_pairs:
-                        pair = tuple(sorted([alliance_a, alliance_b]))
-                        fights_against = conflict_map.get(pair, 0)
-
-                        # Skip if they're confirmed enemies
-                        if pair in confirmed_enemies:
-                            continue
-
-                        # Must cooperate significantly more than conflict
-                        if fights_against > 0 and fights_together < fights_against * 5:
-                            continue
-
-                        # Must actually cooperate significantly
-                        activity_a = alliance_activity.get(alliance_a, 0)
-                        activity_b = alliance_activity.get(alliance_b, 0)
-                        min_activity = min(activity_a, activity_b)
-
-                        is_significant = min_activity > 0 and fights_together >= min_activity * 0.10
+                    # Step 1-2: Co-attacking pairs, alliance activity and conflicts from the hourly rollups
+                    alliance_pairs, alliance_activity, conflicts_raw = get_coalition_inputs(
+                        cur, days, min_fights_together
+                    )
 
-                        if is_significant:
-                            safe_union(alliance_a, alliance_b)
+                    # Step 3: Cluster allies, never merging confirmed enemies into one coalition
+                    clusters = cluster_coalitions(alliance_pairs, alliance_activity, conflicts_raw)
 
-                    # Step 4: Group alliances by coalition root
-                    coalitions_raw = {}
-                    for alliance_id in alliance_activity.keys():
-                        root = find(alliance_id)
-                        if root not in coalitions_raw:
-                            coalitions_raw[root] = []
-                        coalitions_raw[root].append(alliance_id)
+                    # Resolve the names shown below in one batch
+                    named = [m for c in clusters if len(c) > 1 for m in c[:10]]
+                    named += sorted((c[0] for c in clusters if len(c) == 1),
+                                    key=lambda a: alliance_activity.get(a, 0), reverse=True)[:10]
+                    await get_name_resolver().aget_names('alliance', named)
 
-                    # Step 5: Get names for alliances and build final coalition data
+                    # Step 4: Get names for alliances and build final coalition data
                     coalitions = []
                     unaffiliated = []
 
-                    for root, members in coalitions_raw.items():
+                    for members in clusters:
                         if len(members) < 2:
                             # Single alliance = unaffiliated
                             unaffiliated.extend(members)
                             continue
 
-                        # Sort members by activity, largest first
-                        members.sort(key=lambda x: alliance_activity.get(x, 0), reverse=True)
-
+                        # Members are sorted by activity, largest first
                         # Get name of largest alliance for coalition name
                         leader_name = await self.get_alliance_name(members[0])
 
                         # Get coalition aggregate stats
-                        member_ids = tuple(members[:50])  # Limit to top 50 for query
-                        cur.execute("""
-                            SELECT
-                                COUNT(DISTINCT ka.killmail_id) as total_kills,
-                                COALESCE(SUM(DISTINCT k.ship_value), 0) as isk_destroyed
-                            FROM killmail_attackers ka
-                            JOIN killmails k ON k.killmail_id = ka.killmail_id
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND ka.alliance_id IN %s
-                        """, (days, member_ids))
-                        kills_result = cur.fetchone()
-
-                        cur.execute("""
-                            SELECT
-                                COUNT(*) as total_losses,
-                                COALESCE(SUM(ship_value), 0) as isk_lost
-                            FROM killmails
-                            WHERE killmail_time >= NOW() - INTERVAL '%s days'
-                              AND victim_alliance_id IN %s
-                        """, (days, member_ids))
-                        losses_result = cur.fetchone()
-
-                        total_kills = kills_result[0] if kills_result else 0
-                        isk_destroyed = int(kills_result[1]) if kills_result else 0
-                        total_losses = losses_result[0] if losses_result else 0
-                        isk_lost = int(losses_result[1]) if losses_result else 0
+                        totals = get_alliance_totals(cur, members[:50], days)  # Limit to top 50
+                        total_kills, isk_destroyed = totals["total_kills"], totals["isk_destroyed"]
+                        total_losses, isk_lost = totals["total_losses"], totals["isk_lost"]
 
                         efficiency = (isk_destroyed / (isk_destroyed + isk_lost) * 100) if (isk_destroyed + isk_lost) > 0 else 50
 
@@ -2061,29 +1179,14 @@ class ZKillboardReportsService:
                     for alliance_id in unaffiliated[:10]:
                         name = await self.get_alliance_name(alliance_id)
 
-                        cur.execute("""
-                            SELECT COUNT(*) as kills
-                            FROM killmail_attackers ka
-                            JOIN killmails k ON k.killmail_id = ka.killmail_id
-                            WHERE k.killmail_time >= NOW() - INTERVAL '%s days'
-                              AND ka.alliance_id = %s
-                        """, (days, alliance_id))
-                        kills = cur.fetchone()[0]
-
-                        cur.execute("""
-                            SELECT COUNT(*) as losses, COALESCE(SUM(ship_value), 0) as isk_lost
-                            FROM killmails
-                            WHERE killmail_time >= NOW() - INTERVAL '%s days'
-                              AND victim_alliance_id = %s
-                        """, (days, alliance_id))
-                        loss_result = cur.fetchone()
+                        totals = get_alliance_totals(cur, [alliance_id], days)
 
                         unaffiliated_data.append({
                             "alliance_id": alliance_id,
                             "name": name,
-                            "kills": kills,
-                            "losses": loss_result[0],
-                            "isk_lost": int(loss_result[1]),
+                            "kills": totals["total_kills"],
+                            "losses": totals["total_losses"],
+                            "isk_lost": totals["isk_lost"],
                             "activity": alliance_activity.get(alliance_id, 0)
                         })
 
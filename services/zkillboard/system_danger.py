@@ -0,0 +1,157 @@
+"""
+System Danger - Per-system danger summaries for route and gate-camp checks
+
+Maintained at kill-ingest time next to the kill:system:*:timeline keys:
+
+- kill:system:{id}:danger  HASH of hour-bucket counters '<bucket>:kills',
+                           '<bucket>:isk' and '<bucket>:multi' (kills with
+                           MULTI_ATTACKER_MIN+ attackers)
+- kill:system:{id}:recent  LIST of the RECENT_KILLS newest kill summaries
+                           (arrival bucket, value, attackers, victim corp,
+                           victim ship and attacker ship groups)
+
+read() fetches any number of systems in one pipelined round trip, so the
+trade-route danger map and the gate-camp detector only touch the systems
+they ask about instead of loading every cached killmail.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import redis
+
+from src.services.sde import get_sde_lookup
+
+if TYPE_CHECKING:
+    from services.zkillboard.live_service import LiveKillmail
+
+
+WINDOW_HOURS = 24
+BUCKET_SECONDS = 3600
+DANGER_TTL = (WINDOW_HOURS + 1) * BUCKET_SECONDS
+RECENT_KILLS = 20            # Kills kept for gate-camp detection (newest first)
+MULTI_ATTACKER_MIN = 4       # Attackers on a kill that count towards gate camping
+
+COUNTERS = ("kills", "isk", "multi")
+
+
+def danger_key(system_id: int) -> str:
+    return f"kill:system:{system_id}:danger"
+
+
+def recent_key(system_id: int) -> str:
+    return f"kill:system:{system_id}:recent"
+
+
+@dataclass
+class SystemDanger:
+    """Danger summary of one system over the window"""
+    system_id: int
+    kills: int = 0
+    isk_destroyed: float = 0.0
+    multi_attacker_kills: int = 0
+    recent: List[Dict] = field(default_factory=list)  # Newest first
+
+    @property
+    def unique_victim_corps(self) -> int:
+        """Distinct victim corporations among the recent kills"""
+        return len({k['victim_corporation_id'] for k in self.recent if k['victim_corporation_id']})
+
+    def attacker_group_kills(self) -> Dict[int, int]:
+        """Recent kills per attacker ship group (a group counts once per kill)"""
+        counts: Dict[int, int] = {}
+        for kill in self.recent:
+            for group_id in kill['attacker_groups']:
+                counts[group_id] = counts.get(group_id, 0) + 1
+        return counts
+
+    def top_kills(self, limit: int = 5) -> List[Dict]:
+        """Most expensive recent kills"""
+        return sorted(self.recent, key=lambda k: k['ship_value'], reverse=True)[:limit]
+
+
+class SystemDangerTracker:
+    """Redis-backed per-system danger summaries"""
+
+    def __init__(self, redis_client: redis.Redis, window_hours: int = WINDOW_HOURS):
+        self.redis_client = redis_client
+        self.window_hours = window_hours
+
+    def record(self, kill: 'LiveKillmail', timestamp: Optional[float] = None):
+        """
+        Add a stored kill to its system's summary
+
+        Must be called once per kill (after the duplicate check): the
+        counters are not idempotent.
+        """
+        bucket = int(timestamp if timestamp is not None else time.time()) // BUCKET_SECONDS
+        value = float(kill.ship_value or 0)
+        attacker_groups = sorted({
+            int(group_id) for group_id in get_sde_lookup().groups_of(kill.attacker_ship_types) if group_id
+        })
+
+        summary = json.dumps({
+            'bucket': bucket,
+            'killmail_id': kill.killmail_id,
+            'killmail_time': kill.killmail_time,
+            'ship_type_id': kill.ship_type_id,
+            'ship_value': value,
+            'attacker_count': kill.attacker_count,
+            'victim_corporation_id': kill.victim_corporation_id,
+            'attacker_groups': attacker_groups,
+        })
+
+        key = danger_key(kill.solar_system_id)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hincrby(key, f"{bucket}:kills", 1)
+        pipe.hincrbyfloat(key, f"{bucket}:isk", value)
+        if kill.attacker_count >= MULTI_ATTACKER_MIN:
+            pipe.hincrby(key, f"{bucket}:multi", 1)
+        # Drop the buckets that left the window since the previous kill
+        pipe.hdel(key, *[
+            f"{old}:{counter}"
+            for old in range(bucket - 2 * self.window_hours, bucket - self.window_hours + 1)
+            for counter in COUNTERS
+        ])
+        pipe.expire(key, DANGER_TTL)
+
+        # The list TTL is refreshed by every kill, so read() drops entries
+        # older than the window by their arrival bucket
+        pipe.lpush(recent_key(kill.solar_system_id), summary)
+        pipe.ltrim(recent_key(kill.solar_system_id), 0, RECENT_KILLS - 1)
+        pipe.expire(recent_key(kill.solar_system_id), DANGER_TTL)
+        pipe.execute()
+
+    def read(self, system_ids: Iterable[int], now: Optional[float] = None) -> Dict[int, SystemDanger]:
+        """Danger summaries of the given systems (one pipelined round trip)"""
+        system_ids = list(dict.fromkeys(system_ids))
+        first_bucket = int(now if now is not None else time.time()) // BUCKET_SECONDS - self.window_hours + 1
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for system_id in system_ids:
+            pipe.hgetall(danger_key(system_id))
+            pipe.lrange(recent_key(system_id), 0, -1)
+        results = iter(pipe.execute())
+
+        summaries = {}
+        for system_id in system_ids:
+            counters, recent = next(results), next(results)
+            kills = (json.loads(k) for k in recent)
+            danger = SystemDanger(
+                system_id=system_id,
+                recent=[k for k in kills if k.get('bucket', 0) >= first_bucket]
+            )
+            for name, value in (counters or {}).items():
+                bucket, counter = name.split(":")
+                if int(bucket) < first_bucket:
+                    continue
+                if counter == "kills":
+                    danger.kills += int(value)
+                elif counter == "isk":
+                    danger.isk_destroyed += float(value)
+                elif counter == "multi":
+                    danger.multi_attacker_kills += int(value)
+            summaries[system_id] = danger
+        return summaries
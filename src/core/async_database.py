@@ -0,0 +1,158 @@
+"""Async PostgreSQL access for async routes (psycopg3 connection pool)."""
+
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from psycopg.rows import dict_row, tuple_row
+from psycopg_pool import AsyncConnectionPool
+
+from config import (
+    DB_CONFIG, ASYNC_DB_POOL_MIN_CONN, ASYNC_DB_POOL_MAX_CONN, DB_POOL_TIMEOUT,
+    DB_STATEMENT_TIMEOUT_MS, DB_PGBOUNCER_MODE
+)
+
+Params = Optional[Sequence[Any]]
+
+
+class AsyncSession:
+    """Queries on one pooled connection; SQL uses %s placeholders like psycopg2."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def fetch_all(self, query: str, params: Params = None, as_dict: bool = False) -> List[Any]:
+        """All rows, as tuples (default) or dicts."""
+        async with self.conn.cursor(row_factory=dict_row if as_dict else tuple_row) as cur:
+            await cur.execute(query, params)
+            return await cur.fetchall()
+
+    async def fetch_one(self, query: str, params: Params = None, as_dict: bool = False) -> Optional[Any]:
+        """First row or None."""
+        async with self.conn.cursor(row_factory=dict_row if as_dict else tuple_row) as cur:
+            await cur.execute(query, params)
+            return await cur.fetchone()
+
+    async def fetch_val(self, query: str, params: Params = None) -> Any:
+        """First column of the first row, or None."""
+        row = await self.fetch_one(query, params)
+        return row[0] if row else None
+
+    async def execute(self, query: str, params: Params = None) -> int:
+        """Run a statement; returns the affected row count."""
+        async with self.conn.cursor() as cur:
+            await cur.execute(query, params)
+            return cur.rowcount
+
+
+class AsyncDatabase:
+    """
+    Process-wide async pool.
+
+    Each fetch_*/execute call checks out a connection for one statement.
+    Use session() to run several statements on the same connection; the
+    session commits on success and rolls back on error.
+    """
+
+    def __init__(self, db_config: Dict[str, Any], min_conn: int = 2, max_conn: int = 10,
+                 timeout: float = 30.0, statement_timeout_ms: int = 0, pgbouncer: bool = False):
+        kwargs: Dict[str, Any] = {
+            "host": db_config.get("host"),
+            "port": db_config.get("port", 5432),
+            "dbname": db_config.get("database"),
+            "user": db_config.get("user"),
+            "password": db_config.get("password"),
+        }
+        if pgbouncer:
+            # Transaction pooling: no startup options, no server-side prepared statements
+            kwargs["prepare_threshold"] = None
+        elif statement_timeout_ms:
+            kwargs["options"] = f"-c statement_timeout={int(statement_timeout_ms)}"
+
+        self.pool = AsyncConnectionPool(
+            kwargs=kwargs,
+            min_size=min_conn,
+            max_size=max_conn,
+            timeout=timeout,
+            check=AsyncConnectionPool.check_connection,
+            open=False,
+        )
+        self._statement_timeout_ms = statement_timeout_ms if pgbouncer else 0
+
+    async def open(self) -> None:
+        await self.pool.open()
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """One pooled connection for several statements (one transaction)."""
+        async with self.pool.connection() as conn:
+            session = AsyncSession(conn)
+            if self._statement_timeout_ms:
+                await session.execute("SET LOCAL statement_timeout = %s", (int(self._statement_timeout_ms),))
+            yield session
+
+    async def fetch_all(self, query: str, params: Params = None, as_dict: bool = False) -> List[Any]:
+        async with self.session() as session:
+            return await session.fetch_all(query, params, as_dict)
+
+    async def fetch_one(self, query: str, params: Params = None, as_dict: bool = False) -> Optional[Any]:
+        async with self.session() as session:
+            return await session.fetch_one(query, params, as_dict)
+
+    async def fetch_val(self, query: str, params: Params = None) -> Any:
+        async with self.session() as session:
+            return await session.fetch_val(query, params)
+
+    async def execute(self, query: str, params: Params = None) -> int:
+        async with self.session() as session:
+            return await session.execute(query, params)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, waiting requests and connection errors (psycopg_pool counters)."""
+        return self.pool.get_stats()
+
+
+# Global instance (opened on app startup or first use)
+_async_db: Optional[AsyncDatabase] = None
+_async_db_lock = threading.Lock()
+
+
+def _create_async_database() -> AsyncDatabase:
+    global _async_db
+    with _async_db_lock:
+        if _async_db is None:
+            _async_db = AsyncDatabase(
+                DB_CONFIG,
+                min_conn=ASYNC_DB_POOL_MIN_CONN,
+                max_conn=ASYNC_DB_POOL_MAX_CONN,
+                timeout=DB_POOL_TIMEOUT,
+                statement_timeout_ms=DB_STATEMENT_TIMEOUT_MS,
+                pgbouncer=DB_PGBOUNCER_MODE,
+            )
+    return _async_db
+
+
+async def init_async_database() -> AsyncDatabase:
+    """Open the global pool (called from the app startup hook)."""
+    db = _create_async_database()
+    await db.open()
+    return db
+
+
+async def get_async_database() -> AsyncDatabase:
+    """Get the global pool, opening it on first use. Usable as a FastAPI dependency."""
+    db = _async_db or _create_async_database()
+    if db.pool.closed:
+        await db.open()
+    return db
+
+
+async def close_async_database() -> None:
+    """Close the global pool (called from the app shutdown hook)."""
+    global _async_db
+    if _async_db is not None:
+        await _async_db.close()
+        _async_db = None
@@ -1,5 +1,6 @@
 """Database connection pool management."""
 
+import threading
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
@@ -7,15 +8,16 @@ import psycopg2
 from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 
-from src.core.config import Settings
+from src.core.config import Settings, get_settings
 
 
 class DatabasePool:
-    """Manages PostgreSQL connection pool."""
+    """Manages PostgreSQL connection pool (thread-safe)."""
 
     def __init__(self, settings: Settings, min_conn: int = 1, max_conn: int = 20):
         """Initialize connection pool."""
         self.settings = settings
+        self._lock = threading.Lock()
         self.pool = psycopg2.pool.SimpleConnectionPool(
             min_conn,
             max_conn,
@@ -29,11 +31,13 @@ class DatabasePool:
     @contextmanager
     def get_connection(self):
         """Get a connection from the pool as context manager."""
-        conn = self.pool.getconn()
+        with self._lock:
+            conn = self.pool.getconn()
         try:
             yield conn
         finally:
-            self.pool.putconn(conn)
+            with self._lock:
+                self.pool.putconn(conn)
 
     def execute_query(
         self,
@@ -55,19 +59,24 @@ class DatabasePool:
             self.pool.closeall()
 
 
-# Global pool instance (initialized on app startup)
+# Global pool instance (initialized on app startup or first use)
 _db_pool: Optional[DatabasePool] = None
+_db_pool_lock = threading.Lock()
 
 
 def init_database_pool(settings: Settings) -> DatabasePool:
     """Initialize global database pool."""
     global _db_pool
-    _db_pool = DatabasePool(settings)
+    with _db_pool_lock:
+        _db_pool = DatabasePool(settings)
     return _db_pool
 
 
 def get_database_pool() -> DatabasePool:
-    """Get global database pool instance."""
+    """Get global database pool instance, creating it from settings on first use."""
+    global _db_pool
     if _db_pool is None:
-        raise RuntimeError("Database pool not initialized. Call init_database_pool first.")
+        with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = DatabasePool(get_settings())
     return _db_pool
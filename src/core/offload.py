@@ -0,0 +1,75 @@
+"""Bounded thread pools for blocking calls made from async routes."""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from config import OFFLOAD_WORKERS, OFFLOAD_REPORT_WORKERS
+
+T = TypeVar("T")
+
+# Lane name -> max threads. Heavy report builders get their own lane so a
+# burst of report requests cannot take every thread from the short queries.
+LANES = {
+    "default": OFFLOAD_WORKERS,
+    "reports": OFFLOAD_REPORT_WORKERS,
+}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {lane: {"submitted": 0, "in_flight": 0, "peak_in_flight": 0} for lane in LANES}
+
+
+def _get_executor(lane: str) -> ThreadPoolExecutor:
+    executor = _executors.get(lane)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(lane)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=LANES[lane], thread_name_prefix=f"offload-{lane}")
+                _executors[lane] = executor
+    return executor
+
+
+async def _run(lane: str, func: Callable[..., T], args: tuple, kwargs: dict) -> T:
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    stats = _stats[lane]
+    with _lock:
+        stats["submitted"] += 1
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+    try:
+        return await loop.run_in_executor(_get_executor(lane), call)
+    finally:
+        with _lock:
+            stats["in_flight"] -= 1
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call (psycopg2, requests, sync Redis) off the event loop."""
+    return await _run("default", func, args, kwargs)
+
+
+async def run_report(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a heavy report builder on the reports lane."""
+    return await _run("reports", func, args, kwargs)
+
+
+def get_offload_stats() -> Dict[str, Dict[str, int]]:
+    """Submitted, in-flight and peak in-flight calls per lane."""
+    with _lock:
+        return {lane: {"max_workers": LANES[lane], **stats} for lane, stats in _stats.items()}
+
+
+def shutdown_offload_pools() -> None:
+    """Stop all lanes (waits for running calls)."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
@@ -1,23 +1,317 @@
 """
 EVE Co-Pilot Database Module
 Handles all PostgreSQL SDE queries
+
+get_db_connection() hands out connections from one process-wide pool
+(created on first use, recreated after fork) instead of connecting per call.
 """
 
+import os
+import time
+import threading
 import psycopg2
+import psycopg2.pool
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
 from psycopg2.extras import RealDictCursor
 from contextlib import contextmanager
 from typing import Optional, Dict, List, Any
-from config import DB_CONFIG
+from config import (
+    DB_CONFIG, DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, DB_POOL_TIMEOUT,
+    DB_POOL_IDLE_TIMEOUT, DB_POOL_HEALTHCHECK_INTERVAL, DB_STATEMENT_TIMEOUT_MS,
+    DB_PGBOUNCER_MODE
+)
+
+
+class PoolTimeout(psycopg2.pool.PoolError):
+    """No connection became free within the pool timeout"""
+
+
+class ConnectionPool:
+    """
+    Thread-safe psycopg2 connection pool with bounded waiting.
+
+    - At most max_conn connections are checked out; further callers wait up
+      to `timeout` seconds, then get PoolTimeout
+    - Connections idle longer than healthcheck_interval are pinged before
+      reuse; closed or broken ones are replaced transparently
+    - Idle connections beyond min_conn are closed after idle_timeout seconds
+    - Returned connections are rolled back, so uncommitted work is dropped
+      exactly as when the connection used to be closed
+    - statement_timeout_ms is set as a startup option, or per transaction
+      with SET LOCAL in pgbouncer mode (transaction pooling rejects startup
+      options and would leak session-level SETs to other clients)
+    """
+
+    def __init__(
+        self,
+        db_config: Dict[str, Any],
+        min_conn: int = 1,
+        max_conn: int = 20,
+        timeout: float = 30.0,
+        idle_timeout: float = 300.0,
+        healthcheck_interval: float = 30.0,
+        statement_timeout_ms: int = 0,
+        pgbouncer: bool = False
+    ):
+        self.db_config = dict(db_config)
+        self.min_conn = min_conn
+        self.max_conn = max(1, max_conn)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.healthcheck_interval = healthcheck_interval
+        self.statement_timeout_ms = statement_timeout_ms
+        self.pgbouncer = pgbouncer
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """Fresh state (also used in a forked child, whose sockets belong to the parent)"""
+        self._pid = os.getpid()
+        self._slots = threading.BoundedSemaphore(self.max_conn)
+        self._idle: List[Any] = []          # LIFO: reuse the warmest connection
+        self._last_used: Dict[int, float] = {}
+        self._overridden: set = set()       # Connections with a per-call statement_timeout
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._healthcheck_failures = 0
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset()
+
+    def _connect(self):
+        kwargs = dict(self.db_config)
+        if self.statement_timeout_ms and not self.pgbouncer:
+            kwargs['options'] = f"-c statement_timeout={int(self.statement_timeout_ms)}"
+        conn = psycopg2.connect(**kwargs)
+        with self._lock:
+            self._created += 1
+        return conn
+
+    def _discard(self, conn):
+        self._overridden.discard(id(conn))
+        self._last_used.pop(id(conn), None)
+        with self._lock:
+            self._discarded += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - self._last_used.get(id(conn), 0.0) < self.healthcheck_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute('SELECT 1')
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            with self._lock:
+                self._healthcheck_failures += 1
+            return False
+
+    def _take_idle(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                conn = self._idle.pop()
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def acquire(self, statement_timeout_ms: Optional[int] = None):
+        """
+        Check out a connection, waiting up to `timeout` seconds when all are busy.
+
+        Args:
+            statement_timeout_ms: Override the pool's statement timeout for
+                this checkout (0 disables it)
+        """
+        self._check_fork()
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            started = time.monotonic()
+            with self._lock:
+                self._waits += 1
+            acquired = slots.acquire(timeout=self.timeout)
+            with self._lock:
+                self._wait_seconds += time.monotonic() - started
+                if not acquired:
+                    self._timeouts += 1
+            if not acquired:
+                raise PoolTimeout(
+                    f"No database connection free after {self.timeout}s "
+                    f"({self.max_conn} in use)"
+                )
+
+        try:
+            conn = self._take_idle() or self._connect()
+            self._apply_statement_timeout(conn, statement_timeout_ms)
+        except Exception:
+            slots.release()
+            raise
+
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        return conn
+
+    def _apply_statement_timeout(self, conn, override: Optional[int]):
+        timeout = self.statement_timeout_ms if override is None else override
+        with conn.cursor() as cur:
+            if self.pgbouncer:
+                if timeout:
+                    # Lasts until the caller's first commit/rollback
+                    cur.execute('SET LOCAL statement_timeout = %s', (int(timeout),))
+            elif override is not None and override != self.statement_timeout_ms:
+                cur.execute('SET statement_timeout = %s', (int(override),))
+                conn.commit()
+                self._overridden.add(id(conn))
+
+    def release(self, conn):
+        """Return a connection; broken ones are closed and replaced on demand"""
+        if self._pid != os.getpid():
+            return
+        keep = not conn.closed
+        if keep:
+            try:
+                status = conn.info.transaction_status
+                if status == TRANSACTION_STATUS_UNKNOWN:
+                    keep = False
+                else:
+                    if status != TRANSACTION_STATUS_IDLE:
+                        conn.rollback()
+                    if id(conn) in self._overridden:
+                        with conn.cursor() as cur:
+                            cur.execute('RESET statement_timeout')
+                        conn.commit()
+                        self._overridden.discard(id(conn))
+                    if conn.autocommit:
+                        conn.autocommit = False
+            except psycopg2.Error:
+                keep = False
+
+        expired = []
+        if keep:
+            now = time.monotonic()
+            with self._lock:
+                self._last_used[id(conn)] = now
+                self._idle.append(conn)
+                # Coldest connections sit at the bottom of the LIFO
+                while (len(self._idle) > self.min_conn
+                       and now - self._last_used.get(id(self._idle[0]), now) > self.idle_timeout):
+                    expired.append(self._idle.pop(0))
+        else:
+            expired.append(conn)
+        for stale in expired:
+            self._discard(stale)
+
+        with self._lock:
+            self._in_use -= 1
+        self._slots.release()
+
+    def close(self):
+        """Close all idle connections (checked-out ones are closed on release)"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._last_used.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, saturation and wait metrics"""
+        with self._lock:
+            return {
+                'max_conn': self.max_conn,
+                'open': self._in_use + len(self._idle),
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'peak_in_use': self._peak_in_use,
+                'saturation': round(self._in_use / self.max_conn, 3),
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'wait_seconds_total': round(self._wait_seconds, 3),
+                'avg_wait_ms': round(self._wait_seconds / self._waits * 1000, 2) if self._waits else 0.0,
+                'timeouts': self._timeouts,
+                'connections_created': self._created,
+                'connections_discarded': self._discarded,
+                'healthcheck_failures': self._healthcheck_failures,
+                'statement_timeout_ms': self.statement_timeout_ms,
+                'pgbouncer_mode': self.pgbouncer,
+            }
+
+
+# Process-wide pool (created on first use)
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_db_pool() -> ConnectionPool:
+    """Get the process-wide connection pool behind get_db_connection()"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    DB_CONFIG,
+                    min_conn=DB_POOL_MIN_CONN,
+                    max_conn=DB_POOL_MAX_CONN,
+                    timeout=DB_POOL_TIMEOUT,
+                    idle_timeout=DB_POOL_IDLE_TIMEOUT,
+                    healthcheck_interval=DB_POOL_HEALTHCHECK_INTERVAL,
+                    statement_timeout_ms=DB_STATEMENT_TIMEOUT_MS,
+                    pgbouncer=DB_PGBOUNCER_MODE
+                )
+    return _pool
+
+
+def get_db_pool_stats() -> Dict[str, Any]:
+    """Metrics of the process-wide pool (empty until first use)"""
+    return _pool.stats() if _pool is not None else {}
+
+
+def close_db_pool():
+    """Close the process-wide pool's idle connections"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
 
 
 @contextmanager
-def get_db_connection():
-    """Context manager for database connections"""
-    conn = psycopg2.connect(**DB_CONFIG)
+def get_db_connection(statement_timeout_ms: Optional[int] = None):
+    """
+    Context manager for database connections (pooled).
+
+    Uncommitted work is rolled back when the block exits.
+
+    Args:
+        statement_timeout_ms: Override DB_STATEMENT_TIMEOUT_MS for this
+            connection, e.g. for long-running jobs (0 disables it)
+    """
+    pool = get_db_pool()
+    conn = pool.acquire(statement_timeout_ms)
     try:
         yield conn
     finally:
-        conn.close()
+        pool.release(conn)
 
 
 def get_item_info(type_id: int) -> dict | None:
@@ -33,52 +327,21 @@ def get_item_info(type_id: int) -> dict | None:
 
 
 def get_item_by_name(name: str, group_id: Optional[int] = None, market_group_id: Optional[int] = None) -> List[Dict[str, Any]]:
-    """Get item by name (case-insensitive partial match), optionally filtered by inventory group or market group"""
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            if market_group_id is not None:
-                # For market groups, find all items in this group and its descendants
-                cur.execute('''
-                    WITH RECURSIVE market_tree AS (
-                        -- Start with the selected market group
-                        SELECT "marketGroupID"
-                        FROM "invMarketGroups"
-                        WHERE "marketGroupID" = %s
-
-                        UNION ALL
-
-                        -- Recursively find all child market groups
-                        SELECT mg."marketGroupID"
-                        FROM "invMarketGroups" mg
-                        INNER JOIN market_tree mt ON mg."parentGroupID" = mt."marketGroupID"
-                    )
-                    SELECT DISTINCT it."typeID", it."typeName", it."groupID", it."volume", it."basePrice"
-                    FROM "invTypes" it
-                    INNER JOIN market_tree mt ON it."marketGroupID" = mt."marketGroupID"
-                    WHERE LOWER(it."typeName") LIKE LOWER(%s)
-                      AND it."published" = 1
-                    ORDER BY it."typeName"
-                    LIMIT 100
-                ''', (market_group_id, f'%{name}%'))
-            elif group_id is not None:
-                # For inventory groups, use groupID directly
-                cur.execute('''
-                    SELECT "typeID", "typeName", "groupID", "volume", "basePrice"
-                    FROM "invTypes"
-                    WHERE "groupID" = %s
-                      AND LOWER("typeName") LIKE LOWER(%s)
-                      AND "published" = 1
-                    ORDER BY "typeName"
-                    LIMIT 50
-                ''', (group_id, f'%{name}%'))
-            else:
-                cur.execute('''
-                    SELECT "typeID", "typeName", "groupID", "volume", "basePrice"
-                    FROM "invTypes"
-                    WHERE LOWER("typeName") LIKE LOWER(%s)
-                    LIMIT 10
-                ''', (f'%{name}%',))
-            return cur.fetchall()
+    """
+    Get item by name (case-insensitive partial match), optionally filtered by inventory group or market group
+
+    Served from the in-memory SDE search index: exact and prefix matches rank
+    first, then published market items. Group filters (market groups include
+    their subgroups) return published types only.
+    """
+    from src.services.sde.search import get_search_index
+
+    index = get_search_index()
+    if market_group_id is not None:
+        return index.search_types(name, limit=100, market_group_id=market_group_id, published_only=True)
+    if group_id is not None:
+        return index.search_types(name, limit=50, group_id=group_id, published_only=True)
+    return index.search_types(name, limit=10)
 
 
 def get_blueprint_materials(type_id: int) -> list:
@@ -158,17 +421,10 @@ def get_items_by_group(group_id: int) -> list:
 
 
 def get_group_by_name(name: str) -> list:
-    """Find groups by name"""
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute('''
-                SELECT g."groupID", g."groupName", c."categoryName"
-                FROM "invGroups" g
-                JOIN "invCategories" c ON g."categoryID" = c."categoryID"
-                WHERE LOWER(g."groupName") LIKE LOWER(%s)
-                LIMIT 20
-            ''', (f'%{name}%',))
-            return cur.fetchall()
+    """Find groups by name (served from the in-memory SDE search index)"""
+    from src.services.sde.search import get_search_index
+
+    return get_search_index().search_groups(name, limit=20)
 
 
 def get_market_groups() -> list:
@@ -2,22 +2,166 @@
 EVE Co-Pilot Killmail Service
 Downloads and processes daily killmail archives from EVE Ref
 Aggregates combat data for War Room analytics
+
+Two ingestion paths:
+- process_date(): download to a temp dir, parse every killmail into a list,
+  aggregate
+- ingest_date() / backfill(): stream the archive from HTTP through tarfile
+  without a member list, parse batches in a process pool into partial
+  aggregates and merge them; backfill runs several days at once on one pool
 """
 
 import os
+import time
 import requests
 import tarfile
 import json
 import tempfile
 import shutil
+import multiprocessing
+import resource
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 from psycopg2.extras import execute_values
 
 from src.database import get_db_connection
 from config import WAR_EVEREF_BASE_URL, WAR_DATA_RETENTION_DAYS
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional: stdlib json is about 2-3x slower
+    _json_loads = json.loads
+
+PARSE_BATCH_SIZE = 1000             # Killmails per process pool task
+PENDING_BATCHES_PER_WORKER = 2      # In-flight batches per day and worker (bounds memory)
+BACKFILL_CONCURRENCY = 3            # Days ingested at the same time
+
+# Partial aggregates: (solar_system_id, ship_type_id) -> [quantity, total_value]
+#                     (solar_system_id, item_type_id) -> quantity
+ShipLosses = Dict[Tuple[int, int], List]
+ItemLosses = Dict[Tuple[int, int], int]
+
+
+def add_killmail(km: Dict, ship_losses: ShipLosses, item_losses: ItemLosses):
+    """Add one parsed killmail to partial ship/item loss aggregates"""
+    victim = km.get('victim', {})
+    solar_system_id = km.get('solar_system_id')
+    ship_type_id = victim.get('ship_type_id')
+
+    if not solar_system_id or not ship_type_id:
+        return
+
+    total_value = km.get('zkb', {}).get('totalValue', 0.0)
+    ship = ship_losses.get((solar_system_id, ship_type_id))
+    if ship is None:
+        ship_losses[(solar_system_id, ship_type_id)] = [1, total_value]
+    else:
+        ship[0] += 1
+        ship[1] += total_value
+
+    # Item losses (from victim's cargo/modules)
+    for item in victim.get('items', []):
+        item_type_id = item.get('item_type_id')
+        quantity_destroyed = item.get('quantity_destroyed', 0)
+
+        if item_type_id and quantity_destroyed > 0:
+            key = (solar_system_id, item_type_id)
+            item_losses[key] = item_losses.get(key, 0) + quantity_destroyed
+
+
+def aggregate_killmail_batch(raw_killmails: List[bytes]) -> Tuple[int, ShipLosses, ItemLosses, int]:
+    """
+    Parse and aggregate a batch of raw killmail JSON documents.
+    Runs in a process pool worker.
+
+    Returns:
+        (killmails parsed, ship losses, item losses, peak RSS of the worker in KB)
+    """
+    ship_losses: ShipLosses = {}
+    item_losses: ItemLosses = {}
+    parsed = 0
+    for raw in raw_killmails:
+        try:
+            km = _json_loads(raw)
+            parsed += 1
+            add_killmail(km, ship_losses, item_losses)
+        except Exception:
+            continue
+    # Forkserver workers are not our children: RUSAGE_CHILDREN never sees them
+    return parsed, ship_losses, item_losses, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def merge_loss_partials(ship_losses: ShipLosses, item_losses: ItemLosses,
+                        part_ships: ShipLosses, part_items: ItemLosses):
+    """Merge partial aggregates into the running totals"""
+    for key, (quantity, value) in part_ships.items():
+        ship = ship_losses.get(key)
+        if ship is None:
+            ship_losses[key] = [quantity, value]
+        else:
+            ship[0] += quantity
+            ship[1] += value
+    for key, quantity in part_items.items():
+        item_losses[key] = item_losses.get(key, 0) + quantity
+
+
+def loss_rows(ship_losses: ShipLosses, item_losses: ItemLosses, date: date,
+              system_region_map: Dict[int, int]) -> Dict:
+    """
+    Aggregates as save_to_database() rows; systems outside the map
+    (wormholes, etc.) are dropped
+    """
+    ship_data = []
+    for (system_id, ship_id), (quantity, total_value) in ship_losses.items():
+        region_id = system_region_map.get(system_id)
+        if region_id:
+            ship_data.append({
+                'date': date,
+                'region_id': region_id,
+                'solar_system_id': system_id,
+                'ship_type_id': ship_id,
+                'quantity': quantity,
+                'total_value_destroyed': total_value
+            })
+
+    item_data = []
+    for (system_id, item_id), quantity in item_losses.items():
+        region_id = system_region_map.get(system_id)
+        if region_id:
+            item_data.append({
+                'date': date,
+                'region_id': region_id,
+                'solar_system_id': system_id,
+                'item_type_id': item_id,
+                'quantity_destroyed': quantity
+            })
+
+    return {
+        'ship_losses': ship_data,
+        'item_losses': item_data
+    }
+
+
+def iter_archive_killmails(fileobj: BinaryIO) -> Iterator[bytes]:
+    """Raw JSON of each killmail in a .tar.bz2 stream, read member by member"""
+    with tarfile.open(fileobj=fileobj, mode='r|bz2') as tar:
+        for member in tar:
+            if member.isfile() and member.name.endswith('.json'):
+                f = tar.extractfile(member)
+                if f:
+                    yield f.read()
+
+
+def create_parse_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Process pool for aggregate_killmail_batch (forkserver: safe with the backfill threads)"""
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context('forkserver')
+    )
+
 
 class KillmailService:
     """Service for downloading and processing EVE killmail data"""
@@ -146,83 +290,26 @@ class KillmailService:
         # Load system->region mapping
         system_region_map = self._get_system_region_map()
 
-        # Aggregation structures
-        # Key: (solar_system_id, ship_type_id) -> {'quantity': int, 'total_value': float}
-        ship_losses = defaultdict(lambda: {'quantity': 0, 'total_value': 0.0})
-
-        # Key: (solar_system_id, item_type_id) -> {'quantity': int}
-        item_losses = defaultdict(lambda: {'quantity': 0})
+        ship_losses: ShipLosses = {}
+        item_losses: ItemLosses = {}
 
         for km in killmails:
             try:
-                # Extract victim info
-                victim = km.get('victim', {})
-                solar_system_id = km.get('solar_system_id')
-                ship_type_id = victim.get('ship_type_id')
-
-                if not solar_system_id or not ship_type_id:
-                    continue
-
-                # Skip if system not in our map (wormholes, etc.)
-                if solar_system_id not in system_region_map:
-                    continue
-
-                # Aggregate ship loss
-                zkb = km.get('zkb', {})
-                total_value = zkb.get('totalValue', 0.0)
-
-                key = (solar_system_id, ship_type_id)
-                ship_losses[key]['quantity'] += 1
-                ship_losses[key]['total_value'] += total_value
-
-                # Aggregate item losses (from victim's cargo/modules)
-                items = victim.get('items', [])
-                for item in items:
-                    item_type_id = item.get('item_type_id')
-                    quantity_destroyed = item.get('quantity_destroyed', 0)
-
-                    if item_type_id and quantity_destroyed > 0:
-                        item_key = (solar_system_id, item_type_id)
-                        item_losses[item_key]['quantity'] += quantity_destroyed
-
+                add_killmail(km, ship_losses, item_losses)
             except Exception as e:
                 if verbose:
                     print(f"  Warning: Error processing killmail: {e}")
 
-        # Convert to list format with region_id
-        ship_data = []
-        for (system_id, ship_id), data in ship_losses.items():
-            region_id = system_region_map.get(system_id)
-            if region_id:
-                ship_data.append({
-                    'date': date,
-                    'region_id': region_id,
-                    'solar_system_id': system_id,
-                    'ship_type_id': ship_id,
-                    'quantity': data['quantity'],
-                    'total_value_destroyed': data['total_value']
-                })
-
-        item_data = []
-        for (system_id, item_id), data in item_losses.items():
-            region_id = system_region_map.get(system_id)
-            if region_id:
-                item_data.append({
-                    'date': date,
-                    'region_id': region_id,
-                    'solar_system_id': system_id,
-                    'item_type_id': item_id,
-                    'quantity_destroyed': data['quantity']
-                })
+        # Convert to list format with region_id (skips wormholes, etc.)
+        aggregated = loss_rows(ship_losses, item_losses, date, system_region_map)
+        ship_data = aggregated['ship_losses']
+        item_data = aggregated['item_losses']
 
         if verbose:
             print(f"  Ship losses: {len(ship_data)} unique entries")
             print(f"  Item losses: {len(item_data)} unique entries")
 
-        return {
-            'ship_losses': ship_data,
-            'item_losses': item_data
-        }
+        return aggregated
 
     def save_to_database(self, date: date, aggregated: Dict, verbose: bool = False) -> Dict:
         """
@@ -374,7 +461,168 @@ class KillmailService:
             except Exception:
                 pass
 
-    def backfill(self, start_date: date, end_date: date, verbose: bool = False) -> List[Dict]:
+    def open_archive_stream(self, date: date) -> Optional[requests.Response]:
+        """
+        Open the EVE Ref archive for a date as a streamed HTTP response.
+
+        Returns:
+            Response whose .raw is the .tar.bz2 byte stream, None if unavailable
+        """
+        filename = f"killmails-{date.strftime('%Y-%m-%d')}.tar.bz2"
+        url = f"{self.base_url}/{date.year}/{filename}"
+        response = self.session.get(url, stream=True, timeout=300)
+
+        if response.status_code == 200:
+            response.raw.decode_content = True
+            return response
+
+        response.close()
+        if response.status_code == 404:
+            print(f"  Archive not found for {date} (may not be available yet)")
+        else:
+            print(f"  Failed with status {response.status_code} for {date}")
+        return None
+
+    def stream_aggregate(
+        self,
+        fileobj: BinaryIO,
+        date: date,
+        pool: Executor,
+        workers: int,
+        system_region_map: Dict[int, int],
+        verbose: bool = False
+    ) -> Tuple[int, Dict, int]:
+        """
+        Aggregate a .tar.bz2 killmail stream without holding it in memory.
+
+        Members are read in archive order and shipped to the pool in batches
+        of PARSE_BATCH_SIZE; each batch comes back as a partial aggregate and
+        is merged. At most workers * PENDING_BATCHES_PER_WORKER batches are in
+        flight, so memory stays flat however large the day is.
+
+        Returns:
+            (killmails parsed, dict with 'ship_losses' and 'item_losses',
+             largest peak RSS of the workers that parsed it in KB)
+        """
+        ship_losses: ShipLosses = {}
+        item_losses: ItemLosses = {}
+        killmails = 0
+        worker_peak_rss = 0
+        pending = deque()
+        max_pending = max(1, workers) * PENDING_BATCHES_PER_WORKER
+
+        def collect():
+            nonlocal killmails, worker_peak_rss
+            parsed, part_ships, part_items, peak_rss = pending.popleft().result()
+            killmails += parsed
+            worker_peak_rss = max(worker_peak_rss, peak_rss)
+            merge_loss_partials(ship_losses, item_losses, part_ships, part_items)
+            if verbose and killmails and killmails % 10000 < parsed:
+                print(f"  {date}: parsed {killmails} killmails...")
+
+        batch = []
+        for raw in iter_archive_killmails(fileobj):
+            batch.append(raw)
+            if len(batch) >= PARSE_BATCH_SIZE:
+                pending.append(pool.submit(aggregate_killmail_batch, batch))
+                batch = []
+                while len(pending) >= max_pending:
+                    collect()
+        if batch:
+            pending.append(pool.submit(aggregate_killmail_batch, batch))
+        while pending:
+            collect()
+
+        return killmails, loss_rows(ship_losses, item_losses, date, system_region_map), worker_peak_rss
+
+    def ingest_date(
+        self,
+        date: date,
+        pool: Optional[Executor] = None,
+        workers: Optional[int] = None,
+        system_region_map: Optional[Dict[int, int]] = None,
+        verbose: bool = False
+    ) -> Dict:
+        """
+        Streaming pipeline for one date: the archive is read straight from
+        HTTP, parsed and aggregated in a process pool, then saved.
+
+        Args:
+            date: Date to process
+            pool: Shared parse pool (one is created for this call if None)
+            workers: Pool size, used to bound the batches in flight
+            system_region_map: Preloaded system -> region map
+            verbose: Print progress
+
+        Returns:
+            Dict with processing results (same shape as process_date, plus
+            'seconds' and 'worker_peak_rss_mb')
+        """
+        started = time.time()
+        workers = workers or os.cpu_count() or 1
+        own_pool = pool is None
+        if own_pool:
+            pool = create_parse_pool(workers)
+
+        try:
+            if system_region_map is None:
+                system_region_map = self._get_system_region_map()
+
+            response = self.open_archive_stream(date)
+            if response is None:
+                return {
+                    'success': False,
+                    'date': str(date),
+                    'error': 'Download failed'
+                }
+
+            with response:
+                killmails, aggregated, worker_peak_rss = self.stream_aggregate(
+                    response.raw, date, pool, workers, system_region_map, verbose
+                )
+            if not killmails:
+                return {
+                    'success': False,
+                    'date': str(date),
+                    'error': 'No killmails extracted'
+                }
+
+            save_stats = self.save_to_database(date, aggregated, verbose)
+            elapsed = time.time() - started
+
+            if verbose:
+                print(f"Completed {date}: {killmails} killmails in {elapsed:.1f}s")
+
+            return {
+                'success': True,
+                'date': str(date),
+                'killmails_processed': killmails,
+                'seconds': round(elapsed, 1),
+                'worker_peak_rss_mb': round(worker_peak_rss / 1024, 1),
+                **save_stats
+            }
+
+        except Exception as e:
+            print(f"  Error ingesting {date}: {e}")
+            return {
+                'success': False,
+                'date': str(date),
+                'error': str(e)
+            }
+
+        finally:
+            if own_pool:
+                pool.shutdown()
+
+    def backfill(
+        self,
+        start_date: date,
+        end_date: date,
+        verbose: bool = False,
+        concurrency: int = BACKFILL_CONCURRENCY,
+        workers: Optional[int] = None,
+        streaming: bool = True
+    ) -> List[Dict]:
         """
         Process a date range (inclusive).
 
@@ -382,11 +630,14 @@ class KillmailService:
             start_date: First date to process
             end_date: Last date to process
             verbose: Print progress
+            concurrency: Days ingested at the same time (streaming only)
+            workers: Parse pool size (default: CPU count)
+            streaming: Use ingest_date(); False runs process_date() day by day
 
         Returns:
             List of processing results per date
         """
-        results = []
+        dates = []
         current_date = start_date
 
         while current_date <= end_date:
@@ -394,15 +645,28 @@ class KillmailService:
             if self.has_data_for(current_date):
                 if verbose:
                     print(f"\nSkipping {current_date} (already have data)")
-                current_date += timedelta(days=1)
-                continue
-
-            result = self.process_date(current_date, verbose)
-            results.append(result)
-
+            else:
+                dates.append(current_date)
             current_date += timedelta(days=1)
 
-        return results
+        if not streaming:
+            return [self.process_date(d, verbose) for d in dates]
+        if not dates:
+            return []
+
+        # Days share one parse pool; each day's download/decompress runs on
+        # its own thread (bz2 releases the GIL while decompressing)
+        workers = workers or os.cpu_count() or 1
+        system_region_map = self._get_system_region_map()
+        pool = create_parse_pool(workers)
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as days:
+                return list(days.map(
+                    lambda d: self.ingest_date(d, pool, workers, system_region_map, verbose),
+                    dates
+                ))
+        finally:
+            pool.shutdown()
 
     def has_data_for(self, date: date) -> bool:
         """Check if we already have data for a specific date"""
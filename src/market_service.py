@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 from psycopg2.extras import execute_values
 from src.database import get_db_connection
+from src.services.market.price_book import get_price_book, refresh_price_book
 from config import ESI_BASE_URL, ESI_USER_AGENT
 
 
@@ -21,8 +22,6 @@ class MarketService:
             "User-Agent": ESI_USER_AGENT,
             "Accept": "application/json"
         })
-        self._memory_cache: Dict[int, float] = {}
-        self._cache_loaded = False
 
     def update_global_prices(self) -> Dict:
         """
@@ -87,9 +86,13 @@ class MarketService:
                     )
                     conn.commit()
 
-            # Invalidate memory cache
-            self._memory_cache.clear()
-            self._cache_loaded = False
+            # Swap in a price book with the new prices. The update is already
+            # committed, so a failed reload is only logged; readers keep the
+            # previous book until the next successful refresh
+            try:
+                refresh_price_book(force=True)
+            except Exception as e:
+                print(f"Price book refresh failed: {e}")
 
             return {
                 "success": True,
@@ -134,62 +137,30 @@ class MarketService:
 
     def load_prices_to_memory(self) -> int:
         """
-        Load all cached prices into memory for ultra-fast lookups.
-        Returns number of prices loaded.
+        Reload the shared price book for ultra-fast lookups.
+        Returns number of adjusted prices loaded.
         """
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT type_id, adjusted_price
-                    FROM market_prices_cache
-                    WHERE adjusted_price > 0
-                """)
-
-                self._memory_cache.clear()
-                for row in cur.fetchall():
-                    self._memory_cache[row[0]] = row[1]
-
-                self._cache_loaded = True
-                return len(self._memory_cache)
+        refresh_price_book()
+        return get_price_book().stats()["adjusted_prices"]
 
     def get_cached_price(self, type_id: int) -> Optional[float]:
         """
-        Get adjusted_price from cache.
-        Uses memory cache if loaded, otherwise queries DB.
+        Get adjusted_price from the shared price book.
+        Returns None if the type has no positive adjusted price.
         """
-        if self._cache_loaded and self._memory_cache:
-            return self._memory_cache.get(type_id)
-
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT adjusted_price
-                    FROM market_prices_cache
-                    WHERE type_id = %s
-                """, (type_id,))
-                row = cur.fetchone()
-                return row[0] if row else None
+        price = get_price_book().adjusted_price(type_id)
+        return price if price else None
 
     def get_cached_prices_bulk(self, type_ids: List[int]) -> Dict[int, float]:
         """
-        Get multiple prices at once - much faster than individual lookups.
-        Returns dict {type_id: adjusted_price}
+        Get multiple prices at once from the shared price book.
+        Returns dict {type_id: adjusted_price} (0 if missing)
         """
         if not type_ids:
             return {}
 
-        if self._cache_loaded and self._memory_cache:
-            return {tid: self._memory_cache.get(tid, 0) for tid in type_ids}
-
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT type_id, adjusted_price
-                    FROM market_prices_cache
-                    WHERE type_id = ANY(%s)
-                """, (list(type_ids),))
-
-                return {row[0]: row[1] or 0 for row in cur.fetchall()}
+        book = get_price_book()
+        return book.to_dict(type_ids, book.adjusted_prices(type_ids))
 
     def calculate_material_cost(self, bom: Dict[int, int]) -> float:
         """
@@ -204,14 +175,9 @@ class MarketService:
         if not bom:
             return 0
 
-        prices = self.get_cached_prices_bulk(list(bom.keys()))
-        total = 0
-
-        for type_id, quantity in bom.items():
-            price = prices.get(type_id, 0)
-            total += price * quantity
-
-        return total
+        book = get_price_book()
+        prices = book.adjusted_prices(bom.keys())
+        return float(book.bom_cost(list(bom.values()), prices))
 
     def ensure_cache_fresh(self, max_age_seconds: int = 3600) -> Dict:
         """
@@ -115,6 +115,65 @@ SOURCE_DIFFICULTY = {
 }
 
 
+# Sources that are easily available on the market
+EASY_SOURCES = {MaterialSource.MINERAL, MaterialSource.PI, MaterialSource.ICE,
+                MaterialSource.SALVAGE, MaterialSource.COMPONENT}
+
+
+def source_for_group(group_id: int, category_id: int = None) -> str:
+    """Classify a material by its groupID, falling back to its categoryID"""
+    if group_id in MATERIAL_GROUPS:
+        return MATERIAL_GROUPS[group_id]
+
+    # Check category for broader classification
+    if category_id == 43:
+        return MaterialSource.PI  # Planetary
+    if category_id == 17:
+        return MaterialSource.COMMODITY  # Commodity
+    if category_id == 4:
+        return MaterialSource.MINERAL  # Default for category 4 (Material)
+
+    return MaterialSource.COMMODITY  # Default
+
+
+def score_sources(sources: Dict[str, int]) -> Dict:
+    """
+    Manufacturability score from {source: material_count}.
+
+    Returns the same dict as MaterialClassifier.get_manufacturability_score.
+    """
+    warnings: List[str] = []
+    max_difficulty = 1
+
+    for source, count in sources.items():
+        difficulty = SOURCE_DIFFICULTY.get(source, 3)
+
+        if difficulty > max_difficulty:
+            max_difficulty = difficulty
+
+        # Add warnings for difficult sources
+        if source == MaterialSource.ANCIENT_SALVAGE:
+            warnings.append(f"Requires ancient salvage ({count} types) - wormhole only")
+        elif source == MaterialSource.EXPLORATION:
+            warnings.append(f"Requires exploration loot ({count} types) - not on market")
+        elif source == MaterialSource.ABYSSAL:
+            warnings.append(f"Requires abyssal materials ({count} types)")
+        elif source == MaterialSource.SPECIAL:
+            warnings.append(f"Requires special/event materials ({count} types)")
+        elif source == MaterialSource.DRONE:
+            warnings.append(f"Requires rogue drone components ({count} types)")
+
+    # Check if all materials are easily available on market
+    is_market_only = all(s in EASY_SOURCES for s in sources.keys())
+
+    return {
+        "score": max_difficulty,
+        "sources": dict(sources),
+        "warnings": warnings,
+        "is_market_only": is_market_only
+    }
+
+
 class MaterialClassifier:
     """Classifies materials and determines blueprint manufacturability"""
 
@@ -151,19 +210,8 @@ class MaterialClassifier:
                     WHERE it."typeID" = %s
                 ''', (type_id,))
                 result = cur.fetchone()
-                if result:
-                    category_id = result[0]
-                    # Planetary
-                    if category_id == 43:
-                        return MaterialSource.PI
-                    # Commodity
-                    if category_id == 17:
-                        return MaterialSource.COMMODITY
-                    # Material
-                    if category_id == 4:
-                        return MaterialSource.MINERAL  # Default for category 4
-
-        return MaterialSource.COMMODITY  # Default
+
+        return source_for_group(group_id, result[0] if result else None)
 
     def classify_bom(self, bom: Dict[int, int]) -> Dict[str, List[Dict]]:
         """
@@ -210,41 +258,7 @@ class MaterialClassifier:
             return {"score": 5, "sources": {}, "warnings": ["No BOM found"], "is_market_only": False}
 
         classified = self.classify_bom(bom)
-        sources: Dict[str, int] = {}
-        warnings: List[str] = []
-        max_difficulty = 1
-
-        for source, materials in classified.items():
-            count = len(materials)
-            sources[source] = count
-            difficulty = SOURCE_DIFFICULTY.get(source, 3)
-
-            if difficulty > max_difficulty:
-                max_difficulty = difficulty
-
-            # Add warnings for difficult sources
-            if source == MaterialSource.ANCIENT_SALVAGE:
-                warnings.append(f"Requires ancient salvage ({count} types) - wormhole only")
-            elif source == MaterialSource.EXPLORATION:
-                warnings.append(f"Requires exploration loot ({count} types) - not on market")
-            elif source == MaterialSource.ABYSSAL:
-                warnings.append(f"Requires abyssal materials ({count} types)")
-            elif source == MaterialSource.SPECIAL:
-                warnings.append(f"Requires special/event materials ({count} types)")
-            elif source == MaterialSource.DRONE:
-                warnings.append(f"Requires rogue drone components ({count} types)")
-
-        # Check if all materials are easily available on market
-        easy_sources = {MaterialSource.MINERAL, MaterialSource.PI, MaterialSource.ICE,
-                        MaterialSource.SALVAGE, MaterialSource.COMPONENT}
-        is_market_only = all(s in easy_sources for s in classified.keys())
-
-        return {
-            "score": max_difficulty,
-            "sources": sources,
-            "warnings": warnings,
-            "is_market_only": is_market_only
-        }
+        return score_sources({source: len(materials) for source, materials in classified.items()})
 
     def is_manufacturable(self, bom: Dict[int, int], max_difficulty: int = 2) -> bool:
         """
@@ -11,6 +11,7 @@ import math
 from typing import Dict, List, Tuple, Optional, Literal
 from src.database import get_db_connection, get_item_info, get_item_by_name
 from src.esi_client import esi_client
+from src.services.production.bom_cache import bom_cache
 from config import REGIONS
 
 # Lazy import to avoid circular dependencies
@@ -73,17 +74,8 @@ class ProductionSimulator:
 
     def get_blueprint_for_product(self, product_type_id: int) -> Optional[int]:
         """Find the blueprint that produces a given item"""
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute('''
-                    SELECT "typeID" as blueprint_id
-                    FROM "industryActivityProducts"
-                    WHERE "productTypeID" = %s
-                    AND "activityID" = 1
-                    LIMIT 1
-                ''', (product_type_id,))
-                result = cur.fetchone()
-                return result[0] if result else None
+        blueprint = bom_cache.blueprint_for_product(product_type_id)
+        return blueprint.blueprint_id if blueprint else None
 
     def get_bom(self, type_id: int, runs: int = 1, me: int = 0) -> Dict[int, int]:
         """
@@ -102,17 +94,8 @@ class ProductionSimulator:
         if not blueprint_id:
             return {}
 
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                # Get base materials from industryActivityMaterials
-                cur.execute('''
-                    SELECT "materialTypeID", "quantity"
-                    FROM "industryActivityMaterials"
-                    WHERE "typeID" = %s
-                    AND "activityID" = 1
-                ''', (blueprint_id,))
-
-                materials = cur.fetchall()
+        # Base materials from industryActivityMaterials (cached)
+        materials = [(m.type_id, m.quantity) for m in bom_cache.materials(blueprint_id)]
 
         bom = {}
         me_factor = 1 - (me / 100)  # ME 10 = 0.9 factor
@@ -209,18 +192,9 @@ class ProductionSimulator:
 
         # Get product output quantity
         output_quantity = runs  # Default 1 per run
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                blueprint_id = self.get_blueprint_for_product(type_id)
-                if blueprint_id:
-                    cur.execute('''
-                        SELECT "quantity"
-                        FROM "industryActivityProducts"
-                        WHERE "typeID" = %s AND "productTypeID" = %s AND "activityID" = 1
-                    ''', (blueprint_id, type_id))
-                    result = cur.fetchone()
-                    if result:
-                        output_quantity = result[0] * runs
+        blueprint = bom_cache.blueprint_for_product(type_id)
+        if blueprint:
+            output_quantity = blueprint.quantity * runs
 
         # Get all prices at once (optimized for bulk operations)
         all_type_ids = list(bom.keys()) + [type_id]
@@ -438,18 +412,9 @@ class ProductionSimulator:
 
         # Get output quantity
         output_quantity = runs
-        blueprint_id = self.get_blueprint_for_product(type_id)
-        if blueprint_id:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute('''
-                        SELECT "quantity"
-                        FROM "industryActivityProducts"
-                        WHERE "typeID" = %s AND "productTypeID" = %s AND "activityID" = 1
-                    ''', (blueprint_id, type_id))
-                    result = cur.fetchone()
-                    if result:
-                        output_quantity = result[0] * runs
+        blueprint = bom_cache.blueprint_for_product(type_id)
+        if blueprint:
+            output_quantity = blueprint.quantity * runs
 
         # Get all prices at once
         all_type_ids = list(bom.keys()) + [type_id]
@@ -1,10 +1,11 @@
 """
 Route calculation service using SDE jump data
-A* pathfinding algorithm with HighSec filtering
+Precomputed jump matrix lookups with A* fallback and HighSec filtering
 """
 
-from src.database import get_db_connection
-from psycopg2.extras import RealDictCursor
+from src.services.route.jump_matrix import JumpMatrix, profile_for
+from src.services.route.universe import get_universe_graph
+from src.services.sde.search import get_search_index
 from typing import List, Optional, Dict
 from heapq import heappush, heappop
 from itertools import permutations
@@ -23,50 +24,67 @@ TRADE_HUB_SYSTEMS = {
 # Reverse lookup
 SYSTEM_ID_TO_HUB = {v: k for k, v in TRADE_HUB_SYSTEMS.items()}
 
+# Extra search hits requested to cover ones dropped by search_systems()
+SEARCH_OVERFETCH = 5
+
 
 class RouteService:
     def __init__(self):
         self._graph: Optional[Dict[int, List[int]]] = None
         self._systems: Optional[Dict[int, dict]] = None
+        self._matrix: Optional[JumpMatrix] = None
         self._loaded = False
 
     def _load_graph(self):
-        """Load jump graph from database (lazy loading)"""
+        """Attach the shared universe graph and jump matrix (lazy loading)"""
         if self._loaded:
             return
 
-        self._graph = {}
-        self._systems = {}
-
-        with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Load systems with security
-                cur.execute('''
-                    SELECT "solarSystemID", "solarSystemName", "security", "regionID"
-                    FROM "mapSolarSystems"
-                ''')
-                for row in cur.fetchall():
-                    self._systems[row['solarSystemID']] = {
-                        'name': row['solarSystemName'],
-                        'security': float(row['security']),
-                        'region_id': row['regionID']
-                    }
+        universe = get_universe_graph()
+        self._systems = universe.systems
+        self._graph = universe.graph
+        self._loaded = True
 
-                # Load jumps (bidirectional graph)
-                cur.execute('''
-                    SELECT "fromSolarSystemID", "toSolarSystemID"
-                    FROM "mapSolarSystemJumps"
-                ''')
-                for row in cur.fetchall():
-                    from_id = row['fromSolarSystemID']
-                    to_id = row['toSolarSystemID']
+        try:
+            self._matrix = universe.jump_matrix
+        except Exception as e:
+            # Routing still works via A* search, just slower
+            print(f"Jump matrix unavailable, using A* search: {e}")
+            self._matrix = None
 
-                    if from_id not in self._graph:
-                        self._graph[from_id] = []
-                    self._graph[from_id].append(to_id)
+    def _min_security(self, avoid_lowsec: bool, avoid_nullsec: bool, min_security: float) -> float:
+        """Effective minimum security a system needs to be entered"""
+        if avoid_lowsec:
+            return max(min_security, 0.45)  # 0.45 rounds to 0.5 in EVE
+        elif avoid_nullsec:
+            return 0.0
+        return -1.0
 
-        self._loaded = True
-        print(f"Route graph loaded: {len(self._systems)} systems, {sum(len(v) for v in self._graph.values())} jumps")
+    def get_jump_count(
+        self,
+        from_system_id: int,
+        to_system_id: int,
+        avoid_lowsec: bool = True,
+        avoid_nullsec: bool = True,
+        min_security: float = 0.5
+    ) -> Optional[int]:
+        """
+        Number of jumps between two systems without building the route
+
+        Returns:
+            Jump count, or None if no route found
+        """
+        self._load_graph()
+
+        if from_system_id not in self._systems or to_system_id not in self._systems:
+            return None
+
+        profile = profile_for(self._min_security(avoid_lowsec, avoid_nullsec, min_security))
+        if self._matrix is not None and profile is not None:
+            return self._matrix.jumps(from_system_id, to_system_id, profile)
+
+        route = self.find_route(from_system_id, to_system_id, avoid_lowsec, avoid_nullsec, min_security)
+        return len(route) - 1 if route else None
 
     def find_route(
         self,
@@ -77,7 +95,7 @@ class RouteService:
         min_security: float = 0.5
     ) -> Optional[List[dict]]:
         """
-        Find route using A* algorithm
+        Find shortest route (precomputed jump matrix, A* for custom thresholds)
 
         Args:
             from_system_id: Starting system ID
@@ -94,14 +112,17 @@ class RouteService:
         if from_system_id not in self._systems or to_system_id not in self._systems:
             return None
 
-        # Determine security threshold
-        if avoid_lowsec:
-            min_sec = max(min_security, 0.45)  # 0.45 rounds to 0.5 in EVE
-        elif avoid_nullsec:
-            min_sec = 0.0
-        else:
-            min_sec = -1.0
+        min_sec = self._min_security(avoid_lowsec, avoid_nullsec, min_security)
+
+        profile = profile_for(min_sec)
+        if self._matrix is not None and profile is not None:
+            path = self._matrix.path(from_system_id, to_system_id, profile)
+            return self._build_route_info(path) if path else None
 
+        return self._astar_route(from_system_id, to_system_id, min_sec)
+
+    def _astar_route(self, from_system_id: int, to_system_id: int, min_sec: float) -> Optional[List[dict]]:
+        """A* search for thresholds without a precomputed profile"""
         # A* implementation
         # Priority queue: (f_score, g_score, current_system, path)
         start_h = self._heuristic(from_system_id, to_system_id)
@@ -169,35 +190,49 @@ class RouteService:
     def get_system_by_name(self, name: str) -> Optional[dict]:
         """Find system by name (case-insensitive)"""
         self._load_graph()
-        name_lower = name.lower()
-        for sys_id, info in self._systems.items():
-            if info['name'].lower() == name_lower:
-                return {
-                    'system_id': sys_id,
-                    'system_name': info['name'],
-                    'security': round(info['security'], 2),
-                    'region_id': info['region_id'],
-                    'is_trade_hub': sys_id in SYSTEM_ID_TO_HUB,
-                    'hub_name': SYSTEM_ID_TO_HUB.get(sys_id)
-                }
-        return None
+        sys_id = get_search_index().system_id_by_name(name)
+        info = self._systems.get(sys_id)
+        if info is None:
+            return None
+        return {
+            'system_id': sys_id,
+            'system_name': info['name'],
+            'security': round(info['security'], 2),
+            'region_id': info['region_id'],
+            'is_trade_hub': sys_id in SYSTEM_ID_TO_HUB,
+            'hub_name': SYSTEM_ID_TO_HUB.get(sys_id)
+        }
 
     def search_systems(self, query: str, limit: int = 10) -> List[dict]:
-        """Search systems by partial name"""
+        """Search systems by partial name (exact and prefix matches first)"""
         self._load_graph()
-        query_lower = query.lower()
-        results = []
+        index = get_search_index()
+
+        # The index and the graph load mapSolarSystems separately, so after an
+        # SDE reload a hit may be missing from the graph; only if that leaves
+        # too few results is the full ranked list fetched
+        fetch = limit + SEARCH_OVERFETCH
+        sys_ids = index.search_system_ids(query, limit=fetch)
+        results = self._system_results(sys_ids, limit)
+        if len(results) < limit and len(sys_ids) == fetch:
+            results = self._system_results(index.search_system_ids(query, limit=None), limit)
+        return results
 
-        for sys_id, info in self._systems.items():
-            if query_lower in info['name'].lower():
-                results.append({
-                    'system_id': sys_id,
-                    'system_name': info['name'],
-                    'security': round(info['security'], 2),
-                    'is_trade_hub': sys_id in SYSTEM_ID_TO_HUB
-                })
-                if len(results) >= limit:
-                    break
+    def _system_results(self, sys_ids: List[int], limit: int) -> List[dict]:
+        """Search result dicts for the first `limit` systems in the route graph"""
+        results = []
+        for sys_id in sys_ids:
+            info = self._systems.get(sys_id)
+            if info is None:
+                continue
+            results.append({
+                'system_id': sys_id,
+                'system_name': info['name'],
+                'security': round(info['security'], 2),
+                'is_trade_hub': sys_id in SYSTEM_ID_TO_HUB
+            })
+            if len(results) >= limit:
+                break
 
         return results
 
@@ -219,6 +254,15 @@ class RouteService:
             Travel time info dict
         """
         jumps = len(route) - 1 if route else 0
+        return self._travel_time_for_jumps(jumps, align_time_seconds, warp_time_per_system)
+
+    def _travel_time_for_jumps(
+        self,
+        jumps: int,
+        align_time_seconds: int = 10,
+        warp_time_per_system: int = 30
+    ) -> dict:
+        """Travel time info dict for a known jump count"""
         total_seconds = jumps * (align_time_seconds + warp_time_per_system)
 
         return {
@@ -259,9 +303,9 @@ class RouteService:
                 }
                 continue
 
-            route = self.find_route(from_id, hub_id, avoid_lowsec=True)
-            if route:
-                travel = self.calculate_travel_time(route)
+            jumps = self.get_jump_count(from_id, hub_id, avoid_lowsec=True)
+            if jumps is not None:
+                travel = self._travel_time_for_jumps(jumps)
                 distances[hub_name] = {
                     'jumps': travel['jumps'],
                     'time': travel['formatted'],
@@ -368,20 +412,16 @@ class RouteService:
         # Pre-calculate distances between all relevant systems
         all_systems = [from_system.lower()] + hubs_to_visit
         distances = {}
-        routes = {}  # Store full routes for system list
 
         for i, sys1 in enumerate(all_systems):
             sys1_id = TRADE_HUB_SYSTEMS.get(sys1, from_id if sys1 == from_system.lower() else None)
             for sys2 in all_systems[i+1:]:
                 sys2_id = TRADE_HUB_SYSTEMS.get(sys2)
                 if sys1_id and sys2_id:
-                    route = self.find_route(sys1_id, sys2_id, avoid_lowsec=True)
-                    dist = len(route) - 1 if route else 999
+                    jumps = self.get_jump_count(sys1_id, sys2_id, avoid_lowsec=True)
+                    dist = jumps if jumps is not None else 999
                     distances[(sys1, sys2)] = dist
                     distances[(sys2, sys1)] = dist
-                    if route and include_systems:
-                        routes[(sys1, sys2)] = route
-                        routes[(sys2, sys1)] = list(reversed(route))
 
         # Try all permutations of hubs (TSP)
         best_order = None
@@ -404,6 +444,7 @@ class RouteService:
         route_legs = []
         prev = from_system
         prev_key = from_system.lower()
+        prev_id = from_id
 
         for hub in best_order:
             jumps = distances.get((prev_key, hub), 0)
@@ -412,18 +453,21 @@ class RouteService:
                 'to': hub.title(),
                 'jumps': jumps
             }
-            # Add system names if requested
-            if include_systems and (prev_key, hub) in routes:
+            # Add system names if requested (only for legs actually travelled)
+            hub_id = TRADE_HUB_SYSTEMS[hub]
+            leg_route = self.find_route(prev_id, hub_id, avoid_lowsec=True) if include_systems else None
+            if leg_route:
                 leg['systems'] = [
                     {
                         'name': s['system_name'],
                         'security': s['security']
                     }
-                    for s in routes[(prev_key, hub)]
+                    for s in leg_route
                 ]
             route_legs.append(leg)
             prev = hub
             prev_key = hub
+            prev_id = hub_id
 
         total_jumps = best_total
         order = [from_system] + [h.title() for h in best_order]
@@ -0,0 +1,389 @@
+"""
+Price Book
+
+Process-wide, columnar snapshot of market prices: global adjusted/average
+prices from market_prices_cache and regional sell/buy prices from
+market_prices, held in numpy arrays indexed by a dense type index.
+
+Pricing consumers read the current snapshot without touching the database.
+A refresh builds a complete new snapshot and swaps the module reference in
+one assignment, so readers see either the old or the new book, never a mix.
+The refresher thread polls the source tables' last-update timestamps and
+reloads only when the cron jobs have written new prices.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.database import get_db_connection
+
+
+DEFAULT_REFRESH_INTERVAL = 60  # Seconds between source version checks
+
+_VERSION_SQL = """
+    SELECT
+        (SELECT MAX(last_updated) FROM market_prices_cache),
+        (SELECT COUNT(*) FROM market_prices_cache),
+        (SELECT MAX(updated_at) FROM market_prices),
+        (SELECT COUNT(*) FROM market_prices)
+"""
+
+
+def _readonly(*arrays: np.ndarray) -> None:
+    for array in arrays:
+        array.setflags(write=False)
+
+
+@dataclass(frozen=True, eq=False)
+class PriceBook:
+    """
+    Immutable price snapshot
+
+    Columns are aligned by type index (``type_ids`` is sorted ascending).
+    Regional columns have shape (len(region_ids), len(type_ids)); unknown
+    prices are NaN and unknown volumes are 0.
+    """
+    type_ids: np.ndarray
+    region_ids: np.ndarray
+    adjusted: np.ndarray
+    average: np.ndarray
+    lowest_sell: np.ndarray
+    highest_buy: np.ndarray
+    sell_volume: np.ndarray
+    buy_volume: np.ndarray
+    version: Tuple = ()
+    loaded_at: float = 0.0
+    build_seconds: float = 0.0
+    _region_index: Dict[int, int] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_rows(
+        cls,
+        cache_rows: Sequence[Tuple],
+        regional_rows: Sequence[Tuple],
+        version: Tuple = (),
+        build_seconds: float = 0.0
+    ) -> 'PriceBook':
+        """
+        Build from database rows
+
+        Args:
+            cache_rows: (type_id, adjusted_price, average_price) tuples
+            regional_rows: (type_id, region_id, lowest_sell, highest_buy,
+                sell_volume, buy_volume) tuples
+            version: Source version the rows were read at
+            build_seconds: Time spent loading, recorded for metrics
+        """
+        cache_types = np.array([r[0] for r in cache_rows], dtype=np.int64)
+        regional_types = np.array([r[0] for r in regional_rows], dtype=np.int64)
+        type_ids = np.union1d(cache_types, regional_types)
+        region_ids = np.unique(np.array([r[1] for r in regional_rows], dtype=np.int64))
+        n, r = len(type_ids), len(region_ids)
+
+        def column(rows, i, dtype, missing):
+            return np.array([missing if row[i] is None else row[i] for row in rows], dtype=dtype)
+
+        adjusted = np.full(n, np.nan)
+        average = np.full(n, np.nan)
+        if len(cache_rows):
+            idx = np.searchsorted(type_ids, cache_types)
+            adjusted[idx] = column(cache_rows, 1, np.float64, np.nan)
+            average[idx] = column(cache_rows, 2, np.float64, np.nan)
+
+        lowest_sell = np.full((r, n), np.nan)
+        highest_buy = np.full((r, n), np.nan)
+        sell_volume = np.zeros((r, n), dtype=np.int64)
+        buy_volume = np.zeros((r, n), dtype=np.int64)
+        if len(regional_rows):
+            cols = np.searchsorted(type_ids, regional_types)
+            rows = np.searchsorted(region_ids, column(regional_rows, 1, np.int64, 0))
+            lowest_sell[rows, cols] = column(regional_rows, 2, np.float64, np.nan)
+            highest_buy[rows, cols] = column(regional_rows, 3, np.float64, np.nan)
+            sell_volume[rows, cols] = column(regional_rows, 4, np.int64, 0)
+            buy_volume[rows, cols] = column(regional_rows, 5, np.int64, 0)
+
+        _readonly(type_ids, region_ids, adjusted, average, lowest_sell, highest_buy, sell_volume, buy_volume)
+
+        return cls(
+            type_ids=type_ids,
+            region_ids=region_ids,
+            adjusted=adjusted,
+            average=average,
+            lowest_sell=lowest_sell,
+            highest_buy=highest_buy,
+            sell_volume=sell_volume,
+            buy_volume=buy_volume,
+            version=tuple(version),
+            loaded_at=time.time(),
+            build_seconds=build_seconds,
+            _region_index={int(region_id): i for i, region_id in enumerate(region_ids)},
+        )
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.type_ids)
+
+    def index_of(self, type_ids: Iterable[int]) -> np.ndarray:
+        """Dense type index for each type ID, -1 where the type is unknown"""
+        if not isinstance(type_ids, np.ndarray):
+            type_ids = list(type_ids)
+        ids = np.asarray(type_ids, dtype=np.int64)
+        if not len(self.type_ids):
+            return np.full(len(ids), -1, dtype=np.int64)
+        idx = np.searchsorted(self.type_ids, ids)
+        idx = np.minimum(idx, len(self.type_ids) - 1)
+        return np.where(self.type_ids[idx] == ids, idx, -1)
+
+    def _take(self, column: np.ndarray, type_ids: Iterable[int]) -> np.ndarray:
+        """Gather a 1-D column for type IDs, NaN where unknown"""
+        idx = self.index_of(type_ids)
+        if not len(column):
+            return np.full(len(idx), np.nan)
+        return np.where(idx >= 0, column[idx], np.nan)
+
+    def _region_row(self, region_id: int) -> Optional[int]:
+        return self._region_index.get(region_id)
+
+    # ------------------------------------------------------------------
+    # Vectorized lookups (NaN where no price is known)
+    # ------------------------------------------------------------------
+
+    def adjusted_prices(self, type_ids: Iterable[int]) -> np.ndarray:
+        """Global adjusted prices"""
+        return self._take(self.adjusted, type_ids)
+
+    def average_prices(self, type_ids: Iterable[int]) -> np.ndarray:
+        """Global average prices"""
+        return self._take(self.average, type_ids)
+
+    def sell_prices(self, type_ids: Iterable[int], region_id: int) -> np.ndarray:
+        """Lowest sell prices in a region"""
+        row = self._region_row(region_id)
+        if row is None:
+            return np.full(len(self.index_of(type_ids)), np.nan)
+        return self._take(self.lowest_sell[row], type_ids)
+
+    def buy_prices(self, type_ids: Iterable[int], region_id: int) -> np.ndarray:
+        """Highest buy prices in a region"""
+        row = self._region_row(region_id)
+        if row is None:
+            return np.full(len(self.index_of(type_ids)), np.nan)
+        return self._take(self.highest_buy[row], type_ids)
+
+    def best_sell(
+        self,
+        type_ids: Iterable[int],
+        region_ids: Optional[Iterable[int]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cheapest lowest sell across regions
+
+        Args:
+            type_ids: Types to price
+            region_ids: Regions to consider (default: all)
+
+        Returns:
+            (prices, region_ids) arrays; NaN price and region 0 where no
+            region sells the type
+        """
+        idx = self.index_of(type_ids)
+        rows = np.arange(len(self.region_ids)) if region_ids is None else np.array(
+            [self._region_index[r] for r in region_ids if r in self._region_index], dtype=np.int64
+        )
+        if not len(rows) or not len(self.type_ids):
+            return np.full(len(idx), np.nan), np.zeros(len(idx), dtype=np.int64)
+
+        sells = self.lowest_sell[np.ix_(rows, np.maximum(idx, 0))]
+        sells[:, idx < 0] = np.nan
+        sells[sells <= 0] = np.nan
+        known = ~np.isnan(sells).all(axis=0)
+        best_row = np.argmin(np.where(np.isnan(sells), np.inf, sells), axis=0)
+        prices = np.where(known, sells[best_row, np.arange(len(idx))], np.nan)
+        regions = np.where(known, self.region_ids[rows[best_row]], 0)
+        return prices, regions
+
+    def material_prices(self, type_ids: Iterable[int], region_id: int) -> np.ndarray:
+        """Adjusted price, falling back to the regional lowest sell"""
+        ids = list(type_ids)
+        prices = self.adjusted_prices(ids)
+        missing = np.isnan(prices) | (prices <= 0)
+        if missing.any():
+            prices = np.where(missing, self.sell_prices(ids, region_id), prices)
+        return prices
+
+    @staticmethod
+    def bom_cost(bom_matrix: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """
+        Material cost of each BOM row
+
+        Args:
+            bom_matrix: (products, materials) quantities
+            prices: (materials,) price vector; NaN counts as 0
+
+        Returns:
+            (products,) costs
+        """
+        return np.asarray(bom_matrix, dtype=np.float64) @ np.nan_to_num(prices, nan=0.0)
+
+    # ------------------------------------------------------------------
+    # Scalar / dict helpers for existing call sites
+    # ------------------------------------------------------------------
+
+    def adjusted_price(self, type_id: int) -> Optional[float]:
+        """Adjusted price of one type, or None if unknown"""
+        price = self.adjusted_prices([type_id])[0]
+        return None if np.isnan(price) else float(price)
+
+    def regional_prices(self, type_id: int, region_id: int) -> Tuple[Optional[float], Optional[float]]:
+        """(lowest_sell, highest_buy) of one type in a region"""
+        sell = self.sell_prices([type_id], region_id)[0]
+        buy = self.buy_prices([type_id], region_id)[0]
+        return (None if np.isnan(sell) else float(sell), None if np.isnan(buy) else float(buy))
+
+    @staticmethod
+    def to_dict(type_ids: Sequence[int], prices: np.ndarray, missing: Optional[float] = 0.0) -> Dict[int, Optional[float]]:
+        """{type_id: price} with NaN replaced by `missing`"""
+        return {
+            type_id: missing if np.isnan(price) else float(price)
+            for type_id, price in zip(type_ids, prices.tolist())
+        }
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def memory_bytes(self) -> int:
+        arrays = (self.type_ids, self.region_ids, self.adjusted, self.average,
+                  self.lowest_sell, self.highest_buy, self.sell_volume, self.buy_volume)
+        return sum(a.nbytes for a in arrays)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, age and build metrics"""
+        return {
+            'types': len(self),
+            'regions': [int(r) for r in self.region_ids],
+            'adjusted_prices': int(np.count_nonzero(~np.isnan(self.adjusted))),
+            'build_seconds': round(self.build_seconds, 3),
+            'age_seconds': round(time.time() - self.loaded_at, 1),
+            'memory_bytes': self.memory_bytes,
+        }
+
+
+def _fetch_version(cur) -> Tuple:
+    cur.execute(_VERSION_SQL)
+    return tuple(cur.fetchone())
+
+
+def fetch_price_book_version() -> Tuple:
+    """Last-update timestamps and row counts of the source tables"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            return _fetch_version(cur)
+
+
+def load_price_book() -> PriceBook:
+    """Load a fresh PriceBook from market_prices_cache and market_prices"""
+    started = time.time()
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            version = _fetch_version(cur)
+            cur.execute("""
+                SELECT type_id, adjusted_price, average_price
+                FROM market_prices_cache
+            """)
+            cache_rows = cur.fetchall()
+            cur.execute("""
+                SELECT type_id, region_id, lowest_sell, highest_buy, sell_volume, buy_volume
+                FROM market_prices
+            """)
+            regional_rows = cur.fetchall()
+
+    book = PriceBook.from_rows(cache_rows, regional_rows, version, time.time() - started)
+    print(f"Price book loaded: {len(book)} types x {len(book.region_ids)} regions "
+          f"in {book.build_seconds:.2f}s ({book.memory_bytes / 1024:.0f} KiB)")
+    return book
+
+
+# Process-wide instance (replaced wholesale on refresh)
+_book: Optional[PriceBook] = None
+_book_lock = threading.Lock()
+_refresher: Optional[threading.Thread] = None
+
+
+def get_price_book() -> PriceBook:
+    """Get the shared PriceBook, loading it on first use"""
+    global _book
+    if _book is None:
+        with _book_lock:
+            if _book is None:
+                _book = load_price_book()
+    return _book
+
+
+def refresh_price_book(force: bool = False) -> bool:
+    """
+    Reload the shared PriceBook if the source tables changed
+
+    Readers keep using the previous snapshot until the new one is complete.
+
+    Args:
+        force: Reload even if the source version is unchanged
+
+    Returns:
+        True if a new book was swapped in
+    """
+    global _book
+    with _book_lock:
+        if not force and _book is not None and fetch_price_book_version() == _book.version:
+            return False
+        _book = load_price_book()
+        return True
+
+
+def get_price_book_stats() -> Dict[str, Any]:
+    """Metrics for the shared book without triggering a load"""
+    book = _book
+    if book is None:
+        return {'loaded': False}
+    return {'loaded': True, **book.stats()}
+
+
+def _refresh_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            refresh_price_book()
+        except Exception as e:
+            print(f"Price book refresh failed: {e}")
+
+
+def start_price_book_refresher(interval: float = DEFAULT_REFRESH_INTERVAL) -> None:
+    """Start the background thread that picks up new prices (idempotent)"""
+    global _refresher
+    if _refresher is not None:
+        return
+    _refresher = threading.Thread(target=_refresh_loop, args=(interval,), name="price-book-refresh", daemon=True)
+    _refresher.start()
+
+
+def warm_up_price_book() -> None:
+    """
+    Load the shared book and start the refresher
+
+    The refresher is started even if the initial load fails: whichever
+    comes first, its next tick or a get_price_book() call, loads the book.
+    """
+    try:
+        get_price_book()
+    except Exception as e:
+        print(f"Price book warm-up failed: {e}")
+    start_price_book_refresher()
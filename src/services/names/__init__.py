@@ -0,0 +1,22 @@
+"""
+Names Service
+
+Alliance / corporation / character name resolution with in-process, Redis
+and batched ESI lookups.
+"""
+
+from src.services.names.resolver import (
+    CATEGORIES,
+    FALLBACK_NAMES,
+    NameResolver,
+    get_name_resolver,
+    name_key,
+)
+
+__all__ = [
+    'CATEGORIES',
+    'FALLBACK_NAMES',
+    'NameResolver',
+    'get_name_resolver',
+    'name_key',
+]
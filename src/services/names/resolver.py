@@ -0,0 +1,278 @@
+"""
+Name Resolver
+
+One lookup path for alliance, corporation and character names:
+
+1. in-process LRU (names and "unknown ID" markers)
+2. Redis MGET of the esi:<category>:<id>:name keys
+3. ESI POST /universe/names/ for the remaining misses, up to 1000 IDs per call
+
+IDs ESI does not know are cached as negative entries (empty string in
+Redis, shorter TTL) so they are not asked for again on every call.
+Concurrent callers that miss on the same ID share one fetch. The async
+front-end runs the same resolver in a worker thread.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import redis
+import requests
+
+from config import ESI_BASE_URL, ESI_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ('alliance', 'corporation', 'character')
+FALLBACK_NAMES = {
+    'alliance': 'Alliance {}',
+    'corporation': 'Corporation {}',
+    'character': 'Character {}',
+}
+
+NAME_TTL = 7 * 24 * 60 * 60         # Redis TTL of resolved names
+NEGATIVE_TTL = 60 * 60              # Redis / LRU TTL of IDs ESI does not know
+LRU_SIZE = 50000
+ESI_BATCH_SIZE = 1000               # POST /universe/names/ limit
+ESI_TIMEOUT = 10
+WAIT_TIMEOUT = 30                   # Max wait on another caller's fetch
+
+
+def name_key(category: str, entity_id: int) -> str:
+    return f"esi:{category}:{entity_id}:name"
+
+
+class NameResolver:
+    """Bulk entity-name resolver shared by the services and routers"""
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        session: Optional[requests.Session] = None,
+        lru_size: int = LRU_SIZE,
+        name_ttl: int = NAME_TTL,
+        negative_ttl: int = NEGATIVE_TTL
+    ):
+        self.redis_client = redis_client
+        self.session = session
+        self.lru_size = lru_size
+        self.name_ttl = name_ttl
+        self.negative_ttl = negative_ttl
+
+        self._lru: "OrderedDict[Tuple[str, int], Tuple[Optional[str], float]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, int], Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {'lru_hits': 0, 'redis_hits': 0, 'esi_requests': 0, 'esi_ids': 0}
+
+    # ------------------------------------------------------------------
+    # Front-ends
+    # ------------------------------------------------------------------
+
+    def resolve(self, category: str, ids: Iterable[int]) -> Dict[int, Optional[str]]:
+        """
+        Names of the given IDs; None for IDs ESI does not know or that
+        could not be resolved right now.
+        """
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown name category: {category}")
+
+        result: Dict[int, Optional[str]] = {}
+        misses = []
+        now = time.monotonic()
+        with self._lock:
+            for entity_id in dict.fromkeys(int(i) for i in ids if i):
+                cached = self._lru.get((category, entity_id))
+                if cached is not None and cached[1] > now:
+                    self._lru.move_to_end((category, entity_id))
+                    result[entity_id] = cached[0]
+                    self.stats['lru_hits'] += 1
+                else:
+                    misses.append(entity_id)
+        if not misses:
+            return result
+
+        # Claim the misses nobody is fetching yet, wait for the others
+        owned: List[int] = []
+        waiting: List[Tuple[int, Future]] = []
+        with self._lock:
+            for entity_id in misses:
+                future = self._inflight.get((category, entity_id))
+                if future is None:
+                    self._inflight[(category, entity_id)] = Future()
+                    owned.append(entity_id)
+                else:
+                    waiting.append((entity_id, future))
+
+        if owned:
+            names: Dict[int, Optional[str]] = {}
+            try:
+                names = self._fetch(category, owned)
+            except Exception as e:
+                logger.warning(f"Name resolution failed for {len(owned)} {category} IDs: {e}")
+            finally:
+                with self._lock:
+                    for entity_id in owned:
+                        self._inflight.pop((category, entity_id)).set_result(names.get(entity_id))
+            result.update({entity_id: names.get(entity_id) for entity_id in owned})
+
+        for entity_id, future in waiting:
+            try:
+                result[entity_id] = future.result(timeout=WAIT_TIMEOUT)
+            except Exception:
+                result[entity_id] = None
+        return result
+
+    def get_names(self, category: str, ids: Iterable[int]) -> Dict[int, str]:
+        """Names of the given IDs, with 'Alliance 123'-style fallbacks"""
+        fallback = FALLBACK_NAMES[category]
+        return {
+            entity_id: name or fallback.format(entity_id)
+            for entity_id, name in self.resolve(category, ids).items()
+        }
+
+    def get_name(self, category: str, entity_id: int) -> str:
+        """Name of one ID with fallback, 'Unknown' for a missing ID"""
+        if not entity_id:
+            return "Unknown"
+        return self.get_names(category, [entity_id])[int(entity_id)]
+
+    async def aget_names(self, category: str, ids: Iterable[int]) -> Dict[int, str]:
+        """Async get_names(); the lookup runs in a worker thread"""
+        return await asyncio.to_thread(self.get_names, category, list(ids))
+
+    async def aget_name(self, category: str, entity_id: int) -> str:
+        """Async get_name(); LRU hits are answered without a thread hop"""
+        if not entity_id:
+            return "Unknown"
+        cached = self._lru_get(category, int(entity_id))
+        if cached is not None:
+            return cached[0] or FALLBACK_NAMES[category].format(entity_id)
+        return (await self.aget_names(category, [entity_id]))[int(entity_id)]
+
+    # ------------------------------------------------------------------
+    # Cache tiers
+    # ------------------------------------------------------------------
+
+    def _lru_get(self, category: str, entity_id: int) -> Optional[Tuple[Optional[str], float]]:
+        with self._lock:
+            cached = self._lru.get((category, entity_id))
+            if cached is None or cached[1] <= time.monotonic():
+                return None
+            self._lru.move_to_end((category, entity_id))
+            self.stats['lru_hits'] += 1
+            return cached
+
+    def _lru_put(self, category: str, names: Dict[int, Optional[str]]):
+        now = time.monotonic()
+        with self._lock:
+            for entity_id, name in names.items():
+                ttl = self.name_ttl if name else self.negative_ttl
+                self._lru[(category, entity_id)] = (name, now + ttl)
+                self._lru.move_to_end((category, entity_id))
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _fetch(self, category: str, ids: List[int]) -> Dict[int, Optional[str]]:
+        """Redis, then ESI; fills both cache tiers"""
+        names: Dict[int, Optional[str]] = {}
+        client = self._redis()
+
+        try:
+            cached = client.mget([name_key(category, i) for i in ids])
+        except redis.RedisError:
+            cached = [None] * len(ids)
+        missing = []
+        for entity_id, value in zip(ids, cached):
+            if value is None:
+                missing.append(entity_id)
+            else:
+                names[entity_id] = (value if isinstance(value, str) else value.decode('utf-8')) or None
+                self.stats['redis_hits'] += 1
+        self._lru_put(category, names)
+
+        if missing:
+            resolved, unknown = self._fetch_esi(missing)
+            fetched = {i: resolved[i] for i in missing if i in resolved}
+            fetched.update({i: None for i in unknown})
+
+            try:
+                pipe = client.pipeline(transaction=False)
+                for entity_id, name in fetched.items():
+                    if name:
+                        pipe.setex(name_key(category, entity_id), self.name_ttl, name)
+                    else:
+                        pipe.setex(name_key(category, entity_id), self.negative_ttl, "")
+                pipe.execute()
+            except redis.RedisError:
+                pass
+            self._lru_put(category, fetched)
+            names.update(fetched)
+        return names
+
+    def _fetch_esi(self, ids: List[int]) -> Tuple[Dict[int, str], List[int]]:
+        """
+        Resolve IDs via POST /universe/names/
+
+        Returns:
+            (id -> name, IDs ESI does not know). IDs missing from both were
+            not resolved because of an ESI error and are not negative-cached.
+        """
+        resolved: Dict[int, str] = {}
+        unknown: List[int] = []
+        for start in range(0, len(ids), ESI_BATCH_SIZE):
+            self._post_names(ids[start:start + ESI_BATCH_SIZE], resolved, unknown)
+        return resolved, unknown
+
+    def _post_names(self, ids: List[int], resolved: Dict[int, str], unknown: List[int]):
+        # ESI answers 404 for the whole batch if any ID is invalid: bisect to isolate them
+        self.stats['esi_requests'] += 1
+        self.stats['esi_ids'] += len(ids)
+        try:
+            response = self._session().post(f"{ESI_BASE_URL}/universe/names/", json=ids, timeout=ESI_TIMEOUT)
+        except requests.RequestException as e:
+            logger.warning(f"ESI /universe/names/ request failed: {e}")
+            return
+
+        if response.status_code == 200:
+            for entry in response.json():
+                resolved[int(entry['id'])] = entry['name']
+        elif response.status_code == 404:
+            if len(ids) == 1:
+                unknown.append(ids[0])
+            else:
+                middle = len(ids) // 2
+                self._post_names(ids[:middle], resolved, unknown)
+                self._post_names(ids[middle:], resolved, unknown)
+        else:
+            logger.warning(f"ESI /universe/names/ returned {response.status_code}")
+
+    def _redis(self) -> redis.Redis:
+        if self.redis_client is None:
+            self.redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
+        return self.redis_client
+
+    def _session(self) -> requests.Session:
+        if self.session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": ESI_USER_AGENT, "Accept": "application/json"})
+            self.session = session
+        return self.session
+
+
+_resolver: Optional[NameResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_name_resolver() -> NameResolver:
+    """Get the shared NameResolver"""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = NameResolver()
+    return _resolver
@@ -13,6 +13,8 @@ from .models import (
 )
 from .repository import ProductionRepository
 from .service import ProductionService
+from .profitability import ProfitabilityEngine, ProfitabilityScan
+from .bom_cache import BOMCache
 
 __all__ = [
     "MaterialItem",
@@ -26,4 +28,7 @@ __all__ = [
     "QuickProfitCheck",
     "ProductionRepository",
     "ProductionService",
+    "ProfitabilityEngine",
+    "ProfitabilityScan",
+    "BOMCache",
 ]
@@ -0,0 +1,342 @@
+"""
+BOM Cache
+
+Read-through, size-bounded LRU cache over the static SDE industry tables:
+product -> blueprint, blueprint -> product, per-activity material lists and
+output quantities, plus basic type info (name, group, volume).
+
+The SDE only changes when a new dump is imported, so entries never expire by
+age. Instead the cache is keyed by an SDE version stamp (table OIDs and row
+counts of the industry tables and invTypes); when the stamp changes, all
+entries are dropped. The stamp is re-checked at most every
+VERSION_CHECK_INTERVAL seconds, and invalidate() forces a reset.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.database import get_db_connection
+
+
+DEFAULT_MAX_ENTRIES = 50000
+VERSION_CHECK_INTERVAL = 300  # Seconds between SDE version stamp checks
+MANUFACTURING = 1
+REACTION = 11
+BUILD_ACTIVITIES = (MANUFACTURING, REACTION)
+
+_SDE_VERSION_SQL = """
+    SELECT
+        to_regclass('"industryActivityProducts"')::oid,
+        (SELECT COUNT(*) FROM "industryActivityProducts"),
+        to_regclass('"industryActivityMaterials"')::oid,
+        (SELECT COUNT(*) FROM "industryActivityMaterials"),
+        to_regclass('"invTypes"')::oid,
+        (SELECT COUNT(*) FROM "invTypes")
+"""
+
+
+class BlueprintProduct(NamedTuple):
+    """One industryActivityProducts row"""
+    blueprint_id: int
+    product_type_id: int
+    activity_id: int
+    quantity: int
+
+
+class Material(NamedTuple):
+    """One industryActivityMaterials row with the material's type info"""
+    type_id: int
+    quantity: int
+    name: str
+    volume: float
+
+
+class TypeInfo(NamedTuple):
+    """Basic invTypes info"""
+    type_id: int
+    name: str
+    group_id: int
+    volume: float
+
+
+_MISSING = object()  # Cached negative lookup
+
+
+def fetch_sde_version() -> Tuple:
+    """SDE version stamp: OIDs and row counts of the cached tables"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_SDE_VERSION_SQL)
+            return tuple(cur.fetchone())
+
+
+def _material(row: Sequence) -> Material:
+    return Material(row[0], row[1], row[2] or 'Unknown', float(row[3] or 0))
+
+
+class BOMCache:
+    """Read-through LRU cache of SDE blueprint data"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, version_check_interval: float = VERSION_CHECK_INTERVAL):
+        self.max_entries = max_entries
+        self.version_check_interval = version_check_interval
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._version: Optional[Tuple] = None
+        self._version_checked_at = 0.0
+        self._hits: Dict[str, int] = defaultdict(int)
+        self._misses: Dict[str, int] = defaultdict(int)
+        self._evictions = 0
+        self._invalidations = 0
+        self._warmed_at: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Core
+    # ------------------------------------------------------------------
+
+    def _get(self, key: Tuple, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, loading and storing it on a miss"""
+        self._check_version()
+        kind = key[0]
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits[kind] += 1
+                value = self._entries[key]
+                return None if value is _MISSING else value
+            self._misses[kind] += 1
+
+        value = loader()
+        self._put(key, _MISSING if value is None else value)
+        return value
+
+    def _put(self, key: Tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _check_version(self, force: bool = False) -> None:
+        """Drop all entries if the SDE version stamp changed"""
+        now = time.time()
+        if not force and now - self._version_checked_at < self.version_check_interval:
+            return
+        self._version_checked_at = now
+
+        try:
+            version = fetch_sde_version()
+        except Exception as e:
+            print(f"BOM cache version check failed: {e}")
+            return
+
+        with self._lock:
+            if self._version is not None and version != self._version:
+                print("BOM cache: SDE version changed, dropping cached entries")
+                self._clear()
+            self._version = version
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+            self._warmed_at = None
+
+    def invalidate(self) -> None:
+        """Drop all entries and re-read the SDE version stamp on next use"""
+        self._clear()
+        self._version = None
+        self._version_checked_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def blueprints_for_product(self, product_type_id: int) -> Tuple[BlueprintProduct, ...]:
+        """All manufacturing/reaction blueprints producing a type"""
+        return self._get(('product', product_type_id), lambda: self._load_blueprints(product_type_id)) or ()
+
+    def blueprint_for_product(
+        self,
+        product_type_id: int,
+        activities: Sequence[int] = (MANUFACTURING,)
+    ) -> Optional[BlueprintProduct]:
+        """First blueprint producing a type with one of the given activities"""
+        for bp in self.blueprints_for_product(product_type_id):
+            if bp.activity_id in activities:
+                return bp
+        return None
+
+    def has_blueprint(self, type_id: int) -> bool:
+        """True if the type can be manufactured or reacted"""
+        return self.blueprint_for_product(type_id, BUILD_ACTIVITIES) is not None
+
+    def product_for_blueprint(self, blueprint_id: int, activity_id: int = MANUFACTURING) -> Optional[BlueprintProduct]:
+        """Product and output quantity of a blueprint activity"""
+        return self._get(
+            ('blueprint', blueprint_id, activity_id),
+            lambda: self._load_product(blueprint_id, activity_id)
+        )
+
+    def materials(self, blueprint_id: int, activity_id: int = MANUFACTURING) -> Tuple[Material, ...]:
+        """Base materials of a blueprint activity, ordered by material name"""
+        return self._get(
+            ('materials', blueprint_id, activity_id),
+            lambda: self._load_materials(blueprint_id, activity_id)
+        ) or ()
+
+    def type_info(self, type_id: int) -> Optional[TypeInfo]:
+        """Name, group and volume of a type"""
+        return self._get(('type', type_id), lambda: self._load_type(type_id))
+
+    # ------------------------------------------------------------------
+    # Loaders (one query per miss)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_blueprints(product_type_id: int) -> Optional[Tuple[BlueprintProduct, ...]]:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute('''
+                    SELECT "typeID", "productTypeID", "activityID", "quantity"
+                    FROM "industryActivityProducts"
+                    WHERE "productTypeID" = %s AND "activityID" IN (1, 11)
+                    ORDER BY "activityID", "typeID"
+                ''', (product_type_id,))
+                rows = cur.fetchall()
+        return tuple(BlueprintProduct(r[0], r[1], r[2], r[3] or 1) for r in rows) or None
+
+    @staticmethod
+    def _load_product(blueprint_id: int, activity_id: int) -> Optional[BlueprintProduct]:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute('''
+                    SELECT "typeID", "productTypeID", "activityID", "quantity"
+                    FROM "industryActivityProducts"
+                    WHERE "typeID" = %s AND "activityID" = %s
+                    LIMIT 1
+                ''', (blueprint_id, activity_id))
+                row = cur.fetchone()
+        return BlueprintProduct(row[0], row[1], row[2], row[3] or 1) if row else None
+
+    @staticmethod
+    def _load_materials(blueprint_id: int, activity_id: int) -> Optional[Tuple[Material, ...]]:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute('''
+                    SELECT m."materialTypeID", m."quantity", t."typeName", t."volume"
+                    FROM "industryActivityMaterials" m
+                    LEFT JOIN "invTypes" t ON m."materialTypeID" = t."typeID"
+                    WHERE m."typeID" = %s AND m."activityID" = %s
+                    ORDER BY t."typeName"
+                ''', (blueprint_id, activity_id))
+                rows = cur.fetchall()
+        return tuple(_material(r) for r in rows) or None
+
+    @staticmethod
+    def _load_type(type_id: int) -> Optional[TypeInfo]:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute('''
+                    SELECT "typeID", "typeName", "groupID", "volume"
+                    FROM "invTypes"
+                    WHERE "typeID" = %s
+                ''', (type_id,))
+                row = cur.fetchone()
+        return TypeInfo(row[0], row[1], row[2], float(row[3] or 0)) if row else None
+
+    # ------------------------------------------------------------------
+    # Warm-up and metrics
+    # ------------------------------------------------------------------
+
+    def warm_up(self) -> int:
+        """
+        Bulk-load every manufacturing/reaction blueprint in three queries
+
+        Returns:
+            Number of cached entries
+        """
+        started = time.time()
+        self._check_version(force=True)
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute('''
+                    SELECT "typeID", "productTypeID", "activityID", "quantity"
+                    FROM "industryActivityProducts"
+                    WHERE "activityID" IN (1, 11)
+                    ORDER BY "activityID", "typeID"
+                ''')
+                product_rows = cur.fetchall()
+
+                cur.execute('''
+                    SELECT m."typeID", m."activityID", m."materialTypeID", m."quantity", t."typeName", t."volume"
+                    FROM "industryActivityMaterials" m
+                    LEFT JOIN "invTypes" t ON m."materialTypeID" = t."typeID"
+                    WHERE m."activityID" IN (1, 11)
+                    ORDER BY t."typeName"
+                ''')
+                material_rows = cur.fetchall()
+
+        by_product: Dict[int, List[BlueprintProduct]] = defaultdict(list)
+        by_blueprint: Dict[Tuple[int, int], BlueprintProduct] = {}
+        for r in product_rows:
+            bp = BlueprintProduct(r[0], r[1], r[2], r[3] or 1)
+            by_product[bp.product_type_id].append(bp)
+            by_blueprint.setdefault((bp.blueprint_id, bp.activity_id), bp)
+
+        materials: Dict[Tuple[int, int], List[Material]] = defaultdict(list)
+        for r in material_rows:
+            materials[(r[0], r[1])].append(_material(r[2:]))
+
+        for product_type_id, bps in by_product.items():
+            self._put(('product', product_type_id), tuple(bps))
+        for (blueprint_id, activity_id), bp in by_blueprint.items():
+            self._put(('blueprint', blueprint_id, activity_id), bp)
+        for (blueprint_id, activity_id), mats in materials.items():
+            self._put(('materials', blueprint_id, activity_id), tuple(mats))
+
+        self._warmed_at = time.time()
+        print(f"BOM cache warmed: {len(by_blueprint)} blueprints, {len(self._entries)} entries "
+              f"in {self._warmed_at - started:.2f}s")
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, hit/miss counters per lookup kind and SDE version"""
+        with self._lock:
+            kinds = sorted(set(self._hits) | set(self._misses))
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': round(hits / (hits + misses), 4) if hits + misses else None,
+                'by_kind': {k: {'hits': self._hits[k], 'misses': self._misses[k]} for k in kinds},
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'sde_version': list(self._version) if self._version else None,
+                'warmed_at': self._warmed_at,
+            }
+
+
+# Process-wide instance
+bom_cache = BOMCache()
+
+
+def warm_up_bom_cache() -> None:
+    """
+    Warm the shared BOM cache ahead of the first request
+
+    If the bulk load fails the cache stays cold and falls back to per-blueprint
+    queries on each miss, so requests still work, only slower.
+    """
+    try:
+        bom_cache.warm_up()
+    except Exception as e:
+        print(f"BOM cache warm-up failed: {e}")
@@ -0,0 +1,359 @@
+"""
+Profitability Engine
+
+Whole-catalog manufacturing profitability in a handful of array operations.
+
+The manufacturing BOMs of every blueprint are loaded once into a sparse
+blueprint x material matrix (CSR: indptr / material_index / base_quantity).
+A scan applies ME rounding to the whole matrix, gathers material prices from
+the shared price book and sums each row, for several ME levels and price
+sources (global adjusted prices and regional sell prices) in one pass.
+
+Results match ProductionSimulator.quick_profit_check / get_bom: per-run
+quantities are max(1, ceil(base * (1 - ME/100))) times runs, missing prices
+count as 0 and margin is profit over material cost.
+"""
+
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.database import get_db_connection
+from src.material_classifier import SOURCE_DIFFICULTY, score_sources, source_for_group
+from src.services.market.price_book import PriceBook
+
+
+ADJUSTED = None  # Price source key for global adjusted prices
+NO_BOM_DIFFICULTY = 5  # Score of a blueprint without materials
+
+
+@dataclass(frozen=True, eq=False)
+class ProfitabilityEngine:
+    """
+    Immutable manufacturing BOM matrix
+
+    Rows are blueprints (``blueprint_ids`` sorted ascending); materials of row
+    i are ``material_index[indptr[i]:indptr[i + 1]]`` into ``material_ids``.
+    """
+    blueprint_ids: np.ndarray
+    product_ids: np.ndarray
+    output_quantity: np.ndarray
+    indptr: np.ndarray
+    material_index: np.ndarray
+    base_quantity: np.ndarray
+    material_ids: np.ndarray
+    material_sources: Tuple[str, ...]
+    _row: Dict[int, int] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_rows(
+        cls,
+        product_rows: Sequence[Tuple[int, int, int]],
+        material_rows: Sequence[Tuple[int, int, int]],
+        material_groups: Optional[Dict[int, Tuple[int, Optional[int]]]] = None
+    ) -> 'ProfitabilityEngine':
+        """
+        Build from SDE rows
+
+        Args:
+            product_rows: (blueprint_id, product_type_id, quantity) for activity 1
+            material_rows: (blueprint_id, material_type_id, quantity) for activity 1
+            material_groups: material_type_id -> (groupID, categoryID) used to
+                classify material sources
+        """
+        products = {}
+        for blueprint_id, product_id, quantity in sorted(product_rows):
+            products.setdefault(blueprint_id, (product_id, quantity or 1))
+
+        blueprint_ids = np.array(sorted(products), dtype=np.int64)
+        row = {int(bp): i for i, bp in enumerate(blueprint_ids)}
+
+        # Last row wins for duplicate (blueprint, material) pairs, like get_bom's dict
+        entries = {}
+        for blueprint_id, material_id, quantity in material_rows:
+            if blueprint_id in row:
+                entries[(row[blueprint_id], material_id)] = quantity
+
+        rows = np.array([r for r, _ in entries], dtype=np.int64)
+        materials = np.array([m for _, m in entries], dtype=np.int64)
+        quantities = np.array(list(entries.values()), dtype=np.int64)
+        order = np.lexsort((materials, rows))
+        rows, materials, quantities = rows[order], materials[order], quantities[order]
+
+        material_ids = np.unique(materials)
+        indptr = np.zeros(len(blueprint_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(blueprint_ids)), out=indptr[1:])
+
+        groups = material_groups or {}
+        sources = tuple(source_for_group(*groups.get(int(m), (0, None))) for m in material_ids)
+
+        engine = cls(
+            blueprint_ids=blueprint_ids,
+            product_ids=np.array([products[bp][0] for bp in blueprint_ids.tolist()], dtype=np.int64),
+            output_quantity=np.array([products[bp][1] for bp in blueprint_ids.tolist()], dtype=np.int64),
+            indptr=indptr,
+            material_index=np.searchsorted(material_ids, materials),
+            base_quantity=quantities,
+            material_ids=material_ids,
+            material_sources=sources,
+            _row=row,
+        )
+        for array in (engine.blueprint_ids, engine.product_ids, engine.output_quantity, engine.indptr,
+                      engine.material_index, engine.base_quantity, engine.material_ids):
+            array.setflags(write=False)
+        return engine
+
+    @classmethod
+    def load(cls) -> 'ProfitabilityEngine':
+        """Load all manufacturing blueprints and their materials from the SDE"""
+        started = time.time()
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute('''
+                    SELECT "typeID", "productTypeID", "quantity"
+                    FROM "industryActivityProducts"
+                    WHERE "activityID" = 1
+                ''')
+                product_rows = cur.fetchall()
+
+                cur.execute('''
+                    SELECT "typeID", "materialTypeID", "quantity"
+                    FROM "industryActivityMaterials"
+                    WHERE "activityID" = 1
+                ''')
+                material_rows = cur.fetchall()
+
+                cur.execute('''
+                    SELECT it."typeID", it."groupID", ig."categoryID"
+                    FROM "invTypes" it
+                    LEFT JOIN "invGroups" ig ON ig."groupID" = it."groupID"
+                    WHERE it."typeID" = ANY(%s)
+                ''', (list({row[1] for row in material_rows}),))
+                material_groups = {row[0]: (row[1] or 0, row[2]) for row in cur.fetchall()}
+
+        engine = cls.from_rows(product_rows, material_rows, material_groups)
+        print(f"Profitability engine loaded: {len(engine)} blueprints, {len(engine.material_ids)} materials, "
+              f"{len(engine.base_quantity)} BOM entries in {time.time() - started:.2f}s")
+        return engine
+
+    # ------------------------------------------------------------------
+    # Per-blueprint lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.blueprint_ids)
+
+    def row_of(self, blueprint_id: int) -> Optional[int]:
+        """Matrix row of a blueprint, or None if it has no manufacturing product"""
+        return self._row.get(blueprint_id)
+
+    @cached_property
+    def _entry_rows(self) -> np.ndarray:
+        """Row of every BOM entry"""
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.indptr))
+
+    def quantities(self, me: int, runs: int = 1) -> np.ndarray:
+        """ME-adjusted quantity of every BOM entry (same rounding as get_bom)"""
+        me_factor = 1 - (me / 100)
+        per_run = np.maximum(1, np.ceil(self.base_quantity * me_factor)).astype(np.int64)
+        return per_run * runs
+
+    def bom(self, blueprint_id: int, me: int = 0, runs: int = 1) -> Dict[int, int]:
+        """{material_type_id: quantity} for one blueprint"""
+        i = self._row.get(blueprint_id)
+        if i is None:
+            return {}
+        start, end = self.indptr[i], self.indptr[i + 1]
+        me_factor = 1 - (me / 100)
+        return {
+            int(self.material_ids[m]): max(1, int(np.ceil(q * me_factor))) * runs
+            for m, q in zip(self.material_index[start:end], self.base_quantity[start:end])
+        }
+
+    # ------------------------------------------------------------------
+    # Manufacturability
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def difficulty(self) -> np.ndarray:
+        """Manufacturability score per blueprint (1=easy ... 5=hard/no BOM)"""
+        material_difficulty = np.array(
+            [SOURCE_DIFFICULTY.get(s, 3) for s in self.material_sources], dtype=np.int64
+        )
+        scores = np.ones(len(self), dtype=np.int64)
+        np.maximum.at(scores, self._entry_rows, material_difficulty[self.material_index])
+        scores[np.diff(self.indptr) == 0] = NO_BOM_DIFFICULTY
+        return scores
+
+    def manufacturability(self, blueprint_id: int) -> Dict:
+        """Same dict as MaterialClassifier.get_manufacturability_score"""
+        i = self._row.get(blueprint_id)
+        if i is None or self.indptr[i] == self.indptr[i + 1]:
+            return {"score": NO_BOM_DIFFICULTY, "sources": {}, "warnings": ["No BOM found"], "is_market_only": False}
+
+        sources: Dict[str, int] = {}
+        for m in self.material_index[self.indptr[i]:self.indptr[i + 1]]:
+            source = self.material_sources[m]
+            sources[source] = sources.get(source, 0) + 1
+        return score_sources(sources)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _row_sums(self, values: np.ndarray) -> np.ndarray:
+        return np.bincount(self._entry_rows, weights=values, minlength=len(self))
+
+    def scan(
+        self,
+        book: PriceBook,
+        me_levels: Iterable[int] = (10,),
+        runs: int = 1,
+        region_ids: Iterable[int] = ()
+    ) -> 'ProfitabilityScan':
+        """
+        Price every blueprint
+
+        Args:
+            book: Price snapshot to read prices from
+            me_levels: Material Efficiency levels to evaluate
+            runs: Production runs
+            region_ids: Regions to price at lowest sell, in addition to the
+                global adjusted prices (price source ADJUSTED)
+
+        Returns:
+            ProfitabilityScan with arrays shaped (ME levels, sources, blueprints)
+        """
+        started = time.time()
+        me_levels = tuple(me_levels)
+        sources = (ADJUSTED,) + tuple(region_ids)
+
+        material_prices = []
+        product_prices = []
+        for source in sources:
+            if source is ADJUSTED:
+                material_prices.append(book.adjusted_prices(self.material_ids))
+                product_prices.append(book.adjusted_prices(self.product_ids))
+            else:
+                material_prices.append(book.sell_prices(self.material_ids, source))
+                product_prices.append(book.sell_prices(self.product_ids, source))
+        material_prices = np.vstack(material_prices)
+        product_price = np.nan_to_num(np.vstack(product_prices), nan=0.0)
+
+        # A source prices a blueprint only if it knows every material
+        entry_prices = material_prices[:, self.material_index]
+        unpriced = ~(entry_prices > 0)
+        priced = np.vstack([self._row_sums(u.astype(np.float64)) == 0 for u in unpriced])
+        entry_prices = np.nan_to_num(entry_prices, nan=0.0)
+
+        material_cost = np.empty((len(me_levels), len(sources), len(self)))
+        for i, me in enumerate(me_levels):
+            quantities = self.quantities(me, runs)
+            for j in range(len(sources)):
+                material_cost[i, j] = self._row_sums(quantities * entry_prices[j])
+
+        output_quantity = self.output_quantity * runs
+        revenue = product_price * output_quantity
+        profit = revenue[np.newaxis] - material_cost
+        margin = np.divide(profit * 100, material_cost, out=np.zeros_like(profit), where=material_cost > 0)
+
+        return ProfitabilityScan(
+            engine=self,
+            me_levels=me_levels,
+            sources=sources,
+            runs=runs,
+            output_quantity=output_quantity,
+            material_cost=material_cost,
+            product_price=product_price,
+            revenue=revenue,
+            profit=profit,
+            margin=margin,
+            priced=priced,
+            elapsed=time.time() - started,
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class ProfitabilityScan:
+    """
+    Result of ProfitabilityEngine.scan
+
+    ``material_cost``, ``profit`` and ``margin`` are shaped (ME levels,
+    sources, blueprints); ``product_price``, ``revenue`` and ``priced`` are
+    shaped (sources, blueprints). Source 0 is always ADJUSTED.
+    """
+    engine: ProfitabilityEngine
+    me_levels: Tuple[int, ...]
+    sources: Tuple[Optional[int], ...]
+    runs: int
+    output_quantity: np.ndarray
+    material_cost: np.ndarray
+    product_price: np.ndarray
+    revenue: np.ndarray
+    profit: np.ndarray
+    margin: np.ndarray
+    priced: np.ndarray
+    elapsed: float = 0.0
+
+    def _axes(self, me: Optional[int], source: Optional[int]) -> Tuple[int, int]:
+        i = self.me_levels.index(me) if me is not None else 0
+        return i, self.sources.index(source)
+
+    def result(self, blueprint_id: int, me: Optional[int] = None, source: Optional[int] = ADJUSTED) -> Optional[Dict[str, Any]]:
+        """
+        quick_profit_check-style dict for one blueprint
+
+        Returns None if the blueprint is unknown or has no materials.
+        """
+        engine = self.engine
+        b = engine.row_of(blueprint_id)
+        if b is None or engine.indptr[b] == engine.indptr[b + 1]:
+            return None
+        i, j = self._axes(me, source)
+
+        return {
+            "type_id": int(engine.product_ids[b]),
+            "blueprint_id": int(blueprint_id),
+            "region_id": source,
+            "runs": self.runs,
+            "me": self.me_levels[i],
+            "output_quantity": int(self.output_quantity[b]),
+            "material_cost": round(float(self.material_cost[i, j, b]), 2),
+            "product_price": round(float(self.product_price[j, b]), 2),
+            "revenue": round(float(self.revenue[j, b]), 2),
+            "profit": round(float(self.profit[i, j, b]), 2),
+            "margin_percent": round(float(self.margin[i, j, b]), 2),
+            "priced": bool(self.priced[j, b]),
+            "difficulty": int(engine.difficulty[b]),
+        }
+
+    def results(
+        self,
+        blueprint_ids: Iterable[int],
+        me: Optional[int] = None,
+        source: Optional[int] = ADJUSTED,
+        min_margin: Optional[float] = None,
+        min_profit: Optional[float] = None,
+        max_difficulty: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Results for the given blueprints that pass the filters, sorted by margin descending"""
+        engine = self.engine
+        i, j = self._axes(me, source)
+
+        rows = np.array([engine._row.get(bp, -1) for bp in blueprint_ids], dtype=np.int64)
+        rows = rows[rows >= 0]
+        keep = np.diff(engine.indptr)[rows] > 0
+        if min_margin is not None:
+            keep &= self.margin[i, j, rows] >= min_margin
+        if min_profit is not None:
+            keep &= self.profit[i, j, rows] >= min_profit
+        if max_difficulty is not None:
+            keep &= engine.difficulty[rows] <= max_difficulty
+        rows = rows[keep]
+        rows = rows[np.argsort(-self.margin[i, j, rows], kind='stable')]
+
+        return [self.result(int(engine.blueprint_ids[b]), self.me_levels[i], source) for b in rows]
@@ -21,6 +21,8 @@ from src.services.route.models import (
     RouteWithDanger,
 )
 from src.services.route.repository import RouteRepository
+from src.services.route.jump_matrix import JumpMatrix, SECURITY_PROFILES
+from src.services.route.universe import UniverseGraph, get_universe_graph
 
 __all__ = [
     # Constants
@@ -39,4 +41,10 @@ __all__ = [
     'RouteWithDanger',
     # Repository
     'RouteRepository',
+    # Jump matrix
+    'JumpMatrix',
+    'SECURITY_PROFILES',
+    # Shared universe graph
+    'UniverseGraph',
+    'get_universe_graph',
 ]
@@ -0,0 +1,371 @@
+"""
+Jump Matrix
+
+Precomputed all-pairs jump distances and next hops for the stargate network.
+
+One distance table (uint8) and one next-hop table (uint16) is built per
+security profile from the ``mapSolarSystemJumps`` graph. Tables are persisted
+as ``.npy`` files and memory-mapped on load, so route lookups and jump counts
+become O(path length) array walks instead of a graph search per request.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+# Security profiles: profile name -> minimum security a system needs to be entered.
+# Thresholds match the values RouteService.find_route derives from its flags
+# with the default min_security of 0.5.
+SECURITY_PROFILES: Dict[str, float] = {
+    'highsec': 0.5,
+    'no_nullsec': 0.0,
+    'any': -1.0,
+}
+
+# Sentinels
+UNREACHABLE = np.iinfo(np.uint8).max
+NO_HOP = np.iinfo(np.uint16).max
+
+# Default location of the persisted tables
+DEFAULT_MATRIX_DIR = os.environ.get(
+    'JUMP_MATRIX_DIR',
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+        'data', 'cache', 'jump_matrix'
+    )
+)
+
+_META_FILE = 'meta.json'
+_SYSTEMS_FILE = 'system_ids.npy'
+
+
+def profile_for(min_sec: float) -> Optional[str]:
+    """
+    Map an effective security threshold to a precomputed profile
+
+    Args:
+        min_sec: Minimum security a system must have to be entered
+
+    Returns:
+        Profile name, or None if no table exists for this threshold
+    """
+    for name, threshold in SECURITY_PROFILES.items():
+        if abs(threshold - min_sec) < 1e-9:
+            return name
+    return None
+
+
+def graph_fingerprint(systems: Dict[int, dict], graph: Dict[int, List[int]]) -> str:
+    """
+    Stable hash of the jump graph and system security values
+
+    Used to detect persisted tables that no longer match the SDE.
+    """
+    digest = hashlib.sha1()
+    for sys_id in sorted(systems):
+        digest.update(f"{sys_id}:{round(float(systems[sys_id]['security']), 4)};".encode())
+    for from_id in sorted(graph):
+        digest.update(f"{from_id}>{','.join(str(t) for t in sorted(graph[from_id]))};".encode())
+    return digest.hexdigest()
+
+
+class JumpMatrix:
+    """
+    All-pairs jump distance and next-hop tables per security profile
+
+    ``dist[profile][i, j]`` is the jump count from system index i to j
+    (UNREACHABLE if there is no route). ``next_hop[profile][i, j]`` is the
+    index of the first system after i on a shortest route to j.
+    """
+
+    def __init__(
+        self,
+        system_ids: np.ndarray,
+        dist: Dict[str, np.ndarray],
+        next_hop: Dict[str, np.ndarray],
+        fingerprint: str = ''
+    ):
+        self.system_ids = system_ids
+        self.dist = dist
+        self.next_hop = next_hop
+        self.fingerprint = fingerprint
+        self._index: Dict[int, int] = {int(sys_id): i for i, sys_id in enumerate(system_ids)}
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def has_system(self, system_id: int) -> bool:
+        """Whether the system is part of the stargate network"""
+        return system_id in self._index
+
+    def jumps(self, from_id: int, to_id: int, profile: str) -> Optional[int]:
+        """
+        Jump count between two systems
+
+        Returns:
+            Number of jumps, or None if unreachable under the profile
+        """
+        if from_id == to_id:
+            return 0
+        i = self._index.get(from_id)
+        j = self._index.get(to_id)
+        if i is None or j is None:
+            return None
+        d = int(self.dist[profile][i, j])
+        return None if d == UNREACHABLE else d
+
+    def path(self, from_id: int, to_id: int, profile: str) -> Optional[List[int]]:
+        """
+        Shortest path as a list of system IDs (both endpoints included)
+
+        Returns:
+            List of system IDs, or None if unreachable under the profile
+        """
+        if from_id == to_id:
+            return [from_id]
+        i = self._index.get(from_id)
+        j = self._index.get(to_id)
+        if i is None or j is None or self.dist[profile][i, j] == UNREACHABLE:
+            return None
+
+        next_hop = self.next_hop[profile]
+        path = [from_id]
+        current = i
+        while current != j:
+            current = int(next_hop[current, j])
+            path.append(int(self.system_ids[current]))
+        return path
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        systems: Dict[int, dict],
+        graph: Dict[int, List[int]],
+        profiles: Optional[Iterable[str]] = None
+    ) -> 'JumpMatrix':
+        """
+        Build tables from the in-memory jump graph
+
+        Args:
+            systems: Dict of system_id -> {'security': float, ...}
+            graph: Dict of system_id -> list of connected system_ids
+            profiles: Profile names to build (default: all)
+
+        Returns:
+            JumpMatrix with in-memory tables
+        """
+        started = time.time()
+        profiles = list(profiles or SECURITY_PROFILES)
+
+        # Only gate-connected systems are indexed (wormhole space has no jumps)
+        node_ids = set(graph)
+        for targets in graph.values():
+            node_ids.update(targets)
+        node_ids &= set(systems)
+        system_ids = np.array(sorted(node_ids), dtype=np.int64)
+        n = len(system_ids)
+        if n >= NO_HOP:
+            raise ValueError(f"Too many systems for uint16 next-hop table: {n}")
+
+        index = {int(sys_id): i for i, sys_id in enumerate(system_ids)}
+        security = np.array([float(systems[int(s)]['security']) for s in system_ids])
+
+        src = []
+        dst = []
+        for from_id, targets in graph.items():
+            if from_id not in index:
+                continue
+            for to_id in targets:
+                if to_id in index:
+                    src.append(index[from_id])
+                    dst.append(index[to_id])
+        src = np.array(src, dtype=np.int64)
+        dst = np.array(dst, dtype=np.int64)
+
+        dist = {}
+        next_hop = {}
+        for profile in profiles:
+            allowed = security >= SECURITY_PROFILES[profile]
+            # An edge can be used only if its target may be entered;
+            # the source system itself is never filtered.
+            keep = allowed[dst]
+            p_src, p_dst = src[keep], dst[keep]
+            dist[profile] = _all_pairs_bfs(n, p_src, p_dst)
+            next_hop[profile] = _next_hops(n, p_src, p_dst, dist[profile])
+
+        print(f"Jump matrix built: {n} systems, {len(src)} jumps, "
+              f"{len(profiles)} profiles in {time.time() - started:.1f}s")
+        return cls(system_ids, dist, next_hop, graph_fingerprint(systems, graph))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory: str = DEFAULT_MATRIX_DIR) -> None:
+        """Write tables as .npy files (each file replaced atomically)"""
+        os.makedirs(directory, exist_ok=True)
+        _save_array(os.path.join(directory, _SYSTEMS_FILE), self.system_ids)
+        for profile in self.dist:
+            _save_array(os.path.join(directory, f"{profile}_dist.npy"), self.dist[profile])
+            _save_array(os.path.join(directory, f"{profile}_next.npy"), self.next_hop[profile])
+
+        meta_path = os.path.join(directory, _META_FILE)
+        with open(meta_path + '.tmp', 'w') as f:
+            json.dump({
+                'fingerprint': self.fingerprint,
+                'systems': len(self.system_ids),
+                'profiles': sorted(self.dist),
+                'created_at': time.time(),
+            }, f)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    @classmethod
+    def load(
+        cls,
+        directory: str = DEFAULT_MATRIX_DIR,
+        expected_fingerprint: Optional[str] = None
+    ) -> Optional['JumpMatrix']:
+        """
+        Memory-map persisted tables
+
+        Args:
+            directory: Directory written by save()
+            expected_fingerprint: If given, reject tables built from another graph
+
+        Returns:
+            JumpMatrix backed by read-only memory maps, or None if missing/stale
+        """
+        meta_path = os.path.join(directory, _META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if expected_fingerprint and meta.get('fingerprint') != expected_fingerprint:
+                return None
+
+            system_ids = np.load(os.path.join(directory, _SYSTEMS_FILE))
+            dist = {}
+            next_hop = {}
+            for profile in meta.get('profiles', []):
+                dist[profile] = np.load(os.path.join(directory, f"{profile}_dist.npy"), mmap_mode='r')
+                next_hop[profile] = np.load(os.path.join(directory, f"{profile}_next.npy"), mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"Failed to load jump matrix from {directory}: {e}")
+            return None
+
+        return cls(system_ids, dist, next_hop, meta.get('fingerprint', ''))
+
+    @classmethod
+    def load_or_build(
+        cls,
+        systems: Dict[int, dict],
+        graph: Dict[int, List[int]],
+        directory: str = DEFAULT_MATRIX_DIR
+    ) -> 'JumpMatrix':
+        """Load persisted tables for this graph, building and saving them if needed"""
+        fingerprint = graph_fingerprint(systems, graph)
+        matrix = cls.load(directory, expected_fingerprint=fingerprint)
+        if matrix is not None and set(SECURITY_PROFILES) <= set(matrix.dist):
+            return matrix
+
+        matrix = cls.build(systems, graph)
+        try:
+            matrix.save(directory)
+        except OSError as e:
+            print(f"Could not persist jump matrix to {directory}: {e}")
+        return matrix
+
+
+def _save_array(path: str, array: np.ndarray) -> None:
+    """np.save to a temp file, then rename over the target"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, np.ascontiguousarray(array))
+    os.replace(tmp_path, path)
+
+
+def _all_pairs_bfs(n: int, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    Level-synchronous BFS from every node at once
+
+    BFS sources are bit-packed into uint64 words (one bit per source), so a
+    whole level for all sources is one gather over the edge list plus an
+    OR-reduction per target node.
+    """
+    dist = np.full((n, n), UNREACHABLE, dtype=np.uint8)
+    if n == 0:
+        return dist
+
+    # CSR over incoming edges: for each target node, the sources pointing at it
+    order = np.argsort(dst, kind='stable')
+    in_src = src[order]
+    counts = np.bincount(dst, minlength=n)
+    has_in = counts > 0
+    starts = np.concatenate(([0], np.cumsum(counts)))[:-1][has_in]
+
+    # Bit matrices indexed [node, source word]; bit s set = reached from source s
+    words = (n + 63) // 64
+    frontier = np.zeros((n, words * 8), dtype=np.uint8)
+    nodes = np.arange(n)
+    frontier[nodes, nodes // 8] = (1 << (nodes % 8)).astype(np.uint8)
+    frontier = frontier.view(np.uint64)
+    reached = frontier.copy()
+    dist[nodes, nodes] = 0
+
+    level = 0
+    while len(in_src) and frontier.any():
+        level += 1
+        if level >= UNREACHABLE:
+            raise ValueError("Jump distance exceeds uint8 range")
+        nxt = np.zeros_like(frontier)
+        nxt[has_in] = np.bitwise_or.reduceat(frontier[in_src], starts, axis=0)
+        nxt &= ~reached
+        reached |= nxt
+        frontier = nxt
+
+        # Unpack only targets that gained sources on this level
+        targets = np.flatnonzero(nxt.any(axis=1))
+        if len(targets):
+            bits = np.unpackbits(nxt[targets].view(np.uint8), axis=1, bitorder='little')[:, :n]
+            target_idx, source_idx = np.nonzero(bits)
+            dist[source_idx, targets[target_idx]] = level
+
+    return dist
+
+
+def _next_hops(n: int, src: np.ndarray, dst: np.ndarray, dist: np.ndarray) -> np.ndarray:
+    """
+    First hop on a shortest route for every (source, target) pair
+
+    The next hop from s towards t is the usable neighbour of s that is closest
+    to t; ties resolve to the lowest system index so builds are deterministic.
+    """
+    next_hop = np.full((n, n), NO_HOP, dtype=np.uint16)
+    order = np.lexsort((dst, src))
+    src, dst = src[order], dst[order]
+    bounds = np.searchsorted(src, np.arange(n + 1))
+
+    for s in range(n):
+        neighbours = dst[bounds[s]:bounds[s + 1]]
+        if len(neighbours) == 0:
+            continue
+        best = np.argmin(dist[neighbours], axis=0)
+        row = neighbours[best].astype(np.uint16)
+        unreachable = dist[s] == UNREACHABLE
+        row[unreachable] = NO_HOP
+        row[s] = NO_HOP
+        next_hop[s] = row
+
+    return next_hop
@@ -10,6 +10,7 @@ from psycopg2.extras import RealDictCursor
 from src.core.database import DatabasePool
 from src.core.exceptions import EVECopilotError
 from src.services.route.constants import SYSTEM_ID_TO_HUB
+from src.services.route.universe import get_universe_graph
 
 
 class RouteRepository:
@@ -110,6 +111,36 @@ class RouteRepository:
         except Exception as e:
             raise EVECopilotError(f"Failed to load jump graph from database: {str(e)}") from e
 
+    def get_systems(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get all solar systems from the shared process-wide universe graph
+
+        Returns:
+            Dict mapping system_id to system info dict (name, security, region_id)
+
+        Raises:
+            EVECopilotError: If the universe graph cannot be loaded
+        """
+        try:
+            return get_universe_graph().systems
+        except Exception as e:
+            raise EVECopilotError(f"Failed to load universe graph: {str(e)}") from e
+
+    def get_graph(self) -> Dict[int, List[int]]:
+        """
+        Get the jump graph from the shared process-wide universe graph
+
+        Returns:
+            Dict mapping system_id to list of connected system_ids
+
+        Raises:
+            EVECopilotError: If the universe graph cannot be loaded
+        """
+        try:
+            return get_universe_graph().graph
+        except Exception as e:
+            raise EVECopilotError(f"Failed to load universe graph: {str(e)}") from e
+
     def get_system_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Find system by name (case-insensitive)
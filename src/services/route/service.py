@@ -25,6 +25,7 @@ from src.services.route.constants import (
     SYSTEM_ID_TO_HUB,
     REGION_TO_HUB,
 )
+from src.services.sde.search import NameIndex
 from src.core.exceptions import EVECopilotError
 
 
@@ -75,6 +76,7 @@ class RouteService:
         self.repository = repository
         self._systems: Optional[Dict[int, dict]] = None
         self._graph: Optional[Dict[int, List[int]]] = None
+        self._names: Optional[NameIndex] = None
         self._loaded = False
 
     def _load_graph(self) -> None:
@@ -90,6 +92,9 @@ class RouteService:
         try:
             self._systems = self.repository.get_systems()
             self._graph = self.repository.get_graph()
+            self._names = NameIndex.build(
+                list(self._systems), [info['name'] for info in self._systems.values()]
+            )
             self._loaded = True
         except Exception as e:
             raise EVECopilotError(f"Failed to load route graph: {str(e)}") from e
@@ -274,23 +279,14 @@ class RouteService:
         """
         self._load_graph()
 
-        name_lower = name.lower()
-        for sys_id, info in self._systems.items():
-            if info['name'].lower() == name_lower:
-                is_hub = sys_id in SYSTEM_ID_TO_HUB
-                return SystemInfo(
-                    system_id=sys_id,
-                    name=info['name'],
-                    security=round(info['security'], 2),
-                    region_id=info['region_id'],
-                    is_trade_hub=is_hub,
-                    hub_name=SYSTEM_ID_TO_HUB.get(sys_id)
-                )
-        return None
+        position = self._names.find_exact(name)
+        if position < 0:
+            return None
+        return self._system_info(int(self._names.ids[position]))
 
     def search_systems(self, query: str, limit: int = 10) -> List[SystemInfo]:
         """
-        Search systems by partial name
+        Search systems by partial name, exact and prefix matches first
 
         Args:
             query: Search query (partial name match)
@@ -301,24 +297,19 @@ class RouteService:
         """
         self._load_graph()
 
-        query_lower = query.lower()
-        results = []
-
-        for sys_id, info in self._systems.items():
-            if query_lower in info['name'].lower():
-                is_hub = sys_id in SYSTEM_ID_TO_HUB
-                results.append(SystemInfo(
-                    system_id=sys_id,
-                    name=info['name'],
-                    security=round(info['security'], 2),
-                    region_id=info['region_id'],
-                    is_trade_hub=is_hub,
-                    hub_name=SYSTEM_ID_TO_HUB.get(sys_id)
-                ))
-                if len(results) >= limit:
-                    break
-
-        return results
+        positions = self._names.search(query, limit)
+        return [self._system_info(sys_id) for sys_id in self._names.ids[positions].tolist()]
+
+    def _system_info(self, sys_id: int) -> SystemInfo:
+        info = self._systems[sys_id]
+        return SystemInfo(
+            system_id=sys_id,
+            name=info['name'],
+            security=round(info['security'], 2),
+            region_id=info['region_id'],
+            is_trade_hub=sys_id in SYSTEM_ID_TO_HUB,
+            hub_name=SYSTEM_ID_TO_HUB.get(sys_id)
+        )
 
     def calculate_travel_time(
         self,
@@ -0,0 +1,245 @@
+"""
+Universe Graph
+
+Process-wide, immutable snapshot of the stargate network: systems, security,
+region, coordinates and jump adjacency as CSR arrays. Built once from the SDE
+on first use (or by warm_up_universe_graph at startup) and shared by every
+route consumer instead of each request reloading ~8k systems and ~14k jumps.
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from psycopg2.extras import RealDictCursor
+
+from src.database import get_db_connection
+from src.services.route.jump_matrix import JumpMatrix
+
+
+@dataclass(frozen=True, eq=False)
+class UniverseGraph:
+    """
+    Immutable universe snapshot
+
+    Arrays are aligned by system index (``system_ids`` is sorted ascending).
+    Neighbours of index i are ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+    system_ids: np.ndarray
+    names: Tuple[str, ...]
+    security: np.ndarray
+    region_ids: np.ndarray
+    region_names: Dict[int, str]
+    coordinates: np.ndarray  # (n, 3) float64: x, y, z in metres
+    indptr: np.ndarray
+    indices: np.ndarray
+    build_seconds: float = 0.0
+    _index: Dict[int, int] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_rows(
+        cls,
+        system_rows: List[Dict[str, Any]],
+        jump_rows: List[Tuple[int, int]],
+        build_seconds: float = 0.0
+    ) -> 'UniverseGraph':
+        """
+        Build from SDE rows
+
+        Args:
+            system_rows: Dicts with solarSystemID, solarSystemName, security,
+                regionID and optionally regionName, x, y, z
+            jump_rows: (fromSolarSystemID, toSolarSystemID) pairs
+            build_seconds: Time spent loading, recorded for metrics
+        """
+        rows = sorted(system_rows, key=lambda r: r['solarSystemID'])
+        n = len(rows)
+
+        system_ids = np.array([r['solarSystemID'] for r in rows], dtype=np.int64)
+        index = {int(sys_id): i for i, sys_id in enumerate(system_ids)}
+        security = np.array([float(r['security'] or 0.0) for r in rows], dtype=np.float64)
+        region_ids = np.array([r['regionID'] or 0 for r in rows], dtype=np.int64)
+        coordinates = np.array(
+            [[float(r.get('x') or 0.0), float(r.get('y') or 0.0), float(r.get('z') or 0.0)] for r in rows],
+            dtype=np.float64
+        ).reshape(n, 3)
+        region_names = {
+            int(r['regionID']): r['regionName']
+            for r in rows if r.get('regionName') and r['regionID'] is not None
+        }
+
+        # CSR adjacency (jump rows are already bidirectional in the SDE)
+        src = np.array([index[f] for f, t in jump_rows if f in index and t in index], dtype=np.int32)
+        dst = np.array([index[t] for f, t in jump_rows if f in index and t in index], dtype=np.int32)
+        order = np.lexsort((dst, src))
+        indices = dst[order]
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+
+        for array in (system_ids, security, region_ids, coordinates, indptr, indices):
+            array.setflags(write=False)
+
+        return cls(
+            system_ids=system_ids,
+            names=tuple(r['solarSystemName'] for r in rows),
+            security=security,
+            region_ids=region_ids,
+            region_names=region_names,
+            coordinates=coordinates,
+            indptr=indptr,
+            indices=indices,
+            build_seconds=build_seconds,
+            _index=index,
+        )
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.system_ids)
+
+    @property
+    def jump_count(self) -> int:
+        """Number of directed jump edges"""
+        return len(self.indices)
+
+    def index_of(self, system_id: int) -> Optional[int]:
+        """Array index of a system, or None if unknown"""
+        return self._index.get(system_id)
+
+    def neighbours(self, system_id: int) -> List[int]:
+        """System IDs directly connected by stargate"""
+        i = self._index.get(system_id)
+        if i is None:
+            return []
+        return self.system_ids[self.indices[self.indptr[i]:self.indptr[i + 1]]].tolist()
+
+    def get_system(self, system_id: int) -> Optional[Dict[str, Any]]:
+        """System info dict (name, security, region_id) or None"""
+        return self.systems.get(system_id)
+
+    # ------------------------------------------------------------------
+    # Shared dict views (built once, used by the dict-based route services)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def systems(self) -> Dict[int, Dict[str, Any]]:
+        """system_id -> {'name', 'security', 'region_id'} (treat as read-only)"""
+        return {
+            int(sys_id): {
+                'name': self.names[i],
+                'security': float(self.security[i]),
+                'region_id': int(self.region_ids[i]),
+            }
+            for i, sys_id in enumerate(self.system_ids)
+        }
+
+    @cached_property
+    def graph(self) -> Dict[int, List[int]]:
+        """system_id -> list of connected system_ids (treat as read-only)"""
+        graph = {}
+        ids = self.system_ids.tolist()
+        for i, sys_id in enumerate(ids):
+            start, end = self.indptr[i], self.indptr[i + 1]
+            if end > start:
+                graph[sys_id] = [ids[j] for j in self.indices[start:end]]
+        return graph
+
+    @cached_property
+    def jump_matrix(self) -> JumpMatrix:
+        """Precomputed distance/next-hop tables for this graph"""
+        return JumpMatrix.load_or_build(self.systems, self.graph)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate footprint of the arrays and system names"""
+        arrays = (self.system_ids, self.security, self.region_ids, self.coordinates,
+                  self.indptr, self.indices)
+        total = sum(a.nbytes for a in arrays)
+        total += sys.getsizeof(self.names) + sum(sys.getsizeof(n) for n in self.names)
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Build time and memory metrics"""
+        return {
+            'systems': len(self),
+            'jumps': self.jump_count,
+            'regions': len(self.region_names),
+            'build_seconds': round(self.build_seconds, 3),
+            'memory_bytes': self.memory_bytes,
+            'jump_matrix_loaded': 'jump_matrix' in self.__dict__,
+        }
+
+
+def load_universe_graph() -> UniverseGraph:
+    """Load a fresh UniverseGraph from the SDE tables"""
+    started = time.time()
+
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute('''
+                SELECT s."solarSystemID", s."solarSystemName", s."security", s."regionID",
+                       r."regionName", s.x, s.y, s.z
+                FROM "mapSolarSystems" s
+                LEFT JOIN "mapRegions" r ON r."regionID" = s."regionID"
+            ''')
+            system_rows = cur.fetchall()
+
+        with conn.cursor() as cur:
+            cur.execute('''
+                SELECT "fromSolarSystemID", "toSolarSystemID"
+                FROM "mapSolarSystemJumps"
+            ''')
+            jump_rows = cur.fetchall()
+
+    universe = UniverseGraph.from_rows(system_rows, jump_rows, time.time() - started)
+    print(f"Universe graph loaded: {len(universe)} systems, {universe.jump_count} jumps "
+          f"in {universe.build_seconds:.2f}s ({universe.memory_bytes / 1024:.0f} KiB)")
+    return universe
+
+
+# Process-wide instance
+_universe: Optional[UniverseGraph] = None
+_universe_lock = threading.Lock()
+
+
+def get_universe_graph() -> UniverseGraph:
+    """Get the shared UniverseGraph, loading it on first use"""
+    global _universe
+    if _universe is None:
+        with _universe_lock:
+            if _universe is None:
+                _universe = load_universe_graph()
+    return _universe
+
+
+def get_universe_stats() -> Dict[str, Any]:
+    """Metrics for the shared graph without triggering a load"""
+    if _universe is None:
+        return {'loaded': False}
+    return {'loaded': True, **_universe.stats()}
+
+
+def warm_up_universe_graph(with_jump_matrix: bool = True) -> None:
+    """
+    Load the shared graph (and jump matrix) ahead of the first request
+
+    The jump matrix is rebuilt and saved when the persisted tables don't
+    match the graph, which can take a while. On failure nothing is cached:
+    the first route request loads the graph or builds the matrix itself.
+    """
+    try:
+        universe = get_universe_graph()
+        if with_jump_matrix:
+            universe.jump_matrix
+    except Exception as e:
+        print(f"Universe graph warm-up failed: {e}")
@@ -0,0 +1,26 @@
+"""
+SDE Service
+
+In-memory lookups and name search of static EVE data (types, groups, systems) for hot paths.
+"""
+
+from src.services.sde.ship_classes import (
+    SHIP_GROUP_CLASSES,
+    CAPITAL_GROUP_IDS,
+    ship_class_for_group,
+)
+from src.services.sde.lookup import SDELookup, get_sde_lookup
+from src.services.sde.search import SearchIndex, get_search_index
+
+__all__ = [
+    # Ship classes
+    'SHIP_GROUP_CLASSES',
+    'CAPITAL_GROUP_IDS',
+    'ship_class_for_group',
+    # Shared lookup
+    'SDELookup',
+    'get_sde_lookup',
+    # Name search
+    'SearchIndex',
+    'get_search_index',
+]
@@ -0,0 +1,355 @@
+"""
+SDE Lookup
+
+Process-wide, immutable dictionary of the SDE data the combat pipeline needs
+on every kill: type -> group/category/name/volume, group -> name/category and
+ship class, system -> name/region/security. Integer keys are stored as sorted
+numpy arrays (binary search), so a full load of ~50k types and ~8k systems
+stays in a few MiB and every lookup is a memory read instead of a query.
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.database import get_db_connection
+from src.services.sde.ship_classes import CAPITAL_GROUP_IDS, ship_class_for_group
+
+
+def _sorted_index(ids: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted key array and the permutation that sorts the input"""
+    keys = np.asarray(ids, dtype=np.int64)
+    order = np.argsort(keys, kind='stable')
+    return keys[order], order
+
+
+def _find(keys: np.ndarray, key: int) -> int:
+    """Position of key in a sorted array, -1 if absent"""
+    i = int(np.searchsorted(keys, key))
+    if i < len(keys) and keys[i] == key:
+        return i
+    return -1
+
+
+@dataclass(frozen=True, eq=False)
+class SDELookup:
+    """
+    Immutable SDE snapshot
+
+    Per-kind arrays are aligned with their sorted key array (``type_ids``,
+    ``group_ids``, ``system_ids``).
+    """
+    type_ids: np.ndarray
+    type_groups: np.ndarray
+    type_categories: np.ndarray
+    type_volumes: np.ndarray
+    type_names: Tuple[str, ...]
+    group_ids: np.ndarray
+    group_categories: np.ndarray
+    group_names: Tuple[str, ...]
+    system_ids: np.ndarray
+    system_regions: np.ndarray
+    system_securities: np.ndarray
+    system_names: Tuple[str, ...]
+    region_names: Dict[int, str]
+    category_names: Dict[int, str]
+    build_seconds: float = 0.0
+    _capital: np.ndarray = field(default=None, repr=False)
+
+    @classmethod
+    def from_rows(
+        cls,
+        type_rows: Iterable[Tuple[int, str, int, Optional[float]]],
+        group_rows: Iterable[Tuple[int, str, int]],
+        system_rows: Iterable[Tuple[int, str, int, Optional[float]]],
+        region_rows: Iterable[Tuple[int, str]] = (),
+        category_rows: Iterable[Tuple[int, str]] = (),
+        build_seconds: float = 0.0
+    ) -> 'SDELookup':
+        """
+        Build from SDE rows
+
+        Args:
+            type_rows: (typeID, typeName, groupID, volume)
+            group_rows: (groupID, groupName, categoryID)
+            system_rows: (solarSystemID, solarSystemName, regionID, security)
+            region_rows: (regionID, regionName)
+            category_rows: (categoryID, categoryName)
+            build_seconds: Time spent loading, recorded for metrics
+        """
+        group_rows = list(group_rows)
+        group_ids, order = _sorted_index([r[0] for r in group_rows])
+        group_rows = [group_rows[i] for i in order]
+        group_names = tuple(r[1] or '' for r in group_rows)
+        group_categories = np.array([r[2] or 0 for r in group_rows], dtype=np.int32)
+
+        type_rows = list(type_rows)
+        type_ids, order = _sorted_index([r[0] for r in type_rows])
+        type_rows = [type_rows[i] for i in order]
+        type_names = tuple(r[1] or '' for r in type_rows)
+        type_groups = np.array([r[2] or 0 for r in type_rows], dtype=np.int32)
+        type_volumes = np.array([float(r[3] or 0.0) for r in type_rows], dtype=np.float64)
+
+        # Category via group (0 when the group is unknown)
+        positions = np.searchsorted(group_ids, type_groups)
+        positions = np.minimum(positions, max(len(group_ids) - 1, 0))
+        known = (group_ids[positions] == type_groups) if len(group_ids) else np.zeros(len(type_ids), dtype=bool)
+        type_categories = np.where(known, group_categories[positions] if len(group_ids) else 0, 0).astype(np.int32)
+
+        system_rows = list(system_rows)
+        system_ids, order = _sorted_index([r[0] for r in system_rows])
+        system_rows = [system_rows[i] for i in order]
+        system_names = tuple(r[1] or '' for r in system_rows)
+        system_regions = np.array([r[2] or 0 for r in system_rows], dtype=np.int64)
+        system_securities = np.array([float(r[3] or 0.0) for r in system_rows], dtype=np.float64)
+
+        arrays = (type_ids, type_groups, type_categories, type_volumes,
+                  group_ids, group_categories, system_ids, system_regions, system_securities)
+        for a in arrays:
+            a.setflags(write=False)
+
+        return cls(
+            type_ids=type_ids,
+            type_groups=type_groups,
+            type_categories=type_categories,
+            type_volumes=type_volumes,
+            type_names=type_names,
+            group_ids=group_ids,
+            group_categories=group_categories,
+            group_names=group_names,
+            system_ids=system_ids,
+            system_regions=system_regions,
+            system_securities=system_securities,
+            system_names=system_names,
+            region_names={int(r[0]): r[1] for r in region_rows},
+            category_names={int(r[0]): r[1] for r in category_rows},
+            build_seconds=build_seconds,
+            _capital=np.isin(type_groups, list(CAPITAL_GROUP_IDS)),
+        )
+
+    # ------------------------------------------------------------------
+    # Types
+    # ------------------------------------------------------------------
+
+    def has_type(self, type_id: int) -> bool:
+        return _find(self.type_ids, type_id) >= 0
+
+    def type_name(self, type_id: int, default: Optional[str] = None) -> Optional[str]:
+        """typeName, or default if unknown"""
+        i = _find(self.type_ids, type_id)
+        return self.type_names[i] if i >= 0 else default
+
+    def type_group(self, type_id: int) -> Optional[int]:
+        """groupID of a type"""
+        i = _find(self.type_ids, type_id)
+        return int(self.type_groups[i]) if i >= 0 else None
+
+    def type_category(self, type_id: int) -> Optional[int]:
+        """categoryID of a type (via its group)"""
+        i = _find(self.type_ids, type_id)
+        return int(self.type_categories[i]) if i >= 0 else None
+
+    def type_volume(self, type_id: int) -> Optional[float]:
+        """Packaged volume (m3) of a type"""
+        i = _find(self.type_ids, type_id)
+        return float(self.type_volumes[i]) if i >= 0 else None
+
+    def type_info(self, type_id: int) -> Optional[Dict[str, Any]]:
+        """{'type_id', 'name', 'group_id', 'group_name', 'category_id', 'volume'} or None"""
+        i = _find(self.type_ids, type_id)
+        if i < 0:
+            return None
+        group_id = int(self.type_groups[i])
+        return {
+            'type_id': type_id,
+            'name': self.type_names[i],
+            'group_id': group_id,
+            'group_name': self.group_name(group_id),
+            'category_id': int(self.type_categories[i]),
+            'volume': float(self.type_volumes[i]),
+        }
+
+    def groups_of(self, type_ids: Sequence[int]) -> np.ndarray:
+        """groupIDs for many types at once (0 for unknown types)"""
+        ids = np.asarray(type_ids, dtype=np.int64)
+        if not len(self.type_ids):
+            return np.zeros(len(ids), dtype=np.int32)
+        positions = np.minimum(np.searchsorted(self.type_ids, ids), len(self.type_ids) - 1)
+        return np.where(self.type_ids[positions] == ids, self.type_groups[positions], 0)
+
+    def names_of(self, type_ids: Iterable[int]) -> Dict[int, str]:
+        """type_id -> typeName for the known types among type_ids"""
+        names = {}
+        for type_id in type_ids:
+            name = self.type_name(type_id)
+            if name is not None:
+                names[type_id] = name
+        return names
+
+    # ------------------------------------------------------------------
+    # Groups and ship classes
+    # ------------------------------------------------------------------
+
+    def group_name(self, group_id: int, default: Optional[str] = None) -> Optional[str]:
+        """groupName, or default if unknown"""
+        i = _find(self.group_ids, group_id)
+        return self.group_names[i] if i >= 0 else default
+
+    def group_category(self, group_id: int) -> Optional[int]:
+        """categoryID of a group"""
+        i = _find(self.group_ids, group_id)
+        return int(self.group_categories[i]) if i >= 0 else None
+
+    def type_group_name(self, type_id: int) -> Optional[str]:
+        """groupName of a type's group"""
+        group_id = self.type_group(type_id)
+        return self.group_name(group_id) if group_id is not None else None
+
+    def ship_class(self, type_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """
+        (ship_category, ship_role) of a type
+
+        ('other', 'other') for known types outside the ship classes,
+        (None, None) for unknown types.
+        """
+        group_id = self.type_group(type_id)
+        if group_id is None:
+            return (None, None)
+        return ship_class_for_group(group_id)
+
+    def is_capital(self, type_id: int) -> bool:
+        """True for titans, supercarriers, carriers, dreads, FAX and industrial command ships"""
+        i = _find(self.type_ids, type_id)
+        return bool(self._capital[i]) if i >= 0 else False
+
+    # ------------------------------------------------------------------
+    # Systems
+    # ------------------------------------------------------------------
+
+    def system_name(self, system_id: int, default: Optional[str] = None) -> Optional[str]:
+        """solarSystemName, or default if unknown"""
+        i = _find(self.system_ids, system_id)
+        return self.system_names[i] if i >= 0 else default
+
+    def system_region(self, system_id: int) -> Optional[int]:
+        """regionID of a system"""
+        i = _find(self.system_ids, system_id)
+        return int(self.system_regions[i]) if i >= 0 else None
+
+    def system_security(self, system_id: int) -> Optional[float]:
+        """Security status of a system"""
+        i = _find(self.system_ids, system_id)
+        return float(self.system_securities[i]) if i >= 0 else None
+
+    def region_name(self, region_id: int, default: Optional[str] = None) -> Optional[str]:
+        """regionName, or default if unknown"""
+        return self.region_names.get(region_id, default)
+
+    def system_info(self, system_id: int) -> Optional[Dict[str, Any]]:
+        """{'system_id', 'name', 'region_id', 'region_name', 'security'} or None"""
+        i = _find(self.system_ids, system_id)
+        if i < 0:
+            return None
+        region_id = int(self.system_regions[i])
+        return {
+            'system_id': system_id,
+            'name': self.system_names[i],
+            'region_id': region_id,
+            'region_name': self.region_names.get(region_id),
+            'security': float(self.system_securities[i]),
+        }
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate footprint of the arrays and names"""
+        arrays = (self.type_ids, self.type_groups, self.type_categories, self.type_volumes,
+                  self.group_ids, self.group_categories, self.system_ids, self.system_regions,
+                  self.system_securities, self._capital)
+        total = sum(a.nbytes for a in arrays)
+        for names in (self.type_names, self.group_names, self.system_names):
+            total += sys.getsizeof(names) + sum(sys.getsizeof(n) for n in names)
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Sizes, build time and memory metrics"""
+        return {
+            'types': len(self.type_ids),
+            'groups': len(self.group_ids),
+            'systems': len(self.system_ids),
+            'regions': len(self.region_names),
+            'build_seconds': round(self.build_seconds, 3),
+            'memory_bytes': self.memory_bytes,
+        }
+
+
+def load_sde_lookup() -> SDELookup:
+    """Load a fresh SDELookup from the SDE tables"""
+    started = time.time()
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute('SELECT "typeID", "typeName", "groupID", "volume" FROM "invTypes"')
+            type_rows = cur.fetchall()
+            cur.execute('SELECT "groupID", "groupName", "categoryID" FROM "invGroups"')
+            group_rows = cur.fetchall()
+            cur.execute('SELECT "categoryID", "categoryName" FROM "invCategories"')
+            category_rows = cur.fetchall()
+            cur.execute('''
+                SELECT "solarSystemID", "solarSystemName", "regionID", "security"
+                FROM "mapSolarSystems"
+            ''')
+            system_rows = cur.fetchall()
+            cur.execute('SELECT "regionID", "regionName" FROM "mapRegions"')
+            region_rows = cur.fetchall()
+
+    lookup = SDELookup.from_rows(
+        type_rows, group_rows, system_rows, region_rows, category_rows,
+        build_seconds=time.time() - started
+    )
+    print(f"SDE lookup loaded: {len(lookup.type_ids)} types, {len(lookup.group_ids)} groups, "
+          f"{len(lookup.system_ids)} systems in {lookup.build_seconds:.2f}s "
+          f"({lookup.memory_bytes / 1024:.0f} KiB)")
+    return lookup
+
+
+# Process-wide instance
+_lookup: Optional[SDELookup] = None
+_lookup_lock = threading.Lock()
+
+
+def get_sde_lookup() -> SDELookup:
+    """Get the shared SDELookup, loading it on first use"""
+    global _lookup
+    if _lookup is None:
+        with _lookup_lock:
+            if _lookup is None:
+                _lookup = load_sde_lookup()
+    return _lookup
+
+
+def get_sde_lookup_stats() -> Dict[str, Any]:
+    """Metrics for the shared lookup without triggering a load"""
+    if _lookup is None:
+        return {'loaded': False}
+    return {'loaded': True, **_lookup.stats()}
+
+
+def warm_up_sde_lookup() -> None:
+    """
+    Load the shared lookup ahead of the first kill or request
+
+    Runs in a startup thread, so a failure is only logged; _lookup stays
+    unset and the first get_sde_lookup() call retries the load.
+    """
+    try:
+        get_sde_lookup()
+    except Exception as e:
+        print(f"SDE lookup warm-up failed: {e}")
@@ -0,0 +1,577 @@
+"""
+SDE Search Index
+
+Process-wide, immutable name index over types, groups, market groups and
+solar systems. Names are case-folded; sorted name and word keys answer
+exact/prefix/word-prefix matches by bisection, and 1-, 2- and 3-gram postings
+(sorted numpy arrays of entry positions) answer the remaining substring
+matches by intersection, instead of a LIKE '%q%' scan per request.
+
+Ranking (best first): exact name, name prefix, word prefix, substring; ties
+prefer published types that are on the market, then shorter names.
+"""
+
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.database import get_db_connection
+
+MATCH_EXACT, MATCH_PREFIX, MATCH_WORD_PREFIX, MATCH_SUBSTRING = range(4)
+
+# Restricted searches up to this size check names directly instead of using the indexes
+_SCAN_LIMIT = 2048
+
+
+def fold(text: str) -> str:
+    """Case-folded, whitespace-normalized form used for indexing and queries"""
+    return ' '.join((text or '').casefold().split())
+
+
+def _ngrams(text: str, n: int) -> set:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _key_range(keys: Sequence[str], positions: np.ndarray, prefix: str) -> Tuple[np.ndarray, int]:
+    """
+    Positions whose sorted key starts with prefix, and how many of them
+    (at the front) are equal to it
+    """
+    lo = bisect_left(keys, prefix)
+    hi = bisect_left(keys, prefix + '\U0010ffff', lo)
+    return positions[lo:hi], bisect_right(keys, prefix, lo, hi) - lo
+
+
+@dataclass(frozen=True, eq=False)
+class NameIndex:
+    """
+    Prefix + n-gram index over one kind of named entry
+
+    Positions refer to the order of ``ids``/``names``. ``static_rank`` orders
+    entries of the same match class (lower is better). ``prefix_keys`` are
+    the sorted folded names, ``word_keys`` the sorted name suffixes starting
+    at each later word, so exact, prefix and word-prefix matches are bisect
+    ranges; n-gram postings only serve the remaining substring matches.
+    """
+    ids: np.ndarray
+    names: Tuple[str, ...]
+    folded: Tuple[str, ...]
+    static_rank: np.ndarray
+    prefix_keys: Tuple[str, ...] = field(repr=False)
+    prefix_positions: np.ndarray = field(repr=False)
+    word_keys: Tuple[str, ...] = field(repr=False)
+    word_positions: np.ndarray = field(repr=False)
+    postings: Dict[str, np.ndarray] = field(repr=False)
+
+    @classmethod
+    def build(cls, ids: Sequence[int], names: Sequence[str],
+              quality: Optional[Sequence[int]] = None) -> 'NameIndex':
+        """
+        Args:
+            ids: Entry IDs
+            names: Display names, aligned with ids
+            quality: Optional per-entry tiebreak (lower is better), applied
+                before name length and alphabetical order
+        """
+        names = tuple(n or '' for n in names)
+        folded = tuple(fold(n) for n in names)
+        quality = list(quality) if quality is not None else [0] * len(names)
+
+        order = sorted(range(len(names)), key=lambda i: (quality[i], len(folded[i]), folded[i]))
+        static_rank = np.empty(len(names), dtype=np.int64)
+        static_rank[order] = np.arange(len(names), dtype=np.int64)
+
+        # Ties on the key keep static rank order, so find_exact picks the best entry
+        prefix = sorted((folded[i], static_rank[i], i) for i in range(len(names)))
+        words = sorted(
+            (name[k + 1:], static_rank[i], i)
+            for i, name in enumerate(folded)
+            for k, char in enumerate(name) if char == ' '
+        )
+
+        lists = defaultdict(list)
+        for position, name in enumerate(folded):
+            for gram in _ngrams(name, 1) | _ngrams(name, 2) | _ngrams(name, 3):
+                lists[gram].append(position)
+        postings = {gram: np.array(positions, dtype=np.int32) for gram, positions in lists.items()}
+
+        arrays = dict(
+            ids=np.asarray(ids, dtype=np.int64),
+            static_rank=static_rank,
+            prefix_positions=np.array([p[2] for p in prefix], dtype=np.int32),
+            word_positions=np.array([w[2] for w in words], dtype=np.int32),
+        )
+        for a in (*arrays.values(), *postings.values()):
+            a.setflags(write=False)
+
+        return cls(
+            names=names,
+            folded=folded,
+            prefix_keys=tuple(p[0] for p in prefix),
+            word_keys=tuple(w[0] for w in words),
+            postings=postings,
+            **arrays,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def candidates(self, query: str) -> np.ndarray:
+        """Positions whose folded name contains the folded query (sorted)"""
+        if not query:
+            return np.arange(len(self.names), dtype=np.int32)
+
+        n = min(len(query), 3)
+        lists = []
+        for gram in _ngrams(query, n):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return np.empty(0, dtype=np.int32)
+            lists.append(posting)
+        lists.sort(key=len)
+        result = lists[0]
+        for posting in lists[1:]:
+            result = np.intersect1d(result, posting, assume_unique=True)
+            if not len(result):
+                return result
+        if len(query) > 3:
+            # Every trigram matching does not guarantee the whole substring
+            folded = self.folded
+            result = result[np.fromiter((query in folded[i] for i in result.tolist()), dtype=bool, count=len(result))]
+        return result
+
+    def classify(self, positions: np.ndarray, query: str) -> np.ndarray:
+        """MATCH_* class of each position (all must contain the query)"""
+        if not query:
+            return np.zeros(len(positions), dtype=np.int64)
+        folded = self.folded
+        word = ' ' + query
+
+        def match(name: str) -> int:
+            if name == query:
+                return MATCH_EXACT
+            if name.startswith(query):
+                return MATCH_PREFIX
+            if word in name:
+                return MATCH_WORD_PREFIX
+            return MATCH_SUBSTRING
+
+        return np.fromiter((match(folded[i]) for i in positions.tolist()), dtype=np.int64, count=len(positions))
+
+    def rank(self, positions: np.ndarray, match: np.ndarray, limit: Optional[int]) -> np.ndarray:
+        """Best `limit` positions ordered by match class, then static rank"""
+        if not len(positions):
+            return positions
+        keys = match * len(self.names) + self.static_rank[positions]
+        if limit is not None and limit < len(keys):
+            top = np.argpartition(keys, limit)[:limit]
+            return positions[top[np.argsort(keys[top], kind='stable')]]
+        return positions[np.argsort(keys, kind='stable')]
+
+    def search(self, query: str, limit: Optional[int] = None,
+               within: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Ranked positions matching the query
+
+        Args:
+            query: Raw query text (folded here)
+            limit: Maximum results (None = all)
+            within: Optional sorted positions to restrict the search to
+                (e.g. one group's members)
+        """
+        query = fold(query)
+        member = None
+        if within is not None:
+            if len(within) <= _SCAN_LIMIT:
+                return self._scan(within, query, limit)
+            member = np.zeros(len(self.names), dtype=bool)
+            member[within] = True
+
+        if not query:
+            positions = within if within is not None else np.arange(len(self.names), dtype=np.int32)
+            return self.rank(positions, np.zeros(len(positions), dtype=np.int64), limit)
+
+        # Exact and prefix hits outrank everything else
+        heads, exact = _key_range(self.prefix_keys, self.prefix_positions, query)
+        head_match = np.full(len(heads), MATCH_PREFIX, dtype=np.int64)
+        head_match[:exact] = MATCH_EXACT
+        if member is not None:
+            kept = member[heads]
+            heads, head_match = heads[kept], head_match[kept]
+        if limit is not None and len(heads) >= limit:
+            return self.rank(heads, head_match, limit)
+
+        words, _ = _key_range(self.word_keys, self.word_positions, query)
+        words = np.unique(words)
+        if member is not None:
+            words = words[member[words]]
+        if len(heads):
+            words = words[~np.isin(words, heads)]
+        found = np.concatenate([heads, words])
+        match = np.concatenate([head_match, np.full(len(words), MATCH_WORD_PREFIX, dtype=np.int64)])
+        if limit is not None and len(found) >= limit:
+            return self.rank(found, match, limit)
+
+        rest = self.candidates(query)
+        if member is not None:
+            rest = rest[member[rest]]
+        if len(found):
+            rest = rest[~np.isin(rest, found)]
+        return self.rank(
+            np.concatenate([found, rest]),
+            np.concatenate([match, np.full(len(rest), MATCH_SUBSTRING, dtype=np.int64)]),
+            limit
+        )
+
+    def _scan(self, positions: np.ndarray, query: str, limit: Optional[int]) -> np.ndarray:
+        """Search a small set of positions by checking their names directly"""
+        if query and len(positions):
+            folded = self.folded
+            positions = positions[np.fromiter(
+                (query in folded[i] for i in positions.tolist()), dtype=bool, count=len(positions)
+            )]
+        return self.rank(positions, self.classify(positions, query), limit)
+
+    def find_exact(self, name: str) -> int:
+        """Position of the best entry named exactly `name` (case-insensitive), -1 if none"""
+        positions, exact = _key_range(self.prefix_keys, self.prefix_positions, fold(name))
+        return int(positions[0]) if exact else -1
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate footprint of the arrays and key strings"""
+        total = self.ids.nbytes + self.static_rank.nbytes
+        total += self.prefix_positions.nbytes + self.word_positions.nbytes
+        total += sum(p.nbytes for p in self.postings.values())
+        # prefix_keys reuses the folded strings
+        total += sum(sys.getsizeof(k) for k in self.folded)
+        total += sum(sys.getsizeof(k) for k in self.word_keys)
+        return total
+
+
+_EMPTY = np.empty(0, dtype=np.int32)
+_EMPTY.setflags(write=False)
+
+
+def _members(keys: np.ndarray) -> Dict[int, np.ndarray]:
+    """Sorted positions per distinct key"""
+    order = np.argsort(keys, kind='stable').astype(np.int32)
+    values, starts = np.unique(keys[order], return_index=True)
+    members = {}
+    for value, chunk in zip(values.tolist(), np.split(order, starts[1:])):
+        chunk.setflags(write=False)
+        members[value] = chunk
+    return members
+
+
+@dataclass(frozen=True, eq=False)
+class SearchIndex:
+    """Immutable search snapshot of SDE names"""
+    types: NameIndex
+    type_groups: np.ndarray
+    type_market_groups: np.ndarray
+    type_published: np.ndarray
+    type_volumes: np.ndarray
+    type_base_prices: np.ndarray
+    groups: NameIndex
+    group_categories: Tuple[str, ...]
+    market_groups: NameIndex
+    market_group_parents: np.ndarray
+    systems: NameIndex
+    system_regions: np.ndarray
+    system_securities: np.ndarray
+    build_seconds: float = 0.0
+    _children: Dict[int, List[int]] = field(default_factory=dict, repr=False)
+    _group_members: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _market_members: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _subtrees: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _subtree_members: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_rows(
+        cls,
+        type_rows: Iterable[Tuple[int, str, int, Optional[int], Any, Optional[float], Optional[float]]],
+        group_rows: Iterable[Tuple[int, str, Optional[str]]],
+        market_group_rows: Iterable[Tuple[int, str, Optional[int]]],
+        system_rows: Iterable[Tuple[int, str, int, Optional[float]]],
+        build_seconds: float = 0.0
+    ) -> 'SearchIndex':
+        """
+        Build from SDE rows
+
+        Args:
+            type_rows: (typeID, typeName, groupID, marketGroupID, published, volume, basePrice)
+            group_rows: (groupID, groupName, categoryName)
+            market_group_rows: (marketGroupID, marketGroupName, parentGroupID)
+            system_rows: (solarSystemID, solarSystemName, regionID, security)
+            build_seconds: Time spent loading, recorded for metrics
+        """
+        type_rows = list(type_rows)
+        published = np.array([bool(r[4]) for r in type_rows], dtype=bool)
+        market_groups = np.array([r[3] or 0 for r in type_rows], dtype=np.int64)
+        # Published market items first, unpublished non-market types last
+        quality = (~published).astype(int) * 2 + (market_groups == 0).astype(int)
+        types = NameIndex.build([r[0] for r in type_rows], [r[1] for r in type_rows], quality.tolist())
+
+        group_rows = list(group_rows)
+        groups = NameIndex.build([r[0] for r in group_rows], [r[1] for r in group_rows])
+
+        market_group_rows = list(market_group_rows)
+        market_index = NameIndex.build([r[0] for r in market_group_rows], [r[1] for r in market_group_rows])
+        parents = np.array([r[2] or 0 for r in market_group_rows], dtype=np.int64)
+        children: Dict[int, List[int]] = defaultdict(list)
+        for r in market_group_rows:
+            if r[2]:
+                children[int(r[2])].append(int(r[0]))
+
+        system_rows = list(system_rows)
+        systems = NameIndex.build([r[0] for r in system_rows], [r[1] for r in system_rows])
+
+        arrays = dict(
+            type_groups=np.array([r[2] or 0 for r in type_rows], dtype=np.int64),
+            type_market_groups=market_groups,
+            type_published=published,
+            type_volumes=np.array([float(r[5] or 0.0) for r in type_rows], dtype=np.float64),
+            type_base_prices=np.array([float(r[6] or 0.0) for r in type_rows], dtype=np.float64),
+            market_group_parents=parents,
+            system_regions=np.array([r[2] or 0 for r in system_rows], dtype=np.int64),
+            system_securities=np.array([float(r[3] or 0.0) for r in system_rows], dtype=np.float64),
+        )
+        for a in arrays.values():
+            a.setflags(write=False)
+
+        return cls(
+            types=types,
+            groups=groups,
+            group_categories=tuple(r[2] for r in group_rows),
+            market_groups=market_index,
+            systems=systems,
+            build_seconds=build_seconds,
+            _children=dict(children),
+            _group_members=_members(arrays['type_groups']),
+            _market_members=_members(market_groups),
+            **arrays,
+        )
+
+    # ------------------------------------------------------------------
+    # Types
+    # ------------------------------------------------------------------
+
+    def market_group_subtree(self, market_group_id: int) -> np.ndarray:
+        """Sorted IDs of a market group and all its descendants"""
+        subtree = self._subtrees.get(market_group_id)
+        if subtree is None:
+            found, stack = [], [market_group_id]
+            while stack:
+                group_id = stack.pop()
+                found.append(group_id)
+                stack.extend(self._children.get(group_id, ()))
+            subtree = np.unique(np.array(found, dtype=np.int64))
+            subtree.setflags(write=False)
+            self._subtrees[market_group_id] = subtree
+        return subtree
+
+    def search_types(
+        self,
+        query: str,
+        limit: Optional[int] = 10,
+        group_id: Optional[int] = None,
+        market_group_id: Optional[int] = None,
+        published_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked types whose name contains the query
+
+        Args:
+            query: Name fragment (empty matches everything in the filters)
+            limit: Maximum results (None = all)
+            group_id: Only types of this inventory group
+            market_group_id: Only types in this market group or its subgroups
+            published_only: Skip unpublished types
+
+        Returns:
+            Rows shaped like src.database.get_item_by_name:
+            {'typeID', 'typeName', 'groupID', 'volume', 'basePrice'}
+        """
+        within = None
+        if group_id is not None:
+            within = self._group_members.get(group_id, _EMPTY)
+        if market_group_id is not None:
+            members = self._market_group_members(market_group_id)
+            within = members if within is None else np.intersect1d(within, members, assume_unique=True)
+        if published_only:
+            if within is None:
+                within = np.flatnonzero(self.type_published).astype(np.int32)
+            within = within[self.type_published[within]]
+
+        positions = self.types.search(query, limit, within)
+        return [self._type_row(i) for i in positions.tolist()]
+
+    def _market_group_members(self, market_group_id: int) -> np.ndarray:
+        """Sorted type positions in a market group subtree"""
+        members = self._subtree_members.get(market_group_id)
+        if members is None:
+            parts = [self._market_members.get(g, _EMPTY) for g in self.market_group_subtree(market_group_id).tolist()]
+            members = np.sort(np.concatenate(parts)) if parts else _EMPTY
+            members.setflags(write=False)
+            self._subtree_members[market_group_id] = members
+        return members
+
+    def _type_row(self, i: int) -> Dict[str, Any]:
+        return {
+            'typeID': int(self.types.ids[i]),
+            'typeName': self.types.names[i],
+            'groupID': int(self.type_groups[i]),
+            'volume': float(self.type_volumes[i]),
+            'basePrice': float(self.type_base_prices[i]),
+        }
+
+    # ------------------------------------------------------------------
+    # Groups and market groups
+    # ------------------------------------------------------------------
+
+    def search_groups(self, query: str, limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Groups by name: {'groupID', 'groupName', 'categoryName'} (like get_group_by_name)"""
+        return [
+            {
+                'groupID': int(self.groups.ids[i]),
+                'groupName': self.groups.names[i],
+                'categoryName': self.group_categories[i],
+            }
+            for i in self.groups.search(query, limit).tolist()
+        ]
+
+    def search_market_groups(self, query: str, limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Market groups by name: {'marketGroupID', 'marketGroupName', 'parentGroupID'}"""
+        return [
+            {
+                'marketGroupID': int(self.market_groups.ids[i]),
+                'marketGroupName': self.market_groups.names[i],
+                'parentGroupID': int(self.market_group_parents[i]) or None,
+            }
+            for i in self.market_groups.search(query, limit).tolist()
+        ]
+
+    # ------------------------------------------------------------------
+    # Systems
+    # ------------------------------------------------------------------
+
+    def search_system_ids(self, query: str, limit: Optional[int] = 10) -> List[int]:
+        """Ranked solarSystemIDs whose name contains the query"""
+        return self.systems.ids[self.systems.search(query, limit)].tolist()
+
+    def system_id_by_name(self, name: str) -> Optional[int]:
+        """solarSystemID for an exact (case-insensitive) name"""
+        i = self.systems.find_exact(name)
+        return int(self.systems.ids[i]) if i >= 0 else None
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate footprint of the n-gram indexes and side arrays"""
+        total = sum(index.memory_bytes for index in (self.types, self.groups, self.market_groups, self.systems))
+        total += sum(a.nbytes for a in (
+            self.type_groups, self.type_market_groups, self.type_published, self.type_volumes,
+            self.type_base_prices, self.market_group_parents, self.system_regions, self.system_securities
+        ))
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Sizes, build time and memory metrics"""
+        return {
+            'types': len(self.types),
+            'groups': len(self.groups),
+            'market_groups': len(self.market_groups),
+            'systems': len(self.systems),
+            'ngrams': sum(len(index.postings) for index in (self.types, self.groups, self.market_groups, self.systems)),
+            'build_seconds': round(self.build_seconds, 3),
+            'memory_bytes': self.memory_bytes,
+        }
+
+
+def load_search_index() -> SearchIndex:
+    """Load a fresh SearchIndex from the SDE tables"""
+    started = time.time()
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute('''
+                SELECT "typeID", "typeName", "groupID", "marketGroupID", "published", "volume", "basePrice"
+                FROM "invTypes"
+            ''')
+            type_rows = cur.fetchall()
+            cur.execute('''
+                SELECT g."groupID", g."groupName", c."categoryName"
+                FROM "invGroups" g
+                LEFT JOIN "invCategories" c ON g."categoryID" = c."categoryID"
+            ''')
+            group_rows = cur.fetchall()
+            cur.execute('SELECT "marketGroupID", "marketGroupName", "parentGroupID" FROM "invMarketGroups"')
+            market_group_rows = cur.fetchall()
+            cur.execute('''
+                SELECT "solarSystemID", "solarSystemName", "regionID", "security"
+                FROM "mapSolarSystems"
+            ''')
+            system_rows = cur.fetchall()
+
+    index = SearchIndex.from_rows(
+        type_rows, group_rows, market_group_rows, system_rows,
+        build_seconds=time.time() - started
+    )
+    print(f"SDE search index built: {len(index.types)} types, {len(index.groups)} groups, "
+          f"{len(index.market_groups)} market groups, {len(index.systems)} systems "
+          f"in {index.build_seconds:.2f}s ({index.memory_bytes / 1024 / 1024:.1f} MiB)")
+    return index
+
+
+# Process-wide instance
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """Get the shared SearchIndex, building it on first use"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = load_search_index()
+    return _index
+
+
+def reload_search_index() -> SearchIndex:
+    """Rebuild the shared index (e.g. after an SDE import); readers keep the old one until swapped"""
+    global _index
+    index = load_search_index()
+    with _index_lock:
+        _index = index
+    return index
+
+
+def get_search_index_stats() -> Dict[str, Any]:
+    """Metrics for the shared index without triggering a build"""
+    if _index is None:
+        return {'loaded': False}
+    return {'loaded': True, **_index.stats()}
+
+
+def warm_up_search_index() -> None:
+    """
+    Build the shared index ahead of the first search
+
+    Building the n-gram postings for every type and system is the expensive
+    part; if it fails here, the first search pays for the build instead.
+    """
+    try:
+        get_search_index()
+    except Exception as e:
+        print(f"SDE search index warm-up failed: {e}")
@@ -0,0 +1,141 @@
+"""
+Ship Classes
+
+Official EVE ship classification by invGroups groupID: (ship_category, ship_role).
+
+Categories:
+    frigate, destroyer, cruiser, battlecruiser, battleship,
+    dreadnought, carrier, force_auxiliary, supercarrier, titan,
+    industrial, freighter, mining_barge, exhumer,
+    industrial_command, capital_industrial, corvette, shuttle, capsule, fighter,
+    deployable, starbase, orbital, citadel, refinery, structure
+
+Roles:
+    standard, assault, interceptor, covert_ops, stealth_bomber, electronic_attack,
+    logistics, expedition, interdictor, command, tactical, heavy_assault, recon,
+    heavy_interdictor, strategic, attack, marauder, black_ops, elite,
+    blockade_runner, deep_space_transport, jump, lancer, prototype, citizen, flag,
+    light, heavy, support, structure_light, structure_support, structure_heavy
+"""
+
+from typing import Dict, FrozenSet, Tuple
+
+
+SHIP_GROUP_CLASSES: Dict[int, Tuple[str, str]] = {
+    # Corvettes & Shuttles
+    237: ('corvette', 'standard'),
+    2001: ('corvette', 'citizen'),
+    31: ('shuttle', 'standard'),
+    29: ('capsule', 'standard'),
+
+    # Frigates
+    25: ('frigate', 'standard'),
+    324: ('frigate', 'assault'),
+    831: ('frigate', 'interceptor'),
+    830: ('frigate', 'covert_ops'),
+    834: ('frigate', 'stealth_bomber'),
+    893: ('frigate', 'electronic_attack'),
+    1527: ('frigate', 'logistics'),
+    1283: ('frigate', 'expedition'),
+    1022: ('frigate', 'prototype'),
+
+    # Destroyers
+    420: ('destroyer', 'standard'),
+    541: ('destroyer', 'interdictor'),
+    1534: ('destroyer', 'command'),
+    1305: ('destroyer', 'tactical'),
+
+    # Cruisers
+    26: ('cruiser', 'standard'),
+    358: ('cruiser', 'heavy_assault'),
+    906: ('cruiser', 'recon'),
+    833: ('cruiser', 'recon'),
+    832: ('cruiser', 'logistics'),
+    894: ('cruiser', 'heavy_interdictor'),
+    963: ('cruiser', 'strategic'),
+    1972: ('cruiser', 'flag'),
+
+    # Battlecruisers
+    419: ('battlecruiser', 'standard'),
+    1201: ('battlecruiser', 'attack'),
+    540: ('battlecruiser', 'command'),
+
+    # Battleships
+    27: ('battleship', 'standard'),
+    900: ('battleship', 'marauder'),
+    898: ('battleship', 'black_ops'),
+    381: ('battleship', 'elite'),
+
+    # Capitals
+    485: ('dreadnought', 'standard'),
+    4594: ('dreadnought', 'lancer'),
+    547: ('carrier', 'standard'),
+    1538: ('force_auxiliary', 'standard'),
+    659: ('supercarrier', 'standard'),
+    30: ('titan', 'standard'),
+
+    # Mining
+    463: ('mining_barge', 'standard'),
+    543: ('exhumer', 'standard'),
+
+    # Industrials
+    28: ('industrial', 'standard'),
+    1202: ('industrial', 'blockade_runner'),
+    380: ('industrial', 'deep_space_transport'),
+
+    # Freighters
+    513: ('freighter', 'standard'),
+    902: ('freighter', 'jump'),
+
+    # Industrial Command & Capital Industrial
+    941: ('industrial_command', 'standard'),
+    883: ('capital_industrial', 'standard'),
+
+    # Fighters (Carrier drones)
+    1652: ('fighter', 'light'),
+    1653: ('fighter', 'heavy'),
+    1537: ('fighter', 'support'),
+    4777: ('fighter', 'structure_light'),
+    4778: ('fighter', 'structure_support'),
+    4779: ('fighter', 'structure_heavy'),
+
+    # Deployables (Mobile structures)
+    361: ('deployable', 'warp_disruptor'),
+    1246: ('deployable', 'depot'),
+    1250: ('deployable', 'tractor_unit'),
+    1276: ('deployable', 'micro_jump'),
+    4093: ('deployable', 'cyno_beacon'),
+    4107: ('deployable', 'observatory'),
+    4137: ('deployable', 'analysis_beacon'),
+    4810: ('deployable', 'mercenary_den'),
+
+    # Starbase (POS structures)
+    365: ('starbase', 'control_tower'),
+    363: ('starbase', 'ship_maintenance'),
+    471: ('starbase', 'hangar_array'),
+    430: ('starbase', 'sentry'),
+    449: ('starbase', 'sentry'),
+    441: ('starbase', 'web_battery'),
+    443: ('starbase', 'scram_battery'),
+
+    # Orbitals (Customs Offices, Skyhooks)
+    1025: ('orbital', 'customs_office'),
+    4736: ('orbital', 'skyhook'),
+
+    # Upwell Structures (Citadels, Refineries, etc.)
+    1657: ('citadel', 'standard'),
+    1406: ('refinery', 'standard'),
+    1408: ('structure', 'jump_bridge'),
+    4744: ('structure', 'moon_drill'),
+    1924: ('structure', 'stronghold'),
+}
+
+OTHER_SHIP_CLASS = ('other', 'other')
+
+# Titan, Supercarrier, Carrier, Dreadnought, Force Auxiliary, Industrial Command
+CAPITAL_GROUP_IDS: FrozenSet[int] = frozenset({30, 659, 547, 485, 1538, 941})
+
+
+def ship_class_for_group(group_id: int) -> Tuple[str, str]:
+    """(ship_category, ship_role) of a group, ('other', 'other') if not a known ship group"""
+    return SHIP_GROUP_CLASSES.get(group_id, OTHER_SHIP_CLASS)
@@ -4,11 +4,13 @@ Shopping List Bulk Operations.
 Provides bulk add, export, and grouping operations for shopping lists.
 """
 
+import math
 from typing import Optional, List
 
 from psycopg2.extras import RealDictCursor
 
 from src.database import get_db_connection
+from src.services.market.price_book import get_price_book
 
 
 # Region ID to name mapping
@@ -32,10 +34,9 @@ class ShoppingBulkMixin:
         runs: int = 1
     ) -> List[dict]:
         """Add all materials for producing an item to the shopping list"""
-        # Get materials and their cached prices in a single query
+        # Get materials for this product
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Get materials for this product
                 cur.execute("""
                     SELECT m."materialTypeID" as type_id, t."typeName" as name, m.quantity
                     FROM "invTypeMaterials" m
@@ -47,42 +48,20 @@ class ShoppingBulkMixin:
                 if not materials:
                     return []
 
-                # Get all material type IDs
-                material_ids = [m['type_id'] for m in materials]
-
-                # Get cached prices for all materials at once
-                cur.execute("""
-                    SELECT type_id, region_id, lowest_sell
-                    FROM market_prices
-                    WHERE type_id = ANY(%s) AND lowest_sell IS NOT NULL
-                """, (material_ids,))
-
-                # Build price map: {type_id: {region_name: lowest_sell}}
-                price_map = {}
-                for row in cur.fetchall():
-                    tid = row['type_id']
-                    region_name = REGION_ID_TO_NAME.get(row['region_id'])
-                    if not region_name:
-                        continue
-                    if tid not in price_map:
-                        price_map[tid] = {}
-                    price_map[tid][region_name] = float(row['lowest_sell'])
+        # Cheapest regional sell for every material from the shared price book
+        material_ids = [m['type_id'] for m in materials]
+        best_prices, best_regions = get_price_book().best_sell(material_ids, REGION_ID_TO_NAME.keys())
 
         me_factor = 1 - (me_level / 100)
         added_items = []
 
-        for mat in materials:
+        for i, mat in enumerate(materials):
             adjusted_qty = max(1, int(mat['quantity'] * me_factor * runs))
 
             # Get best price from cached data
-            prices = price_map.get(mat['type_id'], {})
-            best_region = None
-            best_price = float('inf')
-
-            for region, price in prices.items():
-                if price and price < best_price:
-                    best_price = price
-                    best_region = region
+            best_price = best_prices[i]
+            best_region = REGION_ID_TO_NAME.get(int(best_regions[i]))
+            has_price = not math.isnan(best_price)
 
             item = self.add_item(
                 list_id=list_id,
@@ -90,7 +69,7 @@ class ShoppingBulkMixin:
                 item_name=mat['name'],
                 quantity=adjusted_qty,
                 target_region=best_region,
-                target_price=best_price if best_price != float('inf') else None
+                target_price=float(best_price) if has_price else None
             )
             added_items.append(item)
 
@@ -11,6 +11,7 @@ from psycopg2.extras import RealDictCursor
 
 from src.database import get_db_connection
 from services.production.chain_service import ProductionChainService
+from src.services.production.bom_cache import bom_cache, BUILD_ACTIVITIES
 
 
 # Region mapping for price lookup
@@ -71,18 +72,12 @@ class ShoppingMaterialsMixin:
                 me_level = product['me_level'] or 10
 
                 # Get blueprint output info for total_output calculation
-                cur.execute('''
-                    SELECT bp."quantity" as output_per_run
-                    FROM "industryActivityProducts" bp
-                    WHERE bp."productTypeID" = %s AND bp."activityID" IN (1, 11)
-                    LIMIT 1
-                ''', (type_id,))
-                blueprint_info = cur.fetchone()
+                blueprint_info = bom_cache.blueprint_for_product(type_id, BUILD_ACTIVITIES)
 
                 if not blueprint_info:
                     return None
 
-                output_per_run = blueprint_info['output_per_run'] or 1
+                output_per_run = blueprint_info.quantity
 
                 # Use Production Chains API to get materials
                 chain_service = ProductionChainService()
@@ -99,20 +94,11 @@ class ShoppingMaterialsMixin:
                     mat_type_id = mat['type_id']
 
                     # Check if this material has a blueprint (is a sub-product)
-                    cur.execute('''
-                        SELECT bp."typeID"
-                        FROM "industryActivityProducts" bp
-                        WHERE bp."productTypeID" = %s AND bp."activityID" IN (1, 11)
-                        LIMIT 1
-                    ''', (mat_type_id,))
-                    has_blueprint = cur.fetchone() is not None
+                    has_blueprint = bom_cache.has_blueprint(mat_type_id)
 
                     # Get volume info
-                    cur.execute('''
-                        SELECT "volume" FROM "invTypes" WHERE "typeID" = %s
-                    ''', (mat_type_id,))
-                    volume_result = cur.fetchone()
-                    volume = float(volume_result['volume']) if volume_result and volume_result['volume'] else 0
+                    type_info = bom_cache.type_info(mat_type_id)
+                    volume = type_info.volume if type_info else 0
 
                     material_data = {
                         'type_id': mat_type_id,
@@ -10,6 +10,7 @@ from typing import Optional, List
 from psycopg2.extras import RealDictCursor
 
 from src.database import get_db_connection
+from src.services.production.bom_cache import bom_cache, BUILD_ACTIVITIES
 
 
 # Region ID to name mapping
@@ -56,75 +57,43 @@ class ShoppingWizardMixin:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 # Get product info
-                cur.execute('''
-                    SELECT "typeID" as type_id, "typeName" as type_name, "volume"
-                    FROM "invTypes"
-                    WHERE "typeID" = %s
-                ''', (product_type_id,))
-                product_info = cur.fetchone()
+                product_info = bom_cache.type_info(product_type_id)
 
                 if not product_info:
                     return None
 
                 # Get blueprint/formula info
-                cur.execute('''
-                    SELECT bp."typeID" as blueprint_type_id,
-                           bp."quantity" as output_per_run,
-                           bp."activityID" as activity_id
-                    FROM "industryActivityProducts" bp
-                    WHERE bp."productTypeID" = %s AND bp."activityID" IN (1, 11)
-                    LIMIT 1
-                ''', (product_type_id,))
-                blueprint_info = cur.fetchone()
+                blueprint_info = bom_cache.blueprint_for_product(product_type_id, BUILD_ACTIVITIES)
 
                 if not blueprint_info:
                     return None
 
-                blueprint_type_id = blueprint_info['blueprint_type_id']
-                output_per_run = blueprint_info['output_per_run'] or 1
-                activity_id = blueprint_info['activity_id']
-
-                # Get materials from industryActivityMaterials
-                cur.execute('''
-                    SELECT
-                        m."materialTypeID" as type_id,
-                        t."typeName" as item_name,
-                        m."quantity" as base_quantity,
-                        t."volume" as volume
-                    FROM "industryActivityMaterials" m
-                    JOIN "invTypes" t ON m."materialTypeID" = t."typeID"
-                    WHERE m."typeID" = %s AND m."activityID" = %s
-                    ORDER BY t."typeName"
-                ''', (blueprint_type_id, activity_id))
-                raw_materials = cur.fetchall()
+                output_per_run = blueprint_info.quantity
+
+                # Get materials from industryActivityMaterials (ordered by name)
+                raw_materials = bom_cache.materials(blueprint_info.blueprint_id, blueprint_info.activity_id)
 
                 # Separate into materials and sub-components
                 materials = []
                 sub_components = []
 
                 for mat in raw_materials:
-                    mat_type_id = mat['type_id']
+                    mat_type_id = mat.type_id
 
                     # Check if this material can be built
-                    cur.execute('''
-                        SELECT bp."typeID"
-                        FROM "industryActivityProducts" bp
-                        WHERE bp."productTypeID" = %s AND bp."activityID" IN (1, 11)
-                        LIMIT 1
-                    ''', (mat_type_id,))
-                    has_blueprint = cur.fetchone() is not None
+                    has_blueprint = bom_cache.has_blueprint(mat_type_id)
 
                     # Calculate quantity (ME only applies to raw materials)
                     calculated_qty = self._calculate_material_quantity(
-                        mat['base_quantity'], runs, me_level, apply_me=(not has_blueprint)
+                        mat.quantity, runs, me_level, apply_me=(not has_blueprint)
                     )
 
                     material_data = {
                         'type_id': mat_type_id,
-                        'item_name': mat['item_name'],
+                        'item_name': mat.name,
                         'quantity': calculated_qty,
-                        'base_quantity': mat['base_quantity'],
-                        'volume': float(mat['volume']) if mat['volume'] else 0,
+                        'base_quantity': mat.quantity,
+                        'volume': mat.volume,
                         'has_blueprint': has_blueprint
                     }
 
@@ -214,7 +183,7 @@ class ShoppingWizardMixin:
                 return {
                     'product': {
                         'type_id': product_type_id,
-                        'name': product_info['type_name'],
+                        'name': product_info.name,
                         'runs': runs,
                         'me_level': me_level,
                         'output_per_run': output_per_run,
@@ -241,59 +210,33 @@ class ShoppingWizardMixin:
         Recursively resolves nested buildable items (all set to 'buy').
         """
         # Get blueprint info
-        cur.execute('''
-            SELECT bp."typeID" as blueprint_type_id,
-                   bp."quantity" as output_per_run,
-                   bp."activityID" as activity_id
-            FROM "industryActivityProducts" bp
-            WHERE bp."productTypeID" = %s AND bp."activityID" IN (1, 11)
-            LIMIT 1
-        ''', (type_id,))
-        bp_info = cur.fetchone()
+        bp_info = bom_cache.blueprint_for_product(type_id, BUILD_ACTIVITIES)
 
         if not bp_info:
             return []
 
         # Calculate runs needed
-        output_per_run = bp_info['output_per_run'] or 1
+        output_per_run = bp_info.quantity
         runs_needed = math.ceil(quantity / output_per_run)
 
         # Get materials
-        cur.execute('''
-            SELECT
-                m."materialTypeID" as type_id,
-                t."typeName" as item_name,
-                m."quantity" as base_quantity,
-                t."volume" as volume
-            FROM "industryActivityMaterials" m
-            JOIN "invTypes" t ON m."materialTypeID" = t."typeID"
-            WHERE m."typeID" = %s AND m."activityID" = %s
-        ''', (bp_info['blueprint_type_id'], bp_info['activity_id']))
-        raw_mats = cur.fetchall()
+        raw_mats = bom_cache.materials(bp_info.blueprint_id, bp_info.activity_id)
 
         result = []
         for mat in raw_mats:
-            mat_type_id = mat['type_id']
-
             # Check if buildable (but we treat as buy for simplicity)
-            cur.execute('''
-                SELECT bp."typeID"
-                FROM "industryActivityProducts" bp
-                WHERE bp."productTypeID" = %s AND bp."activityID" IN (1, 11)
-                LIMIT 1
-            ''', (mat_type_id,))
-            has_blueprint = cur.fetchone() is not None
+            has_blueprint = bom_cache.has_blueprint(mat.type_id)
 
             # Calculate quantity with ME
             calc_qty = self._calculate_material_quantity(
-                mat['base_quantity'], runs_needed, me_level, apply_me=(not has_blueprint)
+                mat.quantity, runs_needed, me_level, apply_me=(not has_blueprint)
             )
 
             result.append({
-                'type_id': mat_type_id,
-                'item_name': mat['item_name'],
+                'type_id': mat.type_id,
+                'item_name': mat.name,
                 'quantity': calc_qty,
-                'volume': float(mat['volume']) if mat['volume'] else 0
+                'volume': mat.volume
             })
 
         return result
@@ -17,6 +17,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from src.database import get_db_connection
+from src.services.names import get_name_resolver
 from config import ESI_BASE_URL, ESI_USER_AGENT
 
 logging.basicConfig(level=logging.INFO)
@@ -34,9 +35,6 @@ class SovereigntyService:
             "Accept": "application/json"
         })
 
-        # Alliance name cache (in-memory)
-        self._alliance_cache: Dict[int, str] = {}
-
     def fetch_campaigns(self) -> Optional[List[Dict]]:
         """
         Fetch all active sovereignty campaigns from ESI.
@@ -73,43 +71,17 @@ class SovereigntyService:
             logger.error(f"Unexpected error fetching campaigns: {e}")
             return None
 
-    def get_alliance_name(self, alliance_id: int) -> Optional[str]:
+    def get_alliance_name(self, alliance_id: int) -> str:
         """
-        Get alliance name from ESI (with caching).
+        Get alliance name via the shared name resolver.
 
         Args:
             alliance_id: Alliance ID
 
         Returns:
-            Alliance name or None
+            Alliance name or fallback string
         """
-        # Check cache
-        if alliance_id in self._alliance_cache:
-            return self._alliance_cache[alliance_id]
-
-        url = f"{self.base_url}/alliances/{alliance_id}/"
-
-        try:
-            response = self.session.get(
-                url,
-                params={"datasource": "tranquility"},
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                name = data.get("name", f"Alliance {alliance_id}")
-
-                # Cache it
-                self._alliance_cache[alliance_id] = name
-                return name
-            else:
-                logger.warning(f"Failed to fetch alliance {alliance_id}: {response.status_code}")
-                return f"Alliance {alliance_id}"
-
-        except Exception as e:
-            logger.warning(f"Error fetching alliance {alliance_id}: {e}")
-            return f"Alliance {alliance_id}"
+        return get_name_resolver().get_name('alliance', alliance_id)
 
     def update_campaigns(self) -> Dict:
         """
@@ -135,7 +107,8 @@ class SovereigntyService:
                 "deleted": 0
             }
 
-        # Get alliance names for all defenders
+        # Get alliance names for all defenders (one batched lookup)
+        get_name_resolver().resolve('alliance', [c.get("defender_id") for c in campaigns])
         for campaign in campaigns:
             defender_id = campaign.get("defender_id")
             if defender_id:
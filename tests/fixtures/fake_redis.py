@@ -0,0 +1,164 @@
+"""
+In-memory stand-in for the redis.Redis commands the kill aggregates use
+
+Behaves like a client with decode_responses=True: members, fields and
+values come back as strings. Expiry follows the `now` attribute, so tests
+can move the clock instead of sleeping.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+
+class FakeRedis:
+    """Hashes, lists and sorted sets with TTLs, plus non-transactional pipelines"""
+
+    def __init__(self, now: Optional[float] = None):
+        self.now = now if now is not None else time.time()
+        self.data: Dict[str, Any] = {}
+        self.expires: Dict[str, float] = {}
+
+    # --------------------------------------------------------------
+    # Keys
+    # --------------------------------------------------------------
+
+    def _live(self, key: str, default=None):
+        if key in self.expires and self.expires[key] <= self.now:
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        if key not in self.data and default is not None:
+            self.data[key] = default
+        return self.data.get(key)
+
+    def exists(self, key: str) -> int:
+        return int(self._live(key) is not None)
+
+    def ttl(self, key: str) -> int:
+        if self._live(key) is None:
+            return -2
+        if key not in self.expires:
+            return -1
+        return int(self.expires[key] - self.now)
+
+    def expire(self, key: str, seconds: int) -> bool:
+        if self._live(key) is None:
+            return False
+        self.expires[key] = self.now + seconds
+        return True
+
+    def expireat(self, key: str, when: float) -> bool:
+        if self._live(key) is None:
+            return False
+        self.expires[key] = when
+        return True
+
+    def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            if self._live(key) is not None:
+                removed += 1
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return removed
+
+    # --------------------------------------------------------------
+    # Hashes
+    # --------------------------------------------------------------
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        values = self._live(key, {})
+        values[str(field)] = str(int(values.get(str(field), 0)) + int(amount))
+        return int(values[str(field)])
+
+    def hincrbyfloat(self, key: str, field: str, amount: float = 1.0) -> float:
+        values = self._live(key, {})
+        values[str(field)] = repr(float(values.get(str(field), 0)) + float(amount))
+        return float(values[str(field)])
+
+    def hdel(self, key: str, *fields: str) -> int:
+        values = self._live(key) or {}
+        removed = sum(1 for f in fields if values.pop(str(f), None) is not None)
+        if key in self.data and not values:
+            self.delete(key)
+        return removed
+
+    def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self._live(key) or {})
+
+    # --------------------------------------------------------------
+    # Lists
+    # --------------------------------------------------------------
+
+    def lpush(self, key: str, *values: Any) -> int:
+        items = self._live(key, [])
+        for value in values:
+            items.insert(0, str(value))
+        return len(items)
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        items = self._live(key) or []
+        end = len(items) if end == -1 else end + 1
+        items[:] = items[start:end]
+        return True
+
+    def lrange(self, key: str, start: int, end: int) -> List[str]:
+        items = self._live(key) or []
+        return items[start:len(items) if end == -1 else end + 1]
+
+    # --------------------------------------------------------------
+    # Sorted sets
+    # --------------------------------------------------------------
+
+    def zincrby(self, key: str, amount: float, member: Any) -> float:
+        scores = self._live(key, {})
+        scores[str(member)] = scores.get(str(member), 0.0) + float(amount)
+        return scores[str(member)]
+
+    def zadd(self, key: str, mapping: Dict[Any, float]) -> int:
+        scores = self._live(key, {})
+        added = sum(1 for m in mapping if str(m) not in scores)
+        scores.update({str(m): float(s) for m, s in mapping.items()})
+        return added
+
+    def _ranked(self, key: str) -> List[tuple]:
+        return sorted((self._live(key) or {}).items(), key=lambda item: (item[1], item[0]))
+
+    def zremrangebyrank(self, key: str, start: int, end: int) -> int:
+        ranked = self._ranked(key)
+        stop = max(len(ranked) + end + 1, 0) if end < 0 else end + 1
+        doomed = ranked[start:stop]
+        for member, _ in doomed:
+            del self.data[key][member]
+        return len(doomed)
+
+    def zrange(self, key: str, start: int, end: int, withscores: bool = False) -> List:
+        ranked = self._ranked(key)
+        ranked = ranked[start:len(ranked) if end == -1 else end + 1]
+        return ranked if withscores else [member for member, _ in ranked]
+
+    # --------------------------------------------------------------
+    # Pipelines
+    # --------------------------------------------------------------
+
+    def pipeline(self, transaction: bool = True) -> 'FakePipeline':
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on execute()"""
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self.client, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> List[Any]:
+        commands, self.commands = self.commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
@@ -0,0 +1,194 @@
+"""
+Tests for MCP tool dispatch (in-process ASGI and loopback HTTP) and the
+compact JSON tool results
+"""
+
+import asyncio
+import importlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+import requests
+from fastapi import Body, FastAPI, HTTPException
+
+from routers.mcp.handlers.api_proxy import APIProxy
+from routers.mcp.handlers.results import json_result, to_json, tool_result
+
+# The package exports an `api_proxy` instance that shadows the module name
+api_proxy_module = importlib.import_module("routers.mcp.handlers.api_proxy")
+results = importlib.import_module("routers.mcp.handlers.results")
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/api/items")
+    async def items(a: int = 0, b: str = "unset"):
+        return {"a": a, "b": b}
+
+    @app.get("/api/échange/{name}")
+    async def path_echo(name: str):
+        return {"name": name}
+
+    @app.post("/api/echo")
+    async def echo(payload: dict = Body(...), dry_run: bool = False):
+        return {"payload": payload, "dry_run": dry_run}
+
+    @app.delete("/api/items/{item_id}")
+    async def delete(item_id: int):
+        return None
+
+    @app.get("/api/missing")
+    async def missing():
+        raise HTTPException(status_code=404, detail="no such item")
+
+    @app.get("/api/boom")
+    async def boom():
+        raise RuntimeError("kaboom")
+
+    @app.get("/api/slow")
+    async def slow():
+        await asyncio.sleep(5)
+        return {}
+
+    return app
+
+
+@pytest.fixture
+def proxy():
+    proxy = APIProxy(base_url="http://api.test", mode="inprocess")
+    proxy.bind_app(make_app())
+    return proxy
+
+
+def body(result):
+    assert "isError" not in result, result
+    return json.loads(result["content"][0]["text"])
+
+
+class TestInProcess:
+    async def test_query_params_drop_none(self, proxy):
+        assert proxy.in_process
+        assert body(await proxy.get("/api/items", {"a": 3, "b": None})) == {"a": 3, "b": "unset"}
+
+    async def test_non_ascii_path(self, proxy):
+        assert body(await proxy.get("/api/échange/Jita")) == {"name": "Jita"}
+
+    async def test_post_body_and_params(self, proxy):
+        result = await proxy.post("/api/echo", data={"type_id": 34, "names": ["Tritanium"]},
+                                  params={"dry_run": True})
+        assert body(result) == {"payload": {"type_id": 34, "names": ["Tritanium"]}, "dry_run": True}
+
+    async def test_empty_response_body(self, proxy):
+        assert body(await proxy.delete("/api/items/7")) is None
+
+    async def test_http_errors_map_to_is_error(self, proxy):
+        result = await proxy.get("/api/missing")
+        assert result["isError"] is True
+        assert "404" in result["error"] and "no such item" in result["error"]
+
+        result = await proxy.post("/api/echo", data=None)
+        assert result["isError"] is True
+        assert "422" in result["error"]
+
+    async def test_app_exception_is_an_error_result(self, proxy):
+        result = await proxy.get("/api/boom")
+        assert result["isError"] is True
+        assert "kaboom" in result["error"]
+
+    async def test_timeout(self, proxy, monkeypatch):
+        monkeypatch.setattr(api_proxy_module, "REQUEST_TIMEOUT", 0.1)
+        result = await proxy.get("/api/slow")
+        assert result["isError"] is True
+        assert "timed out" in result["error"]
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text=""):
+        self.status_code = status_code
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Client Error")
+
+
+class TestHttpFallback:
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+
+        def fake_request(method, url, params=None, json=None, timeout=None):
+            calls.append((method, url, params, json, timeout))
+            return FakeResponse(404 if url.endswith("/missing") else 200, '{"ok":true}')
+
+        monkeypatch.setattr(api_proxy_module.requests, "request", fake_request)
+        return calls
+
+    async def test_http_mode_ignores_bound_app(self, calls):
+        proxy = APIProxy(base_url="http://api.test", mode="http")
+        proxy.bind_app(make_app())
+        assert not proxy.in_process
+
+        result = await proxy.post("/api/echo", data={"x": 1}, params={"y": 2})
+
+        assert body(result) == {"ok": True}
+        assert calls == [("POST", "http://api.test/api/echo", {"y": 2}, {"x": 1},
+                          api_proxy_module.REQUEST_TIMEOUT)]
+
+    async def test_unbound_inprocess_falls_back_to_http(self, calls):
+        proxy = APIProxy(base_url="http://api.test", mode="inprocess")
+        assert body(await proxy.get("/api/items")) == {"ok": True}
+        assert calls[0][:2] == ("GET", "http://api.test/api/items")
+
+    async def test_http_errors(self, calls):
+        result = await APIProxy(base_url="http://api.test", mode="http").get("/api/missing")
+        assert result["isError"] is True
+        assert "404" in result["error"]
+
+
+class TestResults:
+    VALUES = {
+        "price": Decimal("5.25"),
+        "day": date(2026, 1, 2),
+        "at": datetime(2026, 1, 2, 3, 4, 5),
+        "by_id": {34: "Tritanium", 35: "Pyerite"},
+        "ids": np.array([1, 2, 3], dtype=np.int64),
+        "mean": np.float64(1.5),
+        "count": np.int32(7),
+        "name": "Übersicht",
+        "tags": ("a", "b"),
+    }
+    EXPECTED = {
+        "price": 5.25,
+        "day": "2026-01-02",
+        "at": "2026-01-02T03:04:05",
+        "by_id": {"34": "Tritanium", "35": "Pyerite"},
+        "ids": [1, 2, 3],
+        "mean": 1.5,
+        "count": 7,
+        "name": "Übersicht",
+        "tags": ["a", "b"],
+    }
+
+    def test_to_json(self):
+        text = to_json(self.VALUES)
+        assert json.loads(text) == self.EXPECTED
+        assert " " not in text.replace("Übersicht", "")
+        assert "Übersicht" in text
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        with_orjson = to_json(self.VALUES)
+        monkeypatch.setattr(results, "orjson", None)
+        assert json.loads(to_json(self.VALUES)) == json.loads(with_orjson)
+
+    def test_unserializable_raises(self):
+        with pytest.raises(TypeError):
+            to_json({"x": object()})
+
+    def test_tool_result_and_json_result(self):
+        assert tool_result({"a": [1, 2]}) == {"content": [{"type": "text", "text": '{"a":[1,2]}'}]}
+        assert json_result('{"b":1}') == {"content": [{"type": "text", "text": '{"b":1}'}]}
@@ -0,0 +1,179 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from public_api.report_cache import ReportCache, CachedReport, etag_matches
+from public_api.routers import reports
+
+
+class FakeStore:
+    """stored_reports stand-in counting database calls"""
+
+    def __init__(self):
+        self.reports = {}
+        self.loads = 0
+        self.polls = 0
+
+    def save(self, report_type, data):
+        version = self.reports.get(report_type, (None, 0))[1] + 1
+        self.reports[report_type] = (data, version)
+
+    def load(self, report_type):
+        self.loads += 1
+        return self.reports.get(report_type)
+
+    def versions(self):
+        self.polls += 1
+        return {rt: version for rt, (_, version) in self.reports.items()}
+
+
+@pytest.fixture
+def store():
+    store = FakeStore()
+    store.save('pilot_intelligence', {"global": {"total_kills": 42}})
+    store.save('trade_routes', {"routes": [{"from_hub": i, "systems": [1, 2]} for i in range(10)]})
+    return store
+
+
+@pytest.fixture
+def cache(store):
+    cache = ReportCache(load=store.load, poll_versions=store.versions)
+    cache.refresh()  # Initial load, done by the app lifespan
+    return cache
+
+
+@pytest.fixture
+def client(cache, monkeypatch):
+    monkeypatch.setattr(reports, "report_cache", cache)
+    app = FastAPI()
+    app.include_router(reports.router)
+    return TestClient(app)
+
+
+def test_cache_serves_without_store_access_after_first_poll(cache, store):
+    cache.get('pilot_intelligence')
+    loads, polls = store.loads, store.polls
+    for _ in range(5):
+        entry = cache.get('pilot_intelligence')
+    assert (store.loads, store.polls) == (loads, polls)
+    assert json.loads(entry.body) == {"global": {"total_kills": 42}}
+    assert json.loads(gzip.decompress(entry.gzip_body)) == {"global": {"total_kills": 42}}
+
+
+def test_get_never_queries_the_store(store):
+    cache = ReportCache(load=store.load, poll_versions=store.versions)
+    assert cache.get('pilot_intelligence') is None
+    assert (store.loads, store.polls) == (0, 0)
+
+    cache.refresh()
+    assert json.loads(cache.get('pilot_intelligence').body) == {"global": {"total_kills": 42}}
+
+
+def test_failed_initial_load_serves_503_until_a_poll_succeeds(store, monkeypatch):
+    down = [True]
+
+    def versions():
+        if down[0]:
+            raise ConnectionError("database unreachable")
+        return store.versions()
+
+    cache = ReportCache(load=store.load, poll_versions=versions)
+    with pytest.raises(ConnectionError):
+        cache.refresh()
+
+    monkeypatch.setattr(reports, "report_cache", cache)
+    app = FastAPI()
+    app.include_router(reports.router)
+    client = TestClient(app)
+    assert client.get("/api/reports/battle-24h").status_code == 503
+
+    down[0] = False
+    cache.refresh()
+    assert client.get("/api/reports/battle-24h").status_code == 200
+
+
+def test_refresh_reloads_only_changed_reports(cache, store):
+    cache.refresh()
+    first = cache.get('pilot_intelligence')
+    loads = store.loads
+
+    assert cache.refresh() == 0
+    store.save('pilot_intelligence', {"global": {"total_kills": 7}})
+    assert cache.refresh() == 1
+    assert store.loads == loads + 1
+
+    second = cache.get('pilot_intelligence')
+    assert second.etag != first.etag
+    assert json.loads(second.body)["global"]["total_kills"] == 7
+
+
+def test_variants_are_built_once_per_version(cache):
+    calls = []
+
+    def transform(data):
+        calls.append(1)
+        return {"routes": data["routes"][:2]}
+
+    a = cache.get('trade_routes', "2", transform)
+    b = cache.get('trade_routes', "2", transform)
+    assert a is b and len(calls) == 1
+    assert len(json.loads(a.body)["routes"]) == 2
+    assert len(json.loads(cache.get('trade_routes').body)["routes"]) == 10
+
+
+def test_unknown_report_returns_none(cache):
+    assert cache.get('war_economy') is None
+
+
+def test_encoding_negotiation():
+    entry = CachedReport(etag='W/"x"', body=b"plain", gzip_body=b"gz", brotli_body=b"br")
+    assert entry.encoded("gzip, deflate, br") == (b"br", "br")
+    assert entry.encoded("gzip, br;q=0") == (b"gz", "gzip")
+    assert entry.encoded("identity") == (b"plain", None)
+    assert entry.encoded("") == (b"plain", None)
+
+    no_brotli = CachedReport(etag='W/"x"', body=b"plain", gzip_body=b"gz")
+    assert no_brotli.encoded("br, gzip") == (b"gz", "gzip")
+
+
+def test_etag_matches():
+    assert etag_matches('W/"a-v1"', 'W/"a-v1"')
+    assert etag_matches('"a-v1", "b-v2"', 'W/"a-v1"')
+    assert etag_matches('*', 'W/"a-v1"')
+    assert not etag_matches('W/"a-v2"', 'W/"a-v1"')
+    assert not etag_matches(None, 'W/"a-v1"')
+
+
+def test_endpoint_etag_and_304(client):
+    response = client.get("/api/reports/battle-24h")
+    assert response.status_code == 200
+    assert response.json() == {"global": {"total_kills": 42}}
+    etag = response.headers["etag"]
+
+    response = client.get("/api/reports/battle-24h", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_endpoint_serves_precompressed_gzip(client):
+    response = client.get("/api/reports/battle-24h", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == {"global": {"total_kills": 42}}
+
+
+def test_trade_routes_filters(client):
+    data = client.get("/api/reports/trade-routes?limit=3&include_systems=false").json()
+    assert len(data["routes"]) == 3
+    assert "systems" not in data["routes"][0]
+
+    data = client.get("/api/reports/trade-routes").json()
+    assert len(data["routes"]) == 5
+    assert data["routes"][0]["systems"] == [1, 2]
+
+
+def test_missing_report_is_503(client):
+    assert client.get("/api/reports/war-economy").status_code == 503
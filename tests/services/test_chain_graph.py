@@ -0,0 +1,66 @@
+"""
+Test suite for the production chain DAG
+"""
+
+import pytest
+
+from services.production.chain_graph import ProductionGraph
+
+
+SHIP, COMPONENT, SUBCOMPONENT = 100, 200, 300
+TRITANIUM, PYERITE, MORPHITE = 34, 35, 11399
+
+EDGES = [
+    (SHIP, COMPONENT, 10),
+    (SHIP, TRITANIUM, 1000),
+    (COMPONENT, SUBCOMPONENT, 2),
+    (COMPONENT, PYERITE, 5),
+    (SUBCOMPONENT, TRITANIUM, 3),
+    (SUBCOMPONENT, MORPHITE, 1),
+]
+
+
+@pytest.fixture
+def graph():
+    return ProductionGraph.from_rows(EDGES)
+
+
+def test_raw_material_totals(graph):
+    chain = graph.chain(SHIP)
+    assert {raw: entry.quantity for raw, entry in chain.items()} == {
+        TRITANIUM: 1000 + 10 * 2 * 3,
+        PYERITE: 10 * 5,
+        MORPHITE: 10 * 2 * 1,
+    }
+
+
+def test_chain_depth_and_path_follow_deepest_route(graph):
+    chain = graph.chain(SHIP)
+    assert chain[PYERITE].depth == 2
+    assert chain[TRITANIUM].depth == 3
+    assert graph.path(SHIP, TRITANIUM) == "100->200->300->34"
+    assert graph.path(SHIP, PYERITE) == "100->200->35"
+
+
+def test_topological_order_puts_components_first(graph):
+    order = graph.topological_order(graph.reachable([SHIP]))
+    assert order == [SUBCOMPONENT, COMPONENT, SHIP]
+
+
+def test_shared_components_resolved_once(graph):
+    chains = graph.resolve([SHIP, COMPONENT])
+    assert set(chains) == {SHIP, COMPONENT, SUBCOMPONENT}
+    sub = chains[SUBCOMPONENT]
+    graph.resolve([SHIP])
+    assert graph.resolve([SHIP])[SUBCOMPONENT] is sub
+
+
+def test_raw_material_has_no_chain(graph):
+    assert graph.is_raw(TRITANIUM)
+    assert graph.chain(TRITANIUM) is None
+
+
+def test_cycles_are_reported_not_followed():
+    graph = ProductionGraph.from_rows(EDGES + [(SUBCOMPONENT, SHIP, 1)])
+    assert graph.chain(SHIP) is None
+    assert graph.cyclic == {SHIP, COMPONENT, SUBCOMPONENT}
@@ -0,0 +1,82 @@
+"""
+Test suite for coalition clustering
+"""
+
+from services.coalition_clustering import CoalitionClusterer, cluster_coalitions, count_pairs
+
+
+A, B, C, D, E = 1, 2, 3, 4, 5
+
+
+def as_sets(clusters):
+    return sorted(sorted(c) for c in clusters)
+
+
+def test_allies_are_merged_and_sorted_by_activity():
+    activity = {A: 100, B: 300, C: 50}
+    clusters = cluster_coalitions([(A, B, 40), (B, C, 30)], activity, [])
+    assert clusters == [[B, A, C]]
+
+
+def test_insignificant_cooperation_is_not_merged():
+    # 5 shared kills < 10% of the smaller alliance's 100 activity
+    clusters = cluster_coalitions([(A, B, 5)], {A: 100, B: 200}, [])
+    assert as_sets(clusters) == [[A], [B]]
+
+
+def test_direct_enemies_are_never_merged():
+    conflicts = [(A, B, 12), (B, A, 10)]   # 22 fights between them
+    clusters = cluster_coalitions([(A, B, 500)], {A: 100, B: 100}, conflicts)
+    assert as_sets(clusters) == [[A], [B]]
+
+
+def test_conflict_must_be_outweighed_by_cooperation():
+    activity = {A: 100, B: 100}
+    assert as_sets(cluster_coalitions([(A, B, 40)], activity, [(A, B, 10)])) == [[A], [B]]
+    assert as_sets(cluster_coalitions([(A, B, 50)], activity, [(A, B, 10)])) == [[A, B]]
+
+
+def test_transitive_enemies_block_merge():
+    # A-B and C-D are allied, but A and D are enemies: B-C must not join the two blocs
+    activity = {A: 100, B: 100, C: 100, D: 100}
+    pairs = [(A, B, 90), (C, D, 80), (B, C, 70)]
+    clusters = cluster_coalitions(pairs, activity, [(A, D, 25)])
+    assert as_sets(clusters) == [[A, B], [C, D]]
+
+
+def test_enemies_follow_merged_clusters():
+    # E is an enemy of A only; after A-B merge, E cannot join via B
+    activity = {A: 100, B: 100, E: 100}
+    clusters = cluster_coalitions([(A, B, 90), (B, E, 80)], activity, [(E, A, 30)])
+    assert as_sets(clusters) == [[A, B], [E]]
+
+
+def test_pair_members_without_activity_are_not_reported():
+    clusters = cluster_coalitions([(A, B, 50)], {A: 100}, [])
+    assert clusters == [[A]]
+
+
+def test_thresholds_are_configurable():
+    clusterer = CoalitionClusterer(significance_share=0.01)
+    assert as_sets(clusterer.cluster([(A, B, 5)], {A: 100, B: 200}, [])) == [[A, B]]
+
+
+def test_count_pairs_matches_rollup_semantics():
+    kills = [
+        (C, [A, A, B]),      # A (2 pilots) and B kill C
+        (C, [A, B]),
+        (A, [B, B, B]),      # B kills A
+        (None, [A, 0, B]),   # Victim without alliance, attacker without alliance
+    ]
+    pairs, activity, conflicts = count_pairs(kills, min_fights_together=1, min_activity=1)
+    assert pairs == [(A, B, 3)]
+    assert activity == {A: 4 + 1, B: 6, C: 2}
+    assert sorted(conflicts) == [(A, C, 3), (B, A, 3), (B, C, 2)]
+
+
+def test_count_pairs_filters():
+    kills = [(C, [A, B])] * 5 + [(D, [A])]
+    pairs, activity, conflicts = count_pairs(kills, min_fights_together=5, min_activity=6)
+    assert pairs == [(A, B, 5)]
+    assert activity == {A: 6}
+    assert conflicts == [(A, C, 5), (B, C, 5)]
@@ -0,0 +1,106 @@
+"""
+Test suite for the hourly combat rollups
+"""
+
+from datetime import datetime
+
+from services.combat_rollup_service import (
+    get_alliance_totals,
+    get_war_matchup,
+    hour_ranges,
+    is_consistent,
+    split_range,
+)
+
+
+ALLIANCE_A, ALLIANCE_B = 99000001, 99000002
+
+
+class FakeCursor:
+    """Cursor returning canned rows and recording the executed queries"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, sql, params=None):
+        self.queries.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0]
+
+
+def h(day, hour):
+    return datetime(2026, 1, day, hour)
+
+
+def test_hour_ranges_merges_contiguous_hours():
+    hours = [h(1, 3), h(1, 1), h(1, 2), h(1, 2), h(1, 6), h(2, 0), h(1, 23)]
+    assert hour_ranges(hours) == [
+        (h(1, 1), h(1, 4)),
+        (h(1, 6), h(1, 7)),
+        (h(1, 23), h(2, 1)),
+    ]
+
+
+def test_hour_ranges_empty():
+    assert hour_ranges([]) == []
+
+
+def test_split_range_chunks():
+    assert split_range(h(1, 0), h(2, 6), 12) == [
+        (h(1, 0), h(1, 12)),
+        (h(1, 12), h(2, 0)),
+        (h(2, 0), h(2, 6)),
+    ]
+    assert split_range(h(1, 0), h(1, 0), 12) == []
+
+
+def test_is_consistent():
+    ok = {"t": {"expected": 5, "missing": 0, "unexpected": 0}}
+    assert is_consistent(ok)
+    assert not is_consistent({**ok, "u": {"expected": 5, "missing": 1, "unexpected": 0}})
+    assert not is_consistent({**ok, "u": {"expected": 5, "missing": 0, "unexpected": 2}})
+
+
+def test_war_matchup_aggregates_both_sides():
+    # victim, system, ship_class, kills, isk, max_value, max_type
+    cur = FakeCursor([
+        (ALLIANCE_A, 30000001, "battleship", 3, 600, 300, 641),
+        (ALLIANCE_A, 30000002, "capital", 1, 2000, 2000, 23757),
+        (ALLIANCE_B, 30000001, "frigate", 5, 50, 20, 587),
+        (ALLIANCE_B, 30000003, "mystery", 1, 10, 10, 1),
+    ])
+
+    matchup = get_war_matchup(cur, ALLIANCE_A, ALLIANCE_B, days=7)
+
+    assert (matchup["losses_a"], matchup["isk_lost_a"]) == (4, 2600)
+    assert (matchup["losses_b"], matchup["isk_lost_b"]) == (6, 60)
+    assert matchup["ship_classes_a"]["battleship"] == 3
+    assert matchup["ship_classes_a"]["capital"] == 1
+    assert matchup["ship_classes_b"]["frigate"] == 5
+    assert matchup["ship_classes_b"]["mystery"] == 1
+    assert matchup["biggest_loss_a"] == {"ship_type_id": 23757, "value": 2000}
+    assert matchup["biggest_loss_b"] == {"ship_type_id": 587, "value": 20}
+    assert matchup["system_kills"] == [(30000001, 8), (30000002, 1), (30000003, 1)]
+    assert cur.queries[0][1] == (7, ALLIANCE_A, ALLIANCE_B, ALLIANCE_B, ALLIANCE_A)
+
+
+def test_war_matchup_without_kills():
+    matchup = get_war_matchup(FakeCursor([]), ALLIANCE_A, ALLIANCE_B, days=7)
+
+    assert matchup["losses_a"] == matchup["losses_b"] == 0
+    assert matchup["biggest_loss_a"] == {"ship_type_id": None, "value": 0}
+    assert matchup["system_kills"] == []
+
+
+def test_alliance_totals():
+    cur = FakeCursor([(12, 3400, 5, 900)])
+
+    totals = get_alliance_totals(cur, (ALLIANCE_A, ALLIANCE_B), days=7)
+
+    assert totals == {"total_kills": 12, "isk_destroyed": 3400, "total_losses": 5, "isk_lost": 900}
+    assert cur.queries[0][1] == (7, [ALLIANCE_A, ALLIANCE_B])
@@ -0,0 +1,179 @@
+"""
+Test suite for the staged RedisQ -> ESI -> DB/Redis kill pipeline
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from services.zkillboard.kill_pipeline import KillPipeline
+from services.zkillboard.redisq_client import RedisQPackage, RedisQResponse
+
+
+JITA, AMARR = 30000142, 30002187
+
+
+def package(killmail_id, system=JITA, prefetched=False):
+    killmail = {"killmail_id": killmail_id, "solar_system_id": system,
+                "killmail_time": "2026-01-01T12:00:00Z"}
+    return RedisQPackage(killmail_id, f"hash{killmail_id}", {"totalValue": 1.0},
+                         killmail if prefetched else None)
+
+
+class FakeRedisQ:
+    """Hands out the given packages, then stops the pipeline once drained"""
+
+    def __init__(self, packages):
+        self.packages = list(packages)
+        self.pipeline = None
+        self.stopped = False
+
+    async def poll_with_retry(self):
+        await asyncio.sleep(0)
+        if self.packages:
+            return RedisQResponse(self.packages.pop(0), has_data=True)
+        self.pipeline.stop()
+        return RedisQResponse(None, has_data=False)
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeLiveService:
+    """
+    Records the order kills reach the store stage; results maps a
+    killmail id to the writer outcome (battle_id / 0 / None / exception)
+    """
+
+    def __init__(self, claimed=(), esi_delays=None, esi_missing=(), results=None, hold=False):
+        self.claimed = set(claimed)
+        self.esi_delays = esi_delays or {}
+        self.esi_missing = set(esi_missing)
+        self.results = results or {}
+        self.hold = hold
+        self.esi_calls = []
+        self.processed = []
+        self.futures = {}
+        self.kill_writer = SimpleNamespace(queue_depth=0)
+        self.redis_client = SimpleNamespace(setex=lambda key, ttl, value: None)
+
+    def claim_kill(self, killmail_id):
+        if killmail_id in self.claimed:
+            return False
+        self.claimed.add(killmail_id)
+        return True
+
+    async def fetch_killmail_from_esi(self, killmail_id, killmail_hash):
+        self.esi_calls.append(killmail_id)
+        await asyncio.sleep(self.esi_delays.get(killmail_id, 0))
+        if killmail_id in self.esi_missing:
+            return None
+        return package(killmail_id, system=AMARR if killmail_id >= 100 else JITA, prefetched=True).killmail
+
+    async def process_fetched_kill(self, killmail, zkb):
+        killmail_id = killmail["killmail_id"]
+        self.processed.append(killmail_id)
+        future = asyncio.get_running_loop().create_future()
+        self.futures[killmail_id] = future
+        if not self.hold:
+            self.resolve(killmail_id)
+        return future
+
+    def resolve(self, killmail_id):
+        result = self.results.get(killmail_id, 0)
+        if isinstance(result, Exception):
+            self.futures[killmail_id].set_exception(result)
+        else:
+            self.futures[killmail_id].set_result(result)
+
+    async def drain(self):
+        await asyncio.sleep(0)
+
+
+def make_pipeline(live_service, packages, **kwargs):
+    redisq = FakeRedisQ(packages)
+    pipeline = KillPipeline(live_service, redisq, **kwargs)
+    redisq.pipeline = pipeline
+    return pipeline
+
+
+async def run(pipeline):
+    await asyncio.wait_for(pipeline.run(), timeout=2)
+    await asyncio.sleep(0)  # Let the last store callbacks run
+
+
+async def test_kills_of_a_system_are_stored_in_poll_order():
+    # Later kills come back from ESI first
+    live = FakeLiveService(esi_delays={1: 0.03, 2: 0.02, 3: 0.01, 100: 0.0})
+    pipeline = make_pipeline(live, [package(1), package(100), package(2), package(3)],
+                             esi_concurrency=4, db_workers=2)
+    assert not pipeline.running
+
+    await run(pipeline)
+
+    assert [k for k in live.processed if k < 100] == [1, 2, 3]
+    assert not pipeline.running and pipeline.redisq_client.stopped
+    stats = pipeline.stats()
+    assert (stats["polled"], stats["esi_fetched"], stats["stored"]) == (4, 4, 4)
+    assert stats["in_flight"] == 0 and stats["reorder_buffer"] == 0
+
+
+async def test_claimed_prefetched_and_missing_kills():
+    live = FakeLiveService(claimed={2}, esi_missing={3})
+    pipeline = make_pipeline(live, [package(1, prefetched=True), package(2), package(3), package(4)])
+
+    await run(pipeline)
+
+    assert live.esi_calls == [3, 4]
+    assert live.processed == [1, 4]
+    stats = pipeline.stats()
+    assert stats["already_processed"] == 1
+    assert (stats["prefetched"], stats["esi_fetched"], stats["esi_failed"]) == (1, 1, 1)
+    assert stats["in_flight"] == 0
+
+
+async def test_write_outcomes_are_counted_separately():
+    live = FakeLiveService(results={1: 42, 2: None, 3: RuntimeError("db down")})
+    pipeline = make_pipeline(live, [package(i) for i in (1, 2, 3, 4)])
+
+    await run(pipeline)
+
+    stats = pipeline.stats()
+    assert (stats["queued"], stats["stored"], stats["duplicates"], stats["errors"]) == (4, 2, 1, 1)
+    assert stats["in_flight"] == 0
+    assert stats["poll_to_stored_lag"]["max"] is not None
+
+
+async def test_poll_waits_while_the_window_is_full():
+    live = FakeLiveService(hold=True)
+    pipeline = make_pipeline(live, [package(i) for i in (1, 2, 3, 4)], max_in_flight=2)
+    task = asyncio.create_task(pipeline.run())
+
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert pipeline.running
+    stats = pipeline.stats()
+    assert live.processed == [1, 2]
+    assert stats["in_flight"] == 2 and stats["backpressure"]
+    assert stats["polled"] == 3  # Kill 3 waits for a slot
+
+    live.resolve(1)
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert live.processed == [1, 2, 3]
+
+    for killmail_id in (2, 3, 4):
+        while killmail_id not in live.futures:
+            await asyncio.sleep(0)
+        live.resolve(killmail_id)
+    await asyncio.wait_for(task, timeout=2)
+    assert pipeline.stats()["stored"] == 4
+
+
+async def test_failed_writes_free_their_slots():
+    live = FakeLiveService(results={1: RuntimeError("db down"), 2: RuntimeError("db down")})
+    pipeline = make_pipeline(live, [package(1), package(2), package(3)], max_in_flight=1)
+
+    await run(pipeline)
+
+    assert live.processed == [1, 2, 3]
+    assert pipeline.stats()["errors"] == 2
@@ -0,0 +1,201 @@
+"""
+Test suite for the sliding 24h kill window
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services.zkillboard.kill_window import (
+    BUCKET_SECONDS,
+    KEY_PREFIX,
+    TOP_KILLS_PER_BUCKET,
+    WINDOW_HOURS,
+    KillWindow,
+    bucket_of,
+    killmail_hour,
+)
+from src.services.sde import ship_class_for_group
+from src.services.sde.lookup import SDELookup
+from tests.fixtures.fake_redis import FakeRedis
+
+
+JITA, AMARR, ONE_DQ = 30000142, 30002187, 30004759
+FORGE, DOMAIN, DELVE = 10000002, 10000043, 10000060
+RIFTER, EREBUS, CHARON, BADGER, TRITANIUM = 587, 671, 20185, 648, 34
+
+SDE = SDELookup.from_rows(
+    [(RIFTER, 'Rifter', 25, 27289.0), (EREBUS, 'Erebus', 30, 1e7),
+     (CHARON, 'Charon', 513, 1e6), (BADGER, 'Badger', 28, 1e5), (TRITANIUM, 'Tritanium', 18, 0.01)],
+    [(25, 'Frigate', 6), (30, 'Titan', 6), (513, 'Freighter', 6), (28, 'Industrial', 6), (18, 'Mineral', 4)],
+    [(JITA, 'Jita', FORGE, 0.9459), (AMARR, 'Amarr', DOMAIN, 1.0), (ONE_DQ, '1DQ1-A', DELVE, -0.3848)],
+    [(FORGE, 'The Forge'), (DOMAIN, 'Domain'), (DELVE, 'Delve')],
+    [(6, 'Ship'), (4, 'Material')],
+)
+
+NOW = 500_000 * BUCKET_SECONDS + 1800
+SYSTEMS = {
+    JITA: {'system_name': 'Jita', 'region_name': 'The Forge', 'security_status': 0.9},
+    ONE_DQ: {'system_name': '1DQ1-A', 'region_name': 'Delve', 'security_status': -0.4},
+}
+
+
+def ship_category(group_id):
+    return ship_class_for_group(group_id)[0]
+
+
+def kill(killmail_id, ship=RIFTER, value=1e6, system=JITA, region=FORGE, hour=12, items=()):
+    return SimpleNamespace(
+        killmail_id=killmail_id,
+        killmail_time=f"2026-01-01T{hour:02d}:15:00Z",
+        solar_system_id=system,
+        region_id=region,
+        ship_type_id=ship,
+        ship_value=value,
+        victim_character_id=90000000 + killmail_id,
+        destroyed_items=[{'item_type_id': t, 'quantity': q} for t, q in items],
+    )
+
+
+@pytest.fixture(autouse=True)
+def sde():
+    with patch('services.zkillboard.kill_window.get_sde_lookup', return_value=SDE):
+        yield SDE
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis(now=NOW)
+
+
+@pytest.fixture
+def window(redis_client):
+    return KillWindow(redis_client)
+
+
+def test_killmail_hour():
+    assert killmail_hour("2026-01-01T07:59:59Z") == 7
+    assert killmail_hour("garbage") is None
+    assert killmail_hour(None) is None
+
+
+def test_totals_timeline_and_hot_zones(window):
+    window.record(kill(1, value=2e6, hour=12), timestamp=NOW)
+    window.record(kill(2, value=3e6, hour=12), timestamp=NOW - 3600)
+    window.record(kill(3, value=5e6, hour=3, system=AMARR, region=DOMAIN), timestamp=NOW - 7200)
+
+    snapshot = window.snapshot(now=NOW)
+
+    assert snapshot.buckets == 3
+    assert snapshot.total_kills == 3
+    assert snapshot.total_isk == 10e6
+
+    timeline = snapshot.timeline_section()
+    assert len(timeline) == 24
+    assert timeline[12] == {'hour_utc': 12, 'kills': 2, 'isk_destroyed': 5e6}
+    assert timeline[3]['kills'] == 1 and timeline[0]['kills'] == 0
+
+    hot_zones = snapshot.hot_zones(SYSTEMS)
+    assert [z['system_id'] for z in hot_zones] == [JITA, AMARR]
+    assert hot_zones[0]['dominant_ship_type'] == 'Rifter'
+    assert hot_zones[1]['system_name'] == 'Unknown'
+
+
+def test_capitals(window):
+    window.record(kill(1, ship=EREBUS, value=100e9, system=ONE_DQ, region=DELVE), timestamp=NOW)
+    window.record(kill(2, ship=EREBUS, value=80e9, system=ONE_DQ, region=DELVE), timestamp=NOW - 3600)
+    window.record(kill(3), timestamp=NOW)
+
+    capitals = window.snapshot(now=NOW).capital_section(SYSTEMS)
+
+    assert capitals['titans']['count'] == 2
+    assert capitals['titans']['total_isk'] == 180e9
+    assert [k['killmail_id'] for k in capitals['titans']['kills']] == [1, 2]
+    assert capitals['titans']['kills'][0]['ship_name'] == 'Erebus'
+    assert capitals['titans']['kills'][0]['system_name'] == '1DQ1-A'
+    assert capitals['carriers'] == {'count': 0, 'total_isk': 0, 'kills': []}
+
+
+def test_haulers_and_danger_zones(window):
+    for i in range(3):
+        window.record(kill(i, ship=CHARON, value=5e9), timestamp=NOW - i * 3600)
+    window.record(kill(10, ship=BADGER, value=1e8), timestamp=NOW)
+    window.record(kill(11, ship=BADGER, value=1e8, system=AMARR, region=DOMAIN), timestamp=NOW)
+
+    snapshot = window.snapshot(now=NOW)
+
+    assert snapshot.haulers[JITA] == {'industrials': 1, 'freighters': 3, 'isk': 15.1e9}
+    zones = snapshot.danger_zones(SYSTEMS)
+    assert len(zones) == 1  # Amarr is below min_kills
+    assert zones[0]['system_name'] == 'Jita'
+    assert (zones[0]['freighters_killed'], zones[0]['industrials_killed']) == (3, 1)
+    assert zones[0]['warning_level'] == 'MODERATE'
+
+
+def test_ship_breakdown(window):
+    window.record(kill(1, ship=RIFTER, value=1e6), timestamp=NOW)
+    window.record(kill(2, ship=RIFTER, value=2e6), timestamp=NOW - 3600)
+    window.record(kill(3, ship=CHARON, value=5e9), timestamp=NOW)
+
+    breakdown = window.snapshot(now=NOW).ship_breakdown(ship_category)
+
+    assert list(breakdown) == ['freighter', 'frigate']
+    assert breakdown['frigate'] == {'count': 2, 'total_isk': 3e6}
+
+
+def test_battle_regions(window):
+    window.record(kill(1, items=[(TRITANIUM, 100)]), timestamp=NOW)
+    window.record(kill(2, items=[(TRITANIUM, 50)]), timestamp=NOW - 3600)
+    window.record(kill(3, ship=CHARON, value=5e9), timestamp=NOW)
+    window.record(kill(4, ship=EREBUS, value=100e9, system=ONE_DQ, region=DELVE), timestamp=NOW)
+    window.record(kill(5, region=None), timestamp=NOW)  # No region: counted in totals only
+
+    snapshot = window.snapshot(now=NOW)
+    regions = snapshot.battle_regions()
+
+    assert snapshot.total_kills == 5
+    assert [r['region_id'] for r in regions] == [FORGE, DELVE]
+    forge = regions[0]
+    assert forge['region_name'] == 'The Forge'
+    assert forge['kills'] == 3
+    assert forge['avg_kill_value'] == pytest.approx((1e6 + 1e6 + 5e9) / 3)
+    assert forge['top_systems'] == [{'system_id': JITA, 'system_name': 'Jita', 'kills': 3}]
+    assert forge['top_ships'][0] == {'ship_type_id': RIFTER, 'ship_name': 'Rifter', 'losses': 2}
+    assert forge['top_destroyed_items'] == [
+        {'item_type_id': TRITANIUM, 'item_name': 'Tritanium', 'quantity_destroyed': 150}
+    ]
+
+
+def test_buckets_outside_the_window_are_ignored_and_expire(window, redis_client):
+    old = NOW - WINDOW_HOURS * BUCKET_SECONDS
+    window.record(kill(1, value=9e9), timestamp=old)
+    window.record(kill(2, value=1e6), timestamp=NOW)
+
+    assert window.window_buckets(now=NOW)[0] == bucket_of(old) + 1
+    snapshot = window.snapshot(now=NOW)
+    assert (snapshot.total_kills, snapshot.total_isk, snapshot.buckets) == (1, 1e6, 1)
+
+    # Every key of the old bucket expires on its own, no cleanup job needed
+    old_keys = [key for key in redis_client.data if key.startswith(f"{KEY_PREFIX}:{bucket_of(old)}:")]
+    assert old_keys
+    redis_client.now = (bucket_of(old) + 1) * BUCKET_SECONDS + (WINDOW_HOURS + 1) * BUCKET_SECONDS
+    assert not any(redis_client.exists(key) for key in old_keys)
+    assert redis_client.exists(f"{KEY_PREFIX}:{bucket_of(NOW)}:totals")
+
+
+def test_top_kills_are_capped_per_bucket_and_merged_exactly(window, redis_client):
+    # Even values in one bucket, odd values in the previous one
+    for i in range(TOP_KILLS_PER_BUCKET + 5):
+        window.record(kill(i, value=float(2 * i)), timestamp=NOW)
+        window.record(kill(100 + i, value=float(2 * i + 1)), timestamp=NOW - 3600)
+
+    assert len(redis_client.zrange(f"{KEY_PREFIX}:{bucket_of(NOW)}:top_kills", 0, -1)) == TOP_KILLS_PER_BUCKET
+
+    top = window.snapshot(now=NOW).high_value_kills(SYSTEMS, ship_category, limit=TOP_KILLS_PER_BUCKET)
+
+    expected = sorted((float(v) for v in range(2 * (TOP_KILLS_PER_BUCKET + 5))), reverse=True)
+    assert [k['isk_destroyed'] for k in top] == expected[:TOP_KILLS_PER_BUCKET]
+    assert [k['rank'] for k in top] == list(range(1, TOP_KILLS_PER_BUCKET + 1))
+    assert top[0]['ship_type'] == 'frigate'
+    assert top[0]['is_gank'] is False  # Below the 1B gank threshold
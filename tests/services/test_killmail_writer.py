@@ -0,0 +1,178 @@
+"""
+Test suite for the write-behind killmail batch writer
+"""
+
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+
+from services.zkillboard import killmail_writer
+from services.zkillboard.killmail_writer import (
+    INSERT_ATTACKERS_SQL,
+    INSERT_ITEMS_SQL,
+    INSERT_KILLMAILS_SQL,
+    KillmailBatchWriter,
+    KillmailRecord,
+    write_killmails,
+)
+
+
+JITA, AMARR = 30000142, 30002187
+
+
+def record(killmail_id, system=JITA, items=((34, 10, True),), attackers=((1, 2, None, 587, 3, 100, True),)):
+    return KillmailRecord(killmail_id, system, (killmail_id,), list(items), list(attackers))
+
+
+class FakeDB:
+    """
+    Postgres stand-in for write_killmails(): killmails conflict on id,
+    active battles are looked up per system and nothing is kept unless the
+    transaction commits
+    """
+
+    def __init__(self, existing=(), battles=None, bad_ids=()):
+        self.killmails = set(existing)
+        self.battles = battles or {}
+        self.bad_ids = set(bad_ids)
+        self.items = []
+        self.attackers = []
+        self.statements = []
+        self.inserts = []  # killmail ids per INSERT attempt
+        self.commits = 0
+
+    def execute_values(self, cur, sql, rows, template=None, page_size=None, fetch=False):
+        if sql == INSERT_KILLMAILS_SQL:
+            ids = [row[0] for row in rows]
+            self.inserts.append(ids)
+            if self.bad_ids & set(ids):
+                raise ValueError(f"bad killmail in {ids}")
+            cur.pending_kills.extend(i for i in ids if i not in self.killmails)
+            return [(row[0], self.battles.get(row[-1])) for row in rows if row[0] not in self.killmails]
+        if sql == INSERT_ITEMS_SQL:
+            cur.pending_items.extend(rows)
+        elif sql == INSERT_ATTACKERS_SQL:
+            cur.pending_attackers.extend(rows)
+
+    @contextmanager
+    def connection(self):
+        yield FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+        self.cur = FakeCursor(db)
+
+    @contextmanager
+    def cursor(self):
+        yield self.cur
+
+    def commit(self):
+        self.db.commits += 1
+        self.db.killmails.update(self.cur.pending_kills)
+        self.db.items.extend(self.cur.pending_items)
+        self.db.attackers.extend(self.cur.pending_attackers)
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.pending_kills = []
+        self.pending_items = []
+        self.pending_attackers = []
+
+    def execute(self, sql, params=None):
+        self.db.statements.append((" ".join(sql.split()), params))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeDB(existing={1}, battles={AMARR: 77})
+    monkeypatch.setattr(killmail_writer, "get_db_connection", db.connection)
+    monkeypatch.setattr(killmail_writer, "execute_values", db.execute_values)
+    return db
+
+
+class TestWriteKillmails:
+    def test_result_per_record(self, db):
+        results = write_killmails([record(1), record(2), record(3, system=AMARR), record(2)])
+
+        # Duplicate in the DB, stored without battle, stored in battle, repeated in the batch
+        assert results == [None, 0, 77, None]
+        assert db.inserts == [[1, 2, 3]]
+        assert db.killmails == {1, 2, 3}
+        assert [row[0] for row in db.items] == [2, 3]
+        assert [row[0] for row in db.attackers] == [2, 3]
+
+    def test_touched_battles_are_refreshed_once(self, db):
+        write_killmails([record(2, system=AMARR), record(3, system=AMARR), record(4)])
+
+        assert db.statements[0][1] == ([77],)
+        assert db.statements[1:] == [("SELECT refresh_battle_stats(%s)", (77,))]
+
+    def test_empty_batch_skips_the_database(self, db):
+        assert write_killmails([]) == []
+        assert db.commits == 0
+
+    def test_failure_rolls_back_the_whole_batch(self, db):
+        db.bad_ids = {3}
+        with pytest.raises(ValueError):
+            write_killmails([record(2), record(3)])
+        assert db.killmails == {1} and db.items == []
+
+
+async def wait(futures):
+    return await asyncio.wait_for(asyncio.gather(*futures), timeout=2)
+
+
+class TestBatchWriter:
+    async def test_size_trigger_flushes_a_full_batch(self, db):
+        writer = KillmailBatchWriter(max_batch=3, max_wait_ms=500)
+
+        assert await wait([writer.submit(record(i)) for i in (1, 2, 3)]) == [None, 0, 0]
+        stats = writer.stats()
+        assert (stats["batches"], stats["kills_stored"], stats["duplicates"]) == (1, 2, 1)
+        assert stats["last_batch_size"] == 3
+        assert stats["last_wait_ms"] < 500
+
+        # A lone kill waits for the timer; close() writes it
+        straggler = writer.submit(record(4))
+        await asyncio.sleep(0.05)
+        assert writer.queue_depth == 1 and not straggler.done()
+        await writer.close()
+        assert await straggler == 0
+        assert db.inserts == [[1, 2, 3], [4]]
+
+    async def test_time_trigger_flushes_a_partial_batch(self, db):
+        writer = KillmailBatchWriter(max_batch=50, max_wait_ms=20)
+
+        futures = [writer.submit(record(i, system=AMARR)) for i in (2, 3)]
+        assert await wait(futures) == [77, 77]
+        assert db.inserts == [[2, 3]]
+        assert writer.stats()["last_wait_ms"] >= 20
+
+    async def test_bad_kill_is_retried_alone_and_fails_its_future(self, db):
+        db.bad_ids = {3}
+        flushed = []
+        writer = KillmailBatchWriter(max_batch=3, on_flush=flushed.append)
+
+        futures = [writer.submit(record(i)) for i in (1, 2, 3)]
+        results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), timeout=2)
+
+        assert results[:2] == [None, 0]
+        assert isinstance(results[2], ValueError)
+        assert db.inserts == [[1, 2, 3], [1], [2], [3]]
+        assert db.killmails == {1, 2}
+        # The lost kill is an error, not a duplicate
+        assert (flushed[-1]["kills_stored"], flushed[-1]["duplicates"], flushed[-1]["errors"]) == (1, 1, 1)
+
+    async def test_failed_single_kill_batch_is_not_retried(self, db):
+        db.bad_ids = {2}
+        writer = KillmailBatchWriter(max_batch=1)
+
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(writer.submit(record(2)), timeout=2)
+        assert db.inserts == [[2]]
+        assert (writer.stats()["duplicates"], writer.stats()["errors"]) == (0, 1)
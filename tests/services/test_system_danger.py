@@ -0,0 +1,162 @@
+"""
+Test suite for the per-system danger summaries
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services.zkillboard.live.statistics import StatisticsMixin
+from services.zkillboard.system_danger import (
+    BUCKET_SECONDS,
+    DANGER_TTL,
+    RECENT_KILLS,
+    SystemDangerTracker,
+    danger_key,
+    recent_key,
+)
+from src.services.sde.lookup import SDELookup
+from tests.fixtures.fake_redis import FakeRedis
+
+
+JITA = 30000142
+RIFTER, SABRE = 587, 22456
+
+SDE = SDELookup.from_rows(
+    [(RIFTER, 'Rifter', 25, 27289.0), (SABRE, 'Sabre', 541, 43000.0)],
+    [(25, 'Frigate', 6), (541, 'Interdictor', 6)],
+    [(JITA, 'Jita', 10000002, 0.9459)],
+    [(10000002, 'The Forge')],
+    [(6, 'Ship')],
+)
+
+NOW = (int(time.time()) // BUCKET_SECONDS) * BUCKET_SECONDS + 1800
+
+
+def kill(killmail_id, value=1_000_000.0, attackers=1, corp=None, attacker_ships=(RIFTER,), ship=RIFTER):
+    return SimpleNamespace(
+        killmail_id=killmail_id,
+        killmail_time="2026-01-01T12:00:00Z",
+        solar_system_id=JITA,
+        ship_type_id=ship,
+        ship_value=value,
+        attacker_count=attackers,
+        victim_corporation_id=corp if corp is not None else 98000000 + killmail_id,
+        attacker_ship_types=list(attacker_ships),
+    )
+
+
+@pytest.fixture(autouse=True)
+def sde():
+    with patch('services.zkillboard.system_danger.get_sde_lookup', return_value=SDE), \
+            patch('services.zkillboard.live.statistics.get_sde_lookup', return_value=SDE):
+        yield SDE
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis(now=NOW)
+
+
+@pytest.fixture
+def tracker(redis_client):
+    return SystemDangerTracker(redis_client)
+
+
+class TestRecord:
+    def test_counters_and_summary(self, tracker, redis_client):
+        tracker.record(kill(1, value=5e6, attackers=6, attacker_ships=(SABRE, RIFTER, SABRE)), timestamp=NOW)
+
+        counters = redis_client.hgetall(danger_key(JITA))
+        bucket = NOW // BUCKET_SECONDS
+        assert counters == {f"{bucket}:kills": "1", f"{bucket}:isk": "5000000.0", f"{bucket}:multi": "1"}
+        assert redis_client.ttl(danger_key(JITA)) == DANGER_TTL
+
+        danger = tracker.read([JITA], now=NOW)[JITA]
+        assert danger.recent[0]['bucket'] == bucket
+        assert danger.recent[0]['attacker_groups'] == [25, 541]
+
+    def test_recent_list_is_capped(self, tracker, redis_client):
+        for killmail_id in range(RECENT_KILLS + 5):
+            tracker.record(kill(killmail_id), timestamp=NOW)
+
+        recent = tracker.read([JITA], now=NOW)[JITA].recent
+        assert len(recent) == RECENT_KILLS
+        assert recent[0]['killmail_id'] == RECENT_KILLS + 4
+
+    def test_prunes_buckets_that_left_the_window(self, tracker, redis_client):
+        tracker.record(kill(1), timestamp=NOW - 30 * 3600)
+        tracker.record(kill(2), timestamp=NOW - 2 * 3600)
+        old_bucket = (NOW - 30 * 3600) // BUCKET_SECONDS
+
+        tracker.record(kill(3), timestamp=NOW)
+
+        buckets = {name.split(":")[0] for name in redis_client.hgetall(danger_key(JITA))}
+        assert str(old_bucket) not in buckets
+        assert buckets == {str((NOW - 2 * 3600) // BUCKET_SECONDS), str(NOW // BUCKET_SECONDS)}
+
+
+class TestRead:
+    def test_window_cutoff_applies_to_counters_and_recent_kills(self, tracker, redis_client):
+        tracker.record(kill(1, value=9e9), timestamp=NOW - 23 * 3600)
+        tracker.record(kill(2, value=2e6), timestamp=NOW)
+
+        # 2h later the first kill is outside the window, though both keys live on
+        redis_client.now = NOW + 2 * 3600
+        danger = tracker.read([JITA], now=NOW + 2 * 3600)[JITA]
+
+        assert redis_client.exists(recent_key(JITA))
+        assert danger.kills == 1
+        assert danger.isk_destroyed == 2e6
+        assert [k['killmail_id'] for k in danger.recent] == [2]
+
+    def test_steady_trickle_does_not_keep_stale_kills(self, tracker, redis_client):
+        # One kill a day refreshes the TTL of the recent list every time
+        for day in range(4):
+            redis_client.now = NOW + day * 86400
+            tracker.record(kill(day), timestamp=NOW + day * 86400)
+
+        recent = tracker.read([JITA], now=NOW + 3 * 86400)[JITA].recent
+        assert [k['killmail_id'] for k in recent] == [3]
+
+    def test_unknown_system_is_empty(self, tracker):
+        danger = tracker.read([JITA, JITA], now=NOW)
+        assert list(danger) == [JITA]
+        assert danger[JITA].kills == 0 and danger[JITA].recent == []
+
+
+class Stats(StatisticsMixin):
+    def __init__(self, system_danger):
+        self.system_danger = system_danger
+
+
+class TestGateCampInputs:
+    def camp(self, tracker, timestamp, first_id=0):
+        for i in range(5):
+            tracker.record(
+                kill(first_id + i, value=(i + 1) * 1e7, attackers=8, attacker_ships=(SABRE,)),
+                timestamp=timestamp + i * 60,
+            )
+
+    def test_fresh_camp_is_detected(self, tracker, redis_client):
+        now = time.time()
+        redis_client.now = now
+        self.camp(tracker, now - 600)
+
+        is_camp, confidence, indicators = Stats(tracker).detect_gate_camp(JITA)
+
+        assert is_camp
+        assert "Multi-attacker pattern" in indicators
+        assert confidence >= 50
+
+    def test_old_camp_is_ignored_after_a_single_new_kill(self, tracker, redis_client):
+        now = time.time()
+        self.camp(tracker, now - 2 * 86400)
+        redis_client.now = now
+        tracker.record(kill(99, value=1e6), timestamp=now)
+
+        stats = Stats(tracker)
+        assert stats.detect_gate_camp(JITA) == (False, 0.0, [])
+        assert [s['value'] for s in stats.get_top_expensive_ships(JITA)] == [1e6]
@@ -0,0 +1,79 @@
+"""
+Test suite for the SDE-backed BOM cache
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.services.production import bom_cache as bom_cache_module
+from src.services.production.bom_cache import BOMCache, BlueprintProduct, Material, TypeInfo
+
+
+RIFTER_BP = BlueprintProduct(691, 587, 1, 1)
+FULLERIDE_FORMULA = BlueprintProduct(46166, 16679, 11, 10000)
+
+
+@pytest.fixture
+def version():
+    with patch.object(bom_cache_module, 'fetch_sde_version', return_value=(1, 100)) as fetch:
+        yield fetch
+
+
+@pytest.fixture
+def cache(version):
+    return BOMCache(max_entries=3)
+
+
+class TestBOMCache:
+    def test_read_through_counts_hits_and_misses(self, cache):
+        with patch.object(BOMCache, '_load_blueprints', return_value=(RIFTER_BP,)) as loader:
+            assert cache.blueprint_for_product(587) == RIFTER_BP
+            assert cache.blueprint_for_product(587) == RIFTER_BP
+        loader.assert_called_once_with(587)
+
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['by_kind']['product'] == {'hits': 1, 'misses': 1}
+
+    def test_activity_filter(self, cache):
+        with patch.object(BOMCache, '_load_blueprints', return_value=(FULLERIDE_FORMULA,)):
+            assert cache.blueprint_for_product(16679) is None
+            assert cache.blueprint_for_product(16679, (1, 11)) == FULLERIDE_FORMULA
+            assert cache.has_blueprint(16679)
+
+    def test_negative_lookups_are_cached(self, cache):
+        with patch.object(BOMCache, '_load_type', return_value=None) as loader:
+            assert cache.type_info(999999) is None
+            assert cache.type_info(999999) is None
+        loader.assert_called_once()
+
+    def test_lru_eviction(self, cache):
+        with patch.object(BOMCache, '_load_type', side_effect=lambda t: TypeInfo(t, str(t), 18, 0.01)) as loader:
+            for type_id in (34, 35, 36):
+                cache.type_info(type_id)
+            cache.type_info(34)          # 35 is now least recently used
+            cache.type_info(37)          # evicts 35
+            cache.type_info(34)
+            cache.type_info(35)          # reloaded
+        assert loader.call_count == 5
+        assert cache.stats()['evictions'] == 2
+
+    def test_sde_version_change_drops_entries(self, cache, version):
+        cache.version_check_interval = 0
+        with patch.object(BOMCache, '_load_materials', return_value=(Material(34, 32000, 'Tritanium', 0.01),)) as loader:
+            cache.materials(691)
+            cache.materials(691)
+            version.return_value = (2, 100)
+            cache.materials(691)
+        assert loader.call_count == 2
+        assert cache.stats()['invalidations'] == 1
+        assert cache.stats()['sde_version'] == [2, 100]
+
+    def test_invalidate(self, cache):
+        with patch.object(BOMCache, '_load_type', return_value=TypeInfo(34, 'Tritanium', 18, 0.01)) as loader:
+            cache.type_info(34)
+            cache.invalidate()
+            cache.type_info(34)
+        assert loader.call_count == 2
+        assert cache.stats()['entries'] == 1
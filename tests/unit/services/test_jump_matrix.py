@@ -0,0 +1,114 @@
+"""
+Test suite for the precomputed jump matrix
+"""
+
+import pytest
+
+from src.services.route.jump_matrix import JumpMatrix, profile_for, graph_fingerprint
+
+
+# Same topology as the route service tests:
+#   1 (hs 1.0) -- 2 (hs 0.8) -- 3 (ls 0.4) -- 4 (ns -0.2)
+#                  |            |
+#                  5 (hs 0.6)  6 (hs 0.9)
+#                  |
+#                  7 (hs 0.7) -- 8 (hs 1.0)
+#                                |
+#                                9 (ls 0.3) -- 10 (ns -0.5)
+TEST_SYSTEMS = {
+    1: {'name': 'Jita', 'security': 1.0, 'region_id': 1},
+    2: {'name': 'Perimeter', 'security': 0.8, 'region_id': 1},
+    3: {'name': 'LowSecA', 'security': 0.4, 'region_id': 2},
+    4: {'name': 'NullSecA', 'security': -0.2, 'region_id': 2},
+    5: {'name': 'Amarr', 'security': 0.6, 'region_id': 1},
+    6: {'name': 'HighSecB', 'security': 0.9, 'region_id': 2},
+    7: {'name': 'Rens', 'security': 0.7, 'region_id': 1},
+    8: {'name': 'Dodixie', 'security': 1.0, 'region_id': 1},
+    9: {'name': 'LowSecB', 'security': 0.3, 'region_id': 2},
+    10: {'name': 'NullSecB', 'security': -0.5, 'region_id': 2},
+    11: {'name': 'J123456', 'security': -1.0, 'region_id': 3},  # Wormhole, no gates
+}
+
+TEST_GRAPH = {
+    1: [2],
+    2: [1, 3, 5],
+    3: [2, 4, 6],
+    4: [3],
+    5: [2, 7],
+    6: [3],
+    7: [5, 8],
+    8: [7, 9],
+    9: [8, 10],
+    10: [9],
+}
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    return JumpMatrix.build(TEST_SYSTEMS, TEST_GRAPH)
+
+
+class TestProfiles:
+    def test_profile_for_known_thresholds(self):
+        assert profile_for(0.5) == 'highsec'
+        assert profile_for(0.0) == 'no_nullsec'
+        assert profile_for(-1.0) == 'any'
+
+    def test_profile_for_custom_threshold(self):
+        assert profile_for(0.7) is None
+
+
+class TestLookups:
+    def test_same_system(self, matrix):
+        assert matrix.jumps(1, 1, 'highsec') == 0
+        assert matrix.path(1, 1, 'highsec') == [1]
+
+    def test_highsec_path(self, matrix):
+        assert matrix.path(1, 8, 'highsec') == [1, 2, 5, 7, 8]
+        assert matrix.jumps(1, 8, 'highsec') == 4
+
+    def test_highsec_blocks_lowsec(self, matrix):
+        assert matrix.jumps(1, 6, 'highsec') is None
+        assert matrix.path(1, 6, 'highsec') is None
+
+    def test_no_nullsec_allows_lowsec(self, matrix):
+        assert matrix.path(1, 6, 'no_nullsec') == [1, 2, 3, 6]
+        assert matrix.jumps(1, 4, 'no_nullsec') is None
+
+    def test_any_profile(self, matrix):
+        assert matrix.path(4, 10, 'any') == [4, 3, 2, 5, 7, 8, 9, 10]
+        assert matrix.jumps(4, 10, 'any') == 7
+
+    def test_start_system_is_not_filtered(self, matrix):
+        # Leaving lowsec is allowed, entering it is not
+        assert matrix.path(3, 1, 'highsec') == [3, 2, 1]
+        assert matrix.jumps(1, 3, 'highsec') is None
+
+    def test_system_without_gates(self, matrix):
+        assert not matrix.has_system(11)
+        assert matrix.jumps(1, 11, 'any') is None
+
+
+class TestPersistence:
+    def test_save_and_load_roundtrip(self, matrix, tmp_path):
+        matrix.save(str(tmp_path))
+        loaded = JumpMatrix.load(str(tmp_path), expected_fingerprint=matrix.fingerprint)
+
+        assert loaded is not None
+        assert loaded.path(1, 8, 'highsec') == [1, 2, 5, 7, 8]
+        assert loaded.jumps(4, 10, 'any') == 7
+
+    def test_load_rejects_stale_tables(self, matrix, tmp_path):
+        matrix.save(str(tmp_path))
+        changed = {**TEST_GRAPH, 1: [2, 8], 8: [7, 9, 1]}
+
+        assert JumpMatrix.load(str(tmp_path), graph_fingerprint(TEST_SYSTEMS, changed)) is None
+
+    def test_load_missing_directory(self, tmp_path):
+        assert JumpMatrix.load(str(tmp_path / 'missing')) is None
+
+    def test_load_or_build_persists(self, tmp_path):
+        matrix = JumpMatrix.load_or_build(TEST_SYSTEMS, TEST_GRAPH, str(tmp_path))
+
+        assert (tmp_path / 'meta.json').exists()
+        assert matrix.jumps(1, 8, 'highsec') == 4
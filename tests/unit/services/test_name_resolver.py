@@ -0,0 +1,187 @@
+"""
+Test suite for the bulk entity-name resolver
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.names import NameResolver, name_key
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.mget_calls = 0
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(k) for k in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.ops = []
+
+    def setex(self, *args):
+        self.ops.append(args)
+
+    def execute(self):
+        for args in self.ops:
+            self.client.setex(*args)
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class FakeESI:
+    """POST /universe/names/: 404 for the whole batch if any ID is unknown"""
+
+    def __init__(self, names, status=None, delay=0.0):
+        self.names = names
+        self.status = status
+        self.delay = delay
+        self.batches = []
+
+    def post(self, url, json, timeout):
+        assert url.endswith("/universe/names/")
+        self.batches.append(list(json))
+        time.sleep(self.delay)
+        if self.status:
+            return FakeResponse(self.status)
+        if any(i not in self.names for i in json):
+            return FakeResponse(404, {"error": "Ensure all IDs are valid before resolving."})
+        return FakeResponse(200, [{"id": i, "name": self.names[i], "category": "alliance"} for i in json])
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+def make_resolver(redis_client, esi, **kwargs):
+    return NameResolver(redis_client=redis_client, session=esi, **kwargs)
+
+
+def test_resolves_from_esi_and_fills_both_caches(redis_client):
+    esi = FakeESI({1: "Goonswarm Federation", 2: "Pandemic Horde"})
+    resolver = make_resolver(redis_client, esi)
+
+    assert resolver.get_names('alliance', [1, 2]) == {1: "Goonswarm Federation", 2: "Pandemic Horde"}
+    assert esi.batches == [[1, 2]]
+    assert redis_client.data[name_key('alliance', 1)] == "Goonswarm Federation"
+
+    # Second call is answered by the in-process LRU
+    assert resolver.get_name('alliance', 2) == "Pandemic Horde"
+    assert len(esi.batches) == 1
+    assert redis_client.mget_calls == 1
+
+
+def test_redis_hits_skip_esi(redis_client):
+    redis_client.data[name_key('corporation', 10)] = "Sniggerdly"
+    esi = FakeESI({})
+    resolver = make_resolver(redis_client, esi)
+
+    assert resolver.get_names('corporation', [10]) == {10: "Sniggerdly"}
+    assert esi.batches == []
+
+
+def test_batches_of_1000(redis_client):
+    ids = list(range(1, 2501))
+    esi = FakeESI({i: f"Alliance #{i}" for i in ids})
+    resolver = make_resolver(redis_client, esi)
+
+    names = resolver.resolve('alliance', ids)
+    assert len(names) == 2500
+    assert [len(b) for b in esi.batches] == [1000, 1000, 500]
+
+
+def test_unknown_ids_are_isolated_and_negative_cached(redis_client):
+    esi = FakeESI({1: "A", 2: "B", 4: "D"})
+    resolver = make_resolver(redis_client, esi, negative_ttl=60)
+
+    assert resolver.get_names('alliance', [1, 2, 3, 4]) == {1: "A", 2: "B", 3: "Alliance 3", 4: "D"}
+    assert redis_client.data[name_key('alliance', 3)] == ""
+    assert redis_client.ttls[name_key('alliance', 3)] == 60
+
+    calls = len(esi.batches)
+    assert resolver.resolve('alliance', [3]) == {3: None}
+    assert len(esi.batches) == calls
+
+    # Negative entries in Redis are honoured by a fresh process too
+    fresh = make_resolver(redis_client, esi)
+    assert fresh.resolve('alliance', [3]) == {3: None}
+    assert len(esi.batches) == calls
+
+
+def test_esi_errors_are_not_cached(redis_client):
+    esi = FakeESI({}, status=502)
+    resolver = make_resolver(redis_client, esi)
+
+    assert resolver.get_names('alliance', [7]) == {7: "Alliance 7"}
+    assert name_key('alliance', 7) not in redis_client.data
+
+    esi.status = None
+    esi.names[7] = "Recovered"
+    assert resolver.get_name('alliance', 7) == "Recovered"
+
+
+def test_concurrent_callers_share_one_fetch(redis_client):
+    esi = FakeESI({5: "Shared"}, delay=0.2)
+    resolver = make_resolver(redis_client, esi)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(resolver.get_name('alliance', 5)))
+               for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["Shared"] * 5
+    assert esi.batches == [[5]]
+
+
+def test_async_front_end(redis_client):
+    esi = FakeESI({1: "A", 2: "B"})
+    resolver = make_resolver(redis_client, esi)
+
+    async def run():
+        names = await resolver.aget_names('alliance', [1, 2])
+        single = await resolver.aget_name('alliance', 1)
+        return names, single
+
+    assert asyncio.run(run()) == ({1: "A", 2: "B"}, "A")
+    assert esi.batches == [[1, 2]]
+
+
+def test_missing_and_invalid_input(redis_client):
+    resolver = make_resolver(redis_client, FakeESI({}))
+    assert resolver.get_name('alliance', None) == "Unknown"
+    assert resolver.resolve('alliance', [0, None]) == {}
+    with pytest.raises(ValueError):
+        resolver.resolve('faction', [1])
+
+
+def test_lru_is_bounded(redis_client):
+    esi = FakeESI({i: str(i) for i in range(1, 11)})
+    resolver = make_resolver(redis_client, esi, lru_size=4)
+    resolver.resolve('alliance', range(1, 11))
+    assert len(resolver._lru) == 4
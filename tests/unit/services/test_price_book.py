@@ -0,0 +1,115 @@
+"""
+Test suite for the shared columnar price book
+"""
+
+import math
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.services.market import price_book as price_book_module
+from src.services.market.price_book import PriceBook, get_price_book, refresh_price_book
+
+
+FORGE = 10000002
+DOMAIN = 10000043
+
+CACHE_ROWS = [
+    (34, 4.5, 4.2),      # Tritanium
+    (35, 9.0, 8.8),      # Pyerite
+    (36, None, 60.0),    # Mexallon without adjusted price
+]
+
+REGIONAL_ROWS = [
+    (34, FORGE, 5.0, 4.8, 1000000, 500000),
+    (34, DOMAIN, 5.2, 4.5, 200000, 100000),
+    (36, FORGE, 65.0, 60.0, 1000, 500),
+    (36, DOMAIN, 62.0, None, 800, None),
+    (37, DOMAIN, 150.0, 140.0, 50, 20),    # Isogen: regional only
+]
+
+
+@pytest.fixture
+def book():
+    return PriceBook.from_rows(CACHE_ROWS, REGIONAL_ROWS, version=('v1',))
+
+
+@pytest.fixture
+def reset_book():
+    with patch.object(price_book_module, '_book', None):
+        yield
+
+
+class TestPriceBook:
+    def test_dense_index_covers_both_sources(self, book):
+        assert book.type_ids.tolist() == [34, 35, 36, 37]
+        assert book.region_ids.tolist() == [FORGE, DOMAIN]
+        assert book.index_of([37, 99, 34]).tolist() == [3, -1, 0]
+
+    def test_arrays_are_read_only(self, book):
+        with pytest.raises(ValueError):
+            book.adjusted[0] = 1.0
+
+    def test_adjusted_prices_nan_for_unknown(self, book):
+        prices = book.adjusted_prices([35, 36, 99])
+        assert prices[0] == 9.0
+        assert math.isnan(prices[1]) and math.isnan(prices[2])
+
+    def test_regional_prices(self, book):
+        assert book.sell_prices([34, 37], DOMAIN).tolist() == [5.2, 150.0]
+        assert book.regional_prices(36, DOMAIN) == (62.0, None)
+        assert book.regional_prices(34, 99999) == (None, None)
+
+    def test_best_sell_picks_cheapest_region(self, book):
+        prices, regions = book.best_sell([34, 36, 35])
+        assert prices[:2].tolist() == [5.0, 62.0]
+        assert regions.tolist() == [FORGE, DOMAIN, 0]
+        assert math.isnan(prices[2])
+
+    def test_best_sell_restricted_regions(self, book):
+        prices, regions = book.best_sell([34], [DOMAIN])
+        assert prices.tolist() == [5.2]
+        assert regions.tolist() == [DOMAIN]
+
+    def test_material_prices_fall_back_to_regional_sell(self, book):
+        assert book.material_prices([34, 36], FORGE).tolist() == [4.5, 65.0]
+
+    def test_bom_cost_is_matrix_product(self, book):
+        type_ids = [34, 35, 99]
+        bom = np.array([[10, 5, 1], [0, 2, 0]])
+        costs = book.bom_cost(bom, book.adjusted_prices(type_ids))
+        assert costs.tolist() == [90.0, 18.0]
+
+    def test_to_dict(self, book):
+        assert PriceBook.to_dict([34, 99], book.adjusted_prices([34, 99])) == {34: 4.5, 99: 0.0}
+
+    def test_empty_book(self):
+        book = PriceBook.from_rows([], [])
+        assert len(book) == 0
+        assert math.isnan(book.adjusted_prices([34])[0])
+        prices, regions = book.best_sell([34])
+        assert math.isnan(prices[0]) and regions.tolist() == [0]
+
+
+class TestSharedPriceBook:
+    def test_loaded_once(self, reset_book, book):
+        with patch.object(price_book_module, 'load_price_book', return_value=book) as loader:
+            assert get_price_book() is book
+            assert get_price_book() is book
+        loader.assert_called_once()
+
+    def test_refresh_skips_unchanged_version(self, reset_book, book):
+        with patch.object(price_book_module, 'load_price_book', return_value=book) as loader, \
+             patch.object(price_book_module, 'fetch_price_book_version', return_value=('v1',)):
+            get_price_book()
+            assert refresh_price_book() is False
+        loader.assert_called_once()
+
+    def test_refresh_swaps_new_book(self, reset_book, book):
+        newer = PriceBook.from_rows(CACHE_ROWS[:1], [], version=('v2',))
+        with patch.object(price_book_module, 'load_price_book', side_effect=[book, newer]), \
+             patch.object(price_book_module, 'fetch_price_book_version', return_value=('v2',)):
+            assert get_price_book() is book
+            assert refresh_price_book() is True
+            assert get_price_book() is newer
@@ -0,0 +1,138 @@
+"""
+Test suite for the vectorized profitability engine
+"""
+
+import math
+
+import pytest
+
+from src.material_classifier import MaterialSource
+from src.services.market.price_book import PriceBook
+from src.services.production.profitability import ADJUSTED, ProfitabilityEngine
+
+
+FORGE = 10000002
+DOMAIN = 10000043
+
+RIFTER_BP, RIFTER = 691, 587
+AMMO_BP, AMMO = 1000, 2000
+EMPTY_BP, EMPTY = 3000, 4000
+TRITANIUM, PYERITE, SLEEPER = 34, 35, 30259
+
+PRODUCT_ROWS = [
+    (RIFTER_BP, RIFTER, 1),
+    (AMMO_BP, AMMO, 100),
+    (EMPTY_BP, EMPTY, 1),
+]
+
+MATERIAL_ROWS = [
+    (RIFTER_BP, TRITANIUM, 32000),
+    (RIFTER_BP, PYERITE, 6000),
+    (AMMO_BP, TRITANIUM, 3),
+    (AMMO_BP, SLEEPER, 1),
+]
+
+MATERIAL_GROUPS = {
+    TRITANIUM: (18, 4),
+    PYERITE: (18, 4),
+    SLEEPER: (966, 4),
+}
+
+
+def reference_bom(base: dict, me: int, runs: int) -> dict:
+    """ProductionSimulator.get_bom rounding"""
+    me_factor = 1 - (me / 100)
+    return {m: max(1, math.ceil(q * me_factor)) * runs for m, q in base.items()}
+
+
+@pytest.fixture
+def engine():
+    return ProfitabilityEngine.from_rows(PRODUCT_ROWS, MATERIAL_ROWS, MATERIAL_GROUPS)
+
+
+@pytest.fixture
+def book():
+    cache_rows = [
+        (TRITANIUM, 4.0, 4.0),
+        (PYERITE, 10.0, 10.0),
+        (RIFTER, 300000.0, 300000.0),
+        (AMMO, 50.0, 50.0),
+    ]
+    regional_rows = [
+        (TRITANIUM, FORGE, 5.0, 4.5, 1, 1),
+        (PYERITE, FORGE, 11.0, 10.0, 1, 1),
+        (RIFTER, FORGE, 400000.0, 350000.0, 1, 1),
+        (TRITANIUM, DOMAIN, 6.0, 5.0, 1, 1),
+    ]
+    return PriceBook.from_rows(cache_rows, regional_rows)
+
+
+class TestProfitabilityEngine:
+    def test_matrix_layout(self, engine):
+        assert engine.blueprint_ids.tolist() == [RIFTER_BP, AMMO_BP, EMPTY_BP]
+        assert engine.indptr.tolist() == [0, 2, 4, 4]
+        assert engine.material_ids.tolist() == [TRITANIUM, PYERITE, SLEEPER]
+
+    @pytest.mark.parametrize("me,runs", [(0, 1), (5, 3), (10, 1), (10, 7)])
+    def test_bom_matches_simulator_rounding(self, engine, me, runs):
+        base = {TRITANIUM: 32000, PYERITE: 6000}
+        assert engine.bom(RIFTER_BP, me, runs) == reference_bom(base, me, runs)
+
+    def test_difficulty_and_manufacturability(self, engine):
+        assert engine.difficulty.tolist() == [1, 4, 5]
+        result = engine.manufacturability(AMMO_BP)
+        assert result["score"] == 4
+        assert result["sources"] == {MaterialSource.MINERAL: 1, MaterialSource.ANCIENT_SALVAGE: 1}
+        assert not result["is_market_only"]
+        assert engine.manufacturability(EMPTY_BP)["warnings"] == ["No BOM found"]
+
+    def test_unknown_material_group_defaults_to_commodity(self):
+        engine = ProfitabilityEngine.from_rows(PRODUCT_ROWS, MATERIAL_ROWS)
+        assert set(engine.material_sources) == {MaterialSource.COMMODITY}
+
+
+class TestProfitabilityScan:
+    def test_adjusted_result_matches_quick_profit_check(self, engine, book):
+        scan = engine.scan(book, me_levels=(0, 10), runs=2)
+        bom = reference_bom({TRITANIUM: 32000, PYERITE: 6000}, 10, 2)
+        material_cost = bom[TRITANIUM] * 4.0 + bom[PYERITE] * 10.0
+        revenue = 300000.0 * 2
+
+        result = scan.result(RIFTER_BP, me=10)
+        assert result["material_cost"] == round(material_cost, 2)
+        assert result["revenue"] == revenue
+        assert result["profit"] == round(revenue - material_cost, 2)
+        assert result["margin_percent"] == round((revenue - material_cost) / material_cost * 100, 2)
+        assert result["output_quantity"] == 2
+
+    def test_missing_prices_count_as_zero(self, engine, book):
+        result = engine.scan(book).result(AMMO_BP)
+        assert result["material_cost"] == 3 * 4.0  # Sleeper salvage has no price
+        assert result["priced"] is False
+        assert result["revenue"] == 5000.0
+
+    def test_regional_sources(self, engine, book):
+        scan = engine.scan(book, region_ids=(FORGE, DOMAIN))
+        assert scan.sources == (ADJUSTED, FORGE, DOMAIN)
+
+        forge = scan.result(RIFTER_BP, source=FORGE)
+        assert forge["priced"] is True
+        assert forge["product_price"] == 400000.0
+
+        domain = scan.result(RIFTER_BP, source=DOMAIN)
+        assert domain["priced"] is False
+        assert domain["product_price"] == 0.0
+
+    def test_blueprint_without_materials_has_no_result(self, engine, book):
+        assert engine.scan(book).result(EMPTY_BP) is None
+        assert engine.scan(book).result(99999) is None
+
+    def test_results_filters_and_sorts(self, engine, book):
+        scan = engine.scan(book)
+        all_results = scan.results([AMMO_BP, RIFTER_BP, EMPTY_BP])
+        assert [r["blueprint_id"] for r in all_results] == [AMMO_BP, RIFTER_BP]
+
+        easy = scan.results([AMMO_BP, RIFTER_BP], max_difficulty=2)
+        assert [r["blueprint_id"] for r in easy] == [RIFTER_BP]
+
+        assert scan.results([RIFTER_BP], min_profit=10 ** 9) == []
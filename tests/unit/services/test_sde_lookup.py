@@ -0,0 +1,121 @@
+"""
+Test suite for the in-memory SDE lookup
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.services.sde import lookup as lookup_module
+from src.services.sde.lookup import SDELookup, get_sde_lookup, get_sde_lookup_stats
+
+
+TYPE_ROWS = [
+    (671, 'Erebus', 30, 10000000.0),
+    (587, 'Rifter', 25, 27289.0),
+    (34, 'Tritanium', 18, 0.01),
+    (22456, 'Sabre', 541, 43000.0),
+]
+
+GROUP_ROWS = [
+    (25, 'Frigate', 6),
+    (30, 'Titan', 6),
+    (541, 'Interdictor', 6),
+    (18, 'Mineral', 4),
+]
+
+SYSTEM_ROWS = [
+    (30000142, 'Jita', 10000002, 0.9459),
+    (30002187, 'Amarr', 10000043, 1.0),
+    (30004759, '1DQ1-A', 10000060, -0.3848),
+]
+
+REGION_ROWS = [(10000002, 'The Forge'), (10000043, 'Domain')]
+
+CATEGORY_ROWS = [(6, 'Ship'), (4, 'Material')]
+
+
+@pytest.fixture
+def sde():
+    return SDELookup.from_rows(TYPE_ROWS, GROUP_ROWS, SYSTEM_ROWS, REGION_ROWS, CATEGORY_ROWS,
+                               build_seconds=0.5)
+
+
+class TestTypes:
+    def test_arrays_are_sorted_and_aligned(self, sde):
+        assert sde.type_ids.tolist() == [34, 587, 671, 22456]
+        assert sde.type_names[1] == 'Rifter'
+        assert sde.type_groups.tolist() == [18, 25, 30, 541]
+        assert sde.type_categories.tolist() == [4, 6, 6, 6]
+
+    def test_arrays_are_read_only(self, sde):
+        with pytest.raises(ValueError):
+            sde.type_groups[0] = 1
+
+    def test_type_lookups(self, sde):
+        assert sde.type_name(587) == 'Rifter'
+        assert sde.type_group(22456) == 541
+        assert sde.type_category(34) == 4
+        assert sde.type_volume(34) == 0.01
+        assert sde.type_group_name(22456) == 'Interdictor'
+
+    def test_unknown_type(self, sde):
+        assert sde.type_name(1) is None
+        assert sde.type_name(1, 'Ship 1') == 'Ship 1'
+        assert sde.type_group(99999999) is None
+        assert sde.type_info(1) is None
+
+    def test_batch_lookups(self, sde):
+        assert sde.groups_of([671, 1, 587]).tolist() == [30, 0, 25]
+        assert sde.names_of([587, 1]) == {587: 'Rifter'}
+
+
+class TestShipClasses:
+    def test_ship_class(self, sde):
+        assert sde.ship_class(587) == ('frigate', 'standard')
+        assert sde.ship_class(22456) == ('destroyer', 'interdictor')
+        assert sde.ship_class(34) == ('other', 'other')
+        assert sde.ship_class(1) == (None, None)
+
+    def test_is_capital(self, sde):
+        assert sde.is_capital(671) is True
+        assert sde.is_capital(587) is False
+        assert sde.is_capital(1) is False
+
+
+class TestSystems:
+    def test_system_info(self, sde):
+        assert sde.system_info(30000142) == {
+            'system_id': 30000142,
+            'name': 'Jita',
+            'region_id': 10000002,
+            'region_name': 'The Forge',
+            'security': 0.9459,
+        }
+        assert sde.system_security(30004759) == -0.3848
+        assert sde.system_region(30002187) == 10000043
+
+    def test_unknown_system_and_region(self, sde):
+        assert sde.system_info(1) is None
+        assert sde.system_name(1, 'System 1') == 'System 1'
+        assert sde.system_info(30004759)['region_name'] is None
+
+    def test_stats(self, sde):
+        stats = sde.stats()
+
+        assert stats['types'] == 4
+        assert stats['groups'] == 4
+        assert stats['systems'] == 3
+        assert stats['build_seconds'] == 0.5
+        assert stats['memory_bytes'] > 0
+
+
+class TestSharedInstance:
+    def test_loaded_once(self, sde):
+        with patch.object(lookup_module, '_lookup', None), \
+                patch.object(lookup_module, 'load_sde_lookup', return_value=sde) as load:
+            assert get_sde_lookup_stats() == {'loaded': False}
+            assert get_sde_lookup() is sde
+            assert get_sde_lookup() is sde
+            assert get_sde_lookup_stats()['loaded'] is True
+
+        load.assert_called_once()
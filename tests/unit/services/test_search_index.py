@@ -0,0 +1,180 @@
+"""
+Test suite for the in-memory SDE search index
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.services.sde import search as search_module
+from src.services.sde.search import NameIndex, SearchIndex, get_search_index_stats
+
+
+# (typeID, typeName, groupID, marketGroupID, published, volume, basePrice)
+TYPE_ROWS = [
+    (34, 'Tritanium', 18, 1857, 1, 0.01, 2.0),
+    (587, 'Rifter', 25, 64, 1, 27289.0, 400000.0),
+    (598, 'Breacher', 25, 64, 1, 27289.0, 400000.0),
+    (17703, 'Imperial Navy Slicer', 25, 1366, 1, 27289.0, 0.0),
+    (638, 'Raven', 27, 80, 1, 486000.0, 1e8),
+    (17636, 'Raven Navy Issue', 27, 1378, 1, 486000.0, 0.0),
+    (644, 'Raven Blueprint', 107, None, 0, 0.01, 1e9),
+    (3756, 'Gnosis', 25, None, 0, 27289.0, 0.0),
+    (11393, 'Large Shield Booster II', 40, 611, 1, 25.0, 0.0),
+]
+
+GROUP_ROWS = [
+    (18, 'Mineral', 'Material'),
+    (25, 'Frigate', 'Ship'),
+    (27, 'Battleship', 'Ship'),
+    (40, 'Shield Booster', 'Module'),
+]
+
+# Ships (4) > Frigates (1361) > Standard Frigates (64) / Faction Frigates (1366)
+MARKET_GROUP_ROWS = [
+    (4, 'Ships', None),
+    (1361, 'Frigates', 4),
+    (64, 'Standard Frigates', 1361),
+    (1366, 'Navy Faction Frigates', 1361),
+    (1376, 'Battleships', 4),
+    (80, 'Standard Battleships', 1376),
+    (1378, 'Navy Faction Battleships', 1376),
+    (1857, 'Minerals', None),
+]
+
+SYSTEM_ROWS = [
+    (30000142, 'Jita', 10000002, 0.9459),
+    (30002187, 'Amarr', 10000043, 1.0),
+    (30000144, 'Perimeter', 10000002, 0.9546),
+    (30004759, '1DQ1-A', 10000060, -0.3848),
+]
+
+
+@pytest.fixture
+def index():
+    return SearchIndex.from_rows(TYPE_ROWS, GROUP_ROWS, MARKET_GROUP_ROWS, SYSTEM_ROWS, build_seconds=0.2)
+
+
+def names(rows, key='typeName'):
+    return [r[key] for r in rows]
+
+
+class TestNameIndex:
+    def test_substring_is_case_insensitive(self):
+        idx = NameIndex.build([1, 2, 3], ['Jita', 'Perimeter', 'Jitaa'])
+        assert sorted(idx.ids[idx.search('ITA')].tolist()) == [1, 3]
+
+    def test_short_and_empty_queries(self):
+        idx = NameIndex.build([1, 2, 3], ['Jita', 'Perimeter', 'Amarr'])
+        assert sorted(idx.ids[idx.search('r')].tolist()) == [2, 3]
+        assert sorted(idx.ids[idx.search('ar')].tolist()) == [3]
+        assert len(idx.search('')) == 3
+
+    def test_trigram_false_positives_are_dropped(self):
+        # 'abcab' contains every trigram of 'abcabc'... except the full string
+        idx = NameIndex.build([1, 2], ['abcab', 'xabcabcx'])
+        assert idx.ids[idx.search('abcabc')].tolist() == [2]
+
+    def test_unknown_ngram_returns_nothing(self):
+        idx = NameIndex.build([1], ['Jita'])
+        assert len(idx.search('xyz')) == 0
+
+    def test_find_exact_normalizes_whitespace(self):
+        idx = NameIndex.build([1], ['Raven Navy Issue'])
+        assert idx.find_exact('  raven  navy issue ') == 0
+        assert idx.find_exact('raven') == -1
+
+    def test_postings_are_read_only(self):
+        idx = NameIndex.build([1], ['Jita'])
+        with pytest.raises(ValueError):
+            idx.postings['ji'][0] = 5
+
+
+class TestTypes:
+    def test_ranking_exact_prefix_word_substring(self, index):
+        rows = index.search_types('raven', limit=None)
+        assert names(rows) == ['Raven', 'Raven Navy Issue', 'Raven Blueprint']
+
+        rows = index.search_types('navy', limit=None)
+        # Word prefix in both; the shorter name wins the tie
+        assert names(rows) == ['Raven Navy Issue', 'Imperial Navy Slicer']
+
+    def test_published_market_items_rank_first(self, index):
+        rows = index.search_types('raven', limit=None)
+        assert rows[-1]['typeName'] == 'Raven Blueprint'
+
+    def test_row_shape_matches_get_item_by_name(self, index):
+        assert index.search_types('tritanium') == [{
+            'typeID': 34, 'typeName': 'Tritanium', 'groupID': 18, 'volume': 0.01, 'basePrice': 2.0,
+        }]
+
+    def test_limit(self, index):
+        assert len(index.search_types('r', limit=2)) == 2
+
+    def test_group_filter(self, index):
+        assert names(index.search_types('er', group_id=25, limit=None)) == ['Rifter', 'Breacher', 'Imperial Navy Slicer']
+        assert names(index.search_types('er', group_id=27, limit=None)) == []
+
+    def test_market_group_filter_includes_subgroups(self, index):
+        rows = index.search_types('', market_group_id=1361, limit=None)
+        assert sorted(names(rows)) == ['Breacher', 'Imperial Navy Slicer', 'Rifter']
+
+        rows = index.search_types('navy', market_group_id=4, limit=None)
+        assert names(rows) == ['Raven Navy Issue', 'Imperial Navy Slicer']
+
+    def test_published_only(self, index):
+        assert 'Gnosis' in names(index.search_types('gnosis'))
+        assert index.search_types('gnosis', group_id=25, published_only=True) == []
+
+    def test_large_filters_use_indexes(self, index):
+        for query in ('', 'a', 'navy', 'er'):
+            scanned = index.search_types(query, limit=None, market_group_id=4, published_only=True)
+            with patch.object(search_module, '_SCAN_LIMIT', 0):
+                assert index.search_types(query, limit=None, market_group_id=4, published_only=True) == scanned
+                assert index.search_types(query, limit=2, market_group_id=4, published_only=True) == scanned[:2]
+
+    def test_market_group_subtree(self, index):
+        assert index.market_group_subtree(4).tolist() == [4, 64, 80, 1361, 1366, 1376, 1378]
+        assert index.market_group_subtree(999).tolist() == [999]
+
+
+class TestGroupsAndSystems:
+    def test_search_groups(self, index):
+        assert index.search_groups('ship') == [
+            {'groupID': 27, 'groupName': 'Battleship', 'categoryName': 'Ship'},
+        ]
+        assert [g['groupID'] for g in index.search_groups('i')] == [25, 18, 27, 40]
+
+    def test_search_market_groups(self, index):
+        rows = index.search_market_groups('frigates')
+        assert names(rows, 'marketGroupName') == ['Frigates', 'Standard Frigates', 'Navy Faction Frigates']
+        assert rows[0]['parentGroupID'] == 4
+        assert index.search_market_groups('ships')[0]['parentGroupID'] is None
+
+    def test_search_systems(self, index):
+        assert index.search_system_ids('a') == [30002187, 30000142, 30004759]
+        assert index.search_system_ids('jita') == [30000142]
+
+    def test_system_by_name(self, index):
+        assert index.system_id_by_name('JITA') == 30000142
+        assert index.system_id_by_name('Jit') is None
+
+
+class TestSharedInstance:
+    def test_stats(self, index):
+        stats = index.stats()
+        assert stats['types'] == len(TYPE_ROWS)
+        assert stats['systems'] == len(SYSTEM_ROWS)
+        assert stats['build_seconds'] == 0.2
+        assert stats['ngrams'] > 0
+        assert stats['memory_bytes'] > 0
+
+    def test_stats_do_not_trigger_load(self):
+        with patch.object(search_module, '_index', None):
+            assert get_search_index_stats() == {'loaded': False}
+
+    def test_get_search_index_builds_once(self, index):
+        with patch.object(search_module, '_index', None), \
+                patch.object(search_module, 'load_search_index', return_value=index) as load:
+            assert search_module.get_search_index() is index
+            assert search_module.get_search_index() is index
+            assert load.call_count == 1
@@ -0,0 +1,84 @@
+"""
+Test suite for the shared universe graph
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.services.route import universe as universe_module
+from src.services.route.universe import UniverseGraph, get_universe_graph, get_universe_stats
+
+
+SYSTEM_ROWS = [
+    {'solarSystemID': 30000142, 'solarSystemName': 'Jita', 'security': 0.9459,
+     'regionID': 10000002, 'regionName': 'The Forge', 'x': 1.0, 'y': 2.0, 'z': 3.0},
+    {'solarSystemID': 30000144, 'solarSystemName': 'Perimeter', 'security': 0.9072,
+     'regionID': 10000002, 'regionName': 'The Forge', 'x': 4.0, 'y': 5.0, 'z': 6.0},
+    {'solarSystemID': 30000140, 'solarSystemName': 'Maurasi', 'security': 0.6,
+     'regionID': 10000002, 'regionName': 'The Forge', 'x': 7.0, 'y': 8.0, 'z': 9.0},
+    {'solarSystemID': 31000005, 'solarSystemName': 'Thera', 'security': -1.0,
+     'regionID': 11000031, 'regionName': 'G-R00031', 'x': 0.0, 'y': 0.0, 'z': 0.0},
+]
+
+JUMP_ROWS = [
+    (30000142, 30000144),
+    (30000144, 30000142),
+    (30000142, 30000140),
+    (30000140, 30000142),
+]
+
+
+@pytest.fixture
+def universe():
+    return UniverseGraph.from_rows(SYSTEM_ROWS, JUMP_ROWS, build_seconds=0.25)
+
+
+class TestUniverseGraph:
+    def test_arrays_are_sorted_and_aligned(self, universe):
+        assert universe.system_ids.tolist() == [30000140, 30000142, 30000144, 31000005]
+        assert universe.names[1] == 'Jita'
+        assert universe.coordinates[1].tolist() == [1.0, 2.0, 3.0]
+        assert universe.region_names[10000002] == 'The Forge'
+
+    def test_arrays_are_read_only(self, universe):
+        with pytest.raises(ValueError):
+            universe.security[0] = 1.0
+
+    def test_csr_neighbours(self, universe):
+        assert universe.neighbours(30000142) == [30000140, 30000144]
+        assert universe.neighbours(31000005) == []
+        assert universe.neighbours(1) == []
+        assert universe.jump_count == 4
+
+    def test_dict_views_match_route_service_format(self, universe):
+        assert universe.systems[30000142] == {
+            'name': 'Jita', 'security': 0.9459, 'region_id': 10000002
+        }
+        assert universe.graph == {
+            30000140: [30000142],
+            30000142: [30000140, 30000144],
+            30000144: [30000142],
+        }
+        # Views are built once and shared
+        assert universe.systems is universe.systems
+
+    def test_stats(self, universe):
+        stats = universe.stats()
+
+        assert stats['systems'] == 4
+        assert stats['jumps'] == 4
+        assert stats['build_seconds'] == 0.25
+        assert stats['memory_bytes'] > 0
+        assert stats['jump_matrix_loaded'] is False
+
+
+class TestSharedInstance:
+    def test_loaded_once(self, universe):
+        with patch.object(universe_module, '_universe', None), \
+                patch.object(universe_module, 'load_universe_graph', return_value=universe) as load:
+            assert get_universe_stats() == {'loaded': False}
+            assert get_universe_graph() is universe
+            assert get_universe_graph() is universe
+            assert get_universe_stats()['loaded'] is True
+
+        load.assert_called_once()
@@ -0,0 +1,108 @@
+"""Tests for async route data access: offload lanes and AsyncSession."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.core import offload
+from src.core.async_database import AsyncDatabase, AsyncSession
+
+
+async def test_run_blocking_does_not_block_event_loop():
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    result, _ = await asyncio.gather(offload.run_blocking(time.sleep, 0.1), ticker())
+
+    assert result is None
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.1
+
+
+async def test_run_blocking_passes_arguments_and_raises():
+    assert await offload.run_blocking(lambda a, b=0: a + b, 2, b=3) == 5
+    with pytest.raises(ZeroDivisionError):
+        await offload.run_blocking(lambda: 1 / 0)
+
+
+async def test_report_lane_is_bounded_and_separate(monkeypatch):
+    monkeypatch.setitem(offload.LANES, "reports", 1)
+    monkeypatch.setattr(offload, "_executors", {})
+    release = threading.Event()
+
+    reports = [asyncio.ensure_future(offload.run_report(release.wait, 5)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+
+    # Reports queue behind each other, short calls still run right away
+    assert await asyncio.wait_for(offload.run_blocking(lambda: "live"), timeout=1) == "live"
+    assert offload.get_offload_stats()["reports"]["in_flight"] == 3
+
+    release.set()
+    assert await asyncio.gather(*reports) == [True, True, True]
+    offload.shutdown_offload_pools()
+
+
+class FakeCursor:
+    def __init__(self, rows, row_factory=None):
+        self.rows = rows
+        self.row_factory = row_factory
+        self.executed = []
+        self.rowcount = len(rows)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    async def fetchall(self):
+        return self.rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.cursors = []
+
+    def cursor(self, row_factory=None):
+        cur = FakeCursor(self.rows, row_factory)
+        self.cursors.append(cur)
+        return cur
+
+
+async def test_session_fetch_helpers():
+    conn = FakeConnection([(3, "Jita"), (4, "Amarr")])
+    session = AsyncSession(conn)
+
+    assert await session.fetch_all("SELECT id, name FROM t WHERE id > %s", (1,)) == [(3, "Jita"), (4, "Amarr")]
+    assert await session.fetch_one("SELECT 1") == (3, "Jita")
+    assert await session.fetch_val("SELECT COUNT(*) FROM t") == 3
+    assert await session.execute("DELETE FROM t") == 2
+    assert conn.cursors[0].executed == [("SELECT id, name FROM t WHERE id > %s", (1,))]
+
+
+async def test_session_fetch_val_empty():
+    assert await AsyncSession(FakeConnection([])).fetch_val("SELECT 1 WHERE false") is None
+
+
+def test_pgbouncer_mode_disables_prepared_statements():
+    db = AsyncDatabase({"host": "db", "database": "eve_sde", "user": "eve", "password": "pw"},
+                       statement_timeout_ms=5000, pgbouncer=True)
+    assert db.pool.kwargs["prepare_threshold"] is None
+    assert "options" not in db.pool.kwargs
+
+    direct = AsyncDatabase({"host": "db", "database": "eve_sde"}, statement_timeout_ms=5000)
+    assert direct.pool.kwargs["options"] == "-c statement_timeout=5000"
+    assert direct.pool.kwargs["dbname"] == "eve_sde"
@@ -0,0 +1,148 @@
+"""Tests for streaming killmail archive ingestion."""
+
+import io
+import json
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from src import killmail_service as ks
+from src.killmail_service import (
+    KillmailService,
+    aggregate_killmail_batch,
+    create_parse_pool,
+    iter_archive_killmails,
+)
+
+DAY = date(2026, 1, 5)
+REGION_MAP = {30000142: 10000002, 30002187: 10000043}
+
+
+def make_killmails():
+    return [
+        {
+            'killmail_id': 1, 'solar_system_id': 30000142,
+            'victim': {'ship_type_id': 587, 'items': [
+                {'item_type_id': 2048, 'quantity_destroyed': 2},
+                {'item_type_id': 3170, 'quantity_destroyed': 0, 'quantity_dropped': 1},
+            ]},
+            'zkb': {'totalValue': 1000.0},
+        },
+        {
+            'killmail_id': 2, 'solar_system_id': 30000142,
+            'victim': {'ship_type_id': 587, 'items': [{'item_type_id': 2048, 'quantity_destroyed': 3}]},
+            'zkb': {'totalValue': 500.5},
+        },
+        {
+            'killmail_id': 3, 'solar_system_id': 30002187,
+            'victim': {'ship_type_id': 670, 'items': []},
+            'zkb': {'totalValue': 10.0},
+        },
+        # Wormhole system (not in the map) and a killmail without a ship
+        {'killmail_id': 4, 'solar_system_id': 31000005, 'victim': {'ship_type_id': 587}},
+        {'killmail_id': 5, 'solar_system_id': 30000142, 'victim': {}},
+    ]
+
+
+def make_archive(killmails, extra_members=()):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:bz2') as tar:
+        for name, data in extra_members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        for km in killmails:
+            data = json.dumps(km).encode()
+            info = tarfile.TarInfo(f"killmails/{km['killmail_id']}.json")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+
+class LocalKillmailService(KillmailService):
+    def _get_system_region_map(self):
+        return REGION_MAP
+
+
+def sort_rows(aggregated):
+    return {
+        name: sorted(rows, key=lambda r: sorted((k, str(v)) for k, v in r.items()))
+        for name, rows in aggregated.items()
+    }
+
+
+def test_iter_archive_skips_non_json_members():
+    archive = make_archive(make_killmails()[:2], extra_members=[('README.txt', b'hello')])
+    raw = list(iter_archive_killmails(archive))
+    assert [json.loads(r)['killmail_id'] for r in raw] == [1, 2]
+
+
+def test_batch_aggregation_skips_bad_json():
+    parsed, ships, items, peak_rss = aggregate_killmail_batch(
+        [json.dumps(km).encode() for km in make_killmails()[:2]] + [b'{not json']
+    )
+    assert parsed == 2
+    assert ships == {(30000142, 587): [2, 1500.5]}
+    assert items == {(30000142, 2048): 5}
+    assert peak_rss > 0
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_stream_matches_list_aggregation(monkeypatch, batch_size):
+    monkeypatch.setattr(ks, 'PARSE_BATCH_SIZE', batch_size)
+    service = LocalKillmailService()
+    expected = service.aggregate_killmails(make_killmails(), DAY)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        count, aggregated, _ = service.stream_aggregate(make_archive(make_killmails()), DAY, pool, 2, REGION_MAP)
+
+    assert count == 5
+    assert sort_rows(aggregated) == sort_rows(expected)
+    assert {
+        (r['solar_system_id'], r['ship_type_id']): (r['quantity'], r['total_value_destroyed'], r['region_id'])
+        for r in aggregated['ship_losses']
+    } == {(30000142, 587): (2, 1500.5, 10000002), (30002187, 670): (1, 10.0, 10000043)}
+
+
+def test_stream_bounds_batches_in_flight(monkeypatch):
+    monkeypatch.setattr(ks, 'PARSE_BATCH_SIZE', 1)
+    monkeypatch.setattr(ks, 'PENDING_BATCHES_PER_WORKER', 2)
+    state = {'pending': 0, 'max': 0}
+    merge = ks.merge_loss_partials
+
+    class CountingPool(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            state['pending'] += 1
+            state['max'] = max(state['max'], state['pending'])
+            return super().submit(fn, *args)
+
+    def counting_merge(*args):
+        state['pending'] -= 1
+        return merge(*args)
+
+    monkeypatch.setattr(ks, 'merge_loss_partials', counting_merge)
+    killmails = [dict(km, killmail_id=i) for i, km in enumerate(make_killmails() * 10)]
+    with CountingPool(max_workers=1) as pool:
+        count, _, _ = LocalKillmailService().stream_aggregate(make_archive(killmails), DAY, pool, 1, REGION_MAP)
+
+    assert count == 50
+    assert state['max'] == 2
+
+
+def test_stream_with_process_pool():
+    service = LocalKillmailService()
+    pool = create_parse_pool(2)
+    try:
+        count, aggregated, worker_peak_rss = service.stream_aggregate(
+            make_archive(make_killmails()), DAY, pool, 2, REGION_MAP
+        )
+    finally:
+        pool.shutdown()
+    assert count == 5
+    assert len(aggregated['ship_losses']) == 2
+    assert len(aggregated['item_losses']) == 1
+    # Reported by the workers themselves: forkserver children are never reaped by us
+    assert worker_peak_rss > 0
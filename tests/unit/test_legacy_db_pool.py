@@ -0,0 +1,123 @@
+"""Tests for the pooled legacy src.database.get_db_connection path."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+from src.database import ConnectionPool, PoolTimeout
+
+DB_CONFIG = {"host": "localhost", "database": "eve_sde", "user": "eve", "password": "pw"}
+
+
+def make_conn():
+    conn = MagicMock()
+    conn.closed = 0
+    conn.autocommit = False
+    conn.info.transaction_status = TRANSACTION_STATUS_IDLE
+    return conn
+
+
+@pytest.fixture
+def connect():
+    with patch('src.database.psycopg2.connect', side_effect=lambda **kw: make_conn()) as mock_connect:
+        yield mock_connect
+
+
+def test_connections_are_reused(connect):
+    pool = ConnectionPool(DB_CONFIG, max_conn=2)
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is first
+    assert connect.call_count == 1
+    assert pool.stats()['checkouts'] == 2
+
+
+def test_statement_timeout_is_a_startup_option(connect):
+    pool = ConnectionPool(DB_CONFIG, statement_timeout_ms=5000)
+    pool.acquire()
+    assert connect.call_args.kwargs['options'] == '-c statement_timeout=5000'
+
+
+def test_pgbouncer_mode_uses_set_local(connect):
+    pool = ConnectionPool(DB_CONFIG, statement_timeout_ms=5000, pgbouncer=True)
+    conn = pool.acquire()
+
+    assert 'options' not in connect.call_args.kwargs
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.execute.assert_called_once_with('SET LOCAL statement_timeout = %s', (5000,))
+
+
+def test_release_rolls_back_open_transaction(connect):
+    pool = ConnectionPool(DB_CONFIG)
+    conn = pool.acquire()
+    conn.info.transaction_status = TRANSACTION_STATUS_INTRANS
+    pool.release(conn)
+
+    conn.rollback.assert_called_once()
+    assert pool.stats()['idle'] == 1
+
+
+def test_closed_connection_is_replaced(connect):
+    pool = ConnectionPool(DB_CONFIG)
+    conn = pool.acquire()
+    conn.closed = 1
+    pool.release(conn)
+
+    assert pool.acquire() is not conn
+    stats = pool.stats()
+    assert stats['connections_discarded'] == 1
+    assert stats['connections_created'] == 2
+
+
+def test_stale_connection_fails_healthcheck(connect):
+    pool = ConnectionPool(DB_CONFIG, healthcheck_interval=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.cursor.side_effect = psycopg2.OperationalError('server closed the connection')
+
+    assert pool.acquire() is not conn
+    assert pool.stats()['healthcheck_failures'] == 1
+
+
+def test_saturated_pool_times_out(connect):
+    pool = ConnectionPool(DB_CONFIG, max_conn=1, timeout=0.05)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    stats = pool.stats()
+    assert stats['waits'] == 1
+    assert stats['timeouts'] == 1
+    assert stats['saturation'] == 1.0
+
+
+def test_waiter_gets_released_connection(connect):
+    pool = ConnectionPool(DB_CONFIG, max_conn=1, timeout=5)
+    conn = pool.acquire()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    pool.release(conn)
+    waiter.join(timeout=5)
+
+    assert got == [conn]
+    assert pool.stats()['peak_in_use'] == 1
+
+
+def test_get_db_connection_returns_connection_to_pool(connect):
+    import src.database as database
+
+    pool = ConnectionPool(DB_CONFIG)
+    with patch.object(database, '_pool', pool):
+        with database.get_db_connection() as conn:
+            assert pool.stats()['in_use'] == 1
+        with database.get_db_connection() as again:
+            assert again is conn
+
+    assert pool.stats()['in_use'] == 0
+    assert connect.call_count == 1
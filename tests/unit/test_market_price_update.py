@@ -0,0 +1,70 @@
+"""
+Tests for MarketService.update_global_prices (global ESI price cache)
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import market_service
+from src.market_service import MarketService
+
+
+ESI_PRICES = [
+    {"type_id": 34, "adjusted_price": 4.5, "average_price": 4.2},
+    {"type_id": 35, "adjusted_price": None, "average_price": 9.0},
+]
+
+
+@pytest.fixture
+def db():
+    conn = MagicMock()
+
+    @contextmanager
+    def connection():
+        yield conn
+
+    with patch.object(market_service, "get_db_connection", connection), \
+            patch.object(market_service, "execute_values") as execute_values:
+        yield conn, execute_values
+
+
+@pytest.fixture
+def service():
+    service = MarketService()
+    service.session = MagicMock()
+    service.session.get.return_value = MagicMock(status_code=200, json=lambda: ESI_PRICES)
+    return service
+
+
+def test_prices_are_upserted_and_the_book_refreshed(service, db):
+    conn, execute_values = db
+    with patch.object(market_service, "refresh_price_book") as refresh:
+        result = service.update_global_prices()
+
+    assert result["success"] is True and result["items_updated"] == 2
+    rows = execute_values.call_args[0][2]
+    assert [row[:3] for row in rows] == [(34, 4.5, 4.2), (35, 0, 9.0)]
+    conn.commit.assert_called_once()
+    refresh.assert_called_once_with(force=True)
+
+
+def test_failed_book_reload_does_not_fail_a_committed_update(service, db):
+    conn, _ = db
+    with patch.object(market_service, "refresh_price_book", side_effect=RuntimeError("db gone")):
+        result = service.update_global_prices()
+
+    assert "error" not in result
+    assert result["success"] is True
+    conn.commit.assert_called_once()
+
+
+def test_failed_upsert_is_an_error(service, db):
+    _, execute_values = db
+    execute_values.side_effect = RuntimeError("deadlock")
+    with patch.object(market_service, "refresh_price_book") as refresh:
+        result = service.update_global_prices()
+
+    assert result == {"error": "Cache update failed: deadlock"}
+    refresh.assert_not_called()
@@ -0,0 +1,354 @@
+"""Tests for the regional price fetcher's ESI paging, aggregation and bulk save."""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from jobs import regional_price_fetcher
+from jobs.regional_price_fetcher import (
+    ERROR_LIMIT_PAUSE,
+    ERROR_LIMIT_SLOWDOWN,
+    TOP_ORDERS,
+    ErrorLimitWindow,
+    PageETagCache,
+    StreamingPriceAggregator,
+    aggregate_prices,
+    fetch_order_page,
+    save_prices_bulk,
+)
+
+TRITANIUM, PYERITE, RIFTER = 34, 35, 587
+
+
+def budget(remain, reset=60):
+    return {'X-ESI-Error-Limit-Remain': str(remain), 'X-ESI-Error-Limit-Reset': str(reset)}
+
+
+def acquire_in_thread(window):
+    """Start acquire() in a thread; returns (done event, result list)."""
+    done, result = threading.Event(), []
+
+    def run():
+        result.append(window.acquire())
+        done.set()
+
+    threading.Thread(target=run, daemon=True).start()
+    return done, result
+
+
+class TestErrorLimitWindow:
+    def test_slots_are_bounded_by_the_limit(self):
+        window = ErrorLimitWindow(max_concurrency=2)
+        assert window.acquire() and window.acquire()
+
+        done, result = acquire_in_thread(window)
+        assert not done.wait(0.05)
+
+        window.release()
+        assert done.wait(1) and result == [True]
+        assert window.in_flight == 2
+
+    def test_low_budget_halves_the_window(self):
+        window = ErrorLimitWindow(max_concurrency=8)
+        for expected in (4, 2, 1, 1):
+            window.acquire()
+            window.release(budget(ERROR_LIMIT_SLOWDOWN - 1))
+            assert window.limit == expected
+
+    def test_healthy_budget_grows_the_window_back_one_step_per_response(self):
+        window = ErrorLimitWindow(max_concurrency=4)
+        window.acquire()
+        window.release(budget(ERROR_LIMIT_SLOWDOWN - 1))
+        assert window.limit == 2
+
+        for expected in (3, 4, 4):
+            window.acquire()
+            window.release(budget(100))
+            assert window.limit == expected
+
+    def test_missing_headers_leave_the_window_alone(self):
+        window = ErrorLimitWindow(max_concurrency=4)
+        window.acquire()
+        window.release({'Content-Type': 'application/json'})
+        assert (window.limit, window.in_flight) == (4, 0)
+
+    def test_exhausted_budget_pauses_until_the_reset(self):
+        window = ErrorLimitWindow(max_concurrency=4)
+        window.acquire()
+        before = time.time()
+        window.release(budget(ERROR_LIMIT_PAUSE - 1, reset=30))
+
+        assert window.limit == 1
+        assert before + 30 <= window._paused_until <= time.time() + 30
+
+        done, _ = acquire_in_thread(window)
+        assert not done.wait(0.05)
+
+        # Once the error window resets the paused request goes out, and the
+        # window grows back as healthy responses come in
+        window._paused_until = 0.0
+        with window._cond:
+            window._cond.notify_all()
+        assert done.wait(1)
+        window.release(budget(100))
+        assert window.limit == 2
+
+    def test_pause_blocks_new_requests_for_the_given_time(self):
+        window = ErrorLimitWindow(max_concurrency=4)
+        window.pause(0.2)
+
+        started = time.time()
+        assert window.acquire()
+        assert time.time() - started >= 0.15
+
+    def test_error_ban_stops_everyone(self):
+        window = ErrorLimitWindow(max_concurrency=1)
+        window.acquire()
+        done, result = acquire_in_thread(window)
+
+        window.release(status=420)
+
+        assert done.wait(1) and result == [False]
+        assert window.banned
+        assert window.acquire() is False
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, etag=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {'X-Pages': '1', **({'ETag': etag} if etag else {})}
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    """Answers 304 to a matching If-None-Match, else 200 with the current page."""
+
+    def __init__(self, etag, orders):
+        self.etag = etag
+        self.orders = orders
+        self.sent = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent.append(headers.get('If-None-Match'))
+        if headers.get('If-None-Match') == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.orders, self.etag)
+
+
+class TestFetchOrderPage:
+    ORDERS = [{'type_id': TRITANIUM, 'price': 4.5, 'volume_remain': 10, 'is_buy_order': False}]
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        session = FakeSession('"v1"', self.ORDERS)
+        monkeypatch.setattr(regional_price_fetcher, '_get_session', lambda: session)
+        return session
+
+    def test_not_modified_page_is_read_from_the_cache(self, session, tmp_path):
+        cache = PageETagCache(str(tmp_path))
+        cache.put(10000002, 1, '"v1"', self.ORDERS)
+
+        result = fetch_order_page(10000002, 1, ErrorLimitWindow(), cache)
+
+        assert (result.orders, result.from_cache) == (self.ORDERS, True)
+        assert session.sent == ['"v1"']
+
+    def test_missing_cached_body_is_refetched_and_cached_again(self, session, tmp_path):
+        cache = PageETagCache(str(tmp_path))
+        cache.put(10000002, 1, '"v1"', self.ORDERS)
+        (tmp_path / '10000002' / 'page_1.json.gz').unlink()
+
+        result = fetch_order_page(10000002, 1, ErrorLimitWindow(), cache)
+
+        assert (result.orders, result.from_cache) == (self.ORDERS, False)
+        assert session.sent == ['"v1"', None]
+        assert cache.get_orders(10000002, 1) == self.ORDERS
+
+        # The next run is a plain 304 again
+        assert fetch_order_page(10000002, 1, ErrorLimitWindow(), cache).from_cache
+        assert session.sent[2:] == ['"v1"']
+
+
+def order(type_id, price, volume, is_buy=False, location_id=60003760, issued='2026-01-01T00:00:00Z'):
+    return {'type_id': type_id, 'price': price, 'volume_remain': volume, 'is_buy_order': is_buy,
+            'location_id': location_id, 'issued': issued}
+
+
+def stream(pages, type_ids, **kwargs):
+    aggregator = StreamingPriceAggregator(type_ids, **kwargs)
+    for page in pages:
+        aggregator.add_orders(page)
+    return aggregator
+
+
+class TestStreamingPriceAggregator:
+    def test_min_max_and_volumes_across_pages(self):
+        pages = [
+            [order(TRITANIUM, 5.0, 100), order(TRITANIUM, 4.0, 50, is_buy=True), order(PYERITE, 9.0, 10)],
+            [order(TRITANIUM, 4.5, 200), order(TRITANIUM, 4.2, 25, is_buy=True)],
+            [order(TRITANIUM, 6.0, 300), order(TRITANIUM, 3.0, 1000, is_buy=True), order(RIFTER, 1e6, 1)],
+        ]
+
+        aggregator = stream(pages, {TRITANIUM, PYERITE})
+        results = aggregator.results()
+
+        assert aggregator.orders_seen == 8
+        assert set(results) == {TRITANIUM, PYERITE}
+        tritanium = results[TRITANIUM]
+        assert (tritanium['lowest_sell'], tritanium['highest_buy']) == (4.5, 4.2)
+        assert (tritanium['sell_volume'], tritanium['buy_volume']) == (600, 1075)
+        assert [o['price'] for o in tritanium['top_sells']] == [4.5, 5.0, 6.0]
+        assert [o['price'] for o in tritanium['top_buys']] == [4.2, 4.0, 3.0]
+        assert results[PYERITE]['highest_buy'] is None and results[PYERITE]['buy_volume'] == 0
+
+    def test_realistic_price_only_keeps_the_covering_depth(self):
+        pages = [[order(TRITANIUM, 10.0, 60)], [order(TRITANIUM, 1.0, 50)], [order(TRITANIUM, 2.0, 50)]]
+
+        aggregator = stream(pages, {TRITANIUM}, target_volume=100)
+
+        assert aggregator.results()[TRITANIUM]['realistic_sell'] == pytest.approx(1.5)
+        assert sorted(aggregator._books[TRITANIUM].depth) == [(-2.0, 50), (-1.0, 50)]
+
+    def test_top_orders_keep_the_earlier_of_equal_prices(self):
+        page = [order(TRITANIUM, 5.0, 1, location_id=i) for i in range(TOP_ORDERS + 3)]
+
+        top = stream([page], {TRITANIUM}).results()[TRITANIUM]['top_sells']
+
+        assert [o['location_id'] for o in top] == list(range(TOP_ORDERS))
+
+    @pytest.mark.parametrize('page_size', [1, 7, 1000])
+    def test_matches_aggregate_prices(self, page_size):
+        rng = random.Random(page_size)
+        orders = [
+            order(rng.choice((TRITANIUM, PYERITE, RIFTER)), round(rng.uniform(1, 20), 2),
+                  rng.randint(0, 30000), is_buy=rng.random() < 0.4, location_id=i)
+            for i in range(400)
+        ]
+        pages = [orders[i:i + page_size] for i in range(0, len(orders), page_size)]
+
+        streamed = stream(pages, {TRITANIUM, PYERITE}).results()
+        expected = aggregate_prices(orders, {TRITANIUM, PYERITE})
+
+        assert set(streamed) == set(expected)
+        for type_id, data in expected.items():
+            for key in ('lowest_sell', 'highest_buy', 'sell_volume', 'buy_volume', 'top_sells', 'top_buys'):
+                assert streamed[type_id][key] == data[key], key
+            assert streamed[type_id]['realistic_sell'] == pytest.approx(data['realistic_sell'])
+
+
+class FakeCursor:
+    def __init__(self, rowcount, fail_on=None):
+        self.copied = {}
+        self.executed = []
+        self.rowcount = rowcount
+        self.fail_on = fail_on
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError('constraint violated')
+        self.executed.append((' '.join(sql.split()), params))
+
+    def copy_expert(self, sql, buffer):
+        table = sql.split()[1]
+        self.copied[table] = (sql, [line.split('\t') for line in buffer.read().splitlines()])
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.committed = self.rolled_back = False
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class TestSavePricesBulk:
+    PRICES = {
+        TRITANIUM: {
+            'lowest_sell': 4.5, 'highest_buy': 4.2, 'sell_volume': 600, 'buy_volume': 1075,
+            'realistic_sell': 4.75,
+            'top_sells': [{'price': 4.5, 'volume': 200, 'location_id': 60003760, 'issued': '2026-01-01T00:00:00Z'},
+                          {'price': 5.0, 'volume': 100, 'location_id': None, 'issued': None}],
+            'top_buys': [{'price': 4.2, 'volume': 25, 'location_id': 60008494, 'issued': '2026-01-02T00:00:00Z'}],
+        },
+        PYERITE: {
+            'lowest_sell': 9.0, 'highest_buy': None, 'sell_volume': 10, 'buy_volume': 0,
+            'realistic_sell': None, 'top_sells': [], 'top_buys': [],
+        },
+    }
+
+    @pytest.fixture
+    def db(self, monkeypatch):
+        db = {}
+
+        @contextmanager
+        def connection():
+            db['conn'] = FakeConnection(db['cursor'])
+            yield db['conn']
+
+        monkeypatch.setattr(regional_price_fetcher, 'get_db_connection', connection)
+        return db
+
+    def test_rows_and_upserts(self, db):
+        cur = db['cursor'] = FakeCursor(rowcount=2)
+
+        assert save_prices_bulk(10000002, self.PRICES) == 2
+
+        sql, prices = cur.copied['tmp_market_prices']
+        assert 'type_id, lowest_sell, highest_buy, sell_volume, buy_volume, realistic_sell' in sql
+        assert prices == [
+            ['34', '4.5', '4.2', '600', '1075', '4.75'],
+            ['35', '9.0', r'\N', '10', '0', r'\N'],
+        ]
+        _, snapshots = cur.copied['tmp_market_order_snapshots']
+        assert snapshots == [
+            ['34', 'f', '4.5', '200', '60003760', '2026-01-01T00:00:00Z', '1'],
+            ['34', 'f', '5.0', '100', r'\N', r'\N', '2'],
+            ['34', 't', '4.2', '25', '60008494', '2026-01-02T00:00:00Z', '1'],
+        ]
+
+        upserts = [(sql, params) for sql, params in cur.executed if sql.startswith('INSERT')]
+        assert [sql.split()[2] for sql, _ in upserts] == ['market_prices', 'market_order_snapshots']
+        assert all(params == (10000002,) for _, params in upserts)
+        assert 'ON CONFLICT (type_id, region_id) DO UPDATE' in upserts[0][0]
+        assert 'ON CONFLICT (type_id, region_id, is_buy_order, rank) DO UPDATE' in upserts[1][0]
+        assert db['conn'].committed
+
+    def test_snapshots_are_capped_at_top_orders(self, db):
+        cur = db['cursor'] = FakeCursor(rowcount=1)
+        many = [{'price': float(i), 'volume': 1} for i in range(TOP_ORDERS + 5)]
+        prices = {TRITANIUM: dict(self.PRICES[TRITANIUM], top_sells=many, top_buys=[])}
+
+        save_prices_bulk(10000002, prices)
+
+        ranks = [row[-1] for row in cur.copied['tmp_market_order_snapshots'][1]]
+        assert ranks == [str(rank) for rank in range(1, TOP_ORDERS + 1)]
+
+    def test_error_rolls_back_the_region(self, db):
+        db['cursor'] = FakeCursor(rowcount=0, fail_on='INSERT INTO market_order_snapshots')
+
+        with pytest.raises(RuntimeError):
+            save_prices_bulk(10000002, self.PRICES)
+        assert db['conn'].rolled_back and not db['conn'].committed
+
+    def test_no_prices_skips_the_database(self, db):
+        assert save_prices_bulk(10000002, {}) == 0
+        assert 'conn' not in db
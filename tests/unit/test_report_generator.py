@@ -0,0 +1,168 @@
+"""Tests for the report generation dependency graph."""
+
+import threading
+import time
+
+import pytest
+
+from jobs.report_generator import ReportNode, _check_graph, run_report_graph
+
+
+class Recorder:
+    """save() stand-in and event log shared by the generate functions"""
+
+    def __init__(self):
+        self.events = []
+        self.saved = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def node(self, report_type, depends_on=(), output=None, error=None, delay=0.0,
+             wait: threading.Event = None, timeout=5.0):
+        def generate(inputs):
+            with self.lock:
+                self.events.append(('start', report_type, dict(inputs)))
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                if wait is not None:
+                    wait.wait()
+                time.sleep(delay)
+                if error is not None:
+                    raise error
+                return output if output is not None else {'report': report_type}
+            finally:
+                with self.lock:
+                    self.active -= 1
+
+        return ReportNode(report_type, report_type.title(), generate, tuple(depends_on), timeout)
+
+    def save(self, report_type, data, elapsed):
+        self.events.append(('save', report_type, data))
+        self.saved[report_type] = (data, elapsed)
+        return True
+
+    def started(self):
+        return [report_type for kind, report_type, _ in self.events if kind == 'start']
+
+
+def test_dependents_start_after_their_inputs_are_saved():
+    rec = Recorder()
+    nodes = [
+        rec.node('analysis', depends_on=('wars',)),
+        rec.node('wars', output={'wars': [1, 2]}, delay=0.05),
+        rec.node('routes'),
+    ]
+
+    results = run_report_graph(nodes, workers=3, save=rec.save)
+
+    assert list(results) == ['analysis', 'wars', 'routes']
+    assert all(r.ok for r in results.values())
+    kinds = [(kind, report_type) for kind, report_type, _ in rec.events]
+    assert kinds.index(('save', 'wars')) < kinds.index(('start', 'analysis'))
+    analysis_inputs = next(inputs for kind, rt, inputs in rec.events if kind == 'start' and rt == 'analysis')
+    assert analysis_inputs == {'wars': {'wars': [1, 2]}}
+    assert rec.saved['wars'][1] >= 0.05
+
+
+def test_workers_bound_concurrency():
+    rec = Recorder()
+    nodes = [rec.node(f'r{i}', delay=0.05) for i in range(5)]
+
+    results = run_report_graph(nodes, workers=2, save=rec.save)
+
+    assert all(r.ok for r in results.values())
+    assert rec.max_active == 2
+
+
+def test_failed_report_skips_only_its_dependents():
+    rec = Recorder()
+    nodes = [
+        rec.node('wars', error=RuntimeError('db down')),
+        rec.node('analysis', depends_on=('wars',)),
+        rec.node('summary', depends_on=('analysis',)),
+        rec.node('routes'),
+    ]
+
+    results = run_report_graph(nodes, workers=2, save=rec.save)
+
+    assert results['wars'].status == 'failed'
+    assert results['wars'].error == 'db down'
+    assert results['analysis'].status == 'skipped'
+    assert results['analysis'].error == 'wars not generated'
+    assert results['summary'].status == 'skipped'
+    assert results['routes'].ok
+    assert set(rec.started()) == {'wars', 'routes'}
+    assert set(rec.saved) == {'routes'}
+
+
+def test_save_failure_counts_as_failed():
+    rec = Recorder()
+
+    def failing_save(report_type, data, elapsed):
+        raise IOError('disk full')
+
+    nodes = [rec.node('wars'), rec.node('analysis', depends_on=('wars',))]
+    results = run_report_graph(nodes, workers=1, save=failing_save)
+
+    assert results['wars'].status == 'failed'
+    assert results['analysis'].status == 'skipped'
+
+
+def test_hung_report_times_out_without_blocking_the_others():
+    rec = Recorder()
+    release = threading.Event()
+    nodes = [
+        rec.node('briefing', wait=release, timeout=0.3),
+        rec.node('analysis', depends_on=('briefing',)),
+        rec.node('wars', delay=0.05),
+        rec.node('routes', delay=0.05),
+        rec.node('economy', delay=0.05),
+    ]
+
+    started = time.time()
+    try:
+        results = run_report_graph(nodes, workers=2, save=rec.save)
+        elapsed = time.time() - started
+    finally:
+        release.set()
+
+    assert results['briefing'].status == 'timeout'
+    assert results['analysis'].status == 'skipped'
+    assert all(results[rt].ok for rt in ('wars', 'routes', 'economy'))
+    # The other reports shared the second worker while briefing hung
+    assert elapsed < 1.0
+    assert 'briefing' not in rec.saved
+
+
+def test_late_result_of_timed_out_report_is_discarded():
+    rec = Recorder()
+    nodes = [rec.node('slow', delay=0.3, timeout=0.1), rec.node('after', delay=0.4)]
+
+    results = run_report_graph(nodes, workers=2, save=rec.save)
+
+    assert results['slow'].status == 'timeout'
+    assert results['after'].ok
+    assert 'slow' not in rec.saved
+
+
+def test_check_graph_rejects_unknown_dependencies():
+    rec = Recorder()
+    with pytest.raises(ValueError, match='unknown report wars'):
+        _check_graph([rec.node('analysis', depends_on=('wars',))])
+
+
+def test_check_graph_rejects_cycles():
+    rec = Recorder()
+    nodes = [
+        rec.node('a', depends_on=('c',)),
+        rec.node('b', depends_on=('a',)),
+        rec.node('c', depends_on=('b',)),
+        rec.node('d'),
+    ]
+    with pytest.raises(ValueError, match='cycle between: a, b, c'):
+        _check_graph(nodes)
+    with pytest.raises(ValueError):
+        run_report_graph(nodes, save=rec.save)
+    assert rec.events == []
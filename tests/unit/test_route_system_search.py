@@ -0,0 +1,79 @@
+"""
+Tests for RouteService.search_systems over the shared SDE search index
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src import route_service as route_module
+from src.route_service import SEARCH_OVERFETCH, RouteService
+from src.services.sde.search import SearchIndex
+
+
+# 30 systems sharing the "Ala" prefix: Ala-00 ... Ala-29
+SYSTEM_ROWS = [(30000100 + i, f'Ala-{i:02d}', 10000002, 0.5) for i in range(30)]
+
+
+class Spy:
+    """SearchIndex wrapper recording the limit of every system search"""
+
+    def __init__(self, index):
+        self.index = index
+        self.limits = []
+
+    def search_system_ids(self, query, limit=10):
+        self.limits.append(limit)
+        return self.index.search_system_ids(query, limit)
+
+
+@pytest.fixture
+def index():
+    return Spy(SearchIndex.from_rows([], [], [], SYSTEM_ROWS))
+
+
+def make_service(index, missing=()):
+    """RouteService whose graph lacks the given system ids"""
+    service = RouteService()
+    service._systems = {
+        sys_id: {'name': name, 'security': security, 'region_id': region_id}
+        for sys_id, name, region_id, security in SYSTEM_ROWS
+        if sys_id not in missing
+    }
+    service._graph = {sys_id: [] for sys_id in service._systems}
+    service._loaded = True
+    return service
+
+
+def search(index, service, query, limit):
+    with patch.object(route_module, 'get_search_index', return_value=index):
+        return [r['system_name'] for r in service.search_systems(query, limit=limit)]
+
+
+def test_requests_only_limit_plus_overfetch(index):
+    names = search(index, make_service(index), 'ala', 5)
+
+    assert names == [f'Ala-{i:02d}' for i in range(5)]
+    assert index.limits == [5 + SEARCH_OVERFETCH]
+
+
+def test_overfetch_covers_hits_missing_from_the_graph(index):
+    missing = {30000100, 30000102}
+    names = search(index, make_service(index, missing), 'ala', 5)
+
+    assert names == ['Ala-01', 'Ala-03', 'Ala-04', 'Ala-05', 'Ala-06']
+    assert index.limits == [5 + SEARCH_OVERFETCH]
+
+
+def test_falls_back_to_all_hits_when_filtering_leaves_too_few(index):
+    missing = {30000100 + i for i in range(5 + SEARCH_OVERFETCH)}
+    names = search(index, make_service(index, missing), 'ala', 5)
+
+    assert names == [f'Ala-{i:02d}' for i in range(10, 15)]
+    assert index.limits == [5 + SEARCH_OVERFETCH, None]
+
+
+def test_short_result_list_is_not_searched_again(index):
+    names = search(index, make_service(index), 'ala-2', 20)
+
+    assert len(names) == 10
+    assert index.limits == [20 + SEARCH_OVERFETCH]